@@ -0,0 +1,524 @@
+#!/usr/bin/env python3
+"""
+Batch engine for the loan, mortgage, investment and compound-interest calculators.
+
+The formulas are the ones in assets/js/calculators.js, evaluated over whole
+columns of principals, rates and terms at once. NumPy is used when it is
+installed; without it the same formulas run row by row in plain Python.
+
+    python amortization.py price loan offers.csv -o priced.csv
+    python amortization.py schedule offers.csv -o schedule.csv
+    python amortization.py --parity
+    python amortization.py --benchmark 100000
+
+CSV input and output are streamed in chunks, so neither a large batch of
+offers nor its full amortization schedule is ever held in memory at once.
+"""
+
+import os
+import csv
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import subprocess
+from decimal import Decimal, ROUND_HALF_UP
+
+from build_io import atomic_open
+from calc_registry import CALCULATORS_JS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Rows read, priced and written per chunk
+CHUNK_ROWS = 65536
+
+# Input columns per calculator, named after the calculator's input ids
+KINDS = {
+    'loan': ['principal', 'rate', 'years'],
+    'mortgage': ['homePrice', 'downPayment', 'rate', 'years'],
+    'investment': ['initial', 'monthly', 'rate', 'years'],
+    'compound-interest': ['principal', 'rate', 'years', 'compound'],
+}
+
+# Inputs that the JS reads with `parseFloat(x) || 0`
+_ZERO_DEFAULT = {'principal', 'homePrice', 'downPayment', 'initial', 'monthly'}
+
+COMPOUND_FREQUENCIES = {
+    'Annually': 1,
+    'Semi-annually': 2,
+    'Quarterly': 4,
+    'Monthly': 12,
+    'Daily': 365,
+}
+
+SCHEDULE_COLUMNS = ['loan_id', 'month', 'payment', 'interest', 'principal', 'balance']
+
+
+def _is_array(value):
+    return np is not None and isinstance(value, np.ndarray)
+
+
+def _div(a, b):
+    """Float division with JS semantics for a zero divisor."""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1.0, b)
+
+
+def loan_payment(principal, monthly_rate, payments):
+    """Monthly payment of a fully amortizing loan."""
+    if _is_array(monthly_rate):
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = (1 + monthly_rate) ** payments
+            return np.where(monthly_rate == 0, principal / payments,
+                            principal * (monthly_rate * growth) / (growth - 1))
+    if monthly_rate == 0:
+        return _div(principal, payments)
+    growth = (1 + monthly_rate) ** payments
+    return _div(principal * (monthly_rate * growth), growth - 1)
+
+
+def investment_balance(initial, monthly, monthly_rate, months):
+    """Closed form of the monthly step balance = (balance + monthly) * (1 + rate)."""
+    if _is_array(monthly_rate):
+        periods = np.where(months > 0, months, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            growth = (1 + monthly_rate) ** periods
+            return np.where(monthly_rate == 0, initial + monthly * periods,
+                            initial * growth + monthly * (1 + monthly_rate) * (growth - 1) / monthly_rate)
+    periods = months if months > 0 else 0
+    growth = (1 + monthly_rate) ** periods
+    if monthly_rate == 0:
+        return initial + monthly * periods
+    return initial * growth + _div(monthly * (1 + monthly_rate) * (growth - 1), monthly_rate)
+
+
+def compound_amount(principal, annual_rate, years, frequency):
+    """Future value with `frequency` compounding periods per year."""
+    return principal * (1 + annual_rate / frequency) ** (frequency * years)
+
+
+def price_columns(kind, columns):
+    """Evaluate one calculator over columns of inputs.
+
+    columns maps each input id in KINDS[kind] to a NumPy array (or, without
+    NumPy, a list). Returns the result columns keyed by name.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Unknown calculator '{kind}'")
+    if np is not None:
+        return _price_vector(kind, columns)
+    rows = [dict(zip(columns, values)) for values in zip(*columns.values())]
+    results = [_price_row(kind, row) for row in rows]
+    return {name: [result[name] for result in results] for name in (results[0] if results else {})}
+
+
+def _price_vector(kind, c):
+    rate = np.asarray(c['rate'], dtype=np.float64)
+    years = np.trunc(np.asarray(c['years'], dtype=np.float64))
+    if kind in ('loan', 'mortgage'):
+        if kind == 'loan':
+            principal = np.asarray(c['principal'], dtype=np.float64)
+        else:
+            home_price = np.asarray(c['homePrice'], dtype=np.float64)
+            down_payment = np.asarray(c['downPayment'], dtype=np.float64)
+            principal = home_price - down_payment
+        payments = years * 12
+        monthly_rate = rate / 100 / 12
+        with np.errstate(divide='ignore', invalid='ignore'):
+            payment = loan_payment(principal, monthly_rate, payments)
+            result = {'monthly_payment': payment, 'total_payment': payment * payments,
+                      'total_interest': payment * payments - principal}
+            if kind == 'mortgage':
+                result['loan_amount'] = principal
+                result['down_payment_percent'] = down_payment / home_price * 100
+        return result
+    if kind == 'investment':
+        initial = np.asarray(c['initial'], dtype=np.float64)
+        monthly = np.asarray(c['monthly'], dtype=np.float64)
+        months = years * 12
+        balance = investment_balance(initial, monthly, rate / 100 / 12, months)
+        contributions = initial + monthly * months
+        return {'final_balance': balance, 'total_contributions': contributions,
+                'total_earnings': balance - contributions}
+    principal = np.asarray(c['principal'], dtype=np.float64)
+    years = np.nan_to_num(years, nan=0.0)
+    frequency = np.array([_frequency(value) for value in c['compound']], dtype=np.float64)
+    amount = compound_amount(principal, rate / 100, years, frequency)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return {'final_amount': amount, 'interest_earned': amount - principal,
+                'total_return_percent': (amount - principal) / principal * 100}
+
+
+def _frequency(value):
+    if isinstance(value, str) and value in COMPOUND_FREQUENCIES:
+        return COMPOUND_FREQUENCIES[value]
+    try:
+        return float(value) or 1
+    except (TypeError, ValueError):
+        return 1
+
+
+def _trunc(value):
+    return math.trunc(value) if math.isfinite(value) else math.nan
+
+
+def _price_row(kind, row):
+    rate = row['rate']
+    years = _trunc(row['years'])
+    if kind in ('loan', 'mortgage'):
+        principal = row['principal'] if kind == 'loan' else row['homePrice'] - row['downPayment']
+        payments = years * 12
+        payment = loan_payment(principal, rate / 100 / 12, payments)
+        result = {'monthly_payment': payment, 'total_payment': payment * payments,
+                  'total_interest': payment * payments - principal}
+        if kind == 'mortgage':
+            result['loan_amount'] = principal
+            result['down_payment_percent'] = _div(row['downPayment'], row['homePrice']) * 100
+        return result
+    if kind == 'investment':
+        months = years * 12
+        balance = investment_balance(row['initial'], row['monthly'], rate / 100 / 12, months)
+        contributions = row['initial'] + row['monthly'] * months
+        return {'final_balance': balance, 'total_contributions': contributions,
+                'total_earnings': balance - contributions}
+    years = 0 if math.isnan(years) else years
+    amount = compound_amount(row['principal'], rate / 100, years, _frequency(row['compound']))
+    return {'final_amount': amount, 'interest_earned': amount - row['principal'],
+            'total_return_percent': _div(amount - row['principal'], row['principal']) * 100}
+
+
+def to_fixed(value, digits=2):
+    """Format a number exactly like JavaScript's Number.prototype.toFixed."""
+    if math.isnan(value):
+        return 'NaN'
+    if math.isinf(value):
+        return 'Infinity' if value > 0 else '-Infinity'
+    quantum = Decimal(1).scaleb(-digits)
+    text = str(Decimal(abs(value)).quantize(quantum, rounding=ROUND_HALF_UP))
+    return '-' + text if value < 0 and text.strip('0.') else text
+
+
+def format_result(kind, result):
+    """Render one priced row as the calculator's result text."""
+    if kind == 'loan':
+        if result['rate'] == 0:
+            return f"Monthly Payment: ${to_fixed(result['monthly_payment'])}"
+        return (f"Monthly Payment: ${to_fixed(result['monthly_payment'])}\n"
+                f"Total Interest: ${to_fixed(result['total_interest'])}\n"
+                f"Total Amount: ${to_fixed(result['total_payment'])}")
+    if kind == 'mortgage':
+        if result['rate'] == 0:
+            return f"Monthly Payment: ${to_fixed(result['monthly_payment'])}"
+        return (f"Monthly Payment: ${to_fixed(result['monthly_payment'])}\n"
+                f"Loan Amount: ${to_fixed(result['loan_amount'])}\n"
+                f"Down Payment: {to_fixed(result['down_payment_percent'], 1)}%")
+    if kind == 'investment':
+        return (f"Final Balance: ${to_fixed(result['final_balance'])}\n"
+                f"Total Contributions: ${to_fixed(result['total_contributions'])}\n"
+                f"Total Earnings: ${to_fixed(result['total_earnings'])}")
+    return (f"Final Amount: ${to_fixed(result['final_amount'])}\n"
+            f"Interest Earned: ${to_fixed(result['interest_earned'])}\n"
+            f"Total Return: {to_fixed(result['total_return_percent'])}%")
+
+
+def _parse(name, value):
+    if name == 'compound':
+        return value
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        number = math.nan
+    if name in _ZERO_DEFAULT and (math.isnan(number) or number == 0):
+        return 0.0
+    return number
+
+
+def read_chunks(lines, kind, chunk_rows=CHUNK_ROWS):
+    """Yield (rows, columns) chunks of a CSV with the calculator's input columns."""
+    reader = csv.DictReader(lines)
+    missing = [name for name in KINDS[kind] if name not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"Missing input columns for {kind}: {', '.join(missing)}")
+    rows = []
+    for row in reader:
+        rows.append(row)
+        if len(rows) == chunk_rows:
+            yield rows, _columns(kind, rows)
+            rows = []
+    if rows:
+        yield rows, _columns(kind, rows)
+
+
+def _columns(kind, rows):
+    columns = {name: [_parse(name, row[name]) for row in rows] for name in KINDS[kind]}
+    if np is not None:
+        columns = {name: values if name == 'compound' else np.array(values, dtype=np.float64)
+                   for name, values in columns.items()}
+    return columns
+
+
+def price_csv(kind, in_file, out_file, chunk_rows=CHUNK_ROWS):
+    """Price every row of in_file and write the inputs plus result columns. Returns rows written."""
+    written = 0
+    with open(in_file, 'r', encoding='utf-8', newline='') as source, \
+            atomic_open(out_file, 'w', encoding='utf-8') as out:
+        writer = None
+        for rows, columns in read_chunks(source, kind, chunk_rows):
+            results = price_columns(kind, columns)
+            if writer is None:
+                writer = csv.writer(out, lineterminator='\n')
+                writer.writerow(list(rows[0].keys()) + list(results))
+            values = [[f'{value:.2f}' for value in results[name]] for name in results]
+            writer.writerows(list(row.values()) + list(extra) for row, extra in zip(rows, zip(*values)))
+            written += len(rows)
+    return written
+
+
+def schedule_chunks(principal, annual_rate, years, first_id=0, chunk_rows=CHUNK_ROWS):
+    """Yield amortization schedule rows for many loans, at most about chunk_rows rows at a time.
+
+    With NumPy each chunk is an array with SCHEDULE_COLUMNS as columns;
+    without it, a list of row tuples.
+    """
+    count = len(principal)
+    start = 0
+    while start < count:
+        # Take loans until the chunk holds chunk_rows schedule rows
+        end = start
+        rows = 0
+        while end < count and (rows == 0 or rows + _months(years[end]) <= chunk_rows):
+            rows += _months(years[end])
+            end += 1
+        block = slice(start, end)
+        if np is not None:
+            yield _schedule_vector(np.asarray(principal[block], dtype=np.float64),
+                                   np.asarray(annual_rate[block], dtype=np.float64),
+                                   np.asarray(years[block], dtype=np.float64), first_id + start)
+        else:
+            yield _schedule_rows(principal[block], annual_rate[block], years[block], first_id + start)
+        start = end
+
+
+def _months(years):
+    months = _trunc(float(years)) * 12
+    return int(months) if months > 0 else 0
+
+
+def _schedule_vector(principal, annual_rate, years, first_id):
+    payments = np.maximum(np.nan_to_num(np.trunc(years) * 12), 0)
+    rate = annual_rate / 100 / 12
+    payment = loan_payment(principal, rate, payments)
+    longest = int(payments.max()) if len(payments) else 0
+    month = np.arange(1, longest + 1, dtype=np.float64)
+    active = month[None, :] <= payments[:, None]
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        growth = (1 + rate[:, None]) ** (month[None, :] - 1)
+        # Balance before each month's payment, from the closed form
+        opening = np.where(rate[:, None] == 0,
+                           principal[:, None] - payment[:, None] * (month[None, :] - 1),
+                           principal[:, None] * growth - payment[:, None] * (growth - 1) / rate[:, None])
+        interest = opening * rate[:, None]
+        paid = payment[:, None] - interest
+    loan_ids = np.broadcast_to(np.arange(first_id, first_id + len(principal))[:, None], active.shape)
+    months = np.broadcast_to(month[None, :], active.shape)
+    payments_grid = np.broadcast_to(payment[:, None], active.shape)
+    return np.column_stack([loan_ids[active], months[active], payments_grid[active],
+                            interest[active], paid[active], (opening - paid)[active]])
+
+
+def _schedule_rows(principal, annual_rate, years, first_id):
+    rows = []
+    for offset, (amount, annual, term) in enumerate(zip(principal, annual_rate, years)):
+        rate = annual / 100 / 12
+        payments = _months(term)
+        payment = loan_payment(amount, rate, payments)
+        for month in range(1, payments + 1):
+            if rate == 0:
+                opening = amount - payment * (month - 1)
+            else:
+                growth = (1 + rate) ** (month - 1)
+                opening = amount * growth - payment * (growth - 1) / rate
+            interest = opening * rate
+            rows.append((first_id + offset, month, payment, interest, payment - interest,
+                         opening - (payment - interest)))
+    return rows
+
+
+def write_schedule(out, principal, annual_rate, years, first_id=0, chunk_rows=CHUNK_ROWS):
+    """Stream the schedules of many loans to an open text file as CSV rows. Returns rows written."""
+    written = 0
+    for chunk in schedule_chunks(principal, annual_rate, years, first_id, chunk_rows):
+        if np is not None:
+            np.savetxt(out, chunk, fmt=['%d', '%d', '%.2f', '%.2f', '%.2f', '%.2f'], delimiter=',')
+        else:
+            out.writelines(f'{r[0]},{r[1]},{r[2]:.2f},{r[3]:.2f},{r[4]:.2f},{r[5]:.2f}\n' for r in chunk)
+        written += len(chunk)
+    return written
+
+
+def schedule_csv(in_file, out_file, chunk_rows=CHUNK_ROWS):
+    """Write the amortization schedule of every loan (principal, rate, years) in in_file.
+
+    Loans are numbered by their row in in_file, starting at 0. Returns rows written.
+    """
+    written = 0
+    loans = 0
+    with open(in_file, 'r', encoding='utf-8', newline='') as source, \
+            atomic_open(out_file, 'w', encoding='utf-8') as out:
+        out.write(','.join(SCHEDULE_COLUMNS) + '\n')
+        for rows, columns in read_chunks(source, 'loan', chunk_rows):
+            written += write_schedule(out, columns['principal'], columns['rate'], columns['years'],
+                                      loans, chunk_rows)
+            loans += len(rows)
+    return written
+
+
+def random_inputs(kind, count, seed=42):
+    """Plausible random inputs for benchmarks and parity checks, as CSV-style strings."""
+    rng = random.Random(seed)
+    rows = []
+    for _ in range(count):
+        rate = '0' if rng.random() < 0.05 else f'{rng.uniform(0.5, 12):.2f}'
+        years = str(rng.choice([5, 10, 15, 20, 25, 30]))
+        if kind == 'loan':
+            row = {'principal': f'{rng.uniform(1000, 500000):.2f}', 'rate': rate, 'years': years}
+        elif kind == 'mortgage':
+            price = rng.uniform(80000, 1500000)
+            row = {'homePrice': f'{price:.0f}', 'downPayment': f'{price * rng.uniform(0, 0.4):.0f}',
+                   'rate': rate, 'years': years}
+        elif kind == 'investment':
+            row = {'initial': f'{rng.uniform(0, 100000):.2f}', 'monthly': f'{rng.uniform(0, 3000):.2f}',
+                   'rate': rate, 'years': years}
+        else:
+            row = {'principal': f'{rng.uniform(100, 100000):.2f}', 'rate': rate, 'years': years,
+                   'compound': rng.choice(list(COMPOUND_FREQUENCIES))}
+        rows.append(row)
+    return rows
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8') + ';this.calculators = calculators;', context);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+const out = {};
+for (const kind of Object.keys(cases)) {
+    out[kind] = cases[kind].map(inputs => String(context.calculators[kind].calculate(inputs)));
+}
+process.stdout.write(JSON.stringify(out));
+"""
+
+
+def parity(count=2000, seed=7):
+    """Compare the engine's results with the JS calculators run under Node. Returns mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    cases = {kind: random_inputs(kind, count, seed) for kind in KINDS}
+    cases['loan'] += [{'principal': '10000', 'rate': '5', 'years': '5'},
+                      {'principal': '0', 'rate': '3.5', 'years': '30'},
+                      {'principal': '250000', 'rate': '0', 'years': '30'}]
+    cases['mortgage'] += [{'homePrice': '400000', 'downPayment': '80000', 'rate': '6.5', 'years': '30'}]
+    cases['investment'] += [{'initial': '1000', 'monthly': '100', 'rate': '0', 'years': '10'},
+                            {'initial': '5000', 'monthly': '250', 'rate': '7', 'years': '0'}]
+    cases['compound-interest'] += [{'principal': '1000', 'rate': '5', 'years': '10', 'compound': 'Daily'}]
+
+    cases_file = os.path.join(base_path, '.parity-cases.json')
+    try:
+        with atomic_open(cases_file, 'w', encoding='utf-8') as f:
+            json.dump(cases, f)
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(base_path, CALCULATORS_JS), cases_file],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        if os.path.exists(cases_file):
+            os.remove(cases_file)
+    expected = json.loads(completed.stdout)
+
+    mismatches = 0
+    for kind, rows in cases.items():
+        columns = _columns(kind, rows)
+        results = price_columns(kind, columns)
+        bad = 0
+        for i, js_text in enumerate(expected[kind]):
+            result = {name: float(values[i]) for name, values in results.items()}
+            result['rate'] = float(columns['rate'][i])
+            text = format_result(kind, result)
+            if text != js_text:
+                bad += 1
+                if bad <= 3:
+                    print(f"   {kind} {rows[i]}:\n     js:     {js_text!r}\n     python: {text!r}")
+        mismatches += bad
+        print(f"{'✅' if not bad else '❌'} {kind}: {len(rows) - bad}/{len(rows)} results identical to calculators.js")
+    return mismatches
+
+
+def benchmark(count=100000, chunk_rows=CHUNK_ROWS):
+    """Report pricing and schedule-streaming throughput in rows per second."""
+    print(f"Backend: {'NumPy ' + np.__version__ if np is not None else 'pure Python (NumPy not installed)'}")
+    for kind in KINDS:
+        columns = _columns(kind, random_inputs(kind, count))
+        start = time.perf_counter()
+        price_columns(kind, columns)
+        seconds = time.perf_counter() - start
+        print(f"Pricing {kind:<18} {count / seconds:14,.0f} rows/s ({count:,} rows in {seconds * 1000:.1f} ms)")
+
+    loans = max(1, count // 100)
+    columns = _columns('loan', random_inputs('loan', loans))
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as out:
+        rows = write_schedule(out, columns['principal'], columns['rate'], columns['years'], chunk_rows=chunk_rows)
+    seconds = time.perf_counter() - start
+    print(f"Schedule CSV streaming    {rows / seconds:14,.0f} rows/s ({loans:,} loans, {rows:,} rows in {seconds:.2f} s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Batch pricing and amortization schedules for the finance calculators.")
+    parser.add_argument('command', nargs='?', choices=['price', 'schedule'],
+                        help="price: add result columns to a CSV of inputs; schedule: stream amortization schedules")
+    parser.add_argument('kind', nargs='?', help=f"calculator to price ({', '.join(KINDS)})")
+    parser.add_argument('input', nargs='?', help="input CSV with the calculator's input ids as columns")
+    parser.add_argument('-o', '--output', help="output CSV")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+                        help=f"rows processed per chunk (default {CHUNK_ROWS})")
+    parser.add_argument('--parity', action='store_true', help="compare results with calculators.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark with N random rows per calculator")
+    args = parser.parse_args(argv)
+    if args.command == 'schedule' and args.input is None:
+        # `schedule offers.csv` takes no calculator argument
+        args.kind, args.input = 'loan', args.kind
+    if args.command and (not args.input or not args.output):
+        parser.error(f"{args.command} needs an input CSV and -o/--output")
+    if args.command == 'price' and args.kind not in KINDS:
+        parser.error(f"unknown calculator '{args.kind}', choose from {', '.join(KINDS)}")
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be positive")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark, args.chunk_rows)
+        sys.exit(0)
+    if args.command == 'price':
+        rows = price_csv(args.kind, args.input, args.output, args.chunk_rows)
+        print(f"Priced {rows:,} {args.kind} rows -> {args.output}")
+    elif args.command == 'schedule':
+        rows = schedule_csv(args.input, args.output, args.chunk_rows)
+        print(f"Wrote {rows:,} schedule rows -> {args.output}")
+    else:
+        parse_args(['--help'])
@@ -0,0 +1,66 @@
+// Runtime for prerendered calculator pages (generate_pages.py --prerender).
+// The form is already in the page and the calculator's module is inlined after
+// this script, so this only provides what the module and the form handlers call.
+const calculators = {};
+
+// Called by the inlined calculator module
+function registerCalculator(calcId, definition) {
+    calculators[calcId] = Object.assign(calculators[calcId] || {}, definition);
+}
+
+// Calculate result function
+function calculateResult(event, calcId) {
+    event.preventDefault();
+
+    const calc = calculators[calcId];
+    if (!calc) return;
+
+    const inputs = {};
+    calc.inputs.forEach(input => {
+        const element = document.getElementById(input.id);
+        // File inputs pass the chosen File (or null); the calculator reads it itself
+        inputs[input.id] = input.type === 'file' ? (element.files && element.files[0]) || null : element.value;
+    });
+
+    try {
+        const result = calc.calculate(inputs);
+        if (result && typeof result.then === 'function') {
+            // Long-running calculators (e.g. reading an uploaded file) return a Promise
+            showResult('<span class="spinner-border spinner-border-sm me-2" role="status"></span>Working...');
+            result.then(showResult, error => showError(error.message || 'Error in calculation'));
+        } else {
+            showResult(result);
+        }
+    } catch (error) {
+        showError(error.message || 'Error in calculation');
+    }
+}
+
+// Show calculation result
+function showResult(result) {
+    const resultContainer = document.getElementById('calculator-result');
+    resultContainer.innerHTML = `
+        <div class="calculator-result-section">
+            <h5><i class="fas fa-check-circle me-2"></i>Calculation Results</h5>
+            <div class="calculator-result-content">${result}</div>
+        </div>
+    `;
+    resultContainer.style.display = 'block';
+}
+
+// Show error message
+function showError(message) {
+    const resultContainer = document.getElementById('calculator-result');
+    resultContainer.innerHTML = `
+        <div class="alert alert-danger">
+            <h5><i class="fas fa-exclamation-circle me-2"></i>Calculation Error</h5>
+            <p class="mb-0">${message}</p>
+        </div>
+    `;
+    resultContainer.style.display = 'block';
+}
+
+// "Back to Tools" leaves the standalone page for the category listing
+function backToCalculatorList() {
+    window.location.href = document.body.dataset.categoryUrl || '/';
+}
@@ -0,0 +1,385 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+const calculators = {
+    "muscle-mass": {"title": "Muscle Mass Calculator", "icon": "fas fa-dumbbell"},
+    "meal-planner": {"title": "Meal Planner Calculator", "icon": "fas fa-utensils"},
+    "macros-converter": {"title": "Macros to Calories Converter", "icon": "fas fa-calculator"},
+    "exercise-calories": {"title": "Exercise Calorie Burn Calculator", "icon": "fas fa-running"},
+    "body-fat-distribution": {"title": "Body Fat Distribution Calculator", "icon": "fas fa-child"},
+    "blood-sugar": {"title": "Blood Sugar Converter", "icon": "fas fa-syringe"},
+    "blood-pressure": {"title": "Blood Pressure Category Calculator", "icon": "fas fa-heart"},
+    "blood-alcohol": {"title": "Blood Alcohol Content Calculator", "icon": "fas fa-wine-glass"},
+    "weight-loss-planner": {"title": "Weight Loss Planner", "icon": "fas fa-weight"},
+    "resting-energy": {"title": "Resting Energy Expenditure Calculator", "icon": "fas fa-bed"},
+    "lean-body-mass": {"title": "Lean Body Mass Calculator", "icon": "fas fa-dumbbell"},
+    "body-surface-area": {"title": "Body Surface Area Calculator", "icon": "fas fa-child"},
+    "target-heart-rate": {"title": "Target Heart Rate Calculator", "icon": "fas fa-heartbeat"},
+    "bmr": {"title": "BMR Calculator", "icon": "fas fa-fire-alt"},
+    "waist-hip-ratio": {"title": "Waist-to-Hip Ratio Calculator", "icon": "fas fa-ruler-horizontal"},
+    "crypto-futures-pnl": {"title": "Futures PnL Calculator", "icon": "fas fa-chart-line"},
+    "crypto-lending-returns": {"title": "Lending Returns Calculator", "icon": "fas fa-hand-holding-usd"},
+    "crypto-compound-yield": {"title": "Compound Yield Calculator", "icon": "fas fa-chart-area"},
+    "crypto-rebalancing": {"title": "Portfolio Rebalancing Calculator", "icon": "fas fa-sync"},
+    "crypto-stop-loss": {"title": "Stop Loss Calculator", "icon": "fas fa-shield-alt"},
+    "crypto-correlation": {"title": "Asset Correlation Calculator", "icon": "fas fa-link"},
+    "crypto-volume-analysis": {"title": "Volume Analysis Calculator", "icon": "fas fa-chart-bar"},
+    "crypto-position-size": {"title": "Position Size Calculator", "icon": "fas fa-balance-scale-left"},
+    "crypto-funding-rate": {"title": "Funding Rate Calculator", "icon": "fas fa-percentage"},
+    "crypto-drawdown": {"title": "Maximum Drawdown Calculator", "icon": "fas fa-chart-line"},
+    "crypto-swing-trade": {"title": "Swing Trading Calculator", "icon": "fas fa-wave-square"},
+    "crypto-accumulation": {"title": "DCA Accumulation Calculator", "icon": "fas fa-stream"},
+    "crypto-volatility": {"title": "Volatility Calculator", "icon": "fas fa-bolt"},
+    "length": {"title": "Length Converter", "icon": "fas fa-ruler-horizontal"},
+    "temperature": {"title": "Temperature Converter", "icon": "fas fa-thermometer-half"},
+    "weight": {"title": "Weight Converter", "icon": "fas fa-weight-hanging"},
+    "area": {"title": "Area Converter", "icon": "fas fa-square"},
+    "volume": {"title": "Volume Converter", "icon": "fas fa-cube"},
+    "speed": {"title": "Speed Converter", "icon": "fas fa-tachometer-alt"},
+    "pressure": {"title": "Pressure Converter", "icon": "fas fa-compress"},
+    "energy-conversion": {"title": "Energy Converter", "icon": "fas fa-bolt"},
+    "power-conversion": {"title": "Power Converter", "icon": "fas fa-plug"},
+    "data-storage": {"title": "Data Storage Converter", "icon": "fas fa-hdd"},
+    "angle": {"title": "Angle Converter", "icon": "fas fa-circle-notch"},
+    "time-conversion": {"title": "Time Converter", "icon": "fas fa-clock"},
+    "frequency": {"title": "Frequency Converter", "icon": "fas fa-wave-square"},
+    "currency": {"title": "Currency Converter", "icon": "fas fa-dollar-sign"},
+    "fuel-economy-conversion": {"title": "Fuel Economy Converter", "icon": "fas fa-gas-pump"},
+    "density": {"title": "Density Converter", "icon": "fas fa-weight"},
+    "force-conversion": {"title": "Force Converter", "icon": "fas fa-hand-rock"},
+    "luminosity": {"title": "Luminosity Converter", "icon": "fas fa-lightbulb"},
+    "magnetic-field": {"title": "Magnetic Field Converter", "icon": "fas fa-magnet"},
+    "radioactivity": {"title": "Radioactivity Converter", "icon": "fas fa-radiation"},
+    "torque": {"title": "Torque Converter", "icon": "fas fa-cog"},
+    "crypto-leverage-liquidation": {"title": "Leverage Liquidation Calculator", "icon": "fas fa-balance-scale-right"},
+    "loan": {"title": "Loan Calculator", "icon": "fas fa-money-check-alt"},
+    "mortgage": {"title": "Mortgage Calculator", "icon": "fas fa-home"},
+    "investment": {"title": "Investment Calculator", "icon": "fas fa-chart-line"},
+    "savings": {"title": "Savings Calculator", "icon": "fas fa-piggy-bank"},
+    "compound-interest": {"title": "Compound Interest Calculator", "icon": "fas fa-chart-line"},
+    "percentage": {"title": "Percentage Calculator", "icon": "fas fa-percent"},
+    "fraction": {"title": "Fraction Calculator", "icon": "fas fa-divide"},
+    "algebra": {"title": "Algebra Solver", "icon": "fas fa-square-root-alt"},
+    "quadratic": {"title": "Quadratic Equation Solver", "icon": "fas fa-superscript"},
+    "trigonometry": {"title": "Trigonometry Calculator", "icon": "fas fa-wave-square"},
+    "scientific-calculator": {"title": "Scientific Calculator", "icon": "fas fa-calculator"},
+    "statistics-calculator": {"title": "Statistics Calculator", "icon": "fas fa-chart-bar"},
+    "matrix-calculator": {"title": "Matrix Calculator", "icon": "fas fa-th"},
+    "geometry-calculator": {"title": "Geometry Calculator", "icon": "fas fa-shapes"},
+    "calculus-calculator": {"title": "Basic Calculus Calculator", "icon": "fas fa-integral"},
+    "number-theory": {"title": "Number Theory Calculator", "icon": "fas fa-hashtag"},
+    "probability-calculator": {"title": "Probability Calculator", "icon": "fas fa-dice"},
+    "complex-numbers": {"title": "Complex Numbers Calculator", "icon": "fas fa-infinity"},
+    "sequence-series": {"title": "Sequence & Series Calculator", "icon": "fas fa-list-ol"},
+    "logarithm-calculator": {"title": "Advanced Logarithm Calculator", "icon": "fas fa-chart-line"},
+    "polynomial-calculator": {"title": "Polynomial Calculator", "icon": "fas fa-square-root-alt"},
+    "windows-calculator": {"title": "Windows 10 Calculator", "icon": "fab fa-windows"},
+    "binary-calculator": {"title": "Binary & Base Conversion", "icon": "fas fa-binary"},
+    "bmi": {"title": "BMI Calculator", "icon": "fas fa-weight"},
+    "calorie": {"title": "Calorie Calculator", "icon": "fas fa-fire"},
+    "body-fat": {"title": "Body Fat Calculator", "icon": "fas fa-percent"},
+    "ideal-weight": {"title": "Ideal Weight Calculator", "icon": "fas fa-balance-scale"},
+    "water-intake": {"title": "Water Intake Calculator", "icon": "fas fa-tint"},
+    "heart-rate-zone": {"title": "Heart Rate Zone Calculator", "icon": "fas fa-heartbeat"},
+    "vo2-max": {"title": "VO2 Max Calculator", "icon": "fas fa-lungs"},
+    "pregnancy-due-date": {"title": "Pregnancy Due Date Calculator", "icon": "fas fa-baby"},
+    "ovulation": {"title": "Ovulation Calculator", "icon": "fas fa-calendar-check"},
+    "bmi-children": {"title": "Children BMI Calculator", "icon": "fas fa-child"},
+    "macro-calculator": {"title": "Macro Calculator", "icon": "fas fa-chart-pie"},
+    "protein-intake": {"title": "Protein Intake Calculator", "icon": "fas fa-drumstick-bite"},
+    "body-measurement": {"title": "Body Measurement Tracker", "icon": "fas fa-ruler"},
+    "sleep-calculator": {"title": "Sleep Calculator", "icon": "fas fa-bed"},
+    "hydration-status": {"title": "Hydration Status Calculator", "icon": "fas fa-tint-slash"},
+    "fitness-level": {"title": "Fitness Level Calculator", "icon": "fas fa-running"},
+    "workout-intensity": {"title": "Workout Intensity Calculator", "icon": "fas fa-dumbbell"},
+    "recovery-calculator": {"title": "Recovery Calculator", "icon": "fas fa-spa"},
+    "training-load": {"title": "Training Load Calculator", "icon": "fas fa-chart-line"},
+    "body-age": {"title": "Body Age Calculator", "icon": "fas fa-calendar-alt"},
+    "power-consumption": {"title": "Power Consumption Calculator", "icon": "fas fa-plug"},
+    "resistor-color": {"title": "Resistor Color Code Calculator", "icon": "fas fa-palette"},
+    "voltage-divider": {"title": "Voltage Divider Calculator", "icon": "fas fa-divide"},
+    "capacitor": {"title": "Capacitor Calculator", "icon": "fas fa-battery-half"},
+    "transformer-turns": {"title": "Transformer Turns Ratio Calculator", "icon": "fas fa-exchange-alt"},
+    "inductor-reactance": {"title": "Inductor Reactance Calculator", "icon": "fas fa-coil"},
+    "rc-time-constant": {"title": "RC Time Constant Calculator", "icon": "fas fa-clock"},
+    "rlc-resonance": {"title": "RLC Resonance Calculator", "icon": "fas fa-wave-sine"},
+    "parallel-resistance": {"title": "Parallel Resistance Calculator", "icon": "fas fa-equals"},
+    "series-resistance": {"title": "Series Resistance Calculator", "icon": "fas fa-link"},
+    "power-factor": {"title": "Power Factor Calculator", "icon": "fas fa-angle-right"},
+    "three-phase-power": {"title": "Three-Phase Power Calculator", "icon": "fas fa-bolt"},
+    "wire-gauge": {"title": "Wire Gauge Calculator", "icon": "fas fa-ruler"},
+    "led-resistor": {"title": "LED Resistor Calculator", "icon": "fas fa-lightbulb"},
+    "antenna-length": {"title": "Antenna Length Calculator", "icon": "fas fa-broadcast-tower"},
+    "decibel-converter": {"title": "Decibel (dB) Converter", "icon": "fas fa-volume-up"},
+    "impedance-matching": {"title": "Impedance Matching Calculator", "icon": "fas fa-adjust"},
+    "filter-frequency": {"title": "Filter Frequency Calculator", "icon": "fas fa-filter"},
+    "amplifier-gain": {"title": "Amplifier Gain Calculator", "icon": "fas fa-chart-line"},
+    "beam-deflection": {"title": "Beam Deflection Calculator", "icon": "fas fa-ruler-horizontal"},
+    "gear-ratio": {"title": "Gear Ratio Calculator", "icon": "fas fa-cog"},
+    "pulley-system": {"title": "Pulley System Calculator", "icon": "fas fa-circle-o"},
+    "hydraulic-pressure": {"title": "Hydraulic Pressure Calculator", "icon": "fas fa-tint"},
+    "spring-constant": {"title": "Spring Constant Calculator", "icon": "fas fa-expand-arrows-alt"},
+    "thermal-expansion": {"title": "Thermal Expansion Calculator", "icon": "fas fa-thermometer-half"},
+    "motor-efficiency": {"title": "Motor Efficiency Calculator", "icon": "fas fa-fan"},
+    "pipe-flow": {"title": "Pipe Flow Calculator", "icon": "fas fa-arrows-alt-h"},
+    "ohms-law": {"title": "Ohm's Law Calculator", "icon": "fas fa-bolt"},
+    "velocity": {"title": "Velocity Calculator", "icon": "fas fa-tachometer-alt"},
+    "energy": {"title": "Energy Calculator", "icon": "fas fa-atom"},
+    "force": {"title": "Force Calculator", "icon": "fas fa-compress-arrows-alt"},
+    "molarity": {"title": "Molarity Calculator", "icon": "fas fa-flask"},
+    "ph": {"title": "pH Calculator", "icon": "fas fa-vial"},
+    "molecular-weight": {"title": "Molecular Weight Calculator", "icon": "fas fa-atom"},
+    "crypto-profit": {"title": "Cryptocurrency Profit Calculator", "icon": "fas fa-coins"},
+    "crypto-dca": {"title": "Dollar Cost Average Calculator", "icon": "fas fa-chart-line"},
+    "crypto-mining": {"title": "Mining Profitability Calculator", "icon": "fas fa-microchip"},
+    "crypto-converter": {"title": "Cryptocurrency Converter", "icon": "fas fa-exchange-alt"},
+    "impermanent-loss": {"title": "Impermanent Loss Calculator", "icon": "fas fa-percentage"},
+    "staking-rewards": {"title": "Staking Rewards Calculator", "icon": "fas fa-hand-holding-usd"},
+    "crypto-arbitrage": {"title": "Crypto Arbitrage Calculator", "icon": "fas fa-balance-scale"},
+    "margin-trading": {"title": "Margin Trading Calculator", "icon": "fas fa-chart-bar"},
+    "yield-farming": {"title": "Yield Farming Calculator", "icon": "fas fa-seedling"},
+    "portfolio-tracker": {"title": "Crypto Portfolio Tracker", "icon": "fas fa-wallet"},
+    "crypto-yield-farming": {"title": "Yield Farming Calculator", "icon": "fas fa-seedling"},
+    "crypto-bridge-fees": {"title": "Cross-Chain Bridge Fee Calculator", "icon": "fas fa-bridge"},
+    "crypto-tax-calculator": {"title": "Crypto Tax Calculator", "icon": "fas fa-receipt"},
+    "crypto-hodl-calculator": {"title": "HODL Strategy Calculator", "icon": "fas fa-hand-holding"},
+    "crypto-rainbow-chart": {"title": "Rainbow Chart Price Bands", "icon": "fas fa-rainbow"},
+    "crypto-fear-greed": {"title": "Fear & Greed Index Calculator", "icon": "fas fa-chart-pie"},
+    "crypto-hash-rate": {"title": "Network Hash Rate Calculator", "icon": "fas fa-server"},
+    "crypto-whale-tracker": {"title": "Whale Movement Impact Calculator", "icon": "fas fa-fish"},
+    "crypto-flash-loan": {"title": "Flash Loan Arbitrage Calculator", "icon": "fas fa-bolt"},
+    "crypto-liquidity-pool": {"title": "Liquidity Pool Returns Calculator", "icon": "fas fa-water"},
+    "crypto-options-pricing": {"title": "Crypto Options Pricing Calculator", "icon": "fas fa-chart-bar"},
+    "crypto-defi-yield": {"title": "DeFi Yield Optimization Calculator", "icon": "fas fa-chart-area"},
+    "crypto-nft-valuation": {"title": "NFT Valuation Calculator", "icon": "fas fa-palette"},
+    "crypto-gas-optimizer": {"title": "Gas Fee Optimizer", "icon": "fas fa-gas-pump"},
+    "crypto-portfolio-tracker": {"title": "Crypto Portfolio Tracker", "icon": "fas fa-briefcase"},
+    "crypto-leverage-calculator": {"title": "Advanced Leverage Calculator", "icon": "fas fa-chart-line"},
+    "crypto-sharpe-ratio": {"title": "Crypto Sharpe Ratio Calculator", "icon": "fas fa-chart-bar"},
+    "crypto-dollar-hedge": {"title": "Dollar Cost Hedging Calculator", "icon": "fas fa-shield-alt"},
+    "crypto-momentum-indicator": {"title": "Crypto Momentum Indicator", "icon": "fas fa-tachometer-alt"},
+    "crypto-technical-levels": {"title": "Technical Support/Resistance Levels", "icon": "fas fa-layer-group"},
+    "crypto-altcoin-season": {"title": "Altcoin Season Indicator", "icon": "fas fa-coins"},
+    "crypto-market-cap-calc": {"title": "Market Cap & Supply Calculator", "icon": "fas fa-calculator-alt"},
+    "crypto-pairs-trading": {"title": "Crypto Pairs Trading Calculator", "icon": "fas fa-exchange-alt"},
+    "crypto-grid-trading": {"title": "Grid Trading Calculator", "icon": "fas fa-th"},
+    "crypto-rsi-calculator": {"title": "RSI & Technical Indicators", "icon": "fas fa-chart-line"},
+    "crypto-funding-arbitrage": {"title": "Funding Rate Arbitrage Calculator", "icon": "fas fa-percent"},
+    "crypto-volatility-smile": {"title": "Crypto Volatility Surface Calculator", "icon": "fas fa-chart-area"},
+    "crypto-carry-trade": {"title": "Crypto Carry Trade Calculator", "icon": "fas fa-piggy-bank"},
+    "crypto-basis-trading": {"title": "Crypto Basis Trading Calculator", "icon": "fas fa-chart-area"},
+    "crypto-social-sentiment": {"title": "Social Sentiment Impact Calculator", "icon": "fas fa-comments"}
+};
+
+const toolCategories = {
+    "financial": [
+        "loan",
+        "mortgage",
+        "compound-interest",
+        "investment",
+        "savings"
+    ],
+    "math": [
+        "percentage",
+        "fraction",
+        "algebra",
+        "quadratic",
+        "trigonometry",
+        "scientific-calculator",
+        "statistics-calculator",
+        "matrix-calculator",
+        "geometry-calculator",
+        "calculus-calculator",
+        "number-theory",
+        "probability-calculator",
+        "complex-numbers",
+        "sequence-series",
+        "logarithm-calculator",
+        "polynomial-calculator",
+        "binary-calculator",
+        "windows-calculator"
+    ],
+    "health": [
+        "bmi",
+        "calorie",
+        "body-fat",
+        "ideal-weight",
+        "water-intake",
+        "heart-rate-zone",
+        "vo2-max",
+        "pregnancy-due-date",
+        "ovulation",
+        "bmi-children",
+        "macro-calculator",
+        "protein-intake",
+        "body-measurement",
+        "sleep-calculator",
+        "hydration-status",
+        "fitness-level",
+        "workout-intensity",
+        "recovery-calculator",
+        "training-load",
+        "body-age",
+        "bmr",
+        "waist-hip-ratio",
+        "target-heart-rate",
+        "body-surface-area",
+        "lean-body-mass",
+        "resting-energy",
+        "weight-loss-planner",
+        "blood-alcohol",
+        "blood-pressure",
+        "blood-sugar",
+        "body-fat-distribution",
+        "exercise-calories",
+        "macros-converter",
+        "meal-planner",
+        "muscle-mass"
+    ],
+    "crypto": [
+        "crypto-profit",
+        "crypto-leverage-liquidation",
+        "crypto-futures-pnl",
+        "crypto-lending-returns",
+        "crypto-compound-yield",
+        "crypto-rebalancing",
+        "crypto-stop-loss",
+        "crypto-correlation",
+        "crypto-volume-analysis",
+        "crypto-position-size",
+        "crypto-funding-rate",
+        "crypto-drawdown",
+        "crypto-swing-trade",
+        "crypto-accumulation",
+        "crypto-volatility",
+        "crypto-dca",
+        "crypto-mining",
+        "crypto-converter",
+        "impermanent-loss",
+        "staking-rewards",
+        "crypto-arbitrage",
+        "crypto-yield-farming",
+        "crypto-bridge-fees",
+        "crypto-tax-calculator",
+        "crypto-hodl-calculator",
+        "crypto-rainbow-chart",
+        "crypto-fear-greed",
+        "crypto-hash-rate",
+        "crypto-whale-tracker",
+        "crypto-flash-loan",
+        "crypto-liquidity-pool",
+        "crypto-options-pricing",
+        "crypto-defi-yield",
+        "crypto-nft-valuation",
+        "crypto-gas-optimizer",
+        "crypto-portfolio-tracker",
+        "crypto-leverage-calculator",
+        "crypto-sharpe-ratio",
+        "crypto-dollar-hedge",
+        "crypto-momentum-indicator",
+        "crypto-technical-levels",
+        "crypto-altcoin-season",
+        "crypto-market-cap-calc",
+        "crypto-pairs-trading",
+        "crypto-grid-trading",
+        "crypto-rsi-calculator",
+        "crypto-funding-arbitrage",
+        "crypto-volatility-smile",
+        "crypto-carry-trade",
+        "crypto-basis-trading",
+        "crypto-social-sentiment"
+    ],
+    "physics": [
+        "velocity",
+        "energy",
+        "force",
+        "momentum",
+        "power"
+    ],
+    "chemistry": [
+        "molarity",
+        "ph",
+        "molecular-weight",
+        "gas-laws",
+        "stoichiometry"
+    ],
+    "engineering": [
+        "ohms-law",
+        "power-consumption",
+        "resistor-color",
+        "voltage-divider",
+        "capacitor",
+        "transformer-turns",
+        "inductor-reactance",
+        "rc-time-constant",
+        "rlc-resonance",
+        "parallel-resistance",
+        "series-resistance",
+        "power-factor",
+        "three-phase-power",
+        "wire-gauge",
+        "led-resistor",
+        "antenna-length",
+        "decibel-converter",
+        "impedance-matching",
+        "filter-frequency",
+        "amplifier-gain",
+        "beam-deflection",
+        "gear-ratio",
+        "pulley-system",
+        "hydraulic-pressure",
+        "spring-constant",
+        "thermal-expansion",
+        "motor-efficiency",
+        "pipe-flow"
+    ],
+    "construction": [
+        "concrete",
+        "paint",
+        "brick",
+        "roof-pitch",
+        "flooring"
+    ],
+    "conversion": [
+        "length",
+        "temperature",
+        "weight",
+        "area",
+        "volume",
+        "speed",
+        "pressure",
+        "energy-conversion",
+        "power-conversion",
+        "data-storage",
+        "angle",
+        "time-conversion",
+        "frequency",
+        "currency",
+        "fuel-economy-conversion",
+        "density",
+        "force-conversion",
+        "luminosity",
+        "magnetic-field",
+        "radioactivity",
+        "torque"
+    ],
+    "business": [
+        "roi",
+        "break-even",
+        "markup",
+        "payroll",
+        "cash-flow"
+    ],
+    "time": [
+        "age",
+        "date-difference",
+        "time-zone",
+        "working-days",
+        "countdown"
+    ],
+    "utility": [
+        "grade",
+        "fuel-economy",
+        "password-strength",
+        "random-number",
+        "color-picker"
+    ]
+};
@@ -774,27 +774,30 @@ Position Value: $${(position * entry).toFixed(2)}`;
             { id: 'asset1Returns', label: 'Asset 1 Daily Returns (%, comma-separated)', type: 'text', placeholder: 'e.g., 2.5,-1.3,0.8' },
             { id: 'asset2Returns', label: 'Asset 2 Daily Returns (%, comma-separated)', type: 'text', placeholder: 'e.g., 1.8,-0.9,1.2' }
         ],
-        calculate: function(inputs) {
-            const arr1 = inputs.asset1Returns.split(',').map(x => parseFloat(x));
-            const arr2 = inputs.asset2Returns.split(',').map(x => parseFloat(x));
+        requires: ['indicators'],
+        calculate: function(inputs) {
+            const series1 = createSeriesReader(inputs.asset1Returns);
+            const series2 = createSeriesReader(inputs.asset2Returns);
+            const stats = createCorrelation();
+            
+            let x = series1.next();
+            let y = series2.next();
+            while (x !== undefined && y !== undefined) {
+                stats.push(x, y);
+                x = series1.next();
+                y = series2.next();
+            }
             
-            if (arr1.length !== arr2.length || arr1.length < 2) {
+            if (x !== undefined || y !== undefined || stats.count < 2) {
                 return 'Error: Please provide equal number of returns (at least 2) for both assets';
             }
             
-            const mean1 = arr1.reduce((a,b) => a + b, 0) / arr1.length;
-            const mean2 = arr2.reduce((a,b) => a + b, 0) / arr2.length;
-            
-            const variance1 = arr1.reduce((a,b) => a + Math.pow(b - mean1, 2), 0) / arr1.length;
-            const variance2 = arr2.reduce((a,b) => a + Math.pow(b - mean2, 2), 0) / arr2.length;
-            
-            const covariance = arr1.reduce((a,b,i) => a + (b - mean1) * (arr2[i] - mean2), 0) / arr1.length;
-            const correlation = covariance / (Math.sqrt(variance1) * Math.sqrt(variance2));
+            const correlation = stats.correlation();
             
             return `Correlation Coefficient: ${correlation.toFixed(4)}
 Strength: ${Math.abs(correlation) > 0.7 ? 'Strong' : Math.abs(correlation) > 0.3 ? 'Moderate' : 'Weak'}
 Direction: ${correlation > 0 ? 'Positive' : correlation < 0 ? 'Negative' : 'No correlation'}
-Sample Size: ${arr1.length} data points`;
+Sample Size: ${stats.count} data points`;
         }
     },
 
@@ -881,40 +884,23 @@ Effective Rate: ${(fundingRate * 3 * 365).toFixed(2)}% APR`;
         inputs: [
             { id: 'prices', label: 'Historical Prices (comma-separated)', type: 'text', placeholder: 'e.g., 100,95,105,90,110' }
         ],
+        requires: ['indicators'],
         calculate: function(inputs) {
-            const prices = inputs.prices.split(',').map(x => parseFloat(x));
+            const series = createSeriesReader(inputs.prices);
+            const dd = createDrawdown();
+            for (let price = series.next(); price !== undefined; price = series.next()) {
+                dd.push(price);
+            }
             
-            if (prices.length < 2) {
+            if (dd.count < 2) {
                 return 'Error: Please provide at least 2 price points';
             }
             
-            let maxDrawdown = 0;
-            let peak = prices[0];
-            let peakIndex = 0;
-            let valley = prices[0];
-            let valleyIndex = 0;
-            let currentPeak = prices[0];
-            let currentPeakIndex = 0;
-            
-            for (let i = 1; i < prices.length; i++) {
-                if (prices[i] > currentPeak) {
-                    currentPeak = prices[i];
-                    currentPeakIndex = i;
-                }
-                
-                const drawdown = (currentPeak - prices[i]) / currentPeak;
-                if (drawdown > maxDrawdown) {
-                    maxDrawdown = drawdown;
-                    peak = currentPeak;
-                    peakIndex = currentPeakIndex;
-                    valley = prices[i];
-                    valleyIndex = i;
-                }
-            }
+            const maxDrawdown = dd.maxDrawdown;
             
             return `Maximum Drawdown: ${(maxDrawdown * 100).toFixed(2)}%
-Peak Value: $${peak.toFixed(2)} (point ${peakIndex + 1})
-Valley Value: $${valley.toFixed(2)} (point ${valleyIndex + 1})
+Peak Value: $${dd.peak.toFixed(2)} (point ${dd.peakIndex + 1})
+Valley Value: $${dd.valley.toFixed(2)} (point ${dd.valleyIndex + 1})
 Recovery Required: ${((1/(1-maxDrawdown) - 1) * 100).toFixed(2)}%`;
         }
     },
@@ -988,27 +974,27 @@ Average Cost: $${(totalInvested/totalUnits).toFixed(6)}`;
         inputs: [
             { id: 'prices', label: 'Daily Closing Prices (comma-separated)', type: 'text', placeholder: 'e.g., 100,102,98,103' }
         ],
+        requires: ['indicators'],
         calculate: function(inputs) {
-            const prices = inputs.prices.split(',').map(x => parseFloat(x));
-            
-            if (prices.length < 2) {
-                return 'Error: Please provide at least 2 price points';
+            const series = createSeriesReader(inputs.prices);
+            const returns = createWelford();
+            let previous = series.next();
+            for (let price = series.next(); price !== undefined; price = series.next()) {
+                returns.push((price - previous) / previous);
+                previous = price;
             }
             
-            const returns = [];
-            for(let i = 1; i < prices.length; i++) {
-                returns.push((prices[i] - prices[i-1]) / prices[i-1]);
+            if (returns.count < 1) {
+                return 'Error: Please provide at least 2 price points';
             }
             
-            const mean = returns.reduce((a,b) => a + b, 0) / returns.length;
-            const variance = returns.reduce((a,b) => a + Math.pow(b - mean, 2), 0) / returns.length;
-            const stdDev = Math.sqrt(variance);
+            const stdDev = Math.sqrt(returns.variance());
             const annualizedVol = stdDev * Math.sqrt(365) * 100;
             
             return `Daily Volatility: ${(stdDev * 100).toFixed(2)}%
 Annualized Volatility: ${annualizedVol.toFixed(2)}%
-Max Daily Return: ${(Math.max(...returns) * 100).toFixed(2)}%
-Min Daily Return: ${(Math.min(...returns) * 100).toFixed(2)}%`;
+Max Daily Return: ${(returns.max * 100).toFixed(2)}%
+Min Daily Return: ${(returns.min * 100).toFixed(2)}%`;
         }
     },
 
@@ -1021,23 +1007,18 @@ Min Daily Return: ${(Math.min(...returns) * 100).toFixed(2)}%`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['mm', 'cm', 'm', 'km', 'in', 'ft', 'yd', 'mi'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['mm', 'cm', 'm', 'km', 'in', 'ft', 'yd', 'mi'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to meters first
-            const toMeters = {
-                'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000,
-                'in': 0.0254, 'ft': 0.3048, 'yd': 0.9144, 'mi': 1609.344
-            };
-            
-            const meters = value * toMeters[fromUnit];
-            const result = meters / toMeters[toUnit];
+            const meters = convertUnit('length', value, fromUnit, 'm');
+            const result = convertUnit('length', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Meters: ${meters.toFixed(6)} m
-Conversion Factor: ${(toMeters[fromUnit] / toMeters[toUnit]).toFixed(8)}`;
+Conversion Factor: ${unitFactor('length', fromUnit, toUnit).toFixed(8)}`;
         }
     },
 
@@ -1049,28 +1030,14 @@ Conversion Factor: ${(toMeters[fromUnit] / toMeters[toUnit]).toFixed(8)}`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['C', 'F', 'K', 'R'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['C', 'F', 'K', 'R'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Celsius first
-            let celsius;
-            switch(fromUnit) {
-                case 'C': celsius = value; break;
-                case 'F': celsius = (value - 32) * 5/9; break;
-                case 'K': celsius = value - 273.15; break;
-                case 'R': celsius = (value - 491.67) * 5/9; break;
-            }
-            
-            // Convert from Celsius to target unit
-            let result;
-            switch(toUnit) {
-                case 'C': result = celsius; break;
-                case 'F': result = celsius * 9/5 + 32; break;
-                case 'K': result = celsius + 273.15; break;
-                case 'R': result = celsius * 9/5 + 491.67; break;
-            }
+            const celsius = convertUnit('temperature', value, fromUnit, 'C');
+            const result = convertUnit('temperature', value, fromUnit, toUnit);
             
             return `${value}°${fromUnit} = ${result.toFixed(2)}°${toUnit}
 Celsius: ${celsius.toFixed(2)}°C
@@ -1087,19 +1054,14 @@ Kelvin: ${(celsius + 273.15).toFixed(2)}K`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['mg', 'g', 'kg', 't', 'oz', 'lb', 'st'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['mg', 'g', 'kg', 't', 'oz', 'lb', 'st'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to grams first
-            const toGrams = {
-                'mg': 0.001, 'g': 1, 'kg': 1000, 't': 1000000,
-                'oz': 28.3495, 'lb': 453.592, 'st': 6350.29
-            };
-            
-            const grams = value * toGrams[fromUnit];
-            const result = grams / toGrams[toUnit];
+            const grams = convertUnit('weight', value, fromUnit, 'g');
+            const result = convertUnit('weight', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Grams: ${grams.toFixed(3)} g
@@ -1116,20 +1078,14 @@ Pounds: ${(grams/453.592).toFixed(6)} lb`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['mm²', 'cm²', 'm²', 'km²', 'in²', 'ft²', 'yd²', 'ac', 'ha'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['mm²', 'cm²', 'm²', 'km²', 'in²', 'ft²', 'yd²', 'ac', 'ha'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to square meters first
-            const toSqMeters = {
-                'mm²': 0.000001, 'cm²': 0.0001, 'm²': 1, 'km²': 1000000,
-                'in²': 0.00064516, 'ft²': 0.092903, 'yd²': 0.836127,
-                'ac': 4046.86, 'ha': 10000
-            };
-            
-            const sqMeters = value * toSqMeters[fromUnit];
-            const result = sqMeters / toSqMeters[toUnit];
+            const sqMeters = convertUnit('area', value, fromUnit, 'm²');
+            const result = convertUnit('area', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Square Meters: ${sqMeters.toFixed(6)} m²
@@ -1146,20 +1102,14 @@ Hectares: ${(sqMeters/10000).toFixed(6)} ha`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['ml', 'l', 'm³', 'fl oz', 'cup', 'pt', 'qt', 'gal'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['ml', 'l', 'm³', 'fl oz', 'cup', 'pt', 'qt', 'gal'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to liters first
-            const toLiters = {
-                'ml': 0.001, 'l': 1, 'm³': 1000,
-                'fl oz': 0.0295735, 'cup': 0.236588, 'pt': 0.473176,
-                'qt': 0.946353, 'gal': 3.78541
-            };
-            
-            const liters = value * toLiters[fromUnit];
-            const result = liters / toLiters[toUnit];
+            const liters = convertUnit('volume', value, fromUnit, 'l');
+            const result = convertUnit('volume', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Liters: ${liters.toFixed(6)} L
@@ -1176,19 +1126,14 @@ Gallons: ${(liters/3.78541).toFixed(6)} gal`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['m/s', 'km/h', 'mph', 'ft/s', 'knots'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['m/s', 'km/h', 'mph', 'ft/s', 'knots'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to m/s first
-            const toMPS = {
-                'm/s': 1, 'km/h': 1/3.6, 'mph': 0.44704,
-                'ft/s': 0.3048, 'knots': 0.514444
-            };
-            
-            const mps = value * toMPS[fromUnit];
-            const result = mps / toMPS[toUnit];
+            const mps = convertUnit('speed', value, fromUnit, 'm/s');
+            const result = convertUnit('speed', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Meters/Second: ${mps.toFixed(6)} m/s
@@ -1205,19 +1150,14 @@ Miles/Hour: ${(mps/0.44704).toFixed(3)} mph`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['Pa', 'kPa', 'MPa', 'bar', 'atm', 'psi', 'mmHg', 'inHg'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['Pa', 'kPa', 'MPa', 'bar', 'atm', 'psi', 'mmHg', 'inHg'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Pascals first
-            const toPascals = {
-                'Pa': 1, 'kPa': 1000, 'MPa': 1000000, 'bar': 100000,
-                'atm': 101325, 'psi': 6894.76, 'mmHg': 133.322, 'inHg': 3386.39
-            };
-            
-            const pascals = value * toPascals[fromUnit];
-            const result = pascals / toPascals[toUnit];
+            const pascals = convertUnit('pressure', value, fromUnit, 'Pa');
+            const result = convertUnit('pressure', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Pascals: ${pascals.toFixed(3)} Pa
@@ -1234,19 +1174,14 @@ PSI: ${(pascals/6894.76).toFixed(3)} psi`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['J', 'kJ', 'MJ', 'cal', 'kcal', 'Wh', 'kWh', 'BTU', 'eV'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['J', 'kJ', 'MJ', 'cal', 'kcal', 'Wh', 'kWh', 'BTU', 'eV'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Joules first
-            const toJoules = {
-                'J': 1, 'kJ': 1000, 'MJ': 1000000, 'cal': 4.184,
-                'kcal': 4184, 'Wh': 3600, 'kWh': 3600000, 'BTU': 1055.06, 'eV': 1.602e-19
-            };
-            
-            const joules = value * toJoules[fromUnit];
-            const result = joules / toJoules[toUnit];
+            const joules = convertUnit('energy', value, fromUnit, 'J');
+            const result = convertUnit('energy', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Joules: ${joules.toFixed(3)} J
@@ -1263,19 +1198,14 @@ Calories: ${(joules/4.184).toFixed(3)} cal`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['W', 'kW', 'MW', 'hp', 'BTU/h', 'cal/s'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['W', 'kW', 'MW', 'hp', 'BTU/h', 'cal/s'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Watts first
-            const toWatts = {
-                'W': 1, 'kW': 1000, 'MW': 1000000, 'hp': 745.7,
-                'BTU/h': 0.293071, 'cal/s': 4.184
-            };
-            
-            const watts = value * toWatts[fromUnit];
-            const result = watts / toWatts[toUnit];
+            const watts = convertUnit('power', value, fromUnit, 'W');
+            const result = convertUnit('power', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Watts: ${watts.toFixed(3)} W
@@ -1292,19 +1222,14 @@ Horsepower: ${(watts/745.7).toFixed(6)} hp`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['bit', 'byte', 'KB', 'MB', 'GB', 'TB', 'PB'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['bit', 'byte', 'KB', 'MB', 'GB', 'TB', 'PB'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to bytes first
-            const toBytes = {
-                'bit': 0.125, 'byte': 1, 'KB': 1024, 'MB': 1048576,
-                'GB': 1073741824, 'TB': 1099511627776, 'PB': 1125899906842624
-            };
-            
-            const bytes = value * toBytes[fromUnit];
-            const result = bytes / toBytes[toUnit];
+            const bytes = convertUnit('data-storage', value, fromUnit, 'byte');
+            const result = convertUnit('data-storage', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Bytes: ${bytes.toFixed(0)} bytes
@@ -1321,19 +1246,14 @@ Gigabytes: ${(bytes/1073741824).toFixed(6)} GB`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['deg', 'rad', 'grad', 'turn', 'arcmin', 'arcsec'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['deg', 'rad', 'grad', 'turn', 'arcmin', 'arcsec'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to degrees first
-            const toDegrees = {
-                'deg': 1, 'rad': 180/Math.PI, 'grad': 0.9, 'turn': 360,
-                'arcmin': 1/60, 'arcsec': 1/3600
-            };
-            
-            const degrees = value * toDegrees[fromUnit];
-            const result = degrees / toDegrees[toUnit];
+            const degrees = convertUnit('angle', value, fromUnit, 'deg');
+            const result = convertUnit('angle', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Degrees: ${degrees.toFixed(6)}°
@@ -1350,19 +1270,14 @@ Gradians: ${(degrees/0.9).toFixed(6)} grad`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['ms', 'sec', 'min', 'hr', 'day', 'week', 'month', 'year'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['ms', 'sec', 'min', 'hr', 'day', 'week', 'month', 'year'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to seconds first
-            const toSeconds = {
-                'ms': 0.001, 'sec': 1, 'min': 60, 'hr': 3600, 'day': 86400,
-                'week': 604800, 'month': 2629746, 'year': 31556952
-            };
-            
-            const seconds = value * toSeconds[fromUnit];
-            const result = seconds / toSeconds[toUnit];
+            const seconds = convertUnit('time', value, fromUnit, 'sec');
+            const result = convertUnit('time', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Seconds: ${seconds.toFixed(3)} sec
@@ -1380,19 +1295,14 @@ Days: ${(seconds/86400).toFixed(6)} days`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['Hz', 'kHz', 'MHz', 'GHz', 'THz', 'rpm', 'rps'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['Hz', 'kHz', 'MHz', 'GHz', 'THz', 'rpm', 'rps'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Hz first
-            const toHz = {
-                'Hz': 1, 'kHz': 1000, 'MHz': 1000000, 'GHz': 1000000000,
-                'THz': 1000000000000, 'rpm': 1/60, 'rps': 1
-            };
-            
-            const hz = value * toHz[fromUnit];
-            const result = hz / toHz[toUnit];
+            const hz = convertUnit('frequency', value, fromUnit, 'Hz');
+            const result = convertUnit('frequency', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Hertz: ${hz.toFixed(3)} Hz
@@ -1431,28 +1341,15 @@ Note: Please enter current exchange rate for accurate conversion`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['mpg', 'l/100km', 'km/l', 'mi/l'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['mpg', 'l/100km', 'km/l', 'mi/l'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to l/100km first (standard metric)
-            let l100km;
-            switch(fromUnit) {
-                case 'mpg': l100km = 235.214 / value; break;
-                case 'l/100km': l100km = value; break;
-                case 'km/l': l100km = 100 / value; break;
-                case 'mi/l': l100km = 160.934 / value; break;
-            }
-            
-            // Convert from l/100km to target unit
-            let result;
-            switch(toUnit) {
-                case 'mpg': result = 235.214 / l100km; break;
-                case 'l/100km': result = l100km; break;
-                case 'km/l': result = 100 / l100km; break;
-                case 'mi/l': result = 160.934 / l100km; break;
-            }
+            // l/100km is the standard metric
+            const l100km = convertUnit('fuel-economy', value, fromUnit, 'l/100km');
+            const result = convertUnit('fuel-economy', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(3)} ${toUnit}
 L/100km: ${l100km.toFixed(3)} L/100km
@@ -1469,19 +1366,14 @@ KM/L: ${(100/l100km).toFixed(3)} km/L`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['kg/m³', 'g/cm³', 'g/ml', 'lb/ft³', 'oz/in³'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['kg/m³', 'g/cm³', 'g/ml', 'lb/ft³', 'oz/in³'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to kg/m³ first
-            const toKgM3 = {
-                'kg/m³': 1, 'g/cm³': 1000, 'g/ml': 1000,
-                'lb/ft³': 16.0185, 'oz/in³': 1729.99
-            };
-            
-            const kgm3 = value * toKgM3[fromUnit];
-            const result = kgm3 / toKgM3[toUnit];
+            const kgm3 = convertUnit('density', value, fromUnit, 'kg/m³');
+            const result = convertUnit('density', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 kg/m³: ${kgm3.toFixed(3)} kg/m³
@@ -1498,19 +1390,14 @@ lb/ft³: ${(kgm3/16.0185).toFixed(3)} lb/ft³`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['N', 'kN', 'lbf', 'kgf', 'dyn', 'pdl'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['N', 'kN', 'lbf', 'kgf', 'dyn', 'pdl'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Newtons first
-            const toNewtons = {
-                'N': 1, 'kN': 1000, 'lbf': 4.44822, 'kgf': 9.80665,
-                'dyn': 0.00001, 'pdl': 0.138255
-            };
-            
-            const newtons = value * toNewtons[fromUnit];
-            const result = newtons / toNewtons[toUnit];
+            const newtons = convertUnit('force', value, fromUnit, 'N');
+            const result = convertUnit('force', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Newtons: ${newtons.toFixed(3)} N
@@ -1527,20 +1414,14 @@ Kilograms-force: ${(newtons/9.80665).toFixed(3)} kgf`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['lm', 'cd', 'lx', 'fc'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['lm', 'cd', 'lx', 'fc'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
             // Note: These conversions are approximate and context-dependent
-            const conversions = {
-                'lm': { 'lm': 1, 'cd': 0.0796, 'lx': 1, 'fc': 0.0929 },
-                'cd': { 'lm': 12.57, 'cd': 1, 'lx': 12.57, 'fc': 1.168 },
-                'lx': { 'lm': 1, 'cd': 0.0796, 'lx': 1, 'fc': 0.0929 },
-                'fc': { 'lm': 10.764, 'cd': 0.857, 'lx': 10.764, 'fc': 1 }
-            };
-            
-            const result = value * conversions[fromUnit][toUnit];
+            const result = convertUnit('luminosity', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Note: Luminosity conversions depend on geometry and context
@@ -1559,19 +1440,14 @@ Foot-candles (fc): Illuminance`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['T', 'mT', 'μT', 'G', 'mG', 'Oe'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['T', 'mT', 'μT', 'G', 'mG', 'Oe'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Tesla first
-            const toTesla = {
-                'T': 1, 'mT': 0.001, 'μT': 0.000001,
-                'G': 0.0001, 'mG': 0.0000001, 'Oe': 0.0000796
-            };
-            
-            const tesla = value * toTesla[fromUnit];
-            const result = tesla / toTesla[toUnit];
+            const tesla = convertUnit('magnetic-field', value, fromUnit, 'T');
+            const result = convertUnit('magnetic-field', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Tesla: ${tesla.toFixed(9)} T
@@ -1589,19 +1465,14 @@ Note: Earth's magnetic field ≈ 50 μT`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['Bq', 'kBq', 'MBq', 'GBq', 'Ci', 'mCi', 'μCi', 'nCi', 'pCi'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['Bq', 'kBq', 'MBq', 'GBq', 'Ci', 'mCi', 'μCi', 'nCi', 'pCi'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Becquerels first
-            const toBq = {
-                'Bq': 1, 'kBq': 1000, 'MBq': 1000000, 'GBq': 1000000000,
-                'Ci': 3.7e10, 'mCi': 3.7e7, 'μCi': 37000, 'nCi': 37, 'pCi': 0.037
-            };
-            
-            const bq = value * toBq[fromUnit];
-            const result = bq / toBq[toUnit];
+            const bq = convertUnit('radioactivity', value, fromUnit, 'Bq');
+            const result = convertUnit('radioactivity', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Becquerels: ${bq.toExponential(3)} Bq
@@ -1618,19 +1489,14 @@ Note: 1 Ci = 3.7×10¹⁰ disintegrations/second`;
             { id: 'fromUnit', label: 'From Unit', type: 'select', options: ['Nm', 'kNm', 'lbft', 'lbin', 'kgfm', 'kgfcm', 'ozin'] },
             { id: 'toUnit', label: 'To Unit', type: 'select', options: ['Nm', 'kNm', 'lbft', 'lbin', 'kgfm', 'kgfcm', 'ozin'] }
         ],
+        requires: ['unit-table', 'units'],
         calculate: function(inputs) {
             const value = parseFloat(inputs.value) || 0;
             const fromUnit = inputs.fromUnit;
             const toUnit = inputs.toUnit;
             
-            // Convert to Newton-meters first
-            const toNm = {
-                'Nm': 1, 'kNm': 1000, 'lbft': 1.35582, 'lbin': 0.112985,
-                'kgfm': 9.80665, 'kgfcm': 0.0980665, 'ozin': 0.00706155
-            };
-            
-            const nm = value * toNm[fromUnit];
-            const result = nm / toNm[toUnit];
+            const nm = convertUnit('torque', value, fromUnit, 'Nm');
+            const result = convertUnit('torque', value, fromUnit, toUnit);
             
             return `${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
 Newton-meters: ${nm.toFixed(3)} Nm
@@ -1730,10 +1596,12 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
             const rate = parseFloat(inputs.rate) / 100 / 12;
             const months = parseInt(inputs.years) * 12;
             
-            let balance = initial;
-            for (let i = 0; i < months; i++) {
-                balance = (balance + monthly) * (1 + rate);
-            }
+            // Closed form of the monthly step balance = (balance + monthly) * (1 + rate)
+            const periods = months > 0 ? months : 0;
+            const growth = Math.pow(1 + rate, periods);
+            const balance = rate === 0
+                ? initial + monthly * periods
+                : initial * growth + monthly * (1 + rate) * (growth - 1) / rate;
             
             const totalContributions = initial + (monthly * months);
             const earnings = balance - totalContributions;
@@ -2024,52 +1892,47 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
         title: 'Statistics Calculator',
         icon: 'fas fa-chart-bar',
         inputs: [
-            { id: 'data', label: 'Data Set (comma separated)', type: 'text', placeholder: 'e.g., 1,2,3,4,5' },
+            { id: 'data', label: 'Data Set (comma separated)', type: 'text', placeholder: 'e.g., 1,2,3,4,5', optional: true },
+            { id: 'dataFile', label: 'Or Upload a Data File (.csv/.txt, millions of values)', type: 'file', accept: '.csv,.txt,.tsv,text/plain,text/csv' },
             { id: 'calculation', label: 'Calculation Type', type: 'select', 
-              options: ['All Statistics', 'Mean', 'Median', 'Mode', 'Standard Deviation', 'Variance'] }
+              options: ['All Statistics', 'Mean', 'Median', 'Mode', 'Standard Deviation', 'Variance', 'Percentiles'] }
         ],
+        requires: ['statistics'],
         calculate: function(inputs) {
-            const dataStr = inputs.data || '';
-            const data = dataStr.split(',').map(x => parseFloat(x.trim())).filter(x => !isNaN(x));
-            
-            if (data.length === 0) return 'Error: Please enter valid numeric data';
-            
-            // Sort data for median calculation
-            const sortedData = [...data].sort((a, b) => a - b);
-            
-            // Mean
-            const mean = data.reduce((sum, x) => sum + x, 0) / data.length;
-            
-            // Median
-            const median = data.length % 2 === 0 
-                ? (sortedData[data.length / 2 - 1] + sortedData[data.length / 2]) / 2
-                : sortedData[Math.floor(data.length / 2)];
-            
-            // Mode
-            const frequency = {};
-            data.forEach(x => frequency[x] = (frequency[x] || 0) + 1);
-            const maxFreq = Math.max(...Object.values(frequency));
-            const mode = Object.keys(frequency).filter(x => frequency[x] === maxFreq);
-            
-            // Variance and Standard Deviation
-            const variance = data.reduce((sum, x) => sum + Math.pow(x - mean, 2), 0) / data.length;
-            const stdDev = Math.sqrt(variance);
-            
-            // Range
-            const range = Math.max(...data) - Math.min(...data);
+            // One pass over the data; only the values themselves (8 bytes each) are kept
+            const report = (stats) => {
+                if (stats.count === 0) return 'Error: Please enter valid numeric data';
+                
+                // Preview the data before selection reorders the stored values
+                const preview = Array.from(stats.values.subarray(0, Math.min(stats.count, 20)));
+                const mean = stats.mean;
+                const median = stats.median();
+                const modes = stats.modes();
+                const shown = modes.values.slice(0, 10).join(', ');
+                const mode = modes.values.length > 10 ? `${shown}, … (${modes.values.length} values tie)` : shown;
+                const variance = stats.variance();
+                const stdDev = Math.sqrt(variance);
+                const range = stats.max - stats.min;
+                const percentiles = STATISTICS_PERCENTILES.map(p => `P${p}: ${stats.percentile(p).toFixed(4)}`).join('\n');
+                
+                if (inputs.calculation === 'All Statistics') {
+                    const data = stats.count > 20 ? `${preview.join(', ')}, … (${stats.count} values)` : preview.join(', ');
+                    return `Data: [${data}]\nCount: ${stats.count}\n\nMeasures of Central Tendency:\nMean: ${mean.toFixed(4)}\nMedian: ${median.toFixed(4)}\nMode: ${mode}\n\nMeasures of Dispersion:\nRange: ${range.toFixed(4)}\nVariance: ${variance.toFixed(4)}\nStandard Deviation: ${stdDev.toFixed(4)}\n\nPercentiles:\n${percentiles}\n\nMinimum: ${stats.min}\nMaximum: ${stats.max}`;
+                } else {
+                    const results = {
+                        'Mean': mean.toFixed(4),
+                        'Median': median.toFixed(4),
+                        'Mode': mode,
+                        'Standard Deviation': stdDev.toFixed(4),
+                        'Variance': variance.toFixed(4),
+                        'Percentiles': `\n${percentiles}`
+                    };
+                    return `${inputs.calculation}: ${results[inputs.calculation]}`;
+                }
+            };
             
-            if (inputs.calculation === 'All Statistics') {
-                return `Data: [${data.join(', ')}]\nCount: ${data.length}\n\nMeasures of Central Tendency:\nMean: ${mean.toFixed(4)}\nMedian: ${median.toFixed(4)}\nMode: ${mode.join(', ')}\n\nMeasures of Dispersion:\nRange: ${range.toFixed(4)}\nVariance: ${variance.toFixed(4)}\nStandard Deviation: ${stdDev.toFixed(4)}\n\nMinimum: ${Math.min(...data)}\nMaximum: ${Math.max(...data)}`;
-            } else {
-                const results = {
-                    'Mean': mean.toFixed(4),
-                    'Median': median.toFixed(4),
-                    'Mode': mode.join(', '),
-                    'Standard Deviation': stdDev.toFixed(4),
-                    'Variance': variance.toFixed(4)
-                };
-                return `${inputs.calculation}: ${results[inputs.calculation]}`;
-            }
+            if (inputs.dataFile) return statisticsFromFile(inputs.dataFile).then(report);
+            return report(statisticsFromText(inputs.data || ''));
         }
     },
 
@@ -2078,10 +1941,14 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
         icon: 'fas fa-th',
         inputs: [
             { id: 'operation', label: 'Operation', type: 'select', 
-              options: ['Determinant (2x2)', 'Determinant (3x3)', 'Matrix Addition', 'Matrix Multiplication'] },
+              options: ['Determinant (2x2)', 'Determinant (3x3)', 'Determinant (NxN)', 'Matrix Addition', 'Matrix Multiplication',
+                        'Inverse', 'Solve Ax = b', 'Rank', 'Transpose'] },
             { id: 'matrix', label: 'Matrix Elements (comma separated)', type: 'text', 
-              placeholder: 'For 2x2: a,b,c,d (row by row)' }
+              placeholder: 'For 2x2: a,b,c,d (row by row), or rows separated by ; e.g. 1,2,3;4,5,6' },
+            { id: 'matrixB', label: 'Matrix B or vector b (if needed)', type: 'text',
+              placeholder: 'Second matrix for addition/multiplication, or b for Ax = b', optional: true }
         ],
+        requires: ['matrix'],
         calculate: function(inputs) {
             const elements = inputs.matrix.split(',').map(x => parseFloat(x.trim()));
             
@@ -2099,6 +1966,35 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
                 return `Matrix:\n[${a} ${b} ${c}]\n[${d} ${e} ${f}]\n[${g} ${h} ${i}]\n\nDeterminant: ${det}`;
             }
             
+            try {
+                const a = parseMatrix(inputs.matrix);
+                const size = `${a.rows}×${a.cols}`;
+                switch (inputs.operation) {
+                    case 'Determinant (NxN)':
+                        return `Matrix (${size}):\n${formatMatrix(a)}\n\nDeterminant: ${parseFloat(determinant(a).toPrecision(12))}`;
+                    case 'Matrix Addition':
+                        return `A + B (${size}):\n${formatMatrix(addMatrices(a, parseMatrix(inputs.matrixB)))}`;
+                    case 'Matrix Multiplication': {
+                        const product = multiplyMatrices(a, parseMatrix(inputs.matrixB, a.cols));
+                        return `A × B (${product.rows}×${product.cols}):\n${formatMatrix(product)}`;
+                    }
+                    case 'Inverse':
+                        return `Inverse (${size}):\n${formatMatrix(invertMatrix(a))}`;
+                    case 'Solve Ax = b': {
+                        const x = solveMatrix(a, parseMatrix(inputs.matrixB, a.rows));
+                        return `Solution x (${x.rows}×${x.cols}):\n${formatMatrix(x, 20)}`;
+                    }
+                    case 'Rank':
+                        return `Matrix (${size}):\n${formatMatrix(a)}\n\nRank: ${matrixRank(a)}`;
+                    case 'Transpose': {
+                        const t = transposeMatrix(a);
+                        return `Transpose (${t.rows}×${t.cols}):\n${formatMatrix(t)}`;
+                    }
+                }
+            } catch (e) {
+                return `Error: ${e.message}`;
+            }
+            
             return 'Please select an operation and enter matrix elements';
         }
     },
@@ -2195,44 +2091,36 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
             { id: 'num1', label: 'Number 1', type: 'number', placeholder: 'Enter first number' },
             { id: 'num2', label: 'Number 2 (if needed)', type: 'number', placeholder: 'Enter second number' }
         ],
+        requires: ['primes'],
         calculate: function(inputs) {
-            const num1 = parseInt(inputs.num1) || 0;
-            const num2 = parseInt(inputs.num2) || 0;
-            
-            const gcd = (a, b) => b ? gcd(b, a % b) : a;
-            const lcm = (a, b) => (a * b) / gcd(a, b);
-            const isPrime = (n) => {
-                if (n < 2) return false;
-                for (let i = 2; i <= Math.sqrt(n); i++) {
-                    if (n % i === 0) return false;
-                }
-                return true;
-            };
+            // BigInt keeps inputs beyond 2^53 exact
+            const big1 = parseInteger(inputs.num1);
+            const big2 = parseInteger(inputs.num2);
+            const num1 = Number(big1);
             
             switch(inputs.operation) {
                 case 'GCD (Greatest Common Divisor)':
-                    if (num2 === 0) return 'Error: Please enter two numbers';
-                    return `GCD(${num1}, ${num2}) = ${gcd(Math.abs(num1), Math.abs(num2))}`;
+                    if (big2 === 0n) return 'Error: Please enter two numbers';
+                    return `GCD(${big1}, ${big2}) = ${gcd(big1, big2)}`;
                 
-                case 'LCM (Least Common Multiple)':
-                    if (num2 === 0) return 'Error: Please enter two numbers';
-                    return `LCM(${num1}, ${num2}) = ${lcm(Math.abs(num1), Math.abs(num2))}`;
+                case 'LCM (Least Common Multiple)': {
+                    if (big2 === 0n) return 'Error: Please enter two numbers';
+                    const a = big1 < 0n ? -big1 : big1;
+                    const b = big2 < 0n ? -big2 : big2;
+                    return `LCM(${big1}, ${big2}) = ${a / gcd(a, b) * b}`;
+                }
                 
                 case 'Prime Check':
-                    if (num1 < 0) return 'Error: Please enter a positive number';
-                    return `${num1} is ${isPrime(num1) ? 'prime' : 'not prime'}`;
+                    if (big1 < 0n) return 'Error: Please enter a positive number';
+                    if (big1 >= MILLER_RABIN_LIMIT) {
+                        return `${big1} is ${isPrime(big1) ? 'a probable prime' : 'not prime'}`;
+                    }
+                    return `${big1} is ${isPrime(big1) ? 'prime' : 'not prime'}`;
                 
                 case 'Prime Factorization':
-                    if (num1 < 2) return 'Error: Please enter a number ≥ 2';
-                    let n = num1;
-                    const factors = [];
-                    for (let i = 2; i <= n; i++) {
-                        while (n % i === 0) {
-                            factors.push(i);
-                            n /= i;
-                        }
-                    }
-                    return `Prime factorization of ${num1}: ${factors.join(' × ')}`;
+                    if (big1 < 2n) return 'Error: Please enter a number ≥ 2';
+                    if (big1 >= MILLER_RABIN_LIMIT) return 'Error: Please enter a number below 3.3 × 10^24';
+                    return `Prime factorization of ${big1}: ${factorize(big1).join(' × ')}`;
                 
                 case 'Fibonacci Sequence':
                     if (num1 < 1 || num1 > 50) return 'Error: Please enter a number between 1 and 50';
@@ -2502,6 +2390,7 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
         icon: 'fab fa-windows',
         isCustomInterface: true,
         inputs: [],
+        requires: ['graphing'],
         calculate: function(inputs) {
             return 'Calculator ready for use';
         },
@@ -2802,7 +2691,7 @@ Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`
                             <div id="graphing-keypad" class="calculator-mode-panel" style="display: none;">
                                 <div class="graphing-container">
                                     <div class="function-input-area">
-                                        <input type="text" id="function-input" placeholder="Enter function: f(x) = " class="function-input">
+                                        <input type="text" id="function-input" placeholder="f(x) = x^2 - 2; sin(x); 1/x" class="function-input">
                                         <button class="graph-btn" onclick="window.plotFunction()" title="Plot Function">Plot</button>
                                         <button class="graph-btn" onclick="window.clearGraph()" title="Clear Graph">Clear</button>
                                     </div>
@@ -6545,40 +6434,43 @@ Effective APR: ${tradingFeeApr.toFixed(2)}%`;
             { id: 'strikePrice', label: 'Strike Price ($)', type: 'number', placeholder: 'Enter strike price', step: '0.01' },
             { id: 'timeToExpiry', label: 'Days to Expiry', type: 'number', placeholder: 'Enter days to expiry' },
             { id: 'volatility', label: 'Implied Volatility (%)', type: 'number', placeholder: 'Enter volatility', step: '0.1' },
-            { id: 'optionType', label: 'Option Type', type: 'select', options: ['Call', 'Put'] }
+            { id: 'optionType', label: 'Option Type', type: 'select', options: ['Call', 'Put'] },
+            { id: 'riskFreeRate', label: 'Risk-Free Rate (%)', type: 'number', placeholder: 'Enter risk-free rate (default 0)', step: '0.01', optional: true },
+            { id: 'underlying', label: 'Underlying', type: 'select', options: ['Spot (Black-Scholes)', 'Futures (Black-76)'] }
         ],
+        requires: ['options'],
         calculate: function(inputs) {
             const spotPrice = parseFloat(inputs.spotPrice) || 0;
             const strikePrice = parseFloat(inputs.strikePrice) || 0;
             const timeToExpiry = parseFloat(inputs.timeToExpiry) || 0;
             const volatility = parseFloat(inputs.volatility) || 0;
             const optionType = inputs.optionType || 'Call';
+            const riskFreeRate = parseFloat(inputs.riskFreeRate) || 0;
+            const futures = inputs.underlying === 'Futures (Black-76)';
             
-            // Simplified Black-Scholes approximation
+            if (spotPrice <= 0 || strikePrice <= 0) {
+                return 'Error: Please enter positive underlying and strike prices';
+            }
+            
+            const isCall = optionType === 'Call';
             const timeInYears = timeToExpiry / 365;
             const moneyness = spotPrice / strikePrice;
-            const volEffect = volatility / 100 * Math.sqrt(timeInYears);
-            
-            let intrinsicValue, timeValue, totalValue;
+            const option = priceOption(isCall, spotPrice, strikePrice, timeInYears, riskFreeRate / 100, 0,
+                volatility / 100, futures ? 'black-76' : 'black-scholes');
             
-            if (optionType === 'Call') {
-                intrinsicValue = Math.max(0, spotPrice - strikePrice);
-                timeValue = spotPrice * volEffect * 0.4; // Simplified calculation
-            } else {
-                intrinsicValue = Math.max(0, strikePrice - spotPrice);
-                timeValue = strikePrice * volEffect * 0.4; // Simplified calculation
-            }
-            
-            totalValue = intrinsicValue + timeValue;
-            const delta = optionType === 'Call' ? 0.5 + (moneyness - 1) * 0.3 : -0.5 + (1 - moneyness) * 0.3;
+            const intrinsicValue = Math.max(0, isCall ? spotPrice - strikePrice : strikePrice - spotPrice);
+            const timeValue = option.price - intrinsicValue;
             
-            return `Option Value: $${totalValue.toFixed(2)}
+            return `Option Value: $${option.price.toFixed(2)}
 Intrinsic Value: $${intrinsicValue.toFixed(2)}
 Time Value: $${timeValue.toFixed(2)}
 Moneyness: ${(moneyness * 100).toFixed(1)}%
-Estimated Delta: ${delta.toFixed(3)}
-Time Decay per Day: $${(timeValue / timeToExpiry).toFixed(3)}
-Note: This is a simplified calculation`;
+Delta: ${option.delta.toFixed(3)}
+Gamma: ${option.gamma.toFixed(6)}
+Vega: $${(option.vega / 100).toFixed(3)} per 1% volatility
+Time Decay per Day: $${(option.theta / 365).toFixed(3)}
+Rho: $${(option.rho / 100).toFixed(3)} per 1% rate
+Model: ${futures ? 'Black-76 (options on futures)' : 'Black-Scholes (options on spot)'}`;
         }
     },
 
@@ -7104,17 +6996,18 @@ Buy Grids: ${gridsBelow} | Sell Grids: ${gridsAbove}`;
             { id: 'currentPrice', label: 'Current Price ($)', type: 'number', placeholder: 'Enter current price', step: '0.000001' },
             { id: 'volume', label: 'Average Volume', type: 'number', placeholder: 'Enter average volume' }
         ],
+        requires: ['indicators'],
         calculate: function(inputs) {
             const price1 = parseFloat(inputs.price1) || 0;
             const price2 = parseFloat(inputs.price2) || 0;
             const currentPrice = parseFloat(inputs.currentPrice) || 0;
             const volume = parseFloat(inputs.volume) || 0;
             
-            // Simplified RSI calculation
-            const change1 = currentPrice - price2;
-            const change2 = price2 - price1;
-            const avgGain = Math.max(0, (Math.max(0, change1) + Math.max(0, change2)) / 2);
-            const avgLoss = Math.max(0.01, (Math.max(0, -change1) + Math.max(0, -change2)) / 2);
+            // Simplified RSI: Wilder's averages over the two weekly changes
+            const indicator = createRSI(2);
+            [price1, price2, currentPrice].forEach(price => indicator.push(price));
+            const avgGain = indicator.averageGain;
+            const avgLoss = Math.max(0.01, indicator.averageLoss);
             const rs = avgGain / avgLoss;
             const rsi = 100 - (100 / (1 + rs));
             
@@ -7129,7 +7022,7 @@ Buy Grids: ${gridsBelow} | Sell Grids: ${gridsAbove}`;
             return `RSI (14): ${rsi.toFixed(1)}
 RSI Signal: ${rsiSignal}
 Price Momentum: ${momentum.toFixed(2)}%
-Recent Trend: ${change1 > 0 ? 'Bullish' : 'Bearish'}
+Recent Trend: ${currentPrice > price2 ? 'Bullish' : 'Bearish'}
 Average Volume: ${volume.toLocaleString()}
 Technical Summary: ${rsi > 50 && momentum > 0 ? 'Bullish' : rsi < 50 && momentum < 0 ? 'Bearish' : 'Mixed'}`;
         }
@@ -7190,6 +7083,7 @@ Risk Level: ${Math.abs(fundingRate) > 0.1 ? 'High' : 'Low'}`;
             { id: 'vol2', label: 'Implied Vol 2 (%)', type: 'number', placeholder: 'Enter implied volatility 2', step: '0.1' },
             { id: 'daysToExpiry', label: 'Days to Expiry', type: 'number', placeholder: 'Enter days to expiry' }
         ],
+        requires: ['options'],
         calculate: function(inputs) {
             const currentPrice = parseFloat(inputs.currentPrice) || 0;
             const strike1 = parseFloat(inputs.strike1) || 0;
@@ -7198,15 +7092,33 @@ Risk Level: ${Math.abs(fundingRate) > 0.1 ? 'High' : 'Low'}`;
             const vol2 = parseFloat(inputs.vol2) || 0;
             const daysToExpiry = parseFloat(inputs.daysToExpiry) || 0;
             
+            if (currentPrice <= 0 || strike1 <= 0 || strike2 <= 0) {
+                return 'Error: Please enter positive prices and strikes';
+            }
+            
             const moneyness1 = strike1 / currentPrice;
             const moneyness2 = strike2 / currentPrice;
             const volSkew = vol2 - vol1;
             const timeToExpiry = daysToExpiry / 365;
             
-            // Calculate volatility smile metrics
-            const atmVol = (vol1 + vol2) / 2; // Simplified ATM vol
+            // Volatility is interpolated linearly in log-moneyness through the two quotes
+            const x1 = Math.log(moneyness1);
+            const x2 = Math.log(moneyness2);
+            const smileVol = strike => x1 === x2
+                ? (vol1 + vol2) / 2
+                : vol1 + (vol2 - vol1) * (Math.log(strike / currentPrice) - x1) / (x2 - x1);
+            const atmVol = smileVol(currentPrice);
             const skewPerStrike = volSkew / Math.abs(moneyness2 - moneyness1);
             
+            // Price the smile across the quoted strike range in one grid
+            const low = Math.min(strike1, strike2);
+            const high = Math.max(strike1, strike2);
+            const strikes = [0, 1, 2, 3, 4].map(i => low + (high - low) * i / 4);
+            const grid = priceGrid(true, currentPrice, strikes, [timeToExpiry], 0, 0,
+                strike => Math.max(0, smileVol(strike)) / 100, 'black-scholes');
+            const smileRows = strikes.map((strike, i) =>
+                `  $${strike.toFixed(2)}: IV ${smileVol(strike).toFixed(1)}%, call $${grid.price[i].toFixed(2)}, delta ${grid.delta[i].toFixed(3)}`);
+            
             let skewDirection;
             if (volSkew > 2) skewDirection = 'Strong Put Skew (Fear)';
             else if (volSkew > 0) skewDirection = 'Moderate Put Skew';
@@ -7221,7 +7133,9 @@ Skew Direction: ${skewDirection}
 Skew per Strike: ${skewPerStrike.toFixed(2)}%
 Vol of Vol: ${volOfVol.toFixed(1)}%
 Market Sentiment: ${volSkew > 0 ? 'Risk Averse' : 'Risk Seeking'}
-Time to Expiry: ${timeToExpiry.toFixed(3)} years`;
+Time to Expiry: ${timeToExpiry.toFixed(3)} years
+Smile (Black-Scholes calls, zero rates):
+${smileRows.join('\n')}`;
         }
     },
 
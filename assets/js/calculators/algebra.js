@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("algebra",{title:'Algebra Solver',icon:'fas fa-square-root-alt',inputs:[{id:'equation',label:'Equation Type',type:'select',options:['Linear (ax + b = c)','System of Linear Equations','Simplify Expression']},{id:'a',label:'Coefficient a',type:'number',placeholder:'Enter coefficient a'},{id:'b',label:'Coefficient b',type:'number',placeholder:'Enter coefficient b'},{id:'c',label:'Constant c',type:'number',placeholder:'Enter constant c'}],calculate:function(inputs){const a=parseFloat(inputs.a)||0;const b=parseFloat(inputs.b)||0;const c=parseFloat(inputs.c)||0;if(inputs.equation==='Linear (ax + b = c)'){if(a===0)return'Error: Coefficient a cannot be zero for linear equation';const x=(c-b)/a;return`Linear Equation: ${a}x + ${b} = ${c}\nSolution: x = ${x.toFixed(4)}\nVerification: ${a}(${x.toFixed(4)}) + ${b} = ${(a * x + b).toFixed(4)}`;}
+return'Please select equation type and enter coefficients';}});
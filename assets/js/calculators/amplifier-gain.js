@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("amplifier-gain",{title:'Amplifier Gain Calculator',icon:'fas fa-chart-line',inputs:[{id:'inputVoltage',label:'Input Voltage (V)',type:'number',placeholder:'Enter input voltage'},{id:'outputVoltage',label:'Output Voltage (V)',type:'number',placeholder:'Enter output voltage'},{id:'inputPower',label:'Input Power (W)',type:'number',placeholder:'Enter input power (optional)'},{id:'outputPower',label:'Output Power (W)',type:'number',placeholder:'Enter output power (optional)'}],calculate:function(inputs){const vIn=parseFloat(inputs.inputVoltage)||0;const vOut=parseFloat(inputs.outputVoltage)||0;const pIn=parseFloat(inputs.inputPower)||0;const pOut=parseFloat(inputs.outputPower)||0;let result='Amplifier Gain Analysis:\n';if(vIn>0&&vOut>0){const voltageGain=vOut/vIn;const voltageGainDB=20*Math.log10(voltageGain);result+=`Voltage Gain: ${voltageGain.toFixed(3)}
+Voltage Gain: ${voltageGainDB.toFixed(1)} dB\n`;}
+if(pIn>0&&pOut>0){const powerGain=pOut/pIn;const powerGainDB=10*Math.log10(powerGain);const efficiency=(pOut/pIn)*100;result+=`Power Gain: ${powerGain.toFixed(3)}
+Power Gain: ${powerGainDB.toFixed(1)} dB
+Efficiency: ${efficiency.toFixed(1)}%\n`;}
+if(vIn>0&&vOut>0&&pIn>0&&pOut>0){const inputImpedance=(vIn*vIn)/pIn;const outputImpedance=(vOut*vOut)/pOut;result+=`Input Impedance: ${inputImpedance.toFixed(1)} Ω
+Output Impedance: ${outputImpedance.toFixed(1)} Ω`;}
+return result||'Please enter voltage or power values to calculate gain.';}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("angle",{title:'Angle Converter',icon:'fas fa-circle-notch',inputs:[{id:'value',label:'Angle',type:'number',placeholder:'Enter angle'},{id:'fromUnit',label:'From Unit',type:'select',options:['deg','rad','grad','turn','arcmin','arcsec']},{id:'toUnit',label:'To Unit',type:'select',options:['deg','rad','grad','turn','arcmin','arcsec']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const degrees=convertUnit('angle',value,fromUnit,'deg');const result=convertUnit('angle',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Degrees: ${degrees.toFixed(6)}°
+Radians: ${(degrees * Math.PI/180).toFixed(6)} rad
+Gradians: ${(degrees/0.9).toFixed(6)} grad`;}});
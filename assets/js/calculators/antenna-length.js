@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("antenna-length",{title:'Antenna Length Calculator',icon:'fas fa-broadcast-tower',inputs:[{id:'frequency',label:'Frequency (MHz)',type:'number',placeholder:'Enter frequency'},{id:'antennaType',label:'Antenna Type',type:'select',options:['Quarter Wave','Half Wave','Full Wave','5/8 Wave']}],calculate:function(inputs){const frequency=parseFloat(inputs.frequency)||0;const antennaType=inputs.antennaType||'Quarter Wave';const wavelength=300/frequency;const wavelengthFeet=wavelength*3.28084;const wavelengthInches=wavelengthFeet*12;let multiplier;switch(antennaType){case'Quarter Wave':multiplier=0.25;break;case'Half Wave':multiplier=0.5;break;case'Full Wave':multiplier=1.0;break;case'5/8 Wave':multiplier=0.625;break;default:multiplier=0.25;}
+const antennaLengthM=wavelength*multiplier;const antennaLengthFt=wavelengthFeet*multiplier;const antennaLengthIn=wavelengthInches*multiplier;const antennaLengthCm=antennaLengthM*100;return`${antennaType} Antenna Length:
+${antennaLengthM.toFixed(3)} meters
+${antennaLengthFt.toFixed(2)} feet
+${antennaLengthIn.toFixed(1)} inches
+${antennaLengthCm.toFixed(1)} cm
+
+Full Wavelength: ${wavelength.toFixed(3)} m
+Frequency: ${frequency} MHz
+Velocity Factor: 0.95 (typical)`;}});
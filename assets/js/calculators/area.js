@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("area",{title:'Area Converter',icon:'fas fa-square',inputs:[{id:'value',label:'Area',type:'number',placeholder:'Enter area'},{id:'fromUnit',label:'From Unit',type:'select',options:['mm²','cm²','m²','km²','in²','ft²','yd²','ac','ha']},{id:'toUnit',label:'To Unit',type:'select',options:['mm²','cm²','m²','km²','in²','ft²','yd²','ac','ha']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const sqMeters=convertUnit('area',value,fromUnit,'m²');const result=convertUnit('area',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Square Meters: ${sqMeters.toFixed(6)} m²
+Square Feet: ${(sqMeters/0.092903).toFixed(3)} ft²
+Hectares: ${(sqMeters/10000).toFixed(6)} ha`;}});
@@ -0,0 +1,17 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("beam-deflection",{title:'Beam Deflection Calculator',icon:'fas fa-ruler-horizontal',inputs:[{id:'load',label:'Load (N or lb)',type:'number',placeholder:'Enter load'},{id:'length',label:'Beam Length (m or ft)',type:'number',placeholder:'Enter beam length'},{id:'momentOfInertia',label:'Moment of Inertia (m⁴ or in⁴)',type:'number',placeholder:'Enter moment of inertia'},{id:'elasticModulus',label:'Elastic Modulus (Pa or psi)',type:'number',placeholder:'Enter elastic modulus'},{id:'beamType',label:'Beam Type',type:'select',options:['Simply Supported - Center Load','Simply Supported - Uniform Load','Cantilever - End Load','Cantilever - Uniform Load']}],calculate:function(inputs){const load=parseFloat(inputs.load)||0;const length=parseFloat(inputs.length)||0;const momentOfInertia=parseFloat(inputs.momentOfInertia)||0;const elasticModulus=parseFloat(inputs.elasticModulus)||0;const beamType=inputs.beamType||'Simply Supported - Center Load';let deflection=0;let formula='';switch(beamType){case'Simply Supported - Center Load':
+deflection=(load*Math.pow(length,3))/(48*elasticModulus*momentOfInertia);formula='δ = PL³/(48EI)';break;case'Simply Supported - Uniform Load':
+deflection=(5*load*Math.pow(length,4))/(384*elasticModulus*momentOfInertia);formula='δ = 5wL⁴/(384EI)';break;case'Cantilever - End Load':
+deflection=(load*Math.pow(length,3))/(3*elasticModulus*momentOfInertia);formula='δ = PL³/(3EI)';break;case'Cantilever - Uniform Load':
+deflection=(load*Math.pow(length,4))/(8*elasticModulus*momentOfInertia);formula='δ = wL⁴/(8EI)';break;}
+const maxStress=(load*length)/(4*momentOfInertia);const deflectionMM=deflection*1000;return`${beamType} Analysis:
+Maximum Deflection: ${deflection.toFixed(6)} units
+Maximum Deflection: ${deflectionMM.toFixed(3)} mm (if input in m)
+Maximum Stress: ${maxStress.toFixed(2)} Pa (if input in SI units)
+Formula Used: ${formula}
+
+Input Parameters:
+Load: ${load} N/lb
+Length: ${length} m/ft
+Moment of Inertia: ${momentOfInertia} m⁴/in⁴
+Elastic Modulus: ${elasticModulus} Pa/psi`;}});
@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("binary-calculator",{title:'Binary & Base Conversion',icon:'fas fa-binary',inputs:[{id:'operation',label:'Operation',type:'select',options:['Decimal to Binary','Binary to Decimal','Decimal to Hex','Hex to Decimal','Binary Addition','Binary Subtraction']},{id:'input1',label:'Input 1',type:'text',placeholder:'Enter first number'},{id:'input2',label:'Input 2 (if needed)',type:'text',placeholder:'Enter second number'}],calculate:function(inputs){const input1=inputs.input1||'';const input2=inputs.input2||'';switch(inputs.operation){case'Decimal to Binary':
+const decimal=parseInt(input1);if(isNaN(decimal))return'Error: Please enter a valid decimal number';const binary=decimal.toString(2);return`Decimal: ${decimal}\nBinary: ${binary}\nVerification: ${parseInt(binary, 2)}`;case'Binary to Decimal':
+if(!/^[01]+$/.test(input1))return'Error: Please enter a valid binary number (only 0s and 1s)';const decimalResult=parseInt(input1,2);return`Binary: ${input1}\nDecimal: ${decimalResult}\nVerification: ${decimalResult.toString(2)}`;case'Decimal to Hex':
+const decimalHex=parseInt(input1);if(isNaN(decimalHex))return'Error: Please enter a valid decimal number';const hex=decimalHex.toString(16).toUpperCase();return`Decimal: ${decimalHex}\nHexadecimal: ${hex}\nVerification: ${parseInt(hex, 16)}`;case'Hex to Decimal':
+if(!/^[0-9A-Fa-f]+$/.test(input1))return'Error: Please enter a valid hexadecimal number';const decimalFromHex=parseInt(input1,16);return`Hexadecimal: ${input1.toUpperCase()}\nDecimal: ${decimalFromHex}\nVerification: ${decimalFromHex.toString(16).toUpperCase()}`;case'Binary Addition':
+if(!/^[01]+$/.test(input1)||!/^[01]+$/.test(input2))return'Error: Please enter valid binary numbers';const sum=(parseInt(input1,2)+parseInt(input2,2)).toString(2);return`${input1} + ${input2} = ${sum}\nDecimal verification: ${parseInt(input1, 2)} + ${parseInt(input2, 2)} = ${parseInt(sum, 2)}`;case'Binary Subtraction':
+if(!/^[01]+$/.test(input1)||!/^[01]+$/.test(input2))return'Error: Please enter valid binary numbers';const diff=(parseInt(input1,2)-parseInt(input2,2)).toString(2);return`${input1} - ${input2} = ${diff}\nDecimal verification: ${parseInt(input1, 2)} - ${parseInt(input2, 2)} = ${parseInt(diff, 2)}`;default:
+return'Please select an operation';}}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("blood-alcohol",{title:'Blood Alcohol Content Calculator',icon:'fas fa-wine-glass',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'drinks',label:'Number of Drinks',type:'number',placeholder:'Enter number of drinks'},{id:'hours',label:'Hours Since First Drink',type:'number',placeholder:'Enter hours'},{id:'drinkType',label:'Drink Type',type:'select',options:['Beer (5%)','Wine (12%)','Spirits (40%)']}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const drinks=parseFloat(inputs.drinks)||0;const hours=parseFloat(inputs.hours)||0;const alcoholPercent={'Beer (5%)':0.05,'Wine (12%)':0.12,'Spirits (40%)':0.40};const drinkVolume={'Beer (5%)':355,'Wine (12%)':148,'Spirits (40%)':44};const alcoholGrams=drinks*drinkVolume[inputs.drinkType]*alcoholPercent[inputs.drinkType]*0.789;const genderConstant=inputs.gender==='Male'?0.68:0.55;let bac=(alcoholGrams/(weight*1000*genderConstant))*100;bac=bac-(0.015*hours);bac=Math.max(0,bac);let effect;if(bac===0)effect='No impairment';else if(bac<0.03)effect='Mild mood changes';else if(bac<0.06)effect='Relaxation, mild euphoria';else if(bac<0.10)effect='Impaired judgment and coordination';else effect='Significant impairment - DO NOT DRIVE';return`Blood Alcohol Content: ${bac.toFixed(3)}%
+Effects: ${effect}
+Time to Sober: ${Math.max(0, (bac / 0.015)).toFixed(1)} hours
+WARNING: This is an estimate only. Do not drive after drinking.`;}});
@@ -0,0 +1,12 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("blood-pressure",{title:'Blood Pressure Category Calculator',icon:'fas fa-heart',inputs:[{id:'systolic',label:'Systolic Pressure (mmHg)',type:'number',placeholder:'Enter systolic pressure'},{id:'diastolic',label:'Diastolic Pressure (mmHg)',type:'number',placeholder:'Enter diastolic pressure'}],calculate:function(inputs){const systolic=parseInt(inputs.systolic)||0;const diastolic=parseInt(inputs.diastolic)||0;let category;let risk;if(systolic<90||diastolic<60){category='Low Blood Pressure';risk='Consult healthcare provider if symptomatic';}else if(systolic<120&&diastolic<80){category='Normal';risk='Maintain healthy lifestyle';}else if(systolic<130&&diastolic<80){category='Elevated';risk='Risk of developing hypertension';}else if(systolic<140||diastolic<90){category='Stage 1 Hypertension';risk='Lifestyle changes and possible medication';}else{category='Stage 2 Hypertension';risk='Lifestyle changes and likely medication';}
+return`Blood Pressure: ${systolic}/${diastolic} mmHg
+Category: ${category}
+Risk Level: ${risk}
+
+Recommendations:
+- Regular monitoring
+- Maintain healthy diet
+- Regular exercise
+- Limit sodium intake
+- Manage stress`;}});
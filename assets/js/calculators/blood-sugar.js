@@ -0,0 +1,14 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("blood-sugar",{title:'Blood Sugar Converter',icon:'fas fa-syringe',inputs:[{id:'value',label:'Blood Sugar Value',type:'number',placeholder:'Enter blood sugar value'},{id:'fromUnit',label:'From Unit',type:'select',options:['mg/dL','mmol/L']},{id:'timing',label:'Timing',type:'select',options:['Fasting','Before Meal','After Meal','Random']}],calculate:function(inputs){const value=parseFloat(inputs.value)||0;let mgdl,mmol;if(inputs.fromUnit==='mg/dL'){mgdl=value;mmol=value/18.0182;}else{mmol=value;mgdl=value*18.0182;}
+let range;switch(inputs.timing){case'Fasting':
+range='Normal range: 70-99 mg/dL (3.9-5.5 mmol/L)';break;case'Before Meal':
+range='Normal range: 70-130 mg/dL (3.9-7.2 mmol/L)';break;case'After Meal':
+range='Normal range: <180 mg/dL (<10.0 mmol/L)';break;default:
+range='Target range varies by individual';}
+return`${value} ${inputs.fromUnit} =
+${mgdl.toFixed(1)} mg/dL
+${mmol.toFixed(1)} mmol/L
+
+${range}
+
+Note: Target ranges may vary by individual and condition.`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("bmi-children",{title:'Children BMI Calculator',icon:'fas fa-child',inputs:[{id:'age',label:'Age (months)',type:'number',placeholder:'Enter age in months'},{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)/100||0;const age=parseInt(inputs.age)||0;const bmi=weight/(height*height);let category;if(bmi<5)category='Underweight (Below 5th percentile)';else if(bmi<85)category='Healthy Weight (5th-85th percentile)';else if(bmi<95)category='Overweight (85th-95th percentile)';else category='Obese (Above 95th percentile)';const ageYears=Math.floor(age/12);const ageMonths=age%12;return`Child's BMI: ${bmi.toFixed(1)}
+Age: ${ageYears} years, ${ageMonths} months
+Category: ${category}
+Note: Children's BMI is interpreted using percentiles specific to age and gender.`;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("bmi",{title:'BMI Calculator',icon:'fas fa-weight',inputs:[{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)/100||0;const bmi=weight/(height*height);let category;if(bmi<18.5)category='Underweight';else if(bmi<25)category='Normal weight';else if(bmi<30)category='Overweight';else category='Obese';return`BMI: ${bmi.toFixed(1)}\nCategory: ${category}`;}});
@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("bmr",{title:'BMR Calculator',icon:'fas fa-fire-alt',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;let bmr;if(inputs.gender==='Male'){bmr=10*weight+6.25*height-5*age+5;}else{bmr=10*weight+6.25*height-5*age-161;}
+return`BMR: ${Math.round(bmr)} calories/day
+Daily calorie needs:
+Sedentary: ${Math.round(bmr * 1.2)} calories
+Light Exercise: ${Math.round(bmr * 1.375)} calories
+Moderate Exercise: ${Math.round(bmr * 1.55)} calories
+Heavy Exercise: ${Math.round(bmr * 1.725)} calories
+Athlete: ${Math.round(bmr * 1.9)} calories`;}});
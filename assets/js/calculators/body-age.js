@@ -0,0 +1,34 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("body-age",{title:'Body Age Calculator',icon:'fas fa-calendar-alt',inputs:[{id:'chronoAge',label:'Chronological Age',type:'number',placeholder:'Enter actual age'},{id:'restingHR',label:'Resting Heart Rate',type:'number',placeholder:'Enter resting HR'},{id:'exerciseFreq',label:'Exercise Frequency (days/week)',type:'number',placeholder:'Enter exercise days'},{id:'smoking',label:'Smoking Status',type:'select',options:['Never','Former (>5 years)','Former (<5 years)','Current']},{id:'alcohol',label:'Alcohol Consumption',type:'select',options:['None','Light (1-2 drinks/week)','Moderate (3-7 drinks/week)','Heavy (>7 drinks/week)']},{id:'sleep',label:'Sleep Quality',type:'select',options:['Poor (<6 hours)','Fair (6-7 hours)','Good (7-8 hours)','Excellent (8+ hours)']}],calculate:function(inputs){const chronoAge=parseInt(inputs.chronoAge)||0;const restingHR=parseInt(inputs.restingHR)||70;const exerciseFreq=parseInt(inputs.exerciseFreq)||0;let bodyAge=chronoAge;let factors=[];if(restingHR<60){bodyAge-=3;factors.push('Excellent resting HR (-3 years)');}else if(restingHR<70){bodyAge-=1;factors.push('Good resting HR (-1 year)');}else if(restingHR>80){bodyAge+=2;factors.push('High resting HR (+2 years)');}
+if(exerciseFreq>=5){bodyAge-=4;factors.push('Very active lifestyle (-4 years)');}else if(exerciseFreq>=3){bodyAge-=2;factors.push('Active lifestyle (-2 years)');}else if(exerciseFreq>=1){bodyAge-=1;factors.push('Some exercise (-1 year)');}else{bodyAge+=3;factors.push('Sedentary lifestyle (+3 years)');}
+switch(inputs.smoking){case'Current':
+bodyAge+=8;factors.push('Current smoking (+8 years)');break;case'Former (<5 years)':
+bodyAge+=2;factors.push('Recent former smoker (+2 years)');break;case'Former (>5 years)':
+bodyAge+=0;factors.push('Long-term former smoker (0 years)');break;default:
+bodyAge-=1;factors.push('Never smoked (-1 year)');}
+switch(inputs.alcohol){case'None':
+bodyAge+=0;factors.push('No alcohol (0 years)');break;case'Light (1-2 drinks/week)':
+bodyAge-=1;factors.push('Light alcohol consumption (-1 year)');break;case'Moderate (3-7 drinks/week)':
+bodyAge+=1;factors.push('Moderate alcohol consumption (+1 year)');break;case'Heavy (>7 drinks/week)':
+bodyAge+=4;factors.push('Heavy alcohol consumption (+4 years)');break;}
+switch(inputs.sleep){case'Excellent (8+ hours)':
+bodyAge-=2;factors.push('Excellent sleep (-2 years)');break;case'Good (7-8 hours)':
+bodyAge-=1;factors.push('Good sleep (-1 year)');break;case'Fair (6-7 hours)':
+bodyAge+=1;factors.push('Fair sleep (+1 year)');break;case'Poor (<6 hours)':
+bodyAge+=3;factors.push('Poor sleep (+3 years)');break;}
+const ageDifference=bodyAge-chronoAge;let interpretation;if(ageDifference<=-5){interpretation='Excellent! Your body is significantly younger than your age.';}else if(ageDifference<=-2){interpretation='Great! Your body is younger than your chronological age.';}else if(ageDifference<=2){interpretation='Good! Your body age matches your chronological age.';}else if(ageDifference<=5){interpretation='Your body is aging faster than normal. Consider lifestyle improvements.';}else{interpretation='Significant lifestyle changes recommended to improve body age.';}
+return`Body Age Assessment:
+Chronological Age: ${chronoAge} years
+Biological Body Age: ${Math.round(bodyAge)} years
+Difference: ${ageDifference > 0 ? '+' : ''}${ageDifference.toFixed(1)} years
+
+${interpretation}
+
+Contributing Factors:
+${factors.join('\n')}
+
+Recommendations:
+- Maintain regular exercise routine
+- Prioritize 7-9 hours of quality sleep
+- Avoid smoking and limit alcohol
+- Monitor cardiovascular health`;}});
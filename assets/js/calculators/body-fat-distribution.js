@@ -0,0 +1,12 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("body-fat-distribution",{title:'Body Fat Distribution Calculator',icon:'fas fa-child',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'waist',label:'Waist Circumference (cm)',type:'number',placeholder:'Enter waist measurement'},{id:'hip',label:'Hip Circumference (cm)',type:'number',placeholder:'Enter hip measurement'},{id:'neck',label:'Neck Circumference (cm)',type:'number',placeholder:'Enter neck measurement'}],calculate:function(inputs){const waist=parseFloat(inputs.waist)||0;const hip=parseFloat(inputs.hip)||0;const neck=parseFloat(inputs.neck)||0;const whr=waist/hip;const whtr=waist/(hip-neck);let bodyType;let healthRisk;if(inputs.gender==='Male'){if(whr<0.85){bodyType='Gynoid (Pear)';healthRisk='Lower';}else if(whr<0.95){bodyType='Balanced';healthRisk='Moderate';}else{bodyType='Android (Apple)';healthRisk='Higher';}}else{if(whr<0.75){bodyType='Gynoid (Pear)';healthRisk='Lower';}else if(whr<0.85){bodyType='Balanced';healthRisk='Moderate';}else{bodyType='Android (Apple)';healthRisk='Higher';}}
+return`Body Shape Analysis:
+Body Type: ${bodyType}
+Waist-to-Hip Ratio: ${whr.toFixed(2)}
+Waist-to-Height Ratio: ${whtr.toFixed(2)}
+Health Risk Level: ${healthRisk}
+
+Notes:
+- Android (apple) shape: Higher metabolic risk
+- Gynoid (pear) shape: Lower metabolic risk
+- Regular exercise and healthy diet recommended`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("body-fat",{title:'Body Fat Calculator',icon:'fas fa-percent',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'},{id:'neck',label:'Neck Circumference (cm)',type:'number',placeholder:'Enter neck circumference'},{id:'waist',label:'Waist Circumference (cm)',type:'number',placeholder:'Enter waist circumference'},{id:'hip',label:'Hip Circumference (cm)',type:'number',placeholder:'Enter hip (women only)'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;const neck=parseFloat(inputs.neck)||0;const waist=parseFloat(inputs.waist)||0;const hip=parseFloat(inputs.hip)||0;let bodyFat;if(inputs.gender==='Male'){bodyFat=495/(1.0324-0.19077*Math.log10(waist-neck)+0.15456*Math.log10(height))-450;}else{bodyFat=495/(1.29579-0.35004*Math.log10(waist+hip-neck)+0.22100*Math.log10(height))-450;}
+let category;if(inputs.gender==='Male'){if(bodyFat<6)category='Essential Fat';else if(bodyFat<14)category='Athletes';else if(bodyFat<18)category='Fitness';else if(bodyFat<25)category='Average';else category='Obese';}else{if(bodyFat<14)category='Essential Fat';else if(bodyFat<21)category='Athletes';else if(bodyFat<25)category='Fitness';else if(bodyFat<32)category='Average';else category='Obese';}
+const fatMass=weight*(bodyFat/100);const leanMass=weight-fatMass;return`Body Fat: ${bodyFat.toFixed(1)}%
+Category: ${category}
+Fat Mass: ${fatMass.toFixed(1)} kg
+Lean Mass: ${leanMass.toFixed(1)} kg`;}});
@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("body-measurement",{title:'Body Measurement Tracker',icon:'fas fa-ruler',inputs:[{id:'chest',label:'Chest (cm)',type:'number',placeholder:'Enter chest measurement'},{id:'waist',label:'Waist (cm)',type:'number',placeholder:'Enter waist measurement'},{id:'hips',label:'Hips (cm)',type:'number',placeholder:'Enter hip measurement'},{id:'bicep',label:'Bicep (cm)',type:'number',placeholder:'Enter bicep measurement'},{id:'thigh',label:'Thigh (cm)',type:'number',placeholder:'Enter thigh measurement'}],calculate:function(inputs){const chest=parseFloat(inputs.chest)||0;const waist=parseFloat(inputs.waist)||0;const hips=parseFloat(inputs.hips)||0;const bicep=parseFloat(inputs.bicep)||0;const thigh=parseFloat(inputs.thigh)||0;const waistToHip=waist/hips;let whrCategory;if(waistToHip<0.85)whrCategory='Low Risk';else if(waistToHip<1.0)whrCategory='Moderate Risk';else whrCategory='High Risk';const chestToWaist=chest/waist;return`Body Measurements Summary:
+Chest: ${chest} cm
+Waist: ${waist} cm  
+Hips: ${hips} cm
+Bicep: ${bicep} cm
+Thigh: ${thigh} cm
+
+Ratios:
+Waist-to-Hip: ${waistToHip.toFixed(2)} (${whrCategory})
+Chest-to-Waist: ${chestToWaist.toFixed(2)}`;}});
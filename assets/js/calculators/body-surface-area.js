@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("body-surface-area",{title:'Body Surface Area Calculator',icon:'fas fa-child',inputs:[{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;const bsa=Math.sqrt((weight*height)/3600);return`Body Surface Area: ${bsa.toFixed(2)} m²
+Method: Mosteller Formula
+Common Uses: Drug dosing, metabolic rate calculations`;}});
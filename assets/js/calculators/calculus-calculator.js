@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("calculus-calculator",{title:'Basic Calculus Calculator',icon:'fas fa-integral',inputs:[{id:'operation',label:'Operation',type:'select',options:['Derivative','Definite Integral (Riemann Sum)','Limit']},{id:'function',label:'Function Type',type:'select',options:['Polynomial (ax² + bx + c)','Exponential (ae^x)','Trigonometric (a sin(x))','Power (ax^n)']},{id:'a',label:'Coefficient a',type:'number',placeholder:'Enter coefficient a',step:'0.01'},{id:'b',label:'Coefficient b',type:'number',placeholder:'Enter coefficient b',step:'0.01'},{id:'c',label:'Coefficient c',type:'number',placeholder:'Enter coefficient c',step:'0.01'},{id:'x',label:'Point x (for derivative)',type:'number',placeholder:'Enter x value',step:'0.01'}],calculate:function(inputs){const a=parseFloat(inputs.a)||0;const b=parseFloat(inputs.b)||0;const c=parseFloat(inputs.c)||0;const x=parseFloat(inputs.x)||0;if(inputs.operation==='Derivative'&&inputs.function==='Polynomial (ax² + bx + c)'){const derivative=2*a*x+b;return`Function: f(x) = ${a}x² + ${b}x + ${c}\nDerivative: f'(x) = ${2*a}x + ${b}\nf'(${x}) = ${derivative.toFixed(4)}`;}
+return'Basic calculus operations available. Select function type and operation.';}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("calorie",{title:'Calorie Calculator',icon:'fas fa-fire',inputs:[{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'},{id:'activity',label:'Activity Level',type:'select',options:['Sedentary','Light Exercise','Moderate Exercise','Heavy Exercise','Athlete']}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;const age=parseInt(inputs.age)||0;let bmr;if(inputs.gender==='Male'){bmr=88.362+(13.397*weight)+(4.799*height)-(5.677*age);}else{bmr=447.593+(9.247*weight)+(3.098*height)-(4.330*age);}
+const multipliers={'Sedentary':1.2,'Light Exercise':1.375,'Moderate Exercise':1.55,'Heavy Exercise':1.725,'Athlete':1.9};const tdee=bmr*multipliers[inputs.activity];return`BMR: ${Math.round(bmr)} calories/day\n`+
+`Maintenance: ${Math.round(tdee)} calories/day\n`+
+`Weight Loss: ${Math.round(tdee - 500)} calories/day\n`+
+`Weight Gain: ${Math.round(tdee + 500)} calories/day`;}});
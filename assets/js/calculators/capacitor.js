@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("capacitor",{title:'Capacitor Calculator',icon:'fas fa-battery-half',inputs:[{id:'capacitance',label:'Capacitance (µF)',type:'number',placeholder:'Enter capacitance'},{id:'voltage',label:'Voltage (V)',type:'number',placeholder:'Enter voltage'},{id:'frequency',label:'Frequency (Hz)',type:'number',placeholder:'Enter frequency (optional)'}],calculate:function(inputs){const capacitance=parseFloat(inputs.capacitance)||0;const voltage=parseFloat(inputs.voltage)||0;const frequency=parseFloat(inputs.frequency)||0;const capacitanceFarads=capacitance/1000000;const energy=0.5*capacitanceFarads*voltage*voltage;const charge=capacitanceFarads*voltage;let result=`Energy Stored: ${(energy * 1000).toFixed(3)} mJ
+Charge Stored: ${(charge * 1000000).toFixed(2)} µC
+Capacitance: ${capacitance} µF`;if(frequency>0){const reactance=1/(2*Math.PI*frequency*capacitanceFarads);result+=`\nReactance at ${frequency} Hz: ${reactance.toFixed(2)} Ω`;}
+return result;}});
@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("complex-numbers",{title:'Complex Numbers Calculator',icon:'fas fa-infinity',inputs:[{id:'operation',label:'Operation',type:'select',options:['Addition','Subtraction','Multiplication','Division','Magnitude','Argument']},{id:'real1',label:'Real Part (First)',type:'number',placeholder:'Enter real part',step:'0.01'},{id:'imag1',label:'Imaginary Part (First)',type:'number',placeholder:'Enter imaginary part',step:'0.01'},{id:'real2',label:'Real Part (Second)',type:'number',placeholder:'Enter real part',step:'0.01'},{id:'imag2',label:'Imaginary Part (Second)',type:'number',placeholder:'Enter imaginary part',step:'0.01'}],calculate:function(inputs){const r1=parseFloat(inputs.real1)||0;const i1=parseFloat(inputs.imag1)||0;const r2=parseFloat(inputs.real2)||0;const i2=parseFloat(inputs.imag2)||0;const formatComplex=(real,imag)=>{if(imag===0)return`${real}`;if(real===0)return imag===1?'i':imag===-1?'-i':`${imag}i`;const sign=imag>=0?'+':'-';const imagPart=Math.abs(imag)===1?'i':`${Math.abs(imag)}i`;return`${real} ${sign} ${imagPart}`;};let result_real,result_imag;switch(inputs.operation){case'Addition':
+result_real=r1+r2;result_imag=i1+i2;return`(${formatComplex(r1, i1)}) + (${formatComplex(r2, i2)}) = ${formatComplex(result_real, result_imag)}`;case'Subtraction':
+result_real=r1-r2;result_imag=i1-i2;return`(${formatComplex(r1, i1)}) - (${formatComplex(r2, i2)}) = ${formatComplex(result_real, result_imag)}`;case'Multiplication':
+result_real=r1*r2-i1*i2;result_imag=r1*i2+i1*r2;return`(${formatComplex(r1, i1)}) × (${formatComplex(r2, i2)}) = ${formatComplex(result_real, result_imag)}`;case'Division':
+const denominator=r2*r2+i2*i2;if(denominator===0)return'Error: Division by zero';result_real=(r1*r2+i1*i2)/denominator;result_imag=(i1*r2-r1*i2)/denominator;return`(${formatComplex(r1, i1)}) ÷ (${formatComplex(r2, i2)}) = ${formatComplex(result_real.toFixed(4), result_imag.toFixed(4))}`;case'Magnitude':
+const magnitude=Math.sqrt(r1*r1+i1*i1);return`Magnitude of ${formatComplex(r1, i1)} = ${magnitude.toFixed(4)}`;case'Argument':
+const argument=Math.atan2(i1,r1);const argumentDegrees=argument*(180/Math.PI);return`Argument of ${formatComplex(r1, i1)} = ${argument.toFixed(4)} rad = ${argumentDegrees.toFixed(2)}°`;default:
+return'Please select an operation';}}});
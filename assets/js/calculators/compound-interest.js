@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("compound-interest",{title:'Compound Interest Calculator',icon:'fas fa-chart-line',inputs:[{id:'principal',label:'Initial Investment ($)',type:'number',placeholder:'Enter initial amount'},{id:'rate',label:'Annual Interest Rate (%)',type:'number',placeholder:'Enter interest rate',step:'0.01'},{id:'years',label:'Investment Period (years)',type:'number',placeholder:'Enter number of years'},{id:'compound',label:'Compounding Frequency',type:'select',options:['Annually','Semi-annually','Quarterly','Monthly','Daily']}],calculate:function(inputs){const principal=parseFloat(inputs.principal)||0;const rate=parseFloat(inputs.rate)/100;const years=parseInt(inputs.years)||0;const frequencies={'Annually':1,'Semi-annually':2,'Quarterly':4,'Monthly':12,'Daily':365};const n=frequencies[inputs.compound]||1;const amount=principal*Math.pow(1+rate/n,n*years);const interest=amount-principal;return`Final Amount: $${amount.toFixed(2)}\nInterest Earned: $${interest.toFixed(2)}\nTotal Return: ${((interest / principal) * 100).toFixed(2)}%`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-accumulation",{title:'DCA Accumulation Calculator',icon:'fas fa-stream',inputs:[{id:'monthlyInvestment',label:'Monthly Investment ($)',type:'number',placeholder:'Enter monthly amount'},{id:'expectedReturn',label:'Expected Annual Return (%)',type:'number',placeholder:'Enter expected return',step:'0.1'},{id:'years',label:'Investment Period (years)',type:'number',placeholder:'Enter years'},{id:'currentPrice',label:'Current Asset Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'}],calculate:function(inputs){const monthly=parseFloat(inputs.monthlyInvestment)||0;const returnRate=parseFloat(inputs.expectedReturn)||0;const years=parseFloat(inputs.years)||0;const price=parseFloat(inputs.currentPrice)||0;const monthlyRate=Math.pow(1+returnRate/100,1/12)-1;const months=years*12;let finalBalance=0;let totalInvested=0;let totalUnits=0;for(let i=0;i<months;i++){totalInvested+=monthly;const units=monthly/price;totalUnits+=units;finalBalance=(finalBalance+monthly)*(1+monthlyRate);}
+return`Total Investment: $${totalInvested.toFixed(2)}
+Final Balance: $${finalBalance.toFixed(2)}
+Total Units: ${totalUnits.toFixed(6)}
+Average Cost: $${(totalInvested/totalUnits).toFixed(6)}`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-altcoin-season",{title:'Altcoin Season Indicator',icon:'fas fa-coins',inputs:[{id:'btcDominance',label:'BTC Dominance (%)',type:'number',placeholder:'Enter BTC dominance',step:'0.1'},{id:'btcPrice',label:'BTC Price ($)',type:'number',placeholder:'Enter BTC price'},{id:'btc30DayChange',label:'BTC 30-Day Change (%)',type:'number',placeholder:'Enter BTC 30-day change',step:'0.1'},{id:'altcoinAvgChange',label:'Top 50 Altcoin Avg Change (%)',type:'number',placeholder:'Enter altcoin average change',step:'0.1'}],calculate:function(inputs){const btcDominance=parseFloat(inputs.btcDominance)||0;const btcPrice=parseFloat(inputs.btcPrice)||0;const btc30DayChange=parseFloat(inputs.btc30DayChange)||0;const altcoinAvgChange=parseFloat(inputs.altcoinAvgChange)||0;let altSeasonScore=0;if(btcDominance<40)altSeasonScore+=30;else if(btcDominance<50)altSeasonScore+=20;else if(btcDominance<60)altSeasonScore+=10;const relativePerformance=altcoinAvgChange-btc30DayChange;if(relativePerformance>20)altSeasonScore+=40;else if(relativePerformance>10)altSeasonScore+=30;else if(relativePerformance>0)altSeasonScore+=20;else if(relativePerformance>-10)altSeasonScore+=10;if(btc30DayChange>10)altSeasonScore+=30;else if(btc30DayChange>0)altSeasonScore+=20;else if(btc30DayChange>-10)altSeasonScore+=10;let season;if(altSeasonScore>=80)season='Strong Altcoin Season';else if(altSeasonScore>=60)season='Moderate Altcoin Season';else if(altSeasonScore>=40)season='Weak Altcoin Season';else season='Bitcoin Season';return`Altcoin Season Score: ${altSeasonScore}/100
+Market Phase: ${season}
+BTC Dominance: ${btcDominance.toFixed(1)}%
+Relative Performance: ${relativePerformance.toFixed(1)}%
+BTC 30-Day: ${btc30DayChange.toFixed(1)}%
+Altcoin Avg: ${altcoinAvgChange.toFixed(1)}%`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-arbitrage",{title:'Crypto Arbitrage Calculator',icon:'fas fa-balance-scale',inputs:[{id:'amount',label:'Trading Amount ($)',type:'number',placeholder:'Enter trading amount'},{id:'buyPrice',label:'Buy Price on Exchange 1 ($)',type:'number',placeholder:'Enter buy price',step:'0.000001'},{id:'sellPrice',label:'Sell Price on Exchange 2 ($)',type:'number',placeholder:'Enter sell price',step:'0.000001'},{id:'fees',label:'Total Fees (%)',type:'number',placeholder:'Enter total fees',step:'0.01'}],calculate:function(inputs){const amount=parseFloat(inputs.amount)||0;const buyPrice=parseFloat(inputs.buyPrice)||0;const sellPrice=parseFloat(inputs.sellPrice)||0;const fees=parseFloat(inputs.fees)||0;const coinAmount=amount/buyPrice;const grossProfit=(sellPrice*coinAmount)-amount;const feesAmount=(amount*fees/100)*2;const netProfit=grossProfit-feesAmount;const roi=(netProfit/amount)*100;return`Coins Purchased: ${coinAmount.toFixed(8)}
+Gross Profit: $${grossProfit.toFixed(2)}
+Total Fees: $${feesAmount.toFixed(2)}
+Net Profit: $${netProfit.toFixed(2)}
+ROI: ${roi.toFixed(2)}%`;}});
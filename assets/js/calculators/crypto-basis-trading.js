@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-basis-trading",{title:'Crypto Basis Trading Calculator',icon:'fas fa-chart-area',inputs:[{id:'spotPrice',label:'Spot Price ($)',type:'number',placeholder:'Enter spot price',step:'0.000001'},{id:'futuresPrice',label:'Futures Price ($)',type:'number',placeholder:'Enter futures price',step:'0.000001'},{id:'daysToExpiry',label:'Days to Expiry',type:'number',placeholder:'Enter days to expiry'},{id:'tradingAmount',label:'Trading Amount ($)',type:'number',placeholder:'Enter trading amount'},{id:'interestRate',label:'Risk-Free Rate (%)',type:'number',placeholder:'Enter risk-free rate',step:'0.01'}],calculate:function(inputs){const spotPrice=parseFloat(inputs.spotPrice)||0;const futuresPrice=parseFloat(inputs.futuresPrice)||0;const daysToExpiry=parseFloat(inputs.daysToExpiry)||0;const tradingAmount=parseFloat(inputs.tradingAmount)||0;const interestRate=parseFloat(inputs.interestRate)||0;const basis=futuresPrice-spotPrice;const basisPercentage=(basis/spotPrice)*100;const timeToExpiry=daysToExpiry/365;const annualizedBasis=basisPercentage/timeToExpiry;const theoreticalFuturesPrice=spotPrice*Math.exp(interestRate/100*timeToExpiry);const mispricing=futuresPrice-theoreticalFuturesPrice;const mispricingPercentage=(mispricing/spotPrice)*100;let strategy;if(mispricingPercentage>1){strategy='Short Futures, Long Spot (Futures Overpriced)';}else if(mispricingPercentage<-1){strategy='Long Futures, Short Spot (Futures Underpriced)';}else{strategy='No arbitrage opportunity';}
+const expectedProfit=Math.abs(mispricing)*(tradingAmount/spotPrice);return`Basis: $${basis.toFixed(6)}
+Basis Percentage: ${basisPercentage.toFixed(3)}%
+Annualized Basis: ${annualizedBasis.toFixed(2)}%
+Theoretical Futures Price: $${theoreticalFuturesPrice.toFixed(6)}
+Mispricing: ${mispricingPercentage.toFixed(3)}%
+Strategy: ${strategy}
+Expected Profit: $${expectedProfit.toFixed(2)}`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-bridge-fees",{title:'Cross-Chain Bridge Fee Calculator',icon:'fas fa-bridge',inputs:[{id:'amount',label:'Bridge Amount',type:'number',placeholder:'Enter amount to bridge',step:'0.000001'},{id:'tokenPrice',label:'Token Price ($)',type:'number',placeholder:'Enter token price',step:'0.000001'},{id:'bridgeFee',label:'Bridge Fee (%)',type:'number',placeholder:'Enter bridge fee percentage',step:'0.01'},{id:'gasFee',label:'Gas Fee ($)',type:'number',placeholder:'Enter gas fee',step:'0.01'}],calculate:function(inputs){const amount=parseFloat(inputs.amount)||0;const tokenPrice=parseFloat(inputs.tokenPrice)||0;const bridgeFee=parseFloat(inputs.bridgeFee)||0;const gasFee=parseFloat(inputs.gasFee)||0;const totalValue=amount*tokenPrice;const bridgeFeeAmount=(totalValue*bridgeFee)/100;const totalFees=bridgeFeeAmount+gasFee;const finalAmount=amount-(bridgeFeeAmount/tokenPrice);return`Bridge Amount: ${amount.toFixed(6)} tokens
+Total Value: $${totalValue.toFixed(2)}
+Bridge Fee: $${bridgeFeeAmount.toFixed(2)}
+Gas Fee: $${gasFee.toFixed(2)}
+Total Fees: $${totalFees.toFixed(2)}
+Amount Received: ${finalAmount.toFixed(6)} tokens`;}});
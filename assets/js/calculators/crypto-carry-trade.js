@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-carry-trade",{title:'Crypto Carry Trade Calculator',icon:'fas fa-piggy-bank',inputs:[{id:'baseCurrency',label:'Base Currency Rate (%)',type:'number',placeholder:'Enter base currency rate',step:'0.01'},{id:'targetCurrency',label:'Target Currency Rate (%)',type:'number',placeholder:'Enter target currency rate',step:'0.01'},{id:'exchangeRate',label:'Current Exchange Rate',type:'number',placeholder:'Enter current exchange rate',step:'0.000001'},{id:'principal',label:'Principal Amount',type:'number',placeholder:'Enter principal amount'},{id:'leverage',label:'Leverage (x)',type:'number',placeholder:'Enter leverage ratio'}],calculate:function(inputs){const baseCurrency=parseFloat(inputs.baseCurrency)||0;const targetCurrency=parseFloat(inputs.targetCurrency)||0;const exchangeRate=parseFloat(inputs.exchangeRate)||0;const principal=parseFloat(inputs.principal)||0;const leverage=parseFloat(inputs.leverage)||1;const interestRateDiff=targetCurrency-baseCurrency;const leveragedPosition=principal*leverage;const dailyCarry=(leveragedPosition*interestRateDiff/100)/365;const monthlyCarry=dailyCarry*30;const annualCarry=dailyCarry*365;const carryYield=(annualCarry/principal)*100;const breakEvenMove=Math.abs(interestRateDiff/leverage);let riskAssessment;if(leverage>5)riskAssessment='High Risk';else if(leverage>2)riskAssessment='Moderate Risk';else riskAssessment='Low Risk';return`Interest Rate Differential: ${interestRateDiff.toFixed(2)}%
+Daily Carry: $${dailyCarry.toFixed(2)}
+Monthly Carry: $${monthlyCarry.toFixed(2)}
+Annual Carry: $${annualCarry.toFixed(2)}
+Carry Yield: ${carryYield.toFixed(2)}%
+Break-even FX Move: ${breakEvenMove.toFixed(2)}%
+Risk Assessment: ${riskAssessment}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-compound-yield",{title:'Compound Yield Calculator',icon:'fas fa-chart-area',inputs:[{id:'initial',label:'Initial Investment',type:'number',placeholder:'Enter initial amount'},{id:'contribution',label:'Weekly Contribution',type:'number',placeholder:'Enter weekly addition'},{id:'apy',label:'APY (%)',type:'number',placeholder:'Enter APY',step:'0.01'},{id:'years',label:'Investment Period (years)',type:'number',placeholder:'Enter years',step:'0.1'}],calculate:function(inputs){const initial=parseFloat(inputs.initial)||0;const contribution=parseFloat(inputs.contribution)||0;const apy=parseFloat(inputs.apy)||0;const years=parseFloat(inputs.years)||0;const weeklyRate=Math.pow(1+apy/100,1/52)-1;const weeks=years*52;let balance=initial;for(let i=0;i<weeks;i++){balance=balance*(1+weeklyRate)+contribution;}
+const totalContributed=initial+(contribution*weeks);const earnings=balance-totalContributed;return`Final Balance: $${balance.toFixed(2)}
+Total Contributed: $${totalContributed.toFixed(2)}
+Total Earnings: $${earnings.toFixed(2)}
+Annual Return: ${apy}%`;}});
@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-converter",{title:'Cryptocurrency Converter',icon:'fas fa-exchange-alt',inputs:[{id:'amount',label:'Amount',type:'number',placeholder:'Enter amount',step:'0.000001'},{id:'fromPrice',label:'From Price ($)',type:'number',placeholder:'Enter from price',step:'0.000001'},{id:'toPrice',label:'To Price ($)',type:'number',placeholder:'Enter to price',step:'0.000001'}],calculate:function(inputs){const amount=parseFloat(inputs.amount)||0;const fromPrice=parseFloat(inputs.fromPrice)||0;const toPrice=parseFloat(inputs.toPrice)||0;const valueInUSD=amount*fromPrice;const convertedAmount=valueInUSD/toPrice;return`Value in USD: $${valueInUSD.toFixed(2)}
+Converted Amount: ${convertedAmount.toFixed(6)}
+Rate: 1 = ${(toPrice/fromPrice).toFixed(6)}`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-correlation",{title:'Asset Correlation Calculator',icon:'fas fa-link',inputs:[{id:'asset1Returns',label:'Asset 1 Daily Returns (%, comma-separated)',type:'text',placeholder:'e.g., 2.5,-1.3,0.8'},{id:'asset2Returns',label:'Asset 2 Daily Returns (%, comma-separated)',type:'text',placeholder:'e.g., 1.8,-0.9,1.2'}],requires:['indicators'],calculate:function(inputs){const series1=createSeriesReader(inputs.asset1Returns);const series2=createSeriesReader(inputs.asset2Returns);const stats=createCorrelation();let x=series1.next();let y=series2.next();while(x!==undefined&&y!==undefined){stats.push(x,y);x=series1.next();y=series2.next();}
+if(x!==undefined||y!==undefined||stats.count<2){return'Error: Please provide equal number of returns (at least 2) for both assets';}
+const correlation=stats.correlation();return`Correlation Coefficient: ${correlation.toFixed(4)}
+Strength: ${Math.abs(correlation) > 0.7 ? 'Strong' : Math.abs(correlation) > 0.3 ? 'Moderate' : 'Weak'}
+Direction: ${correlation > 0 ? 'Positive' : correlation < 0 ? 'Negative' : 'No correlation'}
+Sample Size: ${stats.count} data points`;}});
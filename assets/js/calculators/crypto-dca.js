@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-dca",{title:'Dollar Cost Average Calculator',icon:'fas fa-chart-line',inputs:[{id:'investment',label:'Regular Investment ($)',type:'number',placeholder:'Enter investment amount'},{id:'frequency',label:'Investment Frequency (days)',type:'number',placeholder:'Enter frequency in days'},{id:'duration',label:'Investment Duration (months)',type:'number',placeholder:'Enter duration'},{id:'expectedReturn',label:'Expected Annual Return (%)',type:'number',placeholder:'Enter expected return',step:'0.1'}],calculate:function(inputs){const investment=parseFloat(inputs.investment)||0;const frequency=parseFloat(inputs.frequency)||30;const duration=parseFloat(inputs.duration)||0;const expectedReturn=parseFloat(inputs.expectedReturn)||0;const numberOfInvestments=(duration*30)/frequency;const monthlyReturn=(Math.pow(1+expectedReturn/100,1/12)-1);let totalInvestment=0;let finalAmount=0;for(let i=0;i<numberOfInvestments;i++){totalInvestment+=investment;finalAmount=(finalAmount+investment)*(1+monthlyReturn);}
+const profit=finalAmount-totalInvestment;return`Total Invested: $${totalInvestment.toFixed(2)}
+Expected Final Amount: $${finalAmount.toFixed(2)}
+Expected Profit: $${profit.toFixed(2)}
+Expected Return: ${((profit/totalInvestment)*100).toFixed(2)}%`;}});
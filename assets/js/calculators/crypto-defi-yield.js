@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-defi-yield",{title:'DeFi Yield Optimization Calculator',icon:'fas fa-chart-area',inputs:[{id:'principal',label:'Principal Amount ($)',type:'number',placeholder:'Enter principal amount'},{id:'protocol1Apy',label:'Protocol 1 APY (%)',type:'number',placeholder:'Enter protocol 1 APY',step:'0.01'},{id:'protocol2Apy',label:'Protocol 2 APY (%)',type:'number',placeholder:'Enter protocol 2 APY',step:'0.01'},{id:'protocol3Apy',label:'Protocol 3 APY (%)',type:'number',placeholder:'Enter protocol 3 APY',step:'0.01'},{id:'gasCost',label:'Gas Cost per Transaction ($)',type:'number',placeholder:'Enter gas cost per move'}],calculate:function(inputs){const principal=parseFloat(inputs.principal)||0;const apy1=parseFloat(inputs.protocol1Apy)||0;const apy2=parseFloat(inputs.protocol2Apy)||0;const apy3=parseFloat(inputs.protocol3Apy)||0;const gasCost=parseFloat(inputs.gasCost)||0;const protocols=[{name:'Protocol 1',apy:apy1},{name:'Protocol 2',apy:apy2},{name:'Protocol 3',apy:apy3}].sort((a,b)=>b.apy-a.apy);const bestProtocol=protocols[0];const dailyReturn=(principal*bestProtocol.apy)/365/100;const monthlyReturn=dailyReturn*30;const yearlyReturn=dailyReturn*365;const switchingBenefit=(principal*(bestProtocol.apy-protocols[1].apy))/100;const switchingProfitable=switchingBenefit>gasCost;return`Optimal Protocol: ${bestProtocol.name}
+Best APY: ${bestProtocol.apy.toFixed(2)}%
+Daily Returns: $${dailyReturn.toFixed(2)}
+Monthly Returns: $${monthlyReturn.toFixed(2)}
+Yearly Returns: $${yearlyReturn.toFixed(2)}
+Switching Benefit: $${switchingBenefit.toFixed(2)}
+Gas Cost: $${gasCost.toFixed(2)}
+Switching Profitable: ${switchingProfitable ? 'Yes' : 'No'}`;}});
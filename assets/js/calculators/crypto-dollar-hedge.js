@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-dollar-hedge",{title:'Dollar Cost Hedging Calculator',icon:'fas fa-shield-alt',inputs:[{id:'cryptoAmount',label:'Crypto Amount',type:'number',placeholder:'Enter crypto amount',step:'0.000001'},{id:'cryptoPrice',label:'Current Crypto Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'hedgeRatio',label:'Hedge Ratio (%)',type:'number',placeholder:'Enter hedge percentage',step:'1'},{id:'expectedVolatility',label:'Expected Volatility (%)',type:'number',placeholder:'Enter expected volatility',step:'0.1'}],calculate:function(inputs){const cryptoAmount=parseFloat(inputs.cryptoAmount)||0;const cryptoPrice=parseFloat(inputs.cryptoPrice)||0;const hedgeRatio=parseFloat(inputs.hedgeRatio)||0;const expectedVolatility=parseFloat(inputs.expectedVolatility)||0;const portfolioValue=cryptoAmount*cryptoPrice;const hedgeAmount=(portfolioValue*hedgeRatio)/100;const unhedgedAmount=portfolioValue-hedgeAmount;const dailyVaR=(portfolioValue*expectedVolatility/100)/Math.sqrt(365);const hedgedVaR=(unhedgedAmount*expectedVolatility/100)/Math.sqrt(365);const riskReduction=((dailyVaR-hedgedVaR)/dailyVaR)*100;return`Portfolio Value: $${portfolioValue.toFixed(2)}
+Hedged Amount: $${hedgeAmount.toFixed(2)}
+Unhedged Amount: $${unhedgedAmount.toFixed(2)}
+Daily VaR (95%): $${dailyVaR.toFixed(2)}
+Hedged VaR: $${hedgedVaR.toFixed(2)}
+Risk Reduction: ${riskReduction.toFixed(1)}%`;}});
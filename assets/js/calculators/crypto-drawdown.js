@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-drawdown",{title:'Maximum Drawdown Calculator',icon:'fas fa-chart-line',inputs:[{id:'prices',label:'Historical Prices (comma-separated)',type:'text',placeholder:'e.g., 100,95,105,90,110'}],requires:['indicators'],calculate:function(inputs){const series=createSeriesReader(inputs.prices);const dd=createDrawdown();for(let price=series.next();price!==undefined;price=series.next()){dd.push(price);}
+if(dd.count<2){return'Error: Please provide at least 2 price points';}
+const maxDrawdown=dd.maxDrawdown;return`Maximum Drawdown: ${(maxDrawdown * 100).toFixed(2)}%
+Peak Value: $${dd.peak.toFixed(2)} (point ${dd.peakIndex + 1})
+Valley Value: $${dd.valley.toFixed(2)} (point ${dd.valleyIndex + 1})
+Recovery Required: ${((1/(1-maxDrawdown) - 1) * 100).toFixed(2)}%`;}});
@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-fear-greed",{title:'Fear & Greed Index Calculator',icon:'fas fa-chart-pie',inputs:[{id:'volatility',label:'Volatility Score (0-100)',type:'number',placeholder:'Enter volatility score',min:'0',max:'100'},{id:'volume',label:'Volume Score (0-100)',type:'number',placeholder:'Enter volume score',min:'0',max:'100'},{id:'momentum',label:'Momentum Score (0-100)',type:'number',placeholder:'Enter momentum score',min:'0',max:'100'},{id:'social',label:'Social Media Score (0-100)',type:'number',placeholder:'Enter social sentiment',min:'0',max:'100'}],calculate:function(inputs){const volatility=parseFloat(inputs.volatility)||0;const volume=parseFloat(inputs.volume)||0;const momentum=parseFloat(inputs.momentum)||0;const social=parseFloat(inputs.social)||0;const fearGreedIndex=(volatility+volume+momentum+social)/4;let sentiment,color,action;if(fearGreedIndex<=25){sentiment='Extreme Fear';color='Red';action='Excellent buying opportunity';}else if(fearGreedIndex<=45){sentiment='Fear';color='Orange';action='Good time to buy';}else if(fearGreedIndex<=55){sentiment='Neutral';color='Yellow';action='Wait and watch';}else if(fearGreedIndex<=75){sentiment='Greed';color='Light Green';action='Consider taking profits';}else{sentiment='Extreme Greed';color='Green';action='Time to sell/take profits';}
+return`Fear & Greed Index: ${fearGreedIndex.toFixed(0)}
+Market Sentiment: ${sentiment}
+Signal Color: ${color}
+Recommended Action: ${action}
+Volatility Component: ${volatility}
+Volume Component: ${volume}
+Momentum Component: ${momentum}
+Social Media Component: ${social}`;}});
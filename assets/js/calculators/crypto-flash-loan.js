@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-flash-loan",{title:'Flash Loan Arbitrage Calculator',icon:'fas fa-bolt',inputs:[{id:'loanAmount',label:'Flash Loan Amount ($)',type:'number',placeholder:'Enter loan amount'},{id:'priceDifference',label:'Price Difference (%)',type:'number',placeholder:'Enter price difference',step:'0.01'},{id:'flashLoanFee',label:'Flash Loan Fee (%)',type:'number',placeholder:'Enter flash loan fee',step:'0.01'},{id:'gasCost',label:'Gas Cost ($)',type:'number',placeholder:'Enter estimated gas cost'}],calculate:function(inputs){const loanAmount=parseFloat(inputs.loanAmount)||0;const priceDifference=parseFloat(inputs.priceDifference)||0;const flashLoanFee=parseFloat(inputs.flashLoanFee)||0;const gasCost=parseFloat(inputs.gasCost)||0;const grossProfit=loanAmount*(priceDifference/100);const loanFee=loanAmount*(flashLoanFee/100);const netProfit=grossProfit-loanFee-gasCost;const roi=(netProfit/loanAmount)*100;const profitability=netProfit>0?'Profitable':'Not Profitable';return`Gross Profit: $${grossProfit.toFixed(2)}
+Flash Loan Fee: $${loanFee.toFixed(2)}
+Gas Cost: $${gasCost.toFixed(2)}
+Net Profit: $${netProfit.toFixed(2)}
+ROI: ${roi.toFixed(4)}%
+Status: ${profitability}
+Break-even Price Diff: ${((loanFee + gasCost) / loanAmount * 100).toFixed(4)}%`;}});
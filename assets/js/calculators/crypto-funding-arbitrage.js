@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-funding-arbitrage",{title:'Funding Rate Arbitrage Calculator',icon:'fas fa-percent',inputs:[{id:'spotPrice',label:'Spot Price ($)',type:'number',placeholder:'Enter spot price',step:'0.000001'},{id:'futuresPrice',label:'Futures Price ($)',type:'number',placeholder:'Enter futures price',step:'0.000001'},{id:'fundingRate',label:'Funding Rate (%)',type:'number',placeholder:'Enter 8h funding rate',step:'0.001'},{id:'tradingAmount',label:'Trading Amount ($)',type:'number',placeholder:'Enter trading amount'},{id:'holdingPeriod',label:'Holding Period (days)',type:'number',placeholder:'Enter holding period'}],calculate:function(inputs){const spotPrice=parseFloat(inputs.spotPrice)||0;const futuresPrice=parseFloat(inputs.futuresPrice)||0;const fundingRate=parseFloat(inputs.fundingRate)||0;const tradingAmount=parseFloat(inputs.tradingAmount)||0;const holdingPeriod=parseFloat(inputs.holdingPeriod)||0;const basisSpread=((futuresPrice-spotPrice)/spotPrice)*100;const fundingPayments=3;const totalFundingPeriods=holdingPeriod*fundingPayments;const totalFundingEarned=(tradingAmount*fundingRate/100)*totalFundingPeriods;let strategy;if(fundingRate>0.02){strategy='Short Perpetual, Long Spot (Collect Funding)';}else if(fundingRate<-0.02){strategy='Long Perpetual, Short Spot (Pay Funding)';}else{strategy='Funding rates too low for arbitrage';}
+const dailyYield=(totalFundingEarned/tradingAmount/holdingPeriod)*100;const annualizedYield=dailyYield*365;return`Basis Spread: ${basisSpread.toFixed(4)}%
+8h Funding Rate: ${fundingRate.toFixed(4)}%
+Total Funding Earned: $${totalFundingEarned.toFixed(2)}
+Daily Yield: ${dailyYield.toFixed(3)}%
+Annualized Yield: ${annualizedYield.toFixed(1)}%
+Recommended Strategy: ${strategy}
+Risk Level: ${Math.abs(fundingRate) > 0.1 ? 'High' : 'Low'}`;}});
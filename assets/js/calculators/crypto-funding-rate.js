@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-funding-rate",{title:'Funding Rate Calculator',icon:'fas fa-percentage',inputs:[{id:'positionSize',label:'Position Size ($)',type:'number',placeholder:'Enter position size'},{id:'fundingRate',label:'Funding Rate (%)',type:'number',placeholder:'Enter funding rate',step:'0.001'},{id:'leverageUsed',label:'Leverage Used',type:'number',placeholder:'Enter leverage',step:'0.1'},{id:'days',label:'Hold Period (days)',type:'number',placeholder:'Enter days'}],calculate:function(inputs){const positionSize=parseFloat(inputs.positionSize)||0;const fundingRate=parseFloat(inputs.fundingRate)||0;const leverageUsed=parseFloat(inputs.leverageUsed)||1;const days=parseFloat(inputs.days)||0;const margin=positionSize/leverageUsed;const fundingPerDay=positionSize*(fundingRate/100)*3;const totalFunding=fundingPerDay*days;const roi=(totalFunding/margin)*100;return`Daily Funding: $${fundingPerDay.toFixed(2)}
+Total Funding: $${totalFunding.toFixed(2)}
+Funding ROI: ${roi.toFixed(2)}%
+Effective Rate: ${(fundingRate * 3 * 365).toFixed(2)}% APR`;}});
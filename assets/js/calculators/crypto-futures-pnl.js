@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-futures-pnl",{title:'Futures PnL Calculator',icon:'fas fa-chart-line',inputs:[{id:'side',label:'Position Side',type:'select',options:['Long','Short']},{id:'size',label:'Position Size (Contracts)',type:'number',placeholder:'Enter position size'},{id:'entry',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'exit',label:'Exit Price ($)',type:'number',placeholder:'Enter exit price',step:'0.000001'},{id:'leverage',label:'Leverage (x)',type:'number',placeholder:'Enter leverage',step:'0.1'}],calculate:function(inputs){const size=parseFloat(inputs.size)||0;const entry=parseFloat(inputs.entry)||0;const exit=parseFloat(inputs.exit)||0;const leverage=parseFloat(inputs.leverage)||1;const isLong=inputs.side==='Long';const initialMargin=(size*entry)/leverage;const pnl=isLong?
+(exit-entry)*size:
+(entry-exit)*size;const roi=(pnl/initialMargin)*100;return`Profit/Loss: $${pnl.toFixed(2)}
+ROI: ${roi.toFixed(2)}%
+Initial Margin: $${initialMargin.toFixed(2)}
+Effective Leverage: ${leverage.toFixed(2)}x`;}});
@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-gas-optimizer",{title:'Gas Fee Optimizer',icon:'fas fa-gas-pump',inputs:[{id:'gasLimit',label:'Gas Limit',type:'number',placeholder:'Enter gas limit'},{id:'baseFee',label:'Base Fee (Gwei)',type:'number',placeholder:'Enter base fee'},{id:'priorityFee',label:'Priority Fee (Gwei)',type:'number',placeholder:'Enter priority fee'},{id:'ethPrice',label:'ETH Price ($)',type:'number',placeholder:'Enter ETH price'},{id:'urgency',label:'Transaction Urgency',type:'select',options:['Low','Standard','Fast','Rapid']}],calculate:function(inputs){const gasLimit=parseFloat(inputs.gasLimit)||21000;const baseFee=parseFloat(inputs.baseFee)||0;const priorityFee=parseFloat(inputs.priorityFee)||0;const ethPrice=parseFloat(inputs.ethPrice)||0;const urgency=inputs.urgency||'Standard';const urgencyMultipliers={'Low':0.8,'Standard':1.0,'Fast':1.3,'Rapid':1.8};const adjustedPriorityFee=priorityFee*urgencyMultipliers[urgency];const totalGasPrice=baseFee+adjustedPriorityFee;const gasCostGwei=gasLimit*totalGasPrice;const gasCostEth=gasCostGwei/1000000000;const gasCostUsd=gasCostEth*ethPrice;const estimatedTime=urgency==='Low'?'5-10 min':
+urgency==='Standard'?'2-5 min':
+urgency==='Fast'?'30 sec - 2 min':'< 30 sec';return`Gas Cost: ${gasCostEth.toFixed(6)} ETH
+USD Cost: $${gasCostUsd.toFixed(2)}
+Total Gas Price: ${totalGasPrice.toFixed(1)} Gwei
+Base Fee: ${baseFee} Gwei
+Priority Fee: ${adjustedPriorityFee.toFixed(1)} Gwei
+Estimated Confirmation: ${estimatedTime}
+Urgency Level: ${urgency}`;}});
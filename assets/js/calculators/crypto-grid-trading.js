@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-grid-trading",{title:'Grid Trading Calculator',icon:'fas fa-th',inputs:[{id:'basePrice',label:'Base Price ($)',type:'number',placeholder:'Enter base price',step:'0.000001'},{id:'gridSpacing',label:'Grid Spacing (%)',type:'number',placeholder:'Enter grid spacing',step:'0.1'},{id:'numberOfGrids',label:'Number of Grids',type:'number',placeholder:'Enter number of grids'},{id:'investmentAmount',label:'Total Investment ($)',type:'number',placeholder:'Enter investment amount'}],calculate:function(inputs){const basePrice=parseFloat(inputs.basePrice)||0;const gridSpacing=parseFloat(inputs.gridSpacing)||0;const numberOfGrids=parseInt(inputs.numberOfGrids)||0;const investmentAmount=parseFloat(inputs.investmentAmount)||0;const amountPerGrid=investmentAmount/numberOfGrids;const gridsAbove=Math.floor(numberOfGrids/2);const gridsBelow=numberOfGrids-gridsAbove;let gridLevels=[];for(let i=1;i<=gridsBelow;i++){const price=basePrice*(1-(gridSpacing/100)*i);gridLevels.push({type:'Buy',price:price.toFixed(6),amount:amountPerGrid});}
+for(let i=1;i<=gridsAbove;i++){const price=basePrice*(1+(gridSpacing/100)*i);gridLevels.push({type:'Sell',price:price.toFixed(6),amount:amountPerGrid});}
+const lowestBuyPrice=basePrice*(1-(gridSpacing/100)*gridsBelow);const highestSellPrice=basePrice*(1+(gridSpacing/100)*gridsAbove);const totalRange=((highestSellPrice-lowestBuyPrice)/basePrice)*100;return`Grid Strategy Setup:
+Base Price: $${basePrice.toFixed(6)}
+Grid Spacing: ${gridSpacing}%
+Total Grids: ${numberOfGrids}
+Amount per Grid: $${amountPerGrid.toFixed(2)}
+Price Range: $${lowestBuyPrice.toFixed(6)} - $${highestSellPrice.toFixed(6)}
+Total Range: ${totalRange.toFixed(1)}%
+Buy Grids: ${gridsBelow} | Sell Grids: ${gridsAbove}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-hash-rate",{title:'Network Hash Rate Calculator',icon:'fas fa-server',inputs:[{id:'difficulty',label:'Network Difficulty',type:'number',placeholder:'Enter network difficulty'},{id:'blockTime',label:'Block Time (seconds)',type:'number',placeholder:'Enter target block time'},{id:'hashRateUnit',label:'Hash Rate Unit',type:'select',options:['H/s','KH/s','MH/s','GH/s','TH/s','PH/s','EH/s']}],calculate:function(inputs){const difficulty=parseFloat(inputs.difficulty)||0;const blockTime=parseFloat(inputs.blockTime)||600;const unit=inputs.hashRateUnit||'TH/s';const hashRate=difficulty*(Math.pow(2,32))/blockTime;const units={'H/s':1,'KH/s':1000,'MH/s':1000000,'GH/s':1000000000,'TH/s':1000000000000,'PH/s':1000000000000000,'EH/s':1000000000000000000};const convertedHashRate=hashRate/units[unit];const securityLevel=hashRate>100000000000000?'Very High':hashRate>10000000000000?'High':'Moderate';return`Network Hash Rate: ${convertedHashRate.toFixed(2)} ${unit}
+Raw Hash Rate: ${hashRate.toExponential(2)} H/s
+Security Level: ${securityLevel}
+Difficulty: ${difficulty.toLocaleString()}
+Block Time: ${blockTime} seconds`;}});
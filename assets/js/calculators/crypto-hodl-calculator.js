@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-hodl-calculator",{title:'HODL Strategy Calculator',icon:'fas fa-hand-holding',inputs:[{id:'initialInvestment',label:'Initial Investment ($)',type:'number',placeholder:'Enter initial investment'},{id:'initialPrice',label:'Initial Crypto Price ($)',type:'number',placeholder:'Enter initial price',step:'0.000001'},{id:'currentPrice',label:'Current Crypto Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'holdingPeriod',label:'Holding Period (months)',type:'number',placeholder:'Enter holding period'}],calculate:function(inputs){const initialInvestment=parseFloat(inputs.initialInvestment)||0;const initialPrice=parseFloat(inputs.initialPrice)||0;const currentPrice=parseFloat(inputs.currentPrice)||0;const holdingPeriod=parseFloat(inputs.holdingPeriod)||0;const cryptoAmount=initialInvestment/initialPrice;const currentValue=cryptoAmount*currentPrice;const totalGain=currentValue-initialInvestment;const percentageGain=((totalGain/initialInvestment)*100);const annualizedReturn=(Math.pow(currentValue/initialInvestment,12/holdingPeriod)-1)*100;return`Crypto Amount: ${cryptoAmount.toFixed(6)}
+Current Portfolio Value: $${currentValue.toFixed(2)}
+Total Gain/Loss: $${totalGain.toFixed(2)}
+Percentage Gain/Loss: ${percentageGain.toFixed(2)}%
+Annualized Return: ${annualizedReturn.toFixed(2)}%
+Return Multiple: ${(currentValue / initialInvestment).toFixed(2)}x`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-lending-returns",{title:'Lending Returns Calculator',icon:'fas fa-hand-holding-usd',inputs:[{id:'principal',label:'Principal Amount',type:'number',placeholder:'Enter lending amount'},{id:'apy',label:'APY (%)',type:'number',placeholder:'Enter APY',step:'0.01'},{id:'period',label:'Lending Period (days)',type:'number',placeholder:'Enter period'},{id:'compounding',label:'Compounding Frequency',type:'select',options:['Daily','Weekly','Monthly']}],calculate:function(inputs){const principal=parseFloat(inputs.principal)||0;const apy=parseFloat(inputs.apy)||0;const period=parseFloat(inputs.period)||0;let n=inputs.compounding==='Daily'?365:inputs.compounding==='Weekly'?52:12;const r=apy/100;const t=period/365;const amount=principal*Math.pow(1+r/n,n*t);const interest=amount-principal;return`Total Returns: $${interest.toFixed(2)}
+Final Amount: $${amount.toFixed(2)}
+Daily Interest: $${(interest/period).toFixed(2)}
+APY: ${apy}%`;}});
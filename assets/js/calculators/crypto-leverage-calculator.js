@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-leverage-calculator",{title:'Advanced Leverage Calculator',icon:'fas fa-chart-line',inputs:[{id:'capital',label:'Trading Capital ($)',type:'number',placeholder:'Enter trading capital'},{id:'leverage',label:'Leverage Ratio (x)',type:'number',placeholder:'Enter leverage ratio'},{id:'entryPrice',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'priceChange',label:'Price Change (%)',type:'number',placeholder:'Enter price change',step:'0.01'},{id:'tradingFee',label:'Trading Fee (%)',type:'number',placeholder:'Enter trading fee',step:'0.01'}],calculate:function(inputs){const capital=parseFloat(inputs.capital)||0;const leverage=parseFloat(inputs.leverage)||1;const entryPrice=parseFloat(inputs.entryPrice)||0;const priceChange=parseFloat(inputs.priceChange)||0;const tradingFee=parseFloat(inputs.tradingFee)||0;const positionSize=capital*leverage;const leveragedReturn=priceChange*leverage;const tradingFees=(positionSize*tradingFee)/100*2;const grossPnL=(capital*leveragedReturn)/100;const netPnL=grossPnL-tradingFees;const liquidationPrice=entryPrice*(1-(1/leverage)*0.8);return`Position Size: $${positionSize.toFixed(2)}
+Leveraged Return: ${leveragedReturn.toFixed(2)}%
+Gross P&L: $${grossPnL.toFixed(2)}
+Trading Fees: $${tradingFees.toFixed(2)}
+Net P&L: $${netPnL.toFixed(2)}
+ROI: ${((netPnL / capital) * 100).toFixed(2)}%
+Liquidation Price: $${liquidationPrice.toFixed(6)}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-leverage-liquidation",{title:'Leverage Liquidation Calculator',icon:'fas fa-balance-scale-right',inputs:[{id:'position',label:'Position Size ($)',type:'number',placeholder:'Enter position size'},{id:'leverage',label:'Leverage (x)',type:'number',placeholder:'Enter leverage',step:'0.1'},{id:'entryPrice',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'margin',label:'Initial Margin ($)',type:'number',placeholder:'Enter initial margin'}],calculate:function(inputs){const position=parseFloat(inputs.position)||0;const leverage=parseFloat(inputs.leverage)||0;const entryPrice=parseFloat(inputs.entryPrice)||0;const margin=parseFloat(inputs.margin)||0;const maintenanceMargin=margin*0.5;const liquidationPrice=entryPrice*(1-(1/leverage));const maxLoss=margin-maintenanceMargin;return`Liquidation Price: $${liquidationPrice.toFixed(2)}
+Maximum Loss: $${maxLoss.toFixed(2)}
+Effective Leverage: ${(position/margin).toFixed(2)}x
+Risk Level: ${((entryPrice - liquidationPrice) / entryPrice * 100).toFixed(2)}%`;}});
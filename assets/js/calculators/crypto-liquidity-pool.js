@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-liquidity-pool",{title:'Liquidity Pool Returns Calculator',icon:'fas fa-water',inputs:[{id:'token1Amount',label:'Token 1 Amount',type:'number',placeholder:'Enter token 1 amount',step:'0.000001'},{id:'token2Amount',label:'Token 2 Amount',type:'number',placeholder:'Enter token 2 amount',step:'0.000001'},{id:'token1Price',label:'Token 1 Price ($)',type:'number',placeholder:'Enter token 1 price',step:'0.000001'},{id:'token2Price',label:'Token 2 Price ($)',type:'number',placeholder:'Enter token 2 price',step:'0.000001'},{id:'tradingFeeApr',label:'Trading Fee APR (%)',type:'number',placeholder:'Enter trading fee APR',step:'0.01'}],calculate:function(inputs){const token1Amount=parseFloat(inputs.token1Amount)||0;const token2Amount=parseFloat(inputs.token2Amount)||0;const token1Price=parseFloat(inputs.token1Price)||0;const token2Price=parseFloat(inputs.token2Price)||0;const tradingFeeApr=parseFloat(inputs.tradingFeeApr)||0;const token1Value=token1Amount*token1Price;const token2Value=token2Amount*token2Price;const totalLiquidity=token1Value+token2Value;const dailyFeeReturn=(totalLiquidity*tradingFeeApr)/365/100;const monthlyFeeReturn=dailyFeeReturn*30;const yearlyFeeReturn=dailyFeeReturn*365;return`Total Liquidity: $${totalLiquidity.toFixed(2)}
+Token 1 Value: $${token1Value.toFixed(2)}
+Token 2 Value: $${token2Value.toFixed(2)}
+Daily Fee Returns: $${dailyFeeReturn.toFixed(2)}
+Monthly Fee Returns: $${monthlyFeeReturn.toFixed(2)}
+Yearly Fee Returns: $${yearlyFeeReturn.toFixed(2)}
+Effective APR: ${tradingFeeApr.toFixed(2)}%`;}});
@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-market-cap-calc",{title:'Market Cap & Supply Calculator',icon:'fas fa-calculator-alt',inputs:[{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'circulatingSupply',label:'Circulating Supply',type:'number',placeholder:'Enter circulating supply'},{id:'maxSupply',label:'Max Supply',type:'number',placeholder:'Enter max supply'},{id:'targetPrice',label:'Target Price ($)',type:'number',placeholder:'Enter target price',step:'0.000001'}],calculate:function(inputs){const currentPrice=parseFloat(inputs.currentPrice)||0;const circulatingSupply=parseFloat(inputs.circulatingSupply)||0;const maxSupply=parseFloat(inputs.maxSupply)||0;const targetPrice=parseFloat(inputs.targetPrice)||0;const currentMarketCap=currentPrice*circulatingSupply;const targetMarketCap=targetPrice*circulatingSupply;const fullyDilutedValue=currentPrice*maxSupply;const supplyRatio=maxSupply>0?(circulatingSupply/maxSupply)*100:100;const marketCapIncrease=((targetMarketCap-currentMarketCap)/currentMarketCap)*100;return`Current Market Cap: $${currentMarketCap.toLocaleString()}
+Target Market Cap: $${targetMarketCap.toLocaleString()}
+Fully Diluted Value: $${fullyDilutedValue.toLocaleString()}
+Circulating Supply: ${circulatingSupply.toLocaleString()}
+Max Supply: ${maxSupply.toLocaleString()}
+Supply Ratio: ${supplyRatio.toFixed(1)}%
+Required MC Increase: ${marketCapIncrease.toFixed(1)}%`;}});
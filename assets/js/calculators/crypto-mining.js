@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-mining",{title:'Mining Profitability Calculator',icon:'fas fa-microchip',inputs:[{id:'hashrate',label:'Hashrate (H/s)',type:'number',placeholder:'Enter hashrate'},{id:'power',label:'Power Consumption (W)',type:'number',placeholder:'Enter power consumption'},{id:'powerCost',label:'Electricity Cost ($/kWh)',type:'number',placeholder:'Enter electricity cost',step:'0.01'},{id:'poolFee',label:'Pool Fee (%)',type:'number',placeholder:'Enter pool fee',step:'0.1'}],calculate:function(inputs){const hashrate=parseFloat(inputs.hashrate)||0;const power=parseFloat(inputs.power)||0;const powerCost=parseFloat(inputs.powerCost)||0;const poolFee=parseFloat(inputs.poolFee)||0;const dailyPowerCost=(power*24*powerCost)/1000;const monthlyPowerCost=dailyPowerCost*30;return`Daily Power Cost: $${dailyPowerCost.toFixed(2)}
+Monthly Power Cost: $${monthlyPowerCost.toFixed(2)}
+Annual Power Cost: $${(monthlyPowerCost * 12).toFixed(2)}
+Pool Fee Cost (1 ETH): $${(2000 * poolFee / 100).toFixed(2)}`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-momentum-indicator",{title:'Crypto Momentum Indicator',icon:'fas fa-tachometer-alt',inputs:[{id:'price1Day',label:'1-Day Price ($)',type:'number',placeholder:'Enter 1-day ago price',step:'0.000001'},{id:'price7Day',label:'7-Day Price ($)',type:'number',placeholder:'Enter 7-day ago price',step:'0.000001'},{id:'price30Day',label:'30-Day Price ($)',type:'number',placeholder:'Enter 30-day ago price',step:'0.000001'},{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'volume24h',label:'24h Volume ($)',type:'number',placeholder:'Enter 24h volume'}],calculate:function(inputs){const price1Day=parseFloat(inputs.price1Day)||0;const price7Day=parseFloat(inputs.price7Day)||0;const price30Day=parseFloat(inputs.price30Day)||0;const currentPrice=parseFloat(inputs.currentPrice)||0;const volume24h=parseFloat(inputs.volume24h)||0;const change1Day=((currentPrice-price1Day)/price1Day)*100;const change7Day=((currentPrice-price7Day)/price7Day)*100;const change30Day=((currentPrice-price30Day)/price30Day)*100;const momentumScore=(change1Day*0.5)+(change7Day*0.3)+(change30Day*0.2);let momentum;if(momentumScore>10)momentum='Very Bullish';else if(momentumScore>5)momentum='Bullish';else if(momentumScore>-5)momentum='Neutral';else if(momentumScore>-10)momentum='Bearish';else momentum='Very Bearish';return`Momentum Score: ${momentumScore.toFixed(2)}
+1-Day Change: ${change1Day.toFixed(2)}%
+7-Day Change: ${change7Day.toFixed(2)}%
+30-Day Change: ${change30Day.toFixed(2)}%
+Overall Momentum: ${momentum}
+24h Volume: $${volume24h.toLocaleString()}`;}});
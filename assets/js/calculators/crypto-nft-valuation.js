@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-nft-valuation",{title:'NFT Valuation Calculator',icon:'fas fa-palette',inputs:[{id:'floorPrice',label:'Collection Floor Price (ETH)',type:'number',placeholder:'Enter floor price',step:'0.001'},{id:'rarity',label:'Rarity Rank',type:'number',placeholder:'Enter rarity rank'},{id:'totalSupply',label:'Total Supply',type:'number',placeholder:'Enter total supply'},{id:'volume',label:'30-Day Volume (ETH)',type:'number',placeholder:'Enter 30-day volume'},{id:'ethPrice',label:'ETH Price ($)',type:'number',placeholder:'Enter ETH price'}],calculate:function(inputs){const floorPrice=parseFloat(inputs.floorPrice)||0;const rarity=parseFloat(inputs.rarity)||0;const totalSupply=parseFloat(inputs.totalSupply)||0;const volume=parseFloat(inputs.volume)||0;const ethPrice=parseFloat(inputs.ethPrice)||0;const rarityPercentage=(rarity/totalSupply)*100;let rarityMultiplier=1;if(rarityPercentage<=1)rarityMultiplier=3.0;else if(rarityPercentage<=5)rarityMultiplier=2.0;else if(rarityPercentage<=10)rarityMultiplier=1.5;else if(rarityPercentage<=25)rarityMultiplier=1.2;const volumeMultiplier=volume>100?1.3:volume>50?1.2:volume>10?1.1:1.0;const estimatedValue=floorPrice*rarityMultiplier*volumeMultiplier;const usdValue=estimatedValue*ethPrice;return`Estimated NFT Value: ${estimatedValue.toFixed(3)} ETH
+USD Value: $${usdValue.toFixed(2)}
+Rarity Rank: ${rarity} / ${totalSupply}
+Rarity Percentile: Top ${rarityPercentage.toFixed(1)}%
+Rarity Multiplier: ${rarityMultiplier}x
+Volume Multiplier: ${volumeMultiplier}x
+Floor Price: ${floorPrice} ETH`;}});
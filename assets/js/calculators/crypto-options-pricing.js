@@ -0,0 +1,12 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-options-pricing",{title:'Crypto Options Pricing Calculator',icon:'fas fa-chart-bar',inputs:[{id:'spotPrice',label:'Current Spot Price ($)',type:'number',placeholder:'Enter current price',step:'0.01'},{id:'strikePrice',label:'Strike Price ($)',type:'number',placeholder:'Enter strike price',step:'0.01'},{id:'timeToExpiry',label:'Days to Expiry',type:'number',placeholder:'Enter days to expiry'},{id:'volatility',label:'Implied Volatility (%)',type:'number',placeholder:'Enter volatility',step:'0.1'},{id:'optionType',label:'Option Type',type:'select',options:['Call','Put']},{id:'riskFreeRate',label:'Risk-Free Rate (%)',type:'number',placeholder:'Enter risk-free rate (default 0)',step:'0.01',optional:true},{id:'underlying',label:'Underlying',type:'select',options:['Spot (Black-Scholes)','Futures (Black-76)']}],requires:['options'],calculate:function(inputs){const spotPrice=parseFloat(inputs.spotPrice)||0;const strikePrice=parseFloat(inputs.strikePrice)||0;const timeToExpiry=parseFloat(inputs.timeToExpiry)||0;const volatility=parseFloat(inputs.volatility)||0;const optionType=inputs.optionType||'Call';const riskFreeRate=parseFloat(inputs.riskFreeRate)||0;const futures=inputs.underlying==='Futures (Black-76)';if(spotPrice<=0||strikePrice<=0){return'Error: Please enter positive underlying and strike prices';}
+const isCall=optionType==='Call';const timeInYears=timeToExpiry/365;const moneyness=spotPrice/strikePrice;const option=priceOption(isCall,spotPrice,strikePrice,timeInYears,riskFreeRate/100,0,volatility/100,futures?'black-76':'black-scholes');const intrinsicValue=Math.max(0,isCall?spotPrice-strikePrice:strikePrice-spotPrice);const timeValue=option.price-intrinsicValue;return`Option Value: $${option.price.toFixed(2)}
+Intrinsic Value: $${intrinsicValue.toFixed(2)}
+Time Value: $${timeValue.toFixed(2)}
+Moneyness: ${(moneyness * 100).toFixed(1)}%
+Delta: ${option.delta.toFixed(3)}
+Gamma: ${option.gamma.toFixed(6)}
+Vega: $${(option.vega / 100).toFixed(3)} per 1% volatility
+Time Decay per Day: $${(option.theta / 365).toFixed(3)}
+Rho: $${(option.rho / 100).toFixed(3)} per 1% rate
+Model: ${futures ? 'Black-76 (options on futures)' : 'Black-Scholes (options on spot)'}`;}});
@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-pairs-trading",{title:'Crypto Pairs Trading Calculator',icon:'fas fa-exchange-alt',inputs:[{id:'asset1Price',label:'Asset 1 Price ($)',type:'number',placeholder:'Enter asset 1 price',step:'0.000001'},{id:'asset2Price',label:'Asset 2 Price ($)',type:'number',placeholder:'Enter asset 2 price',step:'0.000001'},{id:'historicalRatio',label:'Historical Average Ratio',type:'number',placeholder:'Enter historical ratio',step:'0.001'},{id:'tradingAmount',label:'Trading Amount ($)',type:'number',placeholder:'Enter trading amount'},{id:'spreadThreshold',label:'Spread Threshold (%)',type:'number',placeholder:'Enter spread threshold',step:'0.1'}],calculate:function(inputs){const asset1Price=parseFloat(inputs.asset1Price)||0;const asset2Price=parseFloat(inputs.asset2Price)||0;const historicalRatio=parseFloat(inputs.historicalRatio)||0;const tradingAmount=parseFloat(inputs.tradingAmount)||0;const spreadThreshold=parseFloat(inputs.spreadThreshold)||0;const currentRatio=asset1Price/asset2Price;const ratioDeviation=((currentRatio-historicalRatio)/historicalRatio)*100;const spread=Math.abs(ratioDeviation);let signal,action;if(spread>spreadThreshold){if(ratioDeviation>0){signal='Long Asset 2, Short Asset 1';action='Asset 1 is overvalued relative to Asset 2';}else{signal='Long Asset 1, Short Asset 2';action='Asset 2 is overvalued relative to Asset 1';}}else{signal='No Trade';action='Spread is within normal range';}
+const potentialProfit=tradingAmount*(spread/100);return`Current Ratio: ${currentRatio.toFixed(4)}
+Historical Ratio: ${historicalRatio.toFixed(4)}
+Ratio Deviation: ${ratioDeviation.toFixed(2)}%
+Spread: ${spread.toFixed(2)}%
+Trading Signal: ${signal}
+Action: ${action}
+Potential Profit: $${potentialProfit.toFixed(2)}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-portfolio-tracker",{title:'Crypto Portfolio Tracker',icon:'fas fa-briefcase',inputs:[{id:'asset1',label:'Asset 1 Amount',type:'number',placeholder:'Enter asset 1 amount',step:'0.000001'},{id:'asset1Price',label:'Asset 1 Price ($)',type:'number',placeholder:'Enter asset 1 price',step:'0.000001'},{id:'asset2',label:'Asset 2 Amount',type:'number',placeholder:'Enter asset 2 amount',step:'0.000001'},{id:'asset2Price',label:'Asset 2 Price ($)',type:'number',placeholder:'Enter asset 2 price',step:'0.000001'},{id:'asset3',label:'Asset 3 Amount',type:'number',placeholder:'Enter asset 3 amount',step:'0.000001'},{id:'asset3Price',label:'Asset 3 Price ($)',type:'number',placeholder:'Enter asset 3 price',step:'0.000001'}],calculate:function(inputs){const asset1=parseFloat(inputs.asset1)||0;const asset1Price=parseFloat(inputs.asset1Price)||0;const asset2=parseFloat(inputs.asset2)||0;const asset2Price=parseFloat(inputs.asset2Price)||0;const asset3=parseFloat(inputs.asset3)||0;const asset3Price=parseFloat(inputs.asset3Price)||0;const value1=asset1*asset1Price;const value2=asset2*asset2Price;const value3=asset3*asset3Price;const totalValue=value1+value2+value3;const percent1=totalValue>0?(value1/totalValue)*100:0;const percent2=totalValue>0?(value2/totalValue)*100:0;const percent3=totalValue>0?(value3/totalValue)*100:0;return`Total Portfolio Value: $${totalValue.toFixed(2)}
+Asset 1: $${value1.toFixed(2)} (${percent1.toFixed(1)}%)
+Asset 2: $${value2.toFixed(2)} (${percent2.toFixed(1)}%)
+Asset 3: $${value3.toFixed(2)} (${percent3.toFixed(1)}%)
+Diversification Score: ${(100 - Math.max(percent1, percent2, percent3)).toFixed(1)}%`;}});
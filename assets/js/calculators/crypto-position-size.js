@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-position-size",{title:'Position Size Calculator',icon:'fas fa-balance-scale-left',inputs:[{id:'accountSize',label:'Account Size ($)',type:'number',placeholder:'Enter account size'},{id:'riskPercent',label:'Risk Per Trade (%)',type:'number',placeholder:'Enter risk %',step:'0.1'},{id:'entryPrice',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'stopLoss',label:'Stop Loss Price ($)',type:'number',placeholder:'Enter stop loss',step:'0.000001'}],calculate:function(inputs){const accountSize=parseFloat(inputs.accountSize)||0;const riskPercent=parseFloat(inputs.riskPercent)||0;const entryPrice=parseFloat(inputs.entryPrice)||0;const stopLoss=parseFloat(inputs.stopLoss)||0;const riskAmount=accountSize*(riskPercent/100);const priceRisk=Math.abs(entryPrice-stopLoss);const positionSize=riskAmount/priceRisk;const positionValue=positionSize*entryPrice;return`Position Size: ${positionSize.toFixed(6)} units
+Position Value: $${positionValue.toFixed(2)}
+Risk Amount: $${riskAmount.toFixed(2)}
+Account Risk: ${riskPercent}%`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-profit",{title:'Cryptocurrency Profit Calculator',icon:'fas fa-coins',inputs:[{id:'buyPrice',label:'Buy Price ($)',type:'number',placeholder:'Enter buy price',step:'0.000001'},{id:'sellPrice',label:'Sell Price ($)',type:'number',placeholder:'Enter sell price',step:'0.000001'},{id:'amount',label:'Amount',type:'number',placeholder:'Enter amount of coins',step:'0.000001'}],calculate:function(inputs){const buyPrice=parseFloat(inputs.buyPrice)||0;const sellPrice=parseFloat(inputs.sellPrice)||0;const amount=parseFloat(inputs.amount)||0;const investment=buyPrice*amount;const revenue=sellPrice*amount;const profit=revenue-investment;const roi=((profit/investment)*100)||0;return`Investment: $${investment.toFixed(2)}
+Revenue: $${revenue.toFixed(2)}
+Profit/Loss: $${profit.toFixed(2)}
+ROI: ${roi.toFixed(2)}%`;}});
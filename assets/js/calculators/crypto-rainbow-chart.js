@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-rainbow-chart",{title:'Rainbow Chart Price Bands',icon:'fas fa-rainbow',inputs:[{id:'currentPrice',label:'Current BTC Price ($)',type:'number',placeholder:'Enter current BTC price'},{id:'movingAverage',label:'200-Day Moving Average ($)',type:'number',placeholder:'Enter 200-day MA'},{id:'regressionBase',label:'Regression Base Price ($)',type:'number',placeholder:'Enter regression base'}],calculate:function(inputs){const currentPrice=parseFloat(inputs.currentPrice)||0;const ma200=parseFloat(inputs.movingAverage)||0;const regression=parseFloat(inputs.regressionBase)||0;const bands={'Fire Sale':regression*0.5,'Buy':regression*0.75,'Accumulate':regression*1.0,'Still Cheap':regression*1.5,'HODL':regression*2.0,'Is This A Bubble?':regression*3.0,'FOMO Intensifies':regression*4.0,'Sell. Seriously, SELL!':regression*5.0,'Maximum Bubble Territory':regression*6.0};let currentBand='Unknown';for(const[band,price]of Object.entries(bands)){if(currentPrice<=price){currentBand=band;break;}}
+return`Current Price Band: ${currentBand}
+Fire Sale: $${bands['Fire Sale'].toFixed(0)}
+Buy Zone: $${bands['Buy'].toFixed(0)}
+Accumulate: $${bands['Accumulate'].toFixed(0)}
+Still Cheap: $${bands['Still Cheap'].toFixed(0)}
+HODL Zone: $${bands['HODL'].toFixed(0)}
+Bubble Territory: $${bands['Is This A Bubble?'].toFixed(0)}
+Maximum Bubble: $${bands['Maximum Bubble Territory'].toFixed(0)}`;}});
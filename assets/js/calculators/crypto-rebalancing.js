@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-rebalancing",{title:'Portfolio Rebalancing Calculator',icon:'fas fa-sync',inputs:[{id:'asset1Value',label:'Asset 1 Current Value ($)',type:'number',placeholder:'Enter current value'},{id:'asset2Value',label:'Asset 2 Current Value ($)',type:'number',placeholder:'Enter current value'},{id:'target1',label:'Asset 1 Target Allocation (%)',type:'number',placeholder:'Enter target %',step:'0.1'},{id:'target2',label:'Asset 2 Target Allocation (%)',type:'number',placeholder:'Enter target %',step:'0.1'}],calculate:function(inputs){const asset1Value=parseFloat(inputs.asset1Value)||0;const asset2Value=parseFloat(inputs.asset2Value)||0;const target1=parseFloat(inputs.target1)||0;const target2=parseFloat(inputs.target2)||0;const totalValue=asset1Value+asset2Value;const current1Percent=(asset1Value/totalValue)*100;const current2Percent=(asset2Value/totalValue)*100;const target1Value=totalValue*(target1/100);const target2Value=totalValue*(target2/100);const adjust1=target1Value-asset1Value;const adjust2=target2Value-asset2Value;return`Rebalance Asset 1: ${adjust1 >= 0 ? 'Buy' : 'Sell'} $${Math.abs(adjust1).toFixed(2)}
+Rebalance Asset 2: ${adjust2 >= 0 ? 'Buy' : 'Sell'} $${Math.abs(adjust2).toFixed(2)}
+Current Ratio: ${current1Percent.toFixed(1)}%/${current2Percent.toFixed(1)}%
+Target Ratio: ${target1}%/${target2}%`;}});
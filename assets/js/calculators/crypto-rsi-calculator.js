@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-rsi-calculator",{title:'RSI & Technical Indicators',icon:'fas fa-chart-line',inputs:[{id:'price1',label:'Price 14 Days Ago ($)',type:'number',placeholder:'Enter price 14 days ago',step:'0.000001'},{id:'price2',label:'Price 7 Days Ago ($)',type:'number',placeholder:'Enter price 7 days ago',step:'0.000001'},{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'volume',label:'Average Volume',type:'number',placeholder:'Enter average volume'}],requires:['indicators'],calculate:function(inputs){const price1=parseFloat(inputs.price1)||0;const price2=parseFloat(inputs.price2)||0;const currentPrice=parseFloat(inputs.currentPrice)||0;const volume=parseFloat(inputs.volume)||0;const indicator=createRSI(2);[price1,price2,currentPrice].forEach(price=>indicator.push(price));const avgGain=indicator.averageGain;const avgLoss=Math.max(0.01,indicator.averageLoss);const rs=avgGain/avgLoss;const rsi=100-(100/(1+rs));let rsiSignal;if(rsi>70)rsiSignal='Overbought - Consider Selling';else if(rsi<30)rsiSignal='Oversold - Consider Buying';else rsiSignal='Neutral Range';const momentum=((currentPrice-price1)/price1)*100;return`RSI (14): ${rsi.toFixed(1)}
+RSI Signal: ${rsiSignal}
+Price Momentum: ${momentum.toFixed(2)}%
+Recent Trend: ${currentPrice > price2 ? 'Bullish' : 'Bearish'}
+Average Volume: ${volume.toLocaleString()}
+Technical Summary: ${rsi > 50 && momentum > 0 ? 'Bullish' : rsi < 50 && momentum < 0 ? 'Bearish' : 'Mixed'}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-sharpe-ratio",{title:'Crypto Sharpe Ratio Calculator',icon:'fas fa-chart-bar',inputs:[{id:'portfolioReturn',label:'Portfolio Return (%)',type:'number',placeholder:'Enter portfolio return',step:'0.01'},{id:'riskFreeRate',label:'Risk-Free Rate (%)',type:'number',placeholder:'Enter risk-free rate',step:'0.01'},{id:'volatility',label:'Portfolio Volatility (%)',type:'number',placeholder:'Enter volatility',step:'0.01'}],calculate:function(inputs){const portfolioReturn=parseFloat(inputs.portfolioReturn)||0;const riskFreeRate=parseFloat(inputs.riskFreeRate)||0;const volatility=parseFloat(inputs.volatility)||0;const excessReturn=portfolioReturn-riskFreeRate;const sharpeRatio=volatility>0?excessReturn/volatility:0;let rating;if(sharpeRatio>2)rating='Excellent';else if(sharpeRatio>1)rating='Good';else if(sharpeRatio>0.5)rating='Acceptable';else if(sharpeRatio>0)rating='Poor';else rating='Very Poor';return`Sharpe Ratio: ${sharpeRatio.toFixed(3)}
+Excess Return: ${excessReturn.toFixed(2)}%
+Portfolio Volatility: ${volatility.toFixed(2)}%
+Risk Rating: ${rating}
+Interpretation: ${sharpeRatio > 1 ? 'Risk-adjusted returns are favorable' : 'Consider reducing risk or improving returns'}`;}});
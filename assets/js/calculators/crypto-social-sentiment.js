@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-social-sentiment",{title:'Social Sentiment Impact Calculator',icon:'fas fa-comments',inputs:[{id:'socialScore',label:'Social Sentiment Score (0-100)',type:'number',placeholder:'Enter social sentiment score',min:'0',max:'100'},{id:'twitterMentions',label:'Twitter Mentions (24h)',type:'number',placeholder:'Enter Twitter mentions'},{id:'redditScore',label:'Reddit Activity Score (0-100)',type:'number',placeholder:'Enter Reddit score',min:'0',max:'100'},{id:'newsScore',label:'News Sentiment Score (0-100)',type:'number',placeholder:'Enter news sentiment',min:'0',max:'100'},{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'}],calculate:function(inputs){const socialScore=parseFloat(inputs.socialScore)||0;const twitterMentions=parseFloat(inputs.twitterMentions)||0;const redditScore=parseFloat(inputs.redditScore)||0;const newsScore=parseFloat(inputs.newsScore)||0;const currentPrice=parseFloat(inputs.currentPrice)||0;const compositeSentiment=(socialScore*0.3)+(redditScore*0.3)+(newsScore*0.4);const viralityScore=Math.min(100,twitterMentions/100);const overallSentiment=(compositeSentiment*0.7)+(viralityScore*0.3);let sentimentLevel;if(overallSentiment>=80)sentimentLevel='Extremely Bullish';else if(overallSentiment>=60)sentimentLevel='Bullish';else if(overallSentiment>=40)sentimentLevel='Neutral';else if(overallSentiment>=20)sentimentLevel='Bearish';else sentimentLevel='Extremely Bearish';const predictedPriceImpact=(overallSentiment-50)*0.5;const priceTarget=currentPrice*(1+predictedPriceImpact/100);let recommendation;if(overallSentiment>70)recommendation='Strong Buy Signal';else if(overallSentiment>55)recommendation='Buy Signal';else if(overallSentiment<30)recommendation='Strong Sell Signal';else if(overallSentiment<45)recommendation='Sell Signal';else recommendation='Hold/Wait';return`Overall Sentiment: ${overallSentiment.toFixed(1)}/100
+Sentiment Level: ${sentimentLevel}
+Composite Score: ${compositeSentiment.toFixed(1)}
+Virality Score: ${viralityScore.toFixed(1)}
+Predicted Price Impact: ${predictedPriceImpact.toFixed(1)}%
+Price Target: $${priceTarget.toFixed(6)}
+Recommendation: ${recommendation}`;}});
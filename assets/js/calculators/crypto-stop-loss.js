@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-stop-loss",{title:'Stop Loss Calculator',icon:'fas fa-shield-alt',inputs:[{id:'position',label:'Position Size',type:'number',placeholder:'Enter position size'},{id:'entry',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'risk',label:'Risk Percentage (%)',type:'number',placeholder:'Enter risk %',step:'0.1'},{id:'type',label:'Position Type',type:'select',options:['Long','Short']}],calculate:function(inputs){const position=parseFloat(inputs.position)||0;const entry=parseFloat(inputs.entry)||0;const risk=parseFloat(inputs.risk)||0;const isLong=inputs.type==='Long';const riskAmount=position*(risk/100);const priceChange=riskAmount/position;const stopPrice=isLong?
+entry*(1-risk/100):
+entry*(1+risk/100);return`Stop Loss Price: $${stopPrice.toFixed(6)}
+Risk Amount: $${riskAmount.toFixed(2)}
+Price Change: ${(priceChange * 100).toFixed(2)}%
+Position Value: $${(position * entry).toFixed(2)}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-swing-trade",{title:'Swing Trading Calculator',icon:'fas fa-wave-square',inputs:[{id:'entryPrice',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'targetPrice',label:'Target Price ($)',type:'number',placeholder:'Enter target price',step:'0.000001'},{id:'stopLoss',label:'Stop Loss ($)',type:'number',placeholder:'Enter stop loss',step:'0.000001'},{id:'position',label:'Position Size',type:'number',placeholder:'Enter position size'}],calculate:function(inputs){const entry=parseFloat(inputs.entryPrice)||0;const target=parseFloat(inputs.targetPrice)||0;const stop=parseFloat(inputs.stopLoss)||0;const position=parseFloat(inputs.position)||0;const potentialProfit=(target-entry)*position;const potentialLoss=(entry-stop)*position;const riskRewardRatio=Math.abs(potentialProfit/potentialLoss);const breakEvenMove=(entry*0.001);return`Potential Profit: $${potentialProfit.toFixed(2)}
+Potential Loss: $${potentialLoss.toFixed(2)}
+Risk/Reward Ratio: ${riskRewardRatio.toFixed(2)}
+Break-even Move: $${breakEvenMove.toFixed(6)} (0.1% fee)`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-tax-calculator",{title:'Crypto Tax Calculator',icon:'fas fa-receipt',inputs:[{id:'shortTermGains',label:'Short-term Gains ($)',type:'number',placeholder:'Enter short-term gains'},{id:'longTermGains',label:'Long-term Gains ($)',type:'number',placeholder:'Enter long-term gains'},{id:'income',label:'Annual Income ($)',type:'number',placeholder:'Enter annual income'},{id:'filingStatus',label:'Filing Status',type:'select',options:['Single','Married Filing Jointly','Married Filing Separately','Head of Household']}],calculate:function(inputs){const shortTerm=parseFloat(inputs.shortTermGains)||0;const longTerm=parseFloat(inputs.longTermGains)||0;const income=parseFloat(inputs.income)||0;let shortTermRate=0.22;let longTermRate=0.15;if(income<40000){shortTermRate=0.12;longTermRate=0;}else if(income<85000){shortTermRate=0.22;longTermRate=0.15;}else{shortTermRate=0.32;longTermRate=0.20;}
+const shortTermTax=shortTerm*shortTermRate;const longTermTax=longTerm*longTermRate;const totalTax=shortTermTax+longTermTax;return`Short-term Capital Gains Tax: $${shortTermTax.toFixed(2)}
+Long-term Capital Gains Tax: $${longTermTax.toFixed(2)}
+Total Tax Liability: $${totalTax.toFixed(2)}
+Effective Tax Rate: ${((totalTax / (shortTerm + longTerm)) * 100).toFixed(2)}%
+Note: This is a simplified calculation. Consult a tax professional.`;}});
@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-technical-levels",{title:'Technical Support/Resistance Levels',icon:'fas fa-layer-group',inputs:[{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'highPrice',label:'52-Week High ($)',type:'number',placeholder:'Enter 52-week high',step:'0.000001'},{id:'lowPrice',label:'52-Week Low ($)',type:'number',placeholder:'Enter 52-week low',step:'0.000001'},{id:'volume',label:'Average Volume',type:'number',placeholder:'Enter average volume'}],calculate:function(inputs){const currentPrice=parseFloat(inputs.currentPrice)||0;const highPrice=parseFloat(inputs.highPrice)||0;const lowPrice=parseFloat(inputs.lowPrice)||0;const volume=parseFloat(inputs.volume)||0;const range=highPrice-lowPrice;const fib236=highPrice-(range*0.236);const fib382=highPrice-(range*0.382);const fib618=highPrice-(range*0.618);const pivot=(highPrice+lowPrice+currentPrice)/3;const resistance1=(2*pivot)-lowPrice;const support1=(2*pivot)-highPrice;const pricePosition=((currentPrice-lowPrice)/range)*100;return`Current Position: ${pricePosition.toFixed(1)}% of range
+Pivot Point: $${pivot.toFixed(6)}
+Resistance 1: $${resistance1.toFixed(6)}
+Support 1: $${support1.toFixed(6)}
+Fibonacci Levels:
+  23.6%: $${fib236.toFixed(6)}
+  38.2%: $${fib382.toFixed(6)}
+  61.8%: $${fib618.toFixed(6)}
+52-Week Range: $${lowPrice.toFixed(6)} - $${highPrice.toFixed(6)}`;}});
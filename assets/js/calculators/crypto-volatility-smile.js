@@ -0,0 +1,14 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-volatility-smile",{title:'Crypto Volatility Surface Calculator',icon:'fas fa-chart-area',inputs:[{id:'currentPrice',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'strike1',label:'Strike 1 ($)',type:'number',placeholder:'Enter strike price 1',step:'0.000001'},{id:'vol1',label:'Implied Vol 1 (%)',type:'number',placeholder:'Enter implied volatility 1',step:'0.1'},{id:'strike2',label:'Strike 2 ($)',type:'number',placeholder:'Enter strike price 2',step:'0.000001'},{id:'vol2',label:'Implied Vol 2 (%)',type:'number',placeholder:'Enter implied volatility 2',step:'0.1'},{id:'daysToExpiry',label:'Days to Expiry',type:'number',placeholder:'Enter days to expiry'}],requires:['options'],calculate:function(inputs){const currentPrice=parseFloat(inputs.currentPrice)||0;const strike1=parseFloat(inputs.strike1)||0;const vol1=parseFloat(inputs.vol1)||0;const strike2=parseFloat(inputs.strike2)||0;const vol2=parseFloat(inputs.vol2)||0;const daysToExpiry=parseFloat(inputs.daysToExpiry)||0;if(currentPrice<=0||strike1<=0||strike2<=0){return'Error: Please enter positive prices and strikes';}
+const moneyness1=strike1/currentPrice;const moneyness2=strike2/currentPrice;const volSkew=vol2-vol1;const timeToExpiry=daysToExpiry/365;const x1=Math.log(moneyness1);const x2=Math.log(moneyness2);const smileVol=strike=>x1===x2
+?(vol1+vol2)/2
+:vol1+(vol2-vol1)*(Math.log(strike/currentPrice)-x1)/(x2-x1);const atmVol=smileVol(currentPrice);const skewPerStrike=volSkew/Math.abs(moneyness2-moneyness1);const low=Math.min(strike1,strike2);const high=Math.max(strike1,strike2);const strikes=[0,1,2,3,4].map(i=>low+(high-low)*i/4);const grid=priceGrid(true,currentPrice,strikes,[timeToExpiry],0,0,strike=>Math.max(0,smileVol(strike))/100,'black-scholes');const smileRows=strikes.map((strike,i)=>
+`  $${strike.toFixed(2)}: IV ${smileVol(strike).toFixed(1)}%, call $${grid.price[i].toFixed(2)}, delta ${grid.delta[i].toFixed(3)}`);let skewDirection;if(volSkew>2)skewDirection='Strong Put Skew (Fear)';else if(volSkew>0)skewDirection='Moderate Put Skew';else if(volSkew<-2)skewDirection='Call Skew (Greed)';else skewDirection='Relatively Flat';const volOfVol=Math.abs(volSkew)/atmVol*100;return`ATM Implied Volatility: ${atmVol.toFixed(1)}%
+Volatility Skew: ${volSkew.toFixed(1)}%
+Skew Direction: ${skewDirection}
+Skew per Strike: ${skewPerStrike.toFixed(2)}%
+Vol of Vol: ${volOfVol.toFixed(1)}%
+Market Sentiment: ${volSkew > 0 ? 'Risk Averse' : 'Risk Seeking'}
+Time to Expiry: ${timeToExpiry.toFixed(3)} years
+Smile (Black-Scholes calls, zero rates):
+${smileRows.join('\n')}`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-volatility",{title:'Volatility Calculator',icon:'fas fa-bolt',inputs:[{id:'prices',label:'Daily Closing Prices (comma-separated)',type:'text',placeholder:'e.g., 100,102,98,103'}],requires:['indicators'],calculate:function(inputs){const series=createSeriesReader(inputs.prices);const returns=createWelford();let previous=series.next();for(let price=series.next();price!==undefined;price=series.next()){returns.push((price-previous)/previous);previous=price;}
+if(returns.count<1){return'Error: Please provide at least 2 price points';}
+const stdDev=Math.sqrt(returns.variance());const annualizedVol=stdDev*Math.sqrt(365)*100;return`Daily Volatility: ${(stdDev * 100).toFixed(2)}%
+Annualized Volatility: ${annualizedVol.toFixed(2)}%
+Max Daily Return: ${(returns.max * 100).toFixed(2)}%
+Min Daily Return: ${(returns.min * 100).toFixed(2)}%`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-volume-analysis",{title:'Volume Analysis Calculator',icon:'fas fa-chart-bar',inputs:[{id:'price',label:'Current Price ($)',type:'number',placeholder:'Enter current price',step:'0.000001'},{id:'volume24h',label:'24h Volume ($)',type:'number',placeholder:'Enter 24h volume'},{id:'marketCap',label:'Market Cap ($)',type:'number',placeholder:'Enter market cap'}],calculate:function(inputs){const price=parseFloat(inputs.price)||0;const volume24h=parseFloat(inputs.volume24h)||0;const marketCap=parseFloat(inputs.marketCap)||0;const volumeToMcRatio=(volume24h/marketCap)*100;const turnover=volume24h/price;return`Volume/Market Cap Ratio: ${volumeToMcRatio.toFixed(2)}%
+24h Turnover: ${turnover.toFixed(0)} units
+Average Trade Size: $${(volume24h / (turnover / 24)).toFixed(2)}
+Market Impact Score: ${volumeToMcRatio > 20 ? 'High' : volumeToMcRatio > 10 ? 'Medium' : 'Low'}`;}});
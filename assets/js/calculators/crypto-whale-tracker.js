@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-whale-tracker",{title:'Whale Movement Impact Calculator',icon:'fas fa-fish',inputs:[{id:'whaleAmount',label:'Whale Transaction Amount',type:'number',placeholder:'Enter whale transaction size'},{id:'marketCap',label:'Market Cap ($)',type:'number',placeholder:'Enter current market cap'},{id:'dailyVolume',label:'Daily Volume ($)',type:'number',placeholder:'Enter daily trading volume'},{id:'transactionType',label:'Transaction Type',type:'select',options:['Buy','Sell','Transfer']}],calculate:function(inputs){const whaleAmount=parseFloat(inputs.whaleAmount)||0;const marketCap=parseFloat(inputs.marketCap)||0;const dailyVolume=parseFloat(inputs.dailyVolume)||0;const transactionType=inputs.transactionType||'Transfer';const percentOfMarketCap=(whaleAmount/marketCap)*100;const percentOfVolume=(whaleAmount/dailyVolume)*100;let impact,priceEffect;if(percentOfVolume>10){impact='Very High';priceEffect=transactionType==='Buy'?'+5% to +15%':transactionType==='Sell'?'-5% to -15%':'Neutral';}else if(percentOfVolume>5){impact='High';priceEffect=transactionType==='Buy'?'+2% to +5%':transactionType==='Sell'?'-2% to -5%':'Neutral';}else if(percentOfVolume>1){impact='Moderate';priceEffect=transactionType==='Buy'?'+0.5% to +2%':transactionType==='Sell'?'-0.5% to -2%':'Neutral';}else{impact='Low';priceEffect='Minimal';}
+return`Transaction Impact: ${impact}
+% of Market Cap: ${percentOfMarketCap.toFixed(4)}%
+% of Daily Volume: ${percentOfVolume.toFixed(2)}%
+Expected Price Effect: ${priceEffect}
+Transaction Type: ${transactionType}
+Whale Amount: $${whaleAmount.toLocaleString()}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("crypto-yield-farming",{title:'Yield Farming Calculator',icon:'fas fa-seedling',inputs:[{id:'lpTokens',label:'LP Tokens Amount',type:'number',placeholder:'Enter LP tokens amount',step:'0.000001'},{id:'apy',label:'Farm APY (%)',type:'number',placeholder:'Enter farm APY',step:'0.01'},{id:'rewardTokenPrice',label:'Reward Token Price ($)',type:'number',placeholder:'Enter reward token price',step:'0.000001'},{id:'period',label:'Farming Period (days)',type:'number',placeholder:'Enter farming period'}],calculate:function(inputs){const lpTokens=parseFloat(inputs.lpTokens)||0;const apy=parseFloat(inputs.apy)||0;const rewardTokenPrice=parseFloat(inputs.rewardTokenPrice)||0;const period=parseFloat(inputs.period)||0;const dailyApy=apy/365;const dailyRewards=lpTokens*(dailyApy/100);const totalRewards=dailyRewards*period;const rewardValue=totalRewards*rewardTokenPrice;return`Daily Rewards: ${dailyRewards.toFixed(6)} tokens
+Total Rewards (${period} days): ${totalRewards.toFixed(6)} tokens
+USD Value: $${rewardValue.toFixed(2)}
+Annual Projection: ${(dailyRewards * 365).toFixed(6)} tokens`;}});
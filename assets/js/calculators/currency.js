@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("currency",{title:'Currency Converter',icon:'fas fa-dollar-sign',inputs:[{id:'amount',label:'Amount',type:'number',placeholder:'Enter amount'},{id:'fromCurrency',label:'From Currency',type:'select',options:['USD','EUR','GBP','JPY','CAD','AUD','CHF','CNY','INR','BRL']},{id:'toCurrency',label:'To Currency',type:'select',options:['USD','EUR','GBP','JPY','CAD','AUD','CHF','CNY','INR','BRL']},{id:'exchangeRate',label:'Exchange Rate',type:'number',placeholder:'Enter current exchange rate',step:'0.000001'}],calculate:function(inputs){const amount=parseFloat(inputs.amount)||0;const exchangeRate=parseFloat(inputs.exchangeRate)||1;const fromCurrency=inputs.fromCurrency;const toCurrency=inputs.toCurrency;const convertedAmount=amount*exchangeRate;return`${amount} ${fromCurrency} = ${convertedAmount.toFixed(2)} ${toCurrency}
+Exchange Rate: 1 ${fromCurrency} = ${exchangeRate} ${toCurrency}
+Note: Please enter current exchange rate for accurate conversion`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("data-storage",{title:'Data Storage Converter',icon:'fas fa-hdd',inputs:[{id:'value',label:'Data Size',type:'number',placeholder:'Enter data size'},{id:'fromUnit',label:'From Unit',type:'select',options:['bit','byte','KB','MB','GB','TB','PB']},{id:'toUnit',label:'To Unit',type:'select',options:['bit','byte','KB','MB','GB','TB','PB']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const bytes=convertUnit('data-storage',value,fromUnit,'byte');const result=convertUnit('data-storage',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Bytes: ${bytes.toFixed(0)} bytes
+Megabytes: ${(bytes/1048576).toFixed(6)} MB
+Gigabytes: ${(bytes/1073741824).toFixed(6)} GB`;}});
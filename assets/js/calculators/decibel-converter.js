@@ -0,0 +1,15 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("decibel-converter",{title:'Decibel (dB) Converter',icon:'fas fa-volume-up',inputs:[{id:'value1',label:'Value 1',type:'number',placeholder:'Enter first value'},{id:'value2',label:'Value 2',type:'number',placeholder:'Enter second value'},{id:'conversionType',label:'Conversion Type',type:'select',options:['Power Ratio to dB','Voltage Ratio to dB','dB to Power Ratio','dB to Voltage Ratio']}],calculate:function(inputs){const value1=parseFloat(inputs.value1)||0;const value2=parseFloat(inputs.value2)||1;const conversionType=inputs.conversionType||'Power Ratio to dB';let result='';switch(conversionType){case'Power Ratio to dB':
+const powerDB=10*Math.log10(value1/value2);result=`Power Ratio: ${(value1/value2).toFixed(6)}
+Decibels: ${powerDB.toFixed(2)} dB
+Formula: dB = 10 × log₁₀(P₁/P₂)`;break;case'Voltage Ratio to dB':
+const voltageDB=20*Math.log10(value1/value2);result=`Voltage Ratio: ${(value1/value2).toFixed(6)}
+Decibels: ${voltageDB.toFixed(2)} dB
+Formula: dB = 20 × log₁₀(V₁/V₂)`;break;case'dB to Power Ratio':
+const powerRatio=Math.pow(10,value1/10);result=`Decibels: ${value1} dB
+Power Ratio: ${powerRatio.toFixed(6)}
+Formula: Ratio = 10^(dB/10)`;break;case'dB to Voltage Ratio':
+const voltageRatio=Math.pow(10,value1/20);result=`Decibels: ${value1} dB
+Voltage Ratio: ${voltageRatio.toFixed(6)}
+Formula: Ratio = 10^(dB/20)`;break;}
+return result;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("density",{title:'Density Converter',icon:'fas fa-weight',inputs:[{id:'value',label:'Density',type:'number',placeholder:'Enter density'},{id:'fromUnit',label:'From Unit',type:'select',options:['kg/m³','g/cm³','g/ml','lb/ft³','oz/in³']},{id:'toUnit',label:'To Unit',type:'select',options:['kg/m³','g/cm³','g/ml','lb/ft³','oz/in³']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const kgm3=convertUnit('density',value,fromUnit,'kg/m³');const result=convertUnit('density',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+kg/m³: ${kgm3.toFixed(3)} kg/m³
+g/cm³: ${(kgm3/1000).toFixed(6)} g/cm³
+lb/ft³: ${(kgm3/16.0185).toFixed(3)} lb/ft³`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("energy-conversion",{title:'Energy Converter',icon:'fas fa-bolt',inputs:[{id:'value',label:'Energy',type:'number',placeholder:'Enter energy value'},{id:'fromUnit',label:'From Unit',type:'select',options:['J','kJ','MJ','cal','kcal','Wh','kWh','BTU','eV']},{id:'toUnit',label:'To Unit',type:'select',options:['J','kJ','MJ','cal','kcal','Wh','kWh','BTU','eV']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const joules=convertUnit('energy',value,fromUnit,'J');const result=convertUnit('energy',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Joules: ${joules.toFixed(3)} J
+Kilowatt-hours: ${(joules/3600000).toFixed(6)} kWh
+Calories: ${(joules/4.184).toFixed(3)} cal`;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("energy",{title:'Energy Calculator',icon:'fas fa-atom',inputs:[{id:'mass',label:'Mass (kg)',type:'number',placeholder:'Enter mass'},{id:'height',label:'Height (m)',type:'number',placeholder:'Enter height'},{id:'velocity',label:'Velocity (m/s)',type:'number',placeholder:'Enter velocity'}],calculate:function(inputs){const mass=parseFloat(inputs.mass)||0;const height=parseFloat(inputs.height)||0;const velocity=parseFloat(inputs.velocity)||0;const g=9.81;const potentialEnergy=mass*g*height;const kineticEnergy=0.5*mass*velocity*velocity;const totalEnergy=potentialEnergy+kineticEnergy;return`Potential Energy: ${potentialEnergy.toFixed(2)} Joules\nKinetic Energy: ${kineticEnergy.toFixed(2)} Joules\nTotal Energy: ${totalEnergy.toFixed(2)} Joules`;}});
@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("exercise-calories",{title:'Exercise Calorie Burn Calculator',icon:'fas fa-running',inputs:[{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'duration',label:'Duration (minutes)',type:'number',placeholder:'Enter duration'},{id:'exerciseType',label:'Exercise Type',type:'select',options:['Walking (3.5 mph)','Jogging (5 mph)','Running (7.5 mph)','Cycling (12-14 mph)','Swimming','Weight Training','Yoga','HIIT','Dancing','Elliptical']}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const duration=parseInt(inputs.duration)||0;const metValues={'Walking (3.5 mph)':3.5,'Jogging (5 mph)':7.0,'Running (7.5 mph)':11.5,'Cycling (12-14 mph)':8.0,'Swimming':7.0,'Weight Training':3.5,'Yoga':2.5,'HIIT':8.0,'Dancing':4.5,'Elliptical':5.0};const met=metValues[inputs.exerciseType];const calories=(met*3.5*weight*duration)/200;return`Calories Burned: ${Math.round(calories)} calories
+Exercise: ${inputs.exerciseType}
+Duration: ${duration} minutes
+Intensity: ${met} METs
+
+Note: Actual calorie burn may vary based on:
+- Fitness level
+- Exercise intensity
+- Age and gender
+- Environmental conditions`;}});
@@ -0,0 +1,20 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("filter-frequency",{title:'Filter Frequency Calculator',icon:'fas fa-filter',inputs:[{id:'resistance',label:'Resistance (kΩ)',type:'number',placeholder:'Enter resistance'},{id:'capacitance',label:'Capacitance (µF)',type:'number',placeholder:'Enter capacitance'},{id:'inductance',label:'Inductance (mH)',type:'number',placeholder:'Enter inductance (for LC filters)'},{id:'filterType',label:'Filter Type',type:'select',options:['RC Low-pass','RC High-pass','LC Low-pass','LC High-pass','RLC Band-pass']}],calculate:function(inputs){const resistance=parseFloat(inputs.resistance)||0;const capacitance=parseFloat(inputs.capacitance)||0;const inductance=parseFloat(inputs.inductance)||0;const filterType=inputs.filterType||'RC Low-pass';const resistanceOhms=resistance*1000;const capacitanceFarads=capacitance/1000000;const inductanceHenries=inductance/1000;let cutoffFreq=0;let result='';switch(filterType){case'RC Low-pass':
+case'RC High-pass':
+cutoffFreq=1/(2*Math.PI*resistanceOhms*capacitanceFarads);result=`${filterType} Filter:
+Cutoff Frequency: ${cutoffFreq.toFixed(2)} Hz
+Cutoff Frequency: ${(cutoffFreq/1000).toFixed(3)} kHz
+Time Constant: ${(resistanceOhms * capacitanceFarads * 1000).toFixed(3)} ms
+Roll-off Rate: 20 dB/decade`;break;case'LC Low-pass':
+case'LC High-pass':
+cutoffFreq=1/(2*Math.PI*Math.sqrt(inductanceHenries*capacitanceFarads));const characteristicImpedance=Math.sqrt(inductanceHenries/capacitanceFarads);result=`${filterType} Filter:
+Cutoff Frequency: ${cutoffFreq.toFixed(2)} Hz
+Cutoff Frequency: ${(cutoffFreq/1000).toFixed(3)} kHz
+Characteristic Impedance: ${characteristicImpedance.toFixed(1)} Ω
+Roll-off Rate: 40 dB/decade`;break;case'RLC Band-pass':
+const centerFreq=1/(2*Math.PI*Math.sqrt(inductanceHenries*capacitanceFarads));const qualityFactor=(1/resistanceOhms)*Math.sqrt(inductanceHenries/capacitanceFarads);const bandwidth=centerFreq/qualityFactor;result=`RLC Band-pass Filter:
+Center Frequency: ${centerFreq.toFixed(2)} Hz
+Center Frequency: ${(centerFreq/1000).toFixed(3)} kHz
+Quality Factor (Q): ${qualityFactor.toFixed(2)}
+Bandwidth: ${bandwidth.toFixed(2)} Hz`;break;}
+return result;}});
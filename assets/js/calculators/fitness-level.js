@@ -0,0 +1,34 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("fitness-level",{title:'Fitness Level Calculator',icon:'fas fa-running',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'restingHR',label:'Resting Heart Rate',type:'number',placeholder:'Enter resting HR'},{id:'pushups',label:'Push-ups (max in 1 min)',type:'number',placeholder:'Enter max push-ups'},{id:'situps',label:'Sit-ups (max in 1 min)',type:'number',placeholder:'Enter max sit-ups'},{id:'flexibility',label:'Sit-and-reach (cm)',type:'number',placeholder:'Enter flexibility measurement'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const restingHR=parseInt(inputs.restingHR)||0;const pushups=parseInt(inputs.pushups)||0;const situps=parseInt(inputs.situps)||0;const flexibility=parseFloat(inputs.flexibility)||0;let fitnessScore=0;let components=[];let cardioLevel;if(inputs.gender==='Male'){if(restingHR<60){cardioLevel='Excellent';fitnessScore+=5;}
+else if(restingHR<70){cardioLevel='Good';fitnessScore+=4;}
+else if(restingHR<80){cardioLevel='Average';fitnessScore+=3;}
+else{cardioLevel='Below Average';fitnessScore+=2;}}else{if(restingHR<65){cardioLevel='Excellent';fitnessScore+=5;}
+else if(restingHR<75){cardioLevel='Good';fitnessScore+=4;}
+else if(restingHR<85){cardioLevel='Average';fitnessScore+=3;}
+else{cardioLevel='Below Average';fitnessScore+=2;}}
+components.push(`Cardio: ${cardioLevel}`);let strengthLevel;const pushupThresholds=inputs.gender==='Male'?[40,30,20,10]:[30,20,15,8];if(pushups>=pushupThresholds[0]){strengthLevel='Excellent';fitnessScore+=5;}
+else if(pushups>=pushupThresholds[1]){strengthLevel='Good';fitnessScore+=4;}
+else if(pushups>=pushupThresholds[2]){strengthLevel='Average';fitnessScore+=3;}
+else if(pushups>=pushupThresholds[3]){strengthLevel='Below Average';fitnessScore+=2;}
+else{strengthLevel='Poor';fitnessScore+=1;}
+components.push(`Strength: ${strengthLevel}`);let enduranceLevel;const situpThresholds=inputs.gender==='Male'?[45,35,25,15]:[35,25,20,12];if(situps>=situpThresholds[0]){enduranceLevel='Excellent';fitnessScore+=5;}
+else if(situps>=situpThresholds[1]){enduranceLevel='Good';fitnessScore+=4;}
+else if(situps>=situpThresholds[2]){enduranceLevel='Average';fitnessScore+=3;}
+else if(situps>=situpThresholds[3]){enduranceLevel='Below Average';fitnessScore+=2;}
+else{enduranceLevel='Poor';fitnessScore+=1;}
+components.push(`Endurance: ${enduranceLevel}`);let flexLevel;if(flexibility>=15){flexLevel='Excellent';fitnessScore+=5;}
+else if(flexibility>=10){flexLevel='Good';fitnessScore+=4;}
+else if(flexibility>=5){flexLevel='Average';fitnessScore+=3;}
+else if(flexibility>=0){flexLevel='Below Average';fitnessScore+=2;}
+else{flexLevel='Poor';fitnessScore+=1;}
+components.push(`Flexibility: ${flexLevel}`);const maxScore=20;const percentage=(fitnessScore/maxScore)*100;let overallLevel;if(percentage>=85)overallLevel='Excellent';else if(percentage>=70)overallLevel='Good';else if(percentage>=55)overallLevel='Average';else if(percentage>=40)overallLevel='Below Average';else overallLevel='Poor';return`Overall Fitness Level: ${overallLevel}
+Fitness Score: ${fitnessScore}/${maxScore} (${percentage.toFixed(0)}%)
+
+Component Breakdown:
+${components.join('\n')}
+
+Test Results:
+Push-ups: ${pushups}
+Sit-ups: ${situps}
+Resting HR: ${restingHR} bpm
+Flexibility: ${flexibility} cm`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("force-conversion",{title:'Force Converter',icon:'fas fa-hand-rock',inputs:[{id:'value',label:'Force',type:'number',placeholder:'Enter force'},{id:'fromUnit',label:'From Unit',type:'select',options:['N','kN','lbf','kgf','dyn','pdl']},{id:'toUnit',label:'To Unit',type:'select',options:['N','kN','lbf','kgf','dyn','pdl']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const newtons=convertUnit('force',value,fromUnit,'N');const result=convertUnit('force',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Newtons: ${newtons.toFixed(3)} N
+Pounds-force: ${(newtons/4.44822).toFixed(3)} lbf
+Kilograms-force: ${(newtons/9.80665).toFixed(3)} kgf`;}});
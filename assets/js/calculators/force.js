@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("force",{title:'Force Calculator',icon:'fas fa-compress-arrows-alt',inputs:[{id:'mass',label:'Mass (kg)',type:'number',placeholder:'Enter mass'},{id:'acceleration',label:'Acceleration (m/s²)',type:'number',placeholder:'Enter acceleration'}],calculate:function(inputs){const mass=parseFloat(inputs.mass)||0;const acceleration=parseFloat(inputs.acceleration)||0;const force=mass*acceleration;return`Force: ${force.toFixed(2)} Newtons\nWeight: ${(mass * 9.81).toFixed(2)} Newtons\nMass: ${mass.toFixed(2)} kg`;}});
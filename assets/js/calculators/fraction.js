@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("fraction",{title:'Fraction Calculator',icon:'fas fa-divide',inputs:[{id:'num1',label:'Numerator 1',type:'number',placeholder:'Enter numerator'},{id:'den1',label:'Denominator 1',type:'number',placeholder:'Enter denominator'},{id:'operation',label:'Operation',type:'select',options:['+','-','×','÷']},{id:'num2',label:'Numerator 2',type:'number',placeholder:'Enter numerator'},{id:'den2',label:'Denominator 2',type:'number',placeholder:'Enter denominator'}],calculate:function(inputs){const num1=parseInt(inputs.num1)||0;const den1=parseInt(inputs.den1)||1;const num2=parseInt(inputs.num2)||0;const den2=parseInt(inputs.den2)||1;let resultNum,resultDen;switch(inputs.operation){case'+':
+resultNum=num1*den2+num2*den1;resultDen=den1*den2;break;case'-':
+resultNum=num1*den2-num2*den1;resultDen=den1*den2;break;case'×':
+resultNum=num1*num2;resultDen=den1*den2;break;case'÷':
+resultNum=num1*den2;resultDen=den1*num2;break;}
+const gcd=(a,b)=>b?gcd(b,a%b):a;const divisor=gcd(Math.abs(resultNum),Math.abs(resultDen));resultNum/=divisor;resultDen/=divisor;return`Result: ${resultNum}/${resultDen}\nDecimal: ${(resultNum/resultDen).toFixed(4)}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("frequency",{title:'Frequency Converter',icon:'fas fa-wave-square',inputs:[{id:'value',label:'Frequency',type:'number',placeholder:'Enter frequency'},{id:'fromUnit',label:'From Unit',type:'select',options:['Hz','kHz','MHz','GHz','THz','rpm','rps']},{id:'toUnit',label:'To Unit',type:'select',options:['Hz','kHz','MHz','GHz','THz','rpm','rps']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const hz=convertUnit('frequency',value,fromUnit,'Hz');const result=convertUnit('frequency',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Hertz: ${hz.toFixed(3)} Hz
+Kilohertz: ${(hz/1000).toFixed(6)} kHz
+Megahertz: ${(hz/1000000).toFixed(6)} MHz
+RPM: ${(hz*60).toFixed(3)} rpm`;}});
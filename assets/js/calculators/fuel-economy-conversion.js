@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("fuel-economy-conversion",{title:'Fuel Economy Converter',icon:'fas fa-gas-pump',inputs:[{id:'value',label:'Fuel Economy',type:'number',placeholder:'Enter fuel economy value'},{id:'fromUnit',label:'From Unit',type:'select',options:['mpg','l/100km','km/l','mi/l']},{id:'toUnit',label:'To Unit',type:'select',options:['mpg','l/100km','km/l','mi/l']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const l100km=convertUnit('fuel-economy',value,fromUnit,'l/100km');const result=convertUnit('fuel-economy',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(3)} ${toUnit}
+L/100km: ${l100km.toFixed(3)} L/100km
+MPG: ${(235.214/l100km).toFixed(3)} mpg
+KM/L: ${(100/l100km).toFixed(3)} km/L`;}});
@@ -0,0 +1,13 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("gear-ratio",{title:'Gear Ratio Calculator',icon:'fas fa-cog',inputs:[{id:'inputTeeth',label:'Input Gear Teeth',type:'number',placeholder:'Enter input gear teeth'},{id:'outputTeeth',label:'Output Gear Teeth',type:'number',placeholder:'Enter output gear teeth'},{id:'inputRPM',label:'Input RPM',type:'number',placeholder:'Enter input RPM (optional)'},{id:'inputTorque',label:'Input Torque (Nm)',type:'number',placeholder:'Enter input torque (optional)'}],calculate:function(inputs){const inputTeeth=parseFloat(inputs.inputTeeth)||0;const outputTeeth=parseFloat(inputs.outputTeeth)||0;const inputRPM=parseFloat(inputs.inputRPM)||0;const inputTorque=parseFloat(inputs.inputTorque)||0;const gearRatio=outputTeeth/inputTeeth;const speedReduction=inputTeeth/outputTeeth;const mechanicalAdvantage=outputTeeth/inputTeeth;let result=`Gear Ratio: ${gearRatio.toFixed(3)}:1
+Speed Reduction: ${speedReduction.toFixed(3)}:1
+Mechanical Advantage: ${mechanicalAdvantage.toFixed(3)}
+Input Teeth: ${inputTeeth}
+Output Teeth: ${outputTeeth}`;if(inputRPM>0){const outputRPM=inputRPM*speedReduction;result+=`\n\nSpeed Analysis:
+Input RPM: ${inputRPM}
+Output RPM: ${outputRPM.toFixed(1)}`;}
+if(inputTorque>0){const outputTorque=inputTorque*mechanicalAdvantage;const efficiency=0.95;const actualOutputTorque=outputTorque*efficiency;result+=`\n\nTorque Analysis:
+Input Torque: ${inputTorque} Nm
+Theoretical Output Torque: ${outputTorque.toFixed(2)} Nm
+Actual Output Torque: ${actualOutputTorque.toFixed(2)} Nm (95% efficiency)`;}
+return result;}});
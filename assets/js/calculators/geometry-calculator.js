@@ -0,0 +1,9 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("geometry-calculator",{title:'Geometry Calculator',icon:'fas fa-shapes',inputs:[{id:'shape',label:'Shape',type:'select',options:['Circle','Triangle','Rectangle','Square','Trapezoid','Sphere','Cylinder']},{id:'dimension1',label:'Dimension 1',type:'number',placeholder:'Enter first dimension',step:'0.01'},{id:'dimension2',label:'Dimension 2 (if needed)',type:'number',placeholder:'Enter second dimension',step:'0.01'},{id:'dimension3',label:'Dimension 3 (if needed)',type:'number',placeholder:'Enter third dimension',step:'0.01'}],calculate:function(inputs){const d1=parseFloat(inputs.dimension1)||0;const d2=parseFloat(inputs.dimension2)||0;const d3=parseFloat(inputs.dimension3)||0;switch(inputs.shape){case'Circle':
+const circleArea=Math.PI*d1*d1;const circlePerimeter=2*Math.PI*d1;return`Circle (radius = ${d1})\nArea: ${circleArea.toFixed(4)}\nPerimeter: ${circlePerimeter.toFixed(4)}`;case'Triangle':
+if(d2===0)return'Error: Please enter base and height';const triangleArea=0.5*d1*d2;return`Triangle (base = ${d1}, height = ${d2})\nArea: ${triangleArea.toFixed(4)}`;case'Rectangle':
+if(d2===0)return'Error: Please enter length and width';const rectArea=d1*d2;const rectPerimeter=2*(d1+d2);return`Rectangle (length = ${d1}, width = ${d2})\nArea: ${rectArea.toFixed(4)}\nPerimeter: ${rectPerimeter.toFixed(4)}`;case'Square':
+const squareArea=d1*d1;const squarePerimeter=4*d1;return`Square (side = ${d1})\nArea: ${squareArea.toFixed(4)}\nPerimeter: ${squarePerimeter.toFixed(4)}`;case'Sphere':
+const sphereVolume=(4/3)*Math.PI*Math.pow(d1,3);const sphereSurface=4*Math.PI*d1*d1;return`Sphere (radius = ${d1})\nVolume: ${sphereVolume.toFixed(4)}\nSurface Area: ${sphereSurface.toFixed(4)}`;case'Cylinder':
+if(d2===0)return'Error: Please enter radius and height';const cylinderVolume=Math.PI*d1*d1*d2;const cylinderSurface=2*Math.PI*d1*(d1+d2);return`Cylinder (radius = ${d1}, height = ${d2})\nVolume: ${cylinderVolume.toFixed(4)}\nSurface Area: ${cylinderSurface.toFixed(4)}`;default:
+return'Please select a shape and enter dimensions';}}});
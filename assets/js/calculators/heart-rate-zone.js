@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("heart-rate-zone",{title:'Heart Rate Zone Calculator',icon:'fas fa-heartbeat',inputs:[{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'restingHR',label:'Resting Heart Rate (optional)',type:'number',placeholder:'Enter resting HR'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const restingHR=parseInt(inputs.restingHR)||60;const maxHR=220-age;const hrReserve=maxHR-restingHR;const zone1Min=Math.round(restingHR+(hrReserve*0.5));const zone1Max=Math.round(restingHR+(hrReserve*0.6));const zone2Min=Math.round(restingHR+(hrReserve*0.6));const zone2Max=Math.round(restingHR+(hrReserve*0.7));const zone3Min=Math.round(restingHR+(hrReserve*0.7));const zone3Max=Math.round(restingHR+(hrReserve*0.8));const zone4Min=Math.round(restingHR+(hrReserve*0.8));const zone4Max=Math.round(restingHR+(hrReserve*0.9));const zone5Min=Math.round(restingHR+(hrReserve*0.9));const zone5Max=maxHR;return`Maximum Heart Rate: ${maxHR} bpm
+Zone 1 (50-60%): ${zone1Min}-${zone1Max} bpm - Active Recovery
+Zone 2 (60-70%): ${zone2Min}-${zone2Max} bpm - Base Endurance
+Zone 3 (70-80%): ${zone3Min}-${zone3Max} bpm - Aerobic Base
+Zone 4 (80-90%): ${zone4Min}-${zone4Max} bpm - Lactate Threshold
+Zone 5 (90-100%): ${zone5Min}-${zone5Max} bpm - VO2 Max`;}});
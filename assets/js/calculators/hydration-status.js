@@ -0,0 +1,13 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("hydration-status",{title:'Hydration Status Calculator',icon:'fas fa-tint-slash',inputs:[{id:'urineColor',label:'Urine Color (1-8 scale)',type:'select',options:['1 - Pale Yellow','2 - Light Yellow','3 - Yellow','4 - Dark Yellow','5 - Amber','6 - Light Orange','7 - Orange','8 - Dark Orange']},{id:'frequency',label:'Urination Frequency (times/day)',type:'number',placeholder:'Enter frequency'},{id:'thirst',label:'Thirst Level',type:'select',options:['None','Mild','Moderate','Strong']},{id:'fatigue',label:'Fatigue Level',type:'select',options:['None','Mild','Moderate','Severe']}],calculate:function(inputs){const urineColor=parseInt(inputs.urineColor.charAt(0))||1;const frequency=parseInt(inputs.frequency)||0;let hydrationScore=0;let status='';if(urineColor<=2)hydrationScore+=3;else if(urineColor<=4)hydrationScore+=2;else if(urineColor<=6)hydrationScore+=1;else hydrationScore+=0;if(frequency>=6&&frequency<=8)hydrationScore+=2;else if(frequency>=4&&frequency<=10)hydrationScore+=1;else hydrationScore+=0;if(inputs.thirst==='None')hydrationScore+=1;if(inputs.fatigue==='None')hydrationScore+=1;if(hydrationScore>=6)status='Well Hydrated';else if(hydrationScore>=4)status='Mildly Dehydrated';else if(hydrationScore>=2)status='Moderately Dehydrated';else status='Severely Dehydrated';let recommendations='';if(hydrationScore<6){recommendations=`
+Recommendations:
+- Increase water intake immediately
+- Drink small amounts frequently
+- Monitor urine color improvement
+- Seek medical attention if severe symptoms persist`;}
+return`Hydration Status: ${status}
+Score: ${hydrationScore}/7
+Urine Color: Level ${urineColor}
+Frequency: ${frequency} times/day
+Thirst: ${inputs.thirst}
+Fatigue: ${inputs.fatigue}${recommendations}`;}});
@@ -0,0 +1,15 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("hydraulic-pressure",{title:'Hydraulic Pressure Calculator',icon:'fas fa-tint',inputs:[{id:'force1',label:'Input Force (N)',type:'number',placeholder:'Enter input force'},{id:'area1',label:'Input Piston Area (cm²)',type:'number',placeholder:'Enter input piston area'},{id:'area2',label:'Output Piston Area (cm²)',type:'number',placeholder:'Enter output piston area'},{id:'fluidDensity',label:'Fluid Density (kg/m³)',type:'number',placeholder:'Enter fluid density',value:'850'}],calculate:function(inputs){const force1=parseFloat(inputs.force1)||0;const area1=parseFloat(inputs.area1)||0;const area2=parseFloat(inputs.area2)||0;const fluidDensity=parseFloat(inputs.fluidDensity)||850;const area1M2=area1/10000;const area2M2=area2/10000;const pressure=force1/area1M2;const force2=pressure*area2M2;const mechanicalAdvantage=area2/area1;const pressureBar=pressure/100000;const pressurePSI=pressure*0.000145038;const distanceRatio=area1/area2;return`Hydraulic System Analysis:
+Input Force: ${force1} N
+Input Piston Area: ${area1} cm² (${area1M2.toFixed(6)} m²)
+Output Piston Area: ${area2} cm² (${area2M2.toFixed(6)} m²)
+
+System Pressure: ${pressure.toFixed(0)} Pa
+System Pressure: ${pressureBar.toFixed(2)} bar
+System Pressure: ${pressurePSI.toFixed(1)} PSI
+
+Output Force: ${force2.toFixed(1)} N
+Mechanical Advantage: ${mechanicalAdvantage.toFixed(2)}:1
+Distance Ratio: ${distanceRatio.toFixed(2)}:1
+
+Fluid Density: ${fluidDensity} kg/m³`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("ideal-weight",{title:'Ideal Weight Calculator',icon:'fas fa-balance-scale',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'},{id:'frame',label:'Body Frame',type:'select',options:['Small','Medium','Large']}],calculate:function(inputs){const height=parseFloat(inputs.height)||0;const heightInches=height/2.54;let idealWeight;if(inputs.gender==='Male'){idealWeight=48+2.7*(heightInches-60);}else{idealWeight=45.5+2.2*(heightInches-60);}
+const frameAdjustment={'Small':0.9,'Medium':1.0,'Large':1.1};idealWeight*=frameAdjustment[inputs.frame];const minWeight=idealWeight*0.9;const maxWeight=idealWeight*1.1;const heightM=height/100;const bmiMinWeight=18.5*heightM*heightM;const bmiMaxWeight=24.9*heightM*heightM;return`Ideal Weight (Hamwi): ${idealWeight.toFixed(1)} kg
+Healthy Range: ${minWeight.toFixed(1)} - ${maxWeight.toFixed(1)} kg
+BMI Range (18.5-24.9): ${bmiMinWeight.toFixed(1)} - ${bmiMaxWeight.toFixed(1)} kg
+Frame Size: ${inputs.frame}`;}});
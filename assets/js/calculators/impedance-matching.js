@@ -0,0 +1,15 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("impedance-matching",{title:'Impedance Matching Calculator',icon:'fas fa-adjust',inputs:[{id:'sourceImpedance',label:'Source Impedance (Ω)',type:'number',placeholder:'Enter source impedance',value:'50'},{id:'loadImpedance',label:'Load Impedance (Ω)',type:'number',placeholder:'Enter load impedance'},{id:'frequency',label:'Frequency (MHz)',type:'number',placeholder:'Enter frequency'}],calculate:function(inputs){const rs=parseFloat(inputs.sourceImpedance)||50;const rl=parseFloat(inputs.loadImpedance)||0;const frequency=parseFloat(inputs.frequency)||0;const reflectionCoeff=Math.abs((rl-rs)/(rl+rs));const vswr=(1+reflectionCoeff)/(1-reflectionCoeff);const returnLossDB=-20*Math.log10(reflectionCoeff);const matchingRatio=rl/rs;const q=Math.sqrt(Math.abs(matchingRatio-1));const xl=q*Math.min(rs,rl);const xc=Math.max(rs,rl)/q;let inductanceUH=0;let capacitancePF=0;if(frequency>0){const omega=2*Math.PI*frequency*1000000;inductanceUH=(xl/omega)*1000000;capacitancePF=1/(omega*xc)*1000000000000;}
+return`Impedance Matching Analysis:
+Source Impedance: ${rs} Ω
+Load Impedance: ${rl} Ω
+VSWR: ${vswr.toFixed(2)}:1
+Return Loss: ${returnLossDB.toFixed(1)} dB
+Reflection Coefficient: ${reflectionCoeff.toFixed(4)}
+
+L-Network Matching:
+Required XL: ${xl.toFixed(1)} Ω
+Required XC: ${xc.toFixed(1)} Ω
+${frequency > 0 ? `\nAt ${frequency} MHz:
+Inductance: ${inductanceUH.toFixed(1)} µH
+Capacitance: ${capacitancePF.toFixed(1)} pF` : ''}`;}});
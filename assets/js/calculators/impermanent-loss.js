@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("impermanent-loss",{title:'Impermanent Loss Calculator',icon:'fas fa-percentage',inputs:[{id:'token1Change',label:'Token 1 Price Change (%)',type:'number',placeholder:'Enter price change',step:'0.1'},{id:'token2Change',label:'Token 2 Price Change (%)',type:'number',placeholder:'Enter price change',step:'0.1'},{id:'poolShare',label:'Pool Share (%)',type:'number',placeholder:'Enter your pool share',step:'0.01'}],calculate:function(inputs){const token1Change=parseFloat(inputs.token1Change)||0;const token2Change=parseFloat(inputs.token2Change)||0;const poolShare=parseFloat(inputs.poolShare)||0;const r1=1+(token1Change/100);const r2=1+(token2Change/100);const sqrt=Math.sqrt(r1*r2);const IL=((2*sqrt)/(r1+r2))-1;return`Impermanent Loss: ${(IL * 100).toFixed(2)}%
+Pool Value Change: ${((sqrt - 1) * 100).toFixed(2)}%
+Your Pool Share Value: ${((sqrt - 1) * poolShare).toFixed(2)}%`;}});
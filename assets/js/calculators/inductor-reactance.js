@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("inductor-reactance",{title:'Inductor Reactance Calculator',icon:'fas fa-coil',inputs:[{id:'inductance',label:'Inductance (mH)',type:'number',placeholder:'Enter inductance'},{id:'frequency',label:'Frequency (Hz)',type:'number',placeholder:'Enter frequency'}],calculate:function(inputs){const inductance=parseFloat(inputs.inductance)||0;const frequency=parseFloat(inputs.frequency)||0;const inductanceHenries=inductance/1000;const reactance=2*Math.PI*frequency*inductanceHenries;const impedance=reactance;return`Inductive Reactance: ${reactance.toFixed(2)} Ω
+Impedance: ${impedance.toFixed(2)} Ω
+Angular Frequency: ${(2 * Math.PI * frequency).toFixed(2)} rad/s
+Inductance: ${inductance} mH`;}});
@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("investment",{title:'Investment Calculator',icon:'fas fa-chart-line',inputs:[{id:'initial',label:'Initial Investment ($)',type:'number',placeholder:'Enter initial investment'},{id:'monthly',label:'Monthly Contribution ($)',type:'number',placeholder:'Enter monthly contribution'},{id:'rate',label:'Annual Return Rate (%)',type:'number',placeholder:'Enter return rate',step:'0.1'},{id:'years',label:'Investment Period (years)',type:'number',placeholder:'Enter years'}],calculate:function(inputs){const initial=parseFloat(inputs.initial)||0;const monthly=parseFloat(inputs.monthly)||0;const rate=parseFloat(inputs.rate)/100/12;const months=parseInt(inputs.years)*12;const periods=months>0?months:0;const growth=Math.pow(1+rate,periods);const balance=rate===0
+?initial+monthly*periods
+:initial*growth+monthly*(1+rate)*(growth-1)/rate;const totalContributions=initial+(monthly*months);const earnings=balance-totalContributions;return`Final Balance: $${balance.toFixed(2)}\nTotal Contributions: $${totalContributions.toFixed(2)}\nTotal Earnings: $${earnings.toFixed(2)}`;}});
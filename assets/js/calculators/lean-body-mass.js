@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("lean-body-mass",{title:'Lean Body Mass Calculator',icon:'fas fa-dumbbell',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;let lbm;if(inputs.gender==='Male'){lbm=0.407*weight+0.267*height-19.2;}else{lbm=0.252*weight+0.473*height-48.3;}
+return`Lean Body Mass: ${lbm.toFixed(1)} kg
+Fat Mass: ${(weight - lbm).toFixed(1)} kg
+LBM Percentage: ${((lbm / weight) * 100).toFixed(1)}%`;}});
@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("led-resistor",{title:'LED Resistor Calculator',icon:'fas fa-lightbulb',inputs:[{id:'supplyVoltage',label:'Supply Voltage (V)',type:'number',placeholder:'Enter supply voltage'},{id:'ledVoltage',label:'LED Forward Voltage (V)',type:'number',placeholder:'Enter LED voltage',value:'2.1'},{id:'ledCurrent',label:'LED Current (mA)',type:'number',placeholder:'Enter LED current',value:'20'}],calculate:function(inputs){const supplyVoltage=parseFloat(inputs.supplyVoltage)||0;const ledVoltage=parseFloat(inputs.ledVoltage)||2.1;const ledCurrentMA=parseFloat(inputs.ledCurrent)||20;const ledCurrentA=ledCurrentMA/1000;const voltageDropAcrossResistor=supplyVoltage-ledVoltage;const resistance=voltageDropAcrossResistor/ledCurrentA;const powerDissipation=voltageDropAcrossResistor*ledCurrentA;const standardValues=[100,120,150,180,220,270,330,390,470,560,680,820,1000,1200,1500,1800,2200,2700,3300,3900,4700,5600,6800,8200,10000];let closestResistor=standardValues.reduce((prev,curr)=>
+Math.abs(curr-resistance)<Math.abs(prev-resistance)?curr:prev);const actualCurrent=voltageDropAcrossResistor/closestResistor*1000;const recommendedWattage=powerDissipation<0.125?'1/8W':powerDissipation<0.25?'1/4W':powerDissipation<0.5?'1/2W':'1W';return`Required Resistance: ${resistance.toFixed(1)} Ω
+Closest Standard Resistor: ${closestResistor} Ω
+Actual LED Current: ${actualCurrent.toFixed(1)} mA
+Power Dissipation: ${(powerDissipation * 1000).toFixed(1)} mW
+Recommended Wattage: ${recommendedWattage}
+Voltage Drop Across Resistor: ${voltageDropAcrossResistor.toFixed(2)} V`;}});
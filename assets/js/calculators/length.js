@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("length",{title:'Length Converter',icon:'fas fa-ruler-horizontal',inputs:[{id:'value',label:'Value',type:'number',placeholder:'Enter value'},{id:'fromUnit',label:'From Unit',type:'select',options:['mm','cm','m','km','in','ft','yd','mi']},{id:'toUnit',label:'To Unit',type:'select',options:['mm','cm','m','km','in','ft','yd','mi']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const meters=convertUnit('length',value,fromUnit,'m');const result=convertUnit('length',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Meters: ${meters.toFixed(6)} m
+Conversion Factor: ${unitFactor('length', fromUnit, toUnit).toFixed(8)}`;}});
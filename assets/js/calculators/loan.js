@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("loan",{title:'Loan Calculator',icon:'fas fa-money-check-alt',inputs:[{id:'principal',label:'Loan Amount ($)',type:'number',placeholder:'Enter loan amount'},{id:'rate',label:'Annual Interest Rate (%)',type:'number',placeholder:'Enter interest rate',step:'0.01'},{id:'years',label:'Loan Term (years)',type:'number',placeholder:'Enter loan term'}],calculate:function(inputs){const principal=parseFloat(inputs.principal)||0;const rate=parseFloat(inputs.rate)/100/12;const payments=parseInt(inputs.years)*12;if(rate===0){return`Monthly Payment: $${(principal / payments).toFixed(2)}`;}
+const monthlyPayment=principal*(rate*Math.pow(1+rate,payments))/(Math.pow(1+rate,payments)-1);const totalPayment=monthlyPayment*payments;const totalInterest=totalPayment-principal;return`Monthly Payment: $${monthlyPayment.toFixed(2)}\nTotal Interest: $${totalInterest.toFixed(2)}\nTotal Amount: $${totalPayment.toFixed(2)}`;}});
@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("logarithm-calculator",{title:'Advanced Logarithm Calculator',icon:'fas fa-chart-line',inputs:[{id:'operation',label:'Operation',type:'select',options:['Common Log (log₁₀)','Natural Log (ln)','Custom Base Log','Antilog (10^x)','Exponential (e^x)']},{id:'value',label:'Value',type:'number',placeholder:'Enter value',step:'0.000001'},{id:'base',label:'Base (for custom)',type:'number',placeholder:'Enter base',step:'0.01'}],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const base=parseFloat(inputs.base)||10;switch(inputs.operation){case'Common Log (log₁₀)':
+if(value<=0)return'Error: Logarithm undefined for non-positive numbers';const log10Result=Math.log10(value);return`log₁₀(${value}) = ${log10Result.toFixed(6)}\nVerification: 10^${log10Result.toFixed(6)} = ${Math.pow(10, log10Result).toFixed(6)}`;case'Natural Log (ln)':
+if(value<=0)return'Error: Natural logarithm undefined for non-positive numbers';const lnResult=Math.log(value);return`ln(${value}) = ${lnResult.toFixed(6)}\nVerification: e^${lnResult.toFixed(6)} = ${Math.exp(lnResult).toFixed(6)}`;case'Custom Base Log':
+if(value<=0)return'Error: Logarithm undefined for non-positive numbers';if(base<=0||base===1)return'Error: Base must be positive and not equal to 1';const customLogResult=Math.log(value)/Math.log(base);return`log₍${base}₎(${value}) = ${customLogResult.toFixed(6)}\nVerification: ${base}^${customLogResult.toFixed(6)} = ${Math.pow(base, customLogResult).toFixed(6)}`;case'Antilog (10^x)':
+const antilogResult=Math.pow(10,value);return`Antilog (10^${value}) = ${antilogResult.toFixed(6)}\nVerification: log₁₀(${antilogResult.toFixed(6)}) = ${Math.log10(antilogResult).toFixed(6)}`;case'Exponential (e^x)':
+const expResult=Math.exp(value);return`e^${value} = ${expResult.toFixed(6)}\nVerification: ln(${expResult.toFixed(6)}) = ${Math.log(expResult).toFixed(6)}`;default:
+return'Please select an operation';}}});
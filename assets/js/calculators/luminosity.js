@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("luminosity",{title:'Luminosity Converter',icon:'fas fa-lightbulb',inputs:[{id:'value',label:'Luminosity',type:'number',placeholder:'Enter luminosity'},{id:'fromUnit',label:'From Unit',type:'select',options:['lm','cd','lx','fc']},{id:'toUnit',label:'To Unit',type:'select',options:['lm','cd','lx','fc']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const result=convertUnit('luminosity',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Note: Luminosity conversions depend on geometry and context
+Lumens (lm): Luminous flux
+Candela (cd): Luminous intensity
+Lux (lx): Illuminance
+Foot-candles (fc): Illuminance`;}});
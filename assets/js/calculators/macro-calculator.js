@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("macro-calculator",{title:'Macro Calculator',icon:'fas fa-chart-pie',inputs:[{id:'calories',label:'Daily Calories',type:'number',placeholder:'Enter daily calorie target'},{id:'goal',label:'Goal',type:'select',options:['Weight Loss','Maintenance','Muscle Gain','Athletic Performance']},{id:'activity',label:'Activity Level',type:'select',options:['Sedentary','Light','Moderate','High','Very High']}],calculate:function(inputs){const calories=parseFloat(inputs.calories)||0;let proteinPercent,carbPercent,fatPercent;switch(inputs.goal){case'Weight Loss':
+proteinPercent=35;carbPercent=30;fatPercent=35;break;case'Muscle Gain':
+proteinPercent=30;carbPercent=45;fatPercent=25;break;case'Athletic Performance':
+proteinPercent=25;carbPercent=50;fatPercent=25;break;default:
+proteinPercent=25;carbPercent=45;fatPercent=30;}
+const proteinCalories=calories*(proteinPercent/100);const carbCalories=calories*(carbPercent/100);const fatCalories=calories*(fatPercent/100);const proteinGrams=proteinCalories/4;const carbGrams=carbCalories/4;const fatGrams=fatCalories/9;return`Daily Macronutrients for ${inputs.goal}:
+Protein: ${proteinGrams.toFixed(0)}g (${proteinPercent}%) - ${proteinCalories} cal
+Carbs: ${carbGrams.toFixed(0)}g (${carbPercent}%) - ${carbCalories} cal
+Fat: ${fatGrams.toFixed(0)}g (${fatPercent}%) - ${fatCalories} cal
+Total Calories: ${calories}`;}});
@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("macros-converter",{title:'Macros to Calories Converter',icon:'fas fa-calculator',inputs:[{id:'protein',label:'Protein (g)',type:'number',placeholder:'Enter protein grams'},{id:'carbs',label:'Carbohydrates (g)',type:'number',placeholder:'Enter carb grams'},{id:'fat',label:'Fat (g)',type:'number',placeholder:'Enter fat grams'},{id:'fiber',label:'Fiber (g)',type:'number',placeholder:'Enter fiber grams'}],calculate:function(inputs){const protein=parseFloat(inputs.protein)||0;const carbs=parseFloat(inputs.carbs)||0;const fat=parseFloat(inputs.fat)||0;const fiber=parseFloat(inputs.fiber)||0;const proteinCal=protein*4;const carbsCal=carbs*4;const fatCal=fat*9;const fiberCal=fiber*2;const totalCal=proteinCal+carbsCal+fatCal;const netCarbs=Math.max(0,carbs-fiber);const proteinPercent=(proteinCal/totalCal*100)||0;const carbsPercent=(carbsCal/totalCal*100)||0;const fatPercent=(fatCal/totalCal*100)||0;return`Total Calories: ${Math.round(totalCal)}
+
+Breakdown by Macro:
+Protein: ${proteinCal} cal (${proteinPercent.toFixed(1)}%)
+Carbs: ${carbsCal} cal (${carbsPercent.toFixed(1)}%)
+Fat: ${fatCal} cal (${fatPercent.toFixed(1)}%)
+
+Additional Info:
+Net Carbs: ${netCarbs}g
+Fiber: ${fiber}g (${Math.round(fiberCal)} cal)`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("magnetic-field",{title:'Magnetic Field Converter',icon:'fas fa-magnet',inputs:[{id:'value',label:'Magnetic Field',type:'number',placeholder:'Enter magnetic field'},{id:'fromUnit',label:'From Unit',type:'select',options:['T','mT','μT','G','mG','Oe']},{id:'toUnit',label:'To Unit',type:'select',options:['T','mT','μT','G','mG','Oe']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const tesla=convertUnit('magnetic-field',value,fromUnit,'T');const result=convertUnit('magnetic-field',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Tesla: ${tesla.toFixed(9)} T
+Gauss: ${(tesla/0.0001).toFixed(6)} G
+Oersted: ${(tesla/0.0000796).toFixed(6)} Oe
+Note: Earth's magnetic field ≈ 50 μT`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("margin-trading",{title:'Margin Trading Calculator',icon:'fas fa-chart-bar',inputs:[{id:'collateral',label:'Collateral Amount ($)',type:'number',placeholder:'Enter collateral amount'},{id:'leverage',label:'Leverage (x)',type:'number',placeholder:'Enter leverage',step:'0.1'},{id:'entryPrice',label:'Entry Price ($)',type:'number',placeholder:'Enter entry price',step:'0.000001'},{id:'exitPrice',label:'Exit Price ($)',type:'number',placeholder:'Enter exit price',step:'0.000001'}],calculate:function(inputs){const collateral=parseFloat(inputs.collateral)||0;const leverage=parseFloat(inputs.leverage)||1;const entryPrice=parseFloat(inputs.entryPrice)||0;const exitPrice=parseFloat(inputs.exitPrice)||0;const positionSize=collateral*leverage;const priceDiff=exitPrice-entryPrice;const percentageChange=(priceDiff/entryPrice)*100;const pnl=positionSize*(percentageChange/100);const roi=(pnl/collateral)*100;return`Position Size: $${positionSize.toFixed(2)}
+Price Change: ${percentageChange.toFixed(2)}%
+PnL: $${pnl.toFixed(2)}
+ROI: ${roi.toFixed(2)}%
+Liquidation Price: $${(entryPrice * (1 - (1/leverage))).toFixed(6)}`;}});
@@ -0,0 +1,11 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("matrix-calculator",{title:'Matrix Calculator',icon:'fas fa-th',inputs:[{id:'operation',label:'Operation',type:'select',options:['Determinant (2x2)','Determinant (3x3)','Determinant (NxN)','Matrix Addition','Matrix Multiplication','Inverse','Solve Ax = b','Rank','Transpose']},{id:'matrix',label:'Matrix Elements (comma separated)',type:'text',placeholder:'For 2x2: a,b,c,d (row by row), or rows separated by ; e.g. 1,2,3;4,5,6'},{id:'matrixB',label:'Matrix B or vector b (if needed)',type:'text',placeholder:'Second matrix for addition/multiplication, or b for Ax = b',optional:true}],requires:['matrix'],calculate:function(inputs){const elements=inputs.matrix.split(',').map(x=>parseFloat(x.trim()));if(inputs.operation==='Determinant (2x2)'){if(elements.length!==4)return'Error: Please enter exactly 4 elements for 2x2 matrix';const[a,b,c,d]=elements;const det=a*d-b*c;return`Matrix:\n[${a} ${b}]\n[${c} ${d}]\n\nDeterminant: ${det}`;}
+if(inputs.operation==='Determinant (3x3)'){if(elements.length!==9)return'Error: Please enter exactly 9 elements for 3x3 matrix';const[a,b,c,d,e,f,g,h,i]=elements;const det=a*(e*i-f*h)-b*(d*i-f*g)+c*(d*h-e*g);return`Matrix:\n[${a} ${b} ${c}]\n[${d} ${e} ${f}]\n[${g} ${h} ${i}]\n\nDeterminant: ${det}`;}
+try{const a=parseMatrix(inputs.matrix);const size=`${a.rows}×${a.cols}`;switch(inputs.operation){case'Determinant (NxN)':
+return`Matrix (${size}):\n${formatMatrix(a)}\n\nDeterminant: ${parseFloat(determinant(a).toPrecision(12))}`;case'Matrix Addition':
+return`A + B (${size}):\n${formatMatrix(addMatrices(a, parseMatrix(inputs.matrixB)))}`;case'Matrix Multiplication':{const product=multiplyMatrices(a,parseMatrix(inputs.matrixB,a.cols));return`A × B (${product.rows}×${product.cols}):\n${formatMatrix(product)}`;}
+case'Inverse':
+return`Inverse (${size}):\n${formatMatrix(invertMatrix(a))}`;case'Solve Ax = b':{const x=solveMatrix(a,parseMatrix(inputs.matrixB,a.rows));return`Solution x (${x.rows}×${x.cols}):\n${formatMatrix(x, 20)}`;}
+case'Rank':
+return`Matrix (${size}):\n${formatMatrix(a)}\n\nRank: ${matrixRank(a)}`;case'Transpose':{const t=transposeMatrix(a);return`Transpose (${t.rows}×${t.cols}):\n${formatMatrix(t)}`;}}}catch(e){return`Error: ${e.message}`;}
+return'Please select an operation and enter matrix elements';}});
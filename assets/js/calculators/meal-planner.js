@@ -0,0 +1,20 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("meal-planner",{title:'Meal Planner Calculator',icon:'fas fa-utensils',inputs:[{id:'calories',label:'Daily Calories',type:'number',placeholder:'Enter daily calorie target'},{id:'meals',label:'Number of Meals',type:'select',options:['3','4','5','6']},{id:'goal',label:'Goal',type:'select',options:['Weight Loss','Maintenance','Muscle Gain']},{id:'diet',label:'Diet Type',type:'select',options:['Balanced','High Protein','Low Carb','Mediterranean']}],calculate:function(inputs){const calories=parseFloat(inputs.calories)||2000;const meals=parseInt(inputs.meals)||3;let proteinRatio,carbRatio,fatRatio;switch(inputs.diet){case'High Protein':
+proteinRatio=0.40;carbRatio=0.30;fatRatio=0.30;break;case'Low Carb':
+proteinRatio=0.35;carbRatio=0.25;fatRatio=0.40;break;case'Mediterranean':
+proteinRatio=0.25;carbRatio=0.45;fatRatio=0.30;break;default:
+proteinRatio=0.30;carbRatio=0.45;fatRatio=0.25;}
+if(inputs.goal==='Weight Loss'){proteinRatio+=0.05;carbRatio-=0.05;}else if(inputs.goal==='Muscle Gain'){proteinRatio+=0.05;fatRatio-=0.05;}
+const caloriesPerMeal=calories/meals;const proteinCal=calories*proteinRatio;const carbCal=calories*carbRatio;const fatCal=calories*fatRatio;const proteinGrams=proteinCal/4;const carbGrams=carbCal/4;const fatGrams=fatCal/9;return`Daily Plan (${calories} calories):
+Meals per Day: ${meals}
+Calories per Meal: ${Math.round(caloriesPerMeal)}
+
+Daily Macros:
+Protein: ${Math.round(proteinGrams)}g (${Math.round(proteinCal)} cal)
+Carbs: ${Math.round(carbGrams)}g (${Math.round(carbCal)} cal)
+Fat: ${Math.round(fatGrams)}g (${Math.round(fatCal)} cal)
+
+Per Meal:
+Protein: ${Math.round(proteinGrams/meals)}g
+Carbs: ${Math.round(carbGrams/meals)}g
+Fat: ${Math.round(fatGrams/meals)}g`;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("molarity",{title:'Molarity Calculator',icon:'fas fa-flask',inputs:[{id:'moles',label:'Number of Moles',type:'number',placeholder:'Enter moles'},{id:'volume',label:'Volume (L)',type:'number',placeholder:'Enter volume'}],calculate:function(inputs){const moles=parseFloat(inputs.moles)||0;const volume=parseFloat(inputs.volume)||1;const molarity=moles/volume;return`Molarity: ${molarity.toFixed(4)} M\nMoles: ${moles.toFixed(4)} mol\nVolume: ${volume.toFixed(2)} L`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("molecular-weight",{title:'Molecular Weight Calculator',icon:'fas fa-atom',inputs:[{id:'formula',label:'Chemical Formula',type:'text',placeholder:'e.g., H2O, NaCl'}],calculate:function(inputs){const weights={'H':1.008,'He':4.003,'Li':6.941,'Be':9.012,'B':10.811,'C':12.011,'N':14.007,'O':15.999,'F':18.998,'Ne':20.180,'Na':22.990,'Mg':24.305,'Al':26.982,'Si':28.086,'P':30.974,'S':32.065,'Cl':35.453,'K':39.098,'Ca':40.078,'Fe':55.845,'Cu':63.546,'Zn':65.380,'Ag':107.868,'Au':196.967};const formula=inputs.formula.replace(/\s/g,'');let totalWeight=0;let currentElement='';let currentNumber='';for(let i=0;i<formula.length;i++){if(/[A-Z]/.test(formula[i])){if(currentElement){const num=currentNumber||'1';totalWeight+=weights[currentElement]*parseInt(num);currentNumber='';}
+currentElement=formula[i];}
+else if(/[a-z]/.test(formula[i])){currentElement+=formula[i];}
+else if(/[0-9]/.test(formula[i])){currentNumber+=formula[i];}}
+if(currentElement){const num=currentNumber||'1';totalWeight+=weights[currentElement]*parseInt(num);}
+return`Molecular Weight: ${totalWeight.toFixed(3)} g/mol\nFormula: ${formula}\nElements: ${Object.keys(weights).join(', ')}`;}});
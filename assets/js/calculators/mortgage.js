@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("mortgage",{title:'Mortgage Calculator',icon:'fas fa-home',inputs:[{id:'homePrice',label:'Home Price ($)',type:'number',placeholder:'Enter home price'},{id:'downPayment',label:'Down Payment ($)',type:'number',placeholder:'Enter down payment'},{id:'rate',label:'Interest Rate (%)',type:'number',placeholder:'Enter interest rate',step:'0.01'},{id:'years',label:'Loan Term (years)',type:'number',placeholder:'Enter loan term'}],calculate:function(inputs){const homePrice=parseFloat(inputs.homePrice)||0;const downPayment=parseFloat(inputs.downPayment)||0;const principal=homePrice-downPayment;const rate=parseFloat(inputs.rate)/100/12;const payments=parseInt(inputs.years)*12;if(rate===0){return`Monthly Payment: $${(principal / payments).toFixed(2)}`;}
+const monthlyPayment=principal*(rate*Math.pow(1+rate,payments))/(Math.pow(1+rate,payments)-1);const downPaymentPercent=(downPayment/homePrice*100).toFixed(1);return`Monthly Payment: $${monthlyPayment.toFixed(2)}\nLoan Amount: $${principal.toFixed(2)}\nDown Payment: ${downPaymentPercent}%`;}});
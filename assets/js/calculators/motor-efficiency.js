@@ -0,0 +1,16 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("motor-efficiency",{title:'Motor Efficiency Calculator',icon:'fas fa-fan',inputs:[{id:'inputPower',label:'Input Power (W)',type:'number',placeholder:'Enter input power'},{id:'outputPower',label:'Output Power (W)',type:'number',placeholder:'Enter output power'},{id:'voltage',label:'Voltage (V)',type:'number',placeholder:'Enter voltage (optional)'},{id:'current',label:'Current (A)',type:'number',placeholder:'Enter current (optional)'},{id:'powerFactor',label:'Power Factor',type:'number',placeholder:'Enter power factor (optional)',value:'0.9'}],calculate:function(inputs){const inputPower=parseFloat(inputs.inputPower)||0;const outputPower=parseFloat(inputs.outputPower)||0;const voltage=parseFloat(inputs.voltage)||0;const current=parseFloat(inputs.current)||0;const powerFactor=parseFloat(inputs.powerFactor)||0.9;let efficiency=0;let powerLoss=0;let result='Motor Efficiency Analysis:\n';if(inputPower>0&&outputPower>0){efficiency=(outputPower/inputPower)*100;powerLoss=inputPower-outputPower;result+=`Input Power: ${inputPower} W
+Output Power: ${outputPower} W
+Efficiency: ${efficiency.toFixed(2)}%
+Power Loss: ${powerLoss.toFixed(1)} W
+Heat Dissipated: ${powerLoss.toFixed(1)} W`;}
+if(voltage>0&&current>0){const apparentPower=voltage*current;const calculatedInputPower=apparentPower*powerFactor;result+=`\n\nElectrical Analysis:
+Voltage: ${voltage} V
+Current: ${current} A
+Power Factor: ${powerFactor}
+Apparent Power: ${apparentPower.toFixed(1)} VA
+Real Power: ${calculatedInputPower.toFixed(1)} W`;if(outputPower>0){const calculatedEfficiency=(outputPower/calculatedInputPower)*100;result+=`\nCalculated Efficiency: ${calculatedEfficiency.toFixed(2)}%`;}}
+if(inputPower>0){const dailyConsumption=(inputPower*8)/1000;const monthlyConsumption=dailyConsumption*30;result+=`\n\nEnergy Consumption:
+Daily (8 hrs): ${dailyConsumption.toFixed(2)} kWh
+Monthly: ${monthlyConsumption.toFixed(1)} kWh`;}
+return result;}});
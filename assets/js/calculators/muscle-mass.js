@@ -0,0 +1,13 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("muscle-mass",{title:'Muscle Mass Calculator',icon:'fas fa-dumbbell',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'},{id:'wrist',label:'Wrist Circumference (cm)',type:'number',placeholder:'Enter wrist measurement'},{id:'activity',label:'Activity Level',type:'select',options:['Sedentary','Moderate','Active','Very Active']}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;const wrist=parseFloat(inputs.wrist)||0;const frameIndex=wrist/(height/100);let frame;if(inputs.gender==='Male'){if(frameIndex<0.1)frame='Small';else if(frameIndex<0.11)frame='Medium';else frame='Large';}else{if(frameIndex<0.09)frame='Small';else if(frameIndex<0.1)frame='Medium';else frame='Large';}
+let muscleMass;if(inputs.gender==='Male'){muscleMass=(height*0.325)+(weight*0.482)-(wrist*0.15);}else{muscleMass=(height*0.294)+(weight*0.434)-(wrist*0.14);}
+const activityMultiplier={'Sedentary':0.9,'Moderate':1.0,'Active':1.1,'Very Active':1.2};muscleMass*=activityMultiplier[inputs.activity];const muscleMassPercent=(muscleMass/weight)*100;return`Estimated Muscle Mass: ${muscleMass.toFixed(1)} kg
+Muscle Mass Percentage: ${muscleMassPercent.toFixed(1)}%
+Frame Size: ${frame}
+Activity Level: ${inputs.activity}
+
+Typical Ranges:
+Males: 35-45% of body weight
+Females: 30-40% of body weight
+
+Note: This is an estimate based on anthropometric measurements.`;}});
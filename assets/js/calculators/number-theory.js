@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("number-theory",{title:'Number Theory Calculator',icon:'fas fa-hashtag',inputs:[{id:'operation',label:'Operation',type:'select',options:['GCD (Greatest Common Divisor)','LCM (Least Common Multiple)','Prime Check','Prime Factorization','Fibonacci Sequence']},{id:'num1',label:'Number 1',type:'number',placeholder:'Enter first number'},{id:'num2',label:'Number 2 (if needed)',type:'number',placeholder:'Enter second number'}],requires:['primes'],calculate:function(inputs){const big1=parseInteger(inputs.num1);const big2=parseInteger(inputs.num2);const num1=Number(big1);switch(inputs.operation){case'GCD (Greatest Common Divisor)':
+if(big2===0n)return'Error: Please enter two numbers';return`GCD(${big1}, ${big2}) = ${gcd(big1, big2)}`;case'LCM (Least Common Multiple)':{if(big2===0n)return'Error: Please enter two numbers';const a=big1<0n?-big1:big1;const b=big2<0n?-big2:big2;return`LCM(${big1}, ${big2}) = ${a / gcd(a, b) * b}`;}
+case'Prime Check':
+if(big1<0n)return'Error: Please enter a positive number';if(big1>=MILLER_RABIN_LIMIT){return`${big1} is ${isPrime(big1) ? 'a probable prime' : 'not prime'}`;}
+return`${big1} is ${isPrime(big1) ? 'prime' : 'not prime'}`;case'Prime Factorization':
+if(big1<2n)return'Error: Please enter a number ≥ 2';if(big1>=MILLER_RABIN_LIMIT)return'Error: Please enter a number below 3.3 × 10^24';return`Prime factorization of ${big1}: ${factorize(big1).join(' × ')}`;case'Fibonacci Sequence':
+if(num1<1||num1>50)return'Error: Please enter a number between 1 and 50';const fib=[0,1];for(let i=2;i<num1;i++){fib[i]=fib[i-1]+fib[i-2];}
+return`First ${num1} Fibonacci numbers:\n${fib.slice(0, num1).join(', ')}`;default:
+return'Please select an operation';}}});
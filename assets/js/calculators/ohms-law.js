@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("ohms-law",{title:'Ohm\'s Law Calculator',icon:'fas fa-bolt',inputs:[{id:'voltage',label:'Voltage (V)',type:'number',placeholder:'Enter voltage'},{id:'current',label:'Current (A)',type:'number',placeholder:'Enter current'},{id:'resistance',label:'Resistance (Ω)',type:'number',placeholder:'Enter resistance'}],calculate:function(inputs){const v=parseFloat(inputs.voltage);const i=parseFloat(inputs.current);const r=parseFloat(inputs.resistance);let result='';if(!isNaN(v)&&!isNaN(i)){result+=`Resistance: ${(v/i).toFixed(2)} Ω\n`;}
+if(!isNaN(v)&&!isNaN(r)){result+=`Current: ${(v/r).toFixed(2)} A\n`;}
+if(!isNaN(i)&&!isNaN(r)){result+=`Voltage: ${(i*r).toFixed(2)} V\n`;}
+result+=`Power: ${(v*i).toFixed(2)} W`;return result;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("ovulation",{title:'Ovulation Calculator',icon:'fas fa-calendar-check',inputs:[{id:'lastPeriod',label:'Last Period Start Date (YYYY-MM-DD)',type:'date',placeholder:'Select date'},{id:'cycleLength',label:'Cycle Length (days)',type:'number',placeholder:'Enter cycle length (default: 28)',value:'28'}],calculate:function(inputs){const lastPeriodDate=new Date(inputs.lastPeriod);const cycleLength=parseInt(inputs.cycleLength)||28;if(!inputs.lastPeriod){return'Please enter your last period start date';}
+const ovulationDate=new Date(lastPeriodDate);ovulationDate.setDate(ovulationDate.getDate()+cycleLength-14);const fertilityStart=new Date(ovulationDate);fertilityStart.setDate(fertilityStart.getDate()-5);const fertilityEnd=new Date(ovulationDate);fertilityEnd.setDate(fertilityEnd.getDate()+1);const nextPeriod=new Date(lastPeriodDate);nextPeriod.setDate(nextPeriod.getDate()+cycleLength);return`Ovulation Date: ${ovulationDate.toDateString()}
+Fertile Window: ${fertilityStart.toDateString()} - ${fertilityEnd.toDateString()}
+Next Period: ${nextPeriod.toDateString()}
+Cycle Length: ${cycleLength} days`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("parallel-resistance",{title:'Parallel Resistance Calculator',icon:'fas fa-equals',inputs:[{id:'resistors',label:'Resistor Values (Ω, comma-separated)',type:'text',placeholder:'e.g., 100,200,300'}],calculate:function(inputs){const resistorString=inputs.resistors||'';const resistors=resistorString.split(',').map(r=>parseFloat(r.trim())).filter(r=>!isNaN(r)&&r>0);if(resistors.length<2){return'Error: Please enter at least 2 resistor values';}
+const reciprocalSum=resistors.reduce((sum,r)=>sum+(1/r),0);const totalResistance=1/reciprocalSum;const resistorList=resistors.join('Ω, ')+'Ω';return`Parallel Resistance: ${totalResistance.toFixed(3)} Ω
+Number of Resistors: ${resistors.length}
+Resistor Values: ${resistorList}
+Formula: 1/Rtotal = 1/R1 + 1/R2 + ...`;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("percentage",{title:'Percentage Calculator',icon:'fas fa-percent',inputs:[{id:'value',label:'Value',type:'number',placeholder:'Enter value'},{id:'percent',label:'Percentage',type:'number',placeholder:'Enter percentage',step:'0.01'}],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const percent=parseFloat(inputs.percent)||0;const result=(value*percent)/100;return`${percent}% of ${value} is: ${result.toFixed(2)}\nPercentage: ${percent}%\nResult: ${result.toFixed(2)}`;}});
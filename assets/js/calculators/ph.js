@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("ph",{title:'pH Calculator',icon:'fas fa-vial',inputs:[{id:'concentration',label:'H+ Concentration (mol/L)',type:'number',placeholder:'Enter concentration',step:'1e-14'}],calculate:function(inputs){const concentration=parseFloat(inputs.concentration)||1e-7;const pH=-Math.log10(concentration);const pOH=14-pH;return`pH: ${pH.toFixed(2)}\npOH: ${pOH.toFixed(2)}\nH+ Concentration: ${concentration.toExponential(2)} mol/L`;}});
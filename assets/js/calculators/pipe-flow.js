@@ -0,0 +1,20 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("pipe-flow",{title:'Pipe Flow Calculator',icon:'fas fa-arrows-alt-h',inputs:[{id:'diameter',label:'Pipe Diameter (mm)',type:'number',placeholder:'Enter pipe diameter'},{id:'flowRate',label:'Flow Rate (L/min)',type:'number',placeholder:'Enter flow rate'},{id:'fluidViscosity',label:'Fluid Viscosity (cP)',type:'number',placeholder:'Enter viscosity',value:'1'},{id:'fluidDensity',label:'Fluid Density (kg/m³)',type:'number',placeholder:'Enter density',value:'1000'},{id:'pipeLength',label:'Pipe Length (m)',type:'number',placeholder:'Enter pipe length (optional)'}],calculate:function(inputs){const diameter=parseFloat(inputs.diameter)||0;const flowRate=parseFloat(inputs.flowRate)||0;const viscosity=parseFloat(inputs.fluidViscosity)||1;const density=parseFloat(inputs.fluidDensity)||1000;const pipeLength=parseFloat(inputs.pipeLength)||0;const diameterM=diameter/1000;const flowRateM3s=flowRate/60000;const viscosityPas=viscosity/1000;const area=Math.PI*Math.pow(diameterM/2,2);const velocity=flowRateM3s/area;const reynoldsNumber=(density*velocity*diameterM)/viscosityPas;let flowRegime='';if(reynoldsNumber<2300)flowRegime='Laminar';else if(reynoldsNumber<4000)flowRegime='Transitional';else flowRegime='Turbulent';let frictionFactor=0;if(reynoldsNumber<2300){frictionFactor=64/reynoldsNumber;}else{frictionFactor=0.316/Math.pow(reynoldsNumber,0.25);}
+let result=`Pipe Flow Analysis:
+Pipe Diameter: ${diameter} mm (${diameterM.toFixed(4)} m)
+Flow Rate: ${flowRate} L/min (${flowRateM3s.toFixed(6)} m³/s)
+Pipe Area: ${(area * 10000).toFixed(2)} cm² (${area.toFixed(6)} m²)
+Flow Velocity: ${velocity.toFixed(3)} m/s
+
+Fluid Properties:
+Density: ${density} kg/m³
+Viscosity: ${viscosity} cP (${viscosityPas.toFixed(6)} Pa·s)
+
+Flow Characteristics:
+Reynolds Number: ${reynoldsNumber.toFixed(0)}
+Flow Regime: ${flowRegime}
+Friction Factor: ${frictionFactor.toFixed(6)}`;if(pipeLength>0){const pressureDrop=frictionFactor*(pipeLength/diameterM)*(density*velocity*velocity)/2;const pressureDropBar=pressureDrop/100000;const pressureDropPSI=pressureDrop*0.000145038;result+=`\n\nPressure Drop (${pipeLength} m length):
+Pressure Drop: ${pressureDrop.toFixed(0)} Pa
+Pressure Drop: ${pressureDropBar.toFixed(4)} bar
+Pressure Drop: ${pressureDropPSI.toFixed(3)} PSI`;}
+return result;}});
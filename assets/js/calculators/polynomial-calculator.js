@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("polynomial-calculator",{title:'Polynomial Calculator',icon:'fas fa-square-root-alt',inputs:[{id:'degree',label:'Polynomial Degree',type:'select',options:['2','3','4']},{id:'a',label:'Coefficient a (highest degree)',type:'number',placeholder:'Enter coefficient a',step:'0.01'},{id:'b',label:'Coefficient b',type:'number',placeholder:'Enter coefficient b',step:'0.01'},{id:'c',label:'Coefficient c',type:'number',placeholder:'Enter coefficient c',step:'0.01'},{id:'d',label:'Coefficient d (if degree 3+)',type:'number',placeholder:'Enter coefficient d',step:'0.01'},{id:'e',label:'Coefficient e (if degree 4)',type:'number',placeholder:'Enter coefficient e',step:'0.01'},{id:'x',label:'Evaluate at x =',type:'number',placeholder:'Enter x value',step:'0.01'}],calculate:function(inputs){const degree=parseInt(inputs.degree)||2;const a=parseFloat(inputs.a)||0;const b=parseFloat(inputs.b)||0;const c=parseFloat(inputs.c)||0;const d=parseFloat(inputs.d)||0;const e=parseFloat(inputs.e)||0;const x=parseFloat(inputs.x)||0;let polynomial,value,derivative;switch(degree){case 2:
+polynomial=`f(x) = ${a}x² + ${b}x + ${c}`;value=a*x*x+b*x+c;derivative=`f'(x) = ${2*a}x + ${b}`;break;case 3:
+polynomial=`f(x) = ${a}x³ + ${b}x² + ${c}x + ${d}`;value=a*x*x*x+b*x*x+c*x+d;derivative=`f'(x) = ${3*a}x² + ${2*b}x + ${c}`;break;case 4:
+polynomial=`f(x) = ${a}x⁴ + ${b}x³ + ${c}x² + ${d}x + ${e}`;value=a*Math.pow(x,4)+b*Math.pow(x,3)+c*x*x+d*x+e;derivative=`f'(x) = ${4*a}x³ + ${3*b}x² + ${2*c}x + ${d}`;break;}
+return`Polynomial: ${polynomial}\nEvaluation: f(${x}) = ${value.toFixed(6)}\nDerivative: ${derivative}`;}});
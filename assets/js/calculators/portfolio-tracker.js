@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("portfolio-tracker",{title:'Crypto Portfolio Tracker',icon:'fas fa-wallet',inputs:[{id:'btcAmount',label:'BTC Amount',type:'number',placeholder:'Enter BTC amount',step:'0.00000001'},{id:'btcPrice',label:'BTC Price ($)',type:'number',placeholder:'Enter BTC price'},{id:'ethAmount',label:'ETH Amount',type:'number',placeholder:'Enter ETH amount',step:'0.00000001'},{id:'ethPrice',label:'ETH Price ($)',type:'number',placeholder:'Enter ETH price'}],calculate:function(inputs){const btcAmount=parseFloat(inputs.btcAmount)||0;const btcPrice=parseFloat(inputs.btcPrice)||0;const ethAmount=parseFloat(inputs.ethAmount)||0;const ethPrice=parseFloat(inputs.ethPrice)||0;const btcValue=btcAmount*btcPrice;const ethValue=ethAmount*ethPrice;const totalValue=btcValue+ethValue;const btcShare=(btcValue/totalValue)*100||0;const ethShare=(ethValue/totalValue)*100||0;return`BTC Value: $${btcValue.toFixed(2)} (${btcShare.toFixed(2)}%)
+ETH Value: $${ethValue.toFixed(2)} (${ethShare.toFixed(2)}%)
+Total Portfolio Value: $${totalValue.toFixed(2)}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("power-consumption",{title:'Power Consumption Calculator',icon:'fas fa-plug',inputs:[{id:'voltage',label:'Voltage (V)',type:'number',placeholder:'Enter voltage'},{id:'current',label:'Current (A)',type:'number',placeholder:'Enter current'},{id:'hours',label:'Usage Hours/Day',type:'number',placeholder:'Enter daily usage hours'},{id:'rate',label:'Rate ($/kWh)',type:'number',placeholder:'Enter electricity rate',step:'0.01'}],calculate:function(inputs){const voltage=parseFloat(inputs.voltage)||0;const current=parseFloat(inputs.current)||0;const hours=parseFloat(inputs.hours)||0;const rate=parseFloat(inputs.rate)||0;const power=voltage*current;const dailyConsumption=power*hours/1000;const monthlyConsumption=dailyConsumption*30;const dailyCost=dailyConsumption*rate;const monthlyCost=monthlyConsumption*rate;return`Power: ${power.toFixed(2)} W
+Daily Consumption: ${dailyConsumption.toFixed(3)} kWh
+Monthly Consumption: ${monthlyConsumption.toFixed(1)} kWh
+Daily Cost: $${dailyCost.toFixed(2)}
+Monthly Cost: $${monthlyCost.toFixed(2)}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("power-conversion",{title:'Power Converter',icon:'fas fa-plug',inputs:[{id:'value',label:'Power',type:'number',placeholder:'Enter power value'},{id:'fromUnit',label:'From Unit',type:'select',options:['W','kW','MW','hp','BTU/h','cal/s']},{id:'toUnit',label:'To Unit',type:'select',options:['W','kW','MW','hp','BTU/h','cal/s']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const watts=convertUnit('power',value,fromUnit,'W');const result=convertUnit('power',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Watts: ${watts.toFixed(3)} W
+Kilowatts: ${(watts/1000).toFixed(6)} kW
+Horsepower: ${(watts/745.7).toFixed(6)} hp`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("power-factor",{title:'Power Factor Calculator',icon:'fas fa-angle-right',inputs:[{id:'realPower',label:'Real Power (W)',type:'number',placeholder:'Enter real power'},{id:'apparentPower',label:'Apparent Power (VA)',type:'number',placeholder:'Enter apparent power'}],calculate:function(inputs){const realPower=parseFloat(inputs.realPower)||0;const apparentPower=parseFloat(inputs.apparentPower)||0;if(apparentPower===0){return'Error: Apparent power cannot be zero';}
+const powerFactor=realPower/apparentPower;const reactivePower=Math.sqrt(apparentPower*apparentPower-realPower*realPower);const phaseAngle=Math.acos(powerFactor)*(180/Math.PI);let pfType='Unity';if(powerFactor<1&&powerFactor>0)pfType='Lagging';if(powerFactor<0)pfType='Leading';return`Power Factor: ${powerFactor.toFixed(3)}
+Power Factor (%): ${(powerFactor * 100).toFixed(1)}%
+Reactive Power: ${reactivePower.toFixed(2)} VAR
+Phase Angle: ${phaseAngle.toFixed(2)}°
+Power Factor Type: ${pfType}`;}});
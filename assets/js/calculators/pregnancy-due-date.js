@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("pregnancy-due-date",{title:'Pregnancy Due Date Calculator',icon:'fas fa-baby',inputs:[{id:'lastPeriod',label:'Last Menstrual Period (YYYY-MM-DD)',type:'date',placeholder:'Select date'},{id:'cycleLength',label:'Average Cycle Length (days)',type:'number',placeholder:'Enter cycle length (default: 28)',value:'28'}],calculate:function(inputs){const lmpDate=new Date(inputs.lastPeriod);const cycleLength=parseInt(inputs.cycleLength)||28;if(!inputs.lastPeriod){return'Please enter your last menstrual period date';}
+const dueDate=new Date(lmpDate);dueDate.setDate(dueDate.getDate()+280);const adjustment=cycleLength-28;dueDate.setDate(dueDate.getDate()+adjustment);const today=new Date();const weeksPregnant=Math.floor((today-lmpDate)/(7*24*60*60*1000));const daysIntoWeek=Math.floor(((today-lmpDate)%(7*24*60*60*1000))/(24*60*60*1000));const trimester=weeksPregnant<13?'First':weeksPregnant<27?'Second':'Third';return`Due Date: ${dueDate.toDateString()}
+Current Stage: ${weeksPregnant} weeks, ${daysIntoWeek} days pregnant
+Trimester: ${trimester}
+Conception Date: ${new Date(lmpDate.getTime() + (14 * 24 * 60 * 60 * 1000)).toDateString()}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("pressure",{title:'Pressure Converter',icon:'fas fa-compress',inputs:[{id:'value',label:'Pressure',type:'number',placeholder:'Enter pressure'},{id:'fromUnit',label:'From Unit',type:'select',options:['Pa','kPa','MPa','bar','atm','psi','mmHg','inHg']},{id:'toUnit',label:'To Unit',type:'select',options:['Pa','kPa','MPa','bar','atm','psi','mmHg','inHg']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const pascals=convertUnit('pressure',value,fromUnit,'Pa');const result=convertUnit('pressure',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Pascals: ${pascals.toFixed(3)} Pa
+Atmospheres: ${(pascals/101325).toFixed(6)} atm
+PSI: ${(pascals/6894.76).toFixed(3)} psi`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("probability-calculator",{title:'Probability Calculator',icon:'fas fa-dice',inputs:[{id:'type',label:'Calculation Type',type:'select',options:['Combination (nCr)','Permutation (nPr)','Dice Probability','Coin Flip']},{id:'n',label:'Total Items (n)',type:'number',placeholder:'Enter total items'},{id:'r',label:'Selected Items (r)',type:'number',placeholder:'Enter selected items'},{id:'events',label:'Number of Events',type:'number',placeholder:'Enter number of events'}],calculate:function(inputs){const n=parseInt(inputs.n)||0;const r=parseInt(inputs.r)||0;const events=parseInt(inputs.events)||1;const factorial=(num)=>{if(num<0)return 0;if(num===0||num===1)return 1;let result=1;for(let i=2;i<=num;i++)result*=i;return result;};switch(inputs.type){case'Combination (nCr)':
+if(r>n)return'Error: r cannot be greater than n';const nCr=factorial(n)/(factorial(r)*factorial(n-r));return`Combination: C(${n}, ${r}) = ${nCr}\nFormula: n! / (r! × (n-r)!)`;case'Permutation (nPr)':
+if(r>n)return'Error: r cannot be greater than n';const nPr=factorial(n)/factorial(n-r);return`Permutation: P(${n}, ${r}) = ${nPr}\nFormula: n! / (n-r)!`;case'Dice Probability':
+if(events<1||events>6)return'Error: Dice events must be between 1 and 6';const diceProb=1/6;return`Probability of rolling ${events} on a fair die: ${diceProb.toFixed(4)} or ${(diceProb * 100).toFixed(2)}%`;case'Coin Flip':
+return`Probability of heads (or tails): 0.5 or 50%\nProbability of ${events} consecutive heads: ${Math.pow(0.5, events).toFixed(6)} or ${(Math.pow(0.5, events) * 100).toFixed(4)}%`;default:
+return'Please select a calculation type';}}});
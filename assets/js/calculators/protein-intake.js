@@ -0,0 +1,14 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("protein-intake",{title:'Protein Intake Calculator',icon:'fas fa-drumstick-bite',inputs:[{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'goal',label:'Goal',type:'select',options:['Sedentary Adult','Active Adult','Endurance Athlete','Strength Athlete','Weight Loss']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;const age=parseInt(inputs.age)||0;let proteinPerKg;switch(inputs.goal){case'Sedentary Adult':
+proteinPerKg=0.8;break;case'Active Adult':
+proteinPerKg=1.2;break;case'Endurance Athlete':
+proteinPerKg=1.4;break;case'Strength Athlete':
+proteinPerKg=1.8;break;case'Weight Loss':
+proteinPerKg=1.6;break;default:
+proteinPerKg=1.0;}
+if(age>=65){proteinPerKg=Math.max(proteinPerKg,1.2);}
+const dailyProtein=weight*proteinPerKg;const mealProtein=dailyProtein/3;const proteinCalories=dailyProtein*4;return`Daily Protein Requirement: ${dailyProtein.toFixed(0)}g
+Per Kg Body Weight: ${proteinPerKg}g/kg
+Per Meal (3 meals): ${mealProtein.toFixed(0)}g
+Calories from Protein: ${proteinCalories.toFixed(0)} cal
+Goal: ${inputs.goal}`;}});
@@ -0,0 +1,15 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("pulley-system",{title:'Pulley System Calculator',icon:'fas fa-circle-o',inputs:[{id:'load',label:'Load Weight (kg)',type:'number',placeholder:'Enter load weight'},{id:'pulleyType',label:'Pulley System',type:'select',options:['Fixed Pulley','Movable Pulley','Block and Tackle (2:1)','Block and Tackle (3:1)','Block and Tackle (4:1)']},{id:'efficiency',label:'System Efficiency (%)',type:'number',placeholder:'Enter efficiency',value:'85'}],calculate:function(inputs){const load=parseFloat(inputs.load)||0;const pulleyType=inputs.pulleyType||'Fixed Pulley';const efficiency=parseFloat(inputs.efficiency)||85;let mechanicalAdvantage=1;let description='';switch(pulleyType){case'Fixed Pulley':
+mechanicalAdvantage=1;description='Changes direction of force only';break;case'Movable Pulley':
+mechanicalAdvantage=2;description='Reduces force by half';break;case'Block and Tackle (2:1)':
+mechanicalAdvantage=2;description='Two supporting rope segments';break;case'Block and Tackle (3:1)':
+mechanicalAdvantage=3;description='Three supporting rope segments';break;case'Block and Tackle (4:1)':
+mechanicalAdvantage=4;description='Four supporting rope segments';break;}
+const theoreticalForce=(load*9.81)/mechanicalAdvantage;const actualForce=theoreticalForce/(efficiency/100);const ropePull=mechanicalAdvantage;return`${pulleyType} Analysis:
+Load Weight: ${load} kg (${(load * 9.81).toFixed(1)} N)
+Mechanical Advantage: ${mechanicalAdvantage}:1
+Theoretical Pull Force: ${theoreticalForce.toFixed(1)} N (${(theoreticalForce / 9.81).toFixed(1)} kg)
+Actual Pull Force: ${actualForce.toFixed(1)} N (${(actualForce / 9.81).toFixed(1)} kg)
+System Efficiency: ${efficiency}%
+Rope Pull Distance: ${ropePull}x load distance
+Description: ${description}`;}});
@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("quadratic",{title:'Quadratic Equation Solver',icon:'fas fa-superscript',inputs:[{id:'a',label:'Coefficient a (x²)',type:'number',placeholder:'Enter coefficient of x²'},{id:'b',label:'Coefficient b (x)',type:'number',placeholder:'Enter coefficient of x'},{id:'c',label:'Constant c',type:'number',placeholder:'Enter constant term'}],calculate:function(inputs){const a=parseFloat(inputs.a)||0;const b=parseFloat(inputs.b)||0;const c=parseFloat(inputs.c)||0;if(a===0)return'Error: Coefficient a cannot be zero for quadratic equation';const discriminant=b*b-4*a*c;const vertex_x=-b/(2*a);const vertex_y=a*vertex_x*vertex_x+b*vertex_x+c;let solutions='';if(discriminant>0){const x1=(-b+Math.sqrt(discriminant))/(2*a);const x2=(-b-Math.sqrt(discriminant))/(2*a);solutions=`Two Real Solutions:\nx₁ = ${x1.toFixed(4)}\nx₂ = ${x2.toFixed(4)}`;}else if(discriminant===0){const x=-b/(2*a);solutions=`One Real Solution:\nx = ${x.toFixed(4)}`;}else{const realPart=-b/(2*a);const imagPart=Math.sqrt(-discriminant)/(2*a);solutions=`Two Complex Solutions:\nx₁ = ${realPart.toFixed(4)} + ${imagPart.toFixed(4)}i\nx₂ = ${realPart.toFixed(4)} - ${imagPart.toFixed(4)}i`;}
+return`Quadratic Equation: ${a}x² + ${b}x + ${c} = 0\nDiscriminant: ${discriminant.toFixed(4)}\nVertex: (${vertex_x.toFixed(4)}, ${vertex_y.toFixed(4)})\n${solutions}`;}});
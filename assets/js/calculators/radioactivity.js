@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("radioactivity",{title:'Radioactivity Converter',icon:'fas fa-radiation',inputs:[{id:'value',label:'Radioactivity',type:'number',placeholder:'Enter radioactivity'},{id:'fromUnit',label:'From Unit',type:'select',options:['Bq','kBq','MBq','GBq','Ci','mCi','μCi','nCi','pCi']},{id:'toUnit',label:'To Unit',type:'select',options:['Bq','kBq','MBq','GBq','Ci','mCi','μCi','nCi','pCi']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const bq=convertUnit('radioactivity',value,fromUnit,'Bq');const result=convertUnit('radioactivity',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Becquerels: ${bq.toExponential(3)} Bq
+Curies: ${(bq/3.7e10).toExponential(3)} Ci
+Note: 1 Ci = 3.7×10¹⁰ disintegrations/second`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("rc-time-constant",{title:'RC Time Constant Calculator',icon:'fas fa-clock',inputs:[{id:'resistance',label:'Resistance (kΩ)',type:'number',placeholder:'Enter resistance'},{id:'capacitance',label:'Capacitance (µF)',type:'number',placeholder:'Enter capacitance'}],calculate:function(inputs){const resistance=parseFloat(inputs.resistance)||0;const capacitance=parseFloat(inputs.capacitance)||0;const resistanceOhms=resistance*1000;const capacitanceFarads=capacitance/1000000;const timeConstant=resistanceOhms*capacitanceFarads;const charge63=timeConstant;const charge95=timeConstant*3;const charge99=timeConstant*5;return`Time Constant (τ): ${(timeConstant * 1000).toFixed(3)} ms
+63% Charge Time: ${(charge63 * 1000).toFixed(3)} ms
+95% Charge Time: ${(charge95 * 1000).toFixed(3)} ms
+99% Charge Time: ${(charge99 * 1000).toFixed(3)} ms
+Cutoff Frequency: ${(1/(2*Math.PI*timeConstant)).toFixed(2)} Hz`;}});
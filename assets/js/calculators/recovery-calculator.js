@@ -0,0 +1,18 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("recovery-calculator",{title:'Recovery Calculator',icon:'fas fa-spa',inputs:[{id:'workoutIntensity',label:'Workout Intensity (1-10)',type:'select',options:['1 - Very Light','2 - Light','3 - Light','4 - Moderate','5 - Moderate','6 - Hard','7 - Hard','8 - Very Hard','9 - Very Hard','10 - Maximum']},{id:'workoutDuration',label:'Workout Duration (minutes)',type:'number',placeholder:'Enter duration'},{id:'sleepQuality',label:'Sleep Quality Last Night',type:'select',options:['Poor','Fair','Good','Excellent']},{id:'stressLevel',label:'Stress Level',type:'select',options:['Low','Moderate','High','Very High']},{id:'nutrition',label:'Nutrition Quality',type:'select',options:['Poor','Fair','Good','Excellent']}],calculate:function(inputs){const intensity=parseInt(inputs.workoutIntensity.charAt(0))||1;const duration=parseFloat(inputs.workoutDuration)||0;let recoveryScore=100;const workoutImpact=intensity*(duration/60);recoveryScore-=workoutImpact*5;const sleepImpact={'Poor':-30,'Fair':-15,'Good':0,'Excellent':10};recoveryScore+=sleepImpact[inputs.sleepQuality]||0;const stressImpact={'Low':5,'Moderate':0,'High':-15,'Very High':-25};recoveryScore+=stressImpact[inputs.stressLevel]||0;const nutritionImpact={'Poor':-15,'Fair':-5,'Good':0,'Excellent':10};recoveryScore+=nutritionImpact[inputs.nutrition]||0;recoveryScore=Math.max(0,Math.min(100,recoveryScore));let recoveryStatus;let recommendation;if(recoveryScore>=80){recoveryStatus='Fully Recovered';recommendation='Ready for high-intensity training';}else if(recoveryScore>=60){recoveryStatus='Well Recovered';recommendation='Can handle moderate to high intensity';}else if(recoveryScore>=40){recoveryStatus='Partially Recovered';recommendation='Light to moderate exercise recommended';}else if(recoveryScore>=20){recoveryStatus='Poor Recovery';recommendation='Active recovery or rest day recommended';}else{recoveryStatus='Very Poor Recovery';recommendation='Complete rest day required';}
+return`Recovery Status: ${recoveryStatus}
+Recovery Score: ${Math.round(recoveryScore)}/100
+
+Factors:
+Workout Impact: Intensity ${intensity}, Duration ${duration} min
+Sleep: ${inputs.sleepQuality}
+Stress: ${inputs.stressLevel}
+Nutrition: ${inputs.nutrition}
+
+Recommendation: ${recommendation}
+
+Recovery Tips:
+- Prioritize 7-9 hours of quality sleep
+- Stay hydrated
+- Eat protein within 2 hours post-workout
+- Manage stress through relaxation techniques`;}});
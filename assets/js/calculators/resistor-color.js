@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("resistor-color",{title:'Resistor Color Code Calculator',icon:'fas fa-palette',inputs:[{id:'band1',label:'Band 1',type:'select',options:['Black','Brown','Red','Orange','Yellow','Green','Blue','Violet','Gray','White']},{id:'band2',label:'Band 2',type:'select',options:['Black','Brown','Red','Orange','Yellow','Green','Blue','Violet','Gray','White']},{id:'band3',label:'Band 3 (Multiplier)',type:'select',options:['Black','Brown','Red','Orange','Yellow','Green','Blue','Violet','Gray','White','Gold','Silver']},{id:'band4',label:'Band 4 (Tolerance)',type:'select',options:['Brown','Red','Gold','Silver']}],calculate:function(inputs){const colors={'Black':0,'Brown':1,'Red':2,'Orange':3,'Yellow':4,'Green':5,'Blue':6,'Violet':7,'Gray':8,'White':9};const multipliers={'Black':1,'Brown':10,'Red':100,'Orange':1000,'Yellow':10000,'Green':100000,'Blue':1000000,'Violet':10000000,'Gray':100000000,'White':1000000000,'Gold':0.1,'Silver':0.01};const tolerances={'Brown':'±1%','Red':'±2%','Gold':'±5%','Silver':'±10%'};const band1=colors[inputs.band1]||0;const band2=colors[inputs.band2]||0;const multiplier=multipliers[inputs.band3]||1;const tolerance=tolerances[inputs.band4]||'±5%';const resistance=(band1*10+band2)*multiplier;let unit='Ω';let displayValue=resistance;if(resistance>=1000000){displayValue=resistance/1000000;unit='MΩ';}else if(resistance>=1000){displayValue=resistance/1000;unit='kΩ';}
+return`Resistance: ${displayValue.toFixed(2)} ${unit}
+Raw Value: ${resistance.toFixed(2)} Ω
+Tolerance: ${tolerance}
+Color Code: ${inputs.band1}-${inputs.band2}-${inputs.band3}-${inputs.band4}`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("resting-energy",{title:'Resting Energy Expenditure Calculator',icon:'fas fa-bed',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'height',label:'Height (cm)',type:'number',placeholder:'Enter height'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const weight=parseFloat(inputs.weight)||0;const height=parseFloat(inputs.height)||0;let ree;if(inputs.gender==='Male'){ree=(10*weight)+(6.25*height)-(5*age)+5;}else{ree=(10*weight)+(6.25*height)-(5*age)-161;}
+const stress=ree*0.1;const thermal=ree*0.13;return`Resting Energy Expenditure: ${Math.round(ree)} calories/day
+With Stress Factor: ${Math.round(ree + stress)} calories/day
+With Thermal Effect: ${Math.round(ree + thermal)} calories/day
+Total REE (all factors): ${Math.round(ree + stress + thermal)} calories/day`;}});
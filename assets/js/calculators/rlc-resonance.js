@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("rlc-resonance",{title:'RLC Resonance Calculator',icon:'fas fa-wave-sine',inputs:[{id:'resistance',label:'Resistance (Ω)',type:'number',placeholder:'Enter resistance'},{id:'inductance',label:'Inductance (mH)',type:'number',placeholder:'Enter inductance'},{id:'capacitance',label:'Capacitance (µF)',type:'number',placeholder:'Enter capacitance'}],calculate:function(inputs){const R=parseFloat(inputs.resistance)||0;const L=parseFloat(inputs.inductance)/1000||0;const C=parseFloat(inputs.capacitance)/1000000||0;const resonantFreq=1/(2*Math.PI*Math.sqrt(L*C));const qualityFactor=(1/R)*Math.sqrt(L/C);const bandwidth=resonantFreq/qualityFactor;const impedanceAtResonance=R;return`Resonant Frequency: ${resonantFreq.toFixed(2)} Hz
+Quality Factor (Q): ${qualityFactor.toFixed(2)}
+Bandwidth: ${bandwidth.toFixed(2)} Hz
+Impedance at Resonance: ${impedanceAtResonance.toFixed(2)} Ω
+Angular Frequency: ${(2 * Math.PI * resonantFreq).toFixed(2)} rad/s`;}});
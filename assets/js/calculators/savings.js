@@ -0,0 +1,3 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("savings",{title:'Savings Calculator',icon:'fas fa-piggy-bank',inputs:[{id:'goal',label:'Savings Goal ($)',type:'number',placeholder:'Enter target amount'},{id:'current',label:'Current Savings ($)',type:'number',placeholder:'Enter current savings'},{id:'rate',label:'Annual Interest Rate (%)',type:'number',placeholder:'Enter interest rate',step:'0.1'},{id:'years',label:'Time Period (years)',type:'number',placeholder:'Enter years'}],calculate:function(inputs){const goal=parseFloat(inputs.goal)||0;const current=parseFloat(inputs.current)||0;const rate=parseFloat(inputs.rate)/100/12;const months=parseInt(inputs.years)*12;const monthlyPayment=(goal-current*Math.pow(1+rate,months))/
+((Math.pow(1+rate,months)-1)/rate);return`Required Monthly Savings: $${monthlyPayment.toFixed(2)}\nTotal Savings: $${goal.toFixed(2)}\nTime to Goal: ${months} months`;}});
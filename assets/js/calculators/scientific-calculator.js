@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("scientific-calculator",{title:'Scientific Calculator',icon:'fas fa-calculator',inputs:[{id:'operation',label:'Operation',type:'select',options:['Power (x^y)','Square Root','Cube Root','Logarithm (log₁₀)','Natural Log (ln)','Exponential (e^x)','Factorial']},{id:'x',label:'Value X',type:'number',placeholder:'Enter first value',step:'0.000001'},{id:'y',label:'Value Y (if needed)',type:'number',placeholder:'Enter second value',step:'0.000001'}],calculate:function(inputs){const x=parseFloat(inputs.x)||0;const y=parseFloat(inputs.y)||0;let result;switch(inputs.operation){case'Power (x^y)':
+result=Math.pow(x,y);return`${x}^${y} = ${result}`;case'Square Root':
+if(x<0)return'Error: Cannot calculate square root of negative number';result=Math.sqrt(x);return`√${x} = ${result.toFixed(6)}`;case'Cube Root':
+result=Math.cbrt(x);return`∛${x} = ${result.toFixed(6)}`;case'Logarithm (log₁₀)':
+if(x<=0)return'Error: Logarithm undefined for non-positive numbers';result=Math.log10(x);return`log₁₀(${x}) = ${result.toFixed(6)}`;case'Natural Log (ln)':
+if(x<=0)return'Error: Natural logarithm undefined for non-positive numbers';result=Math.log(x);return`ln(${x}) = ${result.toFixed(6)}`;case'Exponential (e^x)':
+result=Math.exp(x);return`e^${x} = ${result.toFixed(6)}`;case'Factorial':
+if(x<0||!Number.isInteger(x))return'Error: Factorial only defined for non-negative integers';if(x>170)return'Error: Number too large for factorial calculation';result=1;for(let i=2;i<=x;i++)result*=i;return`${x}! = ${result}`;default:
+return'Please select an operation';}}});
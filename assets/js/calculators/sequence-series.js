@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("sequence-series",{title:'Sequence & Series Calculator',icon:'fas fa-list-ol',inputs:[{id:'type',label:'Type',type:'select',options:['Arithmetic Sequence','Geometric Sequence','Arithmetic Series','Geometric Series']},{id:'first',label:'First Term (a₁)',type:'number',placeholder:'Enter first term',step:'0.01'},{id:'difference',label:'Common Difference/Ratio',type:'number',placeholder:'Enter difference or ratio',step:'0.01'},{id:'n',label:'Number of Terms (n)',type:'number',placeholder:'Enter number of terms'}],calculate:function(inputs){const a1=parseFloat(inputs.first)||0;const d=parseFloat(inputs.difference)||0;const n=parseInt(inputs.n)||0;if(n<=0)return'Error: Number of terms must be positive';switch(inputs.type){case'Arithmetic Sequence':
+const an_arith=a1+(n-1)*d;return`Arithmetic Sequence\nFirst term (a₁): ${a1}\nCommon difference (d): ${d}\nNth term (a${n}): ${an_arith}\nFormula: aₙ = a₁ + (n-1)d`;case'Geometric Sequence':
+if(d===0)return'Error: Common ratio cannot be zero';const an_geom=a1*Math.pow(d,n-1);return`Geometric Sequence\nFirst term (a₁): ${a1}\nCommon ratio (r): ${d}\nNth term (a${n}): ${an_geom.toFixed(6)}\nFormula: aₙ = a₁ × r^(n-1)`;case'Arithmetic Series':
+const sum_arith=(n/2)*(2*a1+(n-1)*d);return`Arithmetic Series\nFirst term (a₁): ${a1}\nCommon difference (d): ${d}\nSum of ${n} terms: ${sum_arith}\nFormula: Sₙ = n/2 × [2a₁ + (n-1)d]`;case'Geometric Series':
+if(d===0)return'Error: Common ratio cannot be zero';let sum_geom;if(d===1){sum_geom=n*a1;}else{sum_geom=a1*(1-Math.pow(d,n))/(1-d);}
+return`Geometric Series\nFirst term (a₁): ${a1}\nCommon ratio (r): ${d}\nSum of ${n} terms: ${sum_geom.toFixed(6)}\nFormula: Sₙ = a₁ × (1-r^n)/(1-r)`;default:
+return'Please select a sequence/series type';}}});
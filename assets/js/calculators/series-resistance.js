@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("series-resistance",{title:'Series Resistance Calculator',icon:'fas fa-link',inputs:[{id:'resistors',label:'Resistor Values (Ω, comma-separated)',type:'text',placeholder:'e.g., 100,200,300'}],calculate:function(inputs){const resistorString=inputs.resistors||'';const resistors=resistorString.split(',').map(r=>parseFloat(r.trim())).filter(r=>!isNaN(r)&&r>0);if(resistors.length<2){return'Error: Please enter at least 2 resistor values';}
+const totalResistance=resistors.reduce((sum,r)=>sum+r,0);const resistorList=resistors.join('Ω + ')+'Ω';return`Series Resistance: ${totalResistance.toFixed(3)} Ω
+Number of Resistors: ${resistors.length}
+Calculation: ${resistorList} = ${totalResistance.toFixed(3)}Ω
+Formula: Rtotal = R1 + R2 + R3 + ...`;}});
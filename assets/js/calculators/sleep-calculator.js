@@ -0,0 +1,15 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("sleep-calculator",{title:'Sleep Calculator',icon:'fas fa-bed',inputs:[{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'bedtime',label:'Desired Bedtime',type:'time',placeholder:'Select bedtime'},{id:'wakeup',label:'Wake-up Time',type:'time',placeholder:'Select wake-up time'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;let recommendedSleep;if(age<1)recommendedSleep='14-17 hours';else if(age<3)recommendedSleep='11-14 hours';else if(age<6)recommendedSleep='10-13 hours';else if(age<13)recommendedSleep='9-11 hours';else if(age<18)recommendedSleep='8-10 hours';else if(age<65)recommendedSleep='7-9 hours';else recommendedSleep='7-8 hours';let sleepAnalysis='';if(inputs.bedtime&&inputs.wakeup){const bedtime=new Date(`1970-01-01T${inputs.bedtime}`);let wakeup=new Date(`1970-01-01T${inputs.wakeup}`);if(wakeup<=bedtime){wakeup.setDate(wakeup.getDate()+1);}
+const sleepDuration=(wakeup-bedtime)/(1000*60*60);const sleepCycles=sleepDuration/1.5;sleepAnalysis=`
+Current Sleep Schedule:
+Sleep Duration: ${sleepDuration.toFixed(1)} hours
+Sleep Cycles: ${sleepCycles.toFixed(1)} cycles
+Quality: ${Math.abs(sleepCycles - Math.round(sleepCycles)) < 0.2 ? 'Good (complete cycles)' : 'Could be better'}`;}
+return`Sleep Requirements for Age ${age}:
+Recommended: ${recommendedSleep}${sleepAnalysis}
+
+Sleep Tips:
+- Maintain consistent sleep schedule
+- Avoid screens 1 hour before bed
+- Keep bedroom cool and dark
+- Avoid caffeine 6 hours before bed`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("speed",{title:'Speed Converter',icon:'fas fa-tachometer-alt',inputs:[{id:'value',label:'Speed',type:'number',placeholder:'Enter speed'},{id:'fromUnit',label:'From Unit',type:'select',options:['m/s','km/h','mph','ft/s','knots']},{id:'toUnit',label:'To Unit',type:'select',options:['m/s','km/h','mph','ft/s','knots']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const mps=convertUnit('speed',value,fromUnit,'m/s');const result=convertUnit('speed',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Meters/Second: ${mps.toFixed(6)} m/s
+Kilometers/Hour: ${(mps*3.6).toFixed(3)} km/h
+Miles/Hour: ${(mps/0.44704).toFixed(3)} mph`;}});
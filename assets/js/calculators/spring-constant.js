@@ -0,0 +1,13 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("spring-constant",{title:'Spring Constant Calculator',icon:'fas fa-expand-arrows-alt',inputs:[{id:'force',label:'Applied Force (N)',type:'number',placeholder:'Enter applied force'},{id:'displacement',label:'Displacement (mm)',type:'number',placeholder:'Enter displacement'},{id:'springLength',label:'Free Length (mm)',type:'number',placeholder:'Enter free length (optional)'},{id:'springType',label:'Spring Type',type:'select',options:['Compression','Extension','Torsion']}],calculate:function(inputs){const force=parseFloat(inputs.force)||0;const displacement=parseFloat(inputs.displacement)||0;const springLength=parseFloat(inputs.springLength)||0;const springType=inputs.springType||'Compression';const displacementM=displacement/1000;const springConstant=force/displacementM;const springConstantNmm=force/displacement;const potentialEnergy=0.5*springConstant*displacementM*displacementM;const springRate=springConstant;let result=`${springType} Spring Analysis:
+Spring Constant: ${springConstant.toFixed(1)} N/m
+Spring Constant: ${springConstantNmm.toFixed(3)} N/mm
+Applied Force: ${force} N
+Displacement: ${displacement} mm (${displacementM.toFixed(6)} m)
+Potential Energy: ${potentialEnergy.toFixed(4)} J
+Spring Rate: ${springRate.toFixed(1)} N/m`;if(springLength>0){const compressedLength=springLength-displacement;const compressionRatio=(displacement/springLength)*100;result+=`\n\nGeometry:
+Free Length: ${springLength} mm
+Compressed/Extended Length: ${compressedLength.toFixed(1)} mm
+Compression/Extension Ratio: ${compressionRatio.toFixed(1)}%`;}
+result+=`\n\nHooke's Law: F = kx
+Where F = ${force} N, k = ${springConstantNmm.toFixed(3)} N/mm, x = ${displacement} mm`;return result;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("staking-rewards",{title:'Staking Rewards Calculator',icon:'fas fa-hand-holding-usd',inputs:[{id:'amount',label:'Staking Amount',type:'number',placeholder:'Enter amount to stake'},{id:'apy',label:'Annual Percentage Yield (%)',type:'number',placeholder:'Enter APY',step:'0.01'},{id:'period',label:'Staking Period (days)',type:'number',placeholder:'Enter staking period'}],calculate:function(inputs){const amount=parseFloat(inputs.amount)||0;const apy=parseFloat(inputs.apy)||0;const period=parseFloat(inputs.period)||0;const dailyRate=apy/365;const rewards=amount*(dailyRate/100)*period;const apy30=amount*(dailyRate/100)*30;const apy365=amount*(apy/100);return`Daily Rewards: ${(amount * (dailyRate / 100)).toFixed(6)}
+Expected Rewards (${period} days): ${rewards.toFixed(6)}
+Monthly Estimate: ${apy30.toFixed(6)}
+Yearly Estimate: ${apy365.toFixed(6)}`;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("statistics-calculator",{title:'Statistics Calculator',icon:'fas fa-chart-bar',inputs:[{id:'data',label:'Data Set (comma separated)',type:'text',placeholder:'e.g., 1,2,3,4,5',optional:true},{id:'dataFile',label:'Or Upload a Data File (.csv/.txt, millions of values)',type:'file',accept:'.csv,.txt,.tsv,text/plain,text/csv'},{id:'calculation',label:'Calculation Type',type:'select',options:['All Statistics','Mean','Median','Mode','Standard Deviation','Variance','Percentiles']}],requires:['statistics'],calculate:function(inputs){const report=(stats)=>{if(stats.count===0)return'Error: Please enter valid numeric data';const preview=Array.from(stats.values.subarray(0,Math.min(stats.count,20)));const mean=stats.mean;const median=stats.median();const modes=stats.modes();const shown=modes.values.slice(0,10).join(', ');const mode=modes.values.length>10?`${shown}, … (${modes.values.length} values tie)`:shown;const variance=stats.variance();const stdDev=Math.sqrt(variance);const range=stats.max-stats.min;const percentiles=STATISTICS_PERCENTILES.map(p=>`P${p}: ${stats.percentile(p).toFixed(4)}`).join('\n');if(inputs.calculation==='All Statistics'){const data=stats.count>20?`${preview.join(', ')}, … (${stats.count} values)`:preview.join(', ');return`Data: [${data}]\nCount: ${stats.count}\n\nMeasures of Central Tendency:\nMean: ${mean.toFixed(4)}\nMedian: ${median.toFixed(4)}\nMode: ${mode}\n\nMeasures of Dispersion:\nRange: ${range.toFixed(4)}\nVariance: ${variance.toFixed(4)}\nStandard Deviation: ${stdDev.toFixed(4)}\n\nPercentiles:\n${percentiles}\n\nMinimum: ${stats.min}\nMaximum: ${stats.max}`;}else{const results={'Mean':mean.toFixed(4),'Median':median.toFixed(4),'Mode':mode,'Standard Deviation':stdDev.toFixed(4),'Variance':variance.toFixed(4),'Percentiles':`\n${percentiles}`};return`${inputs.calculation}: ${results[inputs.calculation]}`;}};if(inputs.dataFile)return statisticsFromFile(inputs.dataFile).then(report);return report(statisticsFromText(inputs.data||''));}});
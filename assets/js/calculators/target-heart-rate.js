@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("target-heart-rate",{title:'Target Heart Rate Calculator',icon:'fas fa-heartbeat',inputs:[{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'restingHR',label:'Resting Heart Rate',type:'number',placeholder:'Enter resting HR'},{id:'intensity',label:'Training Intensity',type:'select',options:['Light (40-50%)','Moderate (50-70%)','Hard (70-85%)','Maximum (85-95%)']}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const restingHR=parseInt(inputs.restingHR)||60;const maxHR=220-age;const hrReserve=maxHR-restingHR;const intensity=inputs.intensity.match(/\((\d+)-(\d+)%\)/);const lower=restingHR+(hrReserve*parseInt(intensity[1])/100);const upper=restingHR+(hrReserve*parseInt(intensity[2])/100);return`Target Heart Rate Zone: ${Math.round(lower)}-${Math.round(upper)} BPM
+Maximum Heart Rate: ${maxHR} BPM
+Selected Intensity: ${inputs.intensity}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("temperature",{title:'Temperature Converter',icon:'fas fa-thermometer-half',inputs:[{id:'value',label:'Temperature',type:'number',placeholder:'Enter temperature'},{id:'fromUnit',label:'From Unit',type:'select',options:['C','F','K','R']},{id:'toUnit',label:'To Unit',type:'select',options:['C','F','K','R']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const celsius=convertUnit('temperature',value,fromUnit,'C');const result=convertUnit('temperature',value,fromUnit,toUnit);return`${value}°${fromUnit} = ${result.toFixed(2)}°${toUnit}
+Celsius: ${celsius.toFixed(2)}°C
+Fahrenheit: ${(celsius * 9/5 + 32).toFixed(2)}°F
+Kelvin: ${(celsius + 273.15).toFixed(2)}K`;}});
@@ -0,0 +1,18 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("thermal-expansion",{title:'Thermal Expansion Calculator',icon:'fas fa-thermometer-half',inputs:[{id:'originalLength',label:'Original Length (mm)',type:'number',placeholder:'Enter original length'},{id:'tempChange',label:'Temperature Change (°C)',type:'number',placeholder:'Enter temperature change'},{id:'material',label:'Material',type:'select',options:['Steel','Aluminum','Copper','Brass','Concrete','Glass','Titanium','Stainless Steel','Custom']},{id:'customCoeff',label:'Custom Coefficient (×10⁻⁶/°C)',type:'number',placeholder:'Enter coefficient if custom'}],calculate:function(inputs){const originalLength=parseFloat(inputs.originalLength)||0;const tempChange=parseFloat(inputs.tempChange)||0;const material=inputs.material||'Steel';const customCoeff=parseFloat(inputs.customCoeff)||0;const coefficients={'Steel':12,'Aluminum':24,'Copper':17,'Brass':19,'Concrete':12,'Glass':9,'Titanium':8.6,'Stainless Steel':17.3,'Custom':customCoeff};const coefficient=coefficients[material]||12;const expansion=originalLength*coefficient*0.000001*tempChange;const finalLength=originalLength+expansion;const strainPercent=(expansion/originalLength)*100;const volumeExpansion=3*coefficient*0.000001*tempChange;const volumeChangePercent=volumeExpansion*100;return`Thermal Expansion Analysis:
+Material: ${material}
+Expansion Coefficient: ${coefficient} ×10⁻⁶/°C
+Original Length: ${originalLength} mm
+Temperature Change: ${tempChange}°C
+
+Linear Expansion:
+Length Change: ${expansion.toFixed(4)} mm
+Final Length: ${finalLength.toFixed(4)} mm
+Strain: ${strainPercent.toFixed(6)}%
+
+Volume Expansion:
+Volume Change: ${volumeChangePercent.toFixed(6)}%
+Volume Coefficient: ${(3 * coefficient).toFixed(1)} ×10⁻⁶/°C
+
+Formula: ΔL = L₀ × α × ΔT
+Where α = ${coefficient} ×10⁻⁶/°C`;}});
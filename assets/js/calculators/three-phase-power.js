@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("three-phase-power",{title:'Three-Phase Power Calculator',icon:'fas fa-bolt',inputs:[{id:'voltage',label:'Line Voltage (V)',type:'number',placeholder:'Enter line voltage'},{id:'current',label:'Line Current (A)',type:'number',placeholder:'Enter line current'},{id:'powerFactor',label:'Power Factor',type:'number',placeholder:'Enter power factor (0-1)',min:'0',max:'1',step:'0.01'}],calculate:function(inputs){const voltage=parseFloat(inputs.voltage)||0;const current=parseFloat(inputs.current)||0;const pf=parseFloat(inputs.powerFactor)||1;const realPower=Math.sqrt(3)*voltage*current*pf/1000;const apparentPower=Math.sqrt(3)*voltage*current/1000;const reactivePower=Math.sqrt(apparentPower*apparentPower-realPower*realPower);const phaseAngle=Math.acos(pf)*(180/Math.PI);return`Real Power: ${realPower.toFixed(2)} kW
+Apparent Power: ${apparentPower.toFixed(2)} kVA
+Reactive Power: ${reactivePower.toFixed(2)} kVAR
+Power Factor: ${pf.toFixed(3)}
+Phase Angle: ${phaseAngle.toFixed(2)}°
+Line Voltage: ${voltage} V
+Line Current: ${current} A`;}});
@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("time-conversion",{title:'Time Converter',icon:'fas fa-clock',inputs:[{id:'value',label:'Time',type:'number',placeholder:'Enter time value'},{id:'fromUnit',label:'From Unit',type:'select',options:['ms','sec','min','hr','day','week','month','year']},{id:'toUnit',label:'To Unit',type:'select',options:['ms','sec','min','hr','day','week','month','year']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const seconds=convertUnit('time',value,fromUnit,'sec');const result=convertUnit('time',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Seconds: ${seconds.toFixed(3)} sec
+Minutes: ${(seconds/60).toFixed(3)} min
+Hours: ${(seconds/3600).toFixed(6)} hr
+Days: ${(seconds/86400).toFixed(6)} days`;}});
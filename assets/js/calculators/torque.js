@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("torque",{title:'Torque Converter',icon:'fas fa-cog',inputs:[{id:'value',label:'Torque',type:'number',placeholder:'Enter torque'},{id:'fromUnit',label:'From Unit',type:'select',options:['Nm','kNm','lbft','lbin','kgfm','kgfcm','ozin']},{id:'toUnit',label:'To Unit',type:'select',options:['Nm','kNm','lbft','lbin','kgfm','kgfcm','ozin']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const nm=convertUnit('torque',value,fromUnit,'Nm');const result=convertUnit('torque',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Newton-meters: ${nm.toFixed(3)} Nm
+Pound-feet: ${(nm/1.35582).toFixed(3)} lb·ft
+Kilogram-force meters: ${(nm/9.80665).toFixed(3)} kgf·m`;}});
@@ -0,0 +1,19 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("training-load",{title:'Training Load Calculator',icon:'fas fa-chart-line',inputs:[{id:'sessions',label:'Training Sessions This Week',type:'text',placeholder:'Format: duration,intensity (e.g., 60,7 90,5 45,8)'},{id:'lastWeekLoad',label:'Last Week Total Load (optional)',type:'number',placeholder:'Enter previous week load'}],calculate:function(inputs){const sessionsText=inputs.sessions||'';const lastWeekLoad=parseFloat(inputs.lastWeekLoad)||0;if(!sessionsText.trim()){return'Please enter training sessions in format: duration,intensity (e.g., 60,7 90,5 45,8)';}
+const sessions=sessionsText.split(' ').map(session=>{const[duration,intensity]=session.split(',').map(x=>parseFloat(x));return{duration:duration||0,intensity:intensity||0};}).filter(s=>s.duration>0&&s.intensity>0);if(sessions.length===0){return'Invalid session format. Use: duration,intensity (e.g., 60,7)';}
+let totalLoad=0;let sessionBreakdown=[];sessions.forEach((session,index)=>{const load=session.duration*session.intensity;totalLoad+=load;sessionBreakdown.push(`Session ${index + 1}: ${session.duration}min × ${session.intensity} = ${load} load`);});const averageIntensity=sessions.reduce((sum,s)=>sum+s.intensity,0)/sessions.length;const totalDuration=sessions.reduce((sum,s)=>sum+s.duration,0);let loadCategory;if(totalLoad<1000)loadCategory='Light';else if(totalLoad<2000)loadCategory='Moderate';else if(totalLoad<3000)loadCategory='High';else loadCategory='Very High';let weeklyChange='';if(lastWeekLoad>0){const changePercent=((totalLoad-lastWeekLoad)/lastWeekLoad)*100;const safeIncrease=changePercent<=10;weeklyChange=`
+Weekly Change: ${changePercent > 0 ? '+' : ''}${changePercent.toFixed(1)}%
+Status: ${safeIncrease ? 'Safe progression' : 'High increase - monitor recovery'}`;}
+return`Training Load Analysis:
+Total Load: ${totalLoad.toFixed(0)} (${loadCategory})
+Sessions: ${sessions.length}
+Total Duration: ${totalDuration} minutes
+Average Intensity: ${averageIntensity.toFixed(1)}/10${weeklyChange}
+
+Session Breakdown:
+${sessionBreakdown.join('\n')}
+
+Guidelines:
+- Increase load by max 10% per week
+- Monitor recovery between sessions
+- Balance high and low intensity days`;}});
@@ -0,0 +1,4 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("transformer-turns",{title:'Transformer Turns Ratio Calculator',icon:'fas fa-exchange-alt',inputs:[{id:'primaryVoltage',label:'Primary Voltage (V)',type:'number',placeholder:'Enter primary voltage'},{id:'secondaryVoltage',label:'Secondary Voltage (V)',type:'number',placeholder:'Enter secondary voltage'},{id:'primaryTurns',label:'Primary Turns',type:'number',placeholder:'Enter primary turns (optional)'}],calculate:function(inputs){const vp=parseFloat(inputs.primaryVoltage)||0;const vs=parseFloat(inputs.secondaryVoltage)||0;const np=parseFloat(inputs.primaryTurns)||0;const turnsRatio=vp/vs;const voltageRatio=vs/vp;let result=`Turns Ratio (Np:Ns): ${turnsRatio.toFixed(3)}:1
+Voltage Ratio: 1:${voltageRatio.toFixed(3)}`;if(np>0){const ns=np/turnsRatio;result+=`\nSecondary Turns: ${ns.toFixed(0)}`;}
+result+=`\nTransformer Type: ${vp > vs ? 'Step-down' : vp < vs ? 'Step-up' : 'Isolation'}`;return result;}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("trigonometry",{title:'Trigonometry Calculator',icon:'fas fa-wave-square',inputs:[{id:'angle',label:'Angle',type:'number',placeholder:'Enter angle',step:'0.01'},{id:'unit',label:'Unit',type:'select',options:['Degrees','Radians']},{id:'function',label:'Trigonometric Function',type:'select',options:['All Functions','sin','cos','tan','csc','sec','cot']}],calculate:function(inputs){let angle=parseFloat(inputs.angle)||0;const radians=inputs.unit==='Degrees'?angle*(Math.PI/180):angle;const sin=Math.sin(radians);const cos=Math.cos(radians);const tan=Math.tan(radians);const csc=1/sin;const sec=1/cos;const cot=1/tan;if(inputs.function==='All Functions'){return`Angle: ${angle}° (${radians.toFixed(4)} rad)\n\nPrimary Functions:\nsin(${angle}°) = ${sin.toFixed(6)}\ncos(${angle}°) = ${cos.toFixed(6)}\ntan(${angle}°) = ${tan.toFixed(6)}\n\nReciprocal Functions:\ncsc(${angle}°) = ${csc.toFixed(6)}\nsec(${angle}°) = ${sec.toFixed(6)}\ncot(${angle}°) = ${cot.toFixed(6)}`;}else{const values={sin,cos,tan,csc,sec,cot};const result=values[inputs.function];return`${inputs.function}(${angle}°) = ${result.toFixed(6)}\nAngle in radians: ${radians.toFixed(4)}`;}}});
@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("velocity",{title:'Velocity Calculator',icon:'fas fa-tachometer-alt',inputs:[{id:'distance',label:'Distance (meters)',type:'number',placeholder:'Enter distance'},{id:'time',label:'Time (seconds)',type:'number',placeholder:'Enter time'}],calculate:function(inputs){const distance=parseFloat(inputs.distance)||0;const time=parseFloat(inputs.time)||1;const velocity=distance/time;return`Velocity: ${velocity.toFixed(2)} m/s\nVelocity: ${(velocity * 3.6).toFixed(2)} km/h\nVelocity: ${(velocity * 2.237).toFixed(2)} mph`;}});
@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("vo2-max",{title:'VO2 Max Calculator',icon:'fas fa-lungs',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'age',label:'Age',type:'number',placeholder:'Enter age'},{id:'restingHR',label:'Resting Heart Rate',type:'number',placeholder:'Enter resting HR'},{id:'maxHR',label:'Maximum Heart Rate (optional)',type:'number',placeholder:'Enter max HR'}],calculate:function(inputs){const age=parseInt(inputs.age)||0;const restingHR=parseInt(inputs.restingHR)||0;const maxHR=parseInt(inputs.maxHR)||(220-age);let vo2max;if(inputs.gender==='Male'){vo2max=15.3*(maxHR/restingHR);}else{vo2max=14.7*(maxHR/restingHR);}
+vo2max=vo2max-(age*0.5);let fitnessLevel;const ageCategory=age<30?'young':age<40?'middle':'older';if(inputs.gender==='Male'){if(vo2max>=50)fitnessLevel='Excellent';else if(vo2max>=43)fitnessLevel='Good';else if(vo2max>=35)fitnessLevel='Fair';else if(vo2max>=28)fitnessLevel='Poor';else fitnessLevel='Very Poor';}else{if(vo2max>=45)fitnessLevel='Excellent';else if(vo2max>=38)fitnessLevel='Good';else if(vo2max>=31)fitnessLevel='Fair';else if(vo2max>=24)fitnessLevel='Poor';else fitnessLevel='Very Poor';}
+return`Estimated VO2 Max: ${vo2max.toFixed(1)} ml/kg/min
+Fitness Level: ${fitnessLevel}
+Max Heart Rate: ${maxHR} bpm
+Resting Heart Rate: ${restingHR} bpm
+Note: This is an estimation. Lab testing provides accurate results.`;}});
@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("voltage-divider",{title:'Voltage Divider Calculator',icon:'fas fa-divide',inputs:[{id:'vin',label:'Input Voltage (V)',type:'number',placeholder:'Enter input voltage'},{id:'r1',label:'Resistor R1 (Ω)',type:'number',placeholder:'Enter R1 value'},{id:'r2',label:'Resistor R2 (Ω)',type:'number',placeholder:'Enter R2 value'}],calculate:function(inputs){const vin=parseFloat(inputs.vin)||0;const r1=parseFloat(inputs.r1)||0;const r2=parseFloat(inputs.r2)||0;const vout=vin*(r2/(r1+r2));const totalResistance=r1+r2;const current=vin/totalResistance;const powerR1=current*current*r1;const powerR2=current*current*r2;const totalPower=powerR1+powerR2;return`Output Voltage: ${vout.toFixed(3)} V
+Total Resistance: ${totalResistance.toFixed(2)} Ω
+Current: ${(current * 1000).toFixed(2)} mA
+Power in R1: ${(powerR1 * 1000).toFixed(2)} mW
+Power in R2: ${(powerR2 * 1000).toFixed(2)} mW
+Total Power: ${(totalPower * 1000).toFixed(2)} mW`;}});
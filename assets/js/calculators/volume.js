@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("volume",{title:'Volume Converter',icon:'fas fa-cube',inputs:[{id:'value',label:'Volume',type:'number',placeholder:'Enter volume'},{id:'fromUnit',label:'From Unit',type:'select',options:['ml','l','m³','fl oz','cup','pt','qt','gal']},{id:'toUnit',label:'To Unit',type:'select',options:['ml','l','m³','fl oz','cup','pt','qt','gal']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const liters=convertUnit('volume',value,fromUnit,'l');const result=convertUnit('volume',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Liters: ${liters.toFixed(6)} L
+Milliliters: ${(liters*1000).toFixed(3)} mL
+Gallons: ${(liters/3.78541).toFixed(6)} gal`;}});
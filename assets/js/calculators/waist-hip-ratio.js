@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("waist-hip-ratio",{title:'Waist-to-Hip Ratio Calculator',icon:'fas fa-ruler-horizontal',inputs:[{id:'gender',label:'Gender',type:'select',options:['Male','Female']},{id:'waist',label:'Waist Circumference (cm)',type:'number',placeholder:'Enter waist measurement'},{id:'hip',label:'Hip Circumference (cm)',type:'number',placeholder:'Enter hip measurement'}],calculate:function(inputs){const waist=parseFloat(inputs.waist)||0;const hip=parseFloat(inputs.hip)||0;const whr=waist/hip;let risk=inputs.gender==='Male'?
+(whr<0.9?'Low':whr<0.95?'Moderate':'High'):
+(whr<0.8?'Low':whr<0.85?'Moderate':'High');return`Waist-to-Hip Ratio: ${whr.toFixed(2)}
+Health Risk: ${risk}
+Body Shape: ${whr >= (inputs.gender === 'Male' ? 0.9 : 0.8) ? 'Apple' : 'Pear'}`;}});
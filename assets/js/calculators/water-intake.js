@@ -0,0 +1,7 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("water-intake",{title:'Water Intake Calculator',icon:'fas fa-tint',inputs:[{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'},{id:'activity',label:'Activity Level',type:'select',options:['Sedentary','Light Activity','Moderate Activity','High Activity','Very High Activity']},{id:'climate',label:'Climate',type:'select',options:['Cool','Moderate','Hot']},{id:'health',label:'Health Status',type:'select',options:['Healthy','Fever/Illness','Pregnancy','Breastfeeding']}],calculate:function(inputs){const weight=parseFloat(inputs.weight)||0;let baseWater=weight*35;const activityMultipliers={'Sedentary':1.0,'Light Activity':1.2,'Moderate Activity':1.4,'High Activity':1.6,'Very High Activity':1.8};baseWater*=activityMultipliers[inputs.activity];const climateAdjustments={'Cool':1.0,'Moderate':1.1,'Hot':1.3};baseWater*=climateAdjustments[inputs.climate];const healthAdjustments={'Healthy':1.0,'Fever/Illness':1.15,'Pregnancy':1.3,'Breastfeeding':1.5};baseWater*=healthAdjustments[inputs.health];const waterLiters=baseWater/1000;const waterCups=baseWater/250;const waterOunces=baseWater/29.5735;return`Daily Water Intake: ${Math.round(baseWater)} ml
+In Liters: ${waterLiters.toFixed(1)} L
+In Cups (250ml): ${Math.round(waterCups)} cups
+In Fluid Ounces: ${Math.round(waterOunces)} fl oz
+Activity Level: ${inputs.activity}
+Climate: ${inputs.climate}`;}});
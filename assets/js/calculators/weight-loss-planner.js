@@ -0,0 +1,6 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("weight-loss-planner",{title:'Weight Loss Planner',icon:'fas fa-weight',inputs:[{id:'currentWeight',label:'Current Weight (kg)',type:'number',placeholder:'Enter current weight'},{id:'targetWeight',label:'Target Weight (kg)',type:'number',placeholder:'Enter target weight'},{id:'timeframe',label:'Timeframe (weeks)',type:'number',placeholder:'Enter desired timeframe'},{id:'activity',label:'Activity Level',type:'select',options:['Sedentary','Light Exercise','Moderate Exercise','Heavy Exercise']}],calculate:function(inputs){const currentWeight=parseFloat(inputs.currentWeight)||0;const targetWeight=parseFloat(inputs.targetWeight)||0;const timeframe=parseInt(inputs.timeframe)||1;const weightDiff=currentWeight-targetWeight;const weeklyLoss=weightDiff/timeframe;const dailyDeficit=(weeklyLoss*7700)/7;const activityMultipliers={'Sedentary':1.2,'Light Exercise':1.375,'Moderate Exercise':1.55,'Heavy Exercise':1.725};const bmr=currentWeight*24*activityMultipliers[inputs.activity];return`Required Daily Deficit: ${Math.round(dailyDeficit)} calories
+Weekly Weight Loss: ${weeklyLoss.toFixed(1)} kg
+Suggested Daily Calories: ${Math.round(bmr - dailyDeficit)} calories
+Total Weight Loss: ${weightDiff.toFixed(1)} kg
+Note: Maximum safe weight loss is 0.5-1 kg per week`;}});
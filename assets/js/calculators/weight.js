@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("weight",{title:'Weight Converter',icon:'fas fa-weight-hanging',inputs:[{id:'value',label:'Weight',type:'number',placeholder:'Enter weight'},{id:'fromUnit',label:'From Unit',type:'select',options:['mg','g','kg','t','oz','lb','st']},{id:'toUnit',label:'To Unit',type:'select',options:['mg','g','kg','t','oz','lb','st']}],requires:['unit-table','units'],calculate:function(inputs){const value=parseFloat(inputs.value)||0;const fromUnit=inputs.fromUnit;const toUnit=inputs.toUnit;const grams=convertUnit('weight',value,fromUnit,'g');const result=convertUnit('weight',value,fromUnit,toUnit);return`${value} ${fromUnit} = ${result.toFixed(6)} ${toUnit}
+Grams: ${grams.toFixed(3)} g
+Kilograms: ${(grams/1000).toFixed(6)} kg
+Pounds: ${(grams/453.592).toFixed(6)} lb`;}});
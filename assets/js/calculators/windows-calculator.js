@@ -0,0 +1,967 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("windows-calculator",{title:'Windows 10 Calculator',icon:'fab fa-windows',isCustomInterface:true,inputs:[],requires:['graphing'],calculate:function(inputs){return'Calculator ready for use';},renderCustomInterface:function(){setTimeout(()=>{if(typeof window.initWindowsCalculator==='function'){window.initWindowsCalculator();}},100);return`
+                <div class="windows-calculator-container">
+                    <div class="calculator-header">
+                        <div class="calculator-mode-selector">
+                            <button class="mode-btn active" data-mode="standard" onclick="window.switchMode('standard')">
+                                <i class="fas fa-calculator"></i>
+                                <span>Standard</span>
+                            </button>
+                            <button class="mode-btn" data-mode="scientific" onclick="window.switchMode('scientific')">
+                                <i class="fas fa-atom"></i>
+                                <span>Scientific</span>
+                            </button>
+                            <button class="mode-btn" data-mode="graphing" onclick="window.switchMode('graphing')">
+                                <i class="fas fa-chart-line"></i>
+                                <span>Graphing</span>
+                            </button>
+                            <button class="mode-btn" data-mode="programmer" onclick="window.switchMode('programmer')">
+                                <i class="fas fa-code"></i>
+                                <span>Programmer</span>
+                            </button>
+                        </div>
+                        <div class="calculator-history-memory">
+                            <button class="history-btn" onclick="window.toggleHistory()" title="View History">
+                                <i class="fas fa-history"></i>
+                            </button>
+                            <button class="memory-btn" onclick="window.toggleMemory()" title="View Memory">
+                                <i class="fas fa-memory"></i>
+                            </button>
+                        </div>
+                    </div>
+                    
+                    <div class="calculator-display-section">
+                        <div class="calculator-expression" id="calc-expression"></div>
+                        <div class="calculator-result" id="calc-result">0</div>
+                    </div>
+                    
+                    <div class="calculator-body">
+                        <div class="calculator-sidebar" id="calc-sidebar" style="display: none;">
+                            <div class="sidebar-content" id="sidebar-content">
+                                <div class="history-panel" id="history-panel">
+                                    <h4>History</h4>
+                                    <div class="history-list" id="history-list">
+                                        <p class="no-history">There's no history yet.</p>
+                                    </div>
+                                    <button class="clear-history-btn" onclick="window.clearHistory()">
+                                        <i class="fas fa-trash"></i> Clear all
+                                    </button>
+                                </div>
+                                <div class="memory-panel" id="memory-panel" style="display: none;">
+                                    <h4>Memory</h4>
+                                    <div class="memory-list" id="memory-list">
+                                        <p class="no-memory">There's nothing saved in memory.</p>
+                                    </div>
+                                    <button class="clear-memory-btn" onclick="window.clearMemory()">
+                                        <i class="fas fa-trash"></i> Clear all
+                                    </button>
+                                </div>
+                            </div>
+                        </div>
+                        
+                        <div class="calculator-keypad">
+                            <!-- Standard Mode Keypad -->
+                            <div id="standard-keypad" class="calculator-mode-panel">
+                                <!-- Memory Row -->
+                                <div class="memory-row">
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('clear')" title="Memory Clear">MC</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('recall')" title="Memory Recall">MR</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('add')" title="Memory Add">M+</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('subtract')" title="Memory Subtract">M-</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('store')" title="Memory Store">MS</button>
+                                    <button class="memory-btn-key" onclick="window.toggleMemory()" title="Memory View">M∨</button>
+                                </div>
+                                
+                                <!-- Function Row 1 -->
+                                <div class="function-row">
+                                    <button class="function-btn" onclick="window.calculatePercentage()" title="Percentage">%</button>
+                                    <button class="function-btn" onclick="window.clearEntry()" title="Clear Entry">CE</button>
+                                    <button class="function-btn" onclick="window.clearAll()" title="Clear All">C</button>
+                                    <button class="function-btn" onclick="window.backspace()" title="Backspace">
+                                        <i class="fas fa-backspace"></i>
+                                    </button>
+                                </div>
+                                
+                                <!-- Function Row 2 -->
+                                <div class="function-row">
+                                    <button class="function-btn" onclick="window.calculateReciprocal()" title="1/x">¹⁄ₓ</button>
+                                    <button class="function-btn" onclick="window.calculateSquare()" title="Square">x²</button>
+                                    <button class="function-btn" onclick="window.calculateSquareRoot()" title="Square Root">²√x</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('÷')" title="Divide">÷</button>
+                                </div>
+                                
+                                <!-- Number Row 1 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('7')">7</button>
+                                    <button class="number-btn" onclick="window.inputNumber('8')">8</button>
+                                    <button class="number-btn" onclick="window.inputNumber('9')">9</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('×')" title="Multiply">×</button>
+                                </div>
+                                
+                                <!-- Number Row 2 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('4')">4</button>
+                                    <button class="number-btn" onclick="window.inputNumber('5')">5</button>
+                                    <button class="number-btn" onclick="window.inputNumber('6')">6</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('-')" title="Subtract">−</button>
+                                </div>
+                                
+                                <!-- Number Row 3 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('1')">1</button>
+                                    <button class="number-btn" onclick="window.inputNumber('2')">2</button>
+                                    <button class="number-btn" onclick="window.inputNumber('3')">3</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('+')" title="Add">+</button>
+                                </div>
+                                
+                                <!-- Bottom Row -->
+                                <div class="bottom-row">
+                                    <button class="function-btn" onclick="window.toggleSign()" title="Plus/Minus">±</button>
+                                    <button class="number-btn zero-btn" onclick="window.inputNumber('0')">0</button>
+                                    <button class="function-btn" onclick="window.inputDecimal()" title="Decimal">.</button>
+                                    <button class="equals-btn" onclick="window.calculateResultWin()" title="Equals">=</button>
+                                </div>
+                            </div>
+
+                            <!-- Scientific Mode Keypad -->
+                            <div id="scientific-keypad" class="calculator-mode-panel" style="display: none;">
+                                <!-- Memory Row -->
+                                <div class="memory-row">
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('clear')" title="Memory Clear">MC</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('recall')" title="Memory Recall">MR</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('add')" title="Memory Add">M+</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('subtract')" title="Memory Subtract">M-</button>
+                                    <button class="memory-btn-key" onclick="window.memoryOperation('store')" title="Memory Store">MS</button>
+                                    <button class="memory-btn-key" onclick="window.toggleMemory()" title="Memory View">M∨</button>
+                                </div>
+
+                                <!-- Scientific Function Row 1 -->
+                                <div class="scientific-row">
+                                    <button class="function-btn" onclick="window.toggleAngleUnit()" title="Degrees/Radians" id="angle-unit-btn">DEG</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('factorial')" title="Factorial">n!</button>
+                                    <button class="function-btn" onclick="window.inputBracket('(')" title="Open Bracket">(</button>
+                                    <button class="function-btn" onclick="window.inputBracket(')')" title="Close Bracket">)</button>
+                                    <button class="function-btn" onclick="window.calculatePercentage()" title="Percentage">%</button>
+                                    <button class="function-btn" onclick="window.clearEntry()" title="Clear Entry">CE</button>
+                                </div>
+
+                                <!-- Scientific Function Row 2 -->
+                                <div class="scientific-row">
+                                    <button class="function-btn" onclick="window.calculateFunction('inv')" title="Inverse" id="inv-btn">Inv</button>
+                                    <button class="function-btn" onclick="window.calculateTrig('sin')" title="Sine">sin</button>
+                                    <button class="function-btn" onclick="window.calculateTrig('cos')" title="Cosine">cos</button>
+                                    <button class="function-btn" onclick="window.calculateTrig('tan')" title="Tangent">tan</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('ln')" title="Natural Log">ln</button>
+                                    <button class="function-btn" onclick="window.clearAll()" title="Clear All">C</button>
+                                </div>
+
+                                <!-- Scientific Function Row 3 -->
+                                <div class="scientific-row">
+                                    <button class="function-btn" onclick="window.inputConstant('π')" title="Pi">π</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('log')" title="Log Base 10">log</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('exp')" title="e^x">eˣ</button>
+                                    <button class="function-btn" onclick="window.calculatePower()" title="Power">xʸ</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('sqrt')" title="Square Root">√x</button>
+                                    <button class="function-btn" onclick="window.backspace()" title="Backspace">⌫</button>
+                                </div>
+
+                                <!-- Scientific Function Row 4 -->
+                                <div class="scientific-row">
+                                    <button class="function-btn" onclick="window.inputConstant('e')" title="Euler's Number">e</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('pow10')" title="10^x">10ˣ</button>
+                                    <button class="function-btn" onclick="window.calculateSquare()" title="Square">x²</button>
+                                    <button class="function-btn" onclick="window.calculateFunction('cubert')" title="Cube Root">³√x</button>
+                                    <button class="function-btn" onclick="window.calculateReciprocal()" title="Reciprocal">1/x</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('÷')" title="Divide">÷</button>
+                                </div>
+                                
+                                <!-- Number Row 1 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('7')">7</button>
+                                    <button class="number-btn" onclick="window.inputNumber('8')">8</button>
+                                    <button class="number-btn" onclick="window.inputNumber('9')">9</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('×')" title="Multiply">×</button>
+                                </div>
+                                
+                                <!-- Number Row 2 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('4')">4</button>
+                                    <button class="number-btn" onclick="window.inputNumber('5')">5</button>
+                                    <button class="number-btn" onclick="window.inputNumber('6')">6</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('-')" title="Subtract">−</button>
+                                </div>
+                                
+                                <!-- Number Row 3 -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('1')">1</button>
+                                    <button class="number-btn" onclick="window.inputNumber('2')">2</button>
+                                    <button class="number-btn" onclick="window.inputNumber('3')">3</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('+')" title="Add">+</button>
+                                </div>
+                                
+                                <!-- Bottom Row -->
+                                <div class="bottom-row">
+                                    <button class="function-btn" onclick="window.toggleSign()" title="Plus/Minus">±</button>
+                                    <button class="number-btn zero-btn" onclick="window.inputNumber('0')">0</button>
+                                    <button class="function-btn" onclick="window.inputDecimal()" title="Decimal">.</button>
+                                    <button class="equals-btn" onclick="window.calculateResultWin()" title="Equals">=</button>
+                                </div>
+                            </div>
+
+                            <!-- Programmer Mode Keypad -->
+                            <div id="programmer-keypad" class="calculator-mode-panel" style="display: none;">
+                                <!-- Programmer Controls -->
+                                <div class="programmer-controls">
+                                    <div class="base-selector">
+                                        <button class="base-btn active" onclick="window.switchBase('HEX')" data-base="HEX">HEX</button>
+                                        <button class="base-btn" onclick="window.switchBase('DEC')" data-base="DEC">DEC</button>
+                                        <button class="base-btn" onclick="window.switchBase('OCT')" data-base="OCT">OCT</button>
+                                        <button class="base-btn" onclick="window.switchBase('BIN')" data-base="BIN">BIN</button>
+                                    </div>
+                                    <div class="bit-display" id="bit-display">
+                                        <span class="bit-group">0000</span>
+                                        <span class="bit-group">0000</span>
+                                        <span class="bit-group">0000</span>
+                                        <span class="bit-group">0000</span>
+                                    </div>
+                                </div>
+
+                                <!-- Programmer Functions Row 1 -->
+                                <div class="programmer-row">
+                                    <button class="function-btn" onclick="window.calculateBitwise('lsh')" title="Left Shift">Lsh</button>
+                                    <button class="function-btn" onclick="window.calculateBitwise('rsh')" title="Right Shift">Rsh</button>
+                                    <button class="function-btn" onclick="window.calculateBitwise('or')" title="OR">Or</button>
+                                    <button class="function-btn" onclick="window.calculateBitwise('xor')" title="XOR">Xor</button>
+                                    <button class="function-btn" onclick="window.calculateBitwise('not')" title="NOT">Not</button>
+                                    <button class="function-btn" onclick="window.calculateBitwise('and')" title="AND">And</button>
+                                </div>
+
+                                <!-- Programmer Functions Row 2 -->
+                                <div class="programmer-row">
+                                    <button class="function-btn" onclick="window.clearEntry()" title="Clear Entry">CE</button>
+                                    <button class="function-btn" onclick="window.clearAll()" title="Clear All">C</button>
+                                    <button class="function-btn" onclick="window.backspace()" title="Backspace">⌫</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('÷')" title="Divide">÷</button>
+                                </div>
+
+                                <!-- Hex Row -->
+                                <div class="hex-row">
+                                    <button class="hex-btn" onclick="window.inputNumber('A')" id="btn-A">A</button>
+                                    <button class="hex-btn" onclick="window.inputNumber('B')" id="btn-B">B</button>
+                                    <button class="hex-btn" onclick="window.inputNumber('C')" id="btn-C">C</button>
+                                    <button class="hex-btn" onclick="window.inputNumber('D')" id="btn-D">D</button>
+                                    <button class="hex-btn" onclick="window.inputNumber('E')" id="btn-E">E</button>
+                                    <button class="hex-btn" onclick="window.inputNumber('F')" id="btn-F">F</button>
+                                </div>
+                                
+                                <!-- Number Rows for Programmer Mode -->
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('7')" id="btn-7">7</button>
+                                    <button class="number-btn" onclick="window.inputNumber('8')" id="btn-8">8</button>
+                                    <button class="number-btn" onclick="window.inputNumber('9')" id="btn-9">9</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('×')" title="Multiply">×</button>
+                                </div>
+                                
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('4')" id="btn-4">4</button>
+                                    <button class="number-btn" onclick="window.inputNumber('5')" id="btn-5">5</button>
+                                    <button class="number-btn" onclick="window.inputNumber('6')" id="btn-6">6</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('-')" title="Subtract">−</button>
+                                </div>
+                                
+                                <div class="number-row">
+                                    <button class="number-btn" onclick="window.inputNumber('1')" id="btn-1">1</button>
+                                    <button class="number-btn" onclick="window.inputNumber('2')" id="btn-2">2</button>
+                                    <button class="number-btn" onclick="window.inputNumber('3')" id="btn-3">3</button>
+                                    <button class="operation-btn" onclick="window.inputOperation('+')" title="Add">+</button>
+                                </div>
+                                
+                                <div class="bottom-row">
+                                    <button class="function-btn" onclick="window.toggleSign()" title="Plus/Minus">±</button>
+                                    <button class="number-btn zero-btn" onclick="window.inputNumber('0')" id="btn-0">0</button>
+                                    <button class="function-btn" onclick="window.inputDecimal()" title="Decimal">.</button>
+                                    <button class="equals-btn" onclick="window.calculateResultWin()" title="Equals">=</button>
+                                </div>
+                            </div>
+
+                            <!-- Graphing Mode Keypad -->
+                            <div id="graphing-keypad" class="calculator-mode-panel" style="display: none;">
+                                <div class="graphing-container">
+                                    <div class="function-input-area">
+                                        <input type="text" id="function-input" placeholder="f(x) = x^2 - 2; sin(x); 1/x" class="function-input">
+                                        <button class="graph-btn" onclick="window.plotFunction()" title="Plot Function">Plot</button>
+                                        <button class="graph-btn" onclick="window.clearGraph()" title="Clear Graph">Clear</button>
+                                    </div>
+                                    <canvas id="graphing-canvas" width="400" height="300"></canvas>
+                                    <div class="graphing-controls">
+                                        <div class="zoom-controls">
+                                            <button onclick="window.zoomIn()">Zoom In</button>
+                                            <button onclick="window.zoomOut()">Zoom Out</button>
+                                            <button onclick="window.resetView()">Reset View</button>
+                                        </div>
+                                    </div>
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                
+                <style>
+                .windows-calculator-container {
+                    max-width: 600px;
+                    margin: 0 auto;
+                    background: linear-gradient(145deg, #1e1e1e, #2d2d2d);
+                    border-radius: 12px;
+                    overflow: hidden;
+                    font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+                    box-shadow: 0 8px 32px rgba(0, 0, 0, 0.4);
+                    border: 1px solid #404040;
+                }
+                
+                .calculator-header {
+                    background: linear-gradient(145deg, #2d2d2d, #3a3a3a);
+                    padding: 15px;
+                    display: flex;
+                    justify-content: space-between;
+                    align-items: center;
+                    border-bottom: 1px solid #404040;
+                }
+                
+                .calculator-mode-selector {
+                    display: flex;
+                    gap: 8px;
+                }
+                
+                .mode-btn {
+                    background: linear-gradient(145deg, #404040, #505050);
+                    border: none;
+                    color: #ffffff;
+                    padding: 10px 16px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-size: 13px;
+                    font-weight: 500;
+                    transition: all 0.3s ease;
+                    display: flex;
+                    align-items: center;
+                    gap: 6px;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .mode-btn i {
+                    font-size: 14px;
+                }
+                
+                .mode-btn span {
+                    font-size: 12px;
+                }
+                
+                .mode-btn.active {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    box-shadow: 0 4px 12px rgba(0, 120, 212, 0.3);
+                    transform: translateY(-1px);
+                }
+                
+                .mode-btn:hover:not(.active) {
+                    background: linear-gradient(145deg, #525252, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .calculator-history-memory {
+                    display: flex;
+                    gap: 12px;
+                }
+                
+                .history-btn, .memory-btn {
+                    background: linear-gradient(145deg, #404040, #505050);
+                    border: none;
+                    color: #ffffff;
+                    padding: 10px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-size: 16px;
+                    transition: all 0.3s ease;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .history-btn:hover, .memory-btn:hover {
+                    background: linear-gradient(145deg, #525252, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .calculator-display-section {
+                    background: linear-gradient(145deg, #1e1e1e, #2a2a2a);
+                    padding: 25px;
+                    text-align: right;
+                    min-height: 140px;
+                    display: flex;
+                    flex-direction: column;
+                    justify-content: flex-end;
+                    border-bottom: 1px solid #404040;
+                }
+                
+                .calculator-expression {
+                    color: #888;
+                    font-size: 18px;
+                    margin-bottom: 12px;
+                    min-height: 22px;
+                    font-weight: 300;
+                    letter-spacing: 0.5px;
+                }
+                
+                .calculator-result {
+                    color: #ffffff;
+                    font-size: 52px;
+                    font-weight: 200;
+                    line-height: 1;
+                    word-break: break-all;
+                    text-shadow: 0 2px 4px rgba(0, 0, 0, 0.3);
+                }
+                
+                .calculator-body {
+                    display: flex;
+                    background: linear-gradient(145deg, #1e1e1e, #252525);
+                }
+                
+                .calculator-sidebar {
+                    width: 350px;
+                    background: linear-gradient(145deg, #2d2d2d, #3a3a3a);
+                    border-right: 1px solid #404040;
+                    transition: all 0.3s ease;
+                }
+                
+                .sidebar-content {
+                    padding: 25px;
+                    height: 450px;
+                    overflow-y: auto;
+                }
+                
+                .sidebar-content::-webkit-scrollbar {
+                    width: 6px;
+                }
+                
+                .sidebar-content::-webkit-scrollbar-track {
+                    background: #1e1e1e;
+                    border-radius: 3px;
+                }
+                
+                .sidebar-content::-webkit-scrollbar-thumb {
+                    background: #555;
+                    border-radius: 3px;
+                }
+                
+                .sidebar-content h4 {
+                    color: #ffffff;
+                    margin-bottom: 20px;
+                    font-size: 20px;
+                    font-weight: 300;
+                }
+                
+                .history-list, .memory-list {
+                    min-height: 320px;
+                }
+                
+                .no-history, .no-memory {
+                    color: #888;
+                    text-align: center;
+                    margin-top: 80px;
+                    font-size: 15px;
+                    font-style: italic;
+                }
+                
+                .clear-history-btn, .clear-memory-btn {
+                    background: linear-gradient(145deg, #404040, #505050);
+                    border: 1px solid #555;
+                    color: #ffffff;
+                    padding: 12px 20px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    width: 100%;
+                    margin-top: 20px;
+                    transition: all 0.3s ease;
+                    font-size: 14px;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .clear-history-btn:hover, .clear-memory-btn:hover {
+                    background: linear-gradient(145deg, #525252, #606060);
+                    transform: translateY(-1px);
+                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+                }
+                
+                .calculator-keypad {
+                    flex: 1;
+                    padding: 25px;
+                    background: linear-gradient(145deg, #1e1e1e, #252525);
+                }
+                
+                .memory-row, .function-row, .number-row, .bottom-row {
+                    display: grid;
+                    gap: 4px;
+                    margin-bottom: 4px;
+                }
+                
+                .scientific-row, .programmer-row, .hex-row {
+                    display: grid;
+                    grid-template-columns: repeat(6, 1fr);
+                    gap: 4px;
+                    margin-bottom: 4px;
+                }
+                
+                .memory-row {
+                    grid-template-columns: repeat(6, 1fr);
+                    margin-bottom: 8px;
+                }
+                
+                .function-row, .number-row {
+                    grid-template-columns: repeat(4, 1fr);
+                }
+                
+                .bottom-row {
+                    grid-template-columns: 1fr 2fr 1fr 1fr;
+                }
+                
+                .calculator-mode-panel {
+                    transition: all 0.3s ease;
+                }
+                
+                .memory-btn-key, .function-btn, .number-btn, .operation-btn, .equals-btn {
+                    height: 65px;
+                    border: none;
+                    border-radius: 8px;
+                    font-size: 18px;
+                    font-weight: 500;
+                    cursor: pointer;
+                    transition: all 0.2s ease;
+                    user-select: none;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                    position: relative;
+                    overflow: hidden;
+                }
+                
+                .memory-btn-key {
+                    background: linear-gradient(145deg, #323232, #404040);
+                    color: #ffffff;
+                    font-size: 14px;
+                }
+                
+                .function-btn {
+                    background: linear-gradient(145deg, #323232, #404040);
+                    color: #ffffff;
+                }
+                
+                .number-btn {
+                    background: linear-gradient(145deg, #404040, #525252);
+                    color: #ffffff;
+                    font-size: 24px;
+                    font-weight: 300;
+                }
+                
+                .operation-btn {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    color: #ffffff;
+                    font-size: 20px;
+                }
+                
+                .equals-btn {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    color: #ffffff;
+                    font-size: 22px;
+                    font-weight: 600;
+                }
+                
+                .memory-btn-key:hover {
+                    background: linear-gradient(145deg, #505050, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .function-btn:hover {
+                    background: linear-gradient(145deg, #505050, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .number-btn:hover {
+                    background: linear-gradient(145deg, #525252, #656565);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .operation-btn:hover {
+                    background: linear-gradient(145deg, #106ebe, #1e88e5);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 120, 212, 0.4);
+                }
+                
+                .equals-btn:hover {
+                    background: linear-gradient(145deg, #106ebe, #1e88e5);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 120, 212, 0.4);
+                }
+                
+                .memory-btn-key:active, .function-btn:active, .number-btn:active, .operation-btn:active {
+                    transform: translateY(0px);
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .equals-btn:active {
+                    transform: translateY(0px);
+                    box-shadow: 0 2px 8px rgba(0, 120, 212, 0.3);
+                }
+                
+                .zero-btn {
+                    grid-column: span 1;
+                }
+                
+                .history-item, .memory-item {
+                    background: linear-gradient(145deg, #404040, #525252);
+                    border-radius: 8px;
+                    padding: 15px;
+                    margin-bottom: 10px;
+                    color: #ffffff;
+                    cursor: pointer;
+                    transition: all 0.3s ease;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .history-item:hover, .memory-item:hover {
+                    background: linear-gradient(145deg, #525252, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .history-expression {
+                    font-size: 14px;
+                    color: #ccc;
+                    margin-bottom: 6px;
+                    font-weight: 300;
+                }
+                
+                .history-result {
+                    font-size: 20px;
+                    font-weight: 500;
+                }
+                
+                /* Programmer Mode Styles */
+                .programmer-controls {
+                    margin-bottom: 20px;
+                    padding: 20px;
+                    background: linear-gradient(145deg, #2d2d2d, #3a3a3a);
+                    border-radius: 10px;
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2);
+                }
+                
+                .base-selector {
+                    display: flex;
+                    gap: 6px;
+                    margin-bottom: 18px;
+                }
+                
+                .base-btn {
+                    background: linear-gradient(145deg, #404040, #525252);
+                    border: none;
+                    color: #ffffff;
+                    padding: 10px 18px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-size: 14px;
+                    font-weight: 600;
+                    transition: all 0.3s ease;
+                    flex: 1;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .base-btn.active {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    color: #ffffff;
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 120, 212, 0.4);
+                }
+                
+                .base-btn:hover:not(.active) {
+                    background: linear-gradient(145deg, #525252, #656565);
+                    transform: translateY(-1px);
+                    box-shadow: 0 4px 12px rgba(0, 0, 0, 0.3);
+                }
+                
+                .bit-display {
+                    display: flex;
+                    gap: 10px;
+                    font-family: 'Courier New', monospace;
+                    font-size: 18px;
+                    font-weight: bold;
+                    justify-content: center;
+                    align-items: center;
+                    background: linear-gradient(145deg, #1e1e1e, #2a2a2a);
+                    padding: 15px;
+                    border-radius: 8px;
+                    border: 1px solid #404040;
+                    box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.3);
+                }
+                
+                .bit-group {
+                    color: #0078d4;
+                    letter-spacing: 3px;
+                    text-shadow: 0 0 8px rgba(0, 120, 212, 0.3);
+                }
+                
+                .hex-btn {
+                    background: linear-gradient(145deg, #323232, #404040);
+                    border: none;
+                    color: #ffffff;
+                    height: 65px;
+                    border-radius: 8px;
+                    font-size: 18px;
+                    font-weight: 500;
+                    cursor: pointer;
+                    transition: all 0.2s ease;
+                    user-select: none;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .hex-btn:hover {
+                    background: linear-gradient(145deg, #505050, #606060);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .hex-btn:active {
+                    transform: translateY(0px);
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .hex-btn:disabled {
+                    opacity: 0.3;
+                    cursor: not-allowed;
+                    transform: none;
+                    box-shadow: none;
+                }
+                
+                /* Scientific Mode Styles */
+                .function-btn.active {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    color: #ffffff;
+                    box-shadow: 0 4px 16px rgba(0, 120, 212, 0.4);
+                    transform: translateY(-1px);
+                }
+                
+                /* Graphing Mode Styles */
+                .graphing-container {
+                    padding: 25px;
+                    background: linear-gradient(145deg, #2d2d2d, #3a3a3a);
+                    border-radius: 10px;
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.2);
+                }
+                
+                .function-input-area {
+                    display: flex;
+                    gap: 12px;
+                    margin-bottom: 20px;
+                    align-items: center;
+                }
+                
+                .function-input {
+                    flex: 1;
+                    background: linear-gradient(145deg, #1e1e1e, #2a2a2a);
+                    border: 1px solid #404040;
+                    color: #ffffff;
+                    padding: 12px;
+                    border-radius: 8px;
+                    font-size: 16px;
+                    box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.2);
+                    transition: all 0.3s ease;
+                }
+                
+                .function-input:focus {
+                    outline: none;
+                    border-color: #0078d4;
+                    box-shadow: inset 0 2px 8px rgba(0, 0, 0, 0.2), 0 0 0 2px rgba(0, 120, 212, 0.3);
+                }
+                
+                .graph-btn {
+                    background: linear-gradient(145deg, #0078d4, #106ebe);
+                    border: none;
+                    color: #ffffff;
+                    padding: 12px 24px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-size: 14px;
+                    font-weight: 500;
+                    transition: all 0.3s ease;
+                    box-shadow: 0 2px 8px rgba(0, 120, 212, 0.3);
+                }
+                
+                .graph-btn:hover {
+                    background: linear-gradient(145deg, #106ebe, #1e88e5);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 120, 212, 0.4);
+                }
+                
+                #graphing-canvas {
+                    border: 1px solid #404040;
+                    border-radius: 8px;
+                    background: linear-gradient(145deg, #1e1e1e, #252525);
+                    display: block;
+                    margin: 0 auto 20px;
+                    box-shadow: inset 0 2px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                .graphing-controls {
+                    display: flex;
+                    justify-content: center;
+                    gap: 12px;
+                }
+                
+                .zoom-controls button {
+                    background: linear-gradient(145deg, #404040, #525252);
+                    border: none;
+                    color: #ffffff;
+                    padding: 10px 18px;
+                    border-radius: 8px;
+                    cursor: pointer;
+                    font-size: 14px;
+                    font-weight: 500;
+                    transition: all 0.3s ease;
+                    box-shadow: 0 2px 8px rgba(0, 0, 0, 0.2);
+                }
+                
+                .zoom-controls button:hover {
+                    background: linear-gradient(145deg, #525252, #656565);
+                    transform: translateY(-2px);
+                    box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+                }
+                
+                @media (max-width: 768px) {
+                    .windows-calculator-container {
+                        max-width: 95%;
+                        margin: 10px auto;
+                    }
+                    
+                    .calculator-header {
+                        flex-direction: column;
+                        gap: 15px;
+                        padding: 20px;
+                    }
+                    
+                    .calculator-mode-selector {
+                        width: 100%;
+                        justify-content: space-between;
+                    }
+                    
+                    .mode-btn {
+                        flex: 1;
+                        padding: 12px 8px;
+                    }
+                    
+                    .mode-btn span {
+                        display: none;
+                    }
+                    
+                    .mode-btn i {
+                        font-size: 16px;
+                    }
+                    
+                    .calculator-body {
+                        flex-direction: column;
+                    }
+                    
+                    .calculator-sidebar {
+                        width: 100%;
+                        border-right: none;
+                        border-top: 1px solid #404040;
+                    }
+                    
+                    .sidebar-content {
+                        height: 300px;
+                    }
+                    
+                    .calculator-result {
+                        font-size: 42px;
+                    }
+                    
+                    .calculator-expression {
+                        font-size: 16px;
+                    }
+                    
+                    .memory-btn-key, .function-btn, .number-btn, .operation-btn, .equals-btn, .hex-btn {
+                        height: 55px;
+                        font-size: 16px;
+                    }
+                    
+                    .number-btn {
+                        font-size: 22px;
+                    }
+                    
+                    .calculator-keypad {
+                        padding: 20px;
+                    }
+                    
+                    .bit-display {
+                        font-size: 16px;
+                        gap: 8px;
+                        padding: 12px;
+                    }
+                    
+                    .bit-group {
+                        letter-spacing: 2px;
+                    }
+                    
+                    .function-input-area {
+                        flex-direction: column;
+                        gap: 10px;
+                    }
+                    
+                    .graph-btn {
+                        width: 100%;
+                        padding: 15px;
+                    }
+                    
+                    #graphing-canvas {
+                        width: 100%;
+                        height: 250px;
+                    }
+                    
+                    .zoom-controls {
+                        flex-wrap: wrap;
+                        gap: 8px;
+                    }
+                    
+                    .zoom-controls button {
+                        flex: 1;
+                        min-width: 80px;
+                    }
+                }
+                
+                @media (max-width: 480px) {
+                    .calculator-display-section {
+                        padding: 20px;
+                        min-height: 120px;
+                    }
+                    
+                    .calculator-result {
+                        font-size: 36px;
+                    }
+                    
+                    .memory-btn-key, .function-btn, .number-btn, .operation-btn, .equals-btn, .hex-btn {
+                        height: 50px;
+                        font-size: 14px;
+                    }
+                    
+                    .number-btn {
+                        font-size: 20px;
+                    }
+                    
+                    .calculator-keypad {
+                        padding: 15px;
+                    }
+                    
+                    .memory-row, .function-row, .number-row, .bottom-row, .scientific-row, .programmer-row, .hex-row {
+                        gap: 3px;
+                        margin-bottom: 3px;
+                    }
+                }
+                </style>
+            `;}});
@@ -0,0 +1,8 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("wire-gauge",{title:'Wire Gauge Calculator',icon:'fas fa-ruler',inputs:[{id:'current',label:'Current (A)',type:'number',placeholder:'Enter current'},{id:'length',label:'Wire Length (ft)',type:'number',placeholder:'Enter wire length'},{id:'voltage',label:'Voltage (V)',type:'number',placeholder:'Enter voltage'},{id:'voltDrop',label:'Max Voltage Drop (%)',type:'number',placeholder:'Enter max voltage drop',value:'3'}],calculate:function(inputs){const current=parseFloat(inputs.current)||0;const length=parseFloat(inputs.length)||0;const voltage=parseFloat(inputs.voltage)||0;const voltDropPercent=parseFloat(inputs.voltDrop)||3;const maxVoltDrop=voltage*(voltDropPercent/100);const resistance=maxVoltDrop/current;const resistancePerFoot=resistance/(2*length);const awgData={'14':3.07,'12':1.93,'10':1.21,'8':0.764,'6':0.491,'4':0.308,'2':0.194,'1/0':0.122,'2/0':0.0967,'3/0':0.0766,'4/0':0.0608,'250':0.0515,'300':0.0429,'350':0.0367,'400':0.0321};let recommendedGauge='400 MCM';for(const[gauge,resistance1000ft]of Object.entries(awgData)){const actualResistance=resistance1000ft/1000;if(actualResistance<=resistancePerFoot){recommendedGauge=gauge+' AWG';break;}}
+return`Recommended Wire Gauge: ${recommendedGauge}
+Maximum Voltage Drop: ${maxVoltDrop.toFixed(2)} V (${voltDropPercent}%)
+Required Resistance: ${resistance.toFixed(4)} Ω
+Resistance per Foot: ${(resistancePerFoot * 1000).toFixed(4)} mΩ/ft
+Current: ${current} A
+Wire Length: ${length} ft (one way)`;}});
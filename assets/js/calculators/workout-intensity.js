@@ -0,0 +1,10 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("workout-intensity",{title:'Workout Intensity Calculator',icon:'fas fa-dumbbell',inputs:[{id:'exerciseType',label:'Exercise Type',type:'select',options:['Walking','Jogging','Running','Cycling','Swimming','Weight Training','HIIT','Yoga']},{id:'duration',label:'Duration (minutes)',type:'number',placeholder:'Enter workout duration'},{id:'intensity',label:'Perceived Intensity (1-10)',type:'select',options:['1 - Very Light','2 - Light','3 - Light','4 - Moderate','5 - Moderate','6 - Hard','7 - Hard','8 - Very Hard','9 - Very Hard','10 - Maximum']},{id:'weight',label:'Weight (kg)',type:'number',placeholder:'Enter weight'}],calculate:function(inputs){const duration=parseFloat(inputs.duration)||0;const intensity=parseInt(inputs.intensity.charAt(0))||1;const weight=parseFloat(inputs.weight)||70;const metValues={'Walking':3.5,'Jogging':7.0,'Running':11.0,'Cycling':8.0,'Swimming':8.0,'Weight Training':6.0,'HIIT':12.0,'Yoga':2.5};const baseMET=metValues[inputs.exerciseType]||5.0;const intensityMultiplier=intensity/5;const adjustedMET=baseMET*intensityMultiplier;const caloriesBurned=adjustedMET*weight*(duration/60);let trainingZone;if(intensity<=3)trainingZone='Active Recovery';else if(intensity<=5)trainingZone='Aerobic Base';else if(intensity<=7)trainingZone='Tempo';else if(intensity<=9)trainingZone='Lactate Threshold';else trainingZone='VO2 Max';let recoveryTime;if(intensity<=4)recoveryTime='0-12 hours';else if(intensity<=6)recoveryTime='12-24 hours';else if(intensity<=8)recoveryTime='24-48 hours';else recoveryTime='48-72 hours';return`Workout Analysis:
+Exercise: ${inputs.exerciseType}
+Duration: ${duration} minutes
+Intensity: ${intensity}/10 (${trainingZone})
+Calories Burned: ${Math.round(caloriesBurned)}
+MET Value: ${adjustedMET.toFixed(1)}
+
+Recovery Time: ${recoveryTime}
+Training Effect: ${intensity >= 7 ? 'High' : intensity >= 5 ? 'Moderate' : 'Low'}`;}});
@@ -0,0 +1,5 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+registerCalculator("yield-farming",{title:'Yield Farming Calculator',icon:'fas fa-seedling',inputs:[{id:'principal',label:'Principal Amount ($)',type:'number',placeholder:'Enter principal amount'},{id:'apy',label:'APY (%)',type:'number',placeholder:'Enter APY',step:'0.01'},{id:'compoundFrequency',label:'Compounds per Year',type:'number',placeholder:'Enter compound frequency'},{id:'timeInYears',label:'Time Period (years)',type:'number',placeholder:'Enter time period',step:'0.1'}],calculate:function(inputs){const principal=parseFloat(inputs.principal)||0;const apy=parseFloat(inputs.apy)||0;const compoundFrequency=parseFloat(inputs.compoundFrequency)||365;const timeInYears=parseFloat(inputs.timeInYears)||1;const r=apy/100;const n=compoundFrequency;const t=timeInYears;const amount=principal*Math.pow(1+(r/n),n*t);const profit=amount-principal;return`Final Amount: $${amount.toFixed(2)}
+Total Profit: $${profit.toFixed(2)}
+Daily Profit: $${((profit / (t * 365))).toFixed(2)}
+APY: ${apy}%`;}});
@@ -0,0 +1,346 @@
+// Streaming CSV <-> JSON conversion for the convertors page (mirrored by data_convert.py).
+// Runs as a Web Worker: the file is read a chunk at a time through File.stream(), each chunk is
+// converted as soon as it is decoded, and the output is collected as Blob parts, so neither the
+// input nor the output has to fit in a JavaScript string and the page stays responsive.
+//
+// CSV is read the way RFC 4180 describes it and exactly as Python's csv module reads it: quoted
+// fields may hold commas, doubled quotes and line breaks; records end at CRLF, LF or CR. JSON input
+// is split into array elements by a bracket scanner so only one row is ever parsed at a time.
+
+// Output text is turned into a Blob part once this many characters are pending (small parts keep
+// the pending strings out of the old generation of the garbage collector)
+const DATA_CONVERT_BLOB_PART = 1 << 18;
+// Minimum time between progress messages
+const DATA_CONVERT_PROGRESS_MS = 100;
+const DATA_CONVERT_INVALID_JSON = 'Invalid JSON format';
+const DATA_CONVERT_NOT_ROWS = 'JSON must be an array of objects';
+
+// CSV parser states (the names follow Python's _csv.c)
+const CSV_START_RECORD = 0, CSV_START_FIELD = 1, CSV_IN_FIELD = 2, CSV_IN_QUOTED_FIELD = 3,
+    CSV_QUOTE_IN_QUOTED_FIELD = 4, CSV_EAT_LF = 5;
+const CSV_COMMA = 44, CSV_QUOTE = 34, CSV_CR = 13, CSV_LF = 10;
+
+// Feed text in pieces of any size; onRecord gets each record's fields ([] for a blank line)
+function createCsvParser(onRecord) {
+    let state = CSV_START_RECORD;
+    let fields = [];
+    let field = '';
+    return {
+        feed(text) {
+            // The loop works on locals (much faster than the closure's variables) and stores them back
+            let s = state, current = fields, value = field;
+            // Start of the current field's characters in this piece; they are copied out with one slice
+            let start = 0;
+            for (let i = 0; i < text.length; i++) {
+                const c = text.charCodeAt(i);
+                switch (s) {
+                case CSV_EAT_LF:
+                    if (c === CSV_LF) {
+                        s = CSV_START_RECORD;
+                        break;
+                    }
+                    // falls through: a lone CR ended the record
+                case CSV_START_RECORD:
+                    if (c === CSV_CR || c === CSV_LF) {
+                        onRecord(current);
+                        current = [];
+                        s = c === CSV_CR ? CSV_EAT_LF : CSV_START_RECORD;
+                        break;
+                    }
+                    // falls through
+                case CSV_START_FIELD:
+                    if (c === CSV_QUOTE) {
+                        s = CSV_IN_QUOTED_FIELD;
+                        start = i + 1;
+                    } else if (c === CSV_COMMA || c === CSV_CR || c === CSV_LF) {
+                        current.push('');
+                        if (c === CSV_COMMA) {
+                            s = CSV_START_FIELD;
+                        } else {
+                            onRecord(current);
+                            current = [];
+                            s = c === CSV_CR ? CSV_EAT_LF : CSV_START_RECORD;
+                        }
+                    } else {
+                        s = CSV_IN_FIELD;
+                        start = i;
+                    }
+                    break;
+                case CSV_IN_FIELD:
+                    if (c === CSV_COMMA || c === CSV_CR || c === CSV_LF) {
+                        current.push(value + text.slice(start, i));
+                        value = '';
+                        if (c === CSV_COMMA) {
+                            s = CSV_START_FIELD;
+                        } else {
+                            onRecord(current);
+                            current = [];
+                            s = c === CSV_CR ? CSV_EAT_LF : CSV_START_RECORD;
+                        }
+                    }
+                    break;
+                case CSV_IN_QUOTED_FIELD:
+                    if (c === CSV_QUOTE) {
+                        value += text.slice(start, i);
+                        s = CSV_QUOTE_IN_QUOTED_FIELD;
+                    }
+                    break;
+                case CSV_QUOTE_IN_QUOTED_FIELD:
+                    if (c === CSV_QUOTE) {
+                        // A doubled quote: keep one and carry on inside the quotes
+                        start = i;
+                        s = CSV_IN_QUOTED_FIELD;
+                    } else if (c === CSV_COMMA || c === CSV_CR || c === CSV_LF) {
+                        current.push(value);
+                        value = '';
+                        if (c === CSV_COMMA) {
+                            s = CSV_START_FIELD;
+                        } else {
+                            onRecord(current);
+                            current = [];
+                            s = c === CSV_CR ? CSV_EAT_LF : CSV_START_RECORD;
+                        }
+                    } else {
+                        // Text after a closing quote is kept, as csv does when not strict
+                        start = i;
+                        s = CSV_IN_FIELD;
+                    }
+                    break;
+                }
+            }
+            if (s === CSV_IN_FIELD || s === CSV_IN_QUOTED_FIELD) value += text.slice(start);
+            state = s;
+            fields = current;
+            field = value;
+        },
+        end() {
+            // A last record without a line break; an unclosed quote runs to the end of the file
+            if (state !== CSV_START_RECORD && state !== CSV_EAT_LF) {
+                fields.push(field);
+                onRecord(fields);
+            }
+            state = CSV_START_RECORD;
+            fields = [];
+            field = '';
+        }
+    };
+}
+
+// Header row as JSON keys: blank names become column_<n> and repeats get a _2, _3... suffix
+function csvJsonKeys(headers) {
+    const used = new Set();
+    return headers.map((header, index) => {
+        const base = header === '' ? 'column_' + (index + 1) : header;
+        let name = base;
+        for (let n = 2; used.has(name); n++) name = base + '_' + n;
+        used.add(name);
+        return JSON.stringify(name);
+    });
+}
+
+// CSV in, JSON array of row objects out, laid out as JSON.stringify(rows, null, 2) would;
+// short rows are padded with '' and extra fields dropped. end() returns the row count.
+function createCsvToJson(write) {
+    let keys = null;
+    let rows = 0;
+    const parser = createCsvParser(fields => {
+        if (fields.length === 0) return;
+        if (!keys) {
+            keys = csvJsonKeys(fields);
+            return;
+        }
+        let text = rows === 0 ? '[\n  {' : ',\n  {';
+        for (let i = 0; i < keys.length; i++) {
+            text += (i === 0 ? '\n    ' : ',\n    ') + keys[i] + ': ' + JSON.stringify(i < fields.length ? fields[i] : '');
+        }
+        write(text + '\n  }');
+        rows++;
+    });
+    return {
+        feed: text => parser.feed(text),
+        end() {
+            parser.end();
+            write(rows === 0 ? '[]' : '\n]');
+            return rows;
+        }
+    };
+}
+
+const JSON_WHITESPACE = /^[ \t\n\r]*$/;
+
+// Feed the text of a JSON array in pieces of any size; onElement gets each parsed element in turn
+function createJsonArrayParser(onElement) {
+    let started = false, finished = false;
+    let depth = 0, inString = false, escaped = false;
+    let pending = '';
+    let count = 0;
+    function element(source, closing) {
+        if (JSON_WHITESPACE.test(source)) {
+            // '[]' is fine; '[,' and '[1,]' are not
+            if (closing && count === 0) return;
+            throw new Error(DATA_CONVERT_INVALID_JSON);
+        }
+        let value;
+        try {
+            value = JSON.parse(source);
+        } catch (error) {
+            throw new Error(DATA_CONVERT_INVALID_JSON);
+        }
+        count++;
+        onElement(value);
+    }
+    return {
+        feed(text) {
+            let i = 0;
+            if (!started) {
+                while (i < text.length && JSON_WHITESPACE.test(text[i])) i++;
+                if (i === text.length) return;
+                if (text[i] !== '[') throw new Error(DATA_CONVERT_NOT_ROWS);
+                started = true;
+                i++;
+            }
+            if (finished) {
+                if (!JSON_WHITESPACE.test(text.slice(i))) throw new Error(DATA_CONVERT_INVALID_JSON);
+                return;
+            }
+            // Scanner state in locals for the loop, stored back afterwards
+            let d = depth, quoted = inString, skip = escaped;
+            let start = i;
+            for (; i < text.length; i++) {
+                const c = text.charCodeAt(i);
+                if (quoted) {
+                    if (skip) skip = false;
+                    else if (c === 92) skip = true;
+                    else if (c === 34) quoted = false;
+                } else if (c === 34) {
+                    quoted = true;
+                } else if (c === 123 || c === 91) {
+                    d++;
+                } else if (c === 125 || c === 93) {
+                    if (d > 0) {
+                        d--;
+                    } else if (c === 93) {
+                        element(pending + text.slice(start, i), true);
+                        pending = '';
+                        finished = true;
+                        if (!JSON_WHITESPACE.test(text.slice(i + 1))) throw new Error(DATA_CONVERT_INVALID_JSON);
+                        return;
+                    } else {
+                        throw new Error(DATA_CONVERT_INVALID_JSON);
+                    }
+                } else if (c === 44 && d === 0) {
+                    element(pending + text.slice(start, i), false);
+                    pending = '';
+                    start = i + 1;
+                }
+            }
+            pending += text.slice(start);
+            depth = d;
+            inString = quoted;
+            escaped = skip;
+        },
+        end() {
+            if (!finished) throw new Error(DATA_CONVERT_INVALID_JSON);
+        }
+    };
+}
+
+// A CSV field, quoted only when it holds a comma, quote or line break
+function csvField(text) {
+    return /[",\r\n]/.test(text) ? '"' + text.replace(/"/g, '""') + '"' : text;
+}
+
+// A CSV line; a lone empty field is quoted so the line does not read as blank
+function csvLine(values) {
+    return (values.length === 1 && values[0] === '' ? '""' : values.map(csvField).join(',')) + '\r\n';
+}
+
+// JSON array of objects in, CSV out. The columns are the first object's keys; missing values and
+// null are empty, nested objects and arrays are written as JSON. end() returns the row count.
+function createJsonToCsv(write) {
+    let headers = null;
+    let rows = 0;
+    const parser = createJsonArrayParser(row => {
+        if (row === null || typeof row !== 'object' || Array.isArray(row)) throw new Error(DATA_CONVERT_NOT_ROWS);
+        if (!headers) {
+            headers = Object.keys(row);
+            write(csvLine(headers));
+        }
+        write(csvLine(headers.map(header => {
+            const value = Object.prototype.hasOwnProperty.call(row, header) ? row[header] : null;
+            return value === null ? '' : typeof value === 'object' ? JSON.stringify(value) : String(value);
+        })));
+        rows++;
+    });
+    return {
+        feed: text => parser.feed(text),
+        end() {
+            parser.end();
+            if (rows === 0) throw new Error(DATA_CONVERT_NOT_ROWS);
+            return rows;
+        }
+    };
+}
+
+// Collects output text as Blob parts of about DATA_CONVERT_BLOB_PART characters
+function createBlobWriter() {
+    const blobs = [];
+    let parts = [];
+    let pending = 0;
+    return {
+        write(text) {
+            parts.push(text);
+            pending += text.length;
+            if (pending >= DATA_CONVERT_BLOB_PART) {
+                // One string per part: a Blob built from thousands of small strings is far slower
+                blobs.push(new Blob([parts.join('')]));
+                parts = [];
+                pending = 0;
+            }
+        },
+        blob(type) {
+            return new Blob(blobs.concat(parts.join('')), { type });
+        }
+    };
+}
+
+// Convert a File or Blob ('csv-to-json' or 'json-to-csv'), reporting onProgress(bytesRead, totalBytes)
+// as it goes. Resolves to { blob, rows }.
+async function convertDataFile(file, kind, onProgress) {
+    const output = createBlobWriter();
+    const converter = kind === 'csv-to-json' ? createCsvToJson(output.write) : createJsonToCsv(output.write);
+    const decoder = new TextDecoder();
+    const reader = file.stream().getReader();
+    let loaded = 0;
+    let reported = 0;
+    let rows;
+    try {
+        for (;;) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            converter.feed(decoder.decode(value, { stream: true }));
+            loaded += value.byteLength;
+            if (onProgress && Date.now() - reported >= DATA_CONVERT_PROGRESS_MS) {
+                reported = Date.now();
+                onProgress(loaded, file.size);
+            }
+        }
+        converter.feed(decoder.decode());
+        rows = converter.end();
+    } catch (error) {
+        reader.cancel();
+        throw error;
+    }
+    return { blob: output.blob(kind === 'csv-to-json' ? 'application/json' : 'text/csv'), rows };
+}
+
+// Worker entry point: receives { file, kind } and posts { type: 'progress', loaded, total } messages,
+// then { type: 'done', blob, rows } or { type: 'error', message }
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    self.onmessage = event => {
+        const { file, kind } = event.data;
+        convertDataFile(file, kind, (loaded, total) => self.postMessage({ type: 'progress', loaded, total })).then(
+            ({ blob, rows }) => self.postMessage({ type: 'done', blob, rows }),
+            error => self.postMessage({ type: 'error', message: error.message }));
+    };
+}
@@ -0,0 +1,405 @@
+// Function plotting for the Windows calculator's graphing mode.
+// An expression is parsed once into a whitelisted JavaScript function and cached by its text.
+// Each function is sampled on a grid of GRAPH_SAMPLE_PX pixels that is subdivided wherever the
+// curve is not yet flat to within GRAPH_FLATNESS_PX; a segment that stays steep down to the
+// finest subdivision is a discontinuity (tan, 1/x, floor) and is left unconnected. Samples are
+// kept in graph coordinates per zoom level, so panning only samples the newly exposed strip and
+// returning to a recent zoom level samples nothing; redraws are batched to one per frame.
+
+const GRAPH_UNIT_PX = 20;
+const GRAPH_SAMPLE_PX = 2;
+const GRAPH_MAX_DEPTH = 8;
+const GRAPH_FLATNESS_PX = 0.25;
+const GRAPH_JUMP_PX = 4;
+const GRAPH_CACHED_ZOOMS = 4;
+// Cached samples reach this many canvas widths past the view before they are dropped
+const GRAPH_CACHE_WIDTHS = 8;
+const GRAPH_COLORS = ['#0078d4', '#e81123', '#16c60c', '#ff8c00', '#b146c2', '#00b7c3'];
+
+const GRAPH_CONSTANTS = { pi: 'Math.PI', 'π': 'Math.PI', e: 'Math.E', tau: '(2*Math.PI)' };
+const GRAPH_FUNCTIONS = {
+    sin: 'Math.sin', cos: 'Math.cos', tan: 'Math.tan',
+    asin: 'Math.asin', acos: 'Math.acos', atan: 'Math.atan',
+    arcsin: 'Math.asin', arccos: 'Math.acos', arctan: 'Math.atan',
+    sinh: 'Math.sinh', cosh: 'Math.cosh', tanh: 'Math.tanh',
+    sec: '1/Math.cos', csc: '1/Math.sin', cot: '1/Math.tan',
+    sqrt: 'Math.sqrt', cbrt: 'Math.cbrt', abs: 'Math.abs', exp: 'Math.exp',
+    ln: 'Math.log', log: 'Math.log10', log10: 'Math.log10', log2: 'Math.log2',
+    floor: 'Math.floor', ceil: 'Math.ceil', round: 'Math.round', sign: 'Math.sign',
+    min: 'Math.min', max: 'Math.max', pow: 'Math.pow'
+};
+
+const compiledExpressions = new Map();
+
+function tokenizeExpression(text) {
+    const pattern = /\s*(?:(\d+\.?\d*(?:e[+-]?\d+)?|\.\d+(?:e[+-]?\d+)?)|(?:Math\.)?([a-zA-Zπ_]\w*)|(\*\*|[-+*/^(),]))/y;
+    const tokens = [];
+    let position = 0;
+    text = text.trim();
+    while (position < text.length) {
+        pattern.lastIndex = position;
+        const match = pattern.exec(text);
+        if (!match) throw new Error(`Unexpected '${text[position]}' at position ${position + 1}`);
+        position = pattern.lastIndex;
+        if (match[1] !== undefined) tokens.push({ type: 'number', value: match[1] });
+        else if (match[2] !== undefined) tokens.push({ type: 'name', value: match[2].toLowerCase() });
+        else tokens.push({ type: match[3] === '**' ? '^' : match[3] });
+    }
+    return tokens;
+}
+
+// Recursive descent over the tokens, emitting JavaScript that can only reference x and Math.
+// ^ is right-associative and binds tighter than unary minus (-x^2 is -(x^2)); juxtaposition
+// multiplies (2x, 3sin(x), (x+1)(x-1)).
+function translateExpression(text) {
+    const tokens = tokenizeExpression(text);
+    let index = 0;
+    const peek = () => tokens[index] || { type: 'end' };
+    const expect = type => {
+        if (peek().type !== type) throw new Error(peek().type === 'end' ? `Missing '${type}'` : `Expected '${type}'`);
+        index++;
+    };
+
+    function additive() {
+        let left = multiplicative();
+        while (peek().type === '+' || peek().type === '-') {
+            const operator = tokens[index++].type;
+            left = `(${left}${operator}${multiplicative()})`;
+        }
+        return left;
+    }
+
+    function multiplicative() {
+        let left = unary();
+        for (;;) {
+            const type = peek().type;
+            if (type === '*' || type === '/') {
+                index++;
+                left = `(${left}${type}${unary()})`;
+            } else if (type === 'number' || type === 'name' || type === '(') {
+                left = `(${left}*${power()})`;
+            } else {
+                return left;
+            }
+        }
+    }
+
+    function unary() {
+        if (peek().type === '-') {
+            index++;
+            return `(-${unary()})`;
+        }
+        if (peek().type === '+') {
+            index++;
+            return unary();
+        }
+        return power();
+    }
+
+    function power() {
+        const base = primary();
+        if (peek().type !== '^') return base;
+        index++;
+        return `Math.pow(${base},${unary()})`;
+    }
+
+    function primary() {
+        const token = tokens[index++] || { type: 'end' };
+        if (token.type === 'number') return `(${Number(token.value)})`;
+        if (token.type === '(') {
+            const inner = additive();
+            expect(')');
+            return inner;
+        }
+        if (token.type === 'name') {
+            if (token.value === 'x') return 'x';
+            // Own keys only: inherited names such as 'constructor' or '__proto__' are not whitelisted
+            if (Object.hasOwn(GRAPH_CONSTANTS, token.value)) return GRAPH_CONSTANTS[token.value];
+            if (Object.hasOwn(GRAPH_FUNCTIONS, token.value)) {
+                expect('(');
+                const args = [additive()];
+                while (peek().type === ',') {
+                    index++;
+                    args.push(additive());
+                }
+                expect(')');
+                return `(${GRAPH_FUNCTIONS[token.value]}(${args.join(',')}))`;
+            }
+            throw new Error(`Unknown name '${token.value}'`);
+        }
+        throw new Error(token.type === 'end' ? 'Incomplete expression' : `Unexpected '${token.type}'`);
+    }
+
+    const source = additive();
+    if (index < tokens.length) throw new Error(`Unexpected '${tokens[index].value || tokens[index].type}'`);
+    return source;
+}
+
+// The expression as a function of x, compiled on first use and then served from the cache
+function compileExpression(text) {
+    const key = text.trim();
+    let compiled = compiledExpressions.get(key);
+    if (!compiled) {
+        compiled = new Function('x', `"use strict"; return ${translateExpression(key)};`);
+        compiledExpressions.set(key, compiled);
+    }
+    return compiled;
+}
+
+// "x^2; f(x) = sin(x)" -> ['x^2', 'sin(x)']
+function parseFunctionList(text) {
+    return String(text).split(/[;\n]/)
+        .map(part => part.replace(/^\s*(?:y|[a-zA-Z]\w*\s*\(\s*x\s*\))\s*=/, '').trim())
+        .filter(part => part !== '');
+}
+
+// Sample fn at grid points k * step for k in [k0, k1], subdividing between them. Returns runs of
+// connected points, each an array [x0, y0, x1, y1, ...] in graph coordinates; a new run starts
+// after every gap (undefined values or a discontinuity). unit is pixels per graph unit.
+function sampleFunction(fn, k0, k1, step, unit) {
+    const runs = [];
+    let run = null;
+    const evaluate = x => {
+        let y;
+        try {
+            y = fn(x);
+        } catch (error) {
+            return NaN;
+        }
+        return typeof y === 'number' ? y : NaN;
+    };
+    const flatness = GRAPH_FLATNESS_PX / unit;
+    const jump = GRAPH_JUMP_PX / unit;
+
+    // Still steep at the finest subdivision. A continuous curve splits the rise between the two
+    // halves; across a jump (floor) one half keeps nearly all of it, and across a pole (tan, 1/x)
+    // the midpoint falls outside the endpoints or is undefined.
+    function isJump(x0, y0, x1, y1) {
+        const ym = evaluate((x0 + x1) / 2);
+        if (!isFinite(ym) || ym < Math.min(y0, y1) || ym > Math.max(y0, y1)) return true;
+        return Math.max(Math.abs(ym - y0), Math.abs(y1 - ym)) > 0.9 * Math.abs(y1 - y0);
+    }
+
+    function point(x, y) {
+        if (!run) {
+            run = [];
+            runs.push(run);
+        }
+        run.push(x, y);
+    }
+
+    // Emit the curve over (x0, x1]; the point at x0 has already been handled
+    function refine(x0, y0, x1, y1, depth) {
+        const finite0 = isFinite(y0), finite1 = isFinite(y1);
+        if (depth < GRAPH_MAX_DEPTH && (finite0 || finite1)) {
+            const xm = (x0 + x1) / 2;
+            const ym = evaluate(xm);
+            const split = finite0 && finite1 && isFinite(ym)
+                ? Math.abs(ym - (y0 + y1) / 2) > flatness
+                : true;
+            if (split) {
+                refine(x0, y0, xm, ym, depth + 1);
+                refine(xm, ym, x1, y1, depth + 1);
+                return;
+            }
+        }
+        if (!finite1) {
+            run = null;
+            return;
+        }
+        if (finite0 && depth >= GRAPH_MAX_DEPTH && Math.abs(y1 - y0) > jump && isJump(x0, y0, x1, y1)) run = null;
+        point(x1, y1);
+    }
+
+    let x0 = k0 * step;
+    let y0 = evaluate(x0);
+    if (isFinite(y0)) point(x0, y0);
+    for (let k = k0 + 1; k <= k1; k++) {
+        const x1 = k * step;
+        const y1 = evaluate(x1);
+        refine(x0, y0, x1, y1, 0);
+        x0 = x1;
+        y0 = y1;
+    }
+    return runs;
+}
+
+// Join sampled runs of adjacent ranges: the last run of `left` continues into the first run of
+// `right` when both hold the shared grid point
+function joinRuns(left, right) {
+    if (left.length === 0 || right.length === 0) return left.concat(right);
+    const last = left[left.length - 1];
+    const first = right[0];
+    if (last[last.length - 2] !== first[0]) return left.concat(right);
+    const joined = last.concat(first.slice(2));
+    return left.slice(0, -1).concat([joined], right.slice(1));
+}
+
+// Pixel geometry of a view { scale, offsetX, offsetY } on a width x height canvas
+function graphGeometry(width, height, view) {
+    return {
+        unit: GRAPH_UNIT_PX * view.scale,
+        centerX: width / 2 + view.offsetX,
+        centerY: height / 2 + view.offsetY
+    };
+}
+
+// Grid spacing in graph units: 1, 2 or 5 times a power of ten, at least 20 pixels apart
+function gridSpacing(unit) {
+    const target = 20 / unit;
+    const magnitude = Math.pow(10, Math.floor(Math.log10(target)));
+    for (const multiple of [1, 2, 5, 10]) {
+        if (multiple * magnitude >= target) return multiple * magnitude;
+    }
+    return 10 * magnitude;
+}
+
+function drawGraphAxes(ctx, width, height, view) {
+    const { unit, centerX, centerY } = graphGeometry(width, height, view);
+    const spacing = gridSpacing(unit) * unit;
+
+    ctx.strokeStyle = '#333';
+    ctx.lineWidth = 0.5;
+    ctx.beginPath();
+    for (let x = ((centerX % spacing) + spacing) % spacing; x < width; x += spacing) {
+        ctx.moveTo(x, 0);
+        ctx.lineTo(x, height);
+    }
+    for (let y = ((centerY % spacing) + spacing) % spacing; y < height; y += spacing) {
+        ctx.moveTo(0, y);
+        ctx.lineTo(width, y);
+    }
+    ctx.stroke();
+
+    ctx.strokeStyle = '#666';
+    ctx.lineWidth = 1;
+    ctx.beginPath();
+    ctx.moveTo(0, centerY);
+    ctx.lineTo(width, centerY);
+    ctx.moveTo(centerX, 0);
+    ctx.lineTo(centerX, height);
+    ctx.stroke();
+}
+
+function strokeRuns(ctx, runs, color, geometry, width) {
+    const { unit, centerX, centerY } = geometry;
+    const xMin = -centerX / unit, xMax = (width - centerX) / unit;
+    // Keep far off-canvas points at a finite distance canvas paths can handle
+    const toY = y => centerY - Math.max(-1e6, Math.min(1e6, y * unit));
+    ctx.strokeStyle = color;
+    ctx.lineWidth = 2;
+    ctx.lineJoin = 'round';
+    ctx.beginPath();
+    for (const run of runs) {
+        if (run[run.length - 2] < xMin || run[0] > xMax) continue;
+        // Cached runs reach well past the canvas: start at the last point left of it
+        let low = 0, high = run.length / 2 - 1;
+        while (low < high) {
+            const middle = (low + high + 1) >> 1;
+            if (run[2 * middle] < xMin) low = middle;
+            else high = middle - 1;
+        }
+        ctx.moveTo(centerX + run[2 * low] * unit, toY(run[2 * low + 1]));
+        for (let i = 2 * low + 2; i < run.length; i += 2) {
+            ctx.lineTo(centerX + run[i] * unit, toY(run[i + 1]));
+            if (run[i] > xMax) break;
+        }
+        if (run.length === 2) ctx.lineTo(centerX + run[0] * unit + 0.5, toY(run[1]));
+    }
+    ctx.stroke();
+}
+
+function drawLegend(ctx, plots) {
+    if (plots.length < 2) return;
+    ctx.font = '12px "Segoe UI", sans-serif';
+    ctx.textBaseline = 'middle';
+    plots.forEach((plot, i) => {
+        const y = 12 + i * 16;
+        ctx.fillStyle = plot.color;
+        ctx.fillRect(8, y - 2, 12, 4);
+        ctx.fillText(plot.text, 26, y);
+    });
+}
+
+// One-off drawing of expressions on ctx (nothing cached but the compiled functions)
+function plotExpressions(ctx, texts, width, height, view) {
+    const geometry = graphGeometry(width, height, view);
+    const step = GRAPH_SAMPLE_PX / geometry.unit;
+    const k0 = Math.floor(-geometry.centerX / GRAPH_SAMPLE_PX) - 1;
+    const k1 = Math.ceil((width - geometry.centerX) / GRAPH_SAMPLE_PX) + 1;
+    texts.forEach((text, i) => {
+        const runs = sampleFunction(compileExpression(text), k0, k1, step, geometry.unit);
+        strokeRuns(ctx, runs, GRAPH_COLORS[i % GRAPH_COLORS.length], geometry, width);
+    });
+}
+
+// A plot on a canvas whose view ({ scale, offsetX, offsetY }) comes from getView(). setFunctions()
+// compiles the expressions (throwing on the first invalid one); requestRedraw() draws on the next
+// animation frame from cached samples, sampling only what the cache does not cover yet.
+function createFunctionPlot(canvas, getView) {
+    const ctx = canvas.getContext('2d');
+    let plots = [];
+    let frame = 0;
+
+    function samplesFor(plot, geometry) {
+        const key = geometry.unit.toPrecision(12);
+        const step = GRAPH_SAMPLE_PX / geometry.unit;
+        const margin = Math.ceil(canvas.width / GRAPH_SAMPLE_PX / 4);
+        const first = Math.floor(-geometry.centerX / GRAPH_SAMPLE_PX) - 1;
+        const last = Math.ceil((canvas.width - geometry.centerX) / GRAPH_SAMPLE_PX) + 1;
+        let cache = plot.caches.get(key);
+        const limit = GRAPH_CACHE_WIDTHS * canvas.width / GRAPH_SAMPLE_PX;
+        if (!cache || first > cache.k1 || last < cache.k0 ||
+                Math.max(cache.k1, last) - Math.min(cache.k0, first) > limit) {
+            cache = { k0: first - margin, k1: last + margin };
+            cache.runs = sampleFunction(plot.fn, cache.k0, cache.k1, step, geometry.unit);
+        } else {
+            // Extend by the newly exposed strip plus a margin, so a drag samples every few frames
+            if (first < cache.k0) {
+                const k0 = first - margin;
+                cache.runs = joinRuns(sampleFunction(plot.fn, k0, cache.k0, step, geometry.unit), cache.runs);
+                cache.k0 = k0;
+            }
+            if (last > cache.k1) {
+                const k1 = last + margin;
+                cache.runs = joinRuns(cache.runs, sampleFunction(plot.fn, cache.k1, k1, step, geometry.unit));
+                cache.k1 = k1;
+            }
+        }
+        plot.caches.delete(key);
+        plot.caches.set(key, cache);
+        if (plot.caches.size > GRAPH_CACHED_ZOOMS) plot.caches.delete(plot.caches.keys().next().value);
+        return cache.runs;
+    }
+
+    function redraw() {
+        const width = canvas.width, height = canvas.height;
+        const view = getView();
+        const geometry = graphGeometry(width, height, view);
+        ctx.clearRect(0, 0, width, height);
+        drawGraphAxes(ctx, width, height, view);
+        for (const plot of plots) strokeRuns(ctx, samplesFor(plot, geometry), plot.color, geometry, width);
+        drawLegend(ctx, plots);
+    }
+
+    return {
+        canvas,
+        setFunctions(texts) {
+            const previous = new Map(plots.map(plot => [plot.text, plot]));
+            plots = texts.map((text, i) => {
+                const plot = previous.get(text) || { text, fn: compileExpression(text), caches: new Map() };
+                plot.color = GRAPH_COLORS[i % GRAPH_COLORS.length];
+                return plot;
+            });
+        },
+        requestRedraw() {
+            if (!frame) {
+                frame = requestAnimationFrame(() => {
+                    frame = 0;
+                    redraw();
+                });
+            }
+        },
+        redraw
+    };
+}
@@ -0,0 +1,341 @@
+// Incremental MD5, SHA-1, SHA-256 and SHA-512 for the hash generator on the convertors page.
+// Web Crypto only hashes a whole buffer at once, so these keep their own state and take the file
+// an ArrayBuffer chunk at a time: every selected algorithm is updated from the same chunk, the
+// file is read once, and memory stays at a couple of chunks whatever its size. Bytes are hashed
+// as they are, with no text decoding, so binary files get the same digests as `sha256sum`.
+// The file is both the worker and a plain script (hash_files.py runs it under Node for parity).
+
+const HASH_ENGINE_CHUNK = 4 * 1024 * 1024;
+const HASH_PROGRESS_MS = 100;
+// Blocks are compressed in runs of this many bytes: V8 optimizes a function called often sooner than
+// one long loop, which matters on the first chunk of a file
+const HASH_COMPRESS_RUN = 64 * 1024;
+const HASH_ALGORITHMS = ['MD5', 'SHA-1', 'SHA-256', 'SHA-512'];
+
+const MD5_K = Int32Array.of(
+    0xd76aa478, 0xe8c7b756, 0x242070db, 0xc1bdceee, 0xf57c0faf, 0x4787c62a, 0xa8304613, 0xfd469501,
+    0x698098d8, 0x8b44f7af, 0xffff5bb1, 0x895cd7be, 0x6b901122, 0xfd987193, 0xa679438e, 0x49b40821,
+    0xf61e2562, 0xc040b340, 0x265e5a51, 0xe9b6c7aa, 0xd62f105d, 0x02441453, 0xd8a1e681, 0xe7d3fbc8,
+    0x21e1cde6, 0xc33707d6, 0xf4d50d87, 0x455a14ed, 0xa9e3e905, 0xfcefa3f8, 0x676f02d9, 0x8d2a4c8a,
+    0xfffa3942, 0x8771f681, 0x6d9d6122, 0xfde5380c, 0xa4beea44, 0x4bdecfa9, 0xf6bb4b60, 0xbebfbc70,
+    0x289b7ec6, 0xeaa127fa, 0xd4ef3085, 0x04881d05, 0xd9d4d039, 0xe6db99e5, 0x1fa27cf8, 0xc4ac5665,
+    0xf4292244, 0x432aff97, 0xab9423a7, 0xfc93a039, 0x655b59c3, 0x8f0ccc92, 0xffeff47d, 0x85845dd1,
+    0x6fa87e4f, 0xfe2ce6e0, 0xa3014314, 0x4e0811a1, 0xf7537e82, 0xbd3af235, 0x2ad7d2bb, 0xeb86d391
+);
+const MD5_S = Uint8Array.of(
+    7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
+    5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20, 5, 9, 14, 20,
+    4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23, 4, 11, 16, 23,
+    6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21, 6, 10, 15, 21
+);
+const SHA256_K = Int32Array.of(
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2
+);
+// SHA-512 works on 64-bit words, kept as (high, low) pairs of 32-bit integers
+const SHA512_K = Int32Array.of(
+    0x428a2f98, 0xd728ae22, 0x71374491, 0x23ef65cd, 0xb5c0fbcf, 0xec4d3b2f, 0xe9b5dba5, 0x8189dbbc,
+    0x3956c25b, 0xf348b538, 0x59f111f1, 0xb605d019, 0x923f82a4, 0xaf194f9b, 0xab1c5ed5, 0xda6d8118,
+    0xd807aa98, 0xa3030242, 0x12835b01, 0x45706fbe, 0x243185be, 0x4ee4b28c, 0x550c7dc3, 0xd5ffb4e2,
+    0x72be5d74, 0xf27b896f, 0x80deb1fe, 0x3b1696b1, 0x9bdc06a7, 0x25c71235, 0xc19bf174, 0xcf692694,
+    0xe49b69c1, 0x9ef14ad2, 0xefbe4786, 0x384f25e3, 0x0fc19dc6, 0x8b8cd5b5, 0x240ca1cc, 0x77ac9c65,
+    0x2de92c6f, 0x592b0275, 0x4a7484aa, 0x6ea6e483, 0x5cb0a9dc, 0xbd41fbd4, 0x76f988da, 0x831153b5,
+    0x983e5152, 0xee66dfab, 0xa831c66d, 0x2db43210, 0xb00327c8, 0x98fb213f, 0xbf597fc7, 0xbeef0ee4,
+    0xc6e00bf3, 0x3da88fc2, 0xd5a79147, 0x930aa725, 0x06ca6351, 0xe003826f, 0x14292967, 0x0a0e6e70,
+    0x27b70a85, 0x46d22ffc, 0x2e1b2138, 0x5c26c926, 0x4d2c6dfc, 0x5ac42aed, 0x53380d13, 0x9d95b3df,
+    0x650a7354, 0x8baf63de, 0x766a0abb, 0x3c77b2a8, 0x81c2c92e, 0x47edaee6, 0x92722c85, 0x1482353b,
+    0xa2bfe8a1, 0x4cf10364, 0xa81a664b, 0xbc423001, 0xc24b8b70, 0xd0f89791, 0xc76c51a3, 0x0654be30,
+    0xd192e819, 0xd6ef5218, 0xd6990624, 0x5565a910, 0xf40e3585, 0x5771202a, 0x106aa070, 0x32bbd1b8,
+    0x19a4c116, 0xb8d2d0c8, 0x1e376c08, 0x5141ab53, 0x2748774c, 0xdf8eeb99, 0x34b0bcb5, 0xe19b48a8,
+    0x391c0cb3, 0xc5c95a63, 0x4ed8aa4a, 0xe3418acb, 0x5b9cca4f, 0x7763e373, 0x682e6ff3, 0xd6b2b8a3,
+    0x748f82ee, 0x5defb2fc, 0x78a5636f, 0x43172f60, 0x84c87814, 0xa1f0ab72, 0x8cc70208, 0x1a6439ec,
+    0x90befffa, 0x23631e28, 0xa4506ceb, 0xde82bde9, 0xbef9a3f7, 0xb2c67915, 0xc67178f2, 0xe372532b,
+    0xca273ece, 0xea26619c, 0xd186b8c7, 0x21c0c207, 0xeada7dd6, 0xcde0eb1e, 0xf57d4f7f, 0xee6ed178,
+    0x06f067aa, 0x72176fba, 0x0a637dc5, 0xa2c898a6, 0x113f9804, 0xbef90dae, 0x1b710b35, 0x131c471b,
+    0x28db77f5, 0x23047d84, 0x32caab7b, 0x40c72493, 0x3c9ebe0a, 0x15c9bebc, 0x431d67c4, 0x9c100d4c,
+    0x4cc5d4be, 0xcb3e42b6, 0x597f299c, 0xfc657e2a, 0x5fcb6fab, 0x3ad6faec, 0x6c44198c, 0x4a475817
+);
+
+const md5Words = new Int32Array(16);
+const sha1Words = new Int32Array(80);
+const sha256Words = new Int32Array(64);
+const sha512Words = new Int32Array(160);
+
+// Each compress function runs every whole block in bytes[offset, end) into state. Taking a run of
+// blocks per call keeps the working variables in locals across blocks.
+function md5Blocks(state, bytes, offset, end) {
+    const x = md5Words;
+    let a0 = state[0], b0 = state[1], c0 = state[2], d0 = state[3];
+    for (; offset < end; offset += 64) {
+        for (let i = 0, j = offset; i < 16; i++, j += 4) {
+            x[i] = bytes[j] | bytes[j + 1] << 8 | bytes[j + 2] << 16 | bytes[j + 3] << 24;
+        }
+        let a = a0, b = b0, c = c0, d = d0;
+        for (let i = 0; i < 16; i++) {
+            const sum = (a + ((b & c) | (~b & d)) + MD5_K[i] + x[i]) | 0;
+            a = d; d = c; c = b;
+            b = (b + (sum << MD5_S[i] | sum >>> (32 - MD5_S[i]))) | 0;
+        }
+        for (let i = 16; i < 32; i++) {
+            const sum = (a + ((d & b) | (~d & c)) + MD5_K[i] + x[(5 * i + 1) & 15]) | 0;
+            a = d; d = c; c = b;
+            b = (b + (sum << MD5_S[i] | sum >>> (32 - MD5_S[i]))) | 0;
+        }
+        for (let i = 32; i < 48; i++) {
+            const sum = (a + (b ^ c ^ d) + MD5_K[i] + x[(3 * i + 5) & 15]) | 0;
+            a = d; d = c; c = b;
+            b = (b + (sum << MD5_S[i] | sum >>> (32 - MD5_S[i]))) | 0;
+        }
+        for (let i = 48; i < 64; i++) {
+            const sum = (a + (c ^ (b | ~d)) + MD5_K[i] + x[(7 * i) & 15]) | 0;
+            a = d; d = c; c = b;
+            b = (b + (sum << MD5_S[i] | sum >>> (32 - MD5_S[i]))) | 0;
+        }
+        a0 = (a0 + a) | 0; b0 = (b0 + b) | 0; c0 = (c0 + c) | 0; d0 = (d0 + d) | 0;
+    }
+    state[0] = a0; state[1] = b0; state[2] = c0; state[3] = d0;
+}
+
+function sha1Blocks(state, bytes, offset, end) {
+    const w = sha1Words;
+    let h0 = state[0], h1 = state[1], h2 = state[2], h3 = state[3], h4 = state[4];
+    for (; offset < end; offset += 64) {
+        for (let i = 0, j = offset; i < 16; i++, j += 4) {
+            w[i] = bytes[j] << 24 | bytes[j + 1] << 16 | bytes[j + 2] << 8 | bytes[j + 3];
+        }
+        for (let i = 16; i < 80; i++) {
+            const v = w[i - 3] ^ w[i - 8] ^ w[i - 14] ^ w[i - 16];
+            w[i] = v << 1 | v >>> 31;
+        }
+        let a = h0, b = h1, c = h2, d = h3, e = h4;
+        for (let i = 0; i < 20; i++) {
+            const t = ((a << 5 | a >>> 27) + ((b & c) | (~b & d)) + e + 0x5a827999 + w[i]) | 0;
+            e = d; d = c; c = b << 30 | b >>> 2; b = a; a = t;
+        }
+        for (let i = 20; i < 40; i++) {
+            const t = ((a << 5 | a >>> 27) + (b ^ c ^ d) + e + 0x6ed9eba1 + w[i]) | 0;
+            e = d; d = c; c = b << 30 | b >>> 2; b = a; a = t;
+        }
+        for (let i = 40; i < 60; i++) {
+            const t = ((a << 5 | a >>> 27) + ((b & c) | (b & d) | (c & d)) + e + 0x8f1bbcdc + w[i]) | 0;
+            e = d; d = c; c = b << 30 | b >>> 2; b = a; a = t;
+        }
+        for (let i = 60; i < 80; i++) {
+            const t = ((a << 5 | a >>> 27) + (b ^ c ^ d) + e + 0xca62c1d6 + w[i]) | 0;
+            e = d; d = c; c = b << 30 | b >>> 2; b = a; a = t;
+        }
+        h0 = (h0 + a) | 0; h1 = (h1 + b) | 0; h2 = (h2 + c) | 0; h3 = (h3 + d) | 0; h4 = (h4 + e) | 0;
+    }
+    state[0] = h0; state[1] = h1; state[2] = h2; state[3] = h3; state[4] = h4;
+}
+
+function sha256Blocks(state, bytes, offset, end) {
+    const w = sha256Words;
+    let h0 = state[0], h1 = state[1], h2 = state[2], h3 = state[3];
+    let h4 = state[4], h5 = state[5], h6 = state[6], h7 = state[7];
+    for (; offset < end; offset += 64) {
+        for (let i = 0, j = offset; i < 16; i++, j += 4) {
+            w[i] = bytes[j] << 24 | bytes[j + 1] << 16 | bytes[j + 2] << 8 | bytes[j + 3];
+        }
+        for (let i = 16; i < 64; i++) {
+            const x = w[i - 15], y = w[i - 2];
+            const s0 = (x >>> 7 | x << 25) ^ (x >>> 18 | x << 14) ^ (x >>> 3);
+            const s1 = (y >>> 17 | y << 15) ^ (y >>> 19 | y << 13) ^ (y >>> 10);
+            w[i] = (w[i - 16] + s0 + w[i - 7] + s1) | 0;
+        }
+        let a = h0, b = h1, c = h2, d = h3, e = h4, f = h5, g = h6, h = h7;
+        for (let i = 0; i < 64; i++) {
+            const t1 = (h + ((e >>> 6 | e << 26) ^ (e >>> 11 | e << 21) ^ (e >>> 25 | e << 7)) +
+                ((e & f) ^ (~e & g)) + SHA256_K[i] + w[i]) | 0;
+            const t2 = (((a >>> 2 | a << 30) ^ (a >>> 13 | a << 19) ^ (a >>> 22 | a << 10)) +
+                ((a & b) ^ (a & c) ^ (b & c))) | 0;
+            h = g; g = f; f = e; e = (d + t1) | 0;
+            d = c; c = b; b = a; a = (t1 + t2) | 0;
+        }
+        h0 = (h0 + a) | 0; h1 = (h1 + b) | 0; h2 = (h2 + c) | 0; h3 = (h3 + d) | 0;
+        h4 = (h4 + e) | 0; h5 = (h5 + f) | 0; h6 = (h6 + g) | 0; h7 = (h7 + h) | 0;
+    }
+    state[0] = h0; state[1] = h1; state[2] = h2; state[3] = h3;
+    state[4] = h4; state[5] = h5; state[6] = h6; state[7] = h7;
+}
+
+function addWord64(state, i, high, low) {
+    const sum = (state[i + 1] >>> 0) + (low >>> 0);
+    state[i] = (state[i] + high + (sum / 0x100000000 | 0)) | 0;
+    state[i + 1] = sum | 0;
+}
+
+// 64-bit additions sum the low halves as unsigned numbers (exact in a double) and carry into the high half
+function sha512Blocks(state, bytes, offset, end) {
+    const w = sha512Words;
+    const K = SHA512_K;
+    for (; offset < end; offset += 128) {
+        for (let i = 0, j = offset; i < 32; i++, j += 4) {
+            w[i] = bytes[j] << 24 | bytes[j + 1] << 16 | bytes[j + 2] << 8 | bytes[j + 3];
+        }
+        for (let i = 32; i < 160; i += 2) {
+            const xh = w[i - 30], xl = w[i - 29], yh = w[i - 4], yl = w[i - 3];
+            const s0h = (xh >>> 1 | xl << 31) ^ (xh >>> 8 | xl << 24) ^ (xh >>> 7);
+            const s0l = (xl >>> 1 | xh << 31) ^ (xl >>> 8 | xh << 24) ^ (xl >>> 7 | xh << 25);
+            const s1h = (yh >>> 19 | yl << 13) ^ (yl >>> 29 | yh << 3) ^ (yh >>> 6);
+            const s1l = (yl >>> 19 | yh << 13) ^ (yh >>> 29 | yl << 3) ^ (yl >>> 6 | yh << 26);
+            const low = (s0l >>> 0) + (s1l >>> 0) + (w[i - 13] >>> 0) + (w[i - 31] >>> 0);
+            w[i] = (s0h + s1h + w[i - 14] + w[i - 32] + (low / 0x100000000 | 0)) | 0;
+            w[i + 1] = low | 0;
+        }
+        let ah = state[0], al = state[1], bh = state[2], bl = state[3];
+        let ch = state[4], cl = state[5], dh = state[6], dl = state[7];
+        let eh = state[8], el = state[9], fh = state[10], fl = state[11];
+        let gh = state[12], gl = state[13], hh = state[14], hl = state[15];
+        for (let i = 0; i < 160; i += 2) {
+            const sigma1h = (eh >>> 14 | el << 18) ^ (eh >>> 18 | el << 14) ^ (el >>> 9 | eh << 23);
+            const sigma1l = (el >>> 14 | eh << 18) ^ (el >>> 18 | eh << 14) ^ (eh >>> 9 | el << 23);
+            const chooseH = (eh & fh) ^ (~eh & gh), chooseL = (el & fl) ^ (~el & gl);
+            const t1Low = (hl >>> 0) + (sigma1l >>> 0) + (chooseL >>> 0) + (K[i + 1] >>> 0) + (w[i + 1] >>> 0);
+            const t1h = (hh + sigma1h + chooseH + K[i] + w[i] + (t1Low / 0x100000000 | 0)) | 0;
+            const t1l = t1Low >>> 0;
+            const sigma0h = (ah >>> 28 | al << 4) ^ (al >>> 2 | ah << 30) ^ (al >>> 7 | ah << 25);
+            const sigma0l = (al >>> 28 | ah << 4) ^ (ah >>> 2 | al << 30) ^ (ah >>> 7 | al << 25);
+            const majorityH = (ah & bh) ^ (ah & ch) ^ (bh & ch), majorityL = (al & bl) ^ (al & cl) ^ (bl & cl);
+            const t2Low = (sigma0l >>> 0) + (majorityL >>> 0);
+            const t2h = (sigma0h + majorityH + (t2Low / 0x100000000 | 0)) | 0;
+            const t2l = t2Low >>> 0;
+            hh = gh; hl = gl; gh = fh; gl = fl; fh = eh; fl = el;
+            const eLow = (dl >>> 0) + t1l;
+            eh = (dh + t1h + (eLow / 0x100000000 | 0)) | 0; el = eLow | 0;
+            dh = ch; dl = cl; ch = bh; cl = bl; bh = ah; bl = al;
+            const aLow = t1l + t2l;
+            ah = (t1h + t2h + (aLow / 0x100000000 | 0)) | 0; al = aLow | 0;
+        }
+        addWord64(state, 0, ah, al); addWord64(state, 2, bh, bl); addWord64(state, 4, ch, cl);
+        addWord64(state, 6, dh, dl); addWord64(state, 8, eh, el); addWord64(state, 10, fh, fl);
+        addWord64(state, 12, gh, gl); addWord64(state, 14, hh, hl);
+    }
+}
+
+const HASH_SPECS = {
+    'MD5': {
+        blockSize: 64, lengthBytes: 8, littleEndian: true, compress: md5Blocks,
+        init: [0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476]
+    },
+    'SHA-1': {
+        blockSize: 64, lengthBytes: 8, littleEndian: false, compress: sha1Blocks,
+        init: [0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xc3d2e1f0]
+    },
+    'SHA-256': {
+        blockSize: 64, lengthBytes: 8, littleEndian: false, compress: sha256Blocks,
+        init: [0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19]
+    },
+    'SHA-512': {
+        blockSize: 128, lengthBytes: 16, littleEndian: false, compress: sha512Blocks,
+        init: [0x6a09e667, 0xf3bcc908, 0xbb67ae85, 0x84caa73b, 0x3c6ef372, 0xfe94f82b, 0xa54ff53a, 0x5f1d36f1,
+            0x510e527f, 0xade682d1, 0x9b05688c, 0x2b3e6c1f, 0x1f83d9ab, 0xfb41bd6b, 0x5be0cd19, 0x137e2179]
+    }
+};
+
+// An incremental hash: update(bytes) any number of times, then digest() once for the hex digest
+function createHasher(algorithm) {
+    const spec = HASH_SPECS[algorithm];
+    if (!spec) throw new Error(`Unsupported hash algorithm: ${algorithm}`);
+    const { blockSize, compress } = spec;
+    const state = Int32Array.from(spec.init);
+    const pending = new Uint8Array(blockSize);
+    let buffered = 0;
+    let length = 0;
+
+    return {
+        algorithm,
+        update(bytes) {
+            const size = bytes.length;
+            let offset = 0;
+            length += size;
+            if (buffered > 0) {
+                offset = Math.min(blockSize - buffered, size);
+                pending.set(bytes.subarray(0, offset), buffered);
+                buffered += offset;
+                if (buffered < blockSize) return;
+                compress(state, pending, 0, blockSize);
+                buffered = 0;
+            }
+            const end = offset + (size - offset) - (size - offset) % blockSize;
+            for (let run = offset; run < end; run += HASH_COMPRESS_RUN) {
+                compress(state, bytes, run, Math.min(run + HASH_COMPRESS_RUN, end));
+            }
+            if (end < size) {
+                pending.set(bytes.subarray(end), 0);
+                buffered = size - end;
+            }
+        },
+        digest() {
+            // Padding: a 1 bit, zeros, then the message length in bits in the last lengthBytes bytes
+            const tail = new Uint8Array(Math.ceil((buffered + 1 + spec.lengthBytes) / blockSize) * blockSize);
+            tail.set(pending.subarray(0, buffered));
+            tail[buffered] = 0x80;
+            const bitsHigh = Math.floor(length / 0x20000000);
+            const bitsLow = (length * 8) >>> 0;
+            const at = tail.length - 8;
+            for (let i = 0; i < 4; i++) {
+                if (spec.littleEndian) {
+                    tail[at + i] = bitsLow >>> (8 * i);
+                    tail[at + 4 + i] = bitsHigh >>> (8 * i);
+                } else {
+                    tail[at + i] = bitsHigh >>> (24 - 8 * i);
+                    tail[at + 4 + i] = bitsLow >>> (24 - 8 * i);
+                }
+            }
+            compress(state, tail, 0, tail.length);
+            let hex = '';
+            for (const word of state) {
+                const value = spec.littleEndian
+                    ? ((word & 0xff) << 24 | (word >>> 8 & 0xff) << 16 | (word >>> 16 & 0xff) << 8 | word >>> 24) >>> 0
+                    : word >>> 0;
+                hex += value.toString(16).padStart(8, '0');
+            }
+            return hex;
+        }
+    };
+}
+
+// Hash a Blob or File with every algorithm in one pass, reading the next chunk while the current one
+// is hashed. Resolves to { digests: { algorithm: hex }, bytes, seconds }.
+async function hashFile(file, algorithms, onProgress, chunkBytes) {
+    algorithms = algorithms || HASH_ALGORITHMS;
+    chunkBytes = chunkBytes || HASH_ENGINE_CHUNK;
+    const hashers = algorithms.map(createHasher);
+    const total = file.size;
+    const start = performance.now();
+    let lastProgress = start;
+    let loaded = 0;
+    let next = total > 0 ? file.slice(0, chunkBytes).arrayBuffer() : null;
+    while (next) {
+        const bytes = new Uint8Array(await next);
+        if (bytes.length === 0) break;
+        loaded += bytes.length;
+        next = loaded < total ? file.slice(loaded, loaded + chunkBytes).arrayBuffer() : null;
+        for (const hasher of hashers) hasher.update(bytes);
+        const now = performance.now();
+        if (onProgress && now - lastProgress >= HASH_PROGRESS_MS) {
+            lastProgress = now;
+            onProgress(loaded, total, (now - start) / 1000);
+        }
+    }
+    const digests = {};
+    for (const hasher of hashers) digests[hasher.algorithm] = hasher.digest();
+    return { digests, bytes: loaded, seconds: (performance.now() - start) / 1000 };
+}
+
+// Worker entry point: receives { file, algorithms }, posts progress messages, then done or error
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    self.onmessage = event => {
+        const { file, algorithms } = event.data;
+        hashFile(file, algorithms, (loaded, total, seconds) => self.postMessage({ type: 'progress', loaded, total, seconds }))
+            .then(result => self.postMessage(Object.assign({ type: 'done' }, result)),
+                error => self.postMessage({ type: 'error', message: error.message }));
+    };
+}
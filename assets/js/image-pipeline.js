@@ -0,0 +1,172 @@
+// Off-main-thread image conversion for the image tools on the convertors page.
+// The same file is the page-side pool and the worker: each worker decodes a File with
+// createImageBitmap (no base64 data URL, no <img>), draws it on an OffscreenCanvas and encodes
+// straight to a Blob. A batch runs a few files at once; the limit keeps memory bounded, since a
+// decoded 20 MP photo alone takes 80 MB. Browsers without OffscreenCanvas in workers, and SVG
+// files (which workers cannot decode), take the same steps on the main thread instead.
+
+const IMAGE_PIPELINE_SCRIPT = '/assets/js/image-pipeline.js';
+const IMAGE_PIPELINE_MAX_WORKERS = 4;
+const IMAGE_EXTENSIONS = { 'image/jpeg': '.jpg', 'image/png': '.png', 'image/webp': '.webp' };
+
+function isSvgFile(file) {
+    return file.type === 'image/svg+xml' || /\.svg$/i.test(file.name || '');
+}
+
+function imageCanvas(width, height) {
+    if (typeof OffscreenCanvas !== 'undefined') return new OffscreenCanvas(width, height);
+    const canvas = document.createElement('canvas');
+    canvas.width = width;
+    canvas.height = height;
+    return canvas;
+}
+
+function canvasToBlob(canvas, type, quality) {
+    if (canvas.convertToBlob) return canvas.convertToBlob({ type, quality });
+    return new Promise((resolve, reject) => canvas.toBlob(
+        blob => (blob ? resolve(blob) : reject(new Error('Could not encode the image'))), type, quality));
+}
+
+// Draw a decoded image at options.scale and encode it as options.type ('image/png' by default).
+// Browsers fall back to PNG for types they cannot encode, so callers name files from blob.type.
+async function renderImage(source, sourceWidth, sourceHeight, options) {
+    const scale = options.scale || 1;
+    const width = Math.max(1, Math.floor(sourceWidth * scale));
+    const height = Math.max(1, Math.floor(sourceHeight * scale));
+    const canvas = imageCanvas(width, height);
+    const ctx = canvas.getContext('2d');
+    if (options.type === 'image/jpeg') {
+        // JPEG has no alpha channel: flatten transparent pixels onto white rather than black
+        ctx.fillStyle = '#ffffff';
+        ctx.fillRect(0, 0, width, height);
+    }
+    ctx.imageSmoothingQuality = 'high';
+    ctx.drawImage(source, 0, 0, width, height);
+    const blob = await canvasToBlob(canvas, options.type || 'image/png', options.quality);
+    return { blob, width, height };
+}
+
+// Decode, render and encode one file: { blob, width, height }
+async function convertImage(file, options) {
+    if (typeof createImageBitmap === 'function' && !isSvgFile(file)) {
+        const bitmap = await createImageBitmap(file, { imageOrientation: 'from-image' });
+        try {
+            return await renderImage(bitmap, bitmap.width, bitmap.height, options);
+        } finally {
+            bitmap.close();
+        }
+    }
+    // SVG (and browsers without createImageBitmap): an <img> on an object URL, still no data URL
+    const url = URL.createObjectURL(file);
+    try {
+        const img = new Image();
+        img.src = url;
+        await img.decode();
+        return await renderImage(img, img.naturalWidth || 300, img.naturalHeight || 150, options);
+    } finally {
+        URL.revokeObjectURL(url);
+    }
+}
+
+// Output name for a converted file: the input name with suffix and the extension of the real output type
+function convertedImageName(fileName, suffix, blob) {
+    return fileName.replace(/\.[^/.]+$/, '') + (suffix || '') + (IMAGE_EXTENSIONS[blob.type] || '.png');
+}
+
+function createImagePool(size) {
+    size = size || Math.max(1, Math.min((typeof navigator !== 'undefined' && navigator.hardwareConcurrency) || 2,
+        IMAGE_PIPELINE_MAX_WORKERS));
+    const useWorkers = typeof Worker !== 'undefined' && typeof OffscreenCanvas !== 'undefined' &&
+        typeof OffscreenCanvas.prototype.convertToBlob === 'function';
+    const workers = [];
+    const idle = [];
+    const queue = [];
+    const running = new Map();
+    let nextId = 0;
+
+    function spawn() {
+        const worker = new Worker(IMAGE_PIPELINE_SCRIPT);
+        worker.onmessage = event => {
+            const { id, error, blob, width, height } = event.data;
+            const job = running.get(id);
+            running.delete(id);
+            idle.push(worker);
+            if (error) job.reject(new Error(error));
+            else job.resolve({ blob, width, height });
+            dispatch();
+        };
+        worker.onerror = event => {
+            // A worker that crashed is replaced; its job fails
+            event.preventDefault();
+            worker.terminate();
+            workers.splice(workers.indexOf(worker), 1);
+            for (const [id, job] of running) {
+                if (job.worker === worker) {
+                    running.delete(id);
+                    job.reject(new Error(event.message || 'Image worker failed'));
+                }
+            }
+            dispatch();
+        };
+        workers.push(worker);
+        return worker;
+    }
+
+    function dispatch() {
+        while (queue.length > 0 && (idle.length > 0 || workers.length < size)) {
+            const job = queue.shift();
+            job.worker = idle.pop() || spawn();
+            running.set(job.id, job);
+            job.worker.postMessage({ id: job.id, file: job.file, options: job.options });
+        }
+    }
+
+    function convert(file, options) {
+        if (!useWorkers || isSvgFile(file)) return convertImage(file, options);
+        return new Promise((resolve, reject) => {
+            queue.push({ id: nextId++, file, options, resolve, reject });
+            dispatch();
+        });
+    }
+
+    return {
+        size,
+        convert,
+        // Convert a batch with at most `size` files in flight, calling onProgress(done, total) as each
+        // finishes. Resolves to one { file, blob, width, height } or { file, error } per file, in order.
+        async convertAll(files, options, onProgress) {
+            const results = new Array(files.length);
+            let next = 0;
+            let done = 0;
+            async function lane() {
+                while (next < files.length) {
+                    const index = next++;
+                    try {
+                        results[index] = Object.assign({ file: files[index] }, await convert(files[index], options));
+                    } catch (error) {
+                        results[index] = { file: files[index], error: error.message || 'Could not decode the image' };
+                    }
+                    done++;
+                    if (onProgress) onProgress(done, files.length);
+                }
+            }
+            await Promise.all(Array.from({ length: Math.min(size, files.length) }, lane));
+            return results;
+        },
+        terminate() {
+            workers.forEach(worker => worker.terminate());
+            workers.length = 0;
+            idle.length = 0;
+        }
+    };
+}
+
+// Worker entry point: receives { id, file, options } and posts { id, blob, width, height } or { id, error }
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+    self.onmessage = event => {
+        const { id, file, options } = event.data;
+        convertImage(file, options).then(
+            ({ blob, width, height }) => self.postMessage({ id, blob, width, height }),
+            error => self.postMessage({ id, error: error.message || 'Could not decode the image' }));
+    };
+}
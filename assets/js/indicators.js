@@ -0,0 +1,139 @@
+// Streaming indicators for the crypto analytics calculators (mirrored by indicators.py).
+// Each indicator takes one value at a time in O(1) time and memory, so a series is read
+// in a single pass however long it is.
+
+// Read comma-separated numbers one at a time; empty entries (e.g. a trailing comma) are skipped
+function createSeriesReader(text) {
+    let pos = 0;
+    return {
+        next() {
+            while (pos <= text.length) {
+                let comma = text.indexOf(',', pos);
+                if (comma === -1) comma = text.length;
+                const token = text.slice(pos, comma);
+                pos = comma + 1;
+                if (token.trim() !== '') return parseFloat(token);
+            }
+            return undefined;
+        }
+    };
+}
+
+// Welford's online mean and population variance, plus the extremes seen
+function createWelford() {
+    return {
+        count: 0,
+        mean: 0,
+        m2: 0,
+        min: Infinity,
+        max: -Infinity,
+        push(x) {
+            this.count++;
+            const delta = x - this.mean;
+            this.mean += delta / this.count;
+            this.m2 += delta * (x - this.mean);
+            // x !== x: a NaN value makes the extremes NaN, as Math.min(...)/Math.max(...) did
+            if (x < this.min || x !== x) this.min = x;
+            if (x > this.max || x !== x) this.max = x;
+        },
+        variance() {
+            return this.m2 / this.count;
+        }
+    };
+}
+
+// Running maximum drawdown from the highest price seen so far
+function createDrawdown() {
+    return {
+        count: 0,
+        maxDrawdown: 0,
+        peak: NaN,
+        peakIndex: 0,
+        valley: NaN,
+        valleyIndex: 0,
+        currentPeak: NaN,
+        currentPeakIndex: 0,
+        push(price) {
+            if (this.count === 0) {
+                this.peak = this.valley = this.currentPeak = price;
+            } else {
+                if (price > this.currentPeak) {
+                    this.currentPeak = price;
+                    this.currentPeakIndex = this.count;
+                }
+                const drawdown = (this.currentPeak - price) / this.currentPeak;
+                if (drawdown > this.maxDrawdown) {
+                    this.maxDrawdown = drawdown;
+                    this.peak = this.currentPeak;
+                    this.peakIndex = this.currentPeakIndex;
+                    this.valley = price;
+                    this.valleyIndex = this.count;
+                }
+            }
+            this.count++;
+        }
+    };
+}
+
+// Online Pearson correlation (Welford-style co-moments)
+function createCorrelation() {
+    return {
+        count: 0,
+        meanX: 0,
+        meanY: 0,
+        m2x: 0,
+        m2y: 0,
+        cxy: 0,
+        push(x, y) {
+            this.count++;
+            const dx = x - this.meanX;
+            const dy = y - this.meanY;
+            this.meanX += dx / this.count;
+            this.meanY += dy / this.count;
+            this.m2x += dx * (x - this.meanX);
+            this.m2y += dy * (y - this.meanY);
+            this.cxy += dx * (y - this.meanY);
+        },
+        correlation() {
+            return this.cxy / Math.sqrt(this.m2x * this.m2y);
+        }
+    };
+}
+
+// Wilder's RSI: plain average of the first `period` changes, then Wilder smoothing
+function createRSI(period) {
+    return {
+        period: period,
+        count: 0,
+        previous: NaN,
+        gainSum: 0,
+        lossSum: 0,
+        averageGain: 0,
+        averageLoss: 0,
+        push(price) {
+            const changes = this.count++;
+            if (changes > 0) {
+                const change = price - this.previous;
+                const gain = change > 0 ? change : 0;
+                const loss = change < 0 ? -change : 0;
+                if (changes <= this.period) {
+                    this.gainSum += gain;
+                    this.lossSum += loss;
+                    this.averageGain = this.gainSum / changes;
+                    this.averageLoss = this.lossSum / changes;
+                } else {
+                    this.averageGain = (this.averageGain * (this.period - 1) + gain) / this.period;
+                    this.averageLoss = (this.averageLoss * (this.period - 1) + loss) / this.period;
+                }
+            }
+            this.previous = price;
+        },
+        ready() {
+            return this.count > this.period;
+        },
+        rsi() {
+            if (this.averageLoss === 0) return this.averageGain === 0 ? 50 : 100;
+            return 100 - 100 / (1 + this.averageGain / this.averageLoss);
+        }
+    };
+}
@@ -0,0 +1,209 @@
+window.showCategory=showCategory;window.showCategories=showCategories;window.showCalculator=showCalculator;window.backToCalculatorList=backToCalculatorList;window.calculateResult=calculateResult;window.goToHomePage=goToHomePage;let currentCategory=null;window.initWindowsCalculator=function(){window.currentValue='0';window.previousValue=null;window.operator=null;window.waitingForOperand=false;window.calculatorMemory=0;window.calculatorHistory=[];window.currentMode='standard';window.angleUnit='deg';window.currentBase='DEC';window.inverseMode=false;window.graphScale=1;window.graphOffsetX=0;window.graphOffsetY=0;window.updateDisplay();window.updateMemoryDisplay();window.updateHistoryDisplay();setTimeout(()=>{window.updateBaseButtons();window.updateBitDisplay(0);},200);document.addEventListener('keydown',window.handleKeyboardInput);};window.updateDisplay=function(){const resultElement=document.getElementById('calc-result');if(resultElement){resultElement.textContent=window.currentValue;}};window.updateExpression=function(expression){const expressionElement=document.getElementById('calc-expression');if(expressionElement){expressionElement.textContent=expression;}};window.switchMode=function(mode){window.currentMode=mode;const modeButtons=document.querySelectorAll('.mode-btn');modeButtons.forEach(btn=>btn.classList.remove('active'));const activeBtn=document.querySelector(`[data-mode="${mode}"]`);if(activeBtn)activeBtn.classList.add('active');const keypads=document.querySelectorAll('.calculator-mode-panel');keypads.forEach(keypad=>keypad.style.display='none');const targetKeypad=document.getElementById(`${mode}-keypad`);if(targetKeypad)targetKeypad.style.display='block';if(mode==='programmer'){window.updateProgrammerDisplay();window.updateBaseButtons();window.updateBitDisplay(window.getCurrentDecimal());}else if(mode==='graphing'){setTimeout(()=>{window.initGraphingMode();},100);}
+window.clearAll();};window.calculateTrig=function(func){const value=parseFloat(window.currentValue);let angleValue=value;if(window.angleUnit==='deg'){angleValue=value*(Math.PI/180);}
+let result;const isInverse=window.inverseMode;switch(func){case'sin':
+result=isInverse?Math.asin(value):Math.sin(angleValue);break;case'cos':
+result=isInverse?Math.acos(value):Math.cos(angleValue);break;case'tan':
+result=isInverse?Math.atan(value):Math.tan(angleValue);break;}
+if(isInverse&&window.angleUnit==='deg'){result=result*(180/Math.PI);}
+window.currentValue=String(result);window.updateDisplay();window.updateExpression(`${isInverse ? 'arc' : ''}${func}(${value})`);window.inverseMode=false;window.updateInverseButton();};window.calculateFunction=function(func){const value=parseFloat(window.currentValue);let result;switch(func){case'ln':
+result=Math.log(value);break;case'log':
+result=Math.log10(value);break;case'exp':
+result=Math.exp(value);break;case'pow10':
+result=Math.pow(10,value);break;case'sqrt':
+result=Math.sqrt(value);break;case'cubert':
+result=Math.cbrt(value);break;case'factorial':
+if(value>=0&&Number.isInteger(value)&&value<=170){result=window.factorial(value);}else{window.showError('Factorial only works with non-negative integers ≤ 170');return;}
+break;case'inv':
+window.inverseMode=!window.inverseMode;window.updateInverseButton();return;}
+window.currentValue=String(result);window.updateDisplay();window.updateExpression(`${func}(${value})`);};window.factorial=function(n){if(n===0||n===1)return 1;let result=1;for(let i=2;i<=n;i++){result*=i;}
+return result;};window.calculatePower=function(){if(window.operator===null){window.previousValue=parseFloat(window.currentValue);window.operator='^';window.waitingForOperand=true;window.updateExpression(window.currentValue+'^');}};window.inputConstant=function(constant){switch(constant){case'π':
+window.currentValue=String(Math.PI);break;case'e':
+window.currentValue=String(Math.E);break;}
+window.updateDisplay();};window.inputBracket=function(bracket){if(window.waitingForOperand){window.currentValue=bracket;window.waitingForOperand=false;}else{window.currentValue+=bracket;}
+window.updateDisplay();};window.toggleAngleUnit=function(){window.angleUnit=window.angleUnit==='deg'?'rad':'deg';const angleBtn=document.getElementById('angle-unit-btn');if(angleBtn){angleBtn.textContent=window.angleUnit.toUpperCase();}};window.updateInverseButton=function(){const invBtn=document.getElementById('inv-btn');if(invBtn){invBtn.classList.toggle('active',window.inverseMode);}};window.switchBase=function(base){const currentDecimal=window.getCurrentDecimal();window.currentBase=base;const baseButtons=document.querySelectorAll('.base-btn');baseButtons.forEach(btn=>btn.classList.remove('active'));const activeBtn=document.querySelector(`[data-base="${base}"]`);if(activeBtn)activeBtn.classList.add('active');window.currentValue=window.convertFromDecimal(currentDecimal,base);window.updateDisplay();window.updateBaseButtons();window.updateBitDisplay(currentDecimal);};window.getCurrentDecimal=function(){switch(window.currentBase){case'HEX':
+return parseInt(window.currentValue,16)||0;case'DEC':
+return parseInt(window.currentValue,10)||0;case'OCT':
+return parseInt(window.currentValue,8)||0;case'BIN':
+return parseInt(window.currentValue,2)||0;default:
+return parseInt(window.currentValue,10)||0;}};window.convertFromDecimal=function(decimal,base){switch(base){case'HEX':
+return decimal.toString(16).toUpperCase();case'DEC':
+return decimal.toString(10);case'OCT':
+return decimal.toString(8);case'BIN':
+return decimal.toString(2);default:
+return decimal.toString(10);}};window.updateBaseButtons=function(){const buttons={'BIN':['0','1'],'OCT':['0','1','2','3','4','5','6','7'],'DEC':['0','1','2','3','4','5','6','7','8','9'],'HEX':['0','1','2','3','4','5','6','7','8','9','A','B','C','D','E','F']};const enabledButtons=buttons[window.currentBase]||buttons['DEC'];for(let i=0;i<=9;i++){const btn=document.getElementById(`btn-${i}`);if(btn){btn.disabled=!enabledButtons.includes(String(i));btn.style.opacity=btn.disabled?'0.3':'1';}}
+['A','B','C','D','E','F'].forEach(letter=>{const btn=document.getElementById(`btn-${letter}`);if(btn){btn.disabled=!enabledButtons.includes(letter);btn.style.opacity=btn.disabled?'0.3':'1';}});};window.updateBitDisplay=function(decimal){const bitDisplay=document.getElementById('bit-display');if(bitDisplay){const binary=Math.abs(decimal).toString(2).padStart(16,'0');const bitGroups=[];for(let i=0;i<16;i+=4){bitGroups.push(binary.substr(i,4));}
+bitDisplay.innerHTML=bitGroups.map(group=>
+`<span class="bit-group">${group}</span>`).join('');}};window.calculateBitwise=function(operation){const current=window.getCurrentDecimal();if(operation==='not'){const result=~current&0xFFFFFFFF;window.currentValue=window.convertFromDecimal(result,window.currentBase);window.updateDisplay();window.updateBitDisplay(result);return;}
+if(window.operator===null){window.previousValue=current;window.operator=operation;window.waitingForOperand=true;window.updateExpression(window.currentValue+' '+operation.toUpperCase());}};function graphView(){return{scale:window.graphScale,offsetX:window.graphOffsetX,offsetY:window.graphOffsetY};}
+function getFunctionGraph(){const canvas=document.getElementById('graphing-canvas');if(!canvas||typeof createFunctionPlot!=='function')return null;if(!window.functionGraph||window.functionGraph.canvas!==canvas){window.functionGraph=createFunctionPlot(canvas,graphView);attachGraphControls(canvas);}
+return window.functionGraph;}
+function canvasPoint(canvas,event){const rect=canvas.getBoundingClientRect();return{x:(event.clientX-rect.left)*canvas.width/rect.width,y:(event.clientY-rect.top)*canvas.height/rect.height};}
+function zoomGraph(factor,x,y){const canvas=document.getElementById('graphing-canvas');if(!canvas)return;if(x===undefined){x=canvas.width/2;y=canvas.height/2;}
+window.graphOffsetX=x-canvas.width/2-(x-canvas.width/2-window.graphOffsetX)*factor;window.graphOffsetY=y-canvas.height/2-(y-canvas.height/2-window.graphOffsetY)*factor;window.graphScale*=factor;const graph=getFunctionGraph();if(graph)graph.requestRedraw();}
+function attachGraphControls(canvas){let dragging=null;canvas.style.touchAction='none';canvas.style.cursor='grab';canvas.addEventListener('pointerdown',event=>{dragging=canvasPoint(canvas,event);canvas.setPointerCapture(event.pointerId);canvas.style.cursor='grabbing';});canvas.addEventListener('pointermove',event=>{if(!dragging)return;const point=canvasPoint(canvas,event);window.graphOffsetX+=point.x-dragging.x;window.graphOffsetY+=point.y-dragging.y;dragging=point;window.functionGraph.requestRedraw();});const endDrag=()=>{dragging=null;canvas.style.cursor='grab';};canvas.addEventListener('pointerup',endDrag);canvas.addEventListener('pointercancel',endDrag);canvas.addEventListener('wheel',event=>{event.preventDefault();const point=canvasPoint(canvas,event);zoomGraph(Math.exp(-event.deltaY*0.0015),point.x,point.y);},{passive:false});const functionInput=document.getElementById('function-input');if(functionInput){functionInput.addEventListener('keydown',event=>{if(event.key==='Enter')window.plotFunction();});}}
+window.plotFunction=function(){const functionInput=document.getElementById('function-input');if(!functionInput)return;const graph=getFunctionGraph();if(!graph)return;try{graph.setFunctions(parseFunctionList(functionInput.value));}catch(error){alert('Error plotting function: '+error.message);return;}
+graph.requestRedraw();};window.drawAxes=function(ctx,width,height){drawGraphAxes(ctx,width,height,graphView());};window.plotMathFunction=function(ctx,funcText,width,height){plotExpressions(ctx,parseFunctionList(funcText),width,height,graphView());};window.clearGraph=function(){const functionInput=document.getElementById('function-input');if(functionInput){functionInput.value='';}
+const graph=getFunctionGraph();if(graph){graph.setFunctions([]);graph.requestRedraw();}};window.zoomIn=function(){zoomGraph(1.2);};window.zoomOut=function(){zoomGraph(1/1.2);};window.resetView=function(){window.graphScale=1;window.graphOffsetX=0;window.graphOffsetY=0;const graph=getFunctionGraph();if(graph)graph.requestRedraw();};window.toggleHistory=function(){const sidebar=document.getElementById('calc-sidebar');const historyPanel=document.getElementById('history-panel');const memoryPanel=document.getElementById('memory-panel');if(sidebar.style.display==='none'||!historyPanel.style.display||historyPanel.style.display==='none'){sidebar.style.display='block';historyPanel.style.display='block';memoryPanel.style.display='none';}else{sidebar.style.display='none';}};window.toggleMemory=function(){const sidebar=document.getElementById('calc-sidebar');const historyPanel=document.getElementById('history-panel');const memoryPanel=document.getElementById('memory-panel');if(sidebar.style.display==='none'||!memoryPanel.style.display||memoryPanel.style.display==='none'){sidebar.style.display='block';memoryPanel.style.display='block';historyPanel.style.display='none';}else{sidebar.style.display='none';}};window.handleKeyboardInput=function(event){const key=event.key;if(event.target&&/^(INPUT|TEXTAREA|SELECT)$/.test(event.target.tagName))return;if('0123456789+-*/=.'.includes(key)||key==='Enter'||key==='Backspace'||key==='Escape'){event.preventDefault();}
+if(/[0-9]/.test(key)){window.inputNumber(key);}
+else if(key==='+'){window.inputOperation('+');}
+else if(key==='-'){window.inputOperation('-');}
+else if(key==='*'){window.inputOperation('×');}
+else if(key==='/'){window.inputOperation('÷');}
+else if(key==='.'){window.inputDecimal();}
+else if(key==='Enter'||key==='='){window.calculateResultWin();}
+else if(key==='Escape'){window.clearAll();}
+else if(key==='Backspace'){window.backspace();}
+else if(window.currentMode==='programmer'&&/[A-F]/.test(key.toUpperCase())){window.inputNumber(key.toUpperCase());}};window.performCalculation=function(){const prev=window.previousValue;const current=parseFloat(window.currentValue);switch(window.operator){case'+':
+return prev+current;case'-':
+case'−':
+return prev-current;case'×':
+return prev*current;case'÷':
+return current!==0?prev/current:0;case'^':
+return Math.pow(prev,current);case'and':
+return prev&current;case'or':
+return prev|current;case'xor':
+return prev^current;case'lsh':
+return prev<<current;case'rsh':
+return prev>>current;default:
+return current;}};window.inputNumber=function(num){if(window.currentMode==='programmer'){const validChars={'BIN':['0','1'],'OCT':['0','1','2','3','4','5','6','7'],'DEC':['0','1','2','3','4','5','6','7','8','9'],'HEX':['0','1','2','3','4','5','6','7','8','9','A','B','C','D','E','F']};if(!validChars[window.currentBase].includes(num)){return;}}
+if(window.waitingForOperand){window.currentValue=num;window.waitingForOperand=false;}else{window.currentValue=window.currentValue==='0'?num:window.currentValue+num;}
+window.updateDisplay();if(window.currentMode==='programmer'){window.updateBitDisplay(window.getCurrentDecimal());}};window.showError=function(message){window.currentValue='Error';window.updateDisplay();window.updateExpression(message);setTimeout(()=>{window.clearAll();},2000);};window.updateProgrammerDisplay=function(){if(window.currentMode==='programmer'){const decimal=window.getCurrentDecimal();window.updateBitDisplay(decimal);}};window.calculateLog=function(base){const value=parseFloat(window.currentValue);let result;if(base==='e'){result=Math.log(value);window.updateExpression(`ln(${value})`);}else if(base==='10'){result=Math.log10(value);window.updateExpression(`log(${value})`);}else if(base==='2'){result=Math.log2(value);window.updateExpression(`log2(${value})`);}
+window.currentValue=String(result);window.updateDisplay();};window.calculateCube=function(){const value=parseFloat(window.currentValue);const result=Math.pow(value,3);window.currentValue=String(result);window.updateDisplay();window.updateExpression('cube('+value+')');};window.calculateAbs=function(){const value=parseFloat(window.currentValue);const result=Math.abs(value);window.currentValue=String(result);window.updateDisplay();window.updateExpression('abs('+value+')');};window.initGraphingMode=function(){if(window.currentMode==='graphing'){const graph=getFunctionGraph();if(graph)graph.redraw();}};document.addEventListener('DOMContentLoaded',function(){showCategories();const categoryCards=document.querySelectorAll('.modern-category-card');categoryCards.forEach(card=>{const onclick=card.getAttribute('onclick');if(onclick){const category=onclick.match(/showCategory\('(.+?)'\)/)[1];card.addEventListener('click',function(){showCategory(category);});}});});window.showCategory=showCategory;window.showCategories=showCategories;window.showCalculator=showCalculator;window.backToCalculatorList=backToCalculatorList;window.calculateResult=calculateResult;function showCategories(){document.getElementById('calculator-display').style.display='none';document.getElementById('categories').style.display='block';document.getElementById('categories').scrollIntoView({behavior:'smooth'});}
+function showCategory(category){currentCategory=category;const categoryUrl=urlMapping[category];if(categoryUrl){updateUrl('/'+categoryUrl+'/');}
+const categoriesEl=document.getElementById('categories');if(categoriesEl){categoriesEl.style.display='none';}
+const calcDisplayEl=document.getElementById('calculator-display');if(calcDisplayEl){calcDisplayEl.style.display='block';}
+const categoryTitles={'financial':'Financial Calculators','math':'Mathematics Calculators','health':'Health & Fitness Calculators','engineering':'Engineering Calculators','conversion':'Unit Conversion Tools','business':'Business Calculators','crypto':'Cryptocurrency Tools','physics':'Physics Calculators','chemistry':'Chemistry Calculators','construction':'Construction Tools','time':'Date & Time Tools','utility':'Utility Tools'};document.getElementById('category-title').textContent=categoryTitles[category]||'Calculators';loadCategoryTools(category);document.getElementById('calculator-display').scrollIntoView({behavior:'smooth'});}
+function loadCategoryTools(category){const listContainer=document.getElementById('calculator-list-items');const tools=toolCategories[category]||[];let html='';tools.forEach(tool=>{const calc=calculators[tool];if(calc){const description=`Professional ${calc.title.toLowerCase()} for accurate calculations`;html+=`
+                <div class="modern-calculator-item fade-in-up" onclick="showCalculator('${tool}')">
+                    <div class="calculator-item-icon">
+                        <i class="${calc.icon}"></i>
+                    </div>
+                    <div class="calculator-item-content">
+                        <div class="calculator-item-title">${calc.title}</div>
+                        <div class="calculator-item-description">${description}</div>
+                    </div>
+                    <div class="calculator-item-arrow">
+                        <i class="fas fa-chevron-right"></i>
+                    </div>
+                </div>
+            `;}});listContainer.innerHTML=html||'<p class="text-muted text-center">No calculators available in this category.</p>';}
+const CALCULATOR_MODULE_PATH='/assets/js/calculators/';const calculatorLoads={};const SHARED_SCRIPT_PATH='/assets/js/';const scriptLoads={};const loadedScripts={};function hasCalculatorCode(calc){return!!calc&&(typeof calc.calculate==='function'||typeof calc.renderCustomInterface==='function');}
+function isCalculatorLoaded(calc){return hasCalculatorCode(calc)&&(calc.requires||[]).every(name=>loadedScripts[SHARED_SCRIPT_PATH+name+'.js']);}
+function registerCalculator(calcId,definition){calculators[calcId]=Object.assign(calculators[calcId]||{},definition);}
+function loadScript(src){if(!scriptLoads[src]){scriptLoads[src]=new Promise((resolve,reject)=>{const script=document.createElement('script');script.src=src;script.onload=()=>{loadedScripts[src]=true;resolve();};script.onerror=()=>{delete scriptLoads[src];reject(new Error('Could not load the calculator. Please check your connection and try again.'));};document.head.appendChild(script);});}
+return scriptLoads[src];}
+function loadCalculator(calcId){if(isCalculatorLoaded(calculators[calcId])){return Promise.resolve(calculators[calcId]);}
+if(!calculatorLoads[calcId]){const module=hasCalculatorCode(calculators[calcId])
+?Promise.resolve()
+:loadScript(CALCULATOR_MODULE_PATH+encodeURIComponent(calcId)+'.js');calculatorLoads[calcId]=module
+.then(()=>(calculators[calcId].requires||[]).reduce((loaded,name)=>loaded.then(()=>loadScript(SHARED_SCRIPT_PATH+name+'.js')),Promise.resolve()))
+.then(()=>calculators[calcId])
+.catch(error=>{delete calculatorLoads[calcId];throw error;});}
+return calculatorLoads[calcId];}
+window.loadCalculator=loadCalculator;function showCalculator(calcId){const calc=calculators[calcId];if(!calc){document.getElementById('calculator-content').innerHTML='<p class="text-danger">Calculator not found</p>';return;}
+if(currentCategory){const categoryUrl=urlMapping[currentCategory];const calculatorUrl=getCalculatorUrl(calcId);if(categoryUrl&&calculatorUrl){updateUrl('/'+categoryUrl+'/'+calculatorUrl);}}
+document.getElementById('calculator-list-items').style.display='none';document.getElementById('calculator-form-container').style.display='block';document.getElementById('calculator-form-title').textContent=calc.title;if(document.getElementById('back-button')){document.getElementById('back-button').style.display='none';}
+if(!isCalculatorLoaded(calc)){document.getElementById('calculator-content').innerHTML=`
+            <div class="text-center py-4">
+                <div class="spinner-border text-primary" role="status">
+                    <span class="visually-hidden">Loading...</span>
+                </div>
+            </div>
+        `;document.getElementById('calculator-result').style.display='none';loadCalculator(calcId)
+.then(()=>showCalculator(calcId))
+.catch(error=>{document.getElementById('calculator-content').innerHTML=`<p class="text-danger">${error.message}</p>`;});return;}
+if(calc.isCustomInterface&&calc.renderCustomInterface){document.getElementById('calculator-content').innerHTML=calc.renderCustomInterface();document.getElementById('calculator-result').style.display='none';return;}
+let formHTML=`
+        <form id="calc-form" onsubmit="calculateResult(event, '${calcId}')">
+    `;calc.inputs.forEach(input=>{formHTML+=`
+            <div class="mb-4">
+                <label class="form-label">${input.label}</label>
+        `;if(input.type==='select'){formHTML+=`<select class="form-select" id="${input.id}" required>`;input.options.forEach(option=>{formHTML+=`<option value="${option}">${option}</option>`;});formHTML+=`</select>`;}else if(input.type==='file'){formHTML+=`<input type="file" class="form-control" id="${input.id}" ${input.accept ? `accept="${input.accept}"` : ''}>`;}else{formHTML+=`<input type="${input.type}" class="form-control" id="${input.id}" placeholder="${input.placeholder || ''}" ${input.step ? `step="${input.step}"` : ''} ${input.optional ? '' : 'required'}>`;}
+formHTML+=`</div>`;});formHTML+=`
+            <div class="text-center">
+                <button type="submit" class="calculator-submit-btn">
+                    <i class="fas fa-calculator"></i>
+                    Calculate Results
+                </button>
+            </div>
+        </form>
+        <div class="text-center mt-3">
+            <button class="modern-btn modern-btn-outline" onclick="backToCalculatorList()">
+                <i class="fas fa-arrow-left"></i>
+                Back to Tools
+            </button>
+        </div>
+    `;document.getElementById('calculator-content').innerHTML=formHTML;document.getElementById('calculator-result').style.display='none';}
+function backToCalculatorList(){if(currentCategory){const categoryUrl=urlMapping[currentCategory];if(categoryUrl){updateUrl('/'+categoryUrl+'/');}}
+if(typeof window.handleKeyboardInput==='function'){document.removeEventListener('keydown',window.handleKeyboardInput);}
+document.getElementById('calculator-list-items').style.display='grid';document.getElementById('calculator-form-container').style.display='none';document.getElementById('calculator-result').style.display='none';if(document.getElementById('back-button')){document.getElementById('back-button').style.display='inline-flex';}}
+function showCategories(){updateUrl('/');goToHomePage();}
+function calculateResult(event,calcId){event.preventDefault();const calc=calculators[calcId];if(!calc)return;const inputs={};calc.inputs.forEach(input=>{const element=document.getElementById(input.id);inputs[input.id]=input.type==='file'?(element.files&&element.files[0])||null:element.value;});try{const result=calc.calculate(inputs);if(result&&typeof result.then==='function'){showResult('<span class="spinner-border spinner-border-sm me-2" role="status"></span>Working...');result.then(showResult,error=>showError(error.message||'Error in calculation'));}else{showResult(result);}}catch(error){showError(error.message||'Error in calculation');}}
+function showResult(result){const resultContainer=document.getElementById('calculator-result');resultContainer.innerHTML=`
+        <div class="calculator-result-section">
+            <h5><i class="fas fa-check-circle me-2"></i>Calculation Results</h5>
+            <div class="calculator-result-content">${result}</div>
+        </div>
+    `;resultContainer.style.display='block';}
+function showError(message){const resultContainer=document.getElementById('calculator-result');resultContainer.innerHTML=`
+        <div class="alert alert-danger">
+            <h5><i class="fas fa-exclamation-circle me-2"></i>Calculation Error</h5>
+            <p class="mb-0">${message}</p>
+        </div>
+    `;resultContainer.style.display='block';}
+const SEARCH_RESULT_LIMIT=8;let searchEngine=null;let searchResults=[];let searchSelection=0;function loadSearchEngine(){return loadScript(SHARED_SCRIPT_PATH+'search.js')
+.then(()=>loadScript(SHARED_SCRIPT_PATH+'search-index.js'))
+.then(()=>searchEngine||(searchEngine=createSearchEngine(searchIndex)));}
+function renderSearchResults(query){const list=document.getElementById('searchResults');if(!list)return;searchResults=searchEngine?searchEngine.search(query,SEARCH_RESULT_LIMIT):[];searchSelection=0;if(!query.trim()){list.style.display='none';return;}
+list.innerHTML=searchResults.map((hit,i)=>`
+        <div class="modern-search-result${i === 0 ? ' active' : ''}" role="option" onmousedown="openSearchResult(${i}); return false;">
+            <i class="${calculators[hit.id].icon}"></i>
+            <span>${calculators[hit.id].title}</span>
+        </div>
+    `).join('')||'<div class="modern-search-empty">No calculators found. Please try a different search term.</div>';list.style.display='block';}
+function hideSearchResults(){const list=document.getElementById('searchResults');if(list)list.style.display='none';}
+function moveSearchSelection(step){const items=document.querySelectorAll('#searchResults .modern-search-result');if(items.length===0)return;items[searchSelection].classList.remove('active');searchSelection=(searchSelection+step+items.length)%items.length;items[searchSelection].classList.add('active');}
+function openSearchResult(i){const hit=searchResults[i];if(!hit)return;hideSearchResults();showCategory(hit.category);showCalculator(hit.id);}
+function searchCalculators(){const query=document.getElementById('searchInput').value;if(!query.trim())return;loadSearchEngine().then(()=>{renderSearchResults(query);if(searchResults.length){openSearchResult(0);}else{alert('Calculator not found. Please try a different search term.');}},error=>alert(error.message));}
+function searchFor(term){document.getElementById('searchInput').value=term;searchCalculators();}
+function initSearchBox(){const input=document.getElementById('searchInput');if(!input)return;input.addEventListener('focus',()=>loadSearchEngine().catch(()=>{}));input.addEventListener('input',()=>loadSearchEngine().then(()=>renderSearchResults(input.value),()=>{}));input.addEventListener('blur',hideSearchResults);input.addEventListener('keydown',event=>{if(event.key==='ArrowDown'||event.key==='ArrowUp'){event.preventDefault();moveSearchSelection(event.key==='ArrowDown'?1:-1);}else if(event.key==='Enter'){event.preventDefault();if(searchResults.length&&input.value.trim()){openSearchResult(searchSelection);}else{searchCalculators();}}else if(event.key==='Escape'){hideSearchResults();}});}
+window.initWindowsCalculator=function(){window.currentValue='0';window.previousValue=null;window.operator=null;window.waitingForOperand=false;window.calculatorMemory=0;window.calculatorHistory=[];window.currentMode='standard';window.angleUnit='deg';window.currentBase='DEC';window.inverseMode=false;window.graphScale=1;window.graphOffsetX=0;window.graphOffsetY=0;window.updateDisplay();window.updateMemoryDisplay();window.updateHistoryDisplay();setTimeout(()=>{window.updateBaseButtons();window.updateBitDisplay(0);},200);document.addEventListener('keydown',window.handleKeyboardInput);};window.updateDisplay=function(){const resultElement=document.getElementById('calc-result');if(resultElement){resultElement.textContent=window.currentValue;}};window.updateExpression=function(expression){const expressionElement=document.getElementById('calc-expression');if(expressionElement){expressionElement.textContent=expression;}};window.inputDecimal=function(){if(window.waitingForOperand){window.currentValue='0.';window.waitingForOperand=false;}else if(window.currentValue.indexOf('.')===-1){window.currentValue+='.';}
+window.updateDisplay();};window.clearAll=function(){window.currentValue='0';window.previousValue=null;window.operator=null;window.waitingForOperand=false;window.updateDisplay();window.updateExpression('');};window.clearEntry=function(){window.currentValue='0';window.updateDisplay();};window.backspace=function(){if(window.currentValue.length>1){window.currentValue=window.currentValue.slice(0,-1);}else{window.currentValue='0';}
+window.updateDisplay();};window.inputOperation=function(nextOperator){const inputValue=parseFloat(window.currentValue);if(window.previousValue===null){window.previousValue=inputValue;}else if(window.operator){const result=window.performCalculation();window.currentValue=String(result);window.previousValue=result;window.updateDisplay();}
+window.waitingForOperand=true;window.operator=nextOperator;window.updateExpression(window.previousValue+' '+nextOperator);};window.calculateResultWin=function(){const inputValue=parseFloat(window.currentValue);if(window.previousValue!==null&&window.operator){const result=window.performCalculation();const expression=window.previousValue+' '+window.operator+' '+window.currentValue+' =';window.addToHistory(expression,result);window.currentValue=String(result);window.previousValue=null;window.operator=null;window.waitingForOperand=true;window.updateDisplay();window.updateExpression(expression);}};window.calculatePercentage=function(){const value=parseFloat(window.currentValue);window.currentValue=String(value/100);window.updateDisplay();};window.calculateSquare=function(){const value=parseFloat(window.currentValue);const result=Math.pow(value,2);window.currentValue=String(result);window.updateDisplay();window.updateExpression('sqr('+value+')');};window.calculateSquareRoot=function(){const value=parseFloat(window.currentValue);if(value>=0){const result=Math.sqrt(value);window.currentValue=String(result);window.updateDisplay();window.updateExpression('√('+value+')');}};window.calculateReciprocal=function(){const value=parseFloat(window.currentValue);if(value!==0){const result=1/value;window.currentValue=String(result);window.updateDisplay();window.updateExpression('1/('+value+')');}};window.toggleSign=function(){if(window.currentValue!=='0'){window.currentValue=window.currentValue.startsWith('-')
+?window.currentValue.slice(1)
+:'-'+window.currentValue;window.updateDisplay();}};window.memoryOperation=function(operation){const value=parseFloat(window.currentValue);switch(operation){case'clear':
+window.calculatorMemory=0;window.updateMemoryDisplay();break;case'recall':
+window.currentValue=String(window.calculatorMemory);window.updateDisplay();break;case'add':
+window.calculatorMemory+=value;window.updateMemoryDisplay();break;case'subtract':
+window.calculatorMemory-=value;window.updateMemoryDisplay();break;case'store':
+window.calculatorMemory=value;window.updateMemoryDisplay();break;}};window.updateMemoryDisplay=function(){const memoryList=document.getElementById('memory-list');if(memoryList){if(window.calculatorMemory!==0){memoryList.innerHTML='<div class="memory-item" onclick="window.recallMemory()">'+
+'<div class="history-result">'+window.calculatorMemory+'</div></div>';}else{memoryList.innerHTML='<p class="no-memory">There\'s nothing saved in memory.</p>';}}};window.recallMemory=function(){window.currentValue=String(window.calculatorMemory);window.updateDisplay();};window.clearMemory=function(){window.calculatorMemory=0;window.updateMemoryDisplay();};window.addToHistory=function(expression,result){window.calculatorHistory.unshift({expression,result});if(window.calculatorHistory.length>20){window.calculatorHistory=window.calculatorHistory.slice(0,20);}
+window.updateHistoryDisplay();};window.updateHistoryDisplay=function(){const historyList=document.getElementById('history-list');if(historyList){if(window.calculatorHistory.length>0){historyList.innerHTML=window.calculatorHistory.map(item=>
+'<div class="history-item" onclick="window.recallHistory('+item.result+')">'+
+'<div class="history-expression">'+item.expression+'</div>'+
+'<div class="history-result">'+item.result+'</div>'+
+'</div>').join('');}else{historyList.innerHTML='<p class="no-history">There\'s no history yet.</p>';}}};window.recallHistory=function(result){window.currentValue=String(result);window.updateDisplay();};window.clearHistory=function(){window.calculatorHistory=[];window.updateHistoryDisplay();};function goToHomePage(){updateUrl('/');currentCategory=null;const calculatorDisplay=document.getElementById('calculator-display');if(calculatorDisplay){calculatorDisplay.style.display='none';}
+const calculatorFormContainer=document.getElementById('calculator-form-container');if(calculatorFormContainer){calculatorFormContainer.style.display='none';}
+const calculatorListItems=document.getElementById('calculator-list-items');if(calculatorListItems){calculatorListItems.style.display='grid';}
+const categoriesSection=document.getElementById('categories');if(categoriesSection){categoriesSection.style.display='block';}
+const homeSection=document.getElementById('home');if(homeSection){homeSection.style.display='flex';homeSection.scrollIntoView({behavior:'smooth'});}}
+const urlMapping={'financial':'financial-calculators','math':'math-calculators','health':'health-calculators','crypto':'crypto-calculators','physics':'physics-calculators','chemistry':'chemistry-calculators','engineering':'engineering-calculators','construction':'construction-calculators','conversion':'conversion-tools','business':'business-calculators','time':'time-calculators','utility':'utility-tools'};const reverseUrlMapping={};Object.keys(urlMapping).forEach(key=>{reverseUrlMapping[urlMapping[key]]=key;});function getCalculatorUrl(calcId){return calcId;}
+function getCalculatorIdFromUrl(url){return calculators[url]?url:url.replace(/-calculator$/,'');}
+function updateUrl(path){if(window.location.pathname!==path){window.history.pushState({},'',path);updateMetaTags(path);if(typeof gtag!=='undefined'){gtag('config','G-C5XH1MXSQQ',{page_path:path,page_title:document.title,page_location:window.location.href});}}}
+function updateMetaTags(path){const pathParts=path.replace(/^\/+|\/+$/g,'').split('/');let title='CalcHub - 150+ Free Online Calculator Tools';let description='CalcHub offers 150+ free online calculator tools for financial planning, health monitoring, mathematical calculations, and engineering projects.';let keywords='calculator, online calculator, financial calculator, math calculator, free calculator tools';if(pathParts.length===1&&pathParts[0]){const categoryKey=reverseUrlMapping[pathParts[0]];if(categoryKey){const categoryTitles={'financial':'Financial Calculators','math':'Mathematics Calculators','health':'Health & Fitness Calculators','crypto':'Cryptocurrency Calculators','physics':'Physics Calculators','chemistry':'Chemistry Calculators','engineering':'Engineering Calculators','construction':'Construction Calculators','conversion':'Unit Conversion Tools','business':'Business Calculators','time':'Date & Time Calculators','utility':'Utility Tools'};const categoryTitle=categoryTitles[categoryKey];title=`${categoryTitle} | Free Online Tools | CalcHub`;description=`Professional ${categoryTitle.toLowerCase()} for accurate calculations. Free, fast, and reliable tools for all your calculation needs.`;keywords=`${categoryKey} calculator, ${categoryTitle.toLowerCase()}, online ${categoryKey} tools, free calculator`;}}else if(pathParts.length===2){const categoryKey=reverseUrlMapping[pathParts[0]];const calculatorUrl=pathParts[1];const calcId=getCalculatorIdFromUrl(calculatorUrl);if(categoryKey&&calculators[calcId]){const calc=calculators[calcId];title=`${calc.title} | Free Online Tool | CalcHub`;description=`Free ${calc.title.toLowerCase()} - Professional online tool for accurate calculations. Fast, reliable, and easy to use.`;keywords=`${calc.title.toLowerCase()}, ${categoryKey} calculator, online calculator tool, free calculator`;}}
+document.title=title;let metaDesc=document.querySelector('meta[name="description"]');if(metaDesc){metaDesc.setAttribute('content',description);}
+let metaKeywords=document.querySelector('meta[name="keywords"]');if(metaKeywords){metaKeywords.setAttribute('content',keywords);}
+let ogTitle=document.querySelector('meta[property="og:title"]');if(ogTitle){ogTitle.setAttribute('content',title);}
+let ogDesc=document.querySelector('meta[property="og:description"]');if(ogDesc){ogDesc.setAttribute('content',description);}
+let twitterTitle=document.querySelector('meta[name="twitter:title"]');if(twitterTitle){twitterTitle.setAttribute('content',title);}
+let twitterDesc=document.querySelector('meta[name="twitter:description"]');if(twitterDesc){twitterDesc.setAttribute('content',description);}
+let canonical=document.querySelector('link[rel="canonical"]');if(canonical){canonical.setAttribute('href',`https://www.tahir.engineer${path}`);}}
+function handleRouting(path){path=path||window.location.pathname;const cleanPath=path.replace(/^\/+|\/+$/g,'');if(!cleanPath||cleanPath===''){goToHomePage();return;}
+const pathParts=cleanPath.split('/');if(pathParts.length===1){const categoryKey=reverseUrlMapping[pathParts[0]];if(categoryKey){showCategory(categoryKey);return;}}else if(pathParts.length===2){const categoryKey=reverseUrlMapping[pathParts[0]];const calculatorUrl=pathParts[1];if(categoryKey&&calculatorUrl){const calcId=getCalculatorIdFromUrl(calculatorUrl);if(toolCategories[categoryKey]&&toolCategories[categoryKey].includes(calcId)){showCategory(categoryKey);setTimeout(()=>showCalculator(calcId),500);return;}}}
+goToHomePage();}
+document.addEventListener('DOMContentLoaded',function(){const brandLogo=document.querySelector('.modern-brand');if(brandLogo){brandLogo.addEventListener('click',function(e){if(!brandLogo.getAttribute('href').includes('.html')){e.preventDefault();updateUrl('/');goToHomePage();}});}
+initSearchBox();const urlParams=new URLSearchParams(window.location.search);const calcParam=urlParams.get('calc');if(calcParam){const parts=calcParam.split('/');if(parts.length===2){const categoryKey=parts[0];const calcId=parts[1];if(toolCategories[categoryKey]&&toolCategories[categoryKey].includes(calcId)){window.history.replaceState({},'',`/${urlMapping[categoryKey]}/${calcId}`);showCategory(categoryKey);setTimeout(()=>showCalculator(calcId),300);return;}}}
+const categoryParam=urlParams.get('category');if(categoryParam){if(toolCategories[categoryParam]){window.history.replaceState({},'',`/${urlMapping[categoryParam]}/`);showCategory(categoryParam);return;}}
+handleRouting();if(window.location.hash==='#home'){updateUrl('/');goToHomePage();}else if(window.location.hash==='#categories'){updateUrl('/');const homeSection=document.getElementById('home');if(homeSection){homeSection.style.display='flex';}
+const categoriesSection=document.getElementById('categories');if(categoriesSection){categoriesSection.style.display='block';categoriesSection.scrollIntoView({behavior:'smooth'});}}});
@@ -337,137 +337,138 @@ window.calculateBitwise = function(operation) {
     }
 };
 
-// Graphing mode functions
+// Graphing mode functions. assets/js/graphing.js (loaded through the calculator's `requires`)
+// compiles each expression once and samples it adaptively; pan and zoom only change the view
+// and redraw from cached samples on the next animation frame.
+function graphView() {
+    return { scale: window.graphScale, offsetX: window.graphOffsetX, offsetY: window.graphOffsetY };
+}
+
+// The plot for the current canvas (the calculator's markup, and so the canvas, is rebuilt each time it opens)
+function getFunctionGraph() {
+    const canvas = document.getElementById('graphing-canvas');
+    if (!canvas || typeof createFunctionPlot !== 'function') return null;
+    if (!window.functionGraph || window.functionGraph.canvas !== canvas) {
+        window.functionGraph = createFunctionPlot(canvas, graphView);
+        attachGraphControls(canvas);
+    }
+    return window.functionGraph;
+}
+
+// Canvas pixels of a pointer event (the canvas is scaled by CSS on small screens)
+function canvasPoint(canvas, event) {
+    const rect = canvas.getBoundingClientRect();
+    return {
+        x: (event.clientX - rect.left) * canvas.width / rect.width,
+        y: (event.clientY - rect.top) * canvas.height / rect.height
+    };
+}
+
+// Zoom by factor, keeping the graph point under canvas pixel (x, y) in place
+function zoomGraph(factor, x, y) {
+    const canvas = document.getElementById('graphing-canvas');
+    if (!canvas) return;
+    if (x === undefined) {
+        x = canvas.width / 2;
+        y = canvas.height / 2;
+    }
+    window.graphOffsetX = x - canvas.width / 2 - (x - canvas.width / 2 - window.graphOffsetX) * factor;
+    window.graphOffsetY = y - canvas.height / 2 - (y - canvas.height / 2 - window.graphOffsetY) * factor;
+    window.graphScale *= factor;
+    const graph = getFunctionGraph();
+    if (graph) graph.requestRedraw();
+}
+
+// Drag to pan, wheel to zoom, Enter in the input to plot
+function attachGraphControls(canvas) {
+    let dragging = null;
+    canvas.style.touchAction = 'none';
+    canvas.style.cursor = 'grab';
+    canvas.addEventListener('pointerdown', event => {
+        dragging = canvasPoint(canvas, event);
+        canvas.setPointerCapture(event.pointerId);
+        canvas.style.cursor = 'grabbing';
+    });
+    canvas.addEventListener('pointermove', event => {
+        if (!dragging) return;
+        const point = canvasPoint(canvas, event);
+        window.graphOffsetX += point.x - dragging.x;
+        window.graphOffsetY += point.y - dragging.y;
+        dragging = point;
+        window.functionGraph.requestRedraw();
+    });
+    const endDrag = () => {
+        dragging = null;
+        canvas.style.cursor = 'grab';
+    };
+    canvas.addEventListener('pointerup', endDrag);
+    canvas.addEventListener('pointercancel', endDrag);
+    canvas.addEventListener('wheel', event => {
+        event.preventDefault();
+        const point = canvasPoint(canvas, event);
+        zoomGraph(Math.exp(-event.deltaY * 0.0015), point.x, point.y);
+    }, { passive: false });
+
+    const functionInput = document.getElementById('function-input');
+    if (functionInput) {
+        functionInput.addEventListener('keydown', event => {
+            if (event.key === 'Enter') window.plotFunction();
+        });
+    }
+}
+
 window.plotFunction = function() {
     const functionInput = document.getElementById('function-input');
     if (!functionInput) return;
-    
-    const funcText = functionInput.value.trim();
-    if (!funcText) return;
-    
-    const canvas = document.getElementById('graphing-canvas');
-    if (!canvas) return;
-    
-    const ctx = canvas.getContext('2d');
-    const width = canvas.width;
-    const height = canvas.height;
-    
-    // Clear canvas
-    ctx.clearRect(0, 0, width, height);
-    
-    // Draw axes
-    window.drawAxes(ctx, width, height);
-    
-    // Parse and plot function
+
+    const graph = getFunctionGraph();
+    if (!graph) return;
+
+    // Several functions can be plotted at once, separated by ';'
     try {
-        window.plotMathFunction(ctx, funcText, width, height);
+        graph.setFunctions(parseFunctionList(functionInput.value));
     } catch (error) {
         alert('Error plotting function: ' + error.message);
+        return;
     }
+    graph.requestRedraw();
 };
 
 window.drawAxes = function(ctx, width, height) {
-    ctx.strokeStyle = '#666';
-    ctx.lineWidth = 1;
-    
-    // X-axis
-    ctx.beginPath();
-    ctx.moveTo(0, height / 2);
-    ctx.lineTo(width, height / 2);
-    ctx.stroke();
-    
-    // Y-axis
-    ctx.beginPath();
-    ctx.moveTo(width / 2, 0);
-    ctx.lineTo(width / 2, height);
-    ctx.stroke();
-    
-    // Grid lines
-    ctx.strokeStyle = '#333';
-    ctx.lineWidth = 0.5;
-    const gridSize = 20 * window.graphScale;
-    
-    for (let x = width / 2 % gridSize; x < width; x += gridSize) {
-        ctx.beginPath();
-        ctx.moveTo(x, 0);
-        ctx.lineTo(x, height);
-        ctx.stroke();
-    }
-    
-    for (let y = height / 2 % gridSize; y < height; y += gridSize) {
-        ctx.beginPath();
-        ctx.moveTo(0, y);
-        ctx.lineTo(width, y);
-        ctx.stroke();
-    }
+    drawGraphAxes(ctx, width, height, graphView());
 };
 
 window.plotMathFunction = function(ctx, funcText, width, height) {
-    // Simple function parser - supports basic math functions
-    const func = new Function('x', `return ${funcText.replace(/\^/g, '**')}`);
-    
-    ctx.strokeStyle = '#0078d4';
-    ctx.lineWidth = 2;
-    ctx.beginPath();
-    
-    let firstPoint = true;
-    const scale = window.graphScale;
-    const centerX = width / 2 + window.graphOffsetX;
-    const centerY = height / 2 + window.graphOffsetY;
-    
-    for (let px = 0; px < width; px++) {
-        const x = (px - centerX) / (20 * scale);
-        try {
-            const y = func(x);
-            const py = centerY - y * 20 * scale;
-            
-            if (isFinite(y) && py >= 0 && py <= height) {
-                if (firstPoint) {
-                    ctx.moveTo(px, py);
-                    firstPoint = false;
-                } else {
-                    ctx.lineTo(px, py);
-                }
-            } else {
-                firstPoint = true;
-            }
-        } catch (e) {
-            firstPoint = true;
-        }
-    }
-    
-    ctx.stroke();
+    plotExpressions(ctx, parseFunctionList(funcText), width, height, graphView());
 };
 
 window.clearGraph = function() {
-    const canvas = document.getElementById('graphing-canvas');
-    if (canvas) {
-        const ctx = canvas.getContext('2d');
-        ctx.clearRect(0, 0, canvas.width, canvas.height);
-        window.drawAxes(ctx, canvas.width, canvas.height);
-    }
-    
     const functionInput = document.getElementById('function-input');
     if (functionInput) {
         functionInput.value = '';
     }
+
+    const graph = getFunctionGraph();
+    if (graph) {
+        graph.setFunctions([]);
+        graph.requestRedraw();
+    }
 };
 
 window.zoomIn = function() {
-    window.graphScale *= 1.2;
-    window.plotFunction();
+    zoomGraph(1.2);
 };
 
 window.zoomOut = function() {
-    window.graphScale /= 1.2;
-    window.plotFunction();
+    zoomGraph(1 / 1.2);
 };
 
 window.resetView = function() {
     window.graphScale = 1;
     window.graphOffsetX = 0;
     window.graphOffsetY = 0;
-    window.plotFunction();
+    const graph = getFunctionGraph();
+    if (graph) graph.requestRedraw();
 };
 
 // Sidebar functions
@@ -502,6 +503,9 @@ window.toggleMemory = function() {
 // Enhanced keyboard support
 window.handleKeyboardInput = function(event) {
     const key = event.key;
+
+    // Typing in a text field (the graphing function input, the search box) is not calculator input
+    if (event.target && /^(INPUT|TEXTAREA|SELECT)$/.test(event.target.tagName)) return;
     
     // Prevent default for calculator keys
     if ('0123456789+-*/=.'.includes(key) || key === 'Enter' || key === 'Backspace' || key === 'Escape') {
@@ -668,11 +672,8 @@ window.calculateAbs = function() {
 // Initialize graphing canvas when switching to graphing mode
 window.initGraphingMode = function() {
     if (window.currentMode === 'graphing') {
-        const canvas = document.getElementById('graphing-canvas');
-        if (canvas) {
-            const ctx = canvas.getContext('2d');
-            window.drawAxes(ctx, canvas.width, canvas.height);
-        }
+        const graph = getFunctionGraph();
+        if (graph) graph.redraw();
     }
 };
 
@@ -720,7 +721,7 @@ function showCategory(category) {
     // Update URL
     const categoryUrl = urlMapping[category];
     if (categoryUrl) {
-        updateUrl('/' + categoryUrl);
+        updateUrl('/' + categoryUrl + '/');
     }
     
     // Hide categories section
@@ -792,6 +793,72 @@ function loadCategoryTools(category) {
     listContainer.innerHTML = html || '<p class="text-muted text-center">No calculators available in this category.</p>';
 }
 
+// Calculator code is split into one module per calculator by generate_calculator_modules.py.
+// calculators-index.js only carries titles and icons; a module is fetched the first time it is opened.
+const CALCULATOR_MODULE_PATH = '/assets/js/calculators/';
+const calculatorLoads = {};
+
+// Shared scripts a calculator lists in `requires` (e.g. the unit tables), loaded once each
+const SHARED_SCRIPT_PATH = '/assets/js/';
+const scriptLoads = {};
+const loadedScripts = {};
+
+function hasCalculatorCode(calc) {
+    return !!calc && (typeof calc.calculate === 'function' || typeof calc.renderCustomInterface === 'function');
+}
+
+function isCalculatorLoaded(calc) {
+    return hasCalculatorCode(calc) && (calc.requires || []).every(name => loadedScripts[SHARED_SCRIPT_PATH + name + '.js']);
+}
+
+// Called by each calculator module when it has loaded
+function registerCalculator(calcId, definition) {
+    calculators[calcId] = Object.assign(calculators[calcId] || {}, definition);
+}
+
+function loadScript(src) {
+    if (!scriptLoads[src]) {
+        scriptLoads[src] = new Promise((resolve, reject) => {
+            const script = document.createElement('script');
+            script.src = src;
+            script.onload = () => {
+                loadedScripts[src] = true;
+                resolve();
+            };
+            script.onerror = () => {
+                delete scriptLoads[src];
+                reject(new Error('Could not load the calculator. Please check your connection and try again.'));
+            };
+            document.head.appendChild(script);
+        });
+    }
+    return scriptLoads[src];
+}
+
+// Load a calculator's module once (resolves immediately if the full calculators.js is on the page)
+function loadCalculator(calcId) {
+    if (isCalculatorLoaded(calculators[calcId])) {
+        return Promise.resolve(calculators[calcId]);
+    }
+    if (!calculatorLoads[calcId]) {
+        const module = hasCalculatorCode(calculators[calcId])
+            ? Promise.resolve()
+            : loadScript(CALCULATOR_MODULE_PATH + encodeURIComponent(calcId) + '.js');
+        calculatorLoads[calcId] = module
+            .then(() => (calculators[calcId].requires || []).reduce(
+                (loaded, name) => loaded.then(() => loadScript(SHARED_SCRIPT_PATH + name + '.js')),
+                Promise.resolve()))
+            .then(() => calculators[calcId])
+            .catch(error => {
+                delete calculatorLoads[calcId];
+                throw error;
+            });
+    }
+    return calculatorLoads[calcId];
+}
+
+window.loadCalculator = loadCalculator;
+
 // Show calculator function
 function showCalculator(calcId) {
     const calc = calculators[calcId];
@@ -819,6 +886,24 @@ function showCalculator(calcId) {
         document.getElementById('back-button').style.display = 'none';
     }
     
+    // Fetch the calculator's code on first use, then render it
+    if (!isCalculatorLoaded(calc)) {
+        document.getElementById('calculator-content').innerHTML = `
+            <div class="text-center py-4">
+                <div class="spinner-border text-primary" role="status">
+                    <span class="visually-hidden">Loading...</span>
+                </div>
+            </div>
+        `;
+        document.getElementById('calculator-result').style.display = 'none';
+        loadCalculator(calcId)
+            .then(() => showCalculator(calcId))
+            .catch(error => {
+                document.getElementById('calculator-content').innerHTML = `<p class="text-danger">${error.message}</p>`;
+            });
+        return;
+    }
+    
     // Check if this is a custom interface calculator
     if (calc.isCustomInterface && calc.renderCustomInterface) {
         // Render custom interface (like Windows Calculator)
@@ -844,8 +929,10 @@ function showCalculator(calcId) {
                 formHTML += `<option value="${option}">${option}</option>`;
             });
             formHTML += `</select>`;
+        } else if (input.type === 'file') {
+            formHTML += `<input type="file" class="form-control" id="${input.id}" ${input.accept ? `accept="${input.accept}"` : ''}>`;
         } else {
-            formHTML += `<input type="${input.type}" class="form-control" id="${input.id}" placeholder="${input.placeholder || ''}" ${input.step ? `step="${input.step}"` : ''} required>`;
+            formHTML += `<input type="${input.type}" class="form-control" id="${input.id}" placeholder="${input.placeholder || ''}" ${input.step ? `step="${input.step}"` : ''} ${input.optional ? '' : 'required'}>`;
         }
         
         formHTML += `</div>`;
@@ -875,7 +962,7 @@ function backToCalculatorList() {
     if (currentCategory) {
         const categoryUrl = urlMapping[currentCategory];
         if (categoryUrl) {
-            updateUrl('/' + categoryUrl);
+            updateUrl('/' + categoryUrl + '/');
         }
     }
     
@@ -911,12 +998,19 @@ function calculateResult(event, calcId) {
     const inputs = {};
     calc.inputs.forEach(input => {
         const element = document.getElementById(input.id);
-        inputs[input.id] = element.value;
+        // File inputs pass the chosen File (or null); the calculator reads it itself
+        inputs[input.id] = input.type === 'file' ? (element.files && element.files[0]) || null : element.value;
     });
     
     try {
         const result = calc.calculate(inputs);
-        showResult(result);
+        if (result && typeof result.then === 'function') {
+            // Long-running calculators (e.g. reading an uploaded file) return a Promise
+            showResult('<span class="spinner-border spinner-border-sm me-2" role="status"></span>Working...');
+            result.then(showResult, error => showError(error.message || 'Error in calculation'));
+        } else {
+            showResult(result);
+        }
     } catch (error) {
         showError(error.message || 'Error in calculation');
     }
@@ -946,29 +1040,71 @@ function showError(message) {
     resultContainer.style.display = 'block';
 }
 
-// Search functionality
+// Search functionality. The term index (search-index.js, built by search_index.py) and its
+// engine (search.js) are fetched the first time the search box is used; after that every
+// keystroke is answered from memory with ranked, typo-tolerant matches.
+const SEARCH_RESULT_LIMIT = 8;
+let searchEngine = null;
+let searchResults = [];
+let searchSelection = 0;
+
+function loadSearchEngine() {
+    return loadScript(SHARED_SCRIPT_PATH + 'search.js')
+        .then(() => loadScript(SHARED_SCRIPT_PATH + 'search-index.js'))
+        .then(() => searchEngine || (searchEngine = createSearchEngine(searchIndex)));
+}
+
+// Show the best matches for the query under the search box
+function renderSearchResults(query) {
+    const list = document.getElementById('searchResults');
+    if (!list) return;
+    searchResults = searchEngine ? searchEngine.search(query, SEARCH_RESULT_LIMIT) : [];
+    searchSelection = 0;
+    if (!query.trim()) {
+        list.style.display = 'none';
+        return;
+    }
+    list.innerHTML = searchResults.map((hit, i) => `
+        <div class="modern-search-result${i === 0 ? ' active' : ''}" role="option" onmousedown="openSearchResult(${i}); return false;">
+            <i class="${calculators[hit.id].icon}"></i>
+            <span>${calculators[hit.id].title}</span>
+        </div>
+    `).join('') || '<div class="modern-search-empty">No calculators found. Please try a different search term.</div>';
+    list.style.display = 'block';
+}
+
+function hideSearchResults() {
+    const list = document.getElementById('searchResults');
+    if (list) list.style.display = 'none';
+}
+
+function moveSearchSelection(step) {
+    const items = document.querySelectorAll('#searchResults .modern-search-result');
+    if (items.length === 0) return;
+    items[searchSelection].classList.remove('active');
+    searchSelection = (searchSelection + step + items.length) % items.length;
+    items[searchSelection].classList.add('active');
+}
+
+function openSearchResult(i) {
+    const hit = searchResults[i];
+    if (!hit) return;
+    hideSearchResults();
+    showCategory(hit.category);
+    showCalculator(hit.id);
+}
+
 function searchCalculators() {
-    const query = document.getElementById('searchInput').value.toLowerCase();
-    if (!query) return;
-    
-    // Simple search through all calculators
-    let found = false;
-    for (const [category, tools] of Object.entries(toolCategories)) {
-        for (const tool of tools) {
-            const calc = calculators[tool];
-            if (calc && calc.title.toLowerCase().includes(query)) {
-                showCategory(category);
-                setTimeout(() => showCalculator(tool), 500);
-                found = true;
-                break;
-            }
+    const query = document.getElementById('searchInput').value;
+    if (!query.trim()) return;
+    loadSearchEngine().then(() => {
+        renderSearchResults(query);
+        if (searchResults.length) {
+            openSearchResult(0);
+        } else {
+            alert('Calculator not found. Please try a different search term.');
         }
-        if (found) break;
-    }
-    
-    if (!found) {
-        alert('Calculator not found. Please try a different search term.');
-    }
+    }, error => alert(error.message));
 }
 
 // Search for specific term
@@ -977,6 +1113,29 @@ function searchFor(term) {
     searchCalculators();
 }
 
+function initSearchBox() {
+    const input = document.getElementById('searchInput');
+    if (!input) return;
+    input.addEventListener('focus', () => loadSearchEngine().catch(() => {}));
+    input.addEventListener('input', () => loadSearchEngine().then(() => renderSearchResults(input.value), () => {}));
+    input.addEventListener('blur', hideSearchResults);
+    input.addEventListener('keydown', event => {
+        if (event.key === 'ArrowDown' || event.key === 'ArrowUp') {
+            event.preventDefault();
+            moveSearchSelection(event.key === 'ArrowDown' ? 1 : -1);
+        } else if (event.key === 'Enter') {
+            event.preventDefault();
+            if (searchResults.length && input.value.trim()) {
+                openSearchResult(searchSelection);
+            } else {
+                searchCalculators();
+            }
+        } else if (event.key === 'Escape') {
+            hideSearchResults();
+        }
+    });
+}
+
 // Windows Calculator Global Functions
 window.initWindowsCalculator = function() {
     // Calculator state
@@ -1285,13 +1444,14 @@ Object.keys(urlMapping).forEach(key => {
     reverseUrlMapping[urlMapping[key]] = key;
 });
 
-// Calculator name to URL mapping
+// Calculator id to URL mapping; generate_pages.py writes each calculator to /<category>/<id>(.html)
 function getCalculatorUrl(calcId) {
-    return calcId.replace(/([A-Z])/g, '-$1').toLowerCase() + '-calculator';
+    return calcId;
 }
 
+// Also accepts the older '<id>-calculator' URLs that may still be bookmarked
 function getCalculatorIdFromUrl(url) {
-    return url.replace(/-calculator$/, '').replace(/-/g, '_');
+    return calculators[url] ? url : url.replace(/-calculator$/, '');
 }
 
 // Update URL without page reload
@@ -1457,6 +1617,8 @@ document.addEventListener('DOMContentLoaded', function() {
             }
         });
     }
+
+    initSearchBox();
     
     // Check for URL query parameter (from generated pages redirect)
     const urlParams = new URLSearchParams(window.location.search);
@@ -1486,7 +1648,7 @@ document.addEventListener('DOMContentLoaded', function() {
         // Format: category=categoryKey
         if (toolCategories[categoryParam]) {
             // Clean URL
-            window.history.replaceState({}, '', `/${urlMapping[categoryParam]}`);
+            window.history.replaceState({}, '', `/${urlMapping[categoryParam]}/`);
             showCategory(categoryParam);
             return;
         }
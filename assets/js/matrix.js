@@ -0,0 +1,246 @@
+// N x N linear algebra for the matrix calculator (mirrored by matrix.py).
+// A matrix is { rows, cols, data } with the entries in one row-major Float64Array,
+// so element (i, j) is data[i * cols + j] and rows are contiguous in memory.
+
+const MATRIX_BLOCK = 64;
+
+function createMatrix(rows, cols, data) {
+    return { rows: rows, cols: cols, data: data || new Float64Array(rows * cols) };
+}
+
+function identityMatrix(n) {
+    const matrix = createMatrix(n, n);
+    for (let i = 0; i < n; i++) matrix.data[i * n + i] = 1;
+    return matrix;
+}
+
+// Rows separated by ';' or new lines, entries by commas or spaces: "1, 2; 3, 4".
+// Without row separators a perfect-square count of entries is read as a square matrix,
+// or, when it matches vectorLength, as a column vector.
+function parseMatrix(text, vectorLength) {
+    const rows = String(text).split(/[;\n]/).map(row => row.trim()).filter(row => row !== '')
+        .map(row => row.split(/[\s,]+/).filter(entry => entry !== '').map(Number));
+    if (rows.length === 0) throw new Error('Please enter matrix elements');
+    let values = rows;
+    if (rows.length === 1 && rows[0].length === vectorLength) {
+        values = rows[0].map(value => [value]);
+    } else if (rows.length === 1) {
+        const n = Math.round(Math.sqrt(rows[0].length));
+        if (n * n !== rows[0].length) {
+            throw new Error(`${rows[0].length} elements do not form a square matrix; separate rows with ';'`);
+        }
+        values = [];
+        for (let i = 0; i < n; i++) values.push(rows[0].slice(i * n, (i + 1) * n));
+    }
+    const cols = values[0].length;
+    const matrix = createMatrix(values.length, cols);
+    values.forEach((row, i) => {
+        if (row.length !== cols) throw new Error(`Row ${i + 1} has ${row.length} elements, expected ${cols}`);
+        row.forEach((value, j) => {
+            if (!Number.isFinite(value)) throw new Error(`Row ${i + 1} has an invalid element`);
+            matrix.data[i * cols + j] = value;
+        });
+    });
+    return matrix;
+}
+
+function addMatrices(a, b) {
+    if (a.rows !== b.rows || a.cols !== b.cols) {
+        throw new Error(`Cannot add a ${a.rows}×${a.cols} and a ${b.rows}×${b.cols} matrix`);
+    }
+    const sum = createMatrix(a.rows, a.cols);
+    for (let i = 0; i < sum.data.length; i++) sum.data[i] = a.data[i] + b.data[i];
+    return sum;
+}
+
+// Blocked i-k-j product. Each MATRIX_BLOCK-square tile of b stays in cache while every row
+// of a passes over it, and four rows of b are folded into each pass over a row of the result,
+// so the innermost loop does four multiply-adds per load and store of the result.
+function multiplyMatrices(a, b) {
+    if (a.cols !== b.rows) {
+        throw new Error(`Cannot multiply a ${a.rows}×${a.cols} by a ${b.rows}×${b.cols} matrix`);
+    }
+    const n = a.rows, m = a.cols, p = b.cols;
+    const product = createMatrix(n, p);
+    const A = a.data, B = b.data, C = product.data;
+    for (let kk = 0; kk < m; kk += MATRIX_BLOCK) {
+        const kEnd = Math.min(kk + MATRIX_BLOCK, m);
+        for (let jj = 0; jj < p; jj += MATRIX_BLOCK) {
+            const jEnd = Math.min(jj + MATRIX_BLOCK, p);
+            for (let i = 0; i < n; i++) {
+                const rowA = i * m;
+                const rowC = i * p;
+                let k = kk;
+                for (; k + 3 < kEnd; k += 4) {
+                    const a0 = A[rowA + k], a1 = A[rowA + k + 1], a2 = A[rowA + k + 2], a3 = A[rowA + k + 3];
+                    const b0 = k * p, b1 = b0 + p, b2 = b1 + p, b3 = b2 + p;
+                    for (let j = jj; j < jEnd; j++) {
+                        C[rowC + j] += a0 * B[b0 + j] + a1 * B[b1 + j] + a2 * B[b2 + j] + a3 * B[b3 + j];
+                    }
+                }
+                for (; k < kEnd; k++) {
+                    const aik = A[rowA + k];
+                    const rowB = k * p;
+                    for (let j = jj; j < jEnd; j++) C[rowC + j] += aik * B[rowB + j];
+                }
+            }
+        }
+    }
+    return product;
+}
+
+function transposeMatrix(a) {
+    const t = createMatrix(a.cols, a.rows);
+    for (let i = 0; i < a.rows; i++) {
+        for (let j = 0; j < a.cols; j++) t.data[j * a.rows + i] = a.data[i * a.cols + j];
+    }
+    return t;
+}
+
+// Largest absolute entry, the scale for the singularity tolerance
+function maxAbs(data) {
+    let max = 0;
+    for (let i = 0; i < data.length; i++) {
+        const v = Math.abs(data[i]);
+        if (v > max) max = v;
+    }
+    return max;
+}
+
+function swapRows(data, cols, r1, r2) {
+    const row = data.slice(r1 * cols, (r1 + 1) * cols);
+    data.copyWithin(r1 * cols, r2 * cols, (r2 + 1) * cols);
+    data.set(row, r2 * cols);
+}
+
+// LU decomposition with partial pivoting, PA = LU, in one Float64Array (L below the diagonal,
+// unit diagonal implied). pivots[k] is the row swapped with row k at step k. A pivot no larger
+// than n * eps * max|a| counts as zero, so the matrix is reported singular.
+function luDecompose(a) {
+    if (a.rows !== a.cols) throw new Error(`A ${a.rows}×${a.cols} matrix is not square`);
+    const n = a.rows;
+    const lu = Float64Array.from(a.data);
+    const pivots = new Int32Array(n);
+    const tolerance = n * Number.EPSILON * maxAbs(lu);
+    let sign = 1;
+    let singular = false;
+    for (let k = 0; k < n; k++) {
+        let p = k;
+        let max = Math.abs(lu[k * n + k]);
+        for (let i = k + 1; i < n; i++) {
+            const v = Math.abs(lu[i * n + k]);
+            if (v > max) {
+                max = v;
+                p = i;
+            }
+        }
+        pivots[k] = p;
+        if (p !== k) {
+            swapRows(lu, n, k, p);
+            sign = -sign;
+        }
+        if (max <= tolerance) {
+            singular = true;
+            continue;
+        }
+        const pivot = lu[k * n + k];
+        const rowK = k * n;
+        for (let i = k + 1; i < n; i++) {
+            const rowI = i * n;
+            const factor = (lu[rowI + k] /= pivot);
+            if (factor === 0) continue;
+            for (let j = k + 1; j < n; j++) lu[rowI + j] -= factor * lu[rowK + j];
+        }
+    }
+    return { n: n, lu: lu, pivots: pivots, sign: sign, singular: singular };
+}
+
+function determinant(a) {
+    const decomposition = luDecompose(a);
+    if (decomposition.singular) return 0;
+    const { n, lu } = decomposition;
+    let det = decomposition.sign;
+    for (let i = 0; i < n; i++) det *= lu[i * n + i];
+    return det;
+}
+
+// Solve AX = B for X (B is n x m); throws when A is singular
+function solveMatrix(a, b) {
+    const decomposition = luDecompose(a);
+    if (decomposition.singular) throw new Error('The matrix is singular');
+    const { n, lu, pivots } = decomposition;
+    if (b.rows !== n) throw new Error(`Right-hand side has ${b.rows} rows, expected ${n}`);
+    const m = b.cols;
+    const x = Float64Array.from(b.data);
+    for (let k = 0; k < n; k++) {
+        if (pivots[k] !== k) swapRows(x, m, k, pivots[k]);
+    }
+    // Forward substitution with unit-diagonal L, then back substitution with U, all columns at once
+    for (let i = 0; i < n; i++) {
+        for (let k = 0; k < i; k++) {
+            const l = lu[i * n + k];
+            if (l === 0) continue;
+            for (let j = 0; j < m; j++) x[i * m + j] -= l * x[k * m + j];
+        }
+    }
+    for (let i = n - 1; i >= 0; i--) {
+        for (let k = i + 1; k < n; k++) {
+            const u = lu[i * n + k];
+            if (u === 0) continue;
+            for (let j = 0; j < m; j++) x[i * m + j] -= u * x[k * m + j];
+        }
+        const diagonal = lu[i * n + i];
+        for (let j = 0; j < m; j++) x[i * m + j] /= diagonal;
+    }
+    return createMatrix(n, m, x);
+}
+
+function invertMatrix(a) {
+    return solveMatrix(a, identityMatrix(a.rows));
+}
+
+// Rank by Gaussian elimination with partial pivoting (any shape)
+function matrixRank(a) {
+    const { rows, cols } = a;
+    const data = Float64Array.from(a.data);
+    const tolerance = Math.max(rows, cols) * Number.EPSILON * maxAbs(data);
+    let rank = 0;
+    for (let col = 0; col < cols && rank < rows; col++) {
+        let p = rank;
+        let max = Math.abs(data[rank * cols + col]);
+        for (let i = rank + 1; i < rows; i++) {
+            const v = Math.abs(data[i * cols + col]);
+            if (v > max) {
+                max = v;
+                p = i;
+            }
+        }
+        if (max <= tolerance) continue;
+        swapRows(data, cols, rank, p);
+        const pivotRow = rank * cols;
+        for (let i = rank + 1; i < rows; i++) {
+            const factor = data[i * cols + col] / data[pivotRow + col];
+            if (factor === 0) continue;
+            for (let j = col; j < cols; j++) data[i * cols + j] -= factor * data[pivotRow + j];
+        }
+        rank++;
+    }
+    return rank;
+}
+
+// Rows as "[a b c]" lines, at most `limit` rows and columns shown
+function formatMatrix(a, limit = 10) {
+    const clean = v => {
+        const rounded = parseFloat(v.toPrecision(10));
+        return Object.is(rounded, -0) ? '0' : String(rounded);
+    };
+    const lines = [];
+    for (let i = 0; i < Math.min(a.rows, limit); i++) {
+        const row = [];
+        for (let j = 0; j < Math.min(a.cols, limit); j++) row.push(clean(a.data[i * a.cols + j]));
+        if (a.cols > limit) row.push('…');
+        lines.push(`[${row.join(' ')}]`);
+    }
+    if (a.rows > limit) lines.push(`… (${a.rows}×${a.cols}, first ${limit} rows and columns shown)`);
+    return lines.join('\n');
+}
@@ -0,0 +1,150 @@
+// Black-Scholes / Black-76 option pricing with Greeks (mirrored by options.py).
+// Both models are the generalised Black-Scholes formula with cost of carry b:
+// spot options carry b = r - q, options on futures (Black-76) carry b = 0.
+
+// Cumulative standard normal distribution, accurate to double precision (Hart 1968, as given by West 2005)
+function normCdf(x) {
+    const z = Math.abs(x);
+    let c = 0;
+    if (z <= 37) {
+        const e = Math.exp(-z * z / 2);
+        if (z < 7.07106781186547) {
+            let n = 3.52624965998911e-02 * z + 0.700383064443688;
+            n = n * z + 6.37396220353165;
+            n = n * z + 33.912866078383;
+            n = n * z + 112.079291497871;
+            n = n * z + 221.213596169931;
+            n = n * z + 220.206867912376;
+            let d = 8.83883476483184e-02 * z + 1.75566716318264;
+            d = d * z + 16.064177579207;
+            d = d * z + 86.7807322029461;
+            d = d * z + 296.564248779674;
+            d = d * z + 637.333633378831;
+            d = d * z + 793.826512519948;
+            d = d * z + 440.413735824752;
+            c = e * n / d;
+        } else {
+            let d = z + 0.65;
+            d = z + 4 / d;
+            d = z + 3 / d;
+            d = z + 2 / d;
+            d = z + 1 / d;
+            c = e / d / 2.506628274631;
+        }
+    }
+    return x > 0 ? 1 - c : c;
+}
+
+function normPdf(x) {
+    return Math.exp(-x * x / 2) / 2.5066282746310002;
+}
+
+// Price and Greeks of one European option.
+// model: 'black-scholes' (underlying is spot, q = yield) or 'black-76' (underlying is a futures price).
+// t in years, r, q and vol as decimals. Theta is per year, vega and rho per 1.00 change.
+function priceOption(isCall, underlying, strike, t, r, q, vol, model) {
+    const futures = model === 'black-76';
+    const carry = futures ? 0 : r - q;
+    const carryDiscount = Math.exp((carry - r) * t);
+    const discount = Math.exp(-r * t);
+    const forwardValue = underlying * carryDiscount;
+    const strikeValue = strike * discount;
+    const sigmaRootT = vol * Math.sqrt(t);
+
+    if (!(t > 0) || !(sigmaRootT > 0)) {
+        // Expired or zero volatility: the discounted forward payoff
+        const inMoney = isCall ? forwardValue > strikeValue : strikeValue > forwardValue;
+        const price = inMoney ? (isCall ? forwardValue - strikeValue : strikeValue - forwardValue) : 0;
+        return {
+            price: price,
+            delta: inMoney ? (isCall ? carryDiscount : -carryDiscount) : 0,
+            gamma: 0,
+            vega: 0,
+            theta: 0,
+            rho: futures ? -t * price : (inMoney ? (isCall ? 1 : -1) * strike * t * discount : 0)
+        };
+    }
+
+    const d1 = (Math.log(underlying / strike) + (carry + vol * vol / 2) * t) / sigmaRootT;
+    const d2 = d1 - sigmaRootT;
+    const pdf = normPdf(d1);
+    const decay = -forwardValue * pdf * vol / (2 * Math.sqrt(t));
+    let price, delta, theta, rho;
+    if (isCall) {
+        const nd1 = normCdf(d1);
+        const nd2 = normCdf(d2);
+        price = forwardValue * nd1 - strikeValue * nd2;
+        delta = carryDiscount * nd1;
+        theta = decay - (carry - r) * forwardValue * nd1 - r * strikeValue * nd2;
+        rho = futures ? -t * price : strike * t * discount * nd2;
+    } else {
+        const nd1 = normCdf(-d1);
+        const nd2 = normCdf(-d2);
+        price = strikeValue * nd2 - forwardValue * nd1;
+        delta = -carryDiscount * nd1;
+        theta = decay + (carry - r) * forwardValue * nd1 + r * strikeValue * nd2;
+        rho = futures ? -t * price : -strike * t * discount * nd2;
+    }
+    return {
+        price: price,
+        delta: delta,
+        gamma: carryDiscount * pdf / (underlying * sigmaRootT),
+        vega: forwardValue * pdf * Math.sqrt(t),
+        theta: theta,
+        rho: rho
+    };
+}
+
+// Volatility that reproduces a market price: Newton steps on vega, kept inside a bisection bracket.
+// Returns NaN when the price is outside the no-arbitrage bounds.
+function impliedVolatility(price, isCall, underlying, strike, t, r, q, model) {
+    const lower = priceOption(isCall, underlying, strike, t, r, q, 0, model).price;
+    const upper = isCall
+        ? underlying * Math.exp(((model === 'black-76' ? 0 : r - q) - r) * t)
+        : strike * Math.exp(-r * t);
+    if (!(t > 0) || !(price > lower) || !(price < upper)) return NaN;
+
+    let low = 0;
+    let high = 10;
+    let vol = 0.5;
+    for (let i = 0; i < 100; i++) {
+        const option = priceOption(isCall, underlying, strike, t, r, q, vol, model);
+        const diff = option.price - price;
+        if (Math.abs(diff) <= 1e-14 * price) return vol;
+        if (diff > 0) high = vol; else low = vol;
+        const next = vol - diff / option.vega;
+        vol = next > low && next < high ? next : (low + high) / 2;
+        if (high - low < 1e-15) break;
+    }
+    return vol;
+}
+
+// Price a strike x expiry grid in one call. volatility is a number or a function (strike, t) -> vol.
+// Returns Float64Arrays in row-major order (one row per expiry).
+function priceGrid(isCall, underlying, strikes, expiries, r, q, volatility, model) {
+    const size = strikes.length * expiries.length;
+    const grid = {
+        strikes: strikes,
+        expiries: expiries,
+        price: new Float64Array(size),
+        delta: new Float64Array(size),
+        gamma: new Float64Array(size),
+        vega: new Float64Array(size),
+        theta: new Float64Array(size),
+        rho: new Float64Array(size)
+    };
+    const volAt = typeof volatility === 'function' ? volatility : () => volatility;
+    let cell = 0;
+    for (let i = 0; i < expiries.length; i++) {
+        for (let j = 0; j < strikes.length; j++, cell++) {
+            const option = priceOption(isCall, underlying, strikes[j], expiries[i], r, q, volAt(strikes[j], expiries[i]), model);
+            grid.price[cell] = option.price;
+            grid.delta[cell] = option.delta;
+            grid.gamma[cell] = option.gamma;
+            grid.vega[cell] = option.vega;
+            grid.theta[cell] = option.theta;
+            grid.rho[cell] = option.rho;
+        }
+    }
+    return grid;
+}
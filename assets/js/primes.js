@@ -0,0 +1,171 @@
+// Number theory core for the number-theory calculator (mirrored by primes.py).
+// Integers are BigInt so inputs beyond 2^53 stay exact; small primes come from a
+// segmented sieve that is cached and extended on demand.
+
+const SIEVE_SEGMENT = 65536;
+// Factorization trial-divides below this bound and leaves larger factors to Pollard's rho
+const TRIAL_LIMIT = 1024;
+// The first 12 primes as Miller-Rabin bases are deterministic below this bound (covers all 64-bit inputs)
+const MILLER_RABIN_BASES = [2n, 3n, 5n, 7n, 11n, 13n, 17n, 19n, 23n, 29n, 31n, 37n];
+const MILLER_RABIN_LIMIT = 3317044064679887385961981n;
+
+const sieveCache = { limit: 1, primes: [] };
+
+// Read the integer part of a text field the way parseInt does, but exactly; 0n when there is none
+function parseInteger(text) {
+    const match = /^\s*([-+]?\d+)/.exec(String(text));
+    return match ? BigInt(match[1]) : 0n;
+}
+
+// Grow the cached prime list to cover `limit`, one segment at a time
+function extendSieve(limit) {
+    const primes = sieveCache.primes;
+    if (sieveCache.limit < SIEVE_SEGMENT) {
+        // First segment: plain sieve of Eratosthenes, which also yields every base prime for later segments
+        const composite = new Uint8Array(SIEVE_SEGMENT + 1);
+        for (let i = 2; i <= SIEVE_SEGMENT; i++) {
+            if (composite[i]) continue;
+            primes.push(i);
+            for (let m = i * i; m <= SIEVE_SEGMENT; m += i) composite[m] = 1;
+        }
+        sieveCache.limit = SIEVE_SEGMENT;
+    }
+    while (sieveCache.limit < limit) {
+        const low = sieveCache.limit + 1;
+        const high = low + SIEVE_SEGMENT - 1;
+        const composite = new Uint8Array(SIEVE_SEGMENT);
+        for (let i = 0; i < primes.length; i++) {
+            const p = primes[i];
+            if (p * p > high) break;
+            for (let m = Math.max(p * p, Math.ceil(low / p) * p); m <= high; m += p) composite[m - low] = 1;
+        }
+        for (let i = 0; i < SIEVE_SEGMENT; i++) {
+            if (!composite[i]) primes.push(low + i);
+        }
+        sieveCache.limit = high;
+    }
+    return primes;
+}
+
+// Index of the first cached prime greater than x
+function primeIndexAbove(x) {
+    const primes = extendSieve(x);
+    let low = 0;
+    let high = primes.length;
+    while (low < high) {
+        const mid = (low + high) >>> 1;
+        if (primes[mid] <= x) low = mid + 1; else high = mid;
+    }
+    return low;
+}
+
+// All primes <= limit, as Numbers
+function primesUpTo(limit) {
+    return sieveCache.primes.slice(0, primeIndexAbove(limit));
+}
+
+function gcd(a, b) {
+    a = a < 0n ? -a : a;
+    b = b < 0n ? -b : b;
+    while (b) [a, b] = [b, a % b];
+    return a;
+}
+
+function modPow(base, exponent, modulus) {
+    let result = 1n;
+    base %= modulus;
+    while (exponent > 0n) {
+        if (exponent & 1n) result = result * base % modulus;
+        base = base * base % modulus;
+        exponent >>= 1n;
+    }
+    return result;
+}
+
+// Miller-Rabin with the fixed bases: exact below MILLER_RABIN_LIMIT, a strong probable-prime test above it
+function isPrime(n) {
+    n = BigInt(n);
+    if (n < 2n) return false;
+    if (n <= SIEVE_SEGMENT) {
+        const primes = extendSieve(SIEVE_SEGMENT);
+        const index = primeIndexAbove(Number(n));
+        return primes[index - 1] === Number(n);
+    }
+    for (const p of MILLER_RABIN_BASES) {
+        if (n % p === 0n) return false;
+    }
+    let d = n - 1n;
+    let s = 0;
+    while (!(d & 1n)) {
+        d >>= 1n;
+        s++;
+    }
+    witness: for (const a of MILLER_RABIN_BASES) {
+        let x = modPow(a, d, n);
+        if (x === 1n || x === n - 1n) continue;
+        for (let i = 1; i < s; i++) {
+            x = x * x % n;
+            if (x === n - 1n) continue witness;
+        }
+        return false;
+    }
+    return true;
+}
+
+// A non-trivial factor of an odd composite n (Pollard's rho with Brent's cycle detection)
+function pollardRho(n) {
+    for (let c = 1n; ; c++) {
+        let y = 2n, x = 2n, ys = 2n, q = 1n, g = 1n;
+        let r = 1;
+        const m = 128;
+        while (g === 1n) {
+            x = y;
+            for (let i = 0; i < r; i++) y = (y * y + c) % n;
+            for (let k = 0; k < r && g === 1n; k += m) {
+                ys = y;
+                for (let i = Math.min(m, r - k); i > 0; i--) {
+                    y = (y * y + c) % n;
+                    q = q * (x > y ? x - y : y - x) % n;
+                }
+                g = gcd(q, n);
+            }
+            r *= 2;
+        }
+        if (g === n) {
+            // The batched product overshot: step back one value at a time from the last checkpoint
+            do {
+                ys = (ys * ys + c) % n;
+                g = gcd(x > ys ? x - ys : ys - x, n);
+            } while (g === 1n);
+        }
+        if (g !== n) return g;
+    }
+}
+
+// Prime factors of n with multiplicity, ascending, as BigInt
+function factorize(n) {
+    n = BigInt(n);
+    const factors = [];
+    if (n < 2n) return factors;
+    const primes = extendSieve(TRIAL_LIMIT);
+    for (let i = 0; primes[i] < TRIAL_LIMIT; i++) {
+        const p = BigInt(primes[i]);
+        if (p * p > n) break;
+        while (n % p === 0n) {
+            factors.push(p);
+            n /= p;
+        }
+    }
+    const pending = n > 1n ? [n] : [];
+    while (pending.length) {
+        const m = pending.pop();
+        // Every prime below TRIAL_LIMIT is gone, so anything below its square is prime
+        if (m < BigInt(TRIAL_LIMIT) ** 2n || isPrime(m)) {
+            factors.push(m);
+        } else {
+            const d = pollardRho(m);
+            pending.push(d, m / d);
+        }
+    }
+    return factors.sort((a, b) => (a < b ? -1 : a > b ? 1 : 0));
+}
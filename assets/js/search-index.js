@@ -0,0 +1,2 @@
+// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit
+const searchIndex = {"stopwords":["a","an","and","by","calculator","calculators","for","in","of","on","or","the","to","tool","tools","with","your"],"docs":[["ph","chemistry"],["algebra","math"],["area","conversion"],["bmi","health"],["bmr","health"],["time-conversion","conversion"],["angle","conversion"],["force-conversion","conversion"],["loan","financial"],["power-conversion","conversion"],["speed","conversion"],["energy-conversion","conversion"],["force","physics"],["length","conversion"],["macro-calculator","health"],["sleep-calculator","health"],["torque","conversion"],["volume","conversion"],["weight","conversion"],["crypto-gas-optimizer","crypto"],["density","conversion"],["energy","physics"],["matrix-calculator","math"],["calorie","health"],["currency","conversion"],["pressure","conversion"],["savings","financial"],["vo2-max","health"],["body-age","health"],["body-fat","health"],["fraction","math"],["frequency","conversion"],["geometry-calculator","math"],["molarity","chemistry"],["mortgage","financial"],["recovery-calculator","health"],["velocity","physics"],["weight-loss-planner","health"],["capacitor","engineering"],["crypto-stop-loss","crypto"],["luminosity","conversion"],["ohms-law","engineering"],["ovulation","health"],["pipe-flow","engineering"],["blood-sugar","health"],["crypto-tax-calculator","crypto"],["crypto-volatility","crypto"],["gear-ratio","engineering"],["investment","financial"],["percentage","math"],["polynomial-calculator","math"],["scientific-calculator","math"],["statistics-calculator","math"],["temperature","conversion"],["windows-calculator","math"],["wire-gauge","engineering"],["crypto-futures-pnl","crypto"],["data-storage","conversion"],["decibel-converter","engineering"],["fuel-economy-conversion","conversion"],["muscle-mass","health"],["probability-calculator","math"],["bmi-children","health"],["crypto-funding-rate","crypto"],["crypto-grid-trading","crypto"],["ideal-weight","health"],["led-resistor","engineering"],["meal-planner","health"],["power-factor","engineering"],["radioactivity","conversion"],["trigonometry","math"],["water-intake","health"],["binary-calculator","math"],["body-measurement","health"],["crypto-altcoin-season","crypto"],["crypto-converter","crypto"],["crypto-hodl-calculator","crypto"],["crypto-nft-valuation","crypto"],["crypto-portfolio-tracker","crypto"],["crypto-position-size","crypto"],["crypto-swing-trade","crypto"],["crypto-yield-farming","crypto"],["fitness-level","health"],["magnetic-field","conversion"],["number-theory","math"],["pulley-system","engineering"],["rlc-resonance","engineering"],["training-load","health"],["amplifier-gain","engineering"],["antenna-length","engineering"],["calculus-calculator","math"],["crypto-compound-yield","crypto"],["crypto-momentum-indicator","crypto"],["crypto-rainbow-chart","crypto"],["lean-body-mass","health"],["protein-intake","health"],["quadratic","math"],["beam-deflection","engineering"],["complex-numbers","math"],["crypto-lending-returns","crypto"],["crypto-rsi-calculator","crypto"],["crypto-volume-analysis","crypto"],["heart-rate-zone","health"],["spring-constant","engineering"],["staking-rewards","crypto"],["voltage-divider","engineering"],["crypto-accumulation","crypto"],["crypto-arbitrage","crypto"],["crypto-drawdown","crypto"],["filter-frequency","engineering"],["hydration-status","health"],["impermanent-loss","crypto"],["molecular-weight","chemistry"],["motor-efficiency","engineering"],["rc-time-constant","engineering"],["body-surface-area","health"],["compound-interest","financial"],["crypto-correlation","crypto"],["crypto-hash-rate","crypto"],["crypto-leverage-calculator","crypto"],["macros-converter","health"],["power-consumption","engineering"],["sequence-series","math"],["series-resistance","engineering"],["target-heart-rate","health"],["thermal-expansion","engineering"],["three-phase-power","engineering"],["workout-intensity","health"],["crypto-carry-trade","crypto"],["crypto-fear-greed","crypto"],["hydraulic-pressure","engineering"],["impedance-matching","engineering"],["inductor-reactance","engineering"],["logarithm-calculator","math"],["pregnancy-due-date","health"],["waist-hip-ratio","health"],["crypto-dca","crypto"],["crypto-dollar-hedge","crypto"],["crypto-market-cap-calc","crypto"],["crypto-sharpe-ratio","crypto"],["parallel-resistance","engineering"],["resistor-color","engineering"],["crypto-basis-trading","crypto"],["crypto-flash-loan","crypto"],["crypto-leverage-liquidation","crypto"],["crypto-mining","crypto"],["crypto-pairs-trading","crypto"],["blood-alcohol","health"],["body-fat-distribution","health"],["crypto-profit","crypto"],["crypto-rebalancing","crypto"],["crypto-whale-tracker","crypto"],["exercise-calories","health"],["crypto-bridge-fees","crypto"],["crypto-funding-arbitrage","crypto"],["crypto-liquidity-pool","crypto"],["crypto-options-pricing","crypto"],["blood-pressure","health"],["crypto-defi-yield","crypto"],["crypto-social-sentiment","crypto"],["transformer-turns","engineering"],["crypto-technical-levels","crypto"],["crypto-volatility-smile","crypto"],["resting-energy","health"]],"terms":["0","1","10","100","14","2","200","24h","3","30","4","50","52","6","7","8","a1","acceleration","account","accumulation","activity","advanced","age","ago","alcohol","algebra","allocation","altcoin","amount","amplifier","analysi","angle","annual","antenna","apparent","applied","apr","apy","arbitrage","area","asset","at","average","avg","b","baby","band","base","basi","basic","beam","bedtime","bicep","binary","birthday","bitcoin","block","blood","bmi","bmr","body","borrow","bridge","btc","burn","buy","c","calc","calculation","calculu","calendar","calorie","cap","capacitance","capacitor","capital","carbohydrate","carry","category","celsiu","chain","change","chart","chemical","chemistry","chest","children","chronological","circulating","circumference","climate","closing","cm","cm2","code","coefficient","coin","collection","color","comma","common","complex","compound","compounding","concentration","conception","constant","consumption","content","contract","contribution","conversion","converter","correlation","cost","cp","credit","cross","crypto","cryptocurrency","csv","currency","current","custom","cycle","d","daily","data","date","day","db","dca","dd","decibel","defi","deflection","degree","denominator","density","derivative","desired","diameter","diastolic","diet","difference","difficulty","dimension","displacement","distance","distribution","divider","dollar","dominance","down","drawdown","drink","drop","due","duration","e","economy","efficiency","elastic","electricity","element","emi","energy","engineering","entry","equation","eth","ethereum","evaluate","event","exchange","exercise","exit","expansion","expected","expenditure","expiry","f","factor","fahrenheit","farm","farming","fat","fatigue","fear","fee","fiber","field","file","filing","filter","financial","first","fitness","flash","floor","flow","fluid","force","forex","formula","forward","fraction","frame","free","frequency","from","ft","fuel","function","funding","future","g","gain","gas","gauge","gear","gender","geometry","goal","greed","grid","growth","gst","gwei","h","hash","hashrate","health","heart","hedge","hedging","height","high","highest","hip","historical","hodl","hold","holding","home","hour","house","housing","hydration","hydraulic","hz","ideal","if","imaginary","impact","impedance","impermanent","implied","in4","income","index","indicator","inductance","inductor","inertia","initial","input","intake","intensity","interest","invest","investment","item","k","kcal","kelvin","kg","kwh","l","last","law","lb","lean","led","lending","length","level","leverage","limit","line","liquidation","liquidity","load","loan","logarithm","long","loss","low","lp","luminosity","m","m3","m4","ma","macro","magnetic","margin","market","mass","matching","material","math","mathematic","matrix","max","maximum","meal","measurement","media","menstrual","mention","meter","mh","mhz","million","min","mining","minute","mm","mmhg","modulu","mol","molarity","mole","molecular","moment","momentum","money","month","monthly","mortgage","motor","movement","moving","multiplier","muscle","n","neck","needed","network","new","nft","night","nm","number","numerator","nutrition","obesity","ohm","old","operation","optimization","optimizer","option","optional","original","output","overweight","ovulation","pa","pair","parallel","part","payment","per","perceived","percent","percentage","period","ph","phase","physic","pipe","piston","planner","pnl","point","polynomial","pool","portfolio","position","power","pregnancy","pressure","price","pricing","primary","principal","priority","probability","profit","profitability","property","protein","protocol","psi","pulley","push","quadratic","quality","r","r1","r2","radioactivity","rainbow","rank","rarity","rate","ratio","rc","reach","reactance","real","rebalancing","recovery","reddit","regression","regular","repayment","resistance","resistor","resonance","resting","return","reward","risk","rlc","rpm","rsi","s","s2","saving","scale","scientific","score","season","second","secondary","selected","sell","sentiment","separated","sequence","serie","session","set","shape","share","sharpe","short","side","since","sit","size","sleep","smile","smoking","social","solver","source","spacing","speed","spot","spread","spring","staking","start","statistic","statu","stock","stop","storage","strategy","stress","strike","sugar","supply","support","surface","swing","system","systolic","target","tax","technical","teeth","temperature","term","theory","thermal","thi","thigh","thirst","three","threshold","time","timeframe","timing","token","tolerance","top","torque","total","tracker","trade","trading","training","transaction","transformer","trigonometric","trigonometry","turn","twitter","txt","type","underlying","unit","up","upload","ups","urgency","urination","urine","usage","used","v","va","valuation","value","vat","vector","velocity","viscosity","vo2","vol","volatility","voltage","volume","w","waist","wake","water","week","weekly","weight","whale","window","wire","workout","wrist","x","x2","y","year","yield","yyyy","zone"],"postings":[[129,2,159,2],[30,2,32,2,35,2,58,2,72,2,78,2,82,2,84,2,92,2,107,2,110,2,111,2,117,2,127,2,141,2,146,2,150,2,155,2,158,2,162,2],[35,2,54,10,125,2,127,2],[129,2,159,2],[100,2],[30,2,32,2,58,2,72,2,78,2,84,2,107,2,111,2,117,2,141,2,146,2,150,2,155,2,158,2,162,2],[93,2],[92,2,101,2,159,2],[32,2,50,2,78,2,141,2,158,2],[74,2,77,2,92,2],[50,2,141,2],[74,2],[161,2],[125,2],[92,2,100,2],[110,2],[122,2],[12,2],[79,2],[106,10],[14,2,23,2,37,2,60,2,71,2,159,2],[119,10,133,10],[4,2,15,2,23,2,27,2,28,10,29,2,62,2,82,2,95,2,102,2,124,2,163,2],[100,2],[28,2,147,10],[1,10],[150,2],[74,10],[8,2,24,2,75,2,78,2,81,2,99,2,104,2,107,2,128,2,137,2,142,2,143,2,146,2,149,2,151,2,153,2,154,2,155,2,158,2],[88,10],[101,10],[6,10,70,2],[8,2,26,2,45,2,48,2,104,2,106,2,116,2,136,2],[89,10],[68,2],[103,2],[116,4,155,2],[81,2,91,2,99,2,116,4,158,2],[107,10,143,10,154,10],[2,10,115,10,130,2],[78,2,106,2,117,10,146,2,150,2],[50,2],[93,2,100,2,134,2,136,10,146,2,161,2],[74,2],[1,2,22,2,50,2,90,2,96,2],[134,4],[93,10,141,2],[19,2,64,2,72,10,93,2,128,2,133,2],[142,10],[90,10],[97,10],[15,2],[73,2],[72,10],[28,4],[19,4,39,4,45,4,46,4,56,4,63,4,64,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,91,4,92,4,93,4,99,4,100,4,101,4,106,4,107,4,108,4,117,4,118,4,119,4,128,4,129,4,136,4,137,4,138,4,139,4,142,4,143,4,144,4,145,4,146,4,149,4,150,4,151,4,153,4,154,4,155,4,156,4,158,4,159,4,161,4,162,4],[118,2],[44,10,147,10,157,10],[3,10,62,10],[4,10],[3,4,28,10,29,10,62,4,65,2,73,10,94,10,115,10,148,10],[8,4,143,4],[153,10],[19,4,39,4,45,4,46,4,56,4,63,4,64,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,91,4,92,4,93,4,99,4,100,4,101,4,106,4,107,4,108,4,117,4,118,4,119,4,128,4,129,4,136,4,137,4,138,4,139,4,142,4,143,4,144,4,145,4,146,4,149,4,150,4,151,4,153,4,154,4,155,4,156,4,158,4,159,4,161,4,162,4],[152,10],[107,2,149,2],[1,2,50,2,90,2,96,2,125,2],[138,6],[52,2,61,2],[90,10],[134,4],[14,2,23,10,67,2,120,10,152,10],[101,2,138,10,151,2],[38,2,86,2,109,2,114,2],[38,10],[119,2],[120,2],[128,10],[157,10],[53,4],[153,10],[74,2,111,2,119,2,125,2],[93,10],[112,2],[0,1,33,1,112,1],[73,2],[62,10],[28,2],[138,2],[29,2,60,2,135,2,148,2],[71,2],[46,2],[3,2,4,2,23,2,29,2,60,2,62,2,65,2,73,2,82,2,94,2,115,2,135,2,148,2,163,2],[130,2],[141,10],[1,2,50,2,90,2,96,2,125,2],[19,4,39,4,45,4,46,4,56,4,63,4,64,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,91,4,92,4,93,4,99,4,100,4,101,4,106,4,107,4,108,4,117,4,118,4,119,4,128,4,129,4,136,4,137,4,138,4,139,4,142,4,143,4,144,4,145,4,146,4,149,4,150,4,151,4,153,4,154,4,155,4,156,4,158,4,159,4,161,4,162,4],[77,2],[110,2,141,10],[22,2,46,2,52,2,108,2,117,2,123,2,140,2],[122,2],[98,10],[91,10,116,10],[99,2,116,2],[0,2],[134,4],[1,2,96,2,103,10,114,10],[28,2,121,10,145,2],[147,10],[56,2],[48,2,91,2],[2,1,5,6,6,1,7,6,9,6,10,1,11,6,13,1,16,1,17,1,18,1,20,1,24,1,25,1,31,1,40,1,53,1,57,1,58,2,59,6,69,1,72,10,83,1],[2,10,5,10,6,10,7,10,9,10,10,10,11,10,13,10,16,10,17,10,18,10,20,10,24,10,25,10,31,10,40,10,44,10,53,10,57,10,58,10,59,10,69,10,75,10,83,10,120,10],[117,10],[136,10,137,10,143,2,145,2,158,2],[43,2],[8,4,143,4],[153,10],[19,6,39,6,45,10,46,6,56,6,63,6,64,6,74,6,75,6,76,6,77,6,78,10,79,6,80,6,81,6,91,6,92,10,93,6,99,6,100,6,101,6,104,1,106,6,107,10,108,6,111,1,117,6,118,6,119,6,128,10,129,6,136,6,137,6,138,6,139,10,142,10,143,6,144,6,145,6,146,10,149,6,150,6,151,6,153,6,154,6,155,6,156,10,158,6,159,6,161,6,162,10],[19,1,39,1,45,1,46,1,56,1,63,1,64,1,74,1,75,10,76,1,77,1,78,1,79,1,80,1,81,1,91,1,92,1,93,1,99,1,100,1,101,1,104,1,106,1,107,1,108,1,111,1,117,1,118,1,119,1,128,1,129,1,136,1,137,1,138,1,139,1,142,1,143,1,144,1,145,1,146,1,149,10,150,1,151,1,153,1,154,1,155,1,156,1,158,1,159,1,161,1,162,1],[52,2],[24,10,128,2],[26,2,37,2,41,2,55,2,66,2,76,2,92,2,93,2,100,2,101,2,106,2,113,2,121,2,126,2,128,2,137,2,138,2,150,2,156,2,159,2,161,2,162,2],[125,2,133,2],[42,2,134,2],[50,2],[14,2,46,2,67,2,117,2,151,2],[52,2,57,10],[42,2,134,10],[28,2,42,2,63,2,74,2,77,2,81,2,92,2,93,2,99,2,100,2,104,2,110,2,121,2,134,4,136,2,142,2,154,2,156,2,162,2],[58,10],[106,10,136,6],[42,2,134,2],[58,10],[158,10],[97,10],[50,2],[30,2],[20,10,43,2,130,2],[90,2],[15,2],[43,2],[157,2],[23,4,67,2,120,4,152,4],[122,2,143,2],[118,2],[32,2],[103,2],[36,2],[148,10],[105,10],[136,10,137,10],[74,2],[34,2],[108,10],[147,2],[55,2],[134,10],[35,2,127,2,136,2,152,2],[50,2],[59,10],[85,2,113,10],[97,2],[145,2],[22,2],[8,4,143,4],[11,10,21,10,23,4,120,4,152,4,163,10],[38,1,41,1,43,1,47,1,55,1,58,1,66,1,68,1,85,1,86,1,88,1,89,1,97,1,103,1,105,1,109,1,113,1,114,1,121,1,123,1,125,1,126,1,130,1,131,1,132,1,140,1,141,1,160,1],[39,2,56,2,79,2,80,2,119,2,144,2],[1,2,96,10],[19,4,39,4,45,4,46,4,56,4,63,4,64,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,91,4,92,4,93,4,99,4,100,4,101,4,106,4,107,4,108,4,117,4,118,4,119,4,128,4,129,4,136,4,137,4,138,4,139,4,142,4,143,4,144,4,145,4,146,4,149,4,150,4,151,4,153,4,154,4,155,4,156,4,158,4,159,4,161,4,162,4],[19,4,39,4,45,4,46,4,56,4,63,4,64,4,74,4,75,4,76,4,77,4,78,4,79,4,80,4,81,4,91,4,92,4,93,4,99,4,100,4,101,4,106,4,107,4,108,4,117,4,118,4,119,4,128,4,129,4,136,4,137,4,138,4,139,4,142,4,143,4,144,4,145,4,146,4,149,4,150,4,151,4,153,4,154,4,155,4,156,4,158,4,159,4,161,4,162,4],[50,2],[61,2],[24,4,107,2,128,2],[28,2,127,2,152,10],[56,2],[125,10],[106,2,136,2,137,2],[163,10],[142,2,156,2,162,2],[38,2,86,2,109,2,114,2],[68,10,113,2,126,2],[53,4],[81,2],[81,10],[29,10,120,2,148,10],[110,2],[129,10],[19,10,107,2,119,2,143,2,145,2,153,10,155,2],[120,2],[83,10],[52,2],[45,2],[109,10],[8,1,26,1,34,1,48,1,116,1],[98,2,122,2,147,2],[3,1,4,1,14,1,15,1,23,1,27,1,28,1,29,1,35,1,37,1,42,1,44,1,60,1,62,1,65,1,67,1,71,1,73,1,82,10,87,1,94,1,95,1,102,1,110,1,115,1,120,1,124,1,127,1,134,1,135,1,147,1,148,1,152,1,157,1,163,1],[143,10],[77,2],[43,10],[43,2,130,2],[7,10,12,10,103,2,130,2],[24,4],[112,2],[66,2],[30,10],[65,2],[103,2,139,2,142,2,156,2],[28,2,31,10,38,2,89,2,99,2,109,10,110,2,116,2,131,2,132,2,136,2],[2,2,5,2,6,2,7,2,9,2,10,2,11,2,13,2,16,2,17,2,18,2,20,2,24,2,25,2,31,2,40,2,44,2,53,2,57,2,59,2,69,2,75,2,83,2],[55,2,97,2],[59,10],[70,2,90,2],[63,10,154,10],[56,10,142,2,154,2],[120,2],[45,2,88,10],[19,10,143,2,153,2,158,2],[55,10],[47,10],[4,2,23,2,27,2,29,2,60,2,62,2,65,2,82,2,94,2,135,2,147,2,148,2,163,2],[32,10],[14,2,26,2,67,2,95,2],[129,10],[64,10],[91,4,116,4],[45,4],[19,2],[0,2,145,2],[118,10],[145,2],[3,1,4,1,14,1,15,1,23,1,27,1,28,1,29,1,35,1,37,1,42,1,44,1,60,1,62,1,65,1,67,1,71,2,73,1,82,1,87,1,94,1,95,1,102,1,110,1,115,1,120,1,124,1,127,1,134,1,135,1,147,1,148,1,152,1,157,1,163,1],[27,2,28,2,82,2,102,10,124,10],[137,6],[137,10],[3,2,4,2,21,2,23,2,29,2,60,2,62,2,65,2,94,2,115,2,163,2],[161,2],[50,2],[29,2,73,2,135,10,148,2],[108,2,146,2],[76,10],[63,2],[76,2,154,2],[34,4],[121,2,147,2],[34,4],[34,4],[110,10],[130,10],[38,2,132,2],[65,10],[22,2,32,2,50,2,51,2,72,2,84,2],[98,2],[151,10,159,10],[131,10],[111,10],[156,2,162,2],[97,2],[45,4],[129,10],[74,10,92,10,100,10],[86,2,109,2,132,2],[132,10],[97,2],[48,2,76,2,91,2,116,2,144,2],[47,2,72,2,88,2,105,2,113,2,130,2],[71,10,95,10],[35,2,124,2,127,10],[8,2,26,2,34,2,116,10],[48,4],[48,10,64,2,76,2,91,2,106,2,116,2,136,2],[61,2],[109,2,114,2],[23,4,120,4,152,4],[53,4],[3,2,4,2,12,2,21,2,23,2,29,2,37,2,43,2,60,2,62,2,71,2,85,2,94,2,95,2,115,2,127,2,130,2,147,2,152,2,163,2],[121,2,145,2],[0,2,33,2,43,2],[35,2,42,2,87,2,134,2],[41,10],[97,2],[94,10],[66,10],[8,4,99,10,143,4],[13,10,42,2,43,2,55,2,89,10,97,2,103,2,125,2,134,2],[14,2,23,2,35,2,37,2,60,2,71,2,82,10,110,2,161,10],[56,2,63,2,119,10,128,2,144,10],[19,2],[126,2],[144,10],[155,10],[85,2,87,10,97,2,131,2],[8,10,34,2,143,10],[133,10],[45,2],[37,10,39,10,79,2,80,2,111,10],[161,2],[81,2],[40,10],[12,2,21,2,43,2,97,2],[43,2,130,2],[97,2],[66,2],[14,10,120,10],[83,10],[144,2],[101,2,138,10,151,2],[3,4,12,2,21,2,60,10,62,4,94,10],[131,10],[125,2],[1,1,22,1,30,1,32,1,49,1,50,1,51,1,52,1,54,1,61,1,70,1,72,1,84,1,90,1,96,1,98,1,122,1,133,1],[1,1,22,1,30,1,32,1,49,1,50,1,51,1,52,1,54,1,61,1,70,1,72,1,84,1,90,1,96,1,98,1,122,1,133,1],[22,10],[27,10,55,2,82,2,138,2],[27,2,108,10],[67,10],[73,10],[129,2],[134,2],[159,2],[36,2],[86,2,109,2,132,2],[89,2,131,2],[52,2],[43,2,82,2],[145,10],[35,2,127,2,152,2],[42,2,43,2,103,2,125,2,134,2],[157,2],[97,2],[0,2],[33,10],[33,2],[112,10],[97,2],[92,10,129,2],[24,4],[62,2,76,2,136,2],[48,2,106,2],[34,10],[113,10],[151,10],[93,2],[141,2],[60,10],[61,2,97,2,103,2,122,2,130,2],[29,2,148,2],[22,2,32,2,51,2,72,2,84,2],[118,10],[159,2],[77,10],[35,2],[47,2],[33,2,61,2,64,2,67,2,84,10,98,10,122,2,147,2],[30,2],[35,2],[3,4,62,4],[41,10],[28,4],[22,2,30,2,51,2,72,2,84,2,90,2,98,2,133,2],[158,10],[19,10],[156,10],[27,2,87,2,102,2],[125,2],[47,2,88,2,113,2,130,2],[3,4,62,4],[42,10],[97,2],[146,10],[140,10],[98,2],[34,2],[79,2,158,2],[127,2],[49,4],[39,2,49,10,104,2],[26,2,42,2,48,2,63,2,76,2,81,2,91,2,99,2,104,2,106,2,116,2,134,2,154,2],[0,10],[126,10],[12,1,21,1,36,1],[43,10],[130,2],[37,10,67,10],[56,10],[90,2],[50,10],[111,2,145,2,155,10],[78,10,139,2,150,10],[39,2,56,2,63,2,79,10,80,2,144,2],[9,10,68,10,88,2,113,2,121,10,126,10,145,2],[134,10],[25,10,130,10,157,10],[19,2,34,2,39,2,46,2,56,2,64,2,74,2,75,2,76,2,77,2,78,2,79,2,80,2,81,2,92,2,93,10,100,2,101,2,106,2,107,2,108,2,111,2,119,2,137,2,138,2,142,2,143,2,144,2,146,2,149,2,153,2,154,2,155,2,156,2,159,2,161,2,162,2],[156,10],[160,2],[99,2,128,2,158,2],[19,2],[61,10],[149,10],[145,10],[34,4],[95,10,120,2],[158,2],[97,2],[85,10],[82,2],[96,10],[28,2,35,2],[61,2],[105,2],[105,2],[69,10],[93,10],[77,2],[77,2],[8,2,24,2,26,2,27,2,28,2,34,2,43,2,48,2,63,10,82,2,102,10,116,4,118,10,121,2,124,10,128,2,139,2,142,2,154,10,156,2],[47,10,49,4,119,2,122,2,135,10,137,2,139,10,146,2,160,10],[114,10],[82,2],[132,10],[68,2,98,2],[150,10],[35,10],[159,2],[93,2],[136,2],[8,4,143,4],[41,2,86,2,109,2,114,2,123,10,140,10,161,10],[66,10,105,2,123,2,140,2,141,10],[86,10],[27,2,28,2,82,2,102,2,124,2,163,10],[48,4,99,10,106,2,117,2,136,2,139,2,155,10],[81,2,104,10],[39,2,79,2,139,2,142,2,156,2],[86,10],[47,2],[100,10],[21,2,41,10,145,2],[12,2],[26,10,91,4,116,4],[110,2],[51,10],[129,2,159,2],[74,10],[36,2,98,2,118,2],[160,2],[61,2],[107,2,149,2],[159,10],[22,2,46,2,52,2,108,2,117,2,123,2,140,2],[122,10],[122,10,123,10],[87,2],[52,2],[32,2],[111,2],[139,10],[45,2],[56,2],[147,2],[82,2],[39,2,56,2,57,2,63,2,79,10,80,2,144,2],[15,10,28,2,35,2],[162,6],[28,2],[129,2,159,10],[1,10,96,10],[131,2],[64,2],[10,10],[142,2,154,2,156,2],[146,2],[103,10],[104,10],[42,2],[52,10],[28,2,45,2,71,2,110,10],[48,4],[39,10,79,2,80,2],[57,10],[76,10],[35,2],[156,2,162,2],[44,10],[66,2,77,2,138,10],[161,10],[115,10,162,10],[80,10],[85,10],[157,2],[37,2,80,2,124,10,128,2,138,2,150,2],[45,10],[100,10,161,10],[47,2],[53,10,125,2],[8,2,34,2,45,2,122,2],[84,10],[125,10],[87,2],[73,2],[110,2],[126,10],[146,2],[5,10,15,2,26,2,36,2,110,2,114,10,118,2],[37,2],[44,2],[81,2,111,2,153,2,155,2],[141,2],[74,2],[16,10,47,2],[61,2,64,2,77,2,87,2,107,2],[73,10,78,10,151,6],[79,2,80,6,128,10],[64,10,80,10,107,2,119,2,142,10,146,10,154,2,155,2],[87,10,124,2],[19,2,151,2,158,2],[160,10],[70,2],[70,10],[160,10],[159,2],[52,2],[1,2,39,2,52,2,58,2,61,2,67,2,89,2,90,2,97,2,103,2,109,2,122,2,127,2,147,2,151,2,152,2,156,2],[156,2],[2,2,5,2,6,2,7,2,9,2,10,2,11,2,13,2,16,2,17,2,18,2,20,2,24,1,25,2,31,2,40,2,44,2,53,2,57,2,59,2,69,2,70,2,83,2,118,2],[15,2],[52,2],[82,2],[19,2],[110,2],[110,2],[121,2],[63,2],[38,2,41,2,55,2,66,2,88,2,105,2,113,2,121,2,126,2,160,2],[68,2],[77,10],[13,2,44,2,49,2,51,2,52,2,58,2,123,2,133,2,140,2,150,2],[45,4],[22,2],[21,2,36,10],[43,2],[27,10],[162,2],[46,10,129,2,137,2,139,2,156,2,162,10],[38,2,41,2,55,2,66,2,88,2,105,10,113,2,121,2,126,2,160,2],[17,10,33,2,77,2,92,2,100,2,101,10,129,2,151,2,161,2],[68,2,88,2,113,2,145,2],[29,2,73,2,135,10,148,2],[15,2],[71,10],[28,2,37,2,87,2,161,2],[91,2],[3,2,4,2,18,10,23,2,29,2,37,10,60,2,62,2,65,10,71,2,85,2,94,2,95,2,112,10,115,2,127,2,147,2,152,2,163,2],[151,10],[54,10],[55,10],[35,2,127,10],[60,2],[50,2,51,2,56,2,90,2,96,2,119,2,128,2,144,2],[96,2],[51,2],[8,2,26,2,34,2,48,2,91,2,106,2,116,2],[81,10,91,10,104,2,158,10],[42,2,134,2],[102,10]]};
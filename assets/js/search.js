@@ -0,0 +1,134 @@
+// Ranked, typo-tolerant calculator search over the build-time index in search-index.js
+// (both mirrored by search_index.py). The sorted term list is walked like a trie: edit-distance
+// rows are reused for the prefix a term shares with the previous term, and every term under a
+// prefix that is already too many edits away is skipped in one step.
+
+// Match quality multipliers: exact term, prefix of a term, one typo, two typos
+const SEARCH_EXACT = 4, SEARCH_PREFIX = 3, SEARCH_ONE_TYPO = 2, SEARCH_TWO_TYPOS = 1;
+
+// Lowercase, singular terms with accents and stopwords removed ("Calories" -> "calorie")
+function searchTokens(text, stopwords) {
+    const terms = String(text).normalize('NFKD').toLowerCase().replace(/[\u0300-\u036f]/g, '').match(/[a-z0-9]+/g) || [];
+    return terms.filter(term => !stopwords.has(term))
+        .map(term => term.length > 3 && term.endsWith('s') && !term.endsWith('ss') ? term.slice(0, -1) : term);
+}
+
+// Typos tolerated in a query term of this length
+function searchMaxTypos(length) {
+    return length < 4 ? 0 : length < 8 ? 1 : 2;
+}
+
+function createSearchEngine(index) {
+    const terms = index.terms;
+    const stopwords = new Set(index.stopwords);
+    // lcp[i]: length of the prefix terms[i] shares with terms[i - 1]
+    const lcp = new Uint8Array(terms.length);
+    for (let i = 1; i < terms.length; i++) {
+        const a = terms[i - 1], b = terms[i];
+        let n = 0;
+        while (n < a.length && n < b.length && n < 255 && a[n] === b[n]) n++;
+        lcp[i] = n;
+    }
+    // Per-query scratch: score of each calculator, its best score for the current word and
+    // how many words it has matched
+    const total = new Int32Array(index.docs.length);
+    const wordScore = new Int32Array(index.docs.length);
+    const matched = new Uint16Array(index.docs.length);
+    // [term index, quality] pairs for every term within searchMaxTypos() edits of the query (one
+    // when the first letter differs), counting the query as matched by any prefix of the term
+    function matchingTerms(query) {
+        const m = query.length;
+        const k = searchMaxTypos(m);
+        const maxDepth = m + k;
+        const w = m + 1;
+        const q = new Uint16Array(w + 1);
+        for (let j = 1; j <= m; j++) q[j] = query.charCodeAt(j - 1);
+        // D[i * w + j]: edits between the current term's first i characters and the query's first j
+        // (optimal string alignment); best[i]: fewest edits from the query to a prefix no longer than i
+        const D = new Uint16Array((maxDepth + 1) * w);
+        for (let j = 0; j <= m; j++) D[j] = j;
+        const best = new Uint16Array(maxDepth + 1);
+        best[0] = m;
+        const matches = [];
+        let valid = 0;
+        let x = 0;
+        scan: while (x < terms.length) {
+            const term = terms[x];
+            const depth = Math.min(term.length, maxDepth);
+            // The second typo is only allowed when the first letter is right (most misspellings keep it)
+            const allowed = k === 2 && term.charCodeAt(0) !== q[1] ? 1 : k;
+            for (let i = Math.min(lcp[x], valid) + 1; i <= depth; i++) {
+                const row = i * w, above = row - w;
+                const c = term.charCodeAt(i - 1);
+                const previous = i > 1 ? term.charCodeAt(i - 2) : -1;
+                // Only the diagonal band |i - j| <= k can stay within k edits; the cells either
+                // side of it read as k + 1
+                const lo = i > k ? i - k : 1, hi = i + k < m ? i + k : m;
+                D[row] = i;
+                D[row + lo - 1] = lo === 1 ? i : k + 1;
+                if (hi < m) D[row + hi + 1] = k + 1;
+                let rowMin = D[row + lo - 1];
+                for (let j = lo; j <= hi; j++) {
+                    let d = D[above + j - 1] + (q[j] === c ? 0 : 1);
+                    const up = D[above + j] + 1, left = D[row + j - 1] + 1;
+                    if (up < d) d = up;
+                    if (left < d) d = left;
+                    if (j > 1 && q[j] === previous && q[j - 1] === c && D[above - w + j - 2] + 1 < d) {
+                        d = D[above - w + j - 2] + 1;
+                    }
+                    D[row + j] = d;
+                    if (d < rowMin) rowMin = d;
+                }
+                best[i] = hi === m && D[row + m] < best[i - 1] ? D[row + m] : best[i - 1];
+                if (rowMin > allowed) {
+                    // No term below this prefix can come within the allowed edits
+                    valid = i - 1;
+                    x++;
+                    while (x < terms.length && lcp[x] >= i) x++;
+                    continue scan;
+                }
+            }
+            valid = depth;
+            const distance = best[depth];
+            if (distance <= allowed) {
+                const quality = distance === 0 ? (term.length === m ? SEARCH_EXACT : SEARCH_PREFIX)
+                    : distance === 1 ? SEARCH_ONE_TYPO : SEARCH_TWO_TYPOS;
+                matches.push([x, quality]);
+            }
+            x++;
+        }
+        return matches;
+    }
+
+    return {
+        tokens: text => searchTokens(text, stopwords),
+        matchingTerms: matchingTerms,
+        // Calculators matching any query word, those matching the most words first, then by score:
+        // [{ id, category, score }]
+        search(query, limit = 10) {
+            const words = searchTokens(query, stopwords);
+            if (words.length === 0) return [];
+            const hits = [];
+            total.fill(0);
+            matched.fill(0);
+            for (const word of words) {
+                const touched = [];
+                for (const [x, quality] of matchingTerms(word)) {
+                    const posting = index.postings[x];
+                    for (let p = 0; p < posting.length; p += 2) {
+                        const doc = posting[p], score = posting[p + 1] * quality;
+                        if (wordScore[doc] === 0) touched.push(doc);
+                        if (wordScore[doc] < score) wordScore[doc] = score;
+                    }
+                }
+                for (const doc of touched) {
+                    total[doc] += wordScore[doc];
+                    wordScore[doc] = 0;
+                    if (++matched[doc] === 1) hits.push(doc);
+                }
+            }
+            hits.sort((a, b) => matched[b] - matched[a] || total[b] - total[a] || a - b);
+            return hits.slice(0, limit).map(doc => ({ id: index.docs[doc][0], category: index.docs[doc][1], score: total[doc] }));
+        }
+    };
+}
@@ -0,0 +1,177 @@
+// One-pass descriptive statistics for the statistics calculator (mirrored by dataset_stats.py).
+// Values are pushed one at a time: Welford's mean and variance, running extremes and a hashed
+// frequency count for the mode. The values themselves are kept in a growing Float64Array (8 bytes
+// each, no per-value objects) so the median and percentiles are exact order statistics found by
+// selection rather than a full sort.
+
+// Each chunk is parsed in one go (~0.1 s for 1 MB), then the tab gets control back
+const STATISTICS_FILE_CHUNK = 1024 * 1024;
+const STATISTICS_PERCENTILES = [5, 25, 50, 75, 95];
+// Past this many distinct values the mode is counted from the sorted values instead (a Map is capped at 2^24 keys)
+const STATISTICS_MODE_KEYS = 1 << 22;
+// ASCII separators; other characters are separators when \s matches them
+const STATISTICS_SEPARATORS = new Uint8Array(128);
+for (const c of ' ,;\t\n\v\f\r') STATISTICS_SEPARATORS[c.charCodeAt(0)] = 1;
+
+function createStatistics() {
+    return {
+        count: 0,
+        mean: 0,
+        m2: 0,
+        min: Infinity,
+        max: -Infinity,
+        values: new Float64Array(1024),
+        frequency: new Map(),
+        push(x) {
+            if (this.count === this.values.length) {
+                const grown = new Float64Array(this.values.length * 2);
+                grown.set(this.values);
+                this.values = grown;
+            }
+            this.values[this.count] = x;
+            this.count++;
+            const delta = x - this.mean;
+            this.mean += delta / this.count;
+            this.m2 += delta * (x - this.mean);
+            // x !== x: a NaN value makes the extremes NaN, as Math.min(...)/Math.max(...) did
+            if (x < this.min || x !== x) this.min = x;
+            if (x > this.max || x !== x) this.max = x;
+            if (this.frequency) {
+                this.frequency.set(x, (this.frequency.get(x) || 0) + 1);
+                if (this.frequency.size > STATISTICS_MODE_KEYS) this.frequency = null;
+            }
+        },
+        variance() {
+            return this.m2 / this.count;
+        },
+        sampleVariance() {
+            return this.m2 / (this.count - 1);
+        },
+        // The k-th smallest value (0-based); -0 and 0 tie, so either may be found and both read as 0
+        select(k) {
+            return selectKth(this.values, this.count, k) + 0;
+        },
+        median() {
+            const n = this.count;
+            return n % 2 === 0 ? (this.select(n / 2 - 1) + this.select(n / 2)) / 2 : this.select((n - 1) / 2);
+        },
+        // Linear interpolation between closest ranks (the common 'type 7' definition)
+        percentile(p) {
+            const h = (this.count - 1) * p / 100;
+            const lower = Math.floor(h);
+            const low = this.select(lower);
+            return lower + 1 < this.count ? low + (h - lower) * (this.select(lower + 1) - low) : low;
+        },
+        // Most frequent values, ascending, with their count
+        modes() {
+            let best = 0;
+            let values = [];
+            if (this.frequency) {
+                for (const count of this.frequency.values()) if (count > best) best = count;
+                for (const [value, count] of this.frequency) if (count === best) values.push(value);
+                return { values: values.sort((a, b) => a - b), count: best };
+            }
+            // Sorting in place keeps every later selection valid (and makes it immediate)
+            const sorted = this.values.subarray(0, this.count).sort();
+            for (let i = 0; i < sorted.length;) {
+                let j = i + 1;
+                while (j < sorted.length && sorted[j] === sorted[i]) j++;
+                if (j - i > best) {
+                    best = j - i;
+                    values = [];
+                }
+                if (j - i === best) values.push(sorted[i] + 0);
+                i = j;
+            }
+            return { values: values, count: best };
+        }
+    };
+}
+
+// Quickselect with median-of-three pivots over values[0, n). It reorders the array in place, which
+// also speeds up later selections; a range that keeps failing to shrink is sorted instead.
+function selectKth(values, n, k) {
+    let lo = 0;
+    let hi = n - 1;
+    let budget = 2 * Math.ceil(Math.log2(n + 1)) + 8;
+    while (hi > lo) {
+        if (budget-- === 0) {
+            const range = values.subarray(lo, hi + 1).sort();
+            return range[k - lo];
+        }
+        const mid = (lo + hi) >>> 1;
+        const a = values[lo], b = values[mid], c = values[hi];
+        const pivot = a < b ? (b < c ? b : (a < c ? c : a)) : (a < c ? a : (b < c ? c : b));
+        let i = lo;
+        let j = hi;
+        while (i <= j) {
+            while (values[i] < pivot) i++;
+            while (values[j] > pivot) j--;
+            if (i <= j) {
+                const t = values[i];
+                values[i] = values[j];
+                values[j] = t;
+                i++;
+                j--;
+            }
+        }
+        if (k <= j) hi = j;
+        else if (k >= i) lo = i;
+        else return values[k];
+    }
+    return values[k];
+}
+
+// Feed text in pieces of any size; numbers are separated by commas, semicolons or whitespace and
+// each is read with parseFloat. A number cut by a piece boundary is completed by the next piece.
+function createNumberParser(onValue) {
+    let carry = '';
+    const token = (text) => {
+        const value = parseFloat(text);
+        if (Number.isFinite(value)) onValue(value);
+    };
+    return {
+        feed(text) {
+            let start = 0;
+            for (let i = 0; i < text.length; i++) {
+                const code = text.charCodeAt(i);
+                if (code < 128 ? STATISTICS_SEPARATORS[code] : /\s/.test(text[i])) {
+                    const piece = carry + text.slice(start, i);
+                    if (piece) token(piece);
+                    carry = '';
+                    start = i + 1;
+                }
+            }
+            carry += text.slice(start);
+        },
+        end() {
+            if (carry) token(carry);
+            carry = '';
+        }
+    };
+}
+
+function statisticsFromText(text) {
+    const stats = createStatistics();
+    const parser = createNumberParser(x => stats.push(x));
+    // A piece at a time, so a huge paste is never split into one array of millions of strings
+    for (let offset = 0; offset < text.length; offset += STATISTICS_FILE_CHUNK) {
+        parser.feed(text.slice(offset, offset + STATISTICS_FILE_CHUNK));
+    }
+    parser.end();
+    return stats;
+}
+
+// Read an uploaded File a chunk at a time; each await hands the tab back to the browser
+async function statisticsFromFile(file) {
+    const stats = createStatistics();
+    const parser = createNumberParser(x => stats.push(x));
+    const decoder = new TextDecoder();
+    for (let offset = 0; offset < file.size; offset += STATISTICS_FILE_CHUNK) {
+        const chunk = await file.slice(offset, offset + STATISTICS_FILE_CHUNK).arrayBuffer();
+        parser.feed(decoder.decode(chunk, { stream: true }));
+    }
+    parser.feed(decoder.decode());
+    parser.end();
+    return stats;
+}
@@ -0,0 +1,3 @@
+// Generated by unit_conversion.py --build - do not edit
+// Factor and offset matrices are row-major base64 Float64Array (little-endian)
+const UNIT_TABLE = {"length":{"units":["mm","cm","m","km","in","ft","yd","mi"],"factors":"AAAAAAAA8D+amZmZmZm5P/yp8dJNYlA/je21oPfGsD4KhUKhUCikP7gGroFr4Go/ewR0VvLqUT/CM7qzidmkPgAAAAAAACRAAAAAAAAA8D97FK5H4XqEP/Fo44i1+OQ+TSaTyWQy2T8zxAwxQ8ygP5kFEeyuZYY/s8CoIOwP2j4AAAAAAECPQAAAAAAAAFlAAAAAAAAA8D/8qfHSTWJQP+z1er1er0NAkPKj/Cg/CkBgTG2ocH/xP4vWg3lwXEQ/AAAAAICELkEAAAAAAGr4QAAAAAAAQI9AAAAAAAAA8D8oFAqFQjnjQOAauAauoalAlrx6BHQWkUCEv6rWReLjP2ZmZmZmZjlAUrgehetRBECmCkYldQKaP+o1h7VCovo+AAAAAAAA8D9VVVVVVVW1PxzHcRzHcZw/4mV1s6uM8D7NzMzMzAxzQHsUrkfhej5A/Yf029eB0z9vaCUIsvkzPwAAAAAAAChAAAAAAAAA8D9VVVVVVVXVP9MYMI0B0yg/MzMzMzOTjEBcj8L1KNxWQPvL7snDQu0/pxw4DIv2TT8AAAAAAABCQAAAAAAAAAhAAAAAAAAA8D+eEuQpQZ5CPwAAAACAjjhBMzMzMzOlA0FMN4lBYCWZQKA4gH7fv/k/AAAAAADw7kAAAAAAAKC0QAAAAAAAgJtAAAAAAAAA8D8="},"temperature":{"units":["C","F","K","R"],"factors":"AAAAAAAA8D/NzMzMzMz8PwAAAAAAAPA/zczMzMzM/D9yHMdxHMfhPwAAAAAAAPA/chzHcRzH4T8AAAAAAADwPwAAAAAAAPA/zczMzMzM/D8AAAAAAADwP83MzMzMzPw/chzHcRzH4T8AAAAAAADwP3Icx3Ecx+E/AAAAAAAA8D8=","offsets":"AAAAAAAAAAAAAAAAAABAQGZmZmZmEnFAH4XrUbi6fkByHMdxHMcxwAAAAAAAAAAAP+mTPunrb0AfhetRuLp8QGZmZmZmEnHAH4XrUbi6fMAAAAAAAAAAAAAAAAAAAAAAZmZmZmYSccAfhetRuLp8wAAAAAAAAAAAAAAAAAAAAAA="},"weight":{"units":["mg","g","kg","t","oz","lb","st"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+ldYm6AsuET462qkXZX4CPzraqRdlfsI+pn6mPbwihT4AAAAAAECPQAAAAAAAAPA//Knx0k1iUD+N7bWg98awPh3fG7luD6I/Hd8buW4PYj+ulzTU66MkPwAAAACAhC5BAAAAAABAj0AAAAAAAADwP/yp8dJNYlA/4jfFIBKjQUDiN8UgEqMBQCBcO00UKMQ/AAAAAGXNzUEAAAAAgIQuQQAAAAAAQI9AAAAAAAAA8D+TmAC0PznhQJOYALQ/OaFA9/dr0yOvY0AAAAAAYK/bQLbz/dR4WTxA+IpuvaYHnT/PI0TOArr9PgAAAAAAAPA/AAAAAAAAsD9UWqoxJElyPwAAAABgrxtBtvP91HhZfED4im69pgfdP88jRM4Cuj0/AAAAAAAAMEAAAAAAAADwP1RaqjEkSbI/AAAAgHQ5WEHXo3A9Ss64QJ92+GuyZhlAlv7r/cICej+9KPOTAABsQL0o85MAACxAAAAAAAAA8D8="},"area":{"units":["mm²","cm²","m²","km²","in²","ft²","yd²","ac","ha"],"factors":"AAAAAAAA8D97FK5H4XqEP43ttaD3xrA+EeotgZmXcT0l7OInL2VZPwkbSzjVkuY+ejRfh70QtD4S9la4HvvwPbu919nffNs9AAAAAAAAWUAAAAAAAADwPy1DHOviNho/u73X2d982z19SCnXDNfDPx+t+pO2olE//sGEIyhaHz994AcAYIhaPjqMMOKOeUU+AAAAAICELkEAAAAAAIjDQAAAAAAAAPA/je21oPfGsD785KUsAziYQFSAo98fhyVAZ8et/8Yi8z/EzgSYvDEwPy1DHOviNho/AAAAopQabUIAAAAgX6ACQgAAAACAhC5BAAAAAAAA8D+VZQDnyhjXQU5Jo2HRh2RBf5atj9Y/MkGA69N+XeNuQAAAAAAAAFlA4XoUrkcphECRfvs6cM4ZQMtS44z+I0U/ccH0KuMqBj4AAAAAAADwP7r/6enHcXw/bKp6s7FIST/UDj74tWWFPiA3j3mBUXE+AAAAAHCu9kAK16NwPQiNQBNGs7J9yLc/an0u3D7weD7Y7/l9//9hQAAAAAAAAPA/HMdxHMdxvD9uTmMJbBL4PvtRBByxe+M+AAAAAD6EKUH2KFyPolTAQNWuCWmNweo/GE20t0YOrD7TLblt/z+UQAAAAAAAACJAAAAAAAAA8D88uI+KuRQrPzvchD8n6xU/AAAA3MUm7kEAAADAA0yDQR+F61G4na9AkbSftXCTcD+aDOZioe1XQfpeG9UBReVApeL7oAHoskAAAAAAAADwPyKKyRtg5tk/AAAAIF+gAkIAAAAAhNeXQQAAAAAAiMNAexSuR+F6hD8GggDgX5BtQScWf2hyR/pA6qEb6/Nbx0Bm3pG3tsQDQAAAAAAAAPA/"},"volume":{"units":["ml","l","m³","fl oz","cup","pt","qt","gal"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+1EendRNQoT/UR6d1E1BxP9RHp3UTUGE/JCy6QhJQUT+rtDDcElAxPwAAAAAAQI9AAAAAAAAA8D/8qfHSTWJQPyVc5QAz6EBAJVzlADPoEEAlXOUAM+gAQBvPKdUx6PA/b5AHazLo0D8AAAAAgIQuQQAAAAAAQI9AAAAAAAAA8D/8+9/OwYLgQPz7387BgrBA/PvfzsGCoEBB1CqqwIKQQA1jhTzBgnBAiUFg5dCSPUBXIlD9g0ieP5cK/HGTAv8+AAAAAAAA8D8AAAAAAADAPwAAAAAAALA/++KxyP3/nz+r51jk/v9/P4lBYOXQkm1AVyJQ/YNIzj+XCvxxkwIvPwAAAAAAACBAAAAAAAAA8D8AAAAAAADgP/viscj9/88/q+dY5P7/rz+JQWDl0JJ9QFciUP2DSN4/lwr8cZMCPz8AAAAAAAAwQAAAAAAAAABAAAAAAAAA8D/74rHI/f/fP6vnWOT+/78/5/up8dKSjUBuFi8WhkjuP5yHvZeVAk8/JyKnGwEAQEAnIqcbAQAQQCcipxsBAABAAAAAAAAA8D8rjNONAADQP7gehevRkq1AY5y/CYVIDkAZydyElAJvPxSR040AAGBAFJHTjQAAMEAUkdONAAAgQH3xWOT+/w9AAAAAAAAA8D8="},"speed":{"units":["m/s","km/h","mph","ft/s","knots"],"factors":"AAAAAAAA8D/NzMzMzMwMQJHfzNo+5QFAkPKj/Cg/CkAPpIRx/hn/P3Icx3Ecx9E/AAAAAAAA8D+Ev6rWReLjP6DUYMO7Ke0/JVv0d1RH4T/qPgCpTZzcP6A4gH7fv/k/AAAAAAAA8D93d3d3d3f3P0E8i9aozus//Yf029eB0z/K4Ch5dY7xP9FFF1100eU/AAAAAAAA8D+Jeo2pofXiPxfzc0NTduA/w+gDE8mh/T9TPAKrlmnyP5x6NmFDAfs/AAAAAAAA8D8="},"pressure":{"units":["Pa","kPa","MPa","bar","atm","psi","mmHg","inHg"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+8WjjiLX45D6agmQCgbLkPkrE/DCoAiM/uBTpD/24fj+MHradTlozPwAAAAAAQI9AAAAAAAAA8D/8qfHSTWJQP3sUrkfheoQ/iidW/FE2hD+w19Y/mJDCPzyeiSGnAB5A1NkDxjDm0j8AAAAAgIQuQQAAAAAAQI9AAAAAAAAA8D8AAAAAAAAkQJ0ibBAMvSNAos5XrjQhYkCGZMA2o0y9QLnCX6HLdHJAAAAAAABq+EAAAAAAAABZQJqZmZmZmbk/AAAAAAAA8D/InUYa4JTvPwOxv+PtAS1An4MzkoJwh0BcBGY1rIc9QAAAAADQvPhAzczMzMxUWUA4Z0Rpb/C5P4PAyqFFNvA/AAAAAAAA8D9HPUWkUmQtQE8wGU0EwIdA+EtMntbrPUD2KFyPwu66QGoTJ/c7lBtAAJlrC649fD+gPyPHjKaxP13gWkh2a7E/AAAAAAAA8D/eDDVCiNtJQC3bCDPFSQBA/Knx0k2qYEAKLev+sRDBP0IJekKLeSE/kosYE+7XVT/jQwpJzo5VPy+vcOMAzZM/AAAAAAAA8D89usFCTCikP+F6FK7HdKpA8wLso1MXC0BZ5qVJxr1rP/ivB+6bVqE/33lEDJEcoT82A9/SEW/fP1BSzudrZjlAAAAAAAAA8D8="},"energy":{"units":["J","kJ","MJ","cal","kcal","Wh","kWh","BTU","eV"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+jEMibr2Xzj9OIPqjs1MvP9+8mnhWNDI/uXkfli+kkj7ETxvE1Q5PP4wzFVUvqNVDAAAAAABAj0AAAAAAAADwP/yp8dJNYlA/93WN/S7gbUCMQyJuvZfOP3Icx3Ecx9E/37yaeFY0Mj/lq4LBfFTuP1a0Fjk+JnVEAAAAAICELkEAAAAAAECPQAAAAAAAAPA/MyWc4+0sDUH3dY39LuBtQMdxHMdxXHFAchzHcRzH0T/em/nUgZ6NQBwswMNYpxRFI9v5fmq8EEAo1qnyPSNxPzGsoymJjNE+AAAAAAAA8D/8qfHSTWJQP9cm2Zu2ClM/U7/u2LR/sz7Ey05mST5wPxInVac3p/ZDAAAAAABYsEAj2/l+arwQQCjWqfI9I3E/AAAAAABAj0AAAAAAAADwP+4PMlR2mPI/1ybZm7YKUz/75dFbp7kPQCcoaVlMH5ZEAAAAAAAgrEDNzMzMzMwMQJLLf0i/fW0/Xh3MfV3jikBl1h7jkIjrPwAAAAAAAPA//Knx0k1iUD8bAVzhCUwLQE6ix5nRCJNEAAAAAEB3S0EAAAAAACCsQM3MzMzMzAxArlTZTAlCKkFeHcx9XeOKQAAAAAAAQI9AAAAAAAAA8D8V2ROmQaiqQID0LLCcljJFCtejcD18kECMFTWYhuHwPxAWgAw+SVE/AnQZ5EqFb0CXQ+xPeiPQPw3fc/6xwdI/S4ocnO80Mz8AAAAAAADwPwQclO1ZUHZE+0eWVC+kBzzxKFD0bzVoOyxfXgItysg6Q0e5EQea5jtV2EJs5CRHO2Fmrp0K5ko7httodE6LqzrfcWOcA/JmOwAAAAAAAPA/"},"power":{"units":["W","kW","MW","hp","BTU/h","cal/s"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+vnCsQaf4VT+ykkRXEUwLQIxDIm69l84/AAAAAABAj0AAAAAAAADwP/yp8dJNYlA/GWYiVtN09T9C9zjvSKiqQPd1jf0u4G1AAAAAAICELkEAAAAAAECPQAAAAAAAAPA/tJcdYhb0lEB3oZ05VwhKQTMlnOPtLA1BmpmZmZlNh0AGEhQ/xtznP26Rao5ib0g/AAAAAAAA8D9U6SyH3uCjQKSzUx9AR2ZAK/wZ3qzB0j+UkUNc6jQzP4comePrqpM+XvBt7bDBOT8AAAAAAADwP2o+YwCD7rE/I9v5fmq8EEAo1qnyPSNxPzGsoymJjNE+vG2hLGP7dj/OKJrThI0sQAAAAAAAAPA/"},"data-storage":{"units":["bit","byte","KB","MB","GB","TB","PB"],"factors":"AAAAAAAA8D8AAAAAAADAPwAAAAAAACA/AAAAAAAAgD4AAAAAAADgPQAAAAAAAEA9AAAAAAAAoDwAAAAAAAAgQAAAAAAAAPA/AAAAAAAAUD8AAAAAAACwPgAAAAAAABA+AAAAAAAAcD0AAAAAAADQPAAAAAAAAMBAAAAAAAAAkEAAAAAAAADwPwAAAAAAAFA/AAAAAAAAsD4AAAAAAAAQPgAAAAAAAHA9AAAAAAAAYEEAAAAAAAAwQQAAAAAAAJBAAAAAAAAA8D8AAAAAAABQPwAAAAAAALA+AAAAAAAAED4AAAAAAAAAQgAAAAAAANBBAAAAAAAAMEEAAAAAAACQQAAAAAAAAPA/AAAAAAAAUD8AAAAAAACwPgAAAAAAAKBCAAAAAAAAcEIAAAAAAADQQQAAAAAAADBBAAAAAAAAkEAAAAAAAADwPwAAAAAAAFA/AAAAAAAAQEMAAAAAAAAQQwAAAAAAAHBCAAAAAAAA0EEAAAAAAAAwQQAAAAAAAJBAAAAAAAAA8D8="},"angle":{"units":["deg","rad","grad","turn","arcmin","arcsec"],"factors":"AAAAAAAA8D85nVKiRt+RP3Icx3Ecx/E/F2zBFmzBZj8AAAAAAABOQAAAAAAAIKxA+MFjGtylTEAAAAAAAADwP0xJi6u71E9Ag8jJbTBfxD/Yhb1YftuqQHutMXPGLQlBzczMzMzM7D8aJxeSvxWQPwAAAAAAAPA/exSuR+F6ZD8AAAAAAABLQAAAAAAAUKlAAAAAAACAdkAYLURU+yEZQAAAAAAAAHlAAAAAAAAA8D8AAAAAABjVQAAAAACAxjNBERERERERkT+jls9XSxAzP2gvob2E9pI/KVHOoMhFCD8AAAAAAADwPwAAAAAAAE5A37yaeFY0Mj+dj/+ypVXUPk3uqzAnOjQ/gUUPNAnkqT4RERERERGRPwAAAAAAAPA/"},"time":{"units":["ms","sec","min","hr","day","week","month","year"],"factors":"AAAAAAAA8D/8qfHSTWJQPx6CvZzsefE+uXkfli+kkj73TH8d6tpIPq3FI/3mZxw+gb3wsLAh+j1WfqAgy2vBPQAAAAAAQI9AAAAAAAAA8D8RERERERGRP9+8mnhWNDI/KVHOoMhF6D4L7zSTd727PhAZy4zmhJk+YLvcXUQDYT4AAAAAAEztQAAAAAAAAE5AAAAAAAAA8D8RERERERGRPxdswRZswUY/GqABGqABGj9/Z/4jmOz3PlPf/S8g5r8+AAAAAEB3S0EAAAAAACCsQAAAAAAAAE5AAAAAAAAA8D9VVVVVVVWlPxiGYRiGYXg/B4G+oc5tVj9eAf4svucdPwAAAABwmZRBAAAAAAAY9UAAAAAAAICWQAAAAAAAADhAAAAAAAAA8D+SJEmSJEnCP8XgTvla0qA/B4G+oc5tZj8AAAAAQgbCQQAAAAAAdSJBAAAAAACww0AAAAAAAABlQAAAAAAAABxAAAAAAAAA8D9ZCUo0H3DNP+awhs0UoJM/AAAAqteX40EAAAAAORBEQTMzMzOjZuVAexSuR+HThkCkcD0K128+QBSuR+F6ZBFAAAAAAAAA8D9VVVVVVVW1PwAAAH/DYx1CAAAAgFUYfkFmZmZm+gwgQVyPwvXoHsFAexSuR+HTdkAfhetRuBZKQAAAAAAAAChAAAAAAAAA8D8="},"frequency":{"units":["Hz","kHz","MHz","GHz","THz","rpm","rps"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+ldYm6AsuET4R6i2BmZdxPQAAAAAAAE5AAAAAAAAA8D8AAAAAAECPQAAAAAAAAPA//Knx0k1iUD+N7bWg98awPpXWJugLLhE+AAAAAABM7UAAAAAAAECPQAAAAACAhC5BAAAAAABAj0AAAAAAAADwP/yp8dJNYlA/je21oPfGsD4AAAAAOJyMQQAAAACAhC5BAAAAAGXNzUEAAAAAgIQuQQAAAAAAQI9AAAAAAAAA8D/8qfHSTWJQPwAAALCO8CtCAAAAAGXNzUEAAACilBptQgAAAABlzc1BAAAAAICELkEAAAAAAECPQAAAAAAAAPA/AADgV+tIy0IAAACilBptQhEREREREZE/HoK9nOx58T7bdChnTOVRPtLTj+Y/U7I9rPkw8NbDEj0AAAAAAADwPxEREREREZE/AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+ldYm6AsuET4R6i2BmZdxPQAAAAAAAE5AAAAAAAAA8D8="},"fuel-economy":{"units":["mpg","l/100km","km/l","mi/l"],"factors":"AAAAAAAA8D8CK4cW2WZtQDls/V+SNds/6yKRlPzk5T8CK4cW2WZtQAAAAAAAAPA/AAAAAAAAWUDZzvdT4x1kQFPovMYu0QJAAAAAAAAAWUAAAAAAAADwP3JQwkzbv/k/xVVrMohi9z/ZzvdT4x1kQJ4u0RNJ4uM/AAAAAAAA8D8=","reciprocal":"0100101101000100"},"density":{"units":["kg/m³","g/cm³","g/ml","lb/ft³","oz/in³"],"factors":"AAAAAAAA8D/8qfHSTWJQP/yp8dJNYlA/r+jt94n2rz9d6voz7/BCPwAAAAAAQI9AAAAAAAAA8D8AAAAAAADwPztVHrzCNk9A3wjDmEl/4j8AAAAAAECPQAAAAAAAAPA/AAAAAAAA8D87VR68wjZPQN8Iw5hJf+I/2/l+arwEMECTHoZWJ2eQP5MehlYnZ5A/AAAAAAAA8D+5DdV8ivaCPylcj8L1B5tAPIOG/gmu+z88g4b+Ca77P8kgRdH3/1pAAAAAAAAA8D8="},"force":{"units":["N","kN","lbf","kgf","dyn","pdl"],"factors":"AAAAAAAA8D/8qfHSTWJQPwq6iciKxsw/EhiY6s8auj8AAAAAAGr4QMJxq46a7hxAAAAAAABAj0AAAAAAAADwP65/1ofjGWxAgYcYCy9+WUAAAAAAhNeXQRdtU+8CQbxACacFL/rKEUD9fc72SzhyPwAAAAAAAPA/8wbcmacH3T8AAAAAWCYbQZe4Cn5GFkBABaOSOgGdI0BwPERIghWEP3C42ZoRowFAAAAAAAAA8D8AAAAAcu0tQU6la4efu1FA8WjjiLX45D46jDDijnlFPo2KAa+828I+JahM1aUbsT4AAAAAAADwPxy7Wuj99RI/3xXB/1aywT90QzJoER8iP+HNKrSw058/Vlu3I3XfjD8AAAAAwADLQAAAAAAAAPA/"},"luminosity":{"units":["lm","cd","lx","fc"],"factors":"AAAAAAAA8D84+MJkqmC0PwAAAAAAAPA/8WPMXUvItz+kcD0K1yMpQAAAAAAAAPA/pHA9CtcjKUDjpZvEILDyPwAAAAAAAPA/OPjCZKpgtD8AAAAAAADwP/FjzF1LyLc/ukkMAiuHJUAGgZVDi2zrP7pJDAIrhyVAAAAAAAAA8D8="},"magnetic-field":{"units":["T","mT","μT","G","mG","Oe"],"factors":"AAAAAAAA8D8AAAAAAECPQAAAAACAhC5BAAAAAACIw0AAAAAA0BJjQbkQdTNoichA/Knx0k1iUD8AAAAAAADwPwAAAAAAQI9AAAAAAAAAJEAAAAAAAIjDQGbHcyopIClAje21oPfGsD78qfHSTWJQPwAAAAAAAPA/exSuR+F6hD8AAAAAAAAkQIGEn1yIuok/LUMc6+I2Gj+amZmZmZm5PwAAAAAAAFlAAAAAAAAA8D8AAAAAAECPQIWfXIi6GfQ/SK+8mvLXej4tQxzr4jYaP5qZmZmZmbk//Knx0k1iUD8AAAAAAADwP2fQsuM5lVQ/QaxIlt3dFD84+MJkqmC0P2ZmZmZm5lNARrbz/dR46T8AAAAAAOCIQAAAAAAAAPA/"},"radioactivity":{"units":["Bq","kBq","MBq","GBq","Ci","mCi","μCi","nCi","pCi"],"factors":"AAAAAAAA8D/8qfHSTWJQP43ttaD3xrA+ldYm6AsuET5iC6SKbre9PR4zZPMhBV0+69mvJwNX/D7QusEU+aybP28wRT7rBjtAAAAAAABAj0AAAAAAAADwP/yp8dJNYlA/je21oPfGsD4eM2TzIQVdPuvZrycDV/w+0LrBFPmsmz9vMEU+6wY7QEyRz7rBZNpAAAAAAICELkEAAAAAAECPQAAAAAAAAPA//Knx0k1iUD/r2a8nA1f8PtC6wRT5rJs/bzBFPusGO0BMkc+6wWTaQOSzbjBlxnlBAAAAAGXNzUEAAAAAgIQuQQAAAAAAQI9AAAAAAAAA8D/QusEU+aybP28wRT7rBjtATJHPusFk2kDks24wZcZ5Qa0bTNG+KxlCAAAAZL46IUIAAAAAmqSBQQAAAAAAEeJAAAAAAACAQkAAAAAAAADwPwAAAAAAQI9AAAAAAICELkEAAAAAZc3NQQAAAKKUGm1CAAAAAJqkgUEAAAAAABHiQAAAAAAAgEJAi2zn+6nxoj/8qfHSTWJQPwAAAAAAAPA/AAAAAABAj0AAAAAAgIQuQQAAAABlzc1BAAAAAAAR4kAAAAAAAIBCQIts5/up8aI/q1rSUQ5mAz+N7bWg98awPvyp8dJNYlA/AAAAAAAA8D8AAAAAAECPQAAAAACAhC5BAAAAAACAQkCLbOf7qfGiP6ta0lEOZgM/HOhsxD3dYz6V1iboCy4RPo3ttaD3xrA+/Knx0k1iUD8AAAAAAADwPwAAAAAAQI9Ai2zn+6nxoj+rWtJRDmYDPxzobMQ93WM+pBZdfUlXxD0R6i2BmZdxPZXWJugLLhE+je21oPfGsD78qfHSTWJQPwAAAAAAAPA/"},"torque":{"units":["Nm","kNm","lbft","lbin","kgfm","kgfcm","ozin"],"factors":"AAAAAAAA8D/8qfHSTWJQP/1diZgZmuc/fgZnMpOzIUASGJjqzxq6P87SRm/yZCRA4pAaQJWzYUAAAAAAAECPQAAAAAAAAPA/ySX2/nwMh0BXnDi/XUnBQIGHGAsvfllA3SmrwJTqw0B98ZnAX0kBQRo09E9wsfU/3fXKo7g2Vj8AAAAAAADwPwAAAAAAAChAYoYOX1iywT/5sYYUqqYrQPuhwcgCAGhAeEXwv5XsvD8nnQ6FS54dP1VVVVVVVbU/AAAAAAAA8D/YXRPUdZiHP1Ehrw0cb/I/UsEr2wEAMEAFo5I6AZ0jQHA8REiCFYQ/fGhUUJjuHEBdTj888rJVQAAAAAAAAPA/AAAAAAAAWUDSHKvA9LKVQIxLVdriGrk/12EupCG1GT/AvVSFOISyP6Ac/8dUxus/exSuR+F6hD8AAAAAAADwPysG2wBYxitAIPLxZJLsfD/soXIVSJ7dPmjyxdtSVXU/nOuoSfz/rz9H/lQXc5hHP6dmOuoZb7I/AAAAAAAA8D8="}};
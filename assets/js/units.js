@@ -0,0 +1,73 @@
+// Unit conversion backed by the matrices in unit-table.js (generated by unit_conversion.py).
+// Converting between any two units of a dimension is one lookup:
+//   out = value * factor[i][j] + offset[i][j]   or   out = factor[i][j] / value for reciprocal pairs
+const unitDimensions = {};
+
+function decodeFloat64(base64) {
+    const bytes = atob(base64);
+    const view = new DataView(new ArrayBuffer(bytes.length));
+    for (let i = 0; i < bytes.length; i++) {
+        view.setUint8(i, bytes.charCodeAt(i));
+    }
+    const values = new Float64Array(bytes.length / 8);
+    for (let i = 0; i < values.length; i++) {
+        values[i] = view.getFloat64(i * 8, true);
+    }
+    return values;
+}
+
+// Decode a dimension's matrices on first use
+function unitDimension(dimension) {
+    if (!unitDimensions[dimension]) {
+        const entry = UNIT_TABLE[dimension];
+        if (!entry) throw new Error(`Unknown dimension: ${dimension}`);
+        const index = {};
+        entry.units.forEach((unit, i) => { index[unit] = i; });
+        unitDimensions[dimension] = {
+            units: entry.units,
+            index: index,
+            factors: decodeFloat64(entry.factors),
+            offsets: entry.offsets ? decodeFloat64(entry.offsets) : null,
+            reciprocal: entry.reciprocal || null
+        };
+    }
+    return unitDimensions[dimension];
+}
+
+function unitCell(dimension, fromUnit, toUnit) {
+    const table = unitDimension(dimension);
+    const from = table.index[fromUnit];
+    const to = table.index[toUnit];
+    if (from === undefined || to === undefined) {
+        throw new Error(`Unknown ${dimension} unit: ${from === undefined ? fromUnit : toUnit}`);
+    }
+    const cell = from * table.units.length + to;
+    return {
+        factor: table.factors[cell],
+        offset: table.offsets ? table.offsets[cell] : 0,
+        reciprocal: table.reciprocal !== null && table.reciprocal[cell] === '1'
+    };
+}
+
+// Multiplier from one unit to another (linear units only)
+function unitFactor(dimension, fromUnit, toUnit) {
+    return unitCell(dimension, fromUnit, toUnit).factor;
+}
+
+function convertUnit(dimension, value, fromUnit, toUnit) {
+    const cell = unitCell(dimension, fromUnit, toUnit);
+    if (cell.reciprocal) return cell.factor / value;
+    return value * cell.factor + cell.offset;
+}
+
+// Convert a whole column at once; returns a new Float64Array
+function convertColumn(dimension, values, fromUnit, toUnit) {
+    const cell = unitCell(dimension, fromUnit, toUnit);
+    const out = new Float64Array(values.length);
+    if (cell.reciprocal) {
+        for (let i = 0; i < values.length; i++) out[i] = cell.factor / values[i];
+    } else {
+        for (let i = 0; i < values.length; i++) out[i] = values[i] * cell.factor + cell.offset;
+    }
+    return out;
+}
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Minify, fingerprint and precompress the site's JS and CSS.
+
+For every asset in ASSETS this stage writes next to the source:
+  - <name>.<hash>.<ext>: the minified file under a content-hashed name
+  - <name>.<hash>.<ext>.gz: a precompressed copy for servers that serve .gz directly
+
+assets/asset-manifest.json maps each logical path to its hashed path, and the
+references in the static pages and all generated pages are rewritten to the
+hashed names, so the hashed files can be served with immutable cache headers.
+The unhashed sources stay the files developers edit.
+
+The per-calculator modules in assets/js/calculators/ are fetched by main.js
+under fixed URLs, so they are minified in place (keeping their generated-file
+header) and precompressed instead. Run generate_calculator_modules.py first.
+
+Minification is deliberately conservative: comments and redundant whitespace
+are removed, strings, template literals and regex literals are copied
+verbatim, and line breaks that automatic semicolon insertion might depend on
+are kept.
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+
+from build_io import write_if_changed
+from calc_registry import URL_MAPPING, JSParseError, _JSReader, _REGEX_PRECEDERS, _REGEX_KEYWORDS
+from generate_calculator_modules import MODULES_DIR, GENERATED_HEADER
+
+# Logical asset paths that get a minified, fingerprinted copy
+ASSETS = [
+    'assets/js/main.js',
+    'assets/js/calculators-index.js',
+    'assets/css/style.css',
+]
+
+ASSET_MANIFEST = 'assets/asset-manifest.json'
+
+# Hand-written pages that reference assets; generated pages are found via URL_MAPPING
+STATIC_PAGES = ['index.html', '404.html', 'blogs.html', 'convertors.html']
+
+HASH_LENGTH = 10
+
+
+def _is_word(ch):
+    return ch.isalnum() or ch in '_$\\'
+
+
+class _JSMinifier(_JSReader):
+    """Re-emit JS without comments and redundant whitespace."""
+
+    def minify(self):
+        text = self.text
+        out = []
+        last = last_word = ''
+        while True:
+            start = self.pos
+            self.skip_space()
+            gap = text[start:self.pos]
+            if self.pos >= len(text):
+                break
+            ch = text[self.pos]
+            prev = out[-1][-1] if out else ''
+            if gap and prev:
+                if '\n' in gap:
+                    # Only drop line breaks where no semicolon can be inserted
+                    if prev not in '{;,([' and ch not in '})],;':
+                        out.append('\n')
+                elif ((_is_word(prev) and (_is_word(ch) or ch == '.')) or
+                      (prev in '+-' and ch == prev) or (prev == '/' and ch in '/*')):
+                    out.append(' ')
+
+            start = self.pos
+            if ch in '\'"':
+                self.read_string()
+                last, last_word = ch, ''
+            elif ch == '`':
+                self.skip_template()
+                last, last_word = ch, ''
+            elif ch == '/' and (last_word in _REGEX_KEYWORDS or
+                                (not last_word and (last == '' or last in _REGEX_PRECEDERS))):
+                self.skip_regex()
+                last, last_word = '/', ''
+            elif _is_word(ch) and ch != '\\':
+                word = self.read_identifier()
+                last, last_word = word[-1], word
+            else:
+                self.pos += 1
+                last, last_word = ch, ''
+            out.append(text[start:self.pos])
+        return ''.join(out) + '\n'
+
+
+def minify_js(source):
+    """Strip comments and redundant whitespace from JS source."""
+    return _JSMinifier(source).minify()
+
+
+_CSS_TOKEN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|/\*.*?\*/', re.S)
+_CSS_PUNCTUATION = re.compile(r' ?([{};,>]) ?')
+
+
+def _minify_css_code(code):
+    code = _CSS_PUNCTUATION.sub(r'\1', re.sub(r'\s+', ' ', code))
+    return code.replace(';}', '}')
+
+
+def minify_css(source):
+    """Strip comments and collapse whitespace in CSS, leaving strings untouched."""
+    pieces = []
+    code = []
+    pos = 0
+    for match in _CSS_TOKEN.finditer(source):
+        code.append(source[pos:match.start()])
+        if match.group(1):
+            pieces.append(_minify_css_code(''.join(code)))
+            pieces.append(match.group(1))
+            code = []
+        pos = match.end()
+    code.append(source[pos:])
+    pieces.append(_minify_css_code(''.join(code)))
+    return ''.join(pieces).strip() + '\n'
+
+
+MINIFIERS = {'.js': minify_js, '.css': minify_css}
+
+
+def hashed_path(logical, data):
+    """assets/js/main.js -> assets/js/main.<hash>.js for the given content."""
+    stem, ext = os.path.splitext(logical)
+    digest = hashlib.sha256(data).hexdigest()[:HASH_LENGTH]
+    return f'{stem}.{digest}{ext}'
+
+
+def _hashed_name_pattern(logical):
+    stem, ext = os.path.splitext(os.path.basename(logical))
+    return re.compile(rf'^{re.escape(stem)}\.[0-9a-f]{{{HASH_LENGTH}}}{re.escape(ext)}(\.gz)?$')
+
+
+def _reference_pattern(logical):
+    """Match references to the logical path or any earlier hashed version of it."""
+    stem, ext = os.path.splitext(logical)
+    return re.compile(rf'(?<![\w.-]){re.escape(stem)}(?:\.[0-9a-f]{{{HASH_LENGTH}}})?{re.escape(ext)}(?![\w.-])')
+
+
+def load_asset_manifest(base_path):
+    """Return the logical -> hashed path mapping, or {} before the first asset build."""
+    try:
+        with open(os.path.join(base_path, *ASSET_MANIFEST.split('/')), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def asset_url(manifest, logical):
+    """Site-absolute URL of an asset, hashed when the manifest knows it."""
+    return '/' + manifest.get(logical, logical)
+
+
+def build_asset(base_path, logical):
+    """Minify one asset and write its hashed and gzipped copies. Returns (hashed path, sizes)."""
+    with open(os.path.join(base_path, *logical.split('/')), 'r', encoding='utf-8') as f:
+        source = f.read()
+    data = MINIFIERS[os.path.splitext(logical)[1]](source).encode('utf-8')
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+    hashed = hashed_path(logical, data)
+    hashed_file = os.path.join(base_path, *hashed.split('/'))
+    written = write_if_changed(hashed_file, data)
+    written = write_if_changed(hashed_file + '.gz', compressed) or written
+    if written:
+        print(f"Created: {hashed}")
+
+    # Drop hashed copies of earlier versions
+    directory = os.path.dirname(hashed_file)
+    pattern = _hashed_name_pattern(logical)
+    for name in sorted(os.listdir(directory)):
+        if pattern.match(name) and name not in (os.path.basename(hashed), os.path.basename(hashed) + '.gz'):
+            os.remove(os.path.join(directory, name))
+            print(f"Deleted: {os.path.dirname(logical)}/{name}")
+
+    sizes = (len(source.encode('utf-8')), len(data), len(compressed))
+    return hashed, sizes
+
+
+def build_modules(base_path, directory=MODULES_DIR):
+    """Minify the calculator modules in place and precompress them. Returns (module count, sizes)."""
+    modules_dir = os.path.join(base_path, *directory.split('/'))
+    count = 0
+    totals = [0, 0, 0]
+    for name in sorted(os.listdir(modules_dir)):
+        path = os.path.join(modules_dir, name)
+        if name.endswith('.js.gz'):
+            # The module itself was removed by generate_calculator_modules.py
+            if not os.path.exists(path[:-3]):
+                os.remove(path)
+                print(f"Deleted: {directory}/{name}")
+            continue
+        if not name.endswith('.js'):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            source = f.read()
+        header = GENERATED_HEADER if source.startswith(GENERATED_HEADER) else ''
+        data = (header + minify_js(source[len(header):])).encode('utf-8')
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        write_if_changed(path, data)
+        write_if_changed(path + '.gz', compressed)
+        count += 1
+        for i, size in enumerate((len(source.encode('utf-8')), len(data), len(compressed))):
+            totals[i] += size
+    return count, totals
+
+
+def referencing_pages(base_path):
+    """Static pages plus every generated category and calculator page."""
+    pages = [page for page in STATIC_PAGES if os.path.exists(os.path.join(base_path, page))]
+    for category_url in sorted(set(URL_MAPPING.values())):
+        directory = os.path.join(base_path, category_url)
+        if os.path.isdir(directory):
+            pages.extend(f'{category_url}/{name}' for name in sorted(os.listdir(directory))
+                         if name.endswith('.html'))
+    return pages
+
+
+def rewrite_references(base_path, manifest):
+    """Point every asset reference in the pages at its hashed name. Returns pages written."""
+    patterns = [(_reference_pattern(logical), hashed) for logical, hashed in manifest.items()]
+    rewritten = 0
+    for rel_path in referencing_pages(base_path):
+        page_file = os.path.join(base_path, *rel_path.split('/'))
+        with open(page_file, 'r', encoding='utf-8') as f:
+            html = f.read()
+        updated = html
+        for pattern, hashed in patterns:
+            updated = pattern.sub(hashed, updated)
+        if updated != html and write_if_changed(page_file, updated):
+            rewritten += 1
+            print(f"Rewrote: {rel_path}")
+    return rewritten
+
+
+def main():
+    """Build every asset, write the manifest and rewrite page references."""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    manifest = {}
+    report = []
+    for logical in ASSETS:
+        try:
+            hashed, sizes = build_asset(base_path, logical)
+        except JSParseError as e:
+            print(f"❌ {logical}: {e}")
+            sys.exit(1)
+        manifest[logical] = hashed
+        report.append((logical, hashed, sizes))
+
+    try:
+        modules, module_sizes = build_modules(base_path)
+    except JSParseError as e:
+        print(f"❌ {MODULES_DIR}: {e}")
+        sys.exit(1)
+
+    content = json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+    write_if_changed(os.path.join(base_path, *ASSET_MANIFEST.split('/')), content)
+    rewritten = rewrite_references(base_path, manifest)
+
+    print("\nAssets (source -> minified -> gzip):")
+    for logical, hashed, (source, minified, compressed) in report:
+        print(f"  {hashed:<44} {source / 1024:7.1f} KB -> {minified / 1024:7.1f} KB -> {compressed / 1024:6.1f} KB")
+    source, minified, compressed = module_sizes
+    print(f"  {MODULES_DIR + '/*.js (' + str(modules) + ')':<44} {source / 1024:7.1f} KB -> "
+          f"{minified / 1024:7.1f} KB -> {compressed / 1024:6.1f} KB")
+    print(f"\nManifest: {ASSET_MANIFEST}")
+    print(f"Pages rewritten: {rewritten}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Minify, fingerprint and precompress JS and CSS assets.")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    parse_args()
+    main()
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Build the blog: one static page per article plus a paginated metadata index.
+
+blog/articles.json is the source of truth for the guides on blogs.html. Each
+article is rendered to blog/<id>.html (served as /blog/<id>, the URL its
+canonical and the sitemap use), and the listing metadata without the bodies
+is split into blog/index-1.json, blog/index-2.json, ... so blogs.html loads a
+few kilobytes up front and fetches an article body only when it is opened.
+The stage also writes sitemap-blogs.xml; generate_sitemap.py rewrites it with
+the same URLs and records their lastmod dates.
+
+    python build_blog.py
+    python build_blog.py --extract    # recreate articles.json from an inline array in blogs.html
+    python build_blog.py --extract old-blogs.html
+"""
+
+import os
+import re
+import sys
+import json
+import glob
+import html
+import shutil
+import argparse
+import textwrap
+import subprocess
+from datetime import datetime
+
+from build_io import write_if_changed
+from generate_sitemap import BLOG_ARTICLES_FILE, LastmodHistory, iter_blog_urls, write_sitemap
+from page_templates import ARTICLE_PAGE, ARTICLE_LINK
+
+BASE_URL = 'https://www.tahir.engineer'
+BLOG_DIR = 'blog'
+BLOG_PAGE = 'blogs.html'
+
+# Cards per index file: the first file is all the listing needs for its first screen
+INDEX_PAGE_SIZE = 12
+
+# Metadata kept in the index files; `content` only lives in the article pages
+INDEX_FIELDS = ('id', 'title', 'category', 'excerpt', 'icon', 'date', 'readTime')
+
+# Same names as formatCategory() in blogs.html
+CATEGORY_NAMES = {
+    'financial': 'Financial',
+    'health': 'Health & Fitness',
+    'math': 'Mathematics',
+    'engineering': 'Engineering',
+    'crypto': 'Cryptocurrency',
+    'business': 'Business',
+    'conversion': 'Unit Conversion',
+    'physics': 'Physics',
+    'chemistry': 'Chemistry',
+    'construction': 'Construction',
+    'time': 'Time & Date',
+    'utility': 'Utility Tools',
+}
+
+RELATED_LINKS = 4
+
+_ARTICLE_ID = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+_SLUG_BREAK = re.compile(r'[^a-z0-9]+')
+_INLINE_ARRAY = re.compile(r'const articles = (\[.*?\n\s*\]);', re.S)
+
+_EXTRACT_JS = r"""
+const vm = require('vm');
+let source = '';
+process.stdin.on('data', chunk => { source += chunk; });
+process.stdin.on('end', () => process.stdout.write(JSON.stringify(vm.runInNewContext('(' + source + ')'))));
+"""
+
+
+def slugify(text):
+    """'Quadratic Equations: A Guide' -> 'quadratic-equations-a-guide'"""
+    return _SLUG_BREAK.sub('-', text.lower().replace("'", '')).strip('-')
+
+
+def unique_id(article, seen):
+    """A free id for an article whose id is taken: a slug of its title, numbered if that is taken too."""
+    base = slugify(article['title']) or article['id']
+    candidate, number = base, 2
+    while candidate in seen:
+        candidate, number = f'{base}-{number}', number + 1
+    return candidate
+
+
+def extract_articles(page_html):
+    """The articles from an inline `const articles = [...]` array in a page, evaluated by Node.
+
+    Each article is a separate guide even when its id repeats an earlier
+    one (openArticle() could never show those), so a repeated id is replaced
+    by a slug of the article's title."""
+    match = _INLINE_ARRAY.search(page_html)
+    if not match:
+        raise ValueError(f"no inline `const articles = [...]` array in {BLOG_PAGE}")
+    node = shutil.which('node')
+    if not node:
+        raise RuntimeError("node is needed to read the inline articles array")
+    completed = subprocess.run([node, '-e', _EXTRACT_JS], input=match.group(1),
+                               capture_output=True, text=True, check=True)
+    articles, seen = [], set()
+    for article in json.loads(completed.stdout):
+        if article['id'] in seen:
+            new_id = unique_id(article, seen)
+            print(f"⚠️  Article '{article['title']}' repeats the id '{article['id']}', now '{new_id}'")
+            article['id'] = new_id
+        seen.add(article['id'])
+        article['content'] = textwrap.dedent(article['content']).strip()
+        articles.append(article)
+    return articles
+
+
+def load_articles(base_path):
+    with open(os.path.join(base_path, *BLOG_ARTICLES_FILE.split('/')), 'r', encoding='utf-8') as f:
+        articles = json.load(f)
+    seen = set()
+    for article in articles:
+        missing = [field for field in INDEX_FIELDS + ('content',) if not article.get(field)]
+        if missing:
+            raise ValueError(f"article {article.get('id', '?')}: missing {', '.join(missing)}")
+        if not _ARTICLE_ID.match(article['id']):
+            raise ValueError(f"article {article['id']}: id must be lowercase words joined by hyphens")
+        if article['id'] in seen:
+            raise ValueError(f"article {article['id']}: duplicate id")
+        seen.add(article['id'])
+    return articles
+
+
+def category_name(category):
+    return CATEGORY_NAMES.get(category, category.capitalize())
+
+
+def format_date(date):
+    """'2025-01-15' -> 'January 15, 2025', like formatDate() in blogs.html."""
+    day = datetime.strptime(date, '%Y-%m-%d')
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+def structured_data(article, base_url):
+    url = f"{base_url}/blog/{article['id']}"
+    data = {
+        '@context': 'https://schema.org',
+        '@type': 'Article',
+        'headline': article['title'],
+        'description': article['excerpt'],
+        'datePublished': article['date'],
+        'url': url,
+        'mainEntityOfPage': url,
+        'articleSection': category_name(article['category']),
+        'author': {'@type': 'Organization', 'name': 'CalcHub'},
+        'publisher': {'@type': 'Organization', 'name': 'CalcHub',
+                      'logo': {'@type': 'ImageObject', 'url': f'{base_url}/assets/images/logo.png'}},
+        'isPartOf': {'@type': 'Blog', 'name': 'CalcHub Calculator Guides', 'url': f'{base_url}/blogs.html'},
+        'inLanguage': 'en-US',
+    }
+    # "</" inside a string would end the <script> element early
+    return textwrap.indent(json.dumps(data, indent=4, ensure_ascii=False), '    ').replace('</', '<\\/')
+
+
+def render_article(article, related, base_url=BASE_URL):
+    """The static page for one article; `related` are the other articles linked under it."""
+    return ARTICLE_PAGE.render(
+        base_url=base_url,
+        article_id=article['id'],
+        title=html.escape(article['title']),
+        excerpt=html.escape(article['excerpt']),
+        date=article['date'],
+        date_text=format_date(article['date']),
+        read_time=html.escape(article['readTime']),
+        icon=html.escape(article['icon']),
+        category_name=html.escape(category_name(article['category'])),
+        structured_data=structured_data(article, base_url),
+        content=textwrap.indent(article['content'], ' ' * 12),
+        related_links=''.join(ARTICLE_LINK.render(article_id=other['id'], title=html.escape(other['title']))
+                              for other in related),
+    )
+
+
+def related_articles(articles, article, limit=RELATED_LINKS):
+    """Other articles in the same category, newest first."""
+    same = [other for other in articles if other['category'] == article['category'] and other is not article]
+    return sorted(same, key=lambda other: other['date'], reverse=True)[:limit]
+
+
+def index_pages(articles, page_size=INDEX_PAGE_SIZE):
+    """The listing metadata split into pages: [{page, pages, total, articles}, ...]."""
+    pages = max(1, -(-len(articles) // page_size))
+    for number in range(1, pages + 1):
+        chunk = articles[(number - 1) * page_size:number * page_size]
+        yield {'page': number, 'pages': pages, 'total': len(articles),
+               'articles': [{field: article[field] for field in INDEX_FIELDS} for article in chunk]}
+
+
+def remove_stale(directory, pattern, keep):
+    """Delete generated files matching pattern that this build did not write."""
+    removed = 0
+    for path in glob.glob(os.path.join(directory, pattern)):
+        if os.path.basename(path) not in keep:
+            os.remove(path)
+            print(f"Deleted: {BLOG_DIR}/{os.path.basename(path)}")
+            removed += 1
+    return removed
+
+
+def build(base_path, base_url=BASE_URL, page_size=INDEX_PAGE_SIZE):
+    """Write every article page, the index files and sitemap-blogs.xml. Returns (articles, index files, pages written)."""
+    articles = load_articles(base_path)
+    blog_dir = os.path.join(base_path, BLOG_DIR)
+    written = 0
+
+    pages = set()
+    for article in articles:
+        name = f"{article['id']}.html"
+        pages.add(name)
+        if write_if_changed(os.path.join(blog_dir, name), render_article(article, related_articles(articles, article),
+                                                                         base_url)):
+            written += 1
+            print(f"Created: {BLOG_DIR}/{name}")
+    remove_stale(blog_dir, '*.html', pages)
+
+    indexes = set()
+    for index in index_pages(articles, page_size):
+        name = f"index-{index['page']}.json"
+        indexes.add(name)
+        content = json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+        if write_if_changed(os.path.join(blog_dir, name), content):
+            written += 1
+            print(f"Created: {BLOG_DIR}/{name}")
+    remove_stale(blog_dir, 'index-*.json', indexes)
+
+    # Read-only history: saving here would drop every URL this stage does not visit
+    history = LastmodHistory(base_path)
+    for shard_name, count, _ in write_sitemap(base_path, 'sitemap-blogs', iter_blog_urls(base_url, history)):
+        print(f"Created: {shard_name} ({count} URLs)")
+    return len(articles), len(indexes), written
+
+
+def extract(base_path, page=BLOG_PAGE):
+    """Recreate blog/articles.json from the inline articles array of a page."""
+    with open(os.path.join(base_path, page), 'r', encoding='utf-8') as f:
+        articles = extract_articles(f.read())
+    content = json.dumps(articles, indent=2, ensure_ascii=False) + '\n'
+    write_if_changed(os.path.join(base_path, *BLOG_ARTICLES_FILE.split('/')), content)
+    print(f"📄 {len(articles)} articles written to {BLOG_ARTICLES_FILE}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Build the static blog article pages and the paginated article index.")
+    parser.add_argument('--base-url', default=BASE_URL, help="site origin used in canonical URLs and the sitemap")
+    parser.add_argument('--page-size', type=int, default=INDEX_PAGE_SIZE, help="articles per index file")
+    parser.add_argument('--extract', nargs='?', const=BLOG_PAGE, metavar='PAGE',
+                        help=f"recreate {BLOG_ARTICLES_FILE} from the inline articles array of PAGE "
+                             f"(default {BLOG_PAGE}) first")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    try:
+        if args.extract:
+            extract(base_path, args.extract)
+        articles, indexes, written = build(base_path, args.base_url, args.page_size)
+    except (OSError, ValueError, RuntimeError, subprocess.CalledProcessError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ {articles} articles, {indexes} index files, {written} files written")
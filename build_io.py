@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Atomic file output shared by the build scripts.
+
+Every generated file is written to a temp file in its target directory and
+renamed into place, so a crashed or interrupted build never leaves a
+half-written page behind for the web server to serve.
+"""
+
+import os
+import tempfile
+from contextlib import contextmanager
+
+# Permissions for newly created output files (mkstemp would default to 0600)
+DEFAULT_FILE_MODE = 0o644
+
+
+def _target_mode(file_path):
+    """Keep the permissions of an existing file, otherwise use the default."""
+    try:
+        return os.stat(file_path).st_mode & 0o777
+    except FileNotFoundError:
+        return DEFAULT_FILE_MODE
+
+
+@contextmanager
+def atomic_open(file_path, mode='wb', encoding=None):
+    """Open a temp file next to file_path and rename it into place on success."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+        os.chmod(tmp_path, _target_mode(file_path))
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def write_atomic(file_path, data):
+    """Write bytes to a temp file next to file_path and rename it into place."""
+    with atomic_open(file_path) as f:
+        f.write(data)
+
+
+def write_if_changed(file_path, content):
+    """Write content unless the file already holds exactly these bytes. Returns True if written."""
+    data = content.encode('utf-8') if isinstance(content, str) else content
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+    write_atomic(file_path, data)
+    return True
@@ -0,0 +1,479 @@
+#!/usr/bin/env python3
+"""
+Single source of truth for the calculator registry used by the build scripts.
+
+The registry is read straight from the front end: calculator ids, titles, icons
+and input schemas come from `const calculators` and `const toolCategories` in
+assets/js/calculators.js, and the category URL slugs from `const urlMapping` in
+assets/js/main.js. Parsing 7,000+ lines of JS on every build is slow, so the
+parsed result is cached in a compact JSON snapshot keyed by the hash of those
+source files and reused until one of them changes.
+"""
+
+import os
+import json
+import hashlib
+
+from build_io import write_atomic
+
+CALCULATORS_JS = 'assets/js/calculators.js'
+MAIN_JS = 'assets/js/main.js'
+
+# Parsed registry cache, reused while the JS sources hash to the same key
+SNAPSHOT_FILE = '.registry-cache.json'
+
+# Bump whenever the parser output format changes so stale snapshots are ignored
+PARSER_VERSION = '3'
+
+# Category titles (matches updateMetaTags() in main.js)
+CATEGORY_TITLES = {
+    'financial': 'Financial Calculators',
+    'math': 'Mathematics Calculators',
+    'health': 'Health & Fitness Calculators',
+    'crypto': 'Cryptocurrency Calculators',
+    'physics': 'Physics Calculators',
+    'chemistry': 'Chemistry Calculators',
+    'engineering': 'Engineering Calculators',
+    'construction': 'Construction Calculators',
+    'conversion': 'Unit Conversion Tools',
+    'business': 'Business Calculators',
+    'time': 'Date & Time Calculators',
+    'utility': 'Utility Tools'
+}
+
+# Tokens after which a '/' starts a regex literal rather than a division
+_REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+_REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw'}
+
+_ESCAPES = {'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0'}
+
+
+class JSParseError(ValueError):
+    """Raised when the calculator sources cannot be parsed."""
+
+
+class RawJS:
+    """A JS expression (function, template, computed value) kept as a source span."""
+
+    def __init__(self, start, end):
+        self.start = start
+        self.end = end
+
+
+class _JSReader:
+    """Minimal reader for the object literals the front end declares.
+
+    Plain data (objects, arrays, strings, numbers, booleans) is decoded into
+    Python values; anything else is skipped with awareness of strings,
+    template literals, comments and regex literals and returned as RawJS.
+    """
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        return JSParseError(f"{message} at line {line}")
+
+    def skip_space(self):
+        text = self.text
+        while self.pos < len(text):
+            ch = text[self.pos]
+            if ch.isspace():
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = len(text) if end == -1 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos + 2)
+                if end == -1:
+                    raise self.error("Unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip_space()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, ch):
+        if self.peek() != ch:
+            raise self.error(f"Expected {ch!r}")
+        self.pos += 1
+
+    def read_identifier(self):
+        start = self.pos
+        text = self.text
+        while self.pos < len(text) and (text[self.pos].isalnum() or text[self.pos] in '_$'):
+            self.pos += 1
+        return text[start:self.pos]
+
+    def read_string(self):
+        quote = self.text[self.pos]
+        self.pos += 1
+        parts = []
+        text = self.text
+        while True:
+            if self.pos >= len(text):
+                raise self.error("Unterminated string")
+            ch = text[self.pos]
+            if ch == quote:
+                self.pos += 1
+                return ''.join(parts)
+            if ch == '\\':
+                nxt = text[self.pos + 1]
+                if nxt == 'u':
+                    parts.append(chr(int(text[self.pos + 2:self.pos + 6], 16)))
+                    self.pos += 6
+                    continue
+                if nxt == '\n':
+                    self.pos += 2
+                    continue
+                parts.append(_ESCAPES.get(nxt, nxt))
+                self.pos += 2
+                continue
+            parts.append(ch)
+            self.pos += 1
+
+    def skip_template(self):
+        """Skip a template literal starting at the opening backtick; True if it interpolates."""
+        text = self.text
+        self.pos += 1
+        interpolated = False
+        while True:
+            if self.pos >= len(text):
+                raise self.error("Unterminated template literal")
+            ch = text[self.pos]
+            if ch == '\\':
+                self.pos += 2
+            elif ch == '`':
+                self.pos += 1
+                return interpolated
+            elif text.startswith('${', self.pos):
+                interpolated = True
+                self.pos += 2
+                self.skip_expression(closers='}')
+                self.pos += 1
+            else:
+                self.pos += 1
+
+    def skip_regex(self):
+        text = self.text
+        self.pos += 1
+        in_class = False
+        while True:
+            if self.pos >= len(text) or text[self.pos] == '\n':
+                raise self.error("Unterminated regex literal")
+            ch = text[self.pos]
+            if ch == '\\':
+                self.pos += 2
+                continue
+            if ch == '[':
+                in_class = True
+            elif ch == ']':
+                in_class = False
+            elif ch == '/' and not in_class:
+                self.pos += 1
+                self.read_identifier()
+                return
+            self.pos += 1
+
+    def skip_expression(self, closers=',}]'):
+        """Advance to the next closer at nesting depth zero and return the skipped span."""
+        text = self.text
+        start = self.pos
+        depth = 0
+        last = ''
+        last_word = ''
+        while self.pos < len(text):
+            ch = text[self.pos]
+            if ch.isspace() or text.startswith('//', self.pos) or text.startswith('/*', self.pos):
+                self.skip_space()
+                continue
+            if depth == 0 and ch in closers:
+                break
+            if ch in '\'"':
+                self.read_string()
+                last, last_word = ch, ''
+                continue
+            if ch == '`':
+                self.skip_template()
+                last, last_word = ch, ''
+                continue
+            if ch == '/':
+                if last_word in _REGEX_KEYWORDS or (not last_word and (last == '' or last in _REGEX_PRECEDERS)):
+                    self.skip_regex()
+                    last, last_word = '/', ''
+                    continue
+            if ch.isalnum() or ch in '_$':
+                word = self.read_identifier()
+                last, last_word = word[-1], word
+                continue
+            if ch in '([{':
+                depth += 1
+            elif ch in ')]}':
+                depth -= 1
+                if depth < 0:
+                    raise self.error(f"Unbalanced {ch!r}")
+            last, last_word = ch, ''
+            self.pos += 1
+        end = self.pos
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return RawJS(start, end)
+
+    def parse_value(self):
+        ch = self.peek()
+        start = self.pos
+        if ch == '{':
+            value = self.parse_object()
+        elif ch == '[':
+            value = self.parse_array()
+        elif ch in '\'"':
+            value = self.read_string()
+        elif ch == '`':
+            if self.skip_template():
+                self.pos = start
+                return self.skip_expression()
+            value = self.text[start + 1:self.pos - 1]
+        else:
+            return self.parse_scalar()
+        # Literals followed by an operator (e.g. 'a' + b) are expressions
+        if self.peek() not in ',}]':
+            self.pos = start
+            return self.skip_expression()
+        return value
+
+    def parse_scalar(self):
+        start = self.pos
+        raw = self.skip_expression()
+        source = self.text[start:raw.end].strip()
+        if source in ('true', 'false'):
+            return source == 'true'
+        if source in ('null', 'undefined'):
+            return None
+        try:
+            return int(source)
+        except ValueError:
+            pass
+        try:
+            return float(source)
+        except ValueError:
+            return raw
+
+    def parse_key(self):
+        ch = self.peek()
+        if ch in '\'"':
+            return self.read_string()
+        key = self.read_identifier()
+        if not key:
+            raise self.error("Expected property name")
+        return key
+
+    def parse_object(self):
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            key = self.parse_key()
+            if self.peek() == '(':
+                # Shorthand method: name(args) { body }
+                start = self.pos
+                self.skip_expression()
+                result[key] = RawJS(start, self.pos)
+            else:
+                self.expect(':')
+                result[key] = self.parse_value()
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def parse_array(self):
+        self.expect('[')
+        result = []
+        while self.peek() != ']':
+            result.append(self.parse_value())
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return result
+
+    def parse_entries(self):
+        """Parse an object literal one property at a time, keeping each entry's span."""
+        self.expect('{')
+        entries = []
+        while self.peek() != '}':
+            start = self.pos
+            key = self.parse_key()
+            self.expect(':')
+            self.skip_space()
+            value_start = self.pos
+            value = self.parse_value()
+            value_end = self.pos
+            while self.text[value_end - 1].isspace():
+                value_end -= 1
+            entries.append((key, value, start, self.pos, value_start, value_end))
+            if self.peek() == ',':
+                self.pos += 1
+        self.pos += 1
+        return entries
+
+
+def _find_declaration(text, name):
+    marker = f'const {name} = '
+    index = text.find(marker)
+    if index == -1:
+        raise JSParseError(f"Could not find `const {name}` declaration")
+    return index + len(marker)
+
+
+def _plain(value):
+    """Strip RawJS members, leaving only JSON-serialisable data."""
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items() if not isinstance(v, RawJS)}
+    if isinstance(value, list):
+        return [_plain(v) for v in value if not isinstance(v, RawJS)]
+    return value
+
+
+def parse_calculators(text):
+    """Parse `const calculators` into {id: entry} with data fields and source spans."""
+    reader = _JSReader(text, _find_declaration(text, 'calculators'))
+    calculators = {}
+    for calc_id, value, start, end, value_start, value_end in reader.parse_entries():
+        if not isinstance(value, dict):
+            raise JSParseError(f"Calculator {calc_id!r} is not an object literal")
+        source = text[start:end]
+        calculators[calc_id] = {
+            'title': value.get('title', calc_id),
+            'icon': value.get('icon', ''),
+            'inputs': _plain(value.get('inputs', [])),
+            'custom': bool(value.get('isCustomInterface')),
+            'requires': _plain(value.get('requires', [])),
+            'span': [start, end],
+            'value_span': [value_start, value_end],
+            'functions': {k: [v.start, v.end] for k, v in value.items() if isinstance(v, RawJS)},
+            'hash': hashlib.sha256(source.encode('utf-8')).hexdigest()[:16],
+        }
+    return calculators
+
+
+def parse_object_declaration(text, name):
+    """Parse a plain-data `const <name> = {...}` declaration."""
+    reader = _JSReader(text, _find_declaration(text, name))
+    return _plain(reader.parse_object())
+
+
+def _read(base_path, rel_path):
+    with open(os.path.join(base_path, *rel_path.split('/')), 'rb') as f:
+        return f.read()
+
+
+def _source_key(sources):
+    digest = hashlib.sha256(PARSER_VERSION.encode('ascii'))
+    for data in sources:
+        digest.update(hashlib.sha256(data).digest())
+    return digest.hexdigest()
+
+
+def build_registry(calculators_src, main_src):
+    """Parse the JS sources into the registry dictionary."""
+    return {
+        'calculators': parse_calculators(calculators_src),
+        'categories': parse_object_declaration(calculators_src, 'toolCategories'),
+        'url_mapping': parse_object_declaration(main_src, 'urlMapping'),
+    }
+
+
+_loaded = {}
+
+def load_registry(base_path=None, use_cache=True):
+    """Return the calculator registry, parsing the JS only when its hash changed."""
+    base_path = base_path or os.path.dirname(os.path.abspath(__file__))
+    calculators_bytes = _read(base_path, CALCULATORS_JS)
+    main_bytes = _read(base_path, MAIN_JS)
+    key = _source_key([calculators_bytes, main_bytes])
+
+    if use_cache and key in _loaded:
+        return _loaded[key]
+
+    snapshot_file = os.path.join(base_path, SNAPSHOT_FILE)
+    if use_cache:
+        try:
+            with open(snapshot_file, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get('key') == key:
+                _loaded[key] = snapshot['registry']
+                return snapshot['registry']
+        except (OSError, ValueError, KeyError):
+            pass
+
+    registry = build_registry(calculators_bytes.decode('utf-8'), main_bytes.decode('utf-8'))
+
+    if use_cache:
+        payload = json.dumps({'key': key, 'registry': registry}, separators=(',', ':'))
+        write_atomic(snapshot_file, payload.encode('utf-8'))
+        _loaded[key] = registry
+    return registry
+
+
+def calculator_source(registry, calc_id, base_path=None, member=None):
+    """Return the JS object literal of a calculator, or the source of one of its function members."""
+    base_path = base_path or os.path.dirname(os.path.abspath(__file__))
+    calc = registry['calculators'][calc_id]
+    start, end = calc['functions'][member] if member else calc['value_span']
+    text = _read(base_path, CALCULATORS_JS).decode('utf-8')
+    return text[start:end]
+
+
+def registry_problems(registry):
+    """Return human-readable descriptions of drift between the registry tables."""
+    problems = []
+    calculators = registry['calculators']
+    categories = registry['categories']
+    url_mapping = registry['url_mapping']
+    listed = set()
+
+    for category_key, tools in categories.items():
+        if category_key not in url_mapping:
+            problems.append(f"Category '{category_key}' has no URL in main.js urlMapping")
+        if category_key not in CATEGORY_TITLES:
+            problems.append(f"Category '{category_key}' has no title in CATEGORY_TITLES")
+        for tool in tools:
+            if tool not in calculators:
+                problems.append(f"'{category_key}' lists '{tool}' but calculators.js does not define it")
+            if tool in listed:
+                problems.append(f"'{tool}' is listed in more than one category")
+            listed.add(tool)
+
+    for category_key in url_mapping:
+        if category_key not in categories:
+            problems.append(f"urlMapping has '{category_key}' but toolCategories does not")
+
+    for calc_id in calculators:
+        if calc_id not in listed:
+            problems.append(f"'{calc_id}' is defined but not listed in any category")
+
+    return problems
+
+
+_registry = load_registry()
+
+# Category key -> URL slug (from main.js urlMapping)
+URL_MAPPING = _registry['url_mapping']
+
+# Category key -> calculator ids (from calculators.js toolCategories)
+TOOL_CATEGORIES = _registry['categories']
+
+# Calculator id -> {title, icon, inputs, ...} (from calculators.js calculators)
+CALCULATORS = _registry['calculators']
+
+
+if __name__ == '__main__':
+    total = sum(len(tools) for tools in TOOL_CATEGORIES.values())
+    print(f"Calculators defined: {len(CALCULATORS)}")
+    print(f"Categories: {len(TOOL_CATEGORIES)}")
+    print(f"Calculators listed in categories: {total}")
+    for problem in registry_problems(_registry):
+        print(f"  ⚠️  {problem}")
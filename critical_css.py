@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Critical CSS for the generated calculator and category pages.
+
+Those pages are a heading, a spinner and a breadcrumb, yet their <head> blocks
+first paint on four stylesheets. This module works out which rules a page
+actually uses, inlines that subset in a <style> block and turns the full
+stylesheets into asynchronous preloads.
+
+A stylesheet can only be subset when its CSS is available locally:
+assets/css/style.css always is, the CDN stylesheets once they have been
+downloaded into CSS_CACHE_DIR with `python critical_css.py --fetch`. A CDN
+stylesheet without a cached copy stays render-blocking unless the pages do
+not depend on it for first paint (async_safe).
+
+Selector matching is deliberately generous: a selector is kept when every
+tag, class, id and attribute it names appears somewhere in the page, without
+checking how the elements are nested. Rules that only apply on interaction
+(:hover, :focus, ...) and print styles are left to the full stylesheets.
+"""
+
+import os
+import re
+import sys
+import hashlib
+import argparse
+import urllib.request
+from html.parser import HTMLParser
+from urllib.parse import urljoin
+
+from build_assets import minify_css
+from build_io import write_atomic
+
+# Downloaded copies of the CDN stylesheets, keyed by a hash of their URL
+CSS_CACHE_DIR = '.css-cache'
+
+LOCAL_STYLESHEET = 'assets/css/style.css'
+
+# Stylesheets linked from every generated page, in cascade order. href None is
+# the local stylesheet, whose (fingerprinted) URL is passed in by the caller.
+STYLESHEETS = [
+    {'label': 'Bootstrap CSS', 'href': 'https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css',
+     'async_safe': False},
+    # Redirect stubs and category pages show no icons, but prerendered calculator pages do
+    # (fa-calculator, fa-times, fa-arrow-left), so it only loads asynchronously on icon-free pages
+    {'label': 'Font Awesome', 'href': 'https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css',
+     'async_safe': lambda features: not any(name.startswith('fa-') for name in features.classes)},
+    # display=swap already paints text in a fallback font until the web fonts arrive
+    {'label': 'Google Fonts', 'href': 'https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@700&display=swap',
+     'async_safe': True},
+    {'label': 'Custom CSS', 'href': None, 'async_safe': False},
+]
+
+# Pseudo-classes that only matter after the user interacts with the page
+_INTERACTIVE = re.compile(r':(?:hover|focus|focus-within|focus-visible|active|visited|checked|disabled)\b')
+_SIMPLE_PARTS = re.compile(r'([.#]?)(-?[_a-zA-Z][\w-]*)|\[\s*([\w-]+)')
+_STRIP_PSEUDO = re.compile(r'::?[\w-]+(\([^)]*\))?')
+_ANIMATION = re.compile(r'animation(?:-name)?\s*:\s*([^;}]+)')
+_FONT_FAMILY = re.compile(r'font-family\s*:\s*([^;}]+)')
+_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+
+class _PageFeatures(HTMLParser):
+    """Collect the tags, classes, ids and attribute names used in a page."""
+
+    def __init__(self):
+        super().__init__()
+        self.tags = {'html', 'body'}
+        self.classes = set()
+        self.ids = set()
+        self.attributes = set()
+
+    def handle_starttag(self, tag, attrs):
+        self.tags.add(tag)
+        for name, value in attrs:
+            self.attributes.add(name)
+            if name == 'class' and value:
+                self.classes.update(value.split())
+            elif name == 'id' and value:
+                self.ids.add(value)
+
+
+def async_safe(sheet, features):
+    """Whether a page with these features can paint before the stylesheet loads."""
+    safe = sheet['async_safe']
+    return safe(features) if callable(safe) else safe
+
+
+def page_features(html):
+    parser = _PageFeatures()
+    parser.feed(html)
+    return parser
+
+
+def parse_css(css):
+    """Split minified CSS into [(prelude, body)] where at-rule bodies are parsed recursively."""
+    nodes = []
+    pos = 0
+    while pos < len(css):
+        brace = css.find('{', pos)
+        semi = css.find(';', pos)
+        if brace == -1:
+            break
+        if semi != -1 and semi < brace:
+            # Statement at-rule such as @charset or @import
+            nodes.append((css[pos:semi].strip(), None))
+            pos = semi + 1
+            continue
+        depth = 0
+        end = brace
+        quote = ''
+        while end < len(css):
+            ch = css[end]
+            if quote:
+                if ch == '\\':
+                    end += 1
+                elif ch == quote:
+                    quote = ''
+            elif ch in '\'"':
+                quote = ch
+            elif ch == '{':
+                depth += 1
+            elif ch == '}':
+                depth -= 1
+                if depth == 0:
+                    break
+            end += 1
+        prelude = css[pos:brace].strip()
+        body = css[brace + 1:end]
+        if prelude.startswith('@') and not prelude.startswith(('@font-face', '@page')) and '{' in body:
+            nodes.append((prelude, parse_css(body)))
+        else:
+            nodes.append((prelude, body))
+        pos = end + 1
+    return nodes
+
+
+def _split_selectors(prelude):
+    parts, depth, start = [], 0, 0
+    for i, ch in enumerate(prelude):
+        if ch in '([':
+            depth += 1
+        elif ch in ')]':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(prelude[start:i])
+            start = i + 1
+    parts.append(prelude[start:])
+    return [part.strip() for part in parts if part.strip()]
+
+
+def selector_matches(selector, features):
+    """True if every tag, class, id and attribute named in the selector occurs in the page."""
+    if _INTERACTIVE.search(selector):
+        return False
+    bare = _STRIP_PSEUDO.sub('', selector)
+    for prefix, name, attribute in _SIMPLE_PARTS.findall(bare):
+        if attribute:
+            if attribute not in features.attributes:
+                return False
+        elif prefix == '.':
+            if name not in features.classes:
+                return False
+        elif prefix == '#':
+            if name not in features.ids:
+                return False
+        elif name.lower() not in features.tags:
+            return False
+    return True
+
+
+def _subset(nodes, features, out):
+    for prelude, body in nodes:
+        if body is None:
+            continue
+        if isinstance(body, list):
+            if prelude.startswith('@media') and 'print' in prelude and 'screen' not in prelude:
+                continue
+            if prelude.startswith(('@media', '@supports', '@layer')):
+                inner = []
+                _subset(body, features, inner)
+                if inner:
+                    out.append(f'{prelude}{{{"".join(inner)}}}')
+            continue
+        if prelude.startswith('@'):
+            # @font-face and @keyframes are decided once the kept rules are known
+            continue
+        selectors = [s for s in _split_selectors(prelude) if selector_matches(s, features)]
+        if selectors:
+            out.append(f'{",".join(selectors)}{{{body}}}')
+
+
+def _referenced_names(css, pattern):
+    names = set()
+    for match in pattern.findall(css):
+        names.update(part.strip().strip('\'"') for part in re.split(r'[,\s]+', match))
+    return names
+
+
+def critical_subset(css, features):
+    """Return the rules of a stylesheet that apply to a page with these features."""
+    nodes = parse_css(minify_css(css))
+    kept = []
+    _subset(nodes, features, kept)
+    rules = ''.join(kept)
+    animations = _referenced_names(rules, _ANIMATION)
+    families = _referenced_names(rules, _FONT_FAMILY)
+    extra = []
+    for prelude, body in nodes:
+        if isinstance(body, str) and prelude.startswith('@font-face'):
+            family = _referenced_names(body, _FONT_FAMILY)
+            if family & families:
+                extra.append(f'{prelude}{{{body}}}')
+        elif prelude.startswith(('@keyframes', '@-webkit-keyframes')) and prelude.split()[-1] in animations:
+            inner = ''.join(f'{p}{{{b}}}' for p, b in body) if isinstance(body, list) else body
+            extra.append(f'{prelude}{{{inner}}}')
+    return ''.join(extra) + rules
+
+
+def _cache_file(base_path, href):
+    name = hashlib.sha256(href.encode('utf-8')).hexdigest()[:16] + '.css'
+    return os.path.join(base_path, CSS_CACHE_DIR, name)
+
+
+def read_stylesheet(base_path, href):
+    """CSS text of a linked stylesheet, or None when a CDN copy has not been fetched."""
+    path = os.path.join(base_path, *LOCAL_STYLESHEET.split('/')) if href is None else _cache_file(base_path, href)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def fetch_stylesheets(base_path):
+    """Download the CDN stylesheets into CSS_CACHE_DIR."""
+    for sheet in STYLESHEETS:
+        if sheet['href'] is None:
+            continue
+        request = urllib.request.Request(sheet['href'], headers={'User-Agent': 'Mozilla/5.0'})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                data = response.read()
+        except OSError as e:
+            print(f"❌ {sheet['label']}: {e}")
+            continue
+        write_atomic(_cache_file(base_path, sheet['href']), data)
+        print(f"✅ {sheet['label']}: {len(data) / 1024:.1f} KB")
+
+
+def _absolute_urls(css, href):
+    """Resolve url() references of a CDN stylesheet so they still work inlined."""
+    if href is None:
+        return css
+    return _URL.sub(lambda m: f'url({urljoin(href, m.group(2))})', css)
+
+
+def blocking_links(style_href):
+    """The original render-blocking <link> tags."""
+    lines = []
+    for sheet in STYLESHEETS:
+        href = sheet['href'] or style_href
+        lines.append(f'    <!-- {sheet["label"]} -->\n    <link rel="stylesheet" href="{href}">')
+    return '\n'.join(lines)
+
+
+def inline_css(html):
+    """Contents of the <style> blocks of a page."""
+    return ''.join(re.findall(r'<style[^>]*>(.*?)</style>', html, re.S | re.I))
+
+
+def stylesheet_block(html, style_href, base_path, page_css=''):
+    """Build the <head> styles for a page: inline critical CSS plus async links.
+
+    page_css is CSS that ships inline with no stylesheet of its own (such as
+    the app styles of index.html). No full copy of it loads later, and the
+    page's scripts render elements (results, alerts) and states (:hover,
+    :focus) the sample page lacks, so it goes in whole, minified, in a <style>
+    block after the links so it still wins the cascade once they load.
+
+    Returns (block, report) where report holds the render-blocking stylesheet
+    bytes before and after and the labels of stylesheets whose size is unknown.
+    """
+    features = page_features(html)
+    inline = []
+    links = []
+    before = 0
+    unknown = []
+    for sheet in STYLESHEETS:
+        href = sheet['href'] or style_href
+        css = read_stylesheet(base_path, sheet['href'])
+        if css is None:
+            unknown.append(sheet['label'])
+            if not async_safe(sheet, features):
+                links.append(f'    <!-- {sheet["label"]} -->\n    <link rel="stylesheet" href="{href}">')
+                continue
+        else:
+            size = len(css.encode('utf-8'))
+            before += size
+            inline.append(_absolute_urls(critical_subset(css, features), sheet['href']))
+        links.append(f'    <!-- {sheet["label"]} (loaded asynchronously) -->\n'
+                     f'    <link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">\n'
+                     f'    <noscript><link rel="stylesheet" href="{href}"></noscript>')
+
+    critical = ''.join(inline)
+    after = len(critical.encode('utf-8'))
+    # Stylesheets that stay render-blocking come first in STYLESHEETS, so the
+    # inline rules still follow them in the cascade
+    blocking = [link for link in links if 'rel="preload"' not in link]
+    deferred = [link for link in links if 'rel="preload"' in link]
+    parts = blocking + ['    <!-- Critical CSS -->\n    <style>' + critical + '</style>'] + deferred
+    if page_css:
+        parts.append('    <style>' + minify_css(page_css) + '</style>')
+    block = '\n'.join(parts)
+    return block, {'before': before, 'after': after, 'unknown': unknown}
+
+
+def print_report(kind, report):
+    before, after = report['before'], report['after']
+    print(f"Critical CSS ({kind}): {before / 1024:.1f} KB render-blocking CSS -> "
+          f"{after / 1024:.1f} KB inline ({(before - after) / 1024:.1f} KB removed per page)")
+    if report['unknown']:
+        print(f"  Not cached, size unknown: {', '.join(report['unknown'])} (run critical_css.py --fetch)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Manage the stylesheets used for critical CSS extraction.")
+    parser.add_argument('--fetch', action='store_true',
+                        help=f"download the CDN stylesheets into {CSS_CACHE_DIR}/")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    if args.fetch:
+        fetch_stylesheets(base_path)
+    for sheet in STYLESHEETS:
+        cached = read_stylesheet(base_path, sheet['href']) is not None
+        print(f"{'✅' if cached else '⚠️ '} {sheet['label']}: {'available' if cached else 'not cached'}")
+    sys.exit(0)
@@ -0,0 +1,562 @@
+#!/usr/bin/env python3
+"""
+Streaming CSV <-> JSON conversion for files of any size.
+
+The reference for assets/js/data-convert.js, the Web Worker behind the CSV to
+JSON and JSON to CSV tools on convertors.html; both produce byte-identical
+output. CSV is read with the csv module (RFC 4180: quoted fields may hold
+commas, doubled quotes and line breaks) and written out a row at a time as a
+JSON array of objects in JSON.stringify(rows, null, 2) layout. JSON input is
+split into array elements by a bracket scanner so only one row is parsed at a
+time, and values are printed the way JavaScript prints them.
+
+    python data_convert.py export.csv              # writes export.json
+    python data_convert.py rows.json -o rows.csv
+"""
+
+import os
+import re
+import csv
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from build_io import atomic_open
+
+DATA_CONVERT_JS = 'assets/js/data-convert.js'
+
+CHUNK_CHARS = 1024 * 1024
+INVALID_JSON = 'Invalid JSON format'
+NOT_ROWS = 'JSON must be an array of objects'
+KINDS = {'.csv': ('csv-to-json', '.json'), '.json': ('json-to-csv', '.csv')}
+
+# What the element scanner stops at: a whole string, a bracket or comma, or a string that runs past
+# the piece; _STRING_REST reads on to the closing quote of a string started in an earlier piece
+_JSON_TOKEN = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"|[\[\]{},"]', re.S)
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', re.S)
+# An object with no nested objects or arrays, skipped in one step (most rows are flat); the
+# possessive quantifiers keep a row cut off at the end of a piece from backtracking
+_FLAT_OBJECT = re.compile(r'[ \t\n\r]*+\{(?:[^{}\[\]"]++|"[^"\\]*+(?:\\.[^"\\]*+)*+")*+\}', re.S)
+_JSON_WHITESPACE = ' \t\n\r'
+# Keys JavaScript orders first, ascending: canonical array indices
+_ARRAY_INDEX = re.compile(r'0|[1-9][0-9]*')
+_CSV_SPECIAL = re.compile(r'[",\r\n]')
+
+# json.dumps(text, ensure_ascii=False) for a str, without the per-call overhead
+json_string = json.encoder.encode_basestring
+
+# The csv module caps fields at 128 KB by default
+csv.field_size_limit(sys.maxsize)
+
+
+def json_keys(headers):
+    """Header row as JSON keys: blank names become column_<n> and repeats get a _2, _3... suffix."""
+    used = set()
+    keys = []
+    for index, header in enumerate(headers):
+        base = header or f'column_{index + 1}'
+        name = base
+        n = 2
+        while name in used:
+            name = f'{base}_{n}'
+            n += 1
+        used.add(name)
+        keys.append(json_string(name))
+    return keys
+
+
+def csv_to_json(records, write):
+    """Write CSV records (lists of fields) as a JSON array of row objects. Returns the row count."""
+    keys = None
+    rows = 0
+    for fields in records:
+        if not fields:
+            continue
+        if keys is None:
+            keys = json_keys(fields)
+            continue
+        parts = ['[\n  {' if rows == 0 else ',\n  {']
+        for i, key in enumerate(keys):
+            value = fields[i] if i < len(fields) else ''
+            parts.append(f"{',' if i else ''}\n    {key}: {json_string(value)}")
+        parts.append('\n  }')
+        write(''.join(parts))
+        rows += 1
+    write('\n]' if rows else '[]')
+    return rows
+
+
+def js_number(x):
+    """A float as JavaScript's String(x) prints it: shortest round-trip digits, exponent past 1e21."""
+    if math.isnan(x):
+        return 'NaN'
+    if math.isinf(x):
+        return 'Infinity' if x > 0 else '-Infinity'
+    if x == 0:
+        return '0'
+    whole, _, rest = repr(abs(x)).partition('.')
+    fraction, _, exponent = rest.partition('e')
+    if 'e' in whole:
+        whole, _, exponent = whole.partition('e')
+    digits = (whole + fraction).lstrip('0')
+    point = len(whole) + int(exponent or 0) - (len(whole + fraction) - len(digits))
+    digits = digits.rstrip('0')
+    k, n = len(digits), point
+    if k <= n <= 21:
+        text = digits + '0' * (n - k)
+    elif 0 < n <= 21:
+        text = f'{digits[:n]}.{digits[n:]}'
+    elif -6 < n <= 0:
+        text = '0.' + '0' * -n + digits
+    else:
+        text = (digits if k == 1 else f'{digits[0]}.{digits[1:]}') + f"e{'+' if n > 0 else '-'}{abs(n - 1)}"
+    return ('-' if x < 0 else '') + text
+
+
+def js_keys(obj):
+    """Object.keys order: array-index keys ascending, then the rest as inserted."""
+    index = sorted((int(key), key) for key in obj if _ARRAY_INDEX.fullmatch(key) and int(key) < 2 ** 32 - 1)
+    indices = {key for _, key in index}
+    return [key for _, key in index] + [key for key in obj if key not in indices]
+
+
+def js_json(value):
+    """JSON.stringify(value) for a value parsed by parse_json()."""
+    if value is None:
+        return 'null'
+    if value is True or value is False:
+        return 'true' if value else 'false'
+    if isinstance(value, float):
+        return js_number(value) if math.isfinite(value) else 'null'
+    if isinstance(value, str):
+        return json_string(value)
+    if isinstance(value, list):
+        return '[' + ','.join(js_json(item) for item in value) + ']'
+    return '{' + ','.join(f'{json_string(key)}:{js_json(value[key])}' for key in js_keys(value)) + '}'
+
+
+def _reject_constant(name):
+    raise ValueError(INVALID_JSON)
+
+
+def parse_json(text):
+    """JSON.parse: every number is a float, NaN and Infinity are errors."""
+    try:
+        return json.loads(text, parse_int=float, parse_constant=_reject_constant)
+    except (ValueError, RecursionError):
+        raise ValueError(INVALID_JSON) from None
+
+
+class JsonArrayParser:
+    """Feed the text of a JSON array in pieces of any size; on_element gets each parsed element."""
+
+    def __init__(self, on_element):
+        self.on_element = on_element
+        self.started = False
+        self.finished = False
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.pending = []
+        self.count = 0
+
+    def _element(self, source, closing):
+        if not source.strip(_JSON_WHITESPACE):
+            # '[]' is fine; '[,' and '[1,]' are not
+            if closing and self.count == 0:
+                return
+            raise ValueError(INVALID_JSON)
+        value = parse_json(source)
+        self.count += 1
+        self.on_element(value)
+
+    def feed(self, text):
+        i = 0
+        if not self.started:
+            i = len(text) - len(text.lstrip(_JSON_WHITESPACE))
+            if i == len(text):
+                return
+            if text[i] != '[':
+                raise ValueError(NOT_ROWS)
+            self.started = True
+            i += 1
+        if self.finished:
+            if text[i:].strip(_JSON_WHITESPACE):
+                raise ValueError(INVALID_JSON)
+            return
+        start = pos = i
+        while True:
+            if self.in_string:
+                if self.escaped:
+                    if pos == len(text):
+                        break
+                    self.escaped = False
+                    pos += 1
+                pos = _STRING_REST.match(text, pos).end()
+                if pos == len(text):
+                    break
+                if text[pos] == '\\':
+                    # A backslash ending the piece escapes the first character of the next one
+                    self.escaped = True
+                    break
+                self.in_string = False
+                pos += 1
+            if self.depth == 0:
+                flat = _FLAT_OBJECT.match(text, pos)
+                if flat:
+                    pos = flat.end()
+            match = _JSON_TOKEN.search(text, pos)
+            if not match:
+                break
+            c = match.group()
+            pos = match.end()
+            if c[0] == '"':
+                self.in_string = c == '"'
+            elif c in '[{':
+                self.depth += 1
+            elif c in ']}':
+                if self.depth:
+                    self.depth -= 1
+                elif c == ']':
+                    self.pending.append(text[start:match.start()])
+                    source, self.pending = ''.join(self.pending), []
+                    self._element(source, True)
+                    self.finished = True
+                    if text[pos:].strip(_JSON_WHITESPACE):
+                        raise ValueError(INVALID_JSON)
+                    return
+                else:
+                    raise ValueError(INVALID_JSON)
+            elif self.depth == 0:
+                self.pending.append(text[start:match.start()])
+                source, self.pending = ''.join(self.pending), []
+                self._element(source, False)
+                start = pos
+        self.pending.append(text[start:])
+
+    def end(self):
+        if not self.finished:
+            raise ValueError(INVALID_JSON)
+
+
+def csv_field(text):
+    """A CSV field, quoted only when it holds a comma, quote or line break."""
+    return '"' + text.replace('"', '""') + '"' if _CSV_SPECIAL.search(text) else text
+
+
+def csv_line(values):
+    """A CSV line; a lone empty field is quoted so the line does not read as blank."""
+    return ('""' if values == [''] else ','.join(csv_field(v) for v in values)) + '\r\n'
+
+
+def csv_value(value):
+    """String(value) for a JSON scalar, JSON.stringify() for objects and arrays, '' for null."""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float):
+        return js_number(value)
+    return js_json(value)
+
+
+class JsonToCsv:
+    """JSON array of objects in, CSV out; the columns are the first object's keys."""
+
+    def __init__(self, write):
+        self.write = write
+        self.headers = None
+        self.rows = 0
+        self.parser = JsonArrayParser(self.row)
+
+    def row(self, row):
+        if not isinstance(row, dict):
+            raise ValueError(NOT_ROWS)
+        if self.headers is None:
+            self.headers = js_keys(row)
+            self.write(csv_line(self.headers))
+        self.write(csv_line([csv_value(row.get(header)) for header in self.headers]))
+        self.rows += 1
+
+    def feed(self, text):
+        self.parser.feed(text)
+
+    def end(self):
+        self.parser.end()
+        if not self.rows:
+            raise ValueError(NOT_ROWS)
+        return self.rows
+
+
+def convert_file(path, output_path, kind, chunk_chars=CHUNK_CHARS):
+    """Convert path to output_path ('csv-to-json' or 'json-to-csv'). Returns the row count; the output
+    is only replaced when the whole input converts."""
+    # utf-8-sig and errors='replace' decode the way the browser's TextDecoder does
+    with open(path, 'r', encoding='utf-8-sig', errors='replace', newline='') as source, \
+            atomic_open(output_path, 'w', encoding='utf-8') as output:
+        if kind == 'csv-to-json':
+            return csv_to_json(csv.reader(source), output.write)
+        converter = JsonToCsv(output.write)
+        while True:
+            text = source.read(chunk_chars)
+            if not text:
+                break
+            converter.feed(text)
+        return converter.end()
+
+
+# Building blocks for random CSV: every parser state and line ending, including malformed quoting
+_CSV_PIECES = ['a', 'bc', '1.5', ',', ',', ',', '"', '""', '"x,y"', '"q""q"', '\n', '\r\n', '\r', ' ', '\t',
+               'é', '😀', ' ', '\\', 'x"y', '""""']
+
+
+def _random_csv(rng):
+    if rng.random() < 0.5:
+        return ''.join(rng.choice(_CSV_PIECES) for _ in range(rng.randint(0, 80)))
+    # Well-formed CSV with quoted fields, ragged rows and a blank or duplicate header
+    columns = rng.randint(1, 5)
+    headers = [rng.choice(['id', 'name', '', 'name', 'a,b', '"q"', 'Ünï']) for _ in range(columns)]
+    lines = [','.join(csv_field(h) for h in headers)]
+    for _ in range(rng.randint(0, 20)):
+        fields = [rng.choice(['', '1', 'x y', 'line\nbreak', 'comma, inside', 'say "hi"', 'ß', '\r\n'])
+                  for _ in range(rng.randint(0, columns + 1))]
+        lines.append(','.join(csv_field(f) for f in fields))
+    eol = rng.choice(['\n', '\r\n', '\r'])
+    return eol.join(lines) + rng.choice(['', eol, eol + eol])
+
+
+def _random_value(rng, depth=0):
+    kind = rng.randrange(8 if depth < 2 else 6)
+    if kind == 0:
+        return None
+    if kind == 1:
+        return rng.random() < 0.5
+    if kind == 2:
+        return rng.choice([0, -1, 7, 2 ** 53 + 1, 12345678901234567890, 10 ** 21, -10 ** 25])
+    if kind == 3:
+        return rng.choice([0.1, -0.0, 1e21, 1.5e-7, 1e-6, 123.456, 5e-324, 1.7976931348623157e308,
+                           rng.uniform(-1e6, 1e6), rng.gauss(0, 1) * 10 ** rng.randint(-30, 30)])
+    if kind in (4, 5):
+        return ''.join(rng.choice(['a', ' ', ',', '"', '\n', '\r', '\\', '/', 'é', '😀', '\x01', ' ', '[', '}'])
+                       for _ in range(rng.randint(0, 12)))
+    if kind == 6:
+        return [_random_value(rng, depth + 1) for _ in range(rng.randint(0, 3))]
+    return _random_object(rng, depth + 1)
+
+
+def _random_object(rng, depth=0):
+    keys = ['id', 'name', 'b', 'a', '10', '2', '01', '4294967294', '4294967295', '', 'x,y', '"q"', 'é', '__proto__']
+    return {rng.choice(keys): _random_value(rng, depth) for _ in range(rng.randint(0, 6))}
+
+
+def _random_json(rng):
+    kind = rng.randrange(12)
+    rows = [_random_object(rng) for _ in range(rng.randint(1, 15))]
+    text = json.dumps(rows, ensure_ascii=rng.random() < 0.3, indent=rng.choice([None, 2, '\t']))
+    if kind == 0:
+        return text[:rng.randint(0, len(text))]
+    if kind == 1:
+        return rng.choice(['[]', ' [ ] ', '[1,]', '[,]', '{}', '', '[{"a":1}] x', '[{"a":NaN}]', '[{"a":1},2]',
+                           '[{"a":1}}', '["a"]', '[null]', '[{"a":01}]', '\ufeff[{"a":"bom"}]'])
+    return text
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8'));
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+(async () => {
+    const results = [];
+    for (const { path, kind, pieces, stream } of cases) {
+        if (stream) {
+            // The worker's path: bytes through Blob.stream() and TextDecoder
+            try {
+                const { blob, rows } = await convertDataFile(new Blob([fs.readFileSync(path)]), kind);
+                results.push([await blob.text(), rows]);
+            } catch (error) {
+                results.push({ error: error.message });
+            }
+            continue;
+        }
+        const parts = [];
+        const converter = kind === 'csv-to-json' ? createCsvToJson(text => parts.push(text)) : createJsonToCsv(text => parts.push(text));
+        // TextDecoder drops a byte order mark; readFileSync does not
+        const data = fs.readFileSync(path, 'utf8').replace(/^\uFEFF/, '');
+        try {
+            let offset = 0;
+            for (const size of pieces) {
+                converter.feed(data.slice(offset, offset + size));
+                offset += size;
+            }
+            converter.feed(data.slice(offset));
+            const rows = converter.end();
+            results.push([parts.join(''), rows]);
+        } catch (error) {
+            results.push({ error: error.message });
+        }
+    }
+    process.stdout.write(JSON.stringify(results));
+})();
+"""
+
+
+def parity(count=1000):
+    """Run data-convert.js under Node on random CSV and JSON, fed in random-sized pieces or streamed as
+    bytes, and require identical output text, row counts and errors. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    rng = random.Random(21)
+    directory = tempfile.mkdtemp()
+    try:
+        cases = []
+        for i in range(count):
+            kind = 'csv-to-json' if i % 2 == 0 else 'json-to-csv'
+            path = os.path.join(directory, f'{i}.txt')
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(_random_csv(rng) if kind == 'csv-to-json' else _random_json(rng))
+            pieces = [rng.randint(1, 20) for _ in range(rng.randint(0, 40))]
+            cases.append({'path': path, 'kind': kind, 'pieces': pieces, 'stream': i % 5 == 0})
+        cases_file = os.path.join(directory, 'cases.json')
+        with open(cases_file, 'w', encoding='utf-8') as f:
+            json.dump(cases, f)
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                          *DATA_CONVERT_JS.split('/')), cases_file],
+                                   capture_output=True, text=True, check=True)
+        mismatches = 0
+        for case, js in zip(cases, json.loads(completed.stdout)):
+            output = os.path.join(directory, 'output')
+            try:
+                # A different chunk size than the JS pieces, so both sides split the text differently
+                rows = convert_file(case['path'], output, case['kind'], chunk_chars=rng.randint(1, 64))
+                with open(output, 'r', encoding='utf-8', newline='') as f:
+                    ours = [f.read(), rows]
+            except ValueError as e:
+                ours = {'error': str(e)}
+            if js != ours:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   {case['path']} ({case['kind']}): js {str(js)[:200]}, python {str(ours)[:200]}")
+    finally:
+        shutil.rmtree(directory)
+    print(f"{'✅' if not mismatches else '❌'} {count - mismatches}/{count} conversions match {DATA_CONVERT_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, path, kind, mode] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8'));
+const seconds = (start) => Number(process.hrtime.bigint() - start) / 1e9;
+(async () => {
+    const start = process.hrtime.bigint();
+    let size;
+    if (mode === 'stream') {
+        // A file-backed Blob, like the File the page hands to the worker
+        const { blob } = await convertDataFile(await fs.openAsBlob(path), kind);
+        size = blob.size;
+    } else if (kind === 'csv-to-json') {
+        // The previous convertors.html code: split into lines, build every object, stringify at once
+        const lines = fs.readFileSync(path, 'utf8').split('\n').filter(line => line.trim());
+        const headers = lines[0].split(',').map(h => h.trim());
+        const result = [];
+        for (let i = 1; i < lines.length; i++) {
+            const values = lines[i].split(',').map(v => v.trim());
+            const obj = {};
+            headers.forEach((header, index) => { obj[header] = values[index] || ''; });
+            result.push(obj);
+        }
+        size = JSON.stringify(result, null, 2).length;
+    } else {
+        const data = JSON.parse(fs.readFileSync(path, 'utf8'));
+        const headers = Object.keys(data[0]);
+        const csvLines = [headers.join(',')];
+        data.forEach(row => csvLines.push(headers.map(header => `"${row[header] || ''}"`).join(',')));
+        size = csvLines.join('\n').length;
+    }
+    process.stdout.write(JSON.stringify({ seconds: seconds(start), size, maxRSS: process.resourceUsage().maxRSS }));
+})();
+"""
+
+
+def _write_benchmark_csv(path, rows):
+    rng = random.Random(21)
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        f.write('id,name,city,amount,note\r\n')
+        for i in range(rows):
+            note = rng.choice(['', 'paid', '"late, again"', 'split\nline', 'ok'])
+            f.write(f"{i},user{rng.randrange(10 ** 6)},{rng.choice(['Paris', 'Lahore', 'Austin'])},"
+                    f"{rng.uniform(0, 1000):.2f},{note}\r\n")
+
+
+def benchmark(rows=200000):
+    """Time CSV -> JSON -> CSV on a generated file of `rows` rows through data_convert.py, through
+    data-convert.js and through the code convertors.html used before."""
+    node = shutil.which('node')
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), *DATA_CONVERT_JS.split('/'))
+    directory = tempfile.mkdtemp()
+    try:
+        csv_path = os.path.join(directory, 'rows.csv')
+        json_path = os.path.join(directory, 'rows.json')
+        _write_benchmark_csv(csv_path, rows)
+        for kind, path, output in [('csv-to-json', csv_path, json_path),
+                                   ('json-to-csv', json_path, os.path.join(directory, 'back.csv'))]:
+            size = os.path.getsize(path) / 1024 / 1024
+            start = time.perf_counter()
+            convert_file(path, output, kind)
+            print(f"{kind}: {rows:,} rows, {size:.1f} MB in")
+            print(f"  Python: {time.perf_counter() - start:.2f}s")
+            if not node:
+                continue
+            for mode, label in [('stream', 'data-convert.js, streamed'), ('naive', 'previous page code')]:
+                completed = subprocess.run([node, '-e', _BENCHMARK_JS, source, path, kind, mode],
+                                           capture_output=True, text=True)
+                if completed.returncode:
+                    print(f"  JavaScript ({label}): fails ({completed.stderr.strip().splitlines()[-1]})")
+                    continue
+                js = json.loads(completed.stdout)
+                print(f"  JavaScript ({label}): {js['seconds']:.2f}s, peak memory {js['maxRSS'] / 1024:.0f} MB")
+        if node:
+            print("(Node keeps the output Blob in memory; browsers move large Blobs to disk)")
+    finally:
+        shutil.rmtree(directory)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming CSV <-> JSON conversion for large files.")
+    parser.add_argument('file', nargs='?', help="a .csv file (converted to JSON) or a .json array of objects (to CSV)")
+    parser.add_argument('-o', '--output', help="output file (default: the input with the other extension)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/data-convert.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark a file of N rows")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if not args.file:
+        parse_args(['--help'])
+    root, extension = os.path.splitext(args.file)
+    if extension.lower() not in KINDS:
+        print(f"❌ {args.file}: expected a .csv or .json file")
+        sys.exit(1)
+    kind, output_extension = KINDS[extension.lower()]
+    output = args.output or root + output_extension
+    start = time.perf_counter()
+    try:
+        rows = convert_file(args.file, output, kind)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(f"✅ {rows:,} rows -> {output} ({time.perf_counter() - start:.2f}s)")
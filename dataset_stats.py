@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+One-pass descriptive statistics for datasets of any length.
+
+The same algorithms back the statistics calculator through
+assets/js/statistics.js: values are read a chunk at a time and pushed one by
+one into Welford's mean and variance, running extremes and a hashed frequency
+count for the mode. The values are kept as packed float64 for the median and
+percentiles, which are exact order statistics. Numbers are read from the text
+exactly as the calculator reads them, so both produce identical numbers.
+
+    python dataset_stats.py values.csv
+    python dataset_stats.py values.txt --percentiles 1,50,99 --json
+"""
+
+import os
+import re
+import sys
+import json
+import math
+import time
+import array
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+STATISTICS_JS = 'assets/js/statistics.js'
+
+CHUNK_CHARS = 4 * 1024 * 1024
+PERCENTILES = [5, 25, 50, 75, 95]
+
+# Separators are commas, semicolons and whitespace as JavaScript's \s defines it
+_SEPARATORS = re.compile('[,;\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]+')
+# Leading number in a token: what parseFloat reads when the result is finite
+_NUMBER = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+class Statistics:
+    """Welford mean and variance, extremes and mode counts, updated one value at a time."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.values = array.array('d')
+        self.frequency = {}
+        self._sorted = None
+
+    def push(self, x):
+        self.values.append(x)
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        # x != x: a NaN value makes the extremes NaN, as in the JS accumulator
+        if x < self.min or x != x:
+            self.min = x
+        if x > self.max or x != x:
+            self.max = x
+        # Count -0.0 as 0.0, the way a JavaScript Map keys it
+        key = x + 0.0
+        self.frequency[key] = self.frequency.get(key, 0) + 1
+        self._sorted = None
+
+    def variance(self):
+        return self.m2 / self.count
+
+    def sample_variance(self):
+        return self.m2 / (self.count - 1)
+
+    def select(self, k):
+        """The k-th smallest value (0-based); -0.0 and 0.0 tie, so both read as 0.0."""
+        if self._sorted is None:
+            if np is not None:
+                self._sorted = np.sort(np.frombuffer(self.values, dtype=np.float64))
+            else:
+                self._sorted = sorted(self.values)
+        return float(self._sorted[k]) + 0.0
+
+    def median(self):
+        n = self.count
+        return (self.select(n // 2 - 1) + self.select(n // 2)) / 2 if n % 2 == 0 else self.select((n - 1) // 2)
+
+    def percentile(self, p):
+        """Linear interpolation between closest ranks (the common 'type 7' definition)."""
+        h = (self.count - 1) * p / 100
+        lower = math.floor(h)
+        low = self.select(lower)
+        return low + (h - lower) * (self.select(lower + 1) - low) if lower + 1 < self.count else low
+
+    def modes(self):
+        """Most frequent values, ascending, and their count."""
+        best = max(self.frequency.values(), default=0)
+        return sorted(value for value, count in self.frequency.items() if count == best), best
+
+
+class NumberParser:
+    """Feed text in pieces of any size; a number cut by a piece boundary is completed by the next piece."""
+
+    def __init__(self, on_value):
+        self.on_value = on_value
+        self.carry = ''
+
+    def _token(self, text):
+        match = _NUMBER.match(text)
+        if match:
+            value = float(match.group())
+            if math.isfinite(value):
+                self.on_value(value)
+
+    def feed(self, text):
+        tokens = _SEPARATORS.split(self.carry + text)
+        self.carry = tokens.pop()
+        for token in tokens:
+            self._token(token)
+
+    def end(self):
+        self._token(self.carry)
+        self.carry = ''
+
+
+def statistics_from_file(path, chunk_chars=CHUNK_CHARS):
+    stats = Statistics()
+    parser = NumberParser(stats.push)
+    # utf-8-sig and errors='replace' decode the way the browser's TextDecoder does
+    with open(path, 'r', encoding='utf-8-sig', errors='replace', newline='') as f:
+        while True:
+            text = f.read(chunk_chars)
+            if not text:
+                break
+            parser.feed(text)
+    parser.end()
+    return stats
+
+
+def summary(stats, percentiles=PERCENTILES):
+    """The numbers the calculator reports, as a dict."""
+    if stats.count == 0:
+        return {'count': 0}
+    mode_values, mode_count = stats.modes()
+    return {
+        'count': stats.count,
+        'mean': stats.mean,
+        'median': stats.median(),
+        'mode': mode_values,
+        'mode_count': mode_count,
+        'variance': stats.variance(),
+        'std_dev': math.sqrt(stats.variance()),
+        'sample_variance': stats.sample_variance() if stats.count > 1 else None,
+        'min': stats.min,
+        'max': stats.max,
+        'range': stats.max - stats.min,
+        'percentiles': {str(p): stats.percentile(p) for p in percentiles},
+    }
+
+
+def _number(value):
+    """A value as the calculator prints it: 2 rather than 2.0."""
+    return str(int(value)) if value.is_integer() and abs(value) < 1e21 else repr(value)
+
+
+def format_summary(result):
+    if not result['count']:
+        return "❌ No numeric values found"
+    modes = result['mode']
+    mode = ', '.join(_number(v) for v in modes[:10]) + (f", … ({len(modes)} values tie)" if len(modes) > 10 else '')
+    lines = [
+        f"Count: {result['count']:,}",
+        f"Mean: {result['mean']:.4f}",
+        f"Median: {result['median']:.4f}",
+        f"Mode: {mode} ({result['mode_count']:,} times)",
+        f"Range: {result['range']:.4f}",
+        f"Variance: {result['variance']:.4f}",
+        f"Standard Deviation: {result['std_dev']:.4f}",
+    ]
+    lines += [f"P{p}: {value:.4f}" for p, value in result['percentiles'].items()]
+    lines += [f"Minimum: {_number(result['min'])}", f"Maximum: {_number(result['max'])}"]
+    return '\n'.join(lines)
+
+
+def _random_dataset(rng, count):
+    """Text exercising the parser: mixed separators, exponents, signs, junk tokens, ties and -0."""
+    kind = rng.randrange(4)
+    tokens = []
+    for _ in range(count):
+        if kind == 0:
+            value = repr(rng.gauss(0, 1e3))
+        elif kind == 1:
+            value = str(rng.randint(-20, 20))
+        elif kind == 2:
+            value = f"{rng.uniform(-1, 1):.{rng.randint(0, 3)}e}"
+        else:
+            value = rng.choice(['-0', '0', '.5', '-.5', '5.', '1e3', '12abc', 'abc', '', '+7', '1e', 'NaN',
+                                'Infinity', repr(rng.random())])
+        tokens.append(value)
+    separators = [',', ', ', ';', '\n', '\r\n', ' ', '\t', ',\n', '\u00a0', '\u3000']
+    return ''.join(token + rng.choice(separators) for token in tokens)[:-1]
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+const text = (v) => (Object.is(v, -0) ? '-0' : String(v));
+process.stdout.write(JSON.stringify(cases.map(({ path, pieces, modeKeys }) => {
+    // A small STATISTICS_MODE_KEYS exercises the sorted fallback for the mode
+    const context = vm.createContext({ TextDecoder });
+    vm.runInContext(fs.readFileSync(source, 'utf8').replace(/const STATISTICS_MODE_KEYS = [^;]+;/,
+        `const STATISTICS_MODE_KEYS = ${modeKeys};`) + ';this.s = { createStatistics, createNumberParser };', context);
+    const stats = context.s.createStatistics();
+    const parser = context.s.createNumberParser(x => stats.push(x));
+    const data = fs.readFileSync(path, 'utf8');
+    let offset = 0;
+    for (const size of pieces) {
+        parser.feed(data.slice(offset, offset + size));
+        offset += size;
+    }
+    parser.feed(data.slice(offset));
+    parser.end();
+    if (stats.count === 0) return [0];
+    const modes = stats.modes();
+    return [stats.count, text(stats.mean), text(stats.variance()), text(stats.min), text(stats.max),
+            text(stats.median()), [5, 25, 50, 75, 95].map(p => text(stats.percentile(p))),
+            modes.values.map(text), modes.count];
+})));
+"""
+
+
+def parity(count=200):
+    """Run statistics.js under Node on random datasets, fed in random-sized pieces, and require
+    bit-identical counts, moments, extremes, median, percentiles and modes. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    rng = random.Random(17)
+    directory = tempfile.mkdtemp()
+    try:
+        cases = []
+        for i in range(count):
+            path = os.path.join(directory, f'{i}.txt')
+            data = _random_dataset(rng, rng.choice([1, 2, 3, 10, 100, 1000, 5000]))
+            with open(path, 'w', encoding='utf-8', newline='') as f:
+                f.write(data)
+            pieces = [rng.randint(1, 50) for _ in range(rng.randint(0, 50))]
+            cases.append({'path': path, 'pieces': pieces, 'modeKeys': 16 if i % 3 == 0 else 1 << 22})
+        cases_file = os.path.join(directory, 'cases.json')
+        with open(cases_file, 'w', encoding='utf-8') as f:
+            json.dump(cases, f)
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                          *STATISTICS_JS.split('/')), cases_file],
+                                   capture_output=True, text=True, check=True)
+        mismatches = 0
+        for case, js in zip(cases, json.loads(completed.stdout)):
+            # A different chunk size than the JS pieces, so both sides split numbers differently
+            stats = statistics_from_file(case['path'], chunk_chars=rng.randint(1, 64))
+            if stats.count == 0:
+                ours = [0]
+            else:
+                modes, mode_count = stats.modes()
+                ours = [stats.count, repr(stats.mean), repr(stats.variance()), repr(stats.min), repr(stats.max),
+                        repr(stats.median()), [repr(stats.percentile(p)) for p in PERCENTILES],
+                        [repr(v) for v in modes], mode_count]
+            if len(js) > 1:
+                js = [js[0]] + [repr(float(v)) for v in js[1:6]] + [[repr(float(v)) for v in js[6]],
+                                                                    [repr(float(v)) for v in js[7]], js[8]]
+            if js != ours:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   {case['path']}: js {js[:6]}, python {ours[:6]}")
+    finally:
+        shutil.rmtree(directory)
+    print(f"{'✅' if not mismatches else '❌'} {count - mismatches}/{count} datasets match {STATISTICS_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, path] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8') + ';globalThis.statisticsFromFile = statisticsFromFile;');
+const seconds = (start) => Number(process.hrtime.bigint() - start) / 1e9;
+(async () => {
+    const file = new Blob([fs.readFileSync(path)]);
+    let start = process.hrtime.bigint();
+    const stats = await statisticsFromFile(file);
+    const read = seconds(start);
+    start = process.hrtime.bigint();
+    stats.median();
+    [5, 25, 50, 75, 95].forEach(p => stats.percentile(p));
+    stats.modes();
+    const order = seconds(start);
+
+    // The previous implementation: split, sorted copy, string-keyed frequencies, reduce and spread
+    let naive;
+    start = process.hrtime.bigint();
+    try {
+        const data = fs.readFileSync(path, 'utf8').split(',').map(x => parseFloat(x.trim())).filter(x => !isNaN(x));
+        const sortedData = [...data].sort((a, b) => a - b);
+        const mean = data.reduce((sum, x) => sum + x, 0) / data.length;
+        const frequency = {};
+        data.forEach(x => frequency[x] = (frequency[x] || 0) + 1);
+        const maxFreq = Math.max(...Object.values(frequency));
+        const variance = data.reduce((sum, x) => sum + Math.pow(x - mean, 2), 0) / data.length;
+        const range = Math.max(...data) - Math.min(...data);
+        naive = seconds(start);
+    } catch (e) {
+        naive = e.constructor.name + ': ' + e.message;
+    }
+    process.stdout.write(JSON.stringify({ count: stats.count, read, order, naive }));
+})();
+"""
+
+
+def benchmark(count=1000000):
+    """Time a file of `count` values through dataset_stats.py and statistics.js, and through the
+    calculator's previous implementation."""
+    rng = random.Random(17)
+    with tempfile.NamedTemporaryFile('w', suffix='.csv', delete=False, encoding='utf-8') as f:
+        for start in range(0, count, 100000):
+            f.write(','.join(f"{rng.gauss(100, 15):.2f}" for _ in range(min(100000, count - start))))
+            if start + 100000 < count:
+                f.write(',')
+        path = f.name
+    try:
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"{count:,} values ({size:.1f} MB of CSV)")
+        start = time.perf_counter()
+        stats = statistics_from_file(path)
+        read = time.perf_counter() - start
+        start = time.perf_counter()
+        summary(stats)
+        order = time.perf_counter() - start
+        backend = f"NumPy {np.__version__}" if np is not None else "pure Python (NumPy not installed)"
+        print(f"  Python, {backend}: one pass {read:.2f}s, median/percentiles/mode {order:.2f}s")
+        node = shutil.which('node')
+        if node:
+            completed = subprocess.run([node, '-e', _BENCHMARK_JS, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                                *STATISTICS_JS.split('/')), path],
+                                       capture_output=True, text=True, check=True)
+            js = json.loads(completed.stdout)
+            print(f"  JavaScript (statistics.js, file read in chunks): one pass {js['read']:.2f}s, "
+                  f"median/percentiles/mode {js['order']:.2f}s")
+            naive = js['naive']
+            print(f"  JavaScript (previous calculator code): "
+                  f"{f'{naive:.2f}s' if isinstance(naive, float) else f'fails with {naive}'}")
+    finally:
+        os.remove(path)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="One-pass descriptive statistics for large datasets.")
+    parser.add_argument('file', nargs='?', help="text or CSV file of numbers (commas, semicolons or whitespace)")
+    parser.add_argument('--percentiles', default=','.join(map(str, PERCENTILES)),
+                        help="comma-separated percentiles to report (default 5,25,50,75,95)")
+    parser.add_argument('--json', action='store_true', help="print the summary as JSON")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/statistics.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark a file of N values")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if not args.file:
+        parse_args(['--help'])
+    try:
+        percentiles = [float(p) for p in args.percentiles.split(',')]
+        if any(not 0 <= p <= 100 for p in percentiles):
+            raise ValueError("percentiles must be between 0 and 100")
+        result = summary(statistics_from_file(args.file), [int(p) if p.is_integer() else p for p in percentiles])
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+    print(json.dumps(result) if args.json else format_summary(result))
+    if not result['count']:
+        sys.exit(1)
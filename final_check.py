@@ -6,6 +6,8 @@ Final verification and cleanup before GitHub deployment
 import os
 from pathlib import Path
 
+from calc_registry import URL_MAPPING
+
 def main():
     base_path = Path(__file__).parent
     
@@ -41,12 +43,7 @@ def main():
     
     print()
     print("📁 CALCULATOR CATEGORIES:")
-    categories = [
-        'financial-calculators', 'math-calculators', 'health-calculators',
-        'crypto-calculators', 'physics-calculators', 'chemistry-calculators',
-        'engineering-calculators', 'construction-calculators', 'conversion-tools',
-        'business-calculators', 'time-calculators', 'utility-tools'
-    ]
+    categories = list(URL_MAPPING.values())
     
     all_categories_present = True
     for category in categories:
@@ -91,7 +88,23 @@ def main():
     scripts = {
         'generate_pages.py': 'Generate calculator pages',
         'generate_sitemap.py': 'Generate sitemap',
-        'verify_files.py': 'Verify file structure'
+        'build_blog.py': 'Static blog article pages and paginated article index',
+        'generate_calculator_modules.py': 'Split calculators.js into modules',
+        'build_assets.py': 'Minify and fingerprint JS/CSS',
+        'critical_css.py': 'Critical CSS for generated pages',
+        'amortization.py': 'Batch loan and investment pricing',
+        'unit_conversion.py': 'Unit conversion tables and bulk conversion',
+        'indicators.py': 'Streaming price indicators',
+        'options.py': 'Option pricing, Greeks and implied volatility',
+        'primes.py': 'Primality testing, factorization and prime sieving',
+        'matrix.py': 'Dense linear algebra (LU, inverse, solve, rank)',
+        'dataset_stats.py': 'One-pass statistics for large datasets',
+        'data_convert.py': 'Streaming CSV <-> JSON conversion',
+        'hash_files.py': 'One-pass MD5/SHA-1/SHA-256/SHA-512 file hashing',
+        'search_index.py': 'Calculator search index and ranked, typo-tolerant lookup',
+        'static_server.py': 'Static file server with caching and clean URLs',
+        'verify_files.py': 'Verify file structure',
+        'calc_registry.py': 'Shared calculator registry'
     }
     
     for script, desc in scripts.items():
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Split assets/js/calculators.js into one lazily loaded module per calculator.
+
+calculators.js stays the file developers edit. This script emits:
+  - assets/js/calculators/<id>.js: one registerCalculator() call per calculator
+  - assets/js/calculators-index.js: titles, icons and toolCategories only
+  - assets/js/search-index.js: the search box's term index (see search_index.py)
+
+index.html loads the small index; main.js fetches a calculator's module the
+first time showCalculator() opens it, and the search index the first time the
+search box is used. The script reports the JS bytes each
+route ships before (full calculators.js) and after the split.
+"""
+
+import os
+import gzip
+import json
+import argparse
+
+from build_io import write_if_changed
+from calc_registry import CALCULATORS_JS, MAIN_JS, load_registry
+from search_index import SEARCH_INDEX_JS, build_search_index, search_index_js
+
+MODULES_DIR = 'assets/js/calculators'
+INDEX_JS = 'assets/js/calculators-index.js'
+
+GENERATED_HEADER = '// Generated by generate_calculator_modules.py from assets/js/calculators.js - do not edit\n'
+
+
+def module_js(calc_id, source):
+    """Wrap a calculator's object literal in a registerCalculator() call."""
+    return f"{GENERATED_HEADER}registerCalculator({json.dumps(calc_id)}, {source});\n"
+
+
+def index_js(registry):
+    """Render the index of ids, titles and icons used before any module is loaded."""
+    lines = [GENERATED_HEADER, 'const calculators = {\n']
+    entries = [f"    {json.dumps(calc_id)}: {json.dumps({'title': calc['title'], 'icon': calc['icon']}, ensure_ascii=False)}"
+               for calc_id, calc in registry['calculators'].items()]
+    lines.append(',\n'.join(entries))
+    lines.append('\n};\n\n')
+    lines.append(f"const toolCategories = {json.dumps(registry['categories'], indent=4)};\n")
+    return ''.join(lines)
+
+
+def _sizes(data):
+    return len(data), len(gzip.compress(data, mtime=0))
+
+
+def report_route_bytes(base_path, outputs, show_routes=False):
+    """Print the JS bytes (raw / gzip) shipped per route before and after the split."""
+    def read(rel_path):
+        with open(os.path.join(base_path, *rel_path.split('/')), 'rb') as f:
+            return f.read()
+
+    main = read(MAIN_JS)
+    before = _sizes(main + read(CALCULATORS_JS))
+    index = outputs[INDEX_JS]
+    shell = _sizes(main + index)
+
+    routes = []
+    for rel_path, data in outputs.items():
+        if not rel_path.startswith(MODULES_DIR + '/'):
+            continue
+        calc_id = os.path.basename(rel_path)[:-3]
+        routes.append((calc_id, _sizes(main + index + data)))
+
+    def fmt(sizes):
+        return f"{sizes[0] / 1024:7.1f} KB ({sizes[1] / 1024:5.1f} KB gzip)"
+
+    print("\nJS bytes shipped per route (main.js + calculator code):")
+    print(f"  Before, every route:        {fmt(before)}")
+    print(f"  After, home/category pages: {fmt(shell)}")
+    if routes:
+        raw = sorted(sizes[0] for _, sizes in routes)
+        zipped = sorted(sizes[1] for _, sizes in routes)
+        median = len(routes) // 2
+        largest = max(routes, key=lambda route: route[1][0])
+        print(f"  After, median calculator:   {fmt((raw[median], zipped[median]))}")
+        print(f"  After, largest calculator:  {fmt(largest[1])} [{largest[0]}]")
+    if show_routes:
+        for calc_id, sizes in sorted(routes):
+            print(f"    {calc_id:<32} {fmt(sizes)}")
+
+
+def main(show_routes=False):
+    """Emit the per-calculator modules and the index."""
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    registry = load_registry(base_path)
+    with open(os.path.join(base_path, *CALCULATORS_JS.split('/')), 'r', encoding='utf-8') as f:
+        source = f.read()
+
+    outputs = {
+        INDEX_JS: index_js(registry).encode('utf-8'),
+        SEARCH_INDEX_JS: search_index_js(build_search_index(registry['calculators'], registry['categories']),
+                                         GENERATED_HEADER).encode('utf-8'),
+    }
+    for calc_id, calc in registry['calculators'].items():
+        start, end = calc['value_span']
+        outputs[f'{MODULES_DIR}/{calc_id}.js'] = module_js(calc_id, source[start:end]).encode('utf-8')
+
+    written = 0
+    for rel_path, data in outputs.items():
+        if write_if_changed(os.path.join(base_path, *rel_path.split('/')), data):
+            written += 1
+            print(f"Created: {rel_path}")
+
+    # Remove modules of calculators that no longer exist
+    deleted = 0
+    modules_dir = os.path.join(base_path, *MODULES_DIR.split('/'))
+    for name in sorted(os.listdir(modules_dir)):
+        if name.endswith('.js') and f'{MODULES_DIR}/{name}' not in outputs:
+            os.remove(os.path.join(modules_dir, name))
+            deleted += 1
+            print(f"Deleted: {MODULES_DIR}/{name}")
+
+    print(f"\nCalculator modules: {len(outputs) - 2}")
+    print(f"Files written: {written}, unchanged: {len(outputs) - written}, deleted: {deleted}")
+    report_route_bytes(base_path, outputs, show_routes)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Split calculators.js into per-calculator modules.")
+    parser.add_argument('--routes', action='store_true',
+                        help="list the JS bytes shipped for every calculator route")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    main(show_routes=args.routes)
@@ -2,105 +2,42 @@
 """
 Generate individual HTML pages for each calculator to make them indexable by Google.
 This script creates SEO-friendly pages that redirect via JavaScript after page load.
+With --prerender, calculator pages instead ship the calculator's form and code
+so a deep link works without loading index.html.
 """
 
 import os
+import sys
 import json
+import hashlib
+import argparse
+import time
+import html
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 
-# URL mapping (matches main.js)
-URL_MAPPING = {
-    'financial': 'financial-calculators',
-    'math': 'math-calculators',
-    'health': 'health-calculators',
-    'crypto': 'crypto-calculators',
-    'physics': 'physics-calculators',
-    'chemistry': 'chemistry-calculators',
-    'engineering': 'engineering-calculators',
-    'construction': 'construction-calculators',
-    'conversion': 'conversion-tools',
-    'business': 'business-calculators',
-    'time': 'time-calculators',
-    'utility': 'utility-tools'
-}
+from build_assets import load_asset_manifest, asset_url, minify_js
+from build_io import write_atomic, write_if_changed
+from critical_css import blocking_links, stylesheet_block, print_report, inline_css
+from calc_registry import URL_MAPPING, TOOL_CATEGORIES, CATEGORY_TITLES, CALCULATORS, CALCULATORS_JS
+from generate_calculator_modules import module_js
+from page_templates import (CALCULATOR_PAGE, CATEGORY_PAGE, TOOL_LINK, PRERENDERED_PAGE, CALCULATOR_FORM,
+                            FORM_FIELD, FORM_INPUT, FORM_FILE, FORM_SELECT, FORM_OPTION)
 
-# Tool categories (matches calculators.js)
-TOOL_CATEGORIES = {
-    'financial': ['loan', 'mortgage', 'compound-interest', 'investment', 'savings'],
-    'math': [
-        'percentage', 'fraction', 'algebra', 'quadratic', 'trigonometry', 
-        'scientific-calculator', 'statistics-calculator', 'matrix-calculator', 
-        'geometry-calculator', 'calculus-calculator', 'number-theory', 
-        'probability-calculator', 'complex-numbers', 'sequence-series', 
-        'logarithm-calculator', 'polynomial-calculator', 'binary-calculator',
-        'windows-calculator'
-    ],
-    'health': [
-        'bmi', 'calorie', 'body-fat', 'ideal-weight', 'water-intake',
-        'heart-rate-zone', 'vo2-max', 'pregnancy-due-date', 'ovulation', 'bmi-children',
-        'macro-calculator', 'protein-intake', 'body-measurement', 'sleep-calculator', 'hydration-status',
-        'fitness-level', 'workout-intensity', 'recovery-calculator', 'training-load', 'body-age',
-        'bmr', 'waist-hip-ratio', 'target-heart-rate', 'body-surface-area', 'lean-body-mass',
-        'resting-energy', 'weight-loss-planner', 'blood-alcohol', 'blood-pressure', 'blood-sugar',
-        'body-fat-distribution', 'exercise-calories', 'macros-converter', 'meal-planner', 'muscle-mass'
-    ],
-    'crypto': [
-        'crypto-profit', 'crypto-leverage-liquidation', 'crypto-futures-pnl',
-        'crypto-lending-returns', 'crypto-compound-yield', 'crypto-rebalancing',
-        'crypto-stop-loss', 'crypto-correlation', 'crypto-volume-analysis',
-        'crypto-position-size', 'crypto-funding-rate', 'crypto-drawdown',
-        'crypto-swing-trade', 'crypto-accumulation', 'crypto-volatility',
-        'crypto-dca', 'crypto-mining', 'crypto-converter', 'impermanent-loss',
-        'staking-rewards', 'crypto-arbitrage', 'crypto-yield-farming',
-        'crypto-bridge-fees', 'crypto-tax-calculator', 'crypto-hodl-calculator',
-        'crypto-rainbow-chart', 'crypto-fear-greed', 'crypto-hash-rate',
-        'crypto-whale-tracker', 'crypto-flash-loan', 'crypto-liquidity-pool',
-        'crypto-options-pricing', 'crypto-defi-yield', 'crypto-nft-valuation',
-        'crypto-gas-optimizer', 'crypto-portfolio-tracker', 'crypto-leverage-calculator',
-        'crypto-sharpe-ratio', 'crypto-dollar-hedge', 'crypto-momentum-indicator',
-        'crypto-technical-levels', 'crypto-altcoin-season', 'crypto-market-cap-calc',
-        'crypto-pairs-trading', 'crypto-grid-trading', 'crypto-rsi-calculator',
-        'crypto-funding-arbitrage', 'crypto-volatility-smile', 'crypto-carry-trade',
-        'crypto-basis-trading', 'crypto-social-sentiment'
-    ],
-    'physics': ['velocity', 'energy', 'force', 'momentum', 'power'],
-    'chemistry': ['molarity', 'ph', 'molecular-weight', 'gas-laws', 'stoichiometry'],
-    'engineering': [
-        'ohms-law', 'power-consumption', 'resistor-color', 'voltage-divider', 'capacitor',
-        'transformer-turns', 'inductor-reactance', 'rc-time-constant', 'rlc-resonance',
-        'parallel-resistance', 'series-resistance', 'power-factor', 'three-phase-power',
-        'wire-gauge', 'led-resistor', 'antenna-length', 'decibel-converter',
-        'impedance-matching', 'filter-frequency', 'amplifier-gain', 'beam-deflection',
-        'gear-ratio', 'pulley-system', 'hydraulic-pressure', 'spring-constant',
-        'thermal-expansion', 'motor-efficiency', 'pipe-flow'
-    ],
-    'construction': ['concrete', 'paint', 'brick', 'roof-pitch', 'flooring'],
-    'conversion': [
-        'length', 'temperature', 'weight', 'area', 'volume', 'speed',
-        'pressure', 'energy-conversion', 'power-conversion', 'data-storage',
-        'angle', 'time-conversion', 'frequency', 'currency', 'fuel-economy-conversion',
-        'density', 'force-conversion', 'luminosity', 'magnetic-field', 'radioactivity', 'torque'
-    ],
-    'business': ['roi', 'break-even', 'markup', 'payroll', 'cash-flow'],
-    'time': ['age', 'date-difference', 'time-zone', 'working-days', 'countdown'],
-    'utility': ['grade', 'fuel-economy', 'password-strength', 'random-number', 'color-picker']
-}
+# Bump whenever the page templates below change so incremental builds re-render every page
+TEMPLATE_VERSION = '6'
 
-# Category titles
-CATEGORY_TITLES = {
-    'financial': 'Financial Calculators',
-    'math': 'Mathematics Calculators',
-    'health': 'Health & Fitness Calculators',
-    'crypto': 'Cryptocurrency Calculators',
-    'physics': 'Physics Calculators',
-    'chemistry': 'Chemistry Calculators',
-    'engineering': 'Engineering Calculators',
-    'construction': 'Construction Calculators',
-    'conversion': 'Unit Conversion Tools',
-    'business': 'Business Calculators',
-    'time': 'Date & Time Calculators',
-    'utility': 'Utility Tools'
-}
+# Build manifest storing the input fingerprint of every generated page
+MANIFEST_FILE = '.build-manifest.json'
+
+# Stylesheet URL, fingerprinted once build_assets.py has written the asset manifest
+STYLE_CSS = asset_url(load_asset_manifest(os.path.dirname(os.path.abspath(__file__))), 'assets/css/style.css')
+
+# Script inlined into prerendered pages ahead of the calculator's own module
+PRERENDER_RUNTIME_JS = 'assets/js/calculator-page.js'
+
+# The page whose inline <style> holds the calculator form styles
+APP_PAGE = 'index.html'
 
 def format_calculator_name(calc_id):
     """Convert calculator ID to readable name."""
@@ -109,324 +46,360 @@ def format_calculator_name(calc_id):
     # Replace hyphens with spaces and capitalize
     return ' '.join(word.capitalize() for word in name.split('-'))
 
-def generate_calculator_html(category_key, category_url, calc_id, base_url="https://www.tahir.engineer"):
+def generate_calculator_html(category_key, category_url, calc_id, base_url="https://www.tahir.engineer", head_styles=None):
     """Generate HTML page for a single calculator."""
+    if head_styles is None:
+        head_styles = blocking_links(STYLE_CSS)
     calc_name = format_calculator_name(calc_id)
     category_title = CATEGORY_TITLES.get(category_key, 'Calculators')
-    calc_url_path = calc_id
-    
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{calc_name} Calculator | Free Online Tool | CalcHub</title>
-    <meta name="description" content="Free online {calc_name.lower()} calculator. Professional, accurate, and easy-to-use tool for {calc_name.lower()} calculations. Part of CalcHub's collection of 150+ free calculator tools.">
-    <meta name="keywords" content="{calc_name.lower()}, {calc_name.lower()} calculator, online {calc_name.lower()} calculator, free {calc_name.lower()} tool, {category_key} calculator">
-    
-    <!-- Enhanced SEO Meta Tags -->
-    <meta name="author" content="CalcHub - Professional Calculator Tools">
-    <meta name="robots" content="index, follow, max-snippet:-1, max-video-preview:-1, max-image-preview:large">
-    <meta name="googlebot" content="index, follow">
-    <meta name="language" content="English">
-    <meta name="revisit-after" content="7 days">
-    <meta name="rating" content="General">
-    <meta name="distribution" content="Global">
-    
-    <!-- Canonical URL -->
-    <link rel="canonical" href="{base_url}/{category_url}/{calc_url_path}">
-    
-    <!-- Open Graph Meta Tags -->
-    <meta property="og:title" content="{calc_name} Calculator | Free Online Tool | CalcHub">
-    <meta property="og:description" content="Free online {calc_name.lower()} calculator. Professional and accurate tool for all your {calc_name.lower()} calculation needs.">
-    <meta property="og:type" content="website">
-    <meta property="og:url" content="{base_url}/{category_url}/{calc_url_path}">
-    <meta property="og:image" content="{base_url}/assets/images/calchub-og.png">
-    <meta property="og:site_name" content="CalcHub">
-    
-    <!-- Twitter Card Meta Tags -->
-    <meta name="twitter:card" content="summary_large_image">
-    <meta name="twitter:title" content="{calc_name} Calculator | CalcHub">
-    <meta name="twitter:description" content="Free online {calc_name.lower()} calculator. Professional and accurate.">
-    <meta name="twitter:image" content="{base_url}/assets/images/calchub-og.png">
-    
-    <!-- Favicons -->
-    <link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
-    <link rel="icon" type="image/png" sizes="32x32" href="/favicon-32x32.png">
-    <link rel="icon" type="image/png" sizes="16x16" href="/favicon-16x16.png">
-    <link rel="manifest" href="/site.webmanifest">
-    
-    <!-- Structured Data -->
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "WebApplication",
-        "name": "{calc_name} Calculator",
-        "alternateName": "CalcHub {calc_name} Calculator",
-        "url": "{base_url}/{category_url}/{calc_url_path}",
-        "description": "Free online {calc_name.lower()} calculator for accurate and professional calculations.",
-        "applicationCategory": "UtilityApplication",
-        "operatingSystem": "Web Browser",
-        "browserRequirements": "Requires HTML5 support",
-        "offers": {{
-            "@type": "Offer",
-            "price": "0",
-            "priceCurrency": "USD",
-            "availability": "https://schema.org/InStock"
-        }},
-        "isPartOf": {{
-            "@type": "WebSite",
-            "name": "CalcHub",
-            "url": "{base_url}/"
-        }},
-        "breadcrumb": {{
-            "@type": "BreadcrumbList",
-            "itemListElement": [
-                {{
-                    "@type": "ListItem",
-                    "position": 1,
-                    "name": "Home",
-                    "item": "{base_url}/"
-                }},
-                {{
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": "{category_title}",
-                    "item": "{base_url}/{category_url}"
-                }},
-                {{
-                    "@type": "ListItem",
-                    "position": 3,
-                    "name": "{calc_name} Calculator",
-                    "item": "{base_url}/{category_url}/{calc_url_path}"
-                }}
-            ]
-        }}
-    }}
-    </script>
-    
-    <!-- Bootstrap CSS -->
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-    <!-- Font Awesome -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <!-- Google Fonts -->
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@700&display=swap" rel="stylesheet">
-    <!-- Custom CSS -->
-    <link rel="stylesheet" href="/assets/css/style.css">
-    
-    <!-- Redirect Script with Delay for SEO -->
-    <script>
-        // Allow search engines to crawl the page before redirecting
-        setTimeout(function() {{
-            window.location.href = '/?calc={category_key}/{calc_id}';
-        }}, 100);
-    </script>
-</head>
-<body>
-    <!-- Content visible to search engines before redirect -->
-    <div class="container mt-5 pt-5">
-        <div class="text-center">
-            <h1 class="mb-4">{calc_name} Calculator</h1>
-            <p class="lead">Free online {calc_name.lower()} calculator. Professional, accurate, and easy to use.</p>
-            <p>Loading calculator...</p>
-            <div class="spinner-border text-primary mt-3" role="status">
-                <span class="visually-hidden">Loading...</span>
-            </div>
-        </div>
-        
-        <div class="mt-5">
-            <nav aria-label="breadcrumb">
-                <ol class="breadcrumb">
-                    <li class="breadcrumb-item"><a href="/">Home</a></li>
-                    <li class="breadcrumb-item"><a href="/{category_url}">{category_title}</a></li>
-                    <li class="breadcrumb-item active" aria-current="page">{calc_name} Calculator</li>
-                </ol>
-            </nav>
-        </div>
-        
-        <div class="mt-4">
-            <h2>About {calc_name} Calculator</h2>
-            <p>This free online {calc_name.lower()} calculator is part of CalcHub's comprehensive collection of over 150 professional calculator tools. It provides accurate, fast, and reliable calculations for all your {calc_name.lower()} needs.</p>
-            <p><strong>Category:</strong> {category_title}</p>
-            <p><strong>Features:</strong></p>
-            <ul>
-                <li>100% Free to use</li>
-                <li>No registration required</li>
-                <li>Professional and accurate results</li>
-                <li>User-friendly interface</li>
-                <li>Mobile responsive design</li>
-            </ul>
-        </div>
-    </div>
     
-    <!-- Bootstrap JS -->
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>'''
-    
-    return html_content
+    return CALCULATOR_PAGE.render(
+        calc_id=calc_id,
+        calc_name=calc_name,
+        calc_name_lower=calc_name.lower(),
+        category_key=category_key,
+        category_url=category_url,
+        category_title=category_title,
+        base_url=base_url,
+        head_styles=head_styles,
+    )
 
-def generate_category_html(category_key, category_url, base_url="https://www.tahir.engineer"):
+def generate_category_html(category_key, category_url, base_url="https://www.tahir.engineer", tools=None, head_styles=None):
     """Generate HTML page for a category listing."""
+    if head_styles is None:
+        head_styles = blocking_links(STYLE_CSS)
     category_title = CATEGORY_TITLES.get(category_key, 'Calculators')
-    tools = TOOL_CATEGORIES.get(category_key, [])
-    
-    html_content = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{category_title} | Free Online Tools | CalcHub</title>
-    <meta name="description" content="Professional {category_title.lower()} for accurate calculations. Free, fast, and reliable tools. Browse our collection of {len(tools)} calculators.">
-    <meta name="keywords" content="{category_key} calculator, {category_title.lower()}, online {category_key} tools, free calculator">
-    
-    <!-- Enhanced SEO Meta Tags -->
-    <meta name="author" content="CalcHub - Professional Calculator Tools">
-    <meta name="robots" content="index, follow, max-snippet:-1, max-video-preview:-1, max-image-preview:large">
-    <meta name="googlebot" content="index, follow">
-    
-    <!-- Canonical URL -->
-    <link rel="canonical" href="{base_url}/{category_url}">
-    
-    <!-- Open Graph Meta Tags -->
-    <meta property="og:title" content="{category_title} | Free Online Tools | CalcHub">
-    <meta property="og:description" content="Professional {category_title.lower()} for accurate calculations. {len(tools)} free tools available.">
-    <meta property="og:type" content="website">
-    <meta property="og:url" content="{base_url}/{category_url}">
-    <meta property="og:site_name" content="CalcHub">
+    if tools is None:
+        tools = TOOL_CATEGORIES.get(category_key, [])
     
-    <!-- Favicons -->
-    <link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
-    <link rel="icon" type="image/png" sizes="32x32" href="/favicon-32x32.png">
-    <link rel="icon" type="image/png" sizes="16x16" href="/favicon-16x16.png">
+    render_link = TOOL_LINK.render
+    tool_links = ''.join([render_link(category_url=category_url, tool=tool, tool_name=format_calculator_name(tool))
+                          for tool in tools])
     
-    <!-- Structured Data -->
-    <script type="application/ld+json">
-    {{
-        "@context": "https://schema.org",
-        "@type": "CollectionPage",
-        "name": "{category_title}",
-        "description": "Professional {category_title.lower()} for accurate calculations. Free, fast, and reliable tools.",
-        "url": "{base_url}/{category_url}",
-        "isPartOf": {{
-            "@type": "WebSite",
-            "name": "CalcHub",
-            "url": "{base_url}/"
-        }},
-        "breadcrumb": {{
-            "@type": "BreadcrumbList",
-            "itemListElement": [
-                {{
-                    "@type": "ListItem",
-                    "position": 1,
-                    "name": "Home",
-                    "item": "{base_url}/"
-                }},
-                {{
-                    "@type": "ListItem",
-                    "position": 2,
-                    "name": "{category_title}",
-                    "item": "{base_url}/{category_url}"
-                }}
-            ]
-        }}
-    }}
-    </script>
+    return CATEGORY_PAGE.render(
+        category_key=category_key,
+        category_url=category_url,
+        category_title=category_title,
+        category_title_lower=category_title.lower(),
+        tool_count=len(tools),
+        base_url=base_url,
+        tool_links=tool_links,
+        head_styles=head_styles,
+    )
+
+def js_string(value):
+    """Format a schema value the way a JS template literal interpolates it."""
+    if isinstance(value, bool):
+        return 'true' if value else 'false'
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+def render_calculator_form(calc_id, inputs):
+    """Build a calculator's form from its inputs schema, matching showCalculator() in main.js."""
+    fields = []
+    for field in inputs:
+        if field['type'] == 'select':
+            options = ''.join([FORM_OPTION.render(option=js_string(option)) for option in field['options']])
+            control = FORM_SELECT.render(input_id=field['id'], options=options)
+        elif field['type'] == 'file':
+            accept = field.get('accept')
+            control = FORM_FILE.render(input_id=field['id'], accept_attr=f'accept="{accept}"' if accept else '')
+        else:
+            step = field.get('step')
+            control = FORM_INPUT.render(
+                type=field['type'],
+                input_id=field['id'],
+                placeholder=js_string(field.get('placeholder') or ''),
+                step_attr=f'step="{js_string(step)}"' if step else '',
+                required_attr='' if field.get('optional') else 'required',
+            )
+        fields.append(FORM_FIELD.render(label=field['label'], control=control))
+    return CALCULATOR_FORM.render(calc_id=calc_id, fields=''.join(fields))
+
+def can_prerender(calc_id):
+    """Form-based calculators defined in calculators.js; custom interfaces need the full app."""
+    calc = CALCULATORS.get(calc_id)
+    return bool(calc) and not calc['custom'] and isinstance(calc['inputs'], list)
+
+def inline_script(source):
+    """Minify JS for an inline <script> and keep it from closing the element early."""
+    return minify_js(source).strip().replace('</script', '<\\/script')
+
+def generate_prerendered_html(category_key, category_url, calc_id, base_url="https://www.tahir.engineer",
+                              head_styles=None, runtime_js='', calculator_js=''):
+    """Generate a calculator page with its form rendered and its code inlined."""
+    if head_styles is None:
+        head_styles = blocking_links(STYLE_CSS)
+    calc_name = format_calculator_name(calc_id)
+    calc = CALCULATORS[calc_id]
     
-    <!-- Bootstrap CSS -->
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-    <!-- Font Awesome -->
-    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
-    <!-- Google Fonts -->
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700;800&family=Space+Grotesk:wght@700&display=swap" rel="stylesheet">
-    <!-- Custom CSS -->
-    <link rel="stylesheet" href="/assets/css/style.css">
+    return PRERENDERED_PAGE.render(
+        calc_id=calc_id,
+        calc_name=calc_name,
+        calc_name_lower=calc_name.lower(),
+        calc_title=html.escape(calc['title'], quote=False),
+        category_key=category_key,
+        category_url=category_url,
+        category_title=CATEGORY_TITLES.get(category_key, 'Calculators'),
+        base_url=base_url,
+        head_styles=head_styles,
+        form_html=render_calculator_form(calc_id, calc['inputs']),
+        runtime_js=runtime_js,
+        calculator_js=calculator_js,
+    )
+
+def prerender_scripts(base_path, calc_ids):
+    """Inline scripts for prerendered pages: (runtime, {calc_id: calculator module}).
+
+    A module is preceded by the shared scripts its calculator `requires`.
+    """
+    with open(os.path.join(base_path, *PRERENDER_RUNTIME_JS.split('/')), 'r', encoding='utf-8') as f:
+        runtime_js = inline_script(f.read())
+    with open(os.path.join(base_path, *CALCULATORS_JS.split('/')), 'r', encoding='utf-8') as f:
+        source = f.read()
+    shared = {}
+    modules = {}
+    for calc_id in calc_ids:
+        start, end = CALCULATORS[calc_id]['value_span']
+        scripts = []
+        for name in CALCULATORS[calc_id]['requires']:
+            if name not in shared:
+                with open(os.path.join(base_path, 'assets', 'js', f'{name}.js'), 'r', encoding='utf-8') as f:
+                    shared[name] = f.read()
+            scripts.append(shared[name])
+        scripts.append(module_js(calc_id, source[start:end]))
+        modules[calc_id] = inline_script('\n'.join(scripts))
+    return runtime_js, modules
+
+def fingerprint(*inputs):
+    """Return a stable hash of the inputs a page is rendered from."""
+    payload = json.dumps([TEMPLATE_VERSION, *inputs], sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def page_styles(base_url="https://www.tahir.engineer", prerender=False):
+    """Critical CSS <head> blocks for calculator and category pages.
     
-    <!-- Redirect Script -->
-    <script>
-        setTimeout(function() {{
-            window.location.href = '/?category={category_key}';
-        }}, 100);
-    </script>
-</head>
-<body>
-    <div class="container mt-5 pt-5">
-        <div class="text-center">
-            <h1 class="mb-4">{category_title}</h1>
-            <p class="lead">Browse our collection of {len(tools)} professional {category_key} calculators</p>
-            <p>Loading calculators...</p>
-            <div class="spinner-border text-primary mt-3" role="status">
-                <span class="visually-hidden">Loading...</span>
-            </div>
-        </div>
-        
-        <div class="mt-5">
-            <nav aria-label="breadcrumb">
-                <ol class="breadcrumb">
-                    <li class="breadcrumb-item"><a href="/">Home</a></li>
-                    <li class="breadcrumb-item active" aria-current="page">{category_title}</li>
-                </ol>
-            </nav>
-        </div>
+    All pages of a kind share one structure, so each block is computed once
+    from a sample page. Returns {kind: (block, report)}.
+    """
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    category_key, category_url = next(iter(URL_MAPPING.items()))
+    samples = {
+        'calculator': generate_calculator_html(category_key, category_url, 'sample', base_url),
+        'category': generate_category_html(category_key, category_url, base_url, ['sample']),
+    }
+    styles = {kind: stylesheet_block(page, STYLE_CSS, base_path) for kind, page in samples.items()}
+    if prerender:
+        # One sample with every kind of form control stands in for all prerendered pages
+        sample_inputs = [{'id': 'a', 'label': 'A', 'type': 'number', 'step': '1'},
+                         {'id': 'b', 'label': 'B', 'type': 'select', 'options': ['b']}]
+        sample = PRERENDERED_PAGE.render_map({
+            field: '' for field in PRERENDERED_PAGE.fields
+        } | {'form_html': render_calculator_form('sample', sample_inputs), 'head_styles': blocking_links(STYLE_CSS)})
+        with open(os.path.join(base_path, APP_PAGE), 'r', encoding='utf-8') as f:
+            app_css = inline_css(f.read())
+        styles['prerender'] = stylesheet_block(sample, STYLE_CSS, base_path, app_css)
+    return styles
+
+def plan_pages(base_url="https://www.tahir.engineer", styles=None, prerender=False):
+    """List every page as (relative path, input fingerprint, renderer, renderer args)."""
+    if styles is None:
+        styles = page_styles(base_url, prerender)
+    calculator_styles = styles['calculator'][0]
+    category_styles = styles['category'][0]
+    if prerender:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        prerendered = [calc_id for tools in TOOL_CATEGORIES.values() for calc_id in tools if can_prerender(calc_id)]
+        runtime_js, modules = prerender_scripts(base_path, prerendered)
+        prerender_styles = styles['prerender'][0]
+    pages = []
+    for category_key, category_url in URL_MAPPING.items():
+        category_title = CATEGORY_TITLES.get(category_key, 'Calculators')
+        tools = TOOL_CATEGORIES.get(category_key, [])
         
-        <div class="mt-4">
-            <h2>Available Calculators</h2>
-            <ul class="list-unstyled">
-'''
-    
-    # Add calculator links
-    for tool in tools:
-        tool_name = format_calculator_name(tool)
-        html_content += f'                <li class="mb-2"><a href="/{category_url}/{tool}">{tool_name} Calculator</a></li>\n'
+        pages.append((
+            f'{category_url}/index.html',
+            fingerprint('category', category_key, category_url, category_title, tools, base_url, category_styles),
+            generate_category_html,
+            (category_key, category_url, base_url, None, category_styles),
+        ))
+        for calc_id in tools:
+            if prerender and can_prerender(calc_id):
+                pages.append((
+                    f'{category_url}/{calc_id}.html',
+                    fingerprint('prerender', category_key, category_url, category_title, calc_id, base_url,
+                                prerender_styles, runtime_js, modules[calc_id]),
+                    generate_prerendered_html,
+                    (category_key, category_url, calc_id, base_url, prerender_styles, runtime_js, modules[calc_id]),
+                ))
+                continue
+            pages.append((
+                f'{category_url}/{calc_id}.html',
+                fingerprint('calculator', category_key, category_url, category_title, calc_id, base_url, calculator_styles),
+                generate_calculator_html,
+                (category_key, category_url, calc_id, base_url, calculator_styles),
+            ))
+    return pages
+
+def load_manifest(manifest_file):
+    """Load the previous build manifest, or an empty one if it is missing or unreadable."""
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return manifest.get('pages', {})
+
+def save_manifest(manifest_file, pages):
+    """Persist the page fingerprints of the current build."""
+    content = json.dumps({'template_version': TEMPLATE_VERSION, 'pages': pages}, indent=2, sort_keys=True)
+    write_atomic(manifest_file, (content + '\n').encode('utf-8'))
+
+def render_task(task):
+    """Render one page; module-level so it can be shipped to worker processes."""
+    render, args = task
+    return render(*args)
+
+def render_pages(tasks, jobs=1):
+    """Yield rendered pages in task order, fanning out over a process pool when jobs > 1."""
+    if jobs <= 1 or len(tasks) < 2:
+        for task in tasks:
+            yield render_task(task)
+        return
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(render_task, tasks, chunksize=chunksize)
+
+def main(incremental=False, base_url="https://www.tahir.engineer", jobs=1, prerender=False):
+    """Generate all calculator and category pages.
     
-    html_content += '''            </ul>
-        </div>
-    </div>
+    In incremental mode only pages whose input fingerprint differs from the
+    previous build manifest are re-rendered, files whose bytes are unchanged
+    are left untouched, and pages that are no longer registered are deleted.
     
-    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>
-</body>
-</html>'''
+    With jobs > 1 pages are rendered in a process pool and written through a
+    thread pool. Results are consumed in plan order, so the output is the same
+    as a serial build.
     
-    return html_content
-
-def main():
-    """Generate all calculator and category pages."""
+    With prerender, calculator pages carry their form and inlined code
+    instead of redirecting to index.html. Custom-interface calculators and
+    ids missing from calculators.js keep the redirect stub.
+    """
     base_path = os.path.dirname(os.path.abspath(__file__))
+    manifest_file = os.path.join(base_path, MANIFEST_FILE)
+    previous = load_manifest(manifest_file) if incremental else {}
+    current = {}
     created_files = []
+    rebuilt = skipped = deleted = 0
     
     print("Starting page generation...")
     print(f"Base path: {base_path}")
+    print(f"Jobs: {jobs}")
+    if incremental:
+        print(f"Incremental mode: {len(previous)} pages in previous manifest")
     
-    # Generate category pages and calculator pages
-    for category_key, category_url in URL_MAPPING.items():
-        # Create category directory
-        category_dir = os.path.join(base_path, category_url)
-        os.makedirs(category_dir, exist_ok=True)
+    styles = page_styles(base_url, prerender)
+    page_files = []
+    tasks = []
+    prerendered = 0
+    for rel_path, page_hash, render, args in plan_pages(base_url, styles, prerender):
+        if render is generate_prerendered_html:
+            prerendered += 1
+        page_file = os.path.join(base_path, *rel_path.split('/'))
+        current[rel_path] = page_hash
         
-        # Generate category index page
-        category_html = generate_category_html(category_key, category_url)
-        category_file = os.path.join(category_dir, 'index.html')
-        with open(category_file, 'w', encoding='utf-8') as f:
-            f.write(category_html)
-        created_files.append(category_file)
-        print(f"Created: {category_file}")
+        if incremental and previous.get(rel_path) == page_hash and os.path.exists(page_file):
+            skipped += 1
+            continue
         
-        # Generate individual calculator pages
-        tools = TOOL_CATEGORIES.get(category_key, [])
-        for calc_id in tools:
-            # Create calculator page
-            calc_html = generate_calculator_html(category_key, category_url, calc_id)
-            calc_file = os.path.join(category_dir, f'{calc_id}.html')
-            with open(calc_file, 'w', encoding='utf-8') as f:
-                f.write(calc_html)
-            created_files.append(calc_file)
+        page_files.append(page_file)
+        tasks.append((render, args))
+    
+    with ThreadPoolExecutor(max_workers=jobs) as writer:
+        writes = [writer.submit(write_if_changed, page_file, content)
+                  for page_file, content in zip(page_files, render_pages(tasks, jobs))]
+        for page_file, write in zip(page_files, writes):
+            if write.result():
+                rebuilt += 1
+                created_files.append(page_file)
+                print(f"Created: {page_file}")
+            else:
+                skipped += 1
+    
+    # Remove pages the previous build generated that are no longer registered
+    for rel_path in sorted(set(previous) - set(current)):
+        page_file = os.path.join(base_path, *rel_path.split('/'))
+        if os.path.exists(page_file):
+            os.remove(page_file)
+            deleted += 1
+            print(f"Deleted: {page_file}")
+    
+    save_manifest(manifest_file, current)
     
     print(f"\nGeneration complete!")
-    print(f"Total files created: {len(created_files)}")
+    print(f"Pages rebuilt: {rebuilt}")
+    print(f"Pages skipped (unchanged): {skipped}")
+    print(f"Pages deleted: {deleted}")
+    if prerender:
+        print(f"Prerendered calculator pages: {prerendered}")
     print(f"\nCategories: {len(URL_MAPPING)}")
     print(f"Total calculators: {sum(len(tools) for tools in TOOL_CATEGORIES.values())}")
+    print()
+    for kind, (_, report) in styles.items():
+        print_report(f"{kind} pages", report)
     
     return created_files
 
+def benchmark(count=10000, base_url="https://www.tahir.engineer"):
+    """Render synthetic calculators and category pages in memory and report pages per second."""
+    categories = list(URL_MAPPING.items())
+    synthetic = {key: [] for key, _ in categories}
+    for i in range(count):
+        synthetic[categories[i % len(categories)][0]].append(f'synthetic-tool-{i}')
+    
+    styles = page_styles(base_url)
+    calculator_styles = styles['calculator'][0]
+    category_styles = styles['category'][0]
+    
+    start = time.perf_counter()
+    total_bytes = 0
+    for category_key, category_url in categories:
+        for calc_id in synthetic[category_key]:
+            total_bytes += len(generate_calculator_html(category_key, category_url, calc_id, base_url, calculator_styles))
+    calc_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for category_key, category_url in categories:
+        total_bytes += len(generate_category_html(category_key, category_url, base_url, synthetic[category_key], category_styles))
+    category_seconds = time.perf_counter() - start
+    
+    print(f"Benchmark: {count} synthetic calculators in {len(categories)} categories")
+    print(f"Calculator pages: {count / calc_seconds:,.0f} pages/s ({calc_seconds * 1000:.1f} ms total)")
+    print(f"Category pages: {len(categories)} pages with {count} links in {category_seconds * 1000:.1f} ms")
+    print(f"Rendered: {total_bytes / 1024 / 1024:.1f} MB")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate SEO pages for every calculator and category.")
+    parser.add_argument('--incremental', action='store_true',
+                        help=f"only rebuild pages whose inputs changed since the last build ({MANIFEST_FILE})")
+    parser.add_argument('--base-url', default="https://www.tahir.engineer",
+                        help="site origin used for canonical and Open Graph URLs")
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help="number of render processes and writer threads (0 = one per CPU)")
+    parser.add_argument('--prerender', action='store_true',
+                        help="render each calculator's form and inline its code instead of a redirect stub")
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help="render N synthetic calculators in memory, report pages/s and exit")
+    args = parser.parse_args(argv)
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
+    args.jobs = args.jobs or os.cpu_count() or 1
+    return args
+
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark, base_url=args.base_url)
+        sys.exit(0)
+    main(incremental=args.incremental, base_url=args.base_url, jobs=args.jobs, prerender=args.prerender)
@@ -1,179 +1,399 @@
 #!/usr/bin/env python3
 """
-Generate sitemap.xml with all calculator URLs
+Generate sitemap.xml with all calculator URLs, the per-section sitemaps
+(sitemap-blogs.xml, sitemap-categories.xml, sitemap-calculators.xml) and the
+sitemap-index.xml that points at them. Blog article URLs come from
+blog/articles.json, so run build_blog.py before this.
+
+URLs are produced by generators and streamed straight to disk, so memory stays
+flat however many calculators are registered. Each sitemap is split into
+numbered shards (sitemap-calculators-2.xml, ...) whenever it would exceed the
+protocol limits of 50,000 URLs or 50 MB uncompressed.
+
+<lastmod> is the date a URL's content last changed, not the build date. The
+content hash of each generated page (plus its calculator definition in
+calculators.js) is kept in sitemap-lastmod.tsv, one sorted line per URL, and
+the date only moves forward when that hash changes. Run generate_pages.py first.
 """
 
+import os
+import glob
+import gzip
+import json
+import hashlib
+import argparse
+from contextlib import ExitStack
 from datetime import datetime
+from xml.sax.saxutils import escape
 
-# Tool categories (matches calculators.js)
-TOOL_CATEGORIES = {
-    'financial': ['loan', 'mortgage', 'compound-interest', 'investment', 'savings'],
-    'math': [
-        'percentage', 'fraction', 'algebra', 'quadratic', 'trigonometry', 
-        'scientific-calculator', 'statistics-calculator', 'matrix-calculator', 
-        'geometry-calculator', 'calculus-calculator', 'number-theory', 
-        'probability-calculator', 'complex-numbers', 'sequence-series', 
-        'logarithm-calculator', 'polynomial-calculator', 'binary-calculator',
-        'windows-calculator'
-    ],
-    'health': [
-        'bmi', 'calorie', 'body-fat', 'ideal-weight', 'water-intake',
-        'heart-rate-zone', 'vo2-max', 'pregnancy-due-date', 'ovulation', 'bmi-children',
-        'macro-calculator', 'protein-intake', 'body-measurement', 'sleep-calculator', 'hydration-status',
-        'fitness-level', 'workout-intensity', 'recovery-calculator', 'training-load', 'body-age',
-        'bmr', 'waist-hip-ratio', 'target-heart-rate', 'body-surface-area', 'lean-body-mass',
-        'resting-energy', 'weight-loss-planner', 'blood-alcohol', 'blood-pressure', 'blood-sugar',
-        'body-fat-distribution', 'exercise-calories', 'macros-converter', 'meal-planner', 'muscle-mass'
-    ],
-    'crypto': [
-        'crypto-profit', 'crypto-leverage-liquidation', 'crypto-futures-pnl',
-        'crypto-lending-returns', 'crypto-compound-yield', 'crypto-rebalancing',
-        'crypto-stop-loss', 'crypto-correlation', 'crypto-volume-analysis',
-        'crypto-position-size', 'crypto-funding-rate', 'crypto-drawdown',
-        'crypto-swing-trade', 'crypto-accumulation', 'crypto-volatility',
-        'crypto-dca', 'crypto-mining', 'crypto-converter', 'impermanent-loss',
-        'staking-rewards', 'crypto-arbitrage', 'crypto-yield-farming',
-        'crypto-bridge-fees', 'crypto-tax-calculator', 'crypto-hodl-calculator',
-        'crypto-rainbow-chart', 'crypto-fear-greed', 'crypto-hash-rate',
-        'crypto-whale-tracker', 'crypto-flash-loan', 'crypto-liquidity-pool',
-        'crypto-options-pricing', 'crypto-defi-yield', 'crypto-nft-valuation',
-        'crypto-gas-optimizer', 'crypto-portfolio-tracker', 'crypto-leverage-calculator',
-        'crypto-sharpe-ratio', 'crypto-dollar-hedge', 'crypto-momentum-indicator',
-        'crypto-technical-levels', 'crypto-altcoin-season', 'crypto-market-cap-calc',
-        'crypto-pairs-trading', 'crypto-grid-trading', 'crypto-rsi-calculator',
-        'crypto-funding-arbitrage', 'crypto-volatility-smile', 'crypto-carry-trade',
-        'crypto-basis-trading', 'crypto-social-sentiment'
-    ],
-    'physics': ['velocity', 'energy', 'force', 'momentum', 'power'],
-    'chemistry': ['molarity', 'ph', 'molecular-weight', 'gas-laws', 'stoichiometry'],
-    'engineering': [
-        'ohms-law', 'power-consumption', 'resistor-color', 'voltage-divider', 'capacitor',
-        'transformer-turns', 'inductor-reactance', 'rc-time-constant', 'rlc-resonance',
-        'parallel-resistance', 'series-resistance', 'power-factor', 'three-phase-power',
-        'wire-gauge', 'led-resistor', 'antenna-length', 'decibel-converter',
-        'impedance-matching', 'filter-frequency', 'amplifier-gain', 'beam-deflection',
-        'gear-ratio', 'pulley-system', 'hydraulic-pressure', 'spring-constant',
-        'thermal-expansion', 'motor-efficiency', 'pipe-flow'
-    ],
-    'construction': ['concrete', 'paint', 'brick', 'roof-pitch', 'flooring'],
-    'conversion': [
-        'length', 'temperature', 'weight', 'area', 'volume', 'speed',
-        'pressure', 'energy-conversion', 'power-conversion', 'data-storage',
-        'angle', 'time-conversion', 'frequency', 'currency', 'fuel-economy-conversion',
-        'density', 'force-conversion', 'luminosity', 'magnetic-field', 'radioactivity', 'torque'
-    ],
-    'business': ['roi', 'break-even', 'markup', 'payroll', 'cash-flow'],
-    'time': ['age', 'date-difference', 'time-zone', 'working-days', 'countdown'],
-    'utility': ['grade', 'fuel-economy', 'password-strength', 'random-number', 'color-picker']
-}
-
-URL_MAPPING = {
-    'financial': 'financial-calculators',
-    'math': 'math-calculators',
-    'health': 'health-calculators',
-    'crypto': 'crypto-calculators',
-    'physics': 'physics-calculators',
-    'chemistry': 'chemistry-calculators',
-    'engineering': 'engineering-calculators',
-    'construction': 'construction-calculators',
-    'conversion': 'conversion-tools',
-    'business': 'business-calculators',
-    'time': 'time-calculators',
-    'utility': 'utility-tools'
-}
+from build_io import atomic_open, write_atomic, write_if_changed
+from calc_registry import URL_MAPPING, TOOL_CATEGORIES, CALCULATORS
 
-def generate_sitemap(base_url="https://www.tahir.engineer"):
-    """Generate complete sitemap.xml"""
-    today = datetime.now().strftime('%Y-%m-%d')
-    
-    sitemap = f'''<?xml version="1.0" encoding="UTF-8"?>
+# Sitemap protocol limits per file (https://www.sitemaps.org/protocol.html)
+MAX_URLS_PER_SITEMAP = 50000
+MAX_BYTES_PER_SITEMAP = 50 * 1024 * 1024
+
+SITEMAP_INDEX_FILE = 'sitemap-index.xml'
+
+# Blog articles, the source build_blog.py renders blog/<id>.html from
+BLOG_ARTICLES_FILE = 'blog/articles.json'
+
+# Content hash and last-changed date per URL path, tab separated and sorted
+LASTMOD_HISTORY_FILE = 'sitemap-lastmod.tsv'
+
+URLSET_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
 <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
         xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
     
-    <!-- Homepage -->
-    <url>
-        <loc>{base_url}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>daily</changefreq>
-        <priority>1.0</priority>
-        <image:image>
-            <image:loc>{base_url}/assets/images/calchub-og.png</image:loc>
-            <image:title>CalcHub - Professional Calculator Tools</image:title>
-            <image:caption>150+ free online calculator tools for financial, health, math and engineering calculations</image:caption>
-        </image:image>
-    </url>
-    
-    <!-- Static Pages -->
-    <url>
-        <loc>{base_url}/blogs.html</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.9</priority>
-    </url>
-
-    <url>
-        <loc>{base_url}/convertors.html</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.9</priority>
-    </url>
-
-    <!-- Category Pages -->
 '''
-    
-    # Add category pages
-    for category_key, category_url in URL_MAPPING.items():
-        sitemap += f'''    <url>
-        <loc>{base_url}/{category_url}/</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>weekly</changefreq>
-        <priority>0.9</priority>
-    </url>
-    
-'''
-    
-    # Add individual calculator pages
-    sitemap += "    <!-- Individual Calculator Pages -->\n"
-    
+URLSET_FOOTER = '</urlset>'
+
+
+class LastmodHistory:
+    """Track when the content behind each URL last changed.
+
+    Each URL path maps to a hash of the files it is rendered from and the date
+    that hash was first seen. Only paths looked up during a build are saved,
+    so removed pages drop out of the history.
+    """
+
+    def __init__(self, base_path, history_file=LASTMOD_HISTORY_FILE, today=None):
+        self.base_path = base_path
+        self.history_file = os.path.join(base_path, history_file)
+        self.today = today or datetime.now().strftime('%Y-%m-%d')
+        self.entries = {}
+        self.seen = {}
+        self.changed = 0
+        try:
+            with open(self.history_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    path, digest, date = line.rstrip('\n').split('\t')
+                    self.entries[path] = (digest, date)
+        except FileNotFoundError:
+            pass
+
+    def content_hash(self, files, extra):
+        digest = hashlib.sha256()
+        for rel_path in files:
+            try:
+                with open(os.path.join(self.base_path, *rel_path.split('/')), 'rb') as f:
+                    digest.update(hashlib.sha256(f.read()).digest())
+            except FileNotFoundError:
+                digest.update(b'missing:' + rel_path.encode('utf-8'))
+        for value in extra:
+            digest.update(b'\0' + value.encode('utf-8'))
+        return digest.hexdigest()[:16]
+
+    def lastmod(self, path, files=(), extra=()):
+        """Return the last-changed date of a URL path, recording a new date if its content changed."""
+        if path in self.seen:
+            return self.seen[path][1]
+        digest = self.content_hash(files, extra)
+        previous = self.entries.get(path)
+        if previous and previous[0] == digest:
+            date = previous[1]
+        else:
+            date = self.today
+            self.changed += 1
+        self.seen[path] = (digest, date)
+        return date
+
+    def save(self):
+        lines = [f'{path}\t{digest}\t{date}\n' for path, (digest, date) in sorted(self.seen.items())]
+        return write_if_changed(self.history_file, ''.join(lines))
+
+
+def iter_page_urls(base_url, history):
+    """Yield the homepage and static pages."""
+    yield {
+        'comment': 'Homepage',
+        'loc': f'{base_url}/',
+        'lastmod': history.lastmod('/', ['index.html']),
+        'changefreq': 'daily',
+        'priority': '1.0',
+        'image': {
+            'loc': f'{base_url}/assets/images/calchub-og.png',
+            'title': 'CalcHub - Professional Calculator Tools',
+            'caption': '150+ free online calculator tools for financial, health, math and engineering calculations',
+        },
+    }
+    yield {
+        'comment': 'Static Pages',
+        'loc': f'{base_url}/blogs.html',
+        'lastmod': history.lastmod('/blogs.html', ['blogs.html']),
+        'changefreq': 'weekly',
+        'priority': '0.9',
+    }
+    yield {
+        'loc': f'{base_url}/convertors.html',
+        'lastmod': history.lastmod('/convertors.html', ['convertors.html']),
+        'changefreq': 'weekly',
+        'priority': '0.9',
+    }
+
+
+def load_blog_articles(base_path):
+    """The blog articles listed in blog/articles.json, or none if the blog has not been built."""
+    try:
+        with open(os.path.join(base_path, *BLOG_ARTICLES_FILE.split('/')), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def iter_article_urls(base_url, history):
+    """Yield one URL per static blog article page."""
+    for index, article in enumerate(load_blog_articles(history.base_path)):
+        yield {
+            'comment': 'Blog Articles' if index == 0 else None,
+            'loc': f"{base_url}/blog/{article['id']}",
+            'lastmod': history.lastmod(f"/blog/{article['id']}.html", [f"blog/{article['id']}.html"]),
+            'changefreq': 'monthly',
+            'priority': '0.7',
+        }
+
+
+def iter_blog_urls(base_url, history):
+    """Yield the blog listing page and every article page."""
+    yield {
+        'comment': 'Blog',
+        'loc': f'{base_url}/blogs.html',
+        'lastmod': history.lastmod('/blogs.html', ['blogs.html']),
+        'changefreq': 'weekly',
+        'priority': '0.9',
+    }
+    yield from iter_article_urls(base_url, history)
+
+
+def iter_category_urls(base_url, history):
+    """Yield one URL per category listing page."""
+    for index, category_url in enumerate(URL_MAPPING.values()):
+        yield {
+            'comment': 'Category Pages' if index == 0 else None,
+            # The directory URL itself: /<category> is redirected to /<category>/
+            'loc': f'{base_url}/{category_url}/',
+            'lastmod': history.lastmod(f'/{category_url}/', [f'{category_url}/index.html']),
+            'changefreq': 'weekly',
+            'priority': '0.9',
+        }
+
+
+def iter_calculator_urls(base_url, history):
+    """Yield one URL per individual calculator page."""
     for category_key, tools in TOOL_CATEGORIES.items():
         category_url = URL_MAPPING[category_key]
-        sitemap += f"\n    <!-- {category_key.title()} Calculators -->\n"
-        
-        for tool in tools:
-            sitemap += f'''    <url>
-        <loc>{base_url}/{category_url}/{tool}.html</loc>
-        <lastmod>{today}</lastmod>
-        <changefreq>monthly</changefreq>
-        <priority>0.8</priority>
-    </url>
-    
-'''
-    
-    sitemap += "</urlset>"
-    
-    return sitemap
+        for index, tool in enumerate(tools):
+            definition = CALCULATORS.get(tool, {}).get('hash', '')
+            yield {
+                'comment': f'{category_key.title()} Calculators' if index == 0 else None,
+                'loc': f'{base_url}/{category_url}/{tool}',
+                'lastmod': history.lastmod(f'/{category_url}/{tool}.html',
+                                           [f'{category_url}/{tool}.html'], [definition]),
+                'changefreq': 'monthly',
+                'priority': '0.8',
+            }
 
-def main():
-    """Generate and save sitemap"""
-    import os
-    
+
+def iter_all_urls(base_url, history):
+    """Yield every URL for the combined sitemap.xml."""
+    yield from iter_page_urls(base_url, history)
+    yield from iter_article_urls(base_url, history)
+    yield from iter_category_urls(base_url, history)
+    yield from iter_calculator_urls(base_url, history)
+
+
+def render_url(entry):
+    """Render a single <url> element (preceded by its section comment, if any)."""
+    parts = []
+    if entry.get('comment'):
+        parts.append(f"    <!-- {entry['comment']} -->\n")
+    parts.append(f'''    <url>
+        <loc>{escape(entry['loc'])}</loc>
+        <lastmod>{entry['lastmod']}</lastmod>
+        <changefreq>{entry['changefreq']}</changefreq>
+        <priority>{entry['priority']}</priority>
+''')
+    image = entry.get('image')
+    if image:
+        parts.append(f'''        <image:image>
+            <image:loc>{escape(image['loc'])}</image:loc>
+            <image:title>{escape(image['title'])}</image:title>
+            <image:caption>{escape(image['caption'])}</image:caption>
+        </image:image>
+''')
+    parts.append('    </url>\n    \n')
+    return ''.join(parts)
+
+
+class ShardedSitemapWriter:
+    """Stream <url> entries into <name>.xml, <name>-2.xml, ... within protocol limits.
+
+    Each shard is written to a temp file and renamed into place when it is
+    full or the writer is closed. The written shards are available as `shards`: a list of (file name, URL count,
+    newest lastmod).
+    """
+
+    def __init__(self, base_path, name, use_gzip=False,
+                 max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP):
+        self.base_path = base_path
+        self.name = name
+        self.use_gzip = use_gzip
+        self.max_urls = max_urls
+        self.max_bytes = max_bytes
+        self.header = URLSET_HEADER.encode('utf-8')
+        self.footer = URLSET_FOOTER.encode('utf-8')
+        self.shards = []
+        self._file = None
+
+    def shard_name(self, number):
+        suffix = '' if number == 1 else f'-{number}'
+        extension = '.xml.gz' if self.use_gzip else '.xml'
+        return f'{self.name}{suffix}{extension}'
+
+    def _open(self):
+        name = self.shard_name(len(self.shards) + 1)
+        self._stack = ExitStack()
+        raw = self._stack.enter_context(atomic_open(os.path.join(self.base_path, name)))
+        # mtime=0 keeps gzip output byte-identical between builds
+        self._file = self._stack.enter_context(gzip.GzipFile(fileobj=raw, mode='wb', mtime=0)) if self.use_gzip else raw
+        self._file.write(self.header)
+        self._name = name
+        self._urls = 0
+        self._bytes = len(self.header)
+        self._lastmod = ''
+
+    def _close(self):
+        self._file.write(self.footer)
+        self._stack.close()
+        self.shards.append((self._name, self._urls, self._lastmod))
+        self._file = None
+
+    def add(self, entry):
+        data = render_url(entry).encode('utf-8')
+        if self._file is not None and (
+                self._urls >= self.max_urls
+                or self._bytes + len(data) + len(self.footer) > self.max_bytes):
+            self._close()
+        if self._file is None:
+            self._open()
+        self._file.write(data)
+        self._urls += 1
+        self._bytes += len(data)
+        self._lastmod = max(self._lastmod, entry['lastmod'])
+
+    def abort(self):
+        """Discard the shard being written."""
+        if self._file is not None:
+            self._stack.__exit__(RuntimeError, RuntimeError("sitemap aborted"), None)
+            self._file = None
+
+    def close(self):
+        if self._file is None and not self.shards:
+            # An empty sitemap is still a valid document
+            self._open()
+        if self._file is not None:
+            self._close()
+        self._remove_stale_shards()
+        return self.shards
+
+    def _remove_stale_shards(self):
+        """Delete shards left over from a previous build: numbered shards beyond this build's, and
+        every shard in the other format after switching between .xml and .xml.gz."""
+        written = {name for name, _, _ in self.shards}
+        for extension in ('.xml', '.xml.gz'):
+            paths = glob.glob(os.path.join(self.base_path, f'{self.name}-[0-9]*{extension}'))
+            paths.append(os.path.join(self.base_path, f'{self.name}{extension}'))
+            for path in paths:
+                if os.path.basename(path) not in written and os.path.exists(path):
+                    os.remove(path)
+
+
+def write_sitemap(base_path, name, urls, use_gzip=False, **limits):
+    """Stream the URLs from a generator into one or more sitemap shards."""
+    writer = ShardedSitemapWriter(base_path, name, use_gzip=use_gzip, **limits)
+    try:
+        for entry in urls:
+            writer.add(entry)
+    except BaseException:
+        writer.abort()
+        raise
+    return writer.close()
+
+
+def write_sitemap_index(base_path, base_url, shards):
+    """Write sitemap-index.xml listing every shard that was generated."""
+    lines = ['<?xml version="1.0" encoding="UTF-8"?>\n',
+             '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+             '    \n']
+    for name, _, lastmod in shards:
+        lines.append(f'''    <sitemap>
+        <loc>{escape(base_url)}/{name}</loc>
+        <lastmod>{lastmod}</lastmod>
+    </sitemap>
+
+''')
+    lines.append('</sitemapindex>')
+    index_file = os.path.join(base_path, SITEMAP_INDEX_FILE)
+    write_atomic(index_file, ''.join(lines).encode('utf-8'))
+    return index_file
+
+
+def generate_sitemap(base_url="https://www.tahir.engineer"):
+    """Generate complete sitemap.xml content as a single string."""
+    history = LastmodHistory(os.path.dirname(os.path.abspath(__file__)))
+    body = ''.join(render_url(entry) for entry in iter_all_urls(base_url, history))
+    return URLSET_HEADER + body + URLSET_FOOTER
+
+
+def main(base_url="https://www.tahir.engineer", use_gzip=False,
+         max_urls=MAX_URLS_PER_SITEMAP, max_bytes=MAX_BYTES_PER_SITEMAP):
+    """Generate and save all sitemaps and the sitemap index"""
     base_path = os.path.dirname(os.path.abspath(__file__))
-    sitemap_content = generate_sitemap()
-    
-    sitemap_file = os.path.join(base_path, 'sitemap.xml')
-    with open(sitemap_file, 'w', encoding='utf-8') as f:
-        f.write(sitemap_content)
-    
-    print(f"Sitemap generated successfully!")
-    print(f"File: {sitemap_file}")
-    print(f"Total URLs: {sitemap_content.count('<url>')}")
-    
+    history = LastmodHistory(base_path)
+    limits = {'max_urls': max_urls, 'max_bytes': max_bytes}
+
+    sitemaps = [
+        ('sitemap', iter_all_urls),
+        ('sitemap-blogs', iter_blog_urls),
+        ('sitemap-categories', iter_category_urls),
+        ('sitemap-calculators', iter_calculator_urls),
+    ]
+
+    all_shards = []
+    for name, urls in sitemaps:
+        shards = write_sitemap(base_path, name, urls(base_url, history), use_gzip=use_gzip, **limits)
+        all_shards.extend(shards)
+        for shard_name, count, _ in shards:
+            print(f"Created: {shard_name} ({count} URLs)")
+
+    index_file = write_sitemap_index(base_path, base_url, all_shards)
+    history.save()
+
+    print(f"\nSitemap generated successfully!")
+    print(f"Index: {index_file} ({len(all_shards)} sitemaps)")
+    print(f"URLs with new lastmod: {history.changed}")
+
     # Calculate totals
     total_calcs = sum(len(tools) for tools in TOOL_CATEGORIES.values())
+    total_articles = len(load_blog_articles(base_path))
     print(f"Categories: {len(URL_MAPPING)}")
     print(f"Individual Calculators: {total_calcs}")
+    print(f"Blog Articles: {total_articles}")
     print(f"Static Pages: 3")
-    print(f"Total: {len(URL_MAPPING) + total_calcs + 3}")
+    print(f"Total: {len(URL_MAPPING) + total_calcs + total_articles + 3}")
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Generate the sitemaps and sitemap index.")
+    parser.add_argument('--base-url', default="https://www.tahir.engineer",
+                        help="site origin used in every <loc>")
+    parser.add_argument('--gzip', action='store_true',
+                        help="write .xml.gz sitemaps instead of plain .xml")
+    parser.add_argument('--max-urls', type=int, default=MAX_URLS_PER_SITEMAP,
+                        help="start a new shard after this many URLs")
+    parser.add_argument('--max-bytes', type=int, default=MAX_BYTES_PER_SITEMAP,
+                        help="start a new shard before a file exceeds this many uncompressed bytes")
+    return parser.parse_args(argv)
 
 if __name__ == '__main__':
-    main()
+    args = parse_args()
+    main(base_url=args.base_url, use_gzip=args.gzip, max_urls=args.max_urls, max_bytes=args.max_bytes)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+MD5, SHA-1, SHA-256 and SHA-512 digests of files of any size, in one pass.
+
+The reference for assets/js/hash-engine.js, the Web Worker behind the Hash
+Generator on convertors.html: both print the same digests for the same bytes.
+Each file is memory-mapped and fed to every selected hash a window at a time,
+so it is read once and never copied into Python memory. Output uses the tagged
+`sha256sum --tag` layout, the same as the page's _hashes.txt download.
+
+    python hash_files.py backup.iso
+    python hash_files.py *.zip -a SHA-256 -a MD5
+"""
+
+import os
+import sys
+import json
+import mmap
+import time
+import random
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+
+HASH_ENGINE_JS = 'assets/js/hash-engine.js'
+
+ALGORITHMS = {'MD5': 'md5', 'SHA-1': 'sha1', 'SHA-256': 'sha256', 'SHA-512': 'sha512'}
+CHUNK_BYTES = 4 * 1024 * 1024
+
+
+def hash_file(path, algorithms=tuple(ALGORITHMS), chunk_bytes=CHUNK_BYTES):
+    """Hex digests of the file at path: {algorithm: hex}, every algorithm fed from the same mapped window."""
+    hashers = {name: hashlib.new(ALGORITHMS[name]) for name in algorithms}
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        # An empty file cannot be mapped, and its digests are those of no bytes
+        if size:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                for offset in range(0, size, chunk_bytes):
+                    with view[offset:offset + chunk_bytes] as window:
+                        for hasher in hashers.values():
+                            hasher.update(window)
+    return {name: hasher.hexdigest() for name, hasher in hashers.items()}
+
+
+def tagged_lines(name, digests):
+    return [f"{algorithm} ({name}) = {digest}" for algorithm, digest in digests.items()]
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8'));
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+(async () => {
+    const results = [];
+    for (const { path, pieces, chunk } of cases) {
+        const data = fs.readFileSync(path);
+        if (chunk) {
+            // The worker's path: ArrayBuffer chunks sliced from a Blob
+            results.push((await hashFile(new Blob([data]), HASH_ALGORITHMS, null, chunk)).digests);
+            continue;
+        }
+        const hashers = HASH_ALGORITHMS.map(createHasher);
+        let offset = 0;
+        for (const size of pieces.concat([data.length])) {
+            const piece = data.subarray(offset, offset + size);
+            hashers.forEach(hasher => hasher.update(piece));
+            offset += piece.length;
+        }
+        const digests = {};
+        hashers.forEach(hasher => { digests[hasher.algorithm] = hasher.digest(); });
+        results.push(digests);
+    }
+    process.stdout.write(JSON.stringify(results));
+})();
+"""
+
+
+def parity(count=600):
+    """Hash random files with hash-engine.js under Node, fed in random-sized pieces or read from a Blob in
+    small chunks, and require the digests hashlib gives. Lengths cover every padding case around the 64
+    and 128 byte blocks. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    rng = random.Random(23)
+    directory = tempfile.mkdtemp()
+    try:
+        cases = []
+        for i in range(count):
+            size = i if i < 300 else rng.randint(0, 200000)
+            path = os.path.join(directory, f'{i}.bin')
+            with open(path, 'wb') as f:
+                f.write(rng.randbytes(size))
+            pieces = [rng.randint(0, 300) for _ in range(rng.randint(0, 20))]
+            cases.append({'path': path, 'pieces': pieces, 'chunk': rng.randint(1, 5000) if i % 4 == 0 else 0})
+        cases_file = os.path.join(directory, 'cases.json')
+        with open(cases_file, 'w', encoding='utf-8') as f:
+            json.dump(cases, f)
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                                          *HASH_ENGINE_JS.split('/')), cases_file],
+                                   capture_output=True, text=True, check=True)
+        mismatches = 0
+        for case, js in zip(cases, json.loads(completed.stdout)):
+            ours = hash_file(case['path'], chunk_bytes=rng.randint(1, 70000))
+            if js != ours:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   {case['path']} ({os.path.getsize(case['path'])} bytes): js {js}, python {ours}")
+    finally:
+        shutil.rmtree(directory)
+    print(f"{'✅' if not mismatches else '❌'} {count - mismatches}/{count} files hash the same in {HASH_ENGINE_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, path, mode] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8'));
+(async () => {
+    const start = performance.now();
+    if (mode === 'previous') {
+        // The previous convertors.html code: the whole file as text, re-encoded, then one-shot Web Crypto
+        const data = new TextEncoder().encode(fs.readFileSync(path, 'utf8'));
+        await crypto.subtle.digest('SHA-256', data);
+        await crypto.subtle.digest('SHA-1', data);
+    } else {
+        // A file-backed Blob, like the File the page hands to the worker
+        await hashFile(await fs.openAsBlob(path), mode === 'all' ? HASH_ALGORITHMS : [mode]);
+    }
+    const seconds = (performance.now() - start) / 1000;
+    process.stdout.write(JSON.stringify({ seconds, maxRSS: process.resourceUsage().maxRSS }));
+})();
+"""
+
+
+def benchmark(megabytes=256):
+    """Time hashing a random file of `megabytes` MB with hash_file, with hash-engine.js (all algorithms in
+    one pass, then each alone) and with the code convertors.html used before."""
+    node = shutil.which('node')
+    source = os.path.join(os.path.dirname(os.path.abspath(__file__)), *HASH_ENGINE_JS.split('/'))
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, 'data.bin')
+        rng = random.Random(23)
+        with open(path, 'wb') as f:
+            for _ in range(megabytes):
+                f.write(rng.randbytes(1024 * 1024))
+        print(f"{megabytes} MB of random bytes")
+        start = time.perf_counter()
+        hash_file(path)
+        seconds = time.perf_counter() - start
+        print(f"  Python, all four: {seconds:.2f}s ({megabytes / seconds:.0f} MB/s)")
+        if not node:
+            return
+        runs = [('all', 'hash-engine.js, all four in one pass')]
+        runs += [(name, f'hash-engine.js, {name} alone') for name in ALGORITHMS]
+        runs += [('previous', 'previous page code, SHA-256 + SHA-1 of the text')]
+        for mode, label in runs:
+            completed = subprocess.run([node, '-e', _BENCHMARK_JS, source, path, mode], capture_output=True, text=True)
+            if completed.returncode:
+                print(f"  JavaScript ({label}): fails ({completed.stderr.strip().splitlines()[-1]})")
+                continue
+            js = json.loads(completed.stdout)
+            print(f"  JavaScript ({label}): {js['seconds']:.2f}s ({megabytes / js['seconds']:.0f} MB/s), "
+                  f"peak memory {js['maxRSS'] / 1024:.0f} MB")
+    finally:
+        shutil.rmtree(directory)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="MD5, SHA-1, SHA-256 and SHA-512 of files of any size, in one pass.")
+    parser.add_argument('files', nargs='*', help="files to hash")
+    parser.add_argument('-a', '--algorithm', action='append', choices=list(ALGORITHMS),
+                        help="an algorithm to compute (repeatable; default: all four)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/hash-engine.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='MB', help="benchmark hashing a file of MB megabytes")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if not args.files:
+        parse_args(['--help'])
+    algorithms = args.algorithm or list(ALGORITHMS)
+    failed = False
+    for path in args.files:
+        start = time.perf_counter()
+        try:
+            digests = hash_file(path, algorithms)
+        except OSError as e:
+            print(f"❌ {e}")
+            failed = True
+            continue
+        seconds = time.perf_counter() - start
+        print('\n'.join(tagged_lines(path, digests)))
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"📊 {size:.1f} MB in {seconds:.2f}s ({size / seconds if seconds else 0:.0f} MB/s)", file=sys.stderr)
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,411 @@
+#!/usr/bin/env python3
+"""
+Streaming indicators for price series of any length.
+
+The same single-pass algorithms back the crypto analytics calculators through
+assets/js/indicators.js: every indicator takes one tick at a time in O(1) time
+and memory (Wilder RSI, Welford volatility, running maximum drawdown, online
+correlation), with the same floating-point operations in the same order so
+both sides produce identical numbers.
+
+Long series are stored as raw little-endian float64 files (.f64) and memory
+mapped, so a file of millions of ticks is never loaded into memory:
+
+    python indicators.py pack btc.csv -o btc.f64 --column close
+    python indicators.py stats btc.f64 --with eth.f64 --rsi-period 14
+"""
+
+import os
+import csv
+import sys
+import json
+import math
+import mmap
+import time
+import random
+import shutil
+import struct
+import argparse
+import tempfile
+import subprocess
+
+from build_io import atomic_open
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INDICATORS_JS = 'assets/js/indicators.js'
+
+CHUNK_TICKS = 65536
+RSI_PERIOD = 14
+TRADING_DAYS = 365
+
+_FLOAT64 = struct.Struct('<d')
+
+
+class Welford:
+    """Online mean and population variance, plus the extremes seen."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def push(self, x):
+        self.count += 1
+        delta = x - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (x - self.mean)
+        # x != x: a NaN value makes the extremes NaN, as in the JS accumulator
+        if x < self.min or x != x:
+            self.min = x
+        if x > self.max or x != x:
+            self.max = x
+
+    def variance(self):
+        return self.m2 / self.count if self.count else math.nan
+
+
+class Drawdown:
+    """Running maximum drawdown from the highest price seen so far."""
+
+    def __init__(self):
+        self.count = 0
+        self.max_drawdown = 0.0
+        self.peak = self.valley = self.current_peak = math.nan
+        self.peak_index = self.valley_index = self.current_peak_index = 0
+
+    def push(self, price):
+        if self.count == 0:
+            self.peak = self.valley = self.current_peak = price
+        else:
+            if price > self.current_peak:
+                self.current_peak = price
+                self.current_peak_index = self.count
+            drawdown = _divide(self.current_peak - price, self.current_peak)
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+                self.peak = self.current_peak
+                self.peak_index = self.current_peak_index
+                self.valley = price
+                self.valley_index = self.count
+        self.count += 1
+
+
+class Correlation:
+    """Online Pearson correlation from Welford-style co-moments."""
+
+    def __init__(self):
+        self.count = 0
+        self.mean_x = self.mean_y = 0.0
+        self.m2x = self.m2y = self.cxy = 0.0
+
+    def push(self, x, y):
+        self.count += 1
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.mean_x += dx / self.count
+        self.mean_y += dy / self.count
+        self.m2x += dx * (x - self.mean_x)
+        self.m2y += dy * (y - self.mean_y)
+        self.cxy += dx * (y - self.mean_y)
+
+    def correlation(self):
+        return _divide(self.cxy, math.sqrt(self.m2x * self.m2y))
+
+
+class RSI:
+    """Wilder's RSI: plain average of the first `period` changes, then Wilder smoothing."""
+
+    def __init__(self, period=RSI_PERIOD):
+        self.period = period
+        self.count = 0
+        self.previous = math.nan
+        self.gain_sum = self.loss_sum = 0.0
+        self.average_gain = self.average_loss = 0.0
+
+    def push(self, price):
+        changes = self.count
+        self.count += 1
+        if changes > 0:
+            change = price - self.previous
+            gain = change if change > 0 else 0.0
+            loss = -change if change < 0 else 0.0
+            if changes <= self.period:
+                self.gain_sum += gain
+                self.loss_sum += loss
+                self.average_gain = self.gain_sum / changes
+                self.average_loss = self.loss_sum / changes
+            else:
+                self.average_gain = (self.average_gain * (self.period - 1) + gain) / self.period
+                self.average_loss = (self.average_loss * (self.period - 1) + loss) / self.period
+        self.previous = price
+
+    def ready(self):
+        return self.count > self.period
+
+    def rsi(self):
+        if self.average_loss == 0:
+            return 50.0 if self.average_gain == 0 else 100.0
+        return 100 - 100 / (1 + self.average_gain / self.average_loss)
+
+
+def _divide(a, b):
+    """a / b with JavaScript semantics for a zero divisor."""
+    try:
+        return a / b
+    except ZeroDivisionError:
+        if a == 0 or math.isnan(a):
+            return math.nan
+        return math.copysign(math.inf, a) * math.copysign(1, b)
+
+
+def series_stats(prices, other=None, rsi_period=RSI_PERIOD):
+    """One pass over prices, and optionally a second price series whose returns
+    are correlated with those of the first.
+
+    prices and other are iterables of floats. Returns a dict of indicator values.
+    """
+    returns = Welford()
+    drawdown = Drawdown()
+    rsi = RSI(rsi_period)
+    correlation = Correlation() if other is not None else None
+    other = iter(other) if other is not None else None
+    previous = previous_other = None
+    for price in prices:
+        drawdown.push(price)
+        rsi.push(price)
+        if previous is not None:
+            daily_return = _divide(price - previous, previous)
+            returns.push(daily_return)
+        previous = price
+        if other is not None:
+            value = next(other, None)
+            if value is None:
+                raise ValueError("The second series is shorter than the first")
+            if previous_other is not None:
+                correlation.push(daily_return, _divide(value - previous_other, previous_other))
+            previous_other = value
+    if other is not None and next(other, None) is not None:
+        raise ValueError("The second series is longer than the first")
+
+    daily = math.sqrt(returns.variance()) if returns.count else math.nan
+    stats = {
+        'ticks': drawdown.count,
+        'daily_volatility': daily,
+        'annualized_volatility': daily * math.sqrt(TRADING_DAYS),
+        'max_return': returns.max if returns.count else math.nan,
+        'min_return': returns.min if returns.count else math.nan,
+        'max_drawdown': drawdown.max_drawdown,
+        'peak': drawdown.peak,
+        'peak_index': drawdown.peak_index,
+        'valley': drawdown.valley,
+        'valley_index': drawdown.valley_index,
+        'rsi': rsi.rsi() if rsi.ready() else math.nan,
+    }
+    if correlation is not None:
+        stats['correlation'] = correlation.correlation() if correlation.count >= 2 else math.nan
+    return stats
+
+
+def pack(in_file, out_file, column=None):
+    """Convert a CSV (or one price per line) into a .f64 file. Returns the number of ticks."""
+    count = 0
+    with open(in_file, 'r', encoding='utf-8', newline='') as source, atomic_open(out_file, 'wb') as out:
+        reader = csv.reader(source)
+        position = 0
+        if column is not None:
+            header = next(reader, [])
+            if column not in header:
+                raise ValueError(f"Column '{column}' not found in {in_file}")
+            position = header.index(column)
+        buffer = bytearray()
+        for row in reader:
+            if len(row) <= position or not row[position].strip():
+                continue
+            try:
+                value = float(row[position])
+            except ValueError:
+                if count == 0 and column is None:
+                    continue  # header line
+                raise ValueError(f"Not a number on row {reader.line_num}: {row[position]!r}") from None
+            buffer += _FLOAT64.pack(value)
+            count += 1
+            if len(buffer) >= CHUNK_TICKS * 8:
+                out.write(buffer)
+                buffer.clear()
+        out.write(buffer)
+    return count
+
+
+def open_series(path):
+    """Memory-map a .f64 file as a read-only array of floats (NumPy memmap or memoryview)."""
+    size = os.path.getsize(path)
+    if size % 8:
+        raise ValueError(f"{path} is not a float64 file ({size} bytes)")
+    if size == 0:
+        return []
+    if np is not None:
+        return np.memmap(path, dtype='<f8', mode='r')
+    if sys.byteorder != 'little':
+        raise ValueError("Reading .f64 files without NumPy needs a little-endian machine")
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped).cast('d')
+
+
+def iter_series(path, chunk_ticks=CHUNK_TICKS):
+    """Yield the ticks of a .f64 file, converting one chunk of the mapping at a time."""
+    series = open_series(path)
+    for start in range(0, len(series), chunk_ticks):
+        yield from series[start:start + chunk_ticks].tolist()
+
+
+def format_stats(stats):
+    lines = [
+        f"Ticks: {stats['ticks']:,}",
+        f"Daily Volatility: {stats['daily_volatility'] * 100:.2f}%",
+        f"Annualized Volatility: {stats['annualized_volatility'] * 100:.2f}%",
+        f"Max Daily Return: {stats['max_return'] * 100:.2f}%",
+        f"Min Daily Return: {stats['min_return'] * 100:.2f}%",
+        f"Maximum Drawdown: {stats['max_drawdown'] * 100:.2f}%",
+        f"Peak Value: {stats['peak']:.2f} (point {stats['peak_index'] + 1})",
+        f"Valley Value: {stats['valley']:.2f} (point {stats['valley_index'] + 1})",
+        f"RSI: {stats['rsi']:.1f}",
+    ]
+    if 'correlation' in stats:
+        lines.append(f"Correlation of Returns: {stats['correlation']:.4f}")
+    return '\n'.join(lines)
+
+
+def random_walk(count, seed=None):
+    rng = random.Random(seed)
+    price = 100.0
+    for _ in range(count):
+        price *= 1 + rng.gauss(0.0002, 0.02)
+        yield price
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8'), context);
+const run = vm.runInContext(`(function (prices, other, period) {
+    const returns = createWelford(), dd = createDrawdown(), rsi = createRSI(period), corr = createCorrelation();
+    for (let i = 0; i < prices.length; i++) {
+        dd.push(prices[i]);
+        rsi.push(prices[i]);
+        if (i > 0) {
+            const r = (prices[i] - prices[i - 1]) / prices[i - 1];
+            returns.push(r);
+            corr.push(r, (other[i] - other[i - 1]) / other[i - 1]);
+        }
+    }
+    return [Math.sqrt(returns.variance()), returns.max, returns.min, dd.maxDrawdown, dd.peakIndex,
+            dd.valleyIndex, rsi.ready() ? rsi.rsi() : NaN, corr.correlation()].map(String);
+})`, context);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+process.stdout.write(JSON.stringify(cases.map(([prices, other, period]) => run(prices, other, period))));
+"""
+
+
+def parity(cases=300):
+    """Run indicators.js under Node on random series and require bit-identical results.
+    Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    rng = random.Random(13)
+    series = []
+    for i in range(cases):
+        length = rng.randint(3, 400)
+        series.append([list(random_walk(length, rng.random())), list(random_walk(length, rng.random())),
+                       rng.choice([2, 5, 14, 30])])
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(series, f)
+    try:
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(base_path, *INDICATORS_JS.split('/')), f.name],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        os.remove(f.name)
+
+    mismatches = 0
+    for (prices, other, period), js in zip(series, json.loads(completed.stdout)):
+        stats = series_stats(prices, other, period)
+        ours = [stats['daily_volatility'], stats['max_return'], stats['min_return'], stats['max_drawdown'],
+                stats['peak_index'], stats['valley_index'], stats['rsi'], stats['correlation']]
+        if [repr(float(value)) for value in js] != [repr(float(value)) for value in ours]:
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"   {len(prices)} ticks, RSI {period}: js {js}, python {ours}")
+    print(f"{'✅' if not mismatches else '❌'} {cases - mismatches}/{cases} series identical to {INDICATORS_JS}")
+    return mismatches
+
+
+def benchmark(count=1000000):
+    """Time a full pass over a memory-mapped series of `count` ticks."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'ticks.f64')
+        with open(path, 'wb') as f:
+            ticks = random_walk(count, 1)
+            while True:
+                chunk = [tick for _, tick in zip(range(CHUNK_TICKS), ticks)]
+                if not chunk:
+                    break
+                f.write(struct.pack(f'<{len(chunk)}d', *chunk))
+        start = time.perf_counter()
+        stats = series_stats(iter_series(path), iter_series(path))
+        seconds = time.perf_counter() - start
+    print(f"Backend: {'NumPy memmap' if np is not None else 'mmap + memoryview (NumPy not installed)'}")
+    print(f"{stats['ticks']:,} ticks (x2 series, {count * 16 / 1048576:.1f} MB) in {seconds:.2f}s "
+          f"-> {count / seconds:,.0f} ticks/s")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Streaming price indicators over memory-mapped tick files.")
+    parser.add_argument('command', nargs='?', choices=['pack', 'stats'],
+                        help="pack: convert a CSV of prices to .f64; stats: indicators of a .f64 file")
+    parser.add_argument('input', nargs='?', help="input CSV (pack) or .f64 file (stats)")
+    parser.add_argument('-o', '--output', help="output .f64 file (pack)")
+    parser.add_argument('--column', help="CSV column holding the prices (default: first column)")
+    parser.add_argument('--with', dest='other', metavar='F64', help="second .f64 series to correlate returns with")
+    parser.add_argument('--rsi-period', type=int, default=RSI_PERIOD, help=f"RSI period (default {RSI_PERIOD})")
+    parser.add_argument('--json', action='store_true', help="print stats as JSON")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/indicators.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark a pass over N ticks")
+    args = parser.parse_args(argv)
+    if args.command and not args.input:
+        parser.error(f"{args.command} needs an input file")
+    if args.command == 'pack' and not args.output:
+        parser.error("pack needs -o/--output")
+    if args.rsi_period < 1:
+        parser.error("--rsi-period must be positive")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    try:
+        if args.command == 'pack':
+            ticks = pack(args.input, args.output, args.column)
+            print(f"Packed {ticks:,} ticks -> {args.output}")
+        elif args.command == 'stats':
+            other = iter_series(args.other) if args.other else None
+            stats = series_stats(iter_series(args.input), other, args.rsi_period)
+            print(json.dumps(stats, indent=2) if args.json else format_stats(stats))
+        else:
+            parse_args(['--help'])
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""
+Dense linear algebra for matrices stored as flat row-major float64 arrays.
+
+The same algorithms back the matrix calculator through assets/js/matrix.js:
+LU decomposition with partial pivoting for determinants, inverses and linear
+solves, Gaussian elimination for rank and a blocked i-k-j product, with the
+floating-point operations in the same order so both sides produce identical
+numbers. Matrices are CSV files, one row per line:
+
+    python matrix.py det A.csv
+    python matrix.py solve A.csv b.csv -o x.csv
+    python matrix.py multiply A.csv B.csv -o C.csv
+    python matrix.py --benchmark 300
+"""
+
+import os
+import csv
+import sys
+import json
+import time
+import array
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from build_io import atomic_open
+
+MATRIX_JS = 'assets/js/matrix.js'
+
+EPSILON = sys.float_info.epsilon
+
+
+class Matrix:
+    """rows x cols entries in one flat row-major array('d'); (i, j) is data[i * cols + j]."""
+
+    def __init__(self, rows, cols, data=None):
+        self.rows = rows
+        self.cols = cols
+        self.data = data if data is not None else array.array('d', bytes(8 * rows * cols))
+
+    @classmethod
+    def from_rows(cls, rows):
+        cols = len(rows[0])
+        for i, row in enumerate(rows):
+            if len(row) != cols:
+                raise ValueError(f"Row {i + 1} has {len(row)} elements, expected {cols}")
+        return cls(len(rows), cols, array.array('d', (float(value) for row in rows for value in row)))
+
+    @classmethod
+    def identity(cls, n):
+        matrix = cls(n, n)
+        for i in range(n):
+            matrix.data[i * n + i] = 1.0
+        return matrix
+
+    def row(self, i):
+        return self.data[i * self.cols:(i + 1) * self.cols]
+
+    def to_rows(self):
+        return [list(self.row(i)) for i in range(self.rows)]
+
+
+def read_matrix(path):
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        rows = [[float(value) for value in row] for row in csv.reader(f) if row]
+    if not rows:
+        raise ValueError(f"{path} has no rows")
+    return Matrix.from_rows(rows)
+
+
+def write_matrix(path, matrix):
+    with atomic_open(path, 'w', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        for i in range(matrix.rows):
+            writer.writerow([repr(value) for value in matrix.row(i)])
+
+
+def add(a, b):
+    if (a.rows, a.cols) != (b.rows, b.cols):
+        raise ValueError(f"Cannot add a {a.rows}×{a.cols} and a {b.rows}×{b.cols} matrix")
+    return Matrix(a.rows, a.cols, array.array('d', map(float.__add__, a.data, b.data)))
+
+
+def multiply(a, b):
+    """Row-by-row product that adds the terms of each entry in the same groups of four rows
+    of b as the blocked product in matrix.js, so the results are identical."""
+    if a.cols != b.rows:
+        raise ValueError(f"Cannot multiply a {a.rows}×{a.cols} by a {b.rows}×{b.cols} matrix")
+    n, m, p = a.rows, a.cols, b.cols
+    product = Matrix(n, p)
+    b_rows = [b.row(k) for k in range(m)]
+    grouped = m - m % 4
+    for i in range(n):
+        a_row = a.row(i)
+        row = [0.0] * p
+        for k in range(0, grouped, 4):
+            a0, a1, a2, a3 = a_row[k:k + 4]
+            row = [c + (a0 * v0 + a1 * v1 + a2 * v2 + a3 * v3)
+                   for c, v0, v1, v2, v3 in zip(row, *b_rows[k:k + 4])]
+        for k in range(grouped, m):
+            aik = a_row[k]
+            row = [c + aik * v for c, v in zip(row, b_rows[k])]
+        product.data[i * p:(i + 1) * p] = array.array('d', row)
+    return product
+
+
+def transpose(a):
+    t = Matrix(a.cols, a.rows)
+    for i in range(a.rows):
+        t.data[i::a.rows] = a.row(i)
+    return t
+
+
+def _swap_rows(data, cols, r1, r2):
+    row = data[r1 * cols:(r1 + 1) * cols]
+    data[r1 * cols:(r1 + 1) * cols] = data[r2 * cols:(r2 + 1) * cols]
+    data[r2 * cols:(r2 + 1) * cols] = row
+
+
+def lu_decompose(a):
+    """PA = LU with partial pivoting, in one flat array (L below the diagonal, unit diagonal
+    implied). Returns (lu, pivots, sign, singular); a pivot no larger than n * eps * max|a|
+    counts as zero."""
+    if a.rows != a.cols:
+        raise ValueError(f"A {a.rows}×{a.cols} matrix is not square")
+    n = a.rows
+    lu = array.array('d', a.data)
+    pivots = [0] * n
+    tolerance = n * EPSILON * max(map(abs, lu), default=0.0)
+    sign = 1
+    singular = False
+    for k in range(n):
+        p = k
+        largest = abs(lu[k * n + k])
+        for i in range(k + 1, n):
+            v = abs(lu[i * n + k])
+            if v > largest:
+                largest = v
+                p = i
+        pivots[k] = p
+        if p != k:
+            _swap_rows(lu, n, k, p)
+            sign = -sign
+        if largest <= tolerance:
+            singular = True
+            continue
+        pivot = lu[k * n + k]
+        row_k = lu[k * n + k + 1:(k + 1) * n]
+        for i in range(k + 1, n):
+            factor = lu[i * n + k] / pivot
+            lu[i * n + k] = factor
+            if factor == 0:
+                continue
+            start = i * n + k + 1
+            lu[start:(i + 1) * n] = array.array('d', [v - factor * u for v, u in zip(lu[start:(i + 1) * n], row_k)])
+    return lu, pivots, sign, singular
+
+
+def determinant(a):
+    lu, _, sign, singular = lu_decompose(a)
+    if singular:
+        return 0.0
+    det = float(sign)
+    for i in range(a.rows):
+        det *= lu[i * a.rows + i]
+    return det
+
+
+def solve(a, b):
+    """X with AX = B (B is n x m). Raises ValueError when A is singular."""
+    lu, pivots, _, singular = lu_decompose(a)
+    if singular:
+        raise ValueError("The matrix is singular")
+    n, m = a.rows, b.cols
+    if b.rows != n:
+        raise ValueError(f"Right-hand side has {b.rows} rows, expected {n}")
+    x = array.array('d', b.data)
+    for k, p in enumerate(pivots):
+        if p != k:
+            _swap_rows(x, m, k, p)
+    rows = [x[i * m:(i + 1) * m] for i in range(n)]
+    # Forward substitution with unit-diagonal L, then back substitution with U, all columns at once
+    for i in range(n):
+        row = rows[i]
+        for k in range(i):
+            l = lu[i * n + k]
+            if l != 0:
+                row = array.array('d', [v - l * u for v, u in zip(row, rows[k])])
+        rows[i] = row
+    for i in range(n - 1, -1, -1):
+        row = rows[i]
+        for k in range(i + 1, n):
+            u = lu[i * n + k]
+            if u != 0:
+                row = array.array('d', [v - u * w for v, w in zip(row, rows[k])])
+        diagonal = lu[i * n + i]
+        rows[i] = array.array('d', [v / diagonal for v in row])
+    for i, row in enumerate(rows):
+        x[i * m:(i + 1) * m] = row
+    return Matrix(n, m, x)
+
+
+def inverse(a):
+    return solve(a, Matrix.identity(a.rows))
+
+
+def rank(a):
+    """Rank by Gaussian elimination with partial pivoting (any shape)."""
+    rows, cols = a.rows, a.cols
+    data = array.array('d', a.data)
+    tolerance = max(rows, cols) * EPSILON * max(map(abs, data), default=0.0)
+    r = 0
+    for col in range(cols):
+        if r == rows:
+            break
+        p = r
+        largest = abs(data[r * cols + col])
+        for i in range(r + 1, rows):
+            v = abs(data[i * cols + col])
+            if v > largest:
+                largest = v
+                p = i
+        if largest <= tolerance:
+            continue
+        _swap_rows(data, cols, r, p)
+        pivot_row = data[r * cols + col:(r + 1) * cols]
+        for i in range(r + 1, rows):
+            factor = data[i * cols + col] / pivot_row[0]
+            if factor == 0:
+                continue
+            start = i * cols + col
+            data[start:(i + 1) * cols] = array.array('d', [v - factor * u for v, u in zip(data[start:(i + 1) * cols], pivot_row)])
+        r += 1
+    return r
+
+
+def random_matrix(rows, cols, rng, integers=False):
+    if integers:
+        return Matrix(rows, cols, array.array('d', (rng.randint(-9, 9) for _ in range(rows * cols))))
+    return Matrix(rows, cols, array.array('d', (rng.uniform(-1, 1) for _ in range(rows * cols))))
+
+
+def _parity_cases(count, seed=16):
+    rng = random.Random(seed)
+    cases = []
+    for i in range(count):
+        n = rng.randint(1, 12)
+        integers = i % 2 == 0
+        a = random_matrix(n, n, rng, integers)
+        if i % 5 == 0 and n > 1:
+            # Make one row a combination of two others so rank and singularity are exercised
+            r1, r2, r3 = rng.randrange(n), rng.randrange(n), rng.randrange(n)
+            a.data[r3 * n:(r3 + 1) * n] = array.array('d', [2 * u - v for u, v in zip(a.row(r1), a.row(r2))])
+        cases.append((a, random_matrix(n, rng.randint(1, 3), rng, integers)))
+    return cases
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8') + ';this.m = { createMatrix, determinant, solveMatrix, ' +
+    'matrixRank, multiplyMatrices, transposeMatrix };', context);
+const m = context.m;
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+const matrix = ([rows, cols, data]) => m.createMatrix(rows, cols, Float64Array.from(data));
+// String(-0) is '0': keep the sign so negative zeros are compared too
+const text = (values) => Array.from(values).map(v => (Object.is(v, -0) ? '-0' : String(v)));
+process.stdout.write(JSON.stringify(cases.map(([a, b]) => {
+    a = matrix(a);
+    b = matrix(b);
+    let x = null;
+    try { x = text(m.solveMatrix(a, b).data); } catch (e) { x = e.message; }
+    return [text([m.determinant(a)])[0], m.matrixRank(a), x,
+            text(m.multiplyMatrices(a, b).data), text(m.multiplyMatrices(m.transposeMatrix(b), a).data)];
+})));
+"""
+
+
+def parity(count=500):
+    """Run matrix.js under Node on random (and deliberately singular) matrices and require
+    bit-identical determinants, ranks, solutions and products. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    cases = _parity_cases(count)
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump([[[a.rows, a.cols, list(a.data)], [b.rows, b.cols, list(b.data)]] for a, b in cases], f)
+    try:
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(base_path, *MATRIX_JS.split('/')), f.name],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        os.remove(f.name)
+
+    mismatches = 0
+    for (a, b), js in zip(cases, json.loads(completed.stdout)):
+        try:
+            x = [repr(v) for v in solve(a, b).data]
+        except ValueError as e:
+            x = str(e)
+        ours = [determinant(a), rank(a), x, multiply(a, b).data, multiply(transpose(b), a).data]
+        js_det, js_rank, js_x, js_ab, js_ba = js
+        js_x = [repr(float(v)) for v in js_x] if isinstance(js_x, list) else js_x
+        js_ab, js_ba = [[repr(float(v)) for v in values] for values in (js_ab, js_ba)]
+        if (repr(float(js_det)), js_rank, js_x, js_ab, js_ba) != \
+                (repr(ours[0]), ours[1], ours[2], [repr(v) for v in ours[3]], [repr(v) for v in ours[4]]):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"   {a.rows}×{a.cols}: js det {js_det} rank {js_rank}, python det {ours[0]!r} rank {ours[1]}")
+    print(f"{'✅' if not mismatches else '❌'} {count - mismatches}/{count} matrices match {MATRIX_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, size] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8') + ';globalThis.la = { createMatrix, determinant, invertMatrix, ' +
+    'multiplyMatrices, matrixRank };');
+const n = Number(size);
+let seed = 16;
+const random = () => (seed = (seed * 1103515245 + 12345) % 2147483648) / 2147483648 - 0.5;
+const nested = Array.from({ length: n }, () => Array.from({ length: n }, random));
+const flat = la.createMatrix(n, n, Float64Array.from(nested.flat()));
+const time = (fn) => { fn(); const start = process.hrtime.bigint(); fn(); return Number(process.hrtime.bigint() - start) / 1e6; };
+
+// Naive baselines on nested arrays
+const naiveMultiply = (a, b) => a.map((row, i) => b[0].map((_, j) => {
+    let sum = 0;
+    for (let k = 0; k < b.length; k++) sum += a[i][k] * b[k][j];
+    return sum;
+}));
+const cofactorDeterminant = (m) => m.length === 1 ? m[0][0] : m[0].reduce((det, value, j) =>
+    det + (j % 2 ? -1 : 1) * value * cofactorDeterminant(m.slice(1).map(row => row.filter((_, c) => c !== j))), 0);
+const gaussJordanInverse = (m) => {
+    const a = m.map((row, i) => [...row, ...row.map((_, j) => (i === j ? 1 : 0))]);
+    for (let k = 0; k < n; k++) {
+        let p = k;
+        for (let i = k + 1; i < n; i++) if (Math.abs(a[i][k]) > Math.abs(a[p][k])) p = i;
+        [a[k], a[p]] = [a[p], a[k]];
+        const pivot = a[k][k];
+        a[k] = a[k].map(v => v / pivot);
+        for (let i = 0; i < n; i++) if (i !== k) { const f = a[i][k]; a[i] = a[i].map((v, j) => v - f * a[k][j]); }
+    }
+    return a.map(row => row.slice(n));
+};
+const small = nested.slice(0, 9).map(row => row.slice(0, 9));
+const smallFlat = la.createMatrix(9, 9, Float64Array.from(small.flat()));
+process.stdout.write(JSON.stringify({
+    multiply: [time(() => la.multiplyMatrices(flat, flat)), time(() => naiveMultiply(nested, nested))],
+    inverse: [time(() => la.invertMatrix(flat)), time(() => gaussJordanInverse(nested))],
+    determinant: [time(() => la.determinant(flat)), null],
+    rank: [time(() => la.matrixRank(flat)), null],
+    determinant9: [time(() => la.determinant(smallFlat)), time(() => cofactorDeterminant(small))]
+}));
+"""
+
+
+def benchmark(size=300):
+    """Time matrix.js against naive nested-array code under Node, then this module in Python."""
+    node = shutil.which('node')
+    if node:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        completed = subprocess.run([node, '-e', _BENCHMARK_JS, os.path.join(base_path, *MATRIX_JS.split('/')), str(size)],
+                                   capture_output=True, text=True, check=True)
+        results = json.loads(completed.stdout)
+        labels = {
+            'multiply': (f"{size}×{size} multiply", "blocked, unrolled", "nested i-j-k"),
+            'inverse': (f"{size}×{size} inverse", "LU solve", "Gauss-Jordan, nested"),
+            'determinant': (f"{size}×{size} determinant", "LU", None),
+            'rank': (f"{size}×{size} rank", "elimination", None),
+            'determinant9': ("9×9 determinant", "LU", "cofactor expansion"),
+        }
+        print("JavaScript (matrix.js vs naive nested arrays, under Node):")
+        for key, (label, ours, naive) in labels.items():
+            fast, slow = results[key]
+            line = f"  {label:<22} {ours:<18} {fast:9.2f} ms"
+            if slow is not None:
+                line += f"   {naive:<22} {slow:10.2f} ms  ({slow / fast:,.1f}x)"
+            print(line)
+    else:
+        print("⚠️  node not found, JavaScript benchmark skipped")
+
+    rng = random.Random(16)
+    a = random_matrix(size, size, rng)
+    print("Python (pure, array('d')):")
+    for label, fn in ((f"{size}×{size} multiply", lambda: multiply(a, a)),
+                      (f"{size}×{size} inverse", lambda: inverse(a)),
+                      (f"{size}×{size} determinant", lambda: determinant(a)),
+                      (f"{size}×{size} rank", lambda: rank(a))):
+        start = time.perf_counter()
+        fn()
+        print(f"  {label:<22} {(time.perf_counter() - start) * 1000:9.1f} ms")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Dense linear algebra on CSV matrices.")
+    parser.add_argument('command', nargs='?', choices=['det', 'rank', 'inverse', 'solve', 'multiply', 'add', 'transpose'],
+                        help="operation to run")
+    parser.add_argument('matrices', nargs='*', help="CSV matrix files (A, then B or b)")
+    parser.add_argument('-o', '--output', help="write the resulting matrix to this CSV (default: print it)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/matrix.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark N×N matrices against naive code")
+    args = parser.parse_args(argv)
+    needed = 2 if args.command in ('solve', 'multiply', 'add') else 1
+    if args.command and len(args.matrices) != needed:
+        parser.error(f"{args.command} needs {needed} matrix file{'s' if needed > 1 else ''}")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if not args.command:
+        parse_args(['--help'])
+    try:
+        matrices = [read_matrix(path) for path in args.matrices]
+        if args.command == 'det':
+            print(f"Determinant: {determinant(matrices[0])!r}")
+        elif args.command == 'rank':
+            print(f"Rank: {rank(matrices[0])}")
+        else:
+            operations = {'inverse': inverse, 'solve': solve, 'multiply': multiply, 'add': add, 'transpose': transpose}
+            result = operations[args.command](*matrices)
+            if args.output:
+                write_matrix(args.output, result)
+                print(f"{result.rows}×{result.cols} result -> {args.output}")
+            else:
+                for row in result.to_rows():
+                    print(','.join(repr(value) for value in row))
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Black-Scholes / Black-76 option pricing with Greeks and implied volatility.
+
+The same formulas back crypto-options-pricing and crypto-volatility-smile
+through assets/js/options.js. Both models are the generalised Black-Scholes
+formula with cost of carry b: options on spot carry b = r - q, options on
+futures (Black-76) carry b = 0.
+
+price_grid() prices a whole strike x expiry grid in one call; with NumPy it is
+vectorised over the grid, otherwise it loops in plain Python.
+
+    python options.py grid --spot 60000 --strikes 40000:80000:1000 --days 7,30,90 -o grid.csv
+    python options.py implied --price 2300 --spot 60000 --strike 65000 --days 30
+"""
+
+import os
+import csv
+import sys
+import json
+import math
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+
+from build_io import atomic_open
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+OPTIONS_JS = 'assets/js/options.js'
+
+MODELS = ['black-scholes', 'black-76']
+GREEKS = ['price', 'delta', 'gamma', 'vega', 'theta', 'rho']
+DAYS_PER_YEAR = 365
+
+_SQRT_2PI = math.sqrt(2 * math.pi)
+
+# Hart's rational approximation of the normal tail (West 2005), numerator and denominator
+# coefficients from the highest power down
+_HART_N = (3.52624965998911e-02, 0.700383064443688, 6.37396220353165, 33.912866078383,
+           112.079291497871, 221.213596169931, 220.206867912376)
+_HART_D = (8.83883476483184e-02, 1.75566716318264, 16.064177579207, 86.7807322029461,
+           296.564248779674, 637.333633378831, 793.826512519948, 440.413735824752)
+
+
+def norm_cdf(x):
+    """Cumulative standard normal distribution, accurate to double precision."""
+    z = abs(x)
+    c = 0.0
+    if z <= 37:
+        e = math.exp(-z * z / 2)
+        if z < 7.07106781186547:
+            n = _HART_N[0] * z + _HART_N[1]
+            for coefficient in _HART_N[2:]:
+                n = n * z + coefficient
+            d = _HART_D[0] * z + _HART_D[1]
+            for coefficient in _HART_D[2:]:
+                d = d * z + coefficient
+            c = e * n / d
+        else:
+            d = z + 0.65
+            d = z + 4 / d
+            d = z + 3 / d
+            d = z + 2 / d
+            d = z + 1 / d
+            c = e / d / 2.506628274631
+    return 1 - c if x > 0 else c
+
+
+def norm_pdf(x):
+    return math.exp(-x * x / 2) / _SQRT_2PI
+
+
+def price_option(is_call, underlying, strike, t, r, q, vol, model='black-scholes'):
+    """Price and Greeks of one European option as a dict (see GREEKS).
+
+    t in years; r, q and vol as decimals. Theta is per year, vega and rho per 1.00 change.
+    """
+    futures = model == 'black-76'
+    carry = 0.0 if futures else r - q
+    carry_discount = math.exp((carry - r) * t)
+    discount = math.exp(-r * t)
+    forward_value = underlying * carry_discount
+    strike_value = strike * discount
+    sigma_root_t = vol * math.sqrt(t) if t > 0 else 0.0
+
+    if not (t > 0 and sigma_root_t > 0):
+        # Expired or zero volatility: the discounted forward payoff
+        in_money = forward_value > strike_value if is_call else strike_value > forward_value
+        price = (forward_value - strike_value if is_call else strike_value - forward_value) if in_money else 0.0
+        return {
+            'price': price,
+            'delta': (carry_discount if is_call else -carry_discount) if in_money else 0.0,
+            'gamma': 0.0,
+            'vega': 0.0,
+            'theta': 0.0,
+            'rho': -t * price if futures else ((1 if is_call else -1) * strike * t * discount if in_money else 0.0),
+        }
+
+    d1 = (math.log(underlying / strike) + (carry + vol * vol / 2) * t) / sigma_root_t
+    d2 = d1 - sigma_root_t
+    pdf = norm_pdf(d1)
+    decay = -forward_value * pdf * vol / (2 * math.sqrt(t))
+    if is_call:
+        nd1 = norm_cdf(d1)
+        nd2 = norm_cdf(d2)
+        price = forward_value * nd1 - strike_value * nd2
+        delta = carry_discount * nd1
+        theta = decay - (carry - r) * forward_value * nd1 - r * strike_value * nd2
+        rho = -t * price if futures else strike * t * discount * nd2
+    else:
+        nd1 = norm_cdf(-d1)
+        nd2 = norm_cdf(-d2)
+        price = strike_value * nd2 - forward_value * nd1
+        delta = -carry_discount * nd1
+        theta = decay + (carry - r) * forward_value * nd1 + r * strike_value * nd2
+        rho = -t * price if futures else -strike * t * discount * nd2
+    return {
+        'price': price,
+        'delta': delta,
+        'gamma': carry_discount * pdf / (underlying * sigma_root_t),
+        'vega': forward_value * pdf * math.sqrt(t),
+        'theta': theta,
+        'rho': rho,
+    }
+
+
+def implied_volatility(price, is_call, underlying, strike, t, r, q, model='black-scholes'):
+    """Volatility that reproduces a market price, or nan outside the no-arbitrage bounds.
+
+    Newton steps on vega, kept inside a bisection bracket.
+    """
+    lower = price_option(is_call, underlying, strike, t, r, q, 0.0, model)['price']
+    carry = 0.0 if model == 'black-76' else r - q
+    upper = underlying * math.exp((carry - r) * t) if is_call else strike * math.exp(-r * t)
+    if not (t > 0 and lower < price < upper):
+        return math.nan
+
+    low, high, vol = 0.0, 10.0, 0.5
+    for _ in range(100):
+        option = price_option(is_call, underlying, strike, t, r, q, vol, model)
+        diff = option['price'] - price
+        if abs(diff) <= 1e-14 * price:
+            return vol
+        if diff > 0:
+            high = vol
+        else:
+            low = vol
+        step = vol - diff / option['vega'] if option['vega'] else math.nan
+        vol = step if low < step < high else (low + high) / 2
+        if high - low < 1e-15:
+            break
+    return vol
+
+
+def _norm_cdf_array(x):
+    """norm_cdf over a NumPy array (same approximation as the scalar version)."""
+    z = np.abs(x)
+    e = np.exp(-z * z / 2)
+    n = _HART_N[0] * z + _HART_N[1]
+    for coefficient in _HART_N[2:]:
+        n = n * z + coefficient
+    d = _HART_D[0] * z + _HART_D[1]
+    for coefficient in _HART_D[2:]:
+        d = d * z + coefficient
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        tail = z + 0.65
+        for k in (4, 3, 2, 1):
+            tail = z + k / tail
+        c = np.where(z < 7.07106781186547, e * n / d, e / tail / 2.506628274631)
+    c = np.where(z <= 37, c, 0.0)
+    return np.where(x > 0, 1 - c, c)
+
+
+def _grid_numpy(is_call, underlying, strikes, expiries, r, q, vols, model):
+    strike = np.asarray(strikes, dtype=np.float64)[np.newaxis, :]
+    t = np.asarray(expiries, dtype=np.float64)[:, np.newaxis]
+    vol = np.broadcast_to(np.asarray(vols, dtype=np.float64), (len(expiries), len(strikes)))
+    futures = model == 'black-76'
+    carry = 0.0 if futures else r - q
+    carry_discount = np.exp((carry - r) * t)
+    discount = np.exp(-r * t)
+    forward_value = underlying * carry_discount
+    strike_value = strike * discount
+    root_t = np.sqrt(np.maximum(t, 0.0))
+    sigma_root_t = vol * root_t
+    live = (t > 0) & (sigma_root_t > 0)
+    sign = 1.0 if is_call else -1.0
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d1 = (np.log(underlying / strike) + (carry + vol * vol / 2) * t) / sigma_root_t
+        d2 = d1 - sigma_root_t
+        pdf = np.exp(-d1 * d1 / 2) / _SQRT_2PI
+        nd1 = _norm_cdf_array(sign * d1)
+        nd2 = _norm_cdf_array(sign * d2)
+        price = sign * (forward_value * nd1 - strike_value * nd2)
+        delta = sign * carry_discount * nd1
+        gamma = carry_discount * pdf / (underlying * sigma_root_t)
+        vega = forward_value * pdf * root_t
+        theta = (-forward_value * pdf * vol / (2 * root_t)
+                 - sign * (carry - r) * forward_value * nd1 - sign * r * strike_value * nd2)
+        rho = -t * price if futures else sign * strike * t * discount * nd2
+
+    # Expired or zero volatility: the discounted forward payoff
+    payoff = np.maximum(sign * (forward_value - strike_value), 0.0)
+    in_money = payoff > 0
+    dead = {
+        'price': payoff,
+        'delta': np.where(in_money, sign * carry_discount, 0.0),
+        'gamma': 0.0, 'vega': 0.0, 'theta': 0.0,
+        'rho': -t * payoff if futures else np.where(in_money, sign * strike * t * discount, 0.0),
+    }
+    live_values = {'price': price, 'delta': delta, 'gamma': gamma, 'vega': vega, 'theta': theta, 'rho': rho}
+    return {greek: np.where(live, live_values[greek], dead[greek]).ravel() for greek in GREEKS}
+
+
+def price_grid(is_call, underlying, strikes, expiries, r=0.0, q=0.0, volatility=0.5, model='black-scholes'):
+    """Price a strike x expiry grid in one call.
+
+    volatility is a number, a function (strike, t) -> vol or one row of vols per
+    expiry. Returns a dict with 'strikes', 'expiries' and one flat row-major
+    sequence per Greek (one row per expiry): NumPy arrays when NumPy is
+    installed, lists otherwise.
+    """
+    if callable(volatility):
+        volatility = [[volatility(strike, t) for strike in strikes] for t in expiries]
+    grid = {'strikes': list(strikes), 'expiries': list(expiries)}
+    if np is not None:
+        grid.update(_grid_numpy(is_call, underlying, strikes, expiries, r, q, volatility, model))
+        return grid
+    flat = isinstance(volatility, (int, float))
+    columns = {greek: [] for greek in GREEKS}
+    for i, t in enumerate(expiries):
+        for j, strike in enumerate(strikes):
+            option = price_option(is_call, underlying, strike, t, r, q, volatility if flat else volatility[i][j], model)
+            for greek in GREEKS:
+                columns[greek].append(option[greek])
+    grid.update(columns)
+    return grid
+
+
+def write_grid_csv(out_file, grid, days):
+    """Write a priced grid with one row per option."""
+    with atomic_open(out_file, 'w', encoding='utf-8') as f:
+        writer = csv.writer(f, lineterminator='\n')
+        writer.writerow(['days', 'strike'] + GREEKS)
+        cell = 0
+        for day in days:
+            for strike in grid['strikes']:
+                writer.writerow([day, strike] + [repr(float(grid[greek][cell])) for greek in GREEKS])
+                cell += 1
+    return cell
+
+
+def parse_range(text):
+    """'40000:80000:1000' (inclusive) or '50000,60000,70000' -> list of floats."""
+    if ':' in text:
+        start, stop, step = (float(part) for part in text.split(':'))
+        if step <= 0:
+            raise ValueError("Range step must be positive")
+        count = int(math.floor((stop - start) / step + 1e-9)) + 1
+        return [start + i * step for i in range(count)]
+    return [float(part) for part in text.split(',') if part.strip()]
+
+
+def _random_options(count, seed=14):
+    """Random option cases, including expired and zero-volatility ones."""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        underlying = rng.uniform(10, 100000)
+        cases.append([rng.random() < 0.5, underlying, underlying * rng.uniform(0.3, 2.5),
+                      rng.choice([0, 1 / DAYS_PER_YEAR, rng.uniform(0.001, 3)]), rng.uniform(-0.01, 0.1),
+                      rng.uniform(0, 0.05), rng.choice([0, rng.uniform(0.05, 2.5)]), rng.choice(MODELS)])
+    return cases
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8') + ';this.priceOption = priceOption;' +
+    'this.impliedVolatility = impliedVolatility;', context);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+process.stdout.write(JSON.stringify(cases.map(([isCall, s, k, t, r, q, vol, model]) => {
+    const option = context.priceOption(isCall, s, k, t, r, q, vol, model);
+    const values = ['price', 'delta', 'gamma', 'vega', 'theta', 'rho'].map(greek => option[greek]);
+    values.push(context.impliedVolatility(option.price, isCall, s, k, t, r, q, model));
+    return values.map(String);
+})));
+"""
+
+
+def parity(count=2000):
+    """Price random options with options.js under Node and compare every Greek and the
+    implied volatility with this module. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    cases = _random_options(count)
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(cases, f)
+    try:
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(base_path, *OPTIONS_JS.split('/')), f.name],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        os.remove(f.name)
+
+    mismatches = 0
+    for case, js in zip(cases, json.loads(completed.stdout)):
+        option = price_option(*case)
+        ours = [option[greek] for greek in GREEKS]
+        js = [float(value) for value in js]
+        # Where the price barely depends on volatility (deep in the money, hours to expiry) the
+        # solved volatility is not unique, so compare the prices both solutions reproduce
+        implied = implied_volatility(option['price'], *case[:6], case[7])
+        reprice = [price_option(*case[:6], vol, case[7])['price'] if not math.isnan(vol) else vol for vol in (js[6], implied)]
+        for name, a, b in zip(GREEKS + ['implied vol price'], js[:6] + reprice[:1], ours + reprice[1:]):
+            if not (a == b or (math.isnan(a) and math.isnan(b)) or math.isclose(a, b, rel_tol=1e-12, abs_tol=1e-12)):
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   {case}: {name} js {a!r}, python {b!r}")
+                break
+    print(f"{'✅' if not mismatches else '❌'} {count - mismatches}/{count} options match {OPTIONS_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, count] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8') + ';globalThis.priceGrid = priceGrid;');
+const expiries = Array.from({ length: 100 }, (_, i) => (i + 1) / 100);
+const strikes = Array.from({ length: Math.ceil(count / 100) }, (_, i) => 20000 + i * 100);
+const smile = (strike, t) => 0.5 + 0.2 * Math.log(strike / 60000) ** 2;
+priceGrid(true, 60000, strikes, expiries, 0.05, 0, smile, 'black-scholes');
+const start = process.hrtime.bigint();
+priceGrid(true, 60000, strikes, expiries, 0.05, 0, smile, 'black-scholes');
+process.stdout.write(String(Number(process.hrtime.bigint() - start) / 1e9));
+"""
+
+
+def benchmark(count=100000):
+    """Time pricing a strike x expiry grid of about `count` options with all Greeks."""
+    expiries = [(i + 1) / 100 for i in range(100)]
+    strikes = [20000 + i * 100 for i in range(math.ceil(count / 100))]
+    options = len(strikes) * len(expiries)
+    vols = [[0.5 + 0.2 * math.log(strike / 60000) ** 2 for strike in strikes] for _ in expiries]
+    start = time.perf_counter()
+    price_grid(True, 60000, strikes, expiries, 0.05, 0.0, vols)
+    seconds = time.perf_counter() - start
+    backend = f"NumPy {np.__version__}" if np is not None else "pure Python (NumPy not installed)"
+    print(f"{len(strikes)} strikes x {len(expiries)} expiries = {options:,} options with Greeks")
+    print(f"  Python, {backend}: {seconds:.3f}s ({options / seconds:,.0f} options/s)")
+    node = shutil.which('node')
+    if node:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        completed = subprocess.run([node, '-e', _BENCHMARK_JS, os.path.join(base_path, *OPTIONS_JS.split('/')), str(options)],
+                                   capture_output=True, text=True, check=True)
+        seconds = float(completed.stdout)
+        print(f"  JavaScript (priceGrid under Node): {seconds:.3f}s ({options / seconds:,.0f} options/s)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Black-Scholes / Black-76 pricing, Greeks and implied volatility.")
+    parser.add_argument('command', nargs='?', choices=['grid', 'implied'],
+                        help="grid: price a strike x expiry grid to CSV; implied: solve for volatility")
+    parser.add_argument('--spot', type=float, help="underlying spot (or futures) price")
+    parser.add_argument('--strikes', help="strikes as start:stop:step or a comma-separated list (grid)")
+    parser.add_argument('--strike', type=float, help="strike (implied)")
+    parser.add_argument('--days', default='30', help="days to expiry; comma-separated list for grid (default 30)")
+    parser.add_argument('--vol', type=float, default=60.0, help="volatility in %% (grid, default 60)")
+    parser.add_argument('--price', type=float, help="option market price (implied)")
+    parser.add_argument('--rate', type=float, default=0.0, help="risk-free rate in %% (default 0)")
+    parser.add_argument('--yield', dest='dividend', type=float, default=0.0, help="dividend/borrow yield in %% (default 0)")
+    parser.add_argument('--put', action='store_true', help="price puts instead of calls")
+    parser.add_argument('--model', choices=MODELS, default='black-scholes')
+    parser.add_argument('-o', '--output', help="output CSV (grid)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/options.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark a grid of about N options")
+    args = parser.parse_args(argv)
+    if args.command and args.spot is None:
+        parser.error(f"{args.command} needs --spot")
+    if args.command == 'grid' and not (args.strikes and args.output):
+        parser.error("grid needs --strikes and -o/--output")
+    if args.command == 'implied' and (args.strike is None or args.price is None):
+        parser.error("implied needs --strike and --price")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    r, q = args.rate / 100, args.dividend / 100
+    try:
+        if args.command == 'grid':
+            days = parse_range(args.days)
+            strikes = parse_range(args.strikes)
+            grid = price_grid(not args.put, args.spot, strikes, [day / DAYS_PER_YEAR for day in days],
+                              r, q, args.vol / 100, args.model)
+            rows = write_grid_csv(args.output, grid, days)
+            print(f"Priced {rows:,} options -> {args.output}")
+        elif args.command == 'implied':
+            t = float(args.days) / DAYS_PER_YEAR
+            vol = implied_volatility(args.price, not args.put, args.spot, args.strike, t, r, q, args.model)
+            if math.isnan(vol):
+                print("❌ Price is outside the no-arbitrage bounds for this option")
+                sys.exit(1)
+            option = price_option(not args.put, args.spot, args.strike, t, r, q, vol, args.model)
+            print(f"Implied Volatility: {vol * 100:.4f}%")
+            for greek in GREEKS[1:]:
+                print(f"{greek.title()}: {option[greek]:.6f}")
+        else:
+            parse_args(['--help'])
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
@@ -0,0 +1,558 @@
+#!/usr/bin/env python3
+"""
+Compiled page templates for generate_pages.py and build_blog.py.
+
+Templates use {{ name }} for context values and {{> name }} for shared
+partials. Each template is compiled once per build: partials are inlined and
+the page is turned into a generated Python function returning one f-string,
+so rendering costs a single string build with no per-page parsing, no
+repeated `.lower()` calls and no `+=` loops. Repeated rows (link lists) are
+rendered per row and joined in one pass.
+"""
+
+import re
+import keyword
+
+_TOKEN = re.compile(r'\{\{\s*(>?)\s*(\w+)\s*\}\}')
+
+
+class TemplateError(ValueError):
+    """Raised for unknown or recursive partials and invalid field names."""
+
+
+class Template:
+    """A template compiled into a Python function that renders one f-string."""
+
+    def __init__(self, source, partials=None, name='template'):
+        self.name = name
+        self.fields = []
+        pieces = []
+        self._expand(source, partials or {}, (name,), pieces)
+        # render(**values) is the compiled function itself: no wrapper call per page
+        self.render = self._compile(pieces)
+
+    def _expand(self, source, partials, stack, pieces):
+        """Flatten source into literal strings and field names, inlining partials."""
+        pos = 0
+        for match in _TOKEN.finditer(source):
+            pieces.append(source[pos:match.start()])
+            is_partial, key = match.groups()
+            if is_partial:
+                if key not in partials:
+                    raise TemplateError(f"{self.name}: unknown partial '{key}'")
+                if key in stack:
+                    raise TemplateError(f"{self.name}: partial '{key}' includes itself")
+                self._expand(partials[key], partials, stack + (key,), pieces)
+            else:
+                if keyword.iskeyword(key) or key[0].isdigit():
+                    raise TemplateError(f"{self.name}: invalid field name '{key}'")
+                if key not in self.fields:
+                    self.fields.append(key)
+                pieces.append((key,))
+            pos = match.end()
+        pieces.append(source[pos:])
+
+    def _compile(self, pieces):
+        # Adjacent f-string literals are folded into a single string build by the compiler
+        parts = []
+        for piece in pieces:
+            if isinstance(piece, tuple):
+                parts.append(f"f'{{{piece[0]}}}'")
+            elif piece:
+                parts.append('f' + repr(piece.replace('{', '{{').replace('}', '}}')))
+        body = ' '.join(parts) or "''"
+        params = '*, ' + ', '.join(self.fields) if self.fields else ''
+        source = f"def render({params}):\n    return {body}\n"
+        namespace = {}
+        exec(compile(source, f'<template {self.name}>', 'exec'), namespace)
+        return namespace['render']
+
+    def render_map(self, context):
+        """Render with values taken from a mapping."""
+        return self.render(**context)
+
+
+# Shared partials, inlined into every page template at compile time
+PARTIALS = {
+    'favicons': '''    <link rel="apple-touch-icon" sizes="180x180" href="/apple-touch-icon.png">
+    <link rel="icon" type="image/png" sizes="32x32" href="/favicon-32x32.png">
+    <link rel="icon" type="image/png" sizes="16x16" href="/favicon-16x16.png">''',
+
+    'website_ref': '''        "isPartOf": {
+            "@type": "WebSite",
+            "name": "CalcHub",
+            "url": "{{ base_url }}/"
+        },''',
+
+    'breadcrumb_ld_open': '''        "breadcrumb": {
+            "@type": "BreadcrumbList",
+            "itemListElement": [''',
+
+    'breadcrumb_ld_close': '''            ]
+        }''',
+
+    'breadcrumb_ld_home': '''                {
+                    "@type": "ListItem",
+                    "position": 1,
+                    "name": "Home",
+                    "item": "{{ base_url }}/"
+                }''',
+
+    'breadcrumb_ld_category': '''                {
+                    "@type": "ListItem",
+                    "position": 2,
+                    "name": "{{ category_title }}",
+                    "item": "{{ base_url }}/{{ category_url }}/"
+                }''',
+
+    'bootstrap_js': '''    <script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js"></script>''',
+
+    # Meta tags and structured data shared by redirect stubs and prerendered calculator pages
+    'calculator_head': '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ calc_name }} Calculator | Free Online Tool | CalcHub</title>
+    <meta name="description" content="Free online {{ calc_name_lower }} calculator. Professional, accurate, and easy-to-use tool for {{ calc_name_lower }} calculations. Part of CalcHub's collection of 150+ free calculator tools.">
+    <meta name="keywords" content="{{ calc_name_lower }}, {{ calc_name_lower }} calculator, online {{ calc_name_lower }} calculator, free {{ calc_name_lower }} tool, {{ category_key }} calculator">
+    
+    <!-- Enhanced SEO Meta Tags -->
+    <meta name="author" content="CalcHub - Professional Calculator Tools">
+    <meta name="robots" content="index, follow, max-snippet:-1, max-video-preview:-1, max-image-preview:large">
+    <meta name="googlebot" content="index, follow">
+    <meta name="language" content="English">
+    <meta name="revisit-after" content="7 days">
+    <meta name="rating" content="General">
+    <meta name="distribution" content="Global">
+    
+    <!-- Canonical URL -->
+    <link rel="canonical" href="{{ base_url }}/{{ category_url }}/{{ calc_id }}">
+    
+    <!-- Open Graph Meta Tags -->
+    <meta property="og:title" content="{{ calc_name }} Calculator | Free Online Tool | CalcHub">
+    <meta property="og:description" content="Free online {{ calc_name_lower }} calculator. Professional and accurate tool for all your {{ calc_name_lower }} calculation needs.">
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{{ base_url }}/{{ category_url }}/{{ calc_id }}">
+    <meta property="og:image" content="{{ base_url }}/assets/images/calchub-og.png">
+    <meta property="og:site_name" content="CalcHub">
+    
+    <!-- Twitter Card Meta Tags -->
+    <meta name="twitter:card" content="summary_large_image">
+    <meta name="twitter:title" content="{{ calc_name }} Calculator | CalcHub">
+    <meta name="twitter:description" content="Free online {{ calc_name_lower }} calculator. Professional and accurate.">
+    <meta name="twitter:image" content="{{ base_url }}/assets/images/calchub-og.png">
+    
+    <!-- Favicons -->
+{{> favicons }}
+    <link rel="manifest" href="/site.webmanifest">
+    
+    <!-- Structured Data -->
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "WebApplication",
+        "name": "{{ calc_name }} Calculator",
+        "alternateName": "CalcHub {{ calc_name }} Calculator",
+        "url": "{{ base_url }}/{{ category_url }}/{{ calc_id }}",
+        "description": "Free online {{ calc_name_lower }} calculator for accurate and professional calculations.",
+        "applicationCategory": "UtilityApplication",
+        "operatingSystem": "Web Browser",
+        "browserRequirements": "Requires HTML5 support",
+        "offers": {
+            "@type": "Offer",
+            "price": "0",
+            "priceCurrency": "USD",
+            "availability": "https://schema.org/InStock"
+        },
+{{> website_ref }}
+{{> breadcrumb_ld_open }}
+{{> breadcrumb_ld_home }},
+{{> breadcrumb_ld_category }},
+                {
+                    "@type": "ListItem",
+                    "position": 3,
+                    "name": "{{ calc_name }} Calculator",
+                    "item": "{{ base_url }}/{{ category_url }}/{{ calc_id }}"
+                }
+{{> breadcrumb_ld_close }}
+    }
+    </script>''',
+
+    'calculator_breadcrumb': '''        <div class="mt-5">
+            <nav aria-label="breadcrumb">
+                <ol class="breadcrumb">
+                    <li class="breadcrumb-item"><a href="/">Home</a></li>
+                    <li class="breadcrumb-item"><a href="/{{ category_url }}/">{{ category_title }}</a></li>
+                    <li class="breadcrumb-item active" aria-current="page">{{ calc_name }} Calculator</li>
+                </ol>
+            </nav>
+        </div>''',
+
+    'calculator_about': '''        <div class="mt-4">
+            <h2>About {{ calc_name }} Calculator</h2>
+            <p>This free online {{ calc_name_lower }} calculator is part of CalcHub's comprehensive collection of over 150 professional calculator tools. It provides accurate, fast, and reliable calculations for all your {{ calc_name_lower }} needs.</p>
+            <p><strong>Category:</strong> {{ category_title }}</p>
+            <p><strong>Features:</strong></p>
+            <ul>
+                <li>100% Free to use</li>
+                <li>No registration required</li>
+                <li>Professional and accurate results</li>
+                <li>User-friendly interface</li>
+                <li>Mobile responsive design</li>
+            </ul>
+        </div>''',
+}
+
+# One link in a category page's calculator list
+TOOL_LINK = Template('''                <li class="mb-2"><a href="/{{ category_url }}/{{ tool }}">{{ tool_name }} Calculator</a></li>
+''', name='tool_link')
+
+CALCULATOR_PAGE = Template('''{{> calculator_head }}
+    
+{{ head_styles }}
+    
+    <!-- Redirect Script with Delay for SEO -->
+    <script>
+        // Allow search engines to crawl the page before redirecting
+        setTimeout(function() {
+            window.location.href = '/?calc={{ category_key }}/{{ calc_id }}';
+        }, 100);
+    </script>
+</head>
+<body>
+    <!-- Content visible to search engines before redirect -->
+    <div class="container mt-5 pt-5">
+        <div class="text-center">
+            <h1 class="mb-4">{{ calc_name }} Calculator</h1>
+            <p class="lead">Free online {{ calc_name_lower }} calculator. Professional, accurate, and easy to use.</p>
+            <p>Loading calculator...</p>
+            <div class="spinner-border text-primary mt-3" role="status">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+        </div>
+        
+{{> calculator_breadcrumb }}
+        
+{{> calculator_about }}
+    </div>
+    
+    <!-- Bootstrap JS -->
+{{> bootstrap_js }}
+</body>
+</html>''', PARTIALS, name='calculator_page')
+
+CATEGORY_PAGE = Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ category_title }} | Free Online Tools | CalcHub</title>
+    <meta name="description" content="Professional {{ category_title_lower }} for accurate calculations. Free, fast, and reliable tools. Browse our collection of {{ tool_count }} calculators.">
+    <meta name="keywords" content="{{ category_key }} calculator, {{ category_title_lower }}, online {{ category_key }} tools, free calculator">
+    
+    <!-- Enhanced SEO Meta Tags -->
+    <meta name="author" content="CalcHub - Professional Calculator Tools">
+    <meta name="robots" content="index, follow, max-snippet:-1, max-video-preview:-1, max-image-preview:large">
+    <meta name="googlebot" content="index, follow">
+    
+    <!-- Canonical URL -->
+    <link rel="canonical" href="{{ base_url }}/{{ category_url }}/">
+    
+    <!-- Open Graph Meta Tags -->
+    <meta property="og:title" content="{{ category_title }} | Free Online Tools | CalcHub">
+    <meta property="og:description" content="Professional {{ category_title_lower }} for accurate calculations. {{ tool_count }} free tools available.">
+    <meta property="og:type" content="website">
+    <meta property="og:url" content="{{ base_url }}/{{ category_url }}/">
+    <meta property="og:site_name" content="CalcHub">
+    
+    <!-- Favicons -->
+{{> favicons }}
+    
+    <!-- Structured Data -->
+    <script type="application/ld+json">
+    {
+        "@context": "https://schema.org",
+        "@type": "CollectionPage",
+        "name": "{{ category_title }}",
+        "description": "Professional {{ category_title_lower }} for accurate calculations. Free, fast, and reliable tools.",
+        "url": "{{ base_url }}/{{ category_url }}/",
+{{> website_ref }}
+{{> breadcrumb_ld_open }}
+{{> breadcrumb_ld_home }},
+{{> breadcrumb_ld_category }}
+{{> breadcrumb_ld_close }}
+    }
+    </script>
+    
+{{ head_styles }}
+    
+    <!-- Redirect Script -->
+    <script>
+        setTimeout(function() {
+            window.location.href = '/?category={{ category_key }}';
+        }, 100);
+    </script>
+</head>
+<body>
+    <div class="container mt-5 pt-5">
+        <div class="text-center">
+            <h1 class="mb-4">{{ category_title }}</h1>
+            <p class="lead">Browse our collection of {{ tool_count }} professional {{ category_key }} calculators</p>
+            <p>Loading calculators...</p>
+            <div class="spinner-border text-primary mt-3" role="status">
+                <span class="visually-hidden">Loading...</span>
+            </div>
+        </div>
+        
+        <div class="mt-5">
+            <nav aria-label="breadcrumb">
+                <ol class="breadcrumb">
+                    <li class="breadcrumb-item"><a href="/">Home</a></li>
+                    <li class="breadcrumb-item active" aria-current="page">{{ category_title }}</li>
+                </ol>
+            </nav>
+        </div>
+        
+        <div class="mt-4">
+            <h2>Available Calculators</h2>
+            <ul class="list-unstyled">
+{{ tool_links }}            </ul>
+        </div>
+    </div>
+    
+{{> bootstrap_js }}
+</body>
+</html>''', PARTIALS, name='category_page')
+
+# Calculator form rows, built the same way showCalculator() in main.js builds them
+FORM_FIELD = Template('''
+            <div class="mb-4">
+                <label class="form-label">{{ label }}</label>
+        {{ control }}</div>''', name='form_field')
+
+FORM_INPUT = Template('''<input type="{{ type }}" class="form-control" id="{{ input_id }}" placeholder="{{ placeholder }}" {{ step_attr }} {{ required_attr }}>''', name='form_input')
+
+FORM_FILE = Template('''<input type="file" class="form-control" id="{{ input_id }}" {{ accept_attr }}>''', name='form_file')
+
+FORM_SELECT = Template('''<select class="form-select" id="{{ input_id }}" required>{{ options }}</select>''', name='form_select')
+
+FORM_OPTION = Template('''<option value="{{ option }}">{{ option }}</option>''', name='form_option')
+
+CALCULATOR_FORM = Template('''
+        <form id="calc-form" onsubmit="calculateResult(event, '{{ calc_id }}')">
+    {{ fields }}
+            <div class="text-center">
+                <button type="submit" class="calculator-submit-btn">
+                    <i class="fas fa-calculator"></i>
+                    Calculate Results
+                </button>
+            </div>
+        </form>
+        <div class="text-center mt-3">
+            <button class="modern-btn modern-btn-outline" onclick="backToCalculatorList()">
+                <i class="fas fa-arrow-left"></i>
+                Back to Tools
+            </button>
+        </div>
+    ''', name='calculator_form')
+
+# A calculator page with the form already rendered and the calculator's code
+# inlined, so a deep link is interactive without loading index.html
+PRERENDERED_PAGE = Template('''{{> calculator_head }}
+    
+{{ head_styles }}
+</head>
+<body data-category-url="/{{ category_url }}/">
+    <div class="container mt-5 pt-5">
+        <div id="calculator-form-container">
+            <div class="calculator-form-section">
+                <div class="calculator-form-header">
+                    <button class="calculator-close-btn" onclick="backToCalculatorList()" title="Close Calculator">
+                        <i class="fas fa-times"></i>
+                    </button>
+                    <h1 id="calculator-form-title">{{ calc_title }}</h1>
+                    <p>Enter your values below to get accurate results</p>
+                </div>
+                <div class="calculator-form-body">
+                    <div id="calculator-content">{{ form_html }}</div>
+                </div>
+            </div>
+            
+            <div id="calculator-result" style="display: none;"></div>
+        </div>
+        
+{{> calculator_breadcrumb }}
+        
+{{> calculator_about }}
+    </div>
+    
+    <!-- Calculator runtime and this calculator's code -->
+    <script>{{ runtime_js }}</script>
+    <script>{{ calculator_js }}</script>
+</body>
+</html>''', PARTIALS, name='prerendered_page')
+
+# One entry in an article page's "More guides" list
+ARTICLE_LINK = Template('''                <li><a href="/blog/{{ article_id }}">{{ title }}</a></li>
+''', name='article_link')
+
+# A blog article as its own static page, written by build_blog.py. The body
+# sits in #articleBody so blogs.html can lift it into its modal.
+ARTICLE_PAGE = Template('''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{{ title }} | CalcHub Guides</title>
+    <meta name="description" content="{{ excerpt }}">
+    <meta name="author" content="CalcHub - Calculator Experts">
+    <meta name="robots" content="index, follow, max-snippet:-1, max-video-preview:-1, max-image-preview:large">
+    
+    <!-- Canonical URL -->
+    <link rel="canonical" href="{{ base_url }}/blog/{{ article_id }}">
+    
+    <!-- Open Graph Meta Tags -->
+    <meta property="og:title" content="{{ title }}">
+    <meta property="og:description" content="{{ excerpt }}">
+    <meta property="og:type" content="article">
+    <meta property="og:url" content="{{ base_url }}/blog/{{ article_id }}">
+    <meta property="og:site_name" content="CalcHub Blog">
+    <meta property="article:published_time" content="{{ date }}">
+    <meta property="article:section" content="{{ category_name }}">
+    
+    <!-- Favicons -->
+{{> favicons }}
+    
+    <!-- Structured Data -->
+    <script type="application/ld+json">
+{{ structured_data }}
+    </script>
+    
+    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@400;500;600;700&family=Space+Grotesk:wght@600;700&display=swap" rel="stylesheet">
+    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
+    <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+    
+    <style>
+        :root {
+            --primary-gradient: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            --primary-color: #667eea;
+            --secondary-color: #764ba2;
+            --text-primary: #2d3748;
+        }
+        
+        body {
+            font-family: 'Poppins', sans-serif;
+            background: #f8f9fa;
+            color: var(--text-primary);
+            line-height: 1.8;
+        }
+        
+        .article-nav {
+            background: white;
+            box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
+        }
+        
+        .article-brand {
+            font-family: 'Space Grotesk', sans-serif;
+            font-weight: 700;
+            font-size: 1.6rem;
+            color: var(--primary-color);
+            text-decoration: none;
+        }
+        
+        .article-header {
+            background: var(--primary-gradient);
+            color: white;
+            padding: 4rem 0 3rem;
+        }
+        
+        .article-header h1 {
+            font-family: 'Space Grotesk', sans-serif;
+            font-weight: 700;
+        }
+        
+        .article-meta {
+            opacity: 0.9;
+            font-size: 0.9rem;
+        }
+        
+        .article-body {
+            background: white;
+            border-radius: 24px;
+            padding: 2.5rem;
+            margin-top: -2rem;
+            box-shadow: 0 4px 12px rgba(0, 0, 0, 0.15);
+        }
+        
+        .article-body h3 {
+            color: var(--primary-color);
+            font-weight: 600;
+            margin: 2rem 0 1rem;
+            font-size: 1.3rem;
+        }
+        
+        .article-body h4 {
+            color: var(--secondary-color);
+            font-weight: 600;
+            margin: 1.5rem 0 0.8rem;
+            font-size: 1.1rem;
+        }
+        
+        .article-body ul,
+        .article-body ol {
+            margin: 1rem 0;
+            padding-left: 2rem;
+        }
+        
+        .article-body .highlight {
+            background: linear-gradient(135deg, rgba(102, 126, 234, 0.1), rgba(118, 75, 162, 0.1));
+            padding: 1rem;
+            border-radius: 12px;
+            border-left: 4px solid var(--primary-color);
+            margin: 1.5rem 0;
+        }
+    </style>
+</head>
+<body>
+    <nav class="article-nav">
+        <div class="container d-flex justify-content-between align-items-center py-3">
+            <a href="/" class="article-brand"><i class="fas fa-calculator"></i> CalcHub</a>
+            <a href="/blogs.html" class="btn btn-outline-primary btn-sm">All Guides</a>
+        </div>
+    </nav>
+    
+    <header class="article-header">
+        <div class="container">
+            <nav aria-label="breadcrumb">
+                <ol class="breadcrumb">
+                    <li class="breadcrumb-item"><a href="/" class="text-white">Home</a></li>
+                    <li class="breadcrumb-item"><a href="/blogs.html" class="text-white">Guides</a></li>
+                    <li class="breadcrumb-item active text-white-50" aria-current="page">{{ category_name }}</li>
+                </ol>
+            </nav>
+            <h1><i class="{{ icon }} me-2"></i>{{ title }}</h1>
+            <div class="article-meta">
+                <span class="badge bg-light text-dark me-2">{{ category_name }}</span>
+                <i class="fas fa-calendar me-1"></i> <time datetime="{{ date }}">{{ date_text }}</time>
+                <i class="fas fa-clock ms-3 me-1"></i> {{ read_time }}
+            </div>
+        </div>
+    </header>
+    
+    <main class="container mb-5">
+        <article class="article-body" id="articleBody">
+{{ content }}
+        </article>
+        
+        <div class="mt-5">
+            <h2 class="h5">More {{ category_name }} Guides</h2>
+            <ul>
+{{ related_links }}                <li><a href="/blogs.html">Browse all guides</a></li>
+            </ul>
+        </div>
+    </main>
+    
+{{> bootstrap_js }}
+</body>
+</html>''', PARTIALS, name='article_page')
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Primality testing, factorization and prime sieving for integers of any size.
+
+The same algorithms back the number-theory calculator through
+assets/js/primes.js: a cached segmented sieve for small primes, Miller-Rabin
+with the first 12 primes as bases (deterministic below 3.3 x 10^24, so for every
+64-bit input) and Pollard's rho with Brent's cycle detection for factors that
+trial division does not reach.
+
+    python primes.py factor 1000000016000000063
+    python primes.py isprime 18446744073709551557
+    python primes.py primes 1000000000000 1000001000000 -o primes.txt
+"""
+
+import os
+import sys
+import json
+import math
+import time
+import bisect
+import random
+import shutil
+import argparse
+import tempfile
+import itertools
+import subprocess
+
+from build_io import atomic_open
+
+PRIMES_JS = 'assets/js/primes.js'
+
+SIEVE_SEGMENT = 65536
+# Factorization trial-divides below this bound and leaves larger factors to Pollard's rho
+TRIAL_LIMIT = 1024
+# The first 12 primes as Miller-Rabin bases are deterministic below this bound
+MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+MILLER_RABIN_LIMIT = 3317044064679887385961981
+
+# Inputs that are slow or easy to get wrong: (description, n)
+WORST_CASES = [
+    ('largest 64-bit prime', 18446744073709551557),
+    ('largest 18-digit prime', 999999999999999989),
+    ('Mersenne prime 2^61 - 1', 2305843009213693951),
+    ('balanced semiprime, two 10-digit primes', 1000000016000000063),
+    ('square of the largest 31-bit prime', 4611686014132420609),
+    ('square of the largest 32-bit prime', 18446744030759878681),
+    ('strong pseudoprime to bases 2..23', 3825123056546413051),
+    ('strong pseudoprime to bases 2..37', 318665857834031151167461),
+    ('balanced semiprime, two 32-bit primes', 18446743979220271189),
+    ('Carmichael number (Chernick, k = 100291)', 1307351018993397769),
+    ('2^64 - 1', 18446744073709551615),
+    ('largest deterministic input', MILLER_RABIN_LIMIT - 2),
+]
+
+_sieve = {'limit': 1, 'primes': []}
+
+
+def _sieve_segment(low, high, base_primes):
+    """Primes in [low, high], crossing off multiples of base_primes (which must reach sqrt(high))."""
+    flags = bytearray(b'\x01') * (high - low + 1)
+    for p in base_primes:
+        if p * p > high:
+            break
+        start = max(p * p, -(-low // p) * p)
+        flags[start - low::p] = bytes(len(range(start, high + 1, p)))
+    return list(itertools.compress(range(low, high + 1), flags))
+
+
+def extend_sieve(limit):
+    """Grow the cached prime list to cover `limit`, one segment at a time, and return it."""
+    primes = _sieve['primes']
+    if _sieve['limit'] < SIEVE_SEGMENT:
+        # First segment: plain sieve of Eratosthenes, which also yields every base prime for later segments
+        flags = bytearray(b'\x01') * (SIEVE_SEGMENT + 1)
+        flags[0] = flags[1] = 0
+        for i in range(2, math.isqrt(SIEVE_SEGMENT) + 1):
+            if flags[i]:
+                flags[i * i::i] = bytes(len(range(i * i, SIEVE_SEGMENT + 1, i)))
+        primes.extend(itertools.compress(range(SIEVE_SEGMENT + 1), flags))
+        _sieve['limit'] = SIEVE_SEGMENT
+    while _sieve['limit'] < limit:
+        low = _sieve['limit'] + 1
+        high = low + SIEVE_SEGMENT - 1
+        primes.extend(_sieve_segment(low, high, primes))
+        _sieve['limit'] = high
+    return primes
+
+
+def primes_up_to(limit):
+    """All primes <= limit."""
+    primes = extend_sieve(limit)
+    return primes[:bisect.bisect_right(primes, limit)]
+
+
+def iter_primes(low, high):
+    """Yield the primes in [low, high] a segment at a time; only the base primes up to
+    sqrt(high) are kept, so ranges far beyond memory (e.g. around 10^15) are fine."""
+    base_primes = extend_sieve(math.isqrt(high))
+    low = max(low, 2)
+    while low <= high:
+        segment_high = min(low + SIEVE_SEGMENT - 1, high)
+        yield from _sieve_segment(low, segment_high, base_primes)
+        low = segment_high + 1
+
+
+def is_prime(n):
+    """Miller-Rabin with the fixed bases: exact below MILLER_RABIN_LIMIT, a strong
+    probable-prime test above it."""
+    if n < 2:
+        return False
+    if n <= SIEVE_SEGMENT:
+        primes = extend_sieve(SIEVE_SEGMENT)
+        index = bisect.bisect_right(primes, n)
+        return primes[index - 1] == n
+    for p in MILLER_RABIN_BASES:
+        if n % p == 0:
+            return False
+    d = n - 1
+    s = 0
+    while not d & 1:
+        d >>= 1
+        s += 1
+    for a in MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(1, s):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def pollard_rho(n):
+    """A non-trivial factor of an odd composite n (Pollard's rho with Brent's cycle detection)."""
+    for c in itertools.count(1):
+        y = x = ys = 2
+        q = g = 1
+        r = 1
+        m = 128
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The batched product overshot: step back one value at a time from the last checkpoint
+            while True:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+                if g != 1:
+                    break
+        if g != n:
+            return g
+
+
+def factorize(n):
+    """Prime factors of n with multiplicity, ascending."""
+    factors = []
+    if n < 2:
+        return factors
+    for p in extend_sieve(TRIAL_LIMIT):
+        if p >= TRIAL_LIMIT or p * p > n:
+            break
+        while n % p == 0:
+            factors.append(p)
+            n //= p
+    pending = [n] if n > 1 else []
+    while pending:
+        m = pending.pop()
+        # Every prime below TRIAL_LIMIT is gone, so anything below its square is prime
+        if m < TRIAL_LIMIT ** 2 or is_prime(m):
+            factors.append(m)
+        else:
+            d = pollard_rho(m)
+            pending.extend((d, m // d))
+    return sorted(factors)
+
+
+def format_factors(factors):
+    """[2, 2, 3] written as 2^2 × 3."""
+    powers = ((p, len(list(group))) for p, group in itertools.groupby(factors))
+    return ' × '.join(str(p) if count == 1 else f"{p}^{count}" for p, count in powers)
+
+
+def _random_semiprime(digits, rng):
+    """Product of two primes of about digits / 2 digits each: the slowest case for Pollard's rho."""
+    half = digits // 2
+    factors = []
+    for _ in range(2):
+        candidate = rng.randrange(10 ** (half - 1), 10 ** half) | 1
+        while not is_prime(candidate):
+            candidate += 2
+        factors.append(candidate)
+    return factors[0] * factors[1]
+
+
+def _parity_cases(count, seed=15):
+    rng = random.Random(seed)
+    cases = [n for _, n in WORST_CASES] + list(range(0, 2000))
+    for _ in range(count):
+        cases.append(rng.randrange(2, 10 ** rng.randint(2, 24)))
+        cases.append(_random_semiprime(rng.randint(4, 20), rng))
+    return cases
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8') + ';this.isPrime = isPrime;this.factorize = factorize;', context);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+process.stdout.write(JSON.stringify(cases.map(text => {
+    const n = BigInt(text);
+    return [context.isPrime(n), context.factorize(n).map(String)];
+})));
+"""
+
+
+def parity(count=500):
+    """Run primes.js under Node on worst-case and random inputs and require the same
+    primality verdicts and factorizations. Returns the number of mismatches."""
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    cases = _parity_cases(count)
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump([str(n) for n in cases], f)
+    try:
+        completed = subprocess.run([node, '-e', _PARITY_JS, os.path.join(base_path, *PRIMES_JS.split('/')), f.name],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        os.remove(f.name)
+
+    mismatches = 0
+    for n, (js_prime, js_factors) in zip(cases, json.loads(completed.stdout)):
+        factors = factorize(n)
+        if js_prime != is_prime(n) or [int(p) for p in js_factors] != factors or math.prod(factors) != max(n, 1):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"   {n}: js {js_prime} {js_factors}, python {is_prime(n)} {factors}")
+    print(f"{'✅' if not mismatches else '❌'} {len(cases) - mismatches}/{len(cases)} inputs match {PRIMES_JS}")
+    return mismatches
+
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, casesFile] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8') + ';globalThis.factorize = factorize;');
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8')).map(BigInt);
+cases.forEach(n => factorize(n));
+process.stdout.write(JSON.stringify(cases.map(n => {
+    const start = process.hrtime.bigint();
+    factorize(n);
+    return Number(process.hrtime.bigint() - start) / 1e6;
+})));
+"""
+
+
+def _time_factorize(n):
+    start = time.perf_counter()
+    factorize(n)
+    return (time.perf_counter() - start) * 1000
+
+
+def benchmark(count=100):
+    """Time factorization of the worst-case inputs and of `count` random balanced
+    18-digit semiprimes, in Python and (when Node is available) in primes.js."""
+    rng = random.Random(15)
+    semiprimes = [_random_semiprime(18, rng) for _ in range(count)]
+    cases = [n for _, n in WORST_CASES] + semiprimes
+    extend_sieve(SIEVE_SEGMENT)
+    python_ms = [_time_factorize(n) for n in cases]
+
+    js_ms = None
+    node = shutil.which('node')
+    if node:
+        base_path = os.path.dirname(os.path.abspath(__file__))
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+            json.dump([str(n) for n in cases], f)
+        try:
+            completed = subprocess.run([node, '-e', _BENCHMARK_JS, os.path.join(base_path, *PRIMES_JS.split('/')), f.name],
+                                       capture_output=True, text=True, check=True)
+        finally:
+            os.remove(f.name)
+        js_ms = json.loads(completed.stdout)
+
+    print(f"{'Input':<44} {'Digits':>6} {'Python ms':>10} {'JS ms':>8}")
+    for i, (label, n) in enumerate(WORST_CASES):
+        js = f"{js_ms[i]:8.2f}" if js_ms else f"{'-':>8}"
+        print(f"{label:<44} {len(str(n)):>6} {python_ms[i]:10.2f} {js}")
+    rows = len(WORST_CASES)
+    label = f"{count} random 18-digit semiprimes (mean/max)"
+    python = f"{sum(python_ms[rows:]) / count:.2f}/{max(python_ms[rows:]):.2f}"
+    js = f"{sum(js_ms[rows:]) / count:.2f}/{max(js_ms[rows:]):.2f}" if js_ms else '-'
+    print(f"{label:<44} {18:>6} {python:>10} {js:>8}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Primality testing, factorization and prime sieving.")
+    parser.add_argument('command', nargs='?', choices=['factor', 'isprime', 'primes'],
+                        help="factor N...; isprime N...; primes LOW HIGH")
+    parser.add_argument('numbers', nargs='*', type=int, help="integers (decimal)")
+    parser.add_argument('-o', '--output', help="write primes to this file, one per line (primes)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/primes.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help="benchmark the worst-case inputs and N random 18-digit semiprimes")
+    args = parser.parse_args(argv)
+    if args.command in ('factor', 'isprime') and not args.numbers:
+        parser.error(f"{args.command} needs at least one number")
+    if args.command == 'primes' and len(args.numbers) != 2:
+        parser.error("primes needs LOW and HIGH")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if args.command == 'factor':
+        for n in args.numbers:
+            if n < 2:
+                print(f"❌ {n}: please enter a number ≥ 2")
+                continue
+            print(f"{n} = {format_factors(factorize(n))}")
+    elif args.command == 'isprime':
+        for n in args.numbers:
+            verdict = 'prime' if is_prime(n) else 'not prime'
+            if n >= MILLER_RABIN_LIMIT and verdict == 'prime':
+                verdict = 'a probable prime'
+            print(f"{n} is {verdict}")
+    elif args.command == 'primes':
+        low, high = args.numbers
+        if args.output:
+            with atomic_open(args.output, 'w', encoding='utf-8') as f:
+                count = 0
+                for p in iter_primes(low, high):
+                    f.write(f"{p}\n")
+                    count += 1
+            print(f"{count:,} primes in [{low}, {high}] -> {args.output}")
+        else:
+            for p in iter_primes(low, high):
+                print(p)
+    else:
+        parse_args(['--help'])
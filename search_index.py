@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+"""
+Build-time search index for the calculator search box (mirrored by assets/js/search.js).
+
+Every calculator's title, id, input labels and category are split into terms,
+and each term keeps a posting list of (calculator, weight) pairs, the weight
+being the most important field the term appears in. The sorted term list is
+searched like a trie: the edit distance from the query to each term's prefixes
+is computed row by row, rows are reused for the prefix a term shares with the
+previous one, and every term below a prefix that is already too far away is
+skipped. So a query matches terms exactly, by prefix (while typing) or with one
+or two typos, in well under a millisecond even for thousands of calculators.
+
+generate_calculator_modules.py writes the index to assets/js/search-index.js.
+
+    python search_index.py loan
+    python search_index.py "morgage paymnt"
+    python search_index.py --parity
+    python search_index.py --benchmark 5000
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import random
+import shutil
+import argparse
+import tempfile
+import subprocess
+import unicodedata
+
+from calc_registry import CATEGORY_TITLES, load_registry
+
+SEARCH_JS = 'assets/js/search.js'
+SEARCH_INDEX_JS = 'assets/js/search-index.js'
+
+# Field weights; a term scores the weight of the most important field it appears in
+TITLE_WEIGHT = 10
+ID_WEIGHT = 6
+SYNONYM_WEIGHT = 4
+LABEL_WEIGHT = 2
+CATEGORY_WEIGHT = 1
+
+# Match quality multipliers: exact term, prefix of a term, one typo, two typos
+EXACT, PREFIX, ONE_TYPO, TWO_TYPOS = 4, 3, 2, 1
+
+# Words that every title shares or that carry no meaning; dropped from titles and queries
+STOPWORDS = ['a', 'an', 'and', 'by', 'calculator', 'calculators', 'for', 'in', 'of', 'on', 'or', 'the', 'to',
+             'tool', 'tools', 'with', 'your']
+
+# Words people search for that the titles do not use, keyed by a title or id term (singular)
+SYNONYMS = {
+    'age': ['birthday', 'old'],
+    'bmi': ['body', 'mass', 'obesity', 'overweight'],
+    'calorie': ['kcal', 'diet', 'energy'],
+    'compound': ['savings', 'growth'],
+    'crypto': ['bitcoin', 'btc', 'ethereum', 'eth', 'coin'],
+    'currency': ['exchange', 'forex', 'money'],
+    'date': ['calendar', 'day'],
+    'discount': ['sale', 'off', 'price'],
+    'gpa': ['grade', 'grades', 'school'],
+    'interest': ['rate', 'apr', 'apy'],
+    'investment': ['invest', 'stocks', 'returns'],
+    'loan': ['borrow', 'credit', 'lending', 'emi', 'repayment'],
+    'mortgage': ['home', 'house', 'housing', 'property'],
+    'password': ['security', 'random'],
+    'percentage': ['percent', 'ratio'],
+    'pregnancy': ['due', 'baby', 'conception'],
+    'retirement': ['pension', '401k', 'ira'],
+    'salary': ['wage', 'pay', 'income', 'paycheck'],
+    'tax': ['vat', 'gst', 'income'],
+    'temperature': ['celsius', 'fahrenheit', 'kelvin'],
+    'tip': ['gratuity', 'restaurant'],
+    'unit': ['convert', 'conversion'],
+}
+
+_COMBINING_MARKS = re.compile('[\u0300-\u036f]')
+_TERM = re.compile('[a-z0-9]+')
+
+
+def singular(term):
+    """Drop a plural 's' so "calories" finds "Calorie" (and the reverse)."""
+    return term[:-1] if len(term) > 3 and term.endswith('s') and not term.endswith('ss') else term
+
+
+def tokenize(text):
+    """Lowercase, singular terms of text with accents and stopwords removed (matches searchTokens())."""
+    text = _COMBINING_MARKS.sub('', unicodedata.normalize('NFKD', str(text)).lower())
+    stop = set(STOPWORDS)
+    return [singular(term) for term in _TERM.findall(text) if term not in stop]
+
+
+def _calculator_terms(calc_id, calc, category):
+    """{term: weight} for one calculator."""
+    weights = {}
+
+    def add(terms, weight):
+        for term in terms:
+            if weights.get(term, 0) < weight:
+                weights[term] = weight
+
+    title_terms = tokenize(calc['title'])
+    id_terms = tokenize(calc_id)
+    add([singular(term) for name in title_terms + id_terms for term in SYNONYMS.get(name, [])], SYNONYM_WEIGHT)
+    add([term for inp in calc.get('inputs', []) for term in tokenize(inp.get('label', ''))], LABEL_WEIGHT)
+    add(tokenize(category) + tokenize(CATEGORY_TITLES.get(category, '')), CATEGORY_WEIGHT)
+    add(id_terms, ID_WEIGHT)
+    add(title_terms, TITLE_WEIGHT)
+    return weights
+
+
+def build_search_index(calculators, categories):
+    """The index for a registry's calculators and categories.
+
+    docs are [id, category] pairs ordered by title length, so among equal scores
+    the shorter (more general) title ranks first; postings[i] is the flat
+    [doc, weight, doc, weight, ...] list of terms[i].
+    """
+    category_of = {}
+    for category, tools in categories.items():
+        for tool in tools:
+            category_of.setdefault(tool, category)
+    ids = sorted((calc_id for calc_id in calculators if calc_id in category_of),
+                 key=lambda calc_id: (len(calculators[calc_id]['title']), calc_id))
+
+    postings = {}
+    for doc, calc_id in enumerate(ids):
+        for term, weight in sorted(_calculator_terms(calc_id, calculators[calc_id], category_of[calc_id]).items()):
+            postings.setdefault(term, []).extend((doc, weight))
+    terms = sorted(postings)
+    return {
+        'stopwords': STOPWORDS,
+        'docs': [[calc_id, category_of[calc_id]] for calc_id in ids],
+        'terms': terms,
+        'postings': [postings[term] for term in terms],
+    }
+
+
+def search_index_js(index, header=''):
+    """Render the index as the script main.js loads."""
+    return f"{header}const searchIndex = {json.dumps(index, separators=(',', ':'), ensure_ascii=False)};\n"
+
+
+def max_typos(length):
+    """Typos tolerated in a query term of this length."""
+    return 0 if length < 4 else 1 if length < 8 else 2
+
+
+class SearchEngine:
+    """Ranked, typo-tolerant lookups in a search index (matches createSearchEngine())."""
+
+    def __init__(self, index):
+        self.index = index
+        self.terms = index['terms']
+        # lcp[i]: length of the prefix terms[i] shares with terms[i - 1]
+        self.lcp = [0] * len(self.terms)
+        for i in range(1, len(self.terms)):
+            a, b = self.terms[i - 1], self.terms[i]
+            n = 0
+            while n < len(a) and n < len(b) and a[n] == b[n]:
+                n += 1
+            self.lcp[i] = n
+
+    def matching_terms(self, query):
+        """[(term index, quality)] for every term within max_typos(len(query)) edits of
+        the query (one when the first letter differs), counting the query as matched by
+        any prefix of the term."""
+        terms, lcp = self.terms, self.lcp
+        m = len(query)
+        k = max_typos(m)
+        max_depth = m + k
+        # rows[i][j]: edits between terms[x][:i] and query[:j] (optimal string alignment)
+        rows = [list(range(m + 1))] + [[0] * (m + 1) for _ in range(max_depth)]
+        # best[i]: fewest edits from the whole query to any prefix terms[x][:i'] with i' <= i
+        best = [m] + [0] * max_depth
+        valid = 0
+        matches = []
+        x = 0
+        while x < len(terms):
+            term = terms[x]
+            depth = min(len(term), max_depth)
+            # The second typo is only allowed when the first letter is right
+            allowed = 1 if k == 2 and term[0] != query[0] else k
+            i = min(lcp[x], valid) + 1
+            pruned = False
+            while i <= depth:
+                row, above = rows[i], rows[i - 1]
+                c = term[i - 1]
+                # Only the diagonal band |i - j| <= k can stay within k edits; the cells
+                # either side of it read as k + 1
+                lo, hi = max(1, i - k), min(m, i + k)
+                row[0] = i
+                row[lo - 1] = i if lo == 1 else k + 1
+                if hi < m:
+                    row[hi + 1] = k + 1
+                row_min = row[lo - 1]
+                for j in range(lo, hi + 1):
+                    d = min(above[j - 1] + (0 if query[j - 1] == c else 1), above[j] + 1, row[j - 1] + 1)
+                    if i > 1 and j > 1 and query[j - 1] == term[i - 2] and query[j - 2] == c:
+                        d = min(d, rows[i - 2][j - 2] + 1)
+                    row[j] = d
+                    row_min = min(row_min, d)
+                best[i] = min(best[i - 1], row[m]) if hi == m else best[i - 1]
+                if row_min > allowed:
+                    # No term below this prefix can come within the allowed edits
+                    valid = i - 1
+                    x += 1
+                    while x < len(terms) and lcp[x] >= i:
+                        x += 1
+                    pruned = True
+                    break
+                i += 1
+            if pruned:
+                continue
+            valid = depth
+            distance = best[depth]
+            if distance <= allowed:
+                if distance == 0:
+                    quality = EXACT if len(term) == m else PREFIX
+                else:
+                    quality = ONE_TYPO if distance == 1 else TWO_TYPOS
+                matches.append((x, quality))
+            x += 1
+        return matches
+
+    def search(self, query, limit=10):
+        """[(calculator id, category, score)] for calculators matching any query word,
+        those matching the most words first, then by score."""
+        words = tokenize(query)
+        if not words:
+            return []
+        docs = self.index['docs']
+        postings = self.index['postings']
+        total = [0] * len(docs)
+        matched = [0] * len(docs)
+        for word in words:
+            scores = {}
+            for x, quality in self.matching_terms(word):
+                posting = postings[x]
+                for p in range(0, len(posting), 2):
+                    doc, score = posting[p], posting[p + 1] * quality
+                    if scores.get(doc, 0) < score:
+                        scores[doc] = score
+            for doc, score in scores.items():
+                total[doc] += score
+                matched[doc] += 1
+        hits = [doc for doc in range(len(docs)) if matched[doc]]
+        hits.sort(key=lambda doc: (-matched[doc], -total[doc], doc))
+        return [(docs[doc][0], docs[doc][1], total[doc]) for doc in hits[:limit]]
+
+
+def load_search_index(base_path=None):
+    """Build the index from the current calculator registry."""
+    registry = load_registry(base_path or os.path.dirname(os.path.abspath(__file__)))
+    return build_search_index(registry['calculators'], registry['categories'])
+
+
+def _typo(word, rng):
+    """word with one random substitution, deletion, insertion or transposition."""
+    if len(word) < 2:
+        return word
+    i = rng.randrange(len(word) - 1)
+    letter = rng.choice('abcdefghijklmnopqrstuvwxyz')
+    edit = rng.randrange(4)
+    if edit == 0:
+        return word[:i] + letter + word[i + 1:]
+    if edit == 1:
+        return word[:i] + word[i + 1:]
+    if edit == 2:
+        return word[:i] + letter + word[i:]
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def _queries(index, count, seed=18):
+    """Realistic queries: prefixes of title words, misspelt words and two-word phrases."""
+    rng = random.Random(seed)
+    words = index['terms']
+    queries = []
+    for _ in range(count):
+        word = rng.choice(words)
+        kind = rng.randrange(4)
+        if kind == 0:
+            queries.append(word[:rng.randint(1, len(word))])
+        elif kind == 1:
+            queries.append(_typo(word, rng))
+        elif kind == 2:
+            queries.append(f"{rng.choice(words)} {word[:rng.randint(1, len(word))]}")
+        else:
+            queries.append(f"{_typo(rng.choice(words), rng)} {_typo(word, rng)}")
+    return queries
+
+
+def synthetic_index(count, seed=18):
+    """An index over `count` made-up calculators whose titles reuse the real vocabulary
+    plus invented words, for timing searches on a catalogue far larger than the site's."""
+    rng = random.Random(seed)
+    vocabulary = load_search_index()['terms']
+    vocabulary += [''.join(rng.choice('abcdefghijklmnopqrstuvwxyz') for _ in range(rng.randint(4, 11)))
+                   for _ in range(count)]
+    categories = {category: [] for category in CATEGORY_TITLES}
+    calculators = {}
+    for n in range(count):
+        title = ' '.join(rng.choice(vocabulary) for _ in range(rng.randint(2, 4))).title() + ' Calculator'
+        labels = [' '.join(rng.choice(vocabulary) for _ in range(rng.randint(1, 2))) for _ in range(rng.randint(1, 5))]
+        calc_id = f"calc-{n}"
+        calculators[calc_id] = {'title': title, 'inputs': [{'label': label} for label in labels]}
+        categories[rng.choice(list(categories))].append(calc_id)
+    return build_search_index(calculators, categories)
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, indexFile, queriesFile] = process.argv.slice(1);
+const context = vm.createContext({});
+vm.runInContext(fs.readFileSync(source, 'utf8') + ';this.createSearchEngine = createSearchEngine;', context);
+const engine = context.createSearchEngine(JSON.parse(fs.readFileSync(indexFile, 'utf8')));
+const queries = JSON.parse(fs.readFileSync(queriesFile, 'utf8'));
+process.stdout.write(JSON.stringify(queries.map(query =>
+    engine.search(query, 10).map(hit => [hit.id, hit.category, hit.score]))));
+"""
+
+_BENCHMARK_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [source, indexFile, queriesFile] = process.argv.slice(1);
+vm.runInThisContext(fs.readFileSync(source, 'utf8'));
+let start = process.hrtime.bigint();
+const engine = createSearchEngine(JSON.parse(fs.readFileSync(indexFile, 'utf8')));
+const loadMs = Number(process.hrtime.bigint() - start) / 1e6;
+const queries = JSON.parse(fs.readFileSync(queriesFile, 'utf8'));
+for (let i = 0; i < 200; i++) engine.search(queries[i % queries.length], 10);
+const times = queries.map(query => {
+    const t = process.hrtime.bigint();
+    engine.search(query, 10);
+    return Number(process.hrtime.bigint() - t) / 1e6;
+});
+process.stdout.write(JSON.stringify({ load: loadMs, times: times }));
+"""
+
+
+def _run_node(script, index, queries):
+    """Run a Node script over search.js, an index and a query list; None without Node."""
+    node = shutil.which('node')
+    if not node:
+        return None
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    files = []
+    try:
+        for data in (index, queries):
+            with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+                json.dump(data, f)
+            files.append(f.name)
+        completed = subprocess.run([node, '-e', script, os.path.join(base_path, *SEARCH_JS.split('/'))] + files,
+                                   capture_output=True, text=True, check=True)
+    finally:
+        for name in files:
+            os.remove(name)
+    return json.loads(completed.stdout)
+
+
+def parity(count=1000):
+    """Run search.js under Node on the site's index and a synthetic one and require the
+    same ranked results for every query. Returns the number of mismatches."""
+    mismatches = total = 0
+    for label, index in (('site index', load_search_index()), ('synthetic index', synthetic_index(2000))):
+        queries = _queries(index, count)
+        results = _run_node(_PARITY_JS, index, queries)
+        if results is None:
+            print("⚠️  node not found, parity check skipped")
+            return 0
+        engine = SearchEngine(index)
+        for query, js_hits in zip(queries, results):
+            hits = [list(hit) for hit in engine.search(query, 10)]
+            total += 1
+            if hits != js_hits:
+                mismatches += 1
+                if mismatches <= 5:
+                    print(f"   {label} {query!r}: js {js_hits[:3]}, python {hits[:3]}")
+    print(f"{'✅' if not mismatches else '❌'} {total - mismatches}/{total} queries match {SEARCH_JS}")
+    return mismatches
+
+
+def _percentiles(times):
+    times = sorted(times)
+    return times[len(times) // 2], times[int(len(times) * 0.99)], times[-1]
+
+
+def benchmark(count=5000, queries=2000):
+    """Time searches against the site's index and a synthetic index of `count`
+    calculators, in Python and (when Node is available) in search.js."""
+    site = load_search_index()
+    print(f"{'Index':<28} {'Terms':>7} {'KB gzip':>8} {'Python ms p50/p99/max':>22} {'JS ms p50/p99/max':>20}")
+    for label, index in ((f"site ({len(site['docs'])} calculators)", site),
+                         (f"synthetic ({count} calculators)", synthetic_index(count))):
+        query_list = _queries(index, queries)
+        engine = SearchEngine(index)
+        python_ms = []
+        for query in query_list:
+            start = time.perf_counter()
+            engine.search(query, 10)
+            python_ms.append((time.perf_counter() - start) * 1000)
+        js = _run_node(_BENCHMARK_JS, index, query_list)
+        size = len(gzip.compress(search_index_js(index).encode('utf-8'))) / 1024
+        python = '/'.join(f"{t:.2f}" for t in _percentiles(python_ms))
+        js_text = '/'.join(f"{t:.3f}" for t in _percentiles(js['times'])) if js else '-'
+        print(f"{label:<28} {len(index['terms']):>7} {size:>8.1f} {python:>22} {js_text:>20}")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Search the calculator index the way the search box does.")
+    parser.add_argument('query', nargs='*', help="search terms")
+    parser.add_argument('-n', '--limit', type=int, default=10, help="results to show (default 10)")
+    parser.add_argument('--parity', action='store_true', help="compare with assets/js/search.js under Node")
+    parser.add_argument('--benchmark', type=int, metavar='N',
+                        help="time searches on the site's index and on a synthetic index of N calculators")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.parity:
+        sys.exit(1 if parity() else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if not args.query:
+        print("❌ Please enter a search term")
+        sys.exit(1)
+    registry = load_registry(os.path.dirname(os.path.abspath(__file__)))
+    query = ' '.join(args.query)
+    hits = SearchEngine(build_search_index(registry['calculators'], registry['categories'])).search(query, args.limit)
+    if not hits:
+        print(f"❌ No calculators match {query!r}")
+    for calc_id, category, score in hits:
+        print(f"{score:>4}  {registry['calculators'][calc_id]['title']:<48} {category}/{calc_id}")
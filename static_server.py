@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Production static file server for the site tree (asyncio, standard library only).
+
+At start-up every servable file is indexed and the small ones are read into
+memory together with their compressed variants: the .gz/.br copies that
+build_assets.py writes when they exist, otherwise gzip (and brotli, when the
+brotli module is installed) made once here. Each response's headers are built
+once per file and encoding, so a request is a dictionary lookup and a write.
+
+  - Clean URLs resolve directly, without a redirect hop: /math-calculators,
+    /math-calculators/, /math-calculators/matrix, the /<category>/<id>-calculator
+    URLs that main.js updateUrl() pushes, /blogs and /convertors.
+  - If-None-Match and If-Modified-Since are answered with 304 Not Modified.
+  - Fingerprinted assets are served with immutable Cache-Control headers.
+  - Files larger than MEMORY_FILE_LIMIT stay on disk and are sent with
+    loop.sendfile(), which uses the zero-copy sendfile(2) system call.
+  - The tree is rescanned in the background, so rebuilt pages are picked up.
+
+    python static_server.py --port 8000
+    python static_server.py --benchmark 5
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import time
+import shutil
+import socket
+import asyncio
+import argparse
+import mimetypes
+import subprocess
+from email.utils import formatdate, parsedate_to_datetime
+from urllib.parse import unquote
+
+from calc_registry import URL_MAPPING
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Files up to this size are kept in memory; larger ones are sent from disk with sendfile()
+MEMORY_FILE_LIMIT = 1024 * 1024
+# Stop caching file contents once this much is held in memory
+MEMORY_LIMIT = 256 * 1024 * 1024
+# Smaller files are not worth compressing
+MIN_COMPRESS_SIZE = 512
+RESCAN_SECONDS = 2.0
+KEEP_ALIVE_SECONDS = 15
+MAX_HEADER_BYTES = 64 * 1024
+
+# Never served: build scripts, docs, caches and anything starting with a dot
+SKIP_DIRS = {'node_modules', '__pycache__'}
+SKIP_SUFFIXES = ('.py', '.pyc', '.md', '.ps1', '.jsonl', '.tsv', '.tmp')
+
+CONTENT_TYPES = {
+    '.html': 'text/html; charset=utf-8',
+    '.js': 'application/javascript; charset=utf-8',
+    '.css': 'text/css; charset=utf-8',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.txt': 'text/plain; charset=utf-8',
+    '.svg': 'image/svg+xml',
+    '.ico': 'image/x-icon',
+    '.webmanifest': 'application/manifest+json',
+}
+COMPRESSIBLE = ('text/', 'application/javascript', 'application/json', 'application/xml',
+                'application/manifest+json', 'image/svg+xml', 'image/x-icon')
+
+# Cache lifetimes, following the ExpiresByType rules in .htaccess
+FINGERPRINTED = re.compile(r'\.[0-9a-f]{10}\.(js|css)$')
+IMMUTABLE = 'public, max-age=31536000, immutable'
+MAX_AGE = {'text/html': 86400, 'application/xml': 86400, 'application/json': 86400,
+           'text/css': 2592000, 'application/javascript': 2592000, 'image/': 2592000, 'font/': 31536000}
+
+STATUS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+def content_type(path):
+    ext = os.path.splitext(path)[1].lower()
+    return CONTENT_TYPES.get(ext) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def cache_control(path, ctype):
+    if FINGERPRINTED.search(path):
+        return IMMUTABLE
+    for prefix, seconds in MAX_AGE.items():
+        if ctype.startswith(prefix):
+            return f'public, max-age={seconds}'
+    return 'public, max-age=3600'
+
+
+class StaticFile:
+    """One file on disk with its validators, prebuilt headers and cached bodies."""
+
+    def __init__(self, path, st, cached_bytes=0):
+        self.path = path
+        self.size = st.st_size
+        self.mtime_ns = st.st_mtime_ns
+        self.content_type = content_type(path)
+        self.etag = f'"{st.st_size:x}-{st.st_mtime_ns:x}"'
+        self.last_modified = formatdate(st.st_mtime, usegmt=True)
+        self.mtime = int(st.st_mtime)
+        self.cache_control = cache_control(path, self.content_type)
+        # encoding ('identity', 'gzip', 'br') -> body bytes; empty when the file is sent from disk
+        self.bodies = {}
+        if self.size <= MEMORY_FILE_LIMIT and cached_bytes + self.size <= MEMORY_LIMIT:
+            with open(path, 'rb') as f:
+                self.bodies['identity'] = f.read()
+            if self.content_type.startswith(COMPRESSIBLE):
+                self._add_variants()
+        self.headers = {encoding: self.headers_for(encoding, len(body)) for encoding, body in self.bodies.items()}
+
+    def _add_variants(self):
+        data = self.bodies['identity']
+        for encoding, suffix, compress in (('gzip', '.gz', lambda d: gzip.compress(d, 9, mtime=0)),
+                                           ('br', '.br', brotli.compress if brotli else None)):
+            try:
+                with open(self.path + suffix, 'rb') as f:
+                    self.bodies[encoding] = f.read()
+                continue
+            except OSError:
+                pass
+            if compress and len(data) >= MIN_COMPRESS_SIZE:
+                compressed = compress(data)
+                if len(compressed) < len(data):
+                    self.bodies[encoding] = compressed
+
+    def etag_for(self, encoding):
+        """A strong ETag per representation: the gzip and br bodies are different bytes from the file."""
+        return self.etag if encoding == 'identity' else f'{self.etag[:-1]}-{encoding}"'
+
+    def headers_for(self, encoding, length):
+        lines = [f'Content-Type: {self.content_type}', f'Content-Length: {length}', f'ETag: {self.etag_for(encoding)}',
+                 f'Last-Modified: {self.last_modified}', f'Cache-Control: {self.cache_control}']
+        if len(self.bodies) > 1:
+            lines.append('Vary: Accept-Encoding')
+        if encoding != 'identity':
+            lines.append(f'Content-Encoding: {encoding}')
+        return ('\r\n'.join(lines) + '\r\n').encode('latin-1')
+
+    @property
+    def memory(self):
+        return sum(len(body) for body in self.bodies.values())
+
+    def not_modified(self, headers, encoding='identity'):
+        """True when the request's validators show the client's copy of this representation is current."""
+        if_none_match = headers.get('if-none-match')
+        if if_none_match is not None:
+            tags = [tag.strip().removeprefix('W/') for tag in if_none_match.split(',')]
+            return '*' in tags or self.etag_for(encoding) in tags
+        if_modified_since = headers.get('if-modified-since')
+        if if_modified_since:
+            try:
+                return self.mtime <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    def encoding_for(self, accept_encoding):
+        """The best encoding the client accepts and this file has."""
+        if len(self.bodies) < 2 or not accept_encoding:
+            return 'identity'
+        accepted = set()
+        for item in accept_encoding.split(','):
+            name, _, params = item.strip().partition(';')
+            if params.strip().replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                accepted.add(name.strip().lower())
+        for encoding in ('br', 'gzip'):
+            if encoding in self.bodies and (encoding in accepted or '*' in accepted):
+                return encoding
+        return 'identity'
+
+
+def scan_tree(root):
+    """{url path: file path} for every servable file, plus the clean URLs that resolve to them."""
+    files = {}
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith('.') and d not in SKIP_DIRS)
+        for name in filenames:
+            if name.startswith('.') or name.endswith(SKIP_SUFFIXES):
+                continue
+            path = os.path.join(dirpath, name)
+            if name.endswith(('.gz', '.br')) and os.path.exists(path[:-3]):
+                continue
+            files['/' + os.path.relpath(path, root).replace(os.sep, '/')] = path
+
+    routes = dict(files)
+    categories = set(URL_MAPPING.values())
+    for url, path in files.items():
+        if url.endswith('/index.html'):
+            directory = url[:-len('index.html')]
+            routes.setdefault(directory, path)
+            routes.setdefault(directory.rstrip('/') or '/', path)
+        elif url.endswith('.html'):
+            page = url[:-len('.html')]
+            routes.setdefault(page, path)
+            directory = page.rsplit('/', 1)[0].lstrip('/')
+            if directory in categories:
+                # main.js getCalculatorUrl() names calculators '<id>-calculator'
+                routes.setdefault(page + '-calculator', path)
+    return routes
+
+
+class StaticSite:
+    """The route table and file cache, refreshed from disk every RESCAN_SECONDS."""
+
+    def __init__(self, root):
+        self.root = os.path.abspath(root)
+        self.routes = {}
+        self.entries = {}
+        self.refresh()
+
+    def refresh(self):
+        routes = scan_tree(self.root)
+        entries = {}
+        cached = 0
+        for path in sorted(set(routes.values())):
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            entry = self.entries.get(path)
+            if entry is None or entry.size != st.st_size or entry.mtime_ns != st.st_mtime_ns:
+                entry = StaticFile(path, st, cached)
+            entries[path] = entry
+            cached += entry.memory
+        self.routes = {url: entries[path] for url, path in routes.items() if path in entries}
+        self.entries = entries
+        self.not_found = self.routes.get('/404.html')
+
+    def resolve(self, target):
+        """The StaticFile for a request target, or None."""
+        path = unquote(target.split('?', 1)[0].split('#', 1)[0])
+        entry = self.routes.get(path)
+        if entry is None and len(path) > 1 and path.endswith('/'):
+            entry = self.routes.get(path.rstrip('/'))
+        return entry
+
+    @property
+    def memory(self):
+        return sum(entry.memory for entry in self.entries.values())
+
+
+class StaticServer:
+    """HTTP/1.1 keep-alive server for a StaticSite."""
+
+    def __init__(self, site, log=False):
+        self.site = site
+        self.log = log
+        self._date = (0, b'')
+
+    def date_header(self):
+        now = int(time.time())
+        if self._date[0] != now:
+            self._date = (now, f'Date: {formatdate(now, usegmt=True)}\r\n'.encode('latin-1'))
+        return self._date[1]
+
+    async def handle(self, reader, writer):
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_SECONDS)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                keep_alive = await self.respond(head, reader, writer)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+
+    async def respond(self, head, reader, writer):
+        """Answer one request; returns whether the connection stays open."""
+        lines = head.decode('latin-1').split('\r\n')
+        parts = lines[0].split(' ')
+        if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+            await self.send_status(writer, 400, False)
+            return False
+        method, target, version = parts
+        headers = {}
+        for line in lines[1:]:
+            name, sep, value = line.partition(':')
+            if sep:
+                headers[name.strip().lower()] = value.strip()
+        connection = headers.get('connection', '').lower()
+        keep_alive = 'close' not in connection if version == 'HTTP/1.1' else 'keep-alive' in connection
+        if headers.get('content-length', '0') != '0':
+            try:
+                await reader.readexactly(int(headers['content-length']))
+            except (ValueError, asyncio.IncompleteReadError):
+                return False
+
+        if method not in ('GET', 'HEAD'):
+            await self.send_status(writer, 405, keep_alive, b'Allow: GET, HEAD\r\n')
+            return keep_alive
+        entry = self.site.resolve(target)
+        status = 200
+        if entry is None:
+            status, entry = 404, self.site.not_found
+            if entry is None:
+                await self.send_status(writer, 404, keep_alive)
+                return keep_alive
+        if self.log:
+            print(f"{method} {target} {status}")
+
+        common = self.date_header()
+        if not keep_alive:
+            common += b'Connection: close\r\n'
+        elif version == 'HTTP/1.0':
+            common += b'Connection: keep-alive\r\n'
+        # Files sent from disk only have their identity representation
+        encoding = entry.encoding_for(headers.get('accept-encoding')) if entry.bodies else 'identity'
+        if status == 200 and entry.not_modified(headers, encoding):
+            vary = 'Vary: Accept-Encoding\r\n' if len(entry.bodies) > 1 else ''
+            writer.write(b'HTTP/1.1 304 Not Modified\r\n' + common +
+                         f'ETag: {entry.etag_for(encoding)}\r\nLast-Modified: {entry.last_modified}\r\n'
+                         f'Cache-Control: {entry.cache_control}\r\n{vary}\r\n'.encode('latin-1'))
+        else:
+            start = f'HTTP/1.1 {status} {STATUS[status]}\r\n'.encode('latin-1') + common
+            if entry.bodies:
+                writer.write(start + entry.headers[encoding] + b'\r\n')
+                if method == 'GET':
+                    writer.write(entry.bodies[encoding])
+            else:
+                await self.send_file(writer, start, entry, method == 'GET')
+        await writer.drain()
+        return keep_alive
+
+    async def send_file(self, writer, start, entry, body):
+        """Send a large file from disk with zero-copy sendfile()."""
+        with open(entry.path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            writer.write(start + entry.headers_for('identity', size) + b'\r\n')
+            if body:
+                await writer.drain()
+                await asyncio.get_running_loop().sendfile(writer.transport, f, 0, size)
+
+    async def send_status(self, writer, status, keep_alive, extra=b''):
+        body = f'{status} {STATUS[status]}\n'.encode('latin-1')
+        writer.write(f'HTTP/1.1 {status} {STATUS[status]}\r\n'.encode('latin-1') + self.date_header() + extra +
+                     f'Content-Type: text/plain\r\nContent-Length: {len(body)}\r\n'.encode('latin-1') +
+                     (b'' if keep_alive else b'Connection: close\r\n') + b'\r\n' + body)
+        await writer.drain()
+
+    async def rescan(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await asyncio.sleep(RESCAN_SECONDS)
+            await loop.run_in_executor(None, self.site.refresh)
+
+    async def serve(self, host, port, ready=None):
+        server = await asyncio.start_server(self.handle, host, port, limit=MAX_HEADER_BYTES, reuse_address=True)
+        asyncio.get_running_loop().create_task(self.rescan())
+        if ready:
+            ready()
+        async with server:
+            await server.serve_forever()
+
+
+def serve(root, host='127.0.0.1', port=8000, log=False):
+    start = time.perf_counter()
+    site = StaticSite(root)
+    files = len(site.entries)
+    cached = sum(1 for entry in site.entries.values() if entry.bodies)
+    print(f"📦 {files} files, {cached} cached in memory ({site.memory / 1024 / 1024:.1f} MB with compressed copies), "
+          f"{len(site.routes)} routes, indexed in {time.perf_counter() - start:.2f}s"
+          f"{'' if brotli else ' (brotli module not installed: gzip only)'}")
+    server = StaticServer(site, log)
+    try:
+        asyncio.run(server.serve(host, port, lambda: print(f"🚀 Serving {site.root} at http://{host}:{port}/", flush=True)))
+    except KeyboardInterrupt:
+        pass
+
+
+# Load test: a mix of pages, clean URLs and fingerprinted assets, requested over keep-alive connections
+def _benchmark_urls(root, clean):
+    with open(os.path.join(root, 'assets', 'asset-manifest.json'), encoding='utf-8') as f:
+        manifest = json.load(f)
+    urls = ['/', '/404.html', '/sitemap.xml', '/' + manifest['assets/js/main.js'],
+            '/' + manifest['assets/js/calculators-index.js'], '/assets/js/calculators/bmi.js',
+            '/' + manifest['assets/css/style.css']]
+    if clean:
+        urls += ['/math-calculators', '/math-calculators/matrix-calculator', '/health-calculators/bmi', '/blogs']
+    else:
+        urls += ['/math-calculators/index.html', '/math-calculators/matrix-calculator.html',
+                 '/health-calculators/bmi.html', '/blogs.html']
+    return urls
+
+
+async def _client(port, urls, deadline, latencies, counts):
+    reader = writer = None
+    i = 0
+    while time.perf_counter() < deadline:
+        if writer is None:
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        url = urls[i % len(urls)]
+        i += 1
+        start = time.perf_counter()
+        writer.write(f'GET {url} HTTP/1.1\r\nHost: localhost\r\nAccept-Encoding: gzip\r\n\r\n'.encode('latin-1'))
+        head = (await reader.readuntil(b'\r\n\r\n')).decode('latin-1').lower()
+        length = re.search(r'content-length: *(\d+)', head)
+        if length:
+            await reader.readexactly(int(length.group(1)))
+        else:
+            await reader.read()
+        latencies.append(time.perf_counter() - start)
+        status = head[9:12]
+        counts[status] = counts.get(status, 0) + 1
+        if not length or 'connection: close' in head or head.startswith('http/1.0'):
+            writer.close()
+            writer = None
+    if writer:
+        writer.close()
+
+
+async def _load(port, urls, seconds, connections):
+    latencies, counts = [], {}
+    deadline = time.perf_counter() + seconds
+    await asyncio.gather(*(_client(port, urls, deadline, latencies, counts) for _ in range(connections)))
+    return latencies, counts
+
+
+def _wait_for_port(port, timeout=20):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), 0.2).close()
+            return True
+        except OSError:
+            time.sleep(0.1)
+    return False
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def benchmark(seconds=5, connections=32):
+    """Requests per second of this server, `serve` (when installed) and python -m http.server
+    under the same keep-alive load; the load generator runs in this process."""
+    root = os.path.dirname(os.path.abspath(__file__))
+    local_serve = os.path.join(root, 'node_modules', '.bin', 'serve')
+    serve_bin = local_serve if os.path.exists(local_serve) else shutil.which('serve')
+    servers = [('static_server.py', [sys.executable, os.path.abspath(__file__), '--port', '{port}'], True)]
+    if serve_bin:
+        servers.append(('serve', [serve_bin, '-l', 'tcp://127.0.0.1:{port}', '-n', '-L', root], True))
+    servers.append(('python -m http.server', [sys.executable, '-m', 'http.server', '{port}', '-b', '127.0.0.1',
+                                               '-d', root], False))
+
+    print(f"{'Server':<24} {'Req/s':>9} {'p50 ms':>8} {'p99 ms':>8}  Responses")
+    for label, command, clean in servers:
+        port = _free_port()
+        process = subprocess.Popen([part.format(port=port) for part in command],
+                                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            if not _wait_for_port(port):
+                print(f"{label:<24} did not start")
+                continue
+            latencies, counts = asyncio.run(_load(port, _benchmark_urls(root, clean), seconds, connections))
+        finally:
+            process.terminate()
+            process.wait()
+        latencies.sort()
+        p50 = latencies[len(latencies) // 2] * 1000
+        p99 = latencies[int(len(latencies) * 0.99)] * 1000
+        responses = ', '.join(f"{count} x {status}" for status, count in sorted(counts.items()))
+        print(f"{label:<24} {len(latencies) / seconds:>9.0f} {p50:>8.2f} {p99:>8.2f}  {responses}")
+    if not serve_bin:
+        print("⚠️  serve not installed (npm install), skipped")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the site tree with caching, precompression and clean URLs.")
+    parser.add_argument('--root', default=os.path.dirname(os.path.abspath(__file__)), help="site directory")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8000, help="port to listen on (default 8000)")
+    parser.add_argument('--log', action='store_true', help="print one line per request")
+    parser.add_argument('--benchmark', type=int, metavar='SECONDS',
+                        help="load test this server against serve and python -m http.server")
+    parser.add_argument('--connections', type=int, default=32, help="concurrent connections for --benchmark")
+    return parser.parse_args(argv)
+
+if __name__ == '__main__':
+    args = parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark, args.connections)
+        sys.exit(0)
+    serve(args.root, args.host, args.port, args.log)
@@ -0,0 +1,446 @@
+#!/usr/bin/env python3
+"""
+Unit conversion core shared by the conversion-tools calculators.
+
+Every dimension is described once in DIMENSIONS and compiled into a dense
+n x n matrix, so converting between any two units is a single lookup:
+
+    out = value * factor[i][j] + offset[i][j]     (linear and affine units)
+    out = factor[i][j] / value                    (reciprocal pairs, e.g. mpg <-> l/100km)
+
+`python unit_conversion.py --build` writes assets/js/unit-table.js, a compact
+table (factor matrices as base64 Float64Array) that assets/js/units.js decodes
+once in the browser. The bulk API converts whole columns at once, and
+`python unit_conversion.py convert` converts a column of a large CSV file in chunks.
+"""
+
+import os
+import re
+import csv
+import sys
+import json
+import math
+import time
+import base64
+import shutil
+import struct
+import argparse
+import subprocess
+from fractions import Fraction
+
+from build_io import atomic_open, write_if_changed
+from calc_registry import CALCULATORS_JS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+UNIT_TABLE_JS = 'assets/js/unit-table.js'
+UNITS_JS = 'assets/js/units.js'
+
+CHUNK_ROWS = 65536
+
+# Units per dimension, as the size of one unit in the dimension's base unit.
+# (scale, zero) marks an affine unit: base = (value - zero) * scale.
+# ('reciprocal', k) marks a unit inversely proportional to the base: base = k / value.
+# A dimension with 'matrix' lists its conversion factors directly.
+DIMENSIONS = {
+    'length': {'base': 'm', 'units': {
+        'mm': 0.001, 'cm': 0.01, 'm': 1, 'km': 1000,
+        'in': 0.0254, 'ft': 0.3048, 'yd': 0.9144, 'mi': 1609.344}},
+    'temperature': {'base': 'C', 'units': {
+        'C': (1, 0), 'F': (Fraction(5, 9), 32), 'K': (1, 273.15), 'R': (Fraction(5, 9), 491.67)}},
+    'weight': {'base': 'g', 'units': {
+        'mg': 0.001, 'g': 1, 'kg': 1000, 't': 1000000,
+        'oz': 28.3495, 'lb': 453.592, 'st': 6350.29}},
+    'area': {'base': 'm²', 'units': {
+        'mm²': 0.000001, 'cm²': 0.0001, 'm²': 1, 'km²': 1000000,
+        'in²': 0.00064516, 'ft²': 0.092903, 'yd²': 0.836127,
+        'ac': 4046.86, 'ha': 10000}},
+    'volume': {'base': 'l', 'units': {
+        'ml': 0.001, 'l': 1, 'm³': 1000,
+        'fl oz': 0.0295735, 'cup': 0.236588, 'pt': 0.473176,
+        'qt': 0.946353, 'gal': 3.78541}},
+    'speed': {'base': 'm/s', 'units': {
+        'm/s': 1, 'km/h': Fraction(5, 18), 'mph': 0.44704,
+        'ft/s': 0.3048, 'knots': 0.514444}},
+    'pressure': {'base': 'Pa', 'units': {
+        'Pa': 1, 'kPa': 1000, 'MPa': 1000000, 'bar': 100000,
+        'atm': 101325, 'psi': 6894.76, 'mmHg': 133.322, 'inHg': 3386.39}},
+    'energy': {'base': 'J', 'units': {
+        'J': 1, 'kJ': 1000, 'MJ': 1000000, 'cal': 4.184,
+        'kcal': 4184, 'Wh': 3600, 'kWh': 3600000, 'BTU': 1055.06, 'eV': 1.602e-19}},
+    'power': {'base': 'W', 'units': {
+        'W': 1, 'kW': 1000, 'MW': 1000000, 'hp': 745.7,
+        'BTU/h': 0.293071, 'cal/s': 4.184}},
+    'data-storage': {'base': 'byte', 'units': {
+        'bit': 0.125, 'byte': 1, 'KB': 1024, 'MB': 1048576,
+        'GB': 1073741824, 'TB': 1099511627776, 'PB': 1125899906842624}},
+    'angle': {'base': 'deg', 'units': {
+        'deg': 1, 'rad': 180 / math.pi, 'grad': 0.9, 'turn': 360,
+        'arcmin': Fraction(1, 60), 'arcsec': Fraction(1, 3600)}},
+    'time': {'base': 'sec', 'units': {
+        'ms': 0.001, 'sec': 1, 'min': 60, 'hr': 3600, 'day': 86400,
+        'week': 604800, 'month': 2629746, 'year': 31556952}},
+    'frequency': {'base': 'Hz', 'units': {
+        'Hz': 1, 'kHz': 1000, 'MHz': 1000000, 'GHz': 1000000000,
+        'THz': 1000000000000, 'rpm': Fraction(1, 60), 'rps': 1}},
+    'fuel-economy': {'base': 'l/100km', 'units': {
+        'mpg': ('reciprocal', 235.214), 'l/100km': 1,
+        'km/l': ('reciprocal', 100), 'mi/l': ('reciprocal', 160.934)}},
+    'density': {'base': 'kg/m³', 'units': {
+        'kg/m³': 1, 'g/cm³': 1000, 'g/ml': 1000,
+        'lb/ft³': 16.0185, 'oz/in³': 1729.99}},
+    'force': {'base': 'N', 'units': {
+        'N': 1, 'kN': 1000, 'lbf': 4.44822, 'kgf': 9.80665,
+        'dyn': 0.00001, 'pdl': 0.138255}},
+    # Approximate, geometry-dependent factors that do not derive from one base unit
+    'luminosity': {'base': 'lm', 'matrix': {
+        'lm': {'lm': 1, 'cd': 0.0796, 'lx': 1, 'fc': 0.0929},
+        'cd': {'lm': 12.57, 'cd': 1, 'lx': 12.57, 'fc': 1.168},
+        'lx': {'lm': 1, 'cd': 0.0796, 'lx': 1, 'fc': 0.0929},
+        'fc': {'lm': 10.764, 'cd': 0.857, 'lx': 10.764, 'fc': 1}}},
+    'magnetic-field': {'base': 'T', 'units': {
+        'T': 1, 'mT': 0.001, 'μT': 0.000001,
+        'G': 0.0001, 'mG': 0.0000001, 'Oe': 0.0000796}},
+    'radioactivity': {'base': 'Bq', 'units': {
+        'Bq': 1, 'kBq': 1000, 'MBq': 1000000, 'GBq': 1000000000,
+        'Ci': 3.7e10, 'mCi': 3.7e7, 'μCi': 37000, 'nCi': 37, 'pCi': 0.037}},
+    'torque': {'base': 'Nm', 'units': {
+        'Nm': 1, 'kNm': 1000, 'lbft': 1.35582, 'lbin': 0.112985,
+        'kgfm': 9.80665, 'kgfcm': 0.0980665, 'ozin': 0.00706155}},
+}
+
+# conversion-tools calculators backed by the table (currency takes a user-supplied rate)
+CALCULATOR_DIMENSIONS = {
+    'length': 'length', 'temperature': 'temperature', 'weight': 'weight', 'area': 'area',
+    'volume': 'volume', 'speed': 'speed', 'pressure': 'pressure', 'energy-conversion': 'energy',
+    'power-conversion': 'power', 'data-storage': 'data-storage', 'angle': 'angle',
+    'time-conversion': 'time', 'frequency': 'frequency', 'fuel-economy-conversion': 'fuel-economy',
+    'density': 'density', 'force-conversion': 'force', 'luminosity': 'luminosity',
+    'magnetic-field': 'magnetic-field', 'radioactivity': 'radioactivity', 'torque': 'torque',
+}
+
+
+class UnitError(ValueError):
+    """Raised for unknown dimensions or units."""
+
+
+def _exact(number):
+    """A decimal literal as the exact rational it denotes."""
+    return number if isinstance(number, Fraction) else Fraction(repr(number))
+
+
+def _pair(spec_from, spec_to):
+    """Return (factor, offset, reciprocal) converting a value in spec_from to spec_to.
+
+    Factors and offsets are worked out in exact rational arithmetic and rounded
+    once, so zero points such as 0 K or 32 °F convert to exact results.
+    """
+    def parts(spec):
+        if isinstance(spec, tuple) and spec[0] == 'reciprocal':
+            return 'reciprocal', _exact(spec[1]), 0
+        if isinstance(spec, tuple):
+            return 'linear', _exact(spec[0]), _exact(spec[1])
+        return 'linear', _exact(spec), 0
+
+    kind_from, scale_from, zero_from = parts(spec_from)
+    kind_to, scale_to, zero_to = parts(spec_to)
+    if kind_from == 'linear' and kind_to == 'linear':
+        # base = (v - zero_from) * scale_from; out = base / scale_to + zero_to
+        factor = scale_from / scale_to
+        return factor, zero_to - zero_from * factor, False
+    if kind_from == 'reciprocal' and kind_to == 'reciprocal':
+        # base = k_from / v; out = k_to / base
+        return scale_to / scale_from, 0, False
+    if kind_from == 'reciprocal':
+        # base = k_from / v; out = base / scale_to
+        return scale_from / scale_to, 0, True
+    # base = v * scale_from; out = k_to / base
+    return scale_to / scale_from, 0, True
+
+
+def compile_dimension(name):
+    """Build the dense matrices of one dimension.
+
+    Returns {'units': [...], 'factors': [...], 'offsets': [...] or None,
+    'reciprocal': [...] or None} with row-major n*n lists.
+    """
+    spec = DIMENSIONS[name]
+    if 'matrix' in spec:
+        units = list(spec['matrix'])
+        factors = [float(spec['matrix'][a][b]) for a in units for b in units]
+        return {'units': units, 'factors': factors, 'offsets': None, 'reciprocal': None}
+    units = list(spec['units'])
+    factors, offsets, reciprocal = [], [], []
+    for a in units:
+        for b in units:
+            factor, offset, inverse = _pair(spec['units'][a], spec['units'][b])
+            factors.append(float(factor))
+            offsets.append(float(offset))
+            reciprocal.append(1 if inverse else 0)
+    return {
+        'units': units,
+        'factors': factors,
+        'offsets': offsets if any(offsets) else None,
+        'reciprocal': reciprocal if any(reciprocal) else None,
+    }
+
+
+_compiled = {}
+
+
+def dimension(name):
+    """Compiled matrices of a dimension, built once per process."""
+    if name not in _compiled:
+        if name not in DIMENSIONS:
+            raise UnitError(f"Unknown dimension '{name}'")
+        table = compile_dimension(name)
+        table['index'] = {unit: i for i, unit in enumerate(table['units'])}
+        _compiled[name] = table
+    return _compiled[name]
+
+
+def _cell(name, from_unit, to_unit):
+    table = dimension(name)
+    try:
+        cell = table['index'][from_unit] * len(table['units']) + table['index'][to_unit]
+    except KeyError as e:
+        raise UnitError(f"Unknown {name} unit {e.args[0]!r}") from None
+    offset = table['offsets'][cell] if table['offsets'] else 0.0
+    reciprocal = bool(table['reciprocal'] and table['reciprocal'][cell])
+    return table['factors'][cell], offset, reciprocal
+
+
+def _reciprocal(factor, value):
+    try:
+        return factor / value
+    except ZeroDivisionError:
+        return math.inf
+
+
+def convert(name, value, from_unit, to_unit):
+    """Convert a single value."""
+    factor, offset, reciprocal = _cell(name, from_unit, to_unit)
+    if reciprocal:
+        return _reciprocal(factor, value)
+    return value * factor + offset
+
+
+def convert_column(name, values, from_unit, to_unit):
+    """Convert a whole column of values between two units.
+
+    Takes and returns a NumPy array when NumPy is installed, otherwise any
+    iterable in and a list out.
+    """
+    factor, offset, reciprocal = _cell(name, from_unit, to_unit)
+    if np is not None:
+        values = np.asarray(values, dtype=np.float64)
+        if reciprocal:
+            with np.errstate(divide='ignore'):
+                return factor / values
+        return values * factor + offset if offset else values * factor
+    if reciprocal:
+        return [_reciprocal(factor, value) for value in values]
+    if offset:
+        return [value * factor + offset for value in values]
+    return [value * factor for value in values]
+
+
+def _pack(values):
+    return base64.b64encode(struct.pack(f'<{len(values)}d', *values)).decode('ascii')
+
+
+def table_json():
+    """The compact table shipped to the browser."""
+    table = {}
+    for name in DIMENSIONS:
+        compiled = compile_dimension(name)
+        entry = {'units': compiled['units'], 'factors': _pack(compiled['factors'])}
+        if compiled['offsets']:
+            entry['offsets'] = _pack(compiled['offsets'])
+        if compiled['reciprocal']:
+            entry['reciprocal'] = ''.join(str(flag) for flag in compiled['reciprocal'])
+        table[name] = entry
+    return table
+
+
+def build(base_path):
+    """Write assets/js/unit-table.js. Returns True if it changed."""
+    content = ('// Generated by unit_conversion.py --build - do not edit\n'
+               '// Factor and offset matrices are row-major base64 Float64Array (little-endian)\n'
+               f'const UNIT_TABLE = {json.dumps(table_json(), ensure_ascii=False, separators=(",", ":"))};\n')
+    return write_if_changed(os.path.join(base_path, *UNIT_TABLE_JS.split('/')), content)
+
+
+def convert_csv(in_file, out_file, name, from_unit, to_unit, column='value', output_column=None,
+                chunk_rows=CHUNK_ROWS):
+    """Convert one column of a CSV file in chunks, appending the result column. Returns rows written."""
+    output_column = output_column or f'{column}_{to_unit}'
+    _cell(name, from_unit, to_unit)
+    written = 0
+    with open(in_file, 'r', encoding='utf-8', newline='') as source, \
+            atomic_open(out_file, 'w', encoding='utf-8') as out:
+        reader = csv.reader(source)
+        header = next(reader, None)
+        if header is None:
+            return 0
+        if column not in header:
+            raise UnitError(f"Column '{column}' not found in {in_file}")
+        position = header.index(column)
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(header + [output_column])
+        chunk = []
+        for row in reader:
+            chunk.append(row)
+            if len(chunk) == chunk_rows:
+                written += _write_chunk(writer, chunk, position, name, from_unit, to_unit)
+                chunk = []
+        if chunk:
+            written += _write_chunk(writer, chunk, position, name, from_unit, to_unit)
+    return written
+
+
+def _number(text):
+    try:
+        return float(text)
+    except ValueError:
+        return math.nan
+
+
+def _write_chunk(writer, rows, position, name, from_unit, to_unit):
+    converted = convert_column(name, [_number(row[position]) for row in rows], from_unit, to_unit)
+    writer.writerows(row + [repr(float(value))] for row, value in zip(rows, converted))
+    return len(rows)
+
+
+_PARITY_JS = r"""
+const fs = require('fs'), vm = require('vm');
+const [casesFile, ...sources] = process.argv.slice(1);
+const context = vm.createContext({ atob: atob });
+vm.runInContext(sources.map(file => fs.readFileSync(file, 'utf8')).join('\n;\n') +
+    ';this.calculators = calculators;', context);
+const cases = JSON.parse(fs.readFileSync(casesFile, 'utf8'));
+process.stdout.write(JSON.stringify(cases.map(([calcId, inputs]) =>
+    String(context.calculators[calcId].calculate(inputs)).split('\n')[0].split(' = ')[1])));
+"""
+
+_RESULT = re.compile(r'-?(?:Infinity|NaN|\d+(?:\.(\d+))?(?:e[+-]?\d+)?)')
+
+
+def _parity_cases(values):
+    cases = []
+    for calc_id, name in CALCULATOR_DIMENSIONS.items():
+        units = dimension(name)['units']
+        for from_unit in units:
+            for to_unit in units:
+                for value in values:
+                    cases.append((calc_id, name, value, from_unit, to_unit))
+    return cases
+
+
+def parity(sources=None, values=(0, 0.5, 1, -40, 37.25, 1234.5678)):
+    """Run the converters in calculators.js under Node and check every unit pair against
+    this table, to the precision the calculator prints. Returns the number of mismatches.
+
+    sources defaults to the shipped unit-table.js, units.js and calculators.js; pass an older
+    calculators.js alone to check the table against converters that carry their own factors.
+    """
+    node = shutil.which('node')
+    if not node:
+        print("⚠️  node not found, parity check skipped")
+        return 0
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    if sources is None:
+        sources = [os.path.join(base_path, *rel.split('/')) for rel in (UNIT_TABLE_JS, UNITS_JS, CALCULATORS_JS)]
+    cases = _parity_cases(values)
+    cases_file = os.path.join(base_path, '.parity-cases.json')
+    try:
+        with atomic_open(cases_file, 'w', encoding='utf-8') as f:
+            json.dump([[calc_id, {'value': str(value), 'fromUnit': from_unit, 'toUnit': to_unit}]
+                       for calc_id, _, value, from_unit, to_unit in cases], f)
+        completed = subprocess.run([node, '-e', _PARITY_JS, cases_file, *sources],
+                                   capture_output=True, text=True, check=True)
+    finally:
+        if os.path.exists(cases_file):
+            os.remove(cases_file)
+
+    mismatches = 0
+    for (_, name, value, from_unit, to_unit), text in zip(cases, json.loads(completed.stdout)):
+        match = _RESULT.match(text)
+        js_value = float(match.group(0))
+        ours = convert(name, value, from_unit, to_unit)
+        tolerance = 0.5 * 10 ** -len(match.group(1) or '')
+        if not (math.isclose(ours, js_value, rel_tol=1e-9, abs_tol=tolerance * 1.000001) or ours == js_value):
+            mismatches += 1
+            if mismatches <= 5:
+                print(f"   {name}: {value} {from_unit} -> {to_unit}: js {text!r}, table {ours!r}")
+    print(f"{'✅' if not mismatches else '❌'} {len(cases) - mismatches}/{len(cases)} conversions match "
+          f"({', '.join(os.path.basename(source) for source in sources)})")
+    return mismatches
+
+
+def benchmark(count=1000000):
+    """Report bulk conversion throughput against converting one value at a time."""
+    print(f"Backend: {'NumPy ' + np.__version__ if np is not None else 'pure Python (NumPy not installed)'}")
+    values = [i * 0.37 for i in range(count)]
+    column = np.asarray(values) if np is not None else values
+    print(f"{'':<30} {'per value':>16} {'bulk':>16}")
+    for name, from_unit, to_unit in [('length', 'mi', 'km'), ('temperature', 'F', 'K'), ('fuel-economy', 'mpg', 'l/100km')]:
+        start = time.perf_counter()
+        for value in values:
+            convert(name, value, from_unit, to_unit)
+        single = time.perf_counter() - start
+        start = time.perf_counter()
+        convert_column(name, column, from_unit, to_unit)
+        bulk = time.perf_counter() - start
+        print(f"{name + ' ' + from_unit + ' -> ' + to_unit:<30} {count / single:>10,.0f} val/s {count / bulk:>10,.0f} val/s"
+              f"  ({single / bulk:.1f}x)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Unit conversion tables and bulk conversion for the conversion tools.")
+    parser.add_argument('command', nargs='?', choices=['convert'],
+                        help="convert: add a converted column to a CSV file")
+    parser.add_argument('input', nargs='?', help="input CSV")
+    parser.add_argument('-o', '--output', help="output CSV")
+    parser.add_argument('--dimension', choices=list(DIMENSIONS))
+    parser.add_argument('--from', dest='from_unit')
+    parser.add_argument('--to', dest='to_unit')
+    parser.add_argument('--column', default='value', help="column to convert (default: value)")
+    parser.add_argument('--output-column', help="name of the added column (default: <column>_<unit>)")
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS,
+                        help=f"rows processed per chunk (default {CHUNK_ROWS})")
+    parser.add_argument('--build', action='store_true', help=f"write {UNIT_TABLE_JS}")
+    parser.add_argument('--parity', nargs='*', metavar='JS',
+                        help="compare calculators.js under Node with the table (optionally other JS files)")
+    parser.add_argument('--benchmark', type=int, metavar='N', help="benchmark bulk conversion of N values")
+    args = parser.parse_args(argv)
+    if args.command and not (args.input and args.output and args.dimension and args.from_unit and args.to_unit):
+        parser.error("convert needs an input CSV, -o/--output, --dimension, --from and --to")
+    if args.chunk_rows < 1:
+        parser.error("--chunk-rows must be positive")
+    return args
+
+if __name__ == '__main__':
+    args = parse_args()
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    if args.build:
+        changed = build(base_path)
+        print(f"{'Created' if changed else 'Unchanged'}: {UNIT_TABLE_JS}")
+    if args.parity is not None:
+        sys.exit(1 if parity(args.parity or None) else 0)
+    if args.benchmark:
+        benchmark(args.benchmark)
+        sys.exit(0)
+    if args.command == 'convert':
+        try:
+            rows = convert_csv(args.input, args.output, args.dimension, args.from_unit, args.to_unit,
+                               args.column, args.output_column, args.chunk_rows)
+        except UnitError as e:
+            print(f"❌ {e}")
+            sys.exit(1)
+        print(f"Converted {rows:,} rows -> {args.output}")
+    elif not args.build:
+        parse_args(['--help'])
@@ -1,210 +1,452 @@
 #!/usr/bin/env python3
 """
-Quick verification script to check if all generated files exist
+Site integrity checker: internal links, canonicals, sitemaps and JS routes.
+
+Every HTML page and sitemap in the tree is parsed (in a process pool) and the
+results are cross-checked:
+  - every internal href/src (and #fragment) resolves to a file, the way the
+    server resolves clean URLs: /x -> x, x.html or x/index.html
+  - every page's canonical URL resolves back to the page itself
+  - every sitemap <loc> resolves to a page whose canonical is exactly that URL,
+    and every calculator and category page is listed in a sitemap
+  - the routes main.js pushes for each category and calculator
+    (urlMapping + getCalculatorUrl()) resolve to the generated pages, and
+    getCalculatorIdFromUrl() maps each route back to its calculator
+  - calculators.js, toolCategories and urlMapping agree with each other
+
+Parse results are cached per file in .verify-cache.json, keyed by size and
+mtime with a content hash as fallback, so a re-run on an unchanged tree only
+stats the files.
+
+    python verify_files.py
+    python verify_files.py -j 8 --verbose
 """
 
 import os
-from pathlib import Path
-
-# Tool categories
-URL_MAPPING = {
-    'financial': 'financial-calculators',
-    'math': 'math-calculators',
-    'health': 'health-calculators',
-    'crypto': 'crypto-calculators',
-    'physics': 'physics-calculators',
-    'chemistry': 'chemistry-calculators',
-    'engineering': 'engineering-calculators',
-    'construction': 'construction-calculators',
-    'conversion': 'conversion-tools',
-    'business': 'business-calculators',
-    'time': 'time-calculators',
-    'utility': 'utility-tools'
-}
-
-TOOL_CATEGORIES = {
-    'financial': ['loan', 'mortgage', 'compound-interest', 'investment', 'savings'],
-    'math': [
-        'percentage', 'fraction', 'algebra', 'quadratic', 'trigonometry', 
-        'scientific-calculator', 'statistics-calculator', 'matrix-calculator', 
-        'geometry-calculator', 'calculus-calculator', 'number-theory', 
-        'probability-calculator', 'complex-numbers', 'sequence-series', 
-        'logarithm-calculator', 'polynomial-calculator', 'binary-calculator',
-        'windows-calculator'
-    ],
-    'health': [
-        'bmi', 'calorie', 'body-fat', 'ideal-weight', 'water-intake',
-        'heart-rate-zone', 'vo2-max', 'pregnancy-due-date', 'ovulation', 'bmi-children',
-        'macro-calculator', 'protein-intake', 'body-measurement', 'sleep-calculator', 'hydration-status',
-        'fitness-level', 'workout-intensity', 'recovery-calculator', 'training-load', 'body-age',
-        'bmr', 'waist-hip-ratio', 'target-heart-rate', 'body-surface-area', 'lean-body-mass',
-        'resting-energy', 'weight-loss-planner', 'blood-alcohol', 'blood-pressure', 'blood-sugar',
-        'body-fat-distribution', 'exercise-calories', 'macros-converter', 'meal-planner', 'muscle-mass'
-    ],
-    'crypto': [
-        'crypto-profit', 'crypto-leverage-liquidation', 'crypto-futures-pnl',
-        'crypto-lending-returns', 'crypto-compound-yield', 'crypto-rebalancing',
-        'crypto-stop-loss', 'crypto-correlation', 'crypto-volume-analysis',
-        'crypto-position-size', 'crypto-funding-rate', 'crypto-drawdown',
-        'crypto-swing-trade', 'crypto-accumulation', 'crypto-volatility',
-        'crypto-dca', 'crypto-mining', 'crypto-converter', 'impermanent-loss',
-        'staking-rewards', 'crypto-arbitrage', 'crypto-yield-farming',
-        'crypto-bridge-fees', 'crypto-tax-calculator', 'crypto-hodl-calculator',
-        'crypto-rainbow-chart', 'crypto-fear-greed', 'crypto-hash-rate',
-        'crypto-whale-tracker', 'crypto-flash-loan', 'crypto-liquidity-pool',
-        'crypto-options-pricing', 'crypto-defi-yield', 'crypto-nft-valuation',
-        'crypto-gas-optimizer', 'crypto-portfolio-tracker', 'crypto-leverage-calculator',
-        'crypto-sharpe-ratio', 'crypto-dollar-hedge', 'crypto-momentum-indicator',
-        'crypto-technical-levels', 'crypto-altcoin-season', 'crypto-market-cap-calc',
-        'crypto-pairs-trading', 'crypto-grid-trading', 'crypto-rsi-calculator',
-        'crypto-funding-arbitrage', 'crypto-volatility-smile', 'crypto-carry-trade',
-        'crypto-basis-trading', 'crypto-social-sentiment'
-    ],
-    'physics': ['velocity', 'energy', 'force', 'momentum', 'power'],
-    'chemistry': ['molarity', 'ph', 'molecular-weight', 'gas-laws', 'stoichiometry'],
-    'engineering': [
-        'ohms-law', 'power-consumption', 'resistor-color', 'voltage-divider', 'capacitor',
-        'transformer-turns', 'inductor-reactance', 'rc-time-constant', 'rlc-resonance',
-        'parallel-resistance', 'series-resistance', 'power-factor', 'three-phase-power',
-        'wire-gauge', 'led-resistor', 'antenna-length', 'decibel-converter',
-        'impedance-matching', 'filter-frequency', 'amplifier-gain', 'beam-deflection',
-        'gear-ratio', 'pulley-system', 'hydraulic-pressure', 'spring-constant',
-        'thermal-expansion', 'motor-efficiency', 'pipe-flow'
-    ],
-    'construction': ['concrete', 'paint', 'brick', 'roof-pitch', 'flooring'],
-    'conversion': [
-        'length', 'temperature', 'weight', 'area', 'volume', 'speed',
-        'pressure', 'energy-conversion', 'power-conversion', 'data-storage',
-        'angle', 'time-conversion', 'frequency', 'currency', 'fuel-economy-conversion',
-        'density', 'force-conversion', 'luminosity', 'magnetic-field', 'radioactivity', 'torque'
-    ],
-    'business': ['roi', 'break-even', 'markup', 'payroll', 'cash-flow'],
-    'time': ['age', 'date-difference', 'time-zone', 'working-days', 'countdown'],
-    'utility': ['grade', 'fuel-economy', 'password-strength', 'random-number', 'color-picker']
-}
-
-def verify_files():
-    """Verify all generated files exist"""
-    base_path = Path(__file__).parent
-    
-    print("=" * 60)
-    print("CALCHUB - FILE VERIFICATION")
-    print("=" * 60)
-    print()
-    
-    # Track results
-    missing_files = []
-    existing_files = []
-    
-    # Check critical files
-    print("📋 Checking Critical Files:")
-    critical_files = [
-        'index.html',
-        'sitemap.xml',
-        'robots.txt',
-        '.htaccess',
-        'assets/js/main.js',
-        'assets/js/calculators.js',
-        'assets/css/style.css'
-    ]
-    
-    for file in critical_files:
-        file_path = base_path / file
-        if file_path.exists():
-            print(f"  ✅ {file}")
-            existing_files.append(file)
+import sys
+import json
+import time
+import shutil
+import hashlib
+import argparse
+import tempfile
+import subprocess
+from html.parser import HTMLParser
+from xml.etree import ElementTree
+from urllib.parse import unquote, urljoin, urlsplit
+from concurrent.futures import ProcessPoolExecutor
+
+from build_io import write_atomic
+from calc_registry import MAIN_JS, _JSReader, load_registry, registry_problems
+
+CACHE_FILE = '.verify-cache.json'
+# Bump whenever parse_file() output changes so stale cache entries are ignored
+CACHE_VERSION = '1'
+
+BASE_URL = 'https://www.tahir.engineer'
+
+REQUIRED_FILES = [
+    'index.html',
+    'sitemap.xml',
+    'robots.txt',
+    '.htaccess',
+    'assets/js/main.js',
+    'assets/js/calculators.js',
+    'assets/js/calculators-index.js',
+    'assets/css/style.css',
+]
+
+SKIP_DIRS = {'node_modules', '__pycache__'}
+
+# Attributes that reference other resources, per tag
+LINK_ATTRIBUTES = {'a': 'href', 'link': 'href', 'script': 'src', 'img': 'src', 'source': 'src', 'iframe': 'src'}
+# <meta> URLs that point at this site; a missing preview image is a warning, not a broken page
+META_URL_PROPERTIES = {'og:url'}
+META_IMAGE_PROPERTIES = {'og:image', 'twitter:image'}
+SKIP_SCHEMES = ('javascript:', 'mailto:', 'tel:', 'data:')
+
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+IMAGE_NS = '{http://www.google.com/schemas/sitemap-image/1.1}'
+
+
+class _PageParser(HTMLParser):
+    """Collect a page's outgoing URLs, canonical URL and element ids."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links = []
+        self.canonical = None
+        self.ids = []
+        self.images = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('id'):
+            self.ids.append(attrs['id'])
+        if tag == 'link' and attrs.get('rel') == 'canonical':
+            self.canonical = attrs.get('href')
+            return
+        if tag == 'link' and attrs.get('rel') in ('preconnect', 'dns-prefetch'):
+            return
+        meta = attrs.get('property', attrs.get('name')) if tag == 'meta' else None
+        if meta in META_IMAGE_PROPERTIES and attrs.get('content'):
+            self.images.append(attrs['content'])
+            return
+        if meta in META_URL_PROPERTIES:
+            url = attrs.get('content')
         else:
-            print(f"  ❌ {file} - MISSING")
-            missing_files.append(file)
-    
-    print()
-    print("📁 Checking Category Folders:")
-    
-    # Check category folders and index files
-    for category_key, category_url in URL_MAPPING.items():
-        category_dir = base_path / category_url
-        index_file = category_dir / 'index.html'
-        
-        if category_dir.exists():
-            print(f"  ✅ {category_url}/")
-            existing_files.append(f"{category_url}/")
+            url = attrs.get(LINK_ATTRIBUTES.get(tag, ''))
+        if url and not url.startswith(SKIP_SCHEMES) and '${' not in url:
+            self.links.append(url)
+
+
+def parse_file(rel_path, data):
+    """The links, canonical and ids of a page, or the URLs listed in a sitemap."""
+    if rel_path.endswith('.xml'):
+        root = ElementTree.fromstring(data)
+        return {
+            'kind': 'sitemap',
+            'locs': [loc.text.strip() for loc in root.iter(f'{SITEMAP_NS}loc') if loc.text],
+            'images': [loc.text.strip() for loc in root.iter(f'{IMAGE_NS}loc') if loc.text],
+            'index': root.tag == f'{SITEMAP_NS}sitemapindex',
+        }
+    parser = _PageParser()
+    parser.feed(data.decode('utf-8', errors='replace'))
+    parser.close()
+    return {'kind': 'page', 'links': parser.links, 'canonical': parser.canonical, 'ids': parser.ids,
+            'images': parser.images}
+
+
+def _parse_task(task):
+    """Hash a file and parse it unless the hash matches the cached one (runs in a worker)."""
+    base_path, rel_path, cached_hash = task
+    with open(os.path.join(base_path, *rel_path.split('/')), 'rb') as f:
+        data = f.read()
+    digest = hashlib.sha1(data).hexdigest()
+    if digest == cached_hash:
+        return digest, None
+    try:
+        return digest, parse_file(rel_path, data)
+    except ElementTree.ParseError as e:
+        return digest, {'kind': 'invalid', 'error': str(e)}
+
+
+def list_files(base_path):
+    """Every file in the site tree as a '/'-separated relative path."""
+    files = set()
+    for dirpath, dirnames, filenames in os.walk(base_path):
+        dirnames[:] = [d for d in dirnames if not d.startswith('.') and d not in SKIP_DIRS]
+        rel_dir = os.path.relpath(dirpath, base_path).replace(os.sep, '/')
+        for name in filenames:
+            files.add(name if rel_dir == '.' else f'{rel_dir}/{name}')
+    return files
+
+
+def parse_site(base_path, rel_paths, jobs=1, use_cache=True):
+    """{rel_path: parse result} for the given files, reusing .verify-cache.json.
+    Returns the results and how many files were actually parsed."""
+    cache_file = os.path.join(base_path, CACHE_FILE)
+    cache = {}
+    if use_cache:
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+            if saved.get('version') == CACHE_VERSION:
+                cache = saved['files']
+        except (OSError, ValueError, KeyError):
+            cache = {}
+
+    entries = {}
+    tasks = []
+    for rel_path in sorted(rel_paths):
+        st = os.stat(os.path.join(base_path, *rel_path.split('/')))
+        entry = cache.get(rel_path)
+        if entry and entry['size'] == st.st_size and entry['mtime_ns'] == st.st_mtime_ns:
+            entries[rel_path] = entry
         else:
-            print(f"  ❌ {category_url}/ - MISSING")
-            missing_files.append(f"{category_url}/")
-            
-        if index_file.exists():
-            print(f"    ✅ index.html")
-            existing_files.append(f"{category_url}/index.html")
+            entries[rel_path] = {'size': st.st_size, 'mtime_ns': st.st_mtime_ns,
+                                 'sha1': entry['sha1'] if entry else None,
+                                 'result': entry['result'] if entry else None}
+            tasks.append((base_path, rel_path, entries[rel_path]['sha1']))
+
+    parsed = 0
+    if tasks:
+        if jobs > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = list(pool.map(_parse_task, tasks, chunksize=max(1, len(tasks) // (jobs * 4))))
         else:
-            print(f"    ❌ index.html - MISSING")
-            missing_files.append(f"{category_url}/index.html")
-    
-    print()
-    print("🧮 Checking Calculator Pages:")
-    
-    # Check individual calculator files
-    total_calcs = 0
-    missing_calcs = 0
-    
-    for category_key, tools in TOOL_CATEGORIES.items():
-        category_url = URL_MAPPING[category_key]
-        category_dir = base_path / category_url
-        
-        print(f"\n  {category_key.title()} ({len(tools)} calculators):")
-        
-        for tool in tools:
-            total_calcs += 1
-            calc_file = category_dir / f"{tool}.html"
-            
-            if calc_file.exists():
-                print(f"    ✅ {tool}.html")
-                existing_files.append(f"{category_url}/{tool}.html")
+            results = [_parse_task(task) for task in tasks]
+        for (_, rel_path, _), (digest, result) in zip(tasks, results):
+            entries[rel_path]['sha1'] = digest
+            if result is not None:
+                entries[rel_path]['result'] = result
+                parsed += 1
+
+    if use_cache and (tasks or set(cache) != set(entries)):
+        content = json.dumps({'version': CACHE_VERSION, 'files': entries}, separators=(',', ':'))
+        write_atomic(cache_file, content.encode('utf-8'))
+    return {rel_path: entry['result'] for rel_path, entry in entries.items()}, parsed
+
+
+class Site:
+    """URL resolution over the files in the tree."""
+
+    def __init__(self, files, base_url):
+        self.files = files
+        self.base_url = base_url.rstrip('/')
+        self.origin = urlsplit(self.base_url).netloc
+
+    def page_url(self, rel_path):
+        return f'{self.base_url}/{rel_path}'
+
+    def resolve(self, url, from_url=None):
+        """(rel_path or None, fragment) for an internal URL; None for external ones."""
+        parts = urlsplit(urljoin(from_url or self.base_url + '/', url))
+        if parts.scheme not in ('http', 'https') or parts.netloc != self.origin:
+            return None
+        path = unquote(parts.path).lstrip('/')
+        if path == '' or path.endswith('/'):
+            candidates = [path + 'index.html']
+        else:
+            candidates = [path, path + '.html', path + '/index.html']
+        for candidate in candidates:
+            if candidate in self.files:
+                return candidate, parts.fragment
+        return '', parts.fragment
+
+
+class Report:
+    """Problems grouped by check, each with the places it occurs."""
+
+    def __init__(self):
+        self.errors = {}
+        self.warnings = {}
+
+    def error(self, check, message, where=None):
+        self.errors.setdefault(check, {}).setdefault(message, []).append(where)
+
+    def warning(self, check, message, where=None):
+        self.warnings.setdefault(check, {}).setdefault(message, []).append(where)
+
+    def print(self, checks, verbose=False):
+        for check in checks:
+            errors = self.errors.get(check, {})
+            warnings = self.warnings.get(check, {})
+            if not errors and not warnings:
+                print(f"  ✅ {check}")
+                continue
+            print(f"  {'❌' if errors else '⚠️ '} {check}: {len(errors)} errors, {len(warnings)} warnings")
+            for icon, problems in (('❌', errors), ('⚠️ ', warnings)):
+                shown = problems.items() if verbose else list(problems.items())[:10]
+                for message, places in shown:
+                    places = [p for p in places if p]
+                    where = ''
+                    if places:
+                        where = f" ({places[0]}" + (f" and {len(places) - 1} more" if len(places) > 1 else '') + ')'
+                    print(f"      {icon} {message}{where}")
+                    if verbose:
+                        for place in places[1:]:
+                            print(f"           {place}")
+                if len(problems) > len(shown):
+                    print(f"      ... and {len(problems) - len(shown)} more (use --verbose)")
+
+
+_ROUTES_JS = r"""
+const fs = require('fs');
+const [idsFile, source] = process.argv.slice(1);
+const ids = JSON.parse(fs.readFileSync(idsFile, 'utf8'));
+const calculators = {};
+ids.forEach(id => { calculators[id] = {}; });
+const getCalculatorUrl = new Function('calculators', source + '; return getCalculatorUrl;')(calculators);
+const getCalculatorIdFromUrl = new Function('calculators', source + '; return getCalculatorIdFromUrl;')(calculators);
+process.stdout.write(JSON.stringify(ids.map(id => {
+    const url = getCalculatorUrl(id);
+    return [url, getCalculatorIdFromUrl(url)];
+})));
+"""
+
+
+def js_function_source(text, name):
+    """Source of a top-level `function name(...) {...}` declaration in main.js."""
+    start = text.index(f'function {name}(')
+    reader = _JSReader(text, text.index('{', start) + 1)
+    reader.skip_expression(closers='}')
+    return text[start:reader.pos + 1]
+
+
+def js_routes(base_path, calc_ids):
+    """{calc_id: (url segment, id read back from it)} from main.js, or None without Node."""
+    node = shutil.which('node')
+    if not node:
+        return None
+    with open(os.path.join(base_path, *MAIN_JS.split('/')), 'r', encoding='utf-8') as f:
+        text = f.read()
+    source = '\n'.join(js_function_source(text, name) for name in ('getCalculatorUrl', 'getCalculatorIdFromUrl'))
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as f:
+        json.dump(calc_ids, f)
+    try:
+        completed = subprocess.run([node, '-e', _ROUTES_JS, f.name, source], capture_output=True, text=True,
+                                   check=True)
+    finally:
+        os.remove(f.name)
+    return dict(zip(calc_ids, (tuple(route) for route in json.loads(completed.stdout))))
+
+
+def check_pages(site, parsed, report):
+    pages = {rel: result for rel, result in parsed.items() if result and result['kind'] == 'page'}
+    ids = {rel: set(result['ids']) for rel, result in pages.items()}
+    for rel_path, page in pages.items():
+        page_url = site.page_url(rel_path)
+        for url in page['links']:
+            if url == '#':
+                continue
+            resolved = site.resolve(url, page_url)
+            if resolved is None:
+                continue
+            target, fragment = resolved
+            if not target:
+                report.error('Internal links', f"{url} does not resolve to a file", rel_path)
+            elif fragment and target in ids and fragment not in ids[target]:
+                report.error('Internal links', f"{url}: no element with id '{fragment}' in {target}", rel_path)
+        for url in page['images']:
+            resolved = site.resolve(url, page_url)
+            if resolved is not None and not resolved[0]:
+                report.warning('Preview images', f"{url} does not resolve to a file", rel_path)
+
+        canonical = page['canonical']
+        if canonical is None:
+            if rel_path != '404.html':
+                report.warning('Canonical URLs', "page has no canonical URL", rel_path)
+            continue
+        resolved = site.resolve(canonical, page_url)
+        if resolved is None:
+            report.error('Canonical URLs', f"canonical {canonical} is not on {site.base_url}", rel_path)
+        elif resolved[0] != rel_path:
+            target = resolved[0] or 'no file'
+            report.error('Canonical URLs', f"canonical {canonical} resolves to {target}", rel_path)
+
+
+def check_sitemaps(site, parsed, registry, report):
+    sitemaps = {rel: result for rel, result in parsed.items() if result and result['kind'] in ('sitemap', 'invalid')}
+    listed = set()
+    for rel_path, sitemap in sitemaps.items():
+        if sitemap['kind'] == 'invalid':
+            report.error('Sitemaps', f"not well-formed XML: {sitemap['error']}", rel_path)
+            continue
+        seen = set()
+        for loc in sitemap['locs']:
+            if loc in seen:
+                report.warning('Sitemaps', f"{loc} is listed more than once", rel_path)
+            seen.add(loc)
+            resolved = site.resolve(loc)
+            if resolved is None:
+                report.error('Sitemaps', f"{loc} is not on {site.base_url}", rel_path)
+                continue
+            target = resolved[0]
+            if not target:
+                report.error('Sitemaps', f"{loc} does not resolve to a file", rel_path)
+            elif sitemap['index']:
+                if target not in sitemaps:
+                    report.error('Sitemaps', f"{loc} is not a sitemap", rel_path)
             else:
-                print(f"    ❌ {tool}.html - MISSING")
-                missing_files.append(f"{category_url}/{tool}.html")
-                missing_calcs += 1
-    
-    # Summary
-    print()
+                listed.add(target)
+                page = parsed.get(target)
+                canonical = page and page['kind'] == 'page' and page['canonical']
+                if canonical and canonical != loc:
+                    report.error('Sitemaps', f"{loc} has canonical {canonical}", rel_path)
+        for image in sitemap['images']:
+            resolved = site.resolve(image)
+            if resolved is not None and not resolved[0]:
+                report.warning('Preview images', f"{image} does not resolve to a file", rel_path)
+
+    for category_key, tools in registry['categories'].items():
+        category_url = registry['url_mapping'].get(category_key)
+        if not category_url:
+            continue
+        pages = [f'{category_url}/index.html'] + [f'{category_url}/{tool}.html' for tool in tools]
+        for page in pages:
+            if page in site.files and page not in listed:
+                report.warning('Sitemaps', "page is not listed in any sitemap", page)
+
+
+def check_routes(site, base_path, registry, report):
+    url_mapping = registry['url_mapping']
+    calc_ids = [tool for tools in registry['categories'].values() for tool in tools]
+    for category_key, category_url in url_mapping.items():
+        if not site.resolve(f'/{category_url}')[0]:
+            report.error('JS routes', f"/{category_url} (urlMapping['{category_key}']) does not resolve to a page")
+    routes = js_routes(base_path, calc_ids)
+    if routes is None:
+        report.warning('JS routes', "node not found, getCalculatorUrl() routes not checked")
+        routes = {}
+    for category_key, tools in registry['categories'].items():
+        category_url = url_mapping.get(category_key)
+        for tool in tools:
+            if not category_url:
+                continue
+            if f'{category_url}/{tool}.html' not in site.files:
+                report.error('JS routes', f"no generated page for '{tool}' (run generate_pages.py)",
+                             f'{category_url}/{tool}.html')
+            if tool not in routes:
+                continue
+            segment, back = routes[tool]
+            route = f'/{category_url}/{segment}'
+            if not site.resolve(route)[0]:
+                report.error('JS routes', f"getCalculatorUrl('{tool}') pushes {route}, which does not resolve to a page")
+            if back != tool:
+                report.error('JS routes', f"getCalculatorIdFromUrl('{segment}') returns '{back}', not '{tool}'")
+    for problem in registry_problems(registry):
+        report.warning('JS routes', problem)
+
+
+def verify(jobs=1, base_url=BASE_URL, use_cache=True, verbose=False):
+    """Run every check and print the report. Returns True when there are no errors."""
+    start = time.perf_counter()
+    base_path = os.path.dirname(os.path.abspath(__file__))
+    files = list_files(base_path)
+    site = Site(files, base_url)
+    report = Report()
+
     print("=" * 60)
-    print("VERIFICATION SUMMARY")
+    print("CALCHUB - SITE VERIFICATION")
     print("=" * 60)
-    print(f"Total files checked: {len(existing_files) + len(missing_files)}")
-    print(f"✅ Existing files: {len(existing_files)}")
-    print(f"❌ Missing files: {len(missing_files)}")
-    print()
-    print(f"Critical files: {len([f for f in critical_files if (base_path / f).exists()])}/{len(critical_files)}")
-    print(f"Category folders: {len([k for k in URL_MAPPING.keys() if (base_path / URL_MAPPING[k]).exists()])}/{len(URL_MAPPING)}")
-    print(f"Category index pages: {len([k for k in URL_MAPPING.keys() if (base_path / URL_MAPPING[k] / 'index.html').exists()])}/{len(URL_MAPPING)}")
-    print(f"Calculator pages: {total_calcs - missing_calcs}/{total_calcs}")
-    print()
-    
-    if missing_files:
-        print("⚠️  WARNING: Some files are missing!")
-        print()
-        print("Missing files:")
-        for file in missing_files[:10]:  # Show first 10
-            print(f"  - {file}")
-        if len(missing_files) > 10:
-            print(f"  ... and {len(missing_files) - 10} more")
-        print()
-        print("💡 Run 'python generate_pages.py' to regenerate missing files")
-        return False
-    else:
-        print("🎉 SUCCESS! All files are present and ready for deployment!")
-        print()
-        print("📤 Next Steps:")
-        print("  1. Upload all files to your web server")
-        print("  2. Submit sitemap to Google Search Console")
-        print("  3. Request indexing for priority pages")
-        print("  4. Monitor indexing progress")
-        print()
-        print("📚 Documentation:")
-        print("  - SOLUTION_SUMMARY.md - Complete solution overview")
-        print("  - DEPLOYMENT_GUIDE.md - Detailed deployment steps")
-        print("  - README.md - Project documentation")
-        return True
+
+    for rel_path in REQUIRED_FILES:
+        if rel_path not in files:
+            report.error('Required files', f"{rel_path} is missing")
+
+    targets = [rel for rel in files if rel.endswith('.html') or (rel.startswith('sitemap') and rel.endswith('.xml'))]
+    parsed, parsed_count = parse_site(base_path, targets, jobs, use_cache)
+    registry = load_registry(base_path)
+
+    check_pages(site, parsed, report)
+    check_sitemaps(site, parsed, registry, report)
+    check_routes(site, base_path, registry, report)
+
+    print(f"\n📋 {len(targets)} pages and sitemaps ({parsed_count} parsed, {len(targets) - parsed_count} from cache)\n")
+    report.print(['Required files', 'Internal links', 'Preview images', 'Canonical URLs', 'Sitemaps', 'JS routes'],
+                 verbose)
+
+    errors = sum(len(problems) for problems in report.errors.values())
+    warnings = sum(len(problems) for problems in report.warnings.values())
+    print(f"\n{'🎉' if not errors else '❌'} {errors} errors, {warnings} warnings "
+          f"in {time.perf_counter() - start:.2f}s")
+    if errors:
+        print("💡 Run the build (generate_calculator_modules.py, build_assets.py, generate_pages.py, "
+              "generate_sitemap.py) and fix the sources listed above")
+    return not errors
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Check internal links, canonicals, sitemaps and JS routes.")
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 1,
+                        help="parse pages in this many processes (default: CPU count)")
+    parser.add_argument('--base-url', default=BASE_URL, help="site origin the canonical and sitemap URLs use")
+    parser.add_argument('--no-cache', action='store_true', help=f"ignore and do not write {CACHE_FILE}")
+    parser.add_argument('-v', '--verbose', action='store_true', help="list every occurrence of each problem")
+    return parser.parse_args(argv)
 
 if __name__ == '__main__':
-    success = verify_files()
-    exit(0 if success else 1)
+    args = parse_args()
+    success = verify(args.jobs, args.base_url, not args.no_cache, args.verbose)
+    sys.exit(0 if success else 1)